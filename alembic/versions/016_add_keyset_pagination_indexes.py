@@ -0,0 +1,32 @@
+"""Add (created_at, id) indexes backing keyset pagination.
+
+Revision ID: 016_keyset_pagination_indexes
+Revises: 013_add_notification_preferences
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "016_keyset_pagination_indexes"
+down_revision = "013_add_notification_preferences"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ("ix_investigations_created_id", "investigations", ["created_at", "id"]),
+    ("ix_remediations_created_id", "remediations", ["created_at", "id"]),
+    ("ix_security_scans_created_id", "security_scans", ["created_at", "id"]),
+    ("ix_audit_log_ts_id", "audit_log", ["timestamp", "id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,38 @@
+"""Add api_usage_hourly table for persisted usage rollups.
+
+Revision ID: 017_add_api_usage_hourly
+Revises: 016_keyset_pagination_indexes
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "017_add_api_usage_hourly"
+down_revision = "016_keyset_pagination_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "api_usage_hourly",
+        sa.Column("org_id", sa.String(64), primary_key=True),
+        sa.Column("endpoint", sa.String(512), primary_key=True),
+        sa.Column("hour", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("call_count", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("total_latency_ms", sa.Float, nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_api_usage_hourly_org_hour",
+        "api_usage_hourly",
+        ["org_id", "hour"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_api_usage_hourly_org_hour", table_name="api_usage_hourly")
+    op.drop_table("api_usage_hourly")
@@ -0,0 +1,12 @@
+# ShieldOps Batch Evaluation
+# Evaluates `allow` for every action in input.batch in a single query,
+# so a remediation plan needs one OPA round-trip instead of one per action.
+
+package shieldops
+
+import rego.v1
+
+batch_allow := [decision |
+    some item in input.batch
+    decision := allow with input as item
+]
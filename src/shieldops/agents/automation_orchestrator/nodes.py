@@ -150,6 +150,7 @@ async def evaluate_trigger(state: AutomationState) -> dict[str, Any]:
                     system_prompt=SYSTEM_EVALUATE_TRIGGER,
                     user_prompt=trigger_context,
                     schema=TriggerEvalResult,
+                    agent_type="automation_orchestrator",
                 ),
             )
             matched = llm_result.matches
@@ -249,6 +250,7 @@ async def plan_execution(state: AutomationState) -> dict[str, Any]:
                 system_prompt=SYSTEM_PLAN_EXECUTION,
                 user_prompt=plan_context,
                 schema=ExecutionPlan,
+                agent_type="automation_orchestrator",
             ),
         )
 
@@ -403,6 +405,7 @@ async def summarize_execution(state: AutomationState) -> dict[str, Any]:
                 system_prompt=SYSTEM_SUMMARIZE_EXECUTION,
                 user_prompt=summary_context,
                 schema=ExecutionSummary,
+                agent_type="automation_orchestrator",
             ),
         )
         summary = result.summary
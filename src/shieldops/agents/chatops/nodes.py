@@ -93,6 +93,7 @@ async def parse_command(state: ChatOpsState) -> dict[str, Any]:
                             f"## Current Command\n{command_text}"
                         ),
                         schema=CommandParseResult,
+                        agent_type="chatops",
                     )
                     if hasattr(enriched, "entity") and enriched.entity:
                         enriched_command = command_text  # keep original but use enriched parse
@@ -114,6 +115,7 @@ async def parse_command(state: ChatOpsState) -> dict[str, Any]:
                     system_prompt=SYSTEM_COMMAND_PARSE,
                     user_prompt=user_prompt,
                     schema=CommandParseResult,
+                    agent_type="chatops",
                 ),
             )
 
@@ -387,6 +389,7 @@ async def format_response(state: ChatOpsState) -> dict[str, Any]:
                     system_prompt=SYSTEM_RESPONSE_FORMAT,
                     user_prompt=format_input,
                     schema=ResponseFormatResult,
+                    agent_type="chatops",
                 ),
             )
             response_text = formatted.summary
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentComplianceAuditor:
     ) -> None:
         self._max_records = max_records
         self._min_pass_rate_pct = min_pass_rate_pct
-        self._records: list[AuditRecord] = []
+        self._records: RecordStore[AuditRecord] = RecordStore(self._max_records)
         self._evidence: list[AuditEvidence] = []
         logger.info(
             "compliance_auditor.initialized",
@@ -115,8 +117,6 @@ class AgentComplianceAuditor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_auditor.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class AgentComplianceAuditor:
         return record
 
     def get_audit(self, record_id: str) -> AuditRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_audits(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentConsensusEngine:
     ) -> None:
         self._max_records = max_records
         self._quorum_pct = quorum_pct
-        self._records: list[ConsensusRecord] = []
+        self._records: RecordStore[ConsensusRecord] = RecordStore(self._max_records)
         self._votes: list[AgentVote] = []
         logger.info(
             "consensus_engine.initialized",
@@ -115,8 +117,6 @@ class AgentConsensusEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "consensus_engine.decision_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class AgentConsensusEngine:
         return record
 
     def get_decision(self, record_id: str) -> ConsensusRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_decisions(
         self,
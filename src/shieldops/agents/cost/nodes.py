@@ -186,6 +186,7 @@ async def detect_anomalies(state: CostAnalysisState) -> dict[str, Any]:
                     system_prompt=SYSTEM_COST_ANOMALY_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=CostAnomalyAssessmentResult,
+                    agent_type="cost",
                 ),
             )
             output_summary = (
@@ -284,6 +285,7 @@ async def recommend_optimizations(state: CostAnalysisState) -> dict[str, Any]:
                     system_prompt=SYSTEM_OPTIMIZATION_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=OptimizationAssessmentResult,
+                    agent_type="cost",
                 ),
             )
             output_summary = (
@@ -389,6 +391,7 @@ async def synthesize_savings(state: CostAnalysisState) -> dict[str, Any]:
                 system_prompt=SYSTEM_COST_FORECAST,
                 user_prompt="\n".join(context_lines),
                 schema=CostForecastResult,
+                agent_type="cost",
             ),
         )
         health_score = assessment.overall_health_score
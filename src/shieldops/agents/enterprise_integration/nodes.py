@@ -255,6 +255,7 @@ async def diagnose_issues(state: IntegrationState) -> dict[str, Any]:
                 system_prompt=SYSTEM_DIAGNOSE_INTEGRATION,
                 user_prompt=context,
                 schema=DiagnosisResult,
+                agent_type="enterprise_integration",
             ),
         )
 
@@ -388,6 +389,7 @@ async def generate_recommendations(state: IntegrationState) -> dict[str, Any]:
                 system_prompt=SYSTEM_RECOMMEND_FIXES,
                 user_prompt=context,
                 schema=FixRecommendationsOutput,
+                agent_type="enterprise_integration",
             ),
         )
 
@@ -42,6 +42,11 @@ def should_analyze_traces(state: InvestigationState) -> str:
     return "correlate_findings"
 
 
+async def join_signal_analysis(state: InvestigationState) -> dict[str, Any]:
+    """Wait for the parallel log and metric analysis before routing on both."""
+    return {}
+
+
 def should_recommend_action(state: InvestigationState) -> str:
     """Route based on confidence score."""
     if state.confidence_score >= settings.agent_confidence_threshold_auto:
@@ -89,6 +94,7 @@ async def recommend_action(state: InvestigationState) -> dict[str, Any]:
                     system_prompt=SYSTEM_RECOMMEND_ACTION,
                     user_prompt=user_prompt,
                     schema=RecommendedActionOutput,
+                    agent_type="investigation",
                 ),
             )
 
@@ -150,7 +156,9 @@ def create_investigation_graph() -> StateGraph[InvestigationState]:
     """Build the Investigation Agent LangGraph workflow.
 
     Workflow:
-        gather_context → analyze_logs → analyze_metrics
+        gather_context → check_historical_patterns
+            → analyze_logs ∥ analyze_metrics (run in parallel)
+            → join_signal_analysis
             → [conditional: analyze_traces OR correlate_findings]
             → generate_hypotheses
             → [conditional: recommend_action OR end]
@@ -175,6 +183,7 @@ def create_investigation_graph() -> StateGraph[InvestigationState]:
         "analyze_metrics",
         traced_node("investigation.analyze_metrics", _inv)(analyze_metrics),
     )
+    graph.add_node("join_signal_analysis", join_signal_analysis)
     graph.add_node(
         "analyze_traces",
         traced_node("investigation.analyze_traces", _inv)(analyze_traces),
@@ -195,10 +204,12 @@ def create_investigation_graph() -> StateGraph[InvestigationState]:
     # Define edges
     graph.set_entry_point("gather_context")
     graph.add_edge("gather_context", "check_historical_patterns")
+    # Log and metric analysis are independent: fan out, then join.
     graph.add_edge("check_historical_patterns", "analyze_logs")
-    graph.add_edge("analyze_logs", "analyze_metrics")
+    graph.add_edge("check_historical_patterns", "analyze_metrics")
+    graph.add_edge(["analyze_logs", "analyze_metrics"], "join_signal_analysis")
     graph.add_conditional_edges(
-        "analyze_metrics",
+        "join_signal_analysis",
         should_analyze_traces,
         {
             "analyze_traces": "analyze_traces",
@@ -1,7 +1,7 @@
 """State models for the Investigation Agent."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field
 
@@ -63,6 +63,10 @@ class ReasoningStep(BaseModel):
     output_summary: str
     duration_ms: int
     tool_used: str | None = None
+    source_latency_ms: dict[str, int] = Field(default_factory=dict)
+    # Estimated prompt size sent to the LLM, and tokens removed by compaction
+    prompt_tokens: int = 0
+    prompt_tokens_saved: int = 0
 
 
 class HistoricalPattern(BaseModel):
@@ -77,6 +81,30 @@ class HistoricalPattern(BaseModel):
     environment: str = ""
 
 
+def merge_reasoning_chain(
+    current: list[ReasoningStep], update: list[ReasoningStep]
+) -> list[ReasoningStep]:
+    """Reducer for ``reasoning_chain``: append the steps a node added.
+
+    Nodes return the whole chain with their step appended.  When nodes run
+    in parallel each starts from the same chain, so only steps not already
+    present are appended, renumbered to follow on from the chain.
+    """
+    merged = list(current)
+    for step in update:
+        if step in merged:
+            continue
+        if step.step_number != len(merged) + 1:
+            step = step.model_copy(update={"step_number": len(merged) + 1})
+        merged.append(step)
+    return merged
+
+
+def latest_step(current: str, update: str) -> str:
+    """Reducer for ``current_step``: parallel nodes may both set it."""
+    return update
+
+
 class InvestigationState(BaseModel):
     """Full state of an investigation workflow (LangGraph state)."""
 
@@ -99,6 +127,8 @@ class InvestigationState(BaseModel):
     # Metadata
     investigation_start: datetime | None = None
     investigation_duration_ms: int = 0
-    reasoning_chain: list[ReasoningStep] = Field(default_factory=list)
-    current_step: str = "init"
+    reasoning_chain: Annotated[list[ReasoningStep], merge_reasoning_chain] = Field(
+        default_factory=list
+    )
+    current_step: Annotated[str, latest_step] = "init"
     error: str | None = None
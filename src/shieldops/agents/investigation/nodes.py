@@ -7,6 +7,7 @@ Each node is an async function that:
 4. Records its reasoning step in the audit trail
 """
 
+import math
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -32,7 +33,15 @@ from shieldops.agents.investigation.prompts import (
     MetricAnalysisResult,
 )
 from shieldops.agents.investigation.tools import InvestigationToolkit
+from shieldops.config import settings
 from shieldops.models.base import Hypothesis
+from shieldops.utils.context_compactor import (
+    LEVEL_SCORES,
+    CompactedPrompt,
+    CompactionReport,
+    ContextBuilder,
+    log_template,
+)
 from shieldops.utils.llm import llm_structured
 
 logger = structlog.get_logger()
@@ -168,23 +177,25 @@ async def analyze_logs(state: InvestigationState) -> dict[str, Any]:
         patterns=error_patterns,
     )
 
-    # Build context for LLM analysis
-    log_context = _format_log_context(state, log_data)
-
     # LLM analysis of log data
     findings: list[LogFinding] = []
     output_summary = (
         f"Queried logs: {log_data['total_entries']} entries, {log_data['error_count']} errors"
     )
 
+    sent = CompactionReport()
     if log_data["total_entries"] > 0:
+        # Build context for LLM analysis
+        prompt = _format_log_context(state, log_data)
+        sent = prompt.report
         try:
             analysis = cast(
                 LogAnalysisResult,
                 await llm_structured(
                     system_prompt=SYSTEM_LOG_ANALYSIS,
-                    user_prompt=log_context,
+                    user_prompt=prompt.text,
                     schema=LogAnalysisResult,
+                    agent_type="investigation",
                 ),
             )
             output_summary = analysis.summary
@@ -231,9 +242,12 @@ async def analyze_logs(state: InvestigationState) -> dict[str, Any]:
             f"{log_data['total_entries']} entries "
             f"from {log_data['sources_queried']}"
         ),
-        output_summary=output_summary,
+        output_summary=output_summary + _degraded_sources(log_data),
         duration_ms=_elapsed_ms(start),
         tool_used="query_logs + llm",
+        source_latency_ms=log_data.get("source_latency_ms", {}),
+        prompt_tokens=sent.prompt_tokens,
+        prompt_tokens_saved=sent.tokens_saved,
     )
 
     return {
@@ -274,15 +288,18 @@ async def analyze_metrics(state: InvestigationState) -> dict[str, Any]:
         )
 
     # LLM analysis if we have data
+    sent = CompactionReport()
     if metric_data["current_values"] or anomalies:
-        metric_context = _format_metric_context(state, metric_data)
+        prompt = _format_metric_context(state, metric_data)
+        sent = prompt.report
         try:
             analysis = cast(
                 MetricAnalysisResult,
                 await llm_structured(
                     system_prompt=SYSTEM_METRIC_ANALYSIS,
-                    user_prompt=metric_context,
+                    user_prompt=prompt.text,
                     schema=MetricAnalysisResult,
+                    agent_type="investigation",
                 ),
             )
             output_summary = (
@@ -297,9 +314,12 @@ async def analyze_metrics(state: InvestigationState) -> dict[str, Any]:
         step_number=len(state.reasoning_chain) + 1,
         action="analyze_metrics",
         input_summary=f"Checking {len(metric_data['metrics_checked'])} metrics for {resource_id}",
-        output_summary=output_summary,
+        output_summary=output_summary + _degraded_sources(metric_data),
         duration_ms=_elapsed_ms(start),
         tool_used="query_metrics + llm",
+        source_latency_ms=metric_data.get("source_latency_ms", {}),
+        prompt_tokens=sent.prompt_tokens,
+        prompt_tokens_saved=sent.tokens_saved,
     )
 
     return {
@@ -373,16 +393,18 @@ async def correlate_findings(state: InvestigationState) -> dict[str, Any]:
     correlated: list[CorrelatedEvent] = []
     output_summary = "No findings to correlate"
 
-    all_findings = _format_all_findings(state)
-
+    sent = CompactionReport()
     if state.log_findings or state.metric_anomalies:
+        prompt = _format_all_findings(state)
+        sent = prompt.report
         try:
             result = cast(
                 CorrelationResult,
                 await llm_structured(
                     system_prompt=SYSTEM_CORRELATION,
-                    user_prompt=all_findings,
+                    user_prompt=prompt.text,
                     schema=CorrelationResult,
+                    agent_type="investigation",
                 ),
             )
 
@@ -415,6 +437,8 @@ async def correlate_findings(state: InvestigationState) -> dict[str, Any]:
         output_summary=output_summary,
         duration_ms=_elapsed_ms(start),
         tool_used="llm",
+        prompt_tokens=sent.prompt_tokens,
+        prompt_tokens_saved=sent.tokens_saved,
     )
 
     return {
@@ -430,7 +454,7 @@ async def generate_hypotheses(state: InvestigationState) -> dict[str, Any]:
 
     logger.info("investigation_generating_hypotheses", alert_id=state.alert_id)
 
-    all_context = _format_full_investigation_context(state)
+    prompt = _format_full_investigation_context(state)
     hypotheses: list[Hypothesis] = []
     confidence_score = 0.0
 
@@ -439,8 +463,9 @@ async def generate_hypotheses(state: InvestigationState) -> dict[str, Any]:
             HypothesesOutput,
             await llm_structured(
                 system_prompt=SYSTEM_HYPOTHESIS_GENERATION,
-                user_prompt=all_context,
+                user_prompt=prompt.text,
                 schema=HypothesesOutput,
+                agent_type="investigation",
             ),
         )
 
@@ -477,6 +502,8 @@ async def generate_hypotheses(state: InvestigationState) -> dict[str, Any]:
         output_summary=output_summary,
         duration_ms=_elapsed_ms(start),
         tool_used="llm",
+        prompt_tokens=prompt.report.prompt_tokens,
+        prompt_tokens_saved=prompt.report.tokens_saved,
     )
 
     return {
@@ -494,125 +521,162 @@ def _elapsed_ms(start: datetime) -> int:
     return int((datetime.now(UTC) - start).total_seconds() * 1000)
 
 
-def _format_log_context(state: InvestigationState, log_data: dict[str, Any]) -> str:
-    """Format log data into a prompt for LLM analysis."""
-    lines = [
-        "## Alert Context",
+def _degraded_sources(data: dict[str, Any]) -> str:
+    """Note sources that timed out or failed, so partial results are visible."""
+    degraded = [
+        f"{name} {status}"
+        for name, status in data.get("source_status", {}).items()
+        if status != "ok"
+    ]
+    return f" (partial results: {', '.join(degraded)})" if degraded else ""
+
+
+def _prompt_budget(node: str) -> int:
+    return settings.agent_prompt_token_budgets.get(node, settings.agent_prompt_token_budget_default)
+
+
+def _format_log_context(state: InvestigationState, log_data: dict[str, Any]) -> CompactedPrompt:
+    """Format log data into a token-budgeted prompt for LLM analysis.
+
+    Log lines are grouped into templates (errors first) and pattern-match
+    samples are only kept if the budget allows.
+    """
+    builder = ContextBuilder("analyze_logs", _prompt_budget("analyze_logs"))
+    builder.section("## Alert Context").require(
         f"Alert: {state.alert_context.alert_name}",
         f"Severity: {state.alert_context.severity}",
         f"Resource: {state.alert_context.resource_id}",
         f"Description: {state.alert_context.description or 'N/A'}",
-        "",
-        "## Log Summary",
+    )
+    builder.section("## Log Summary").require(
         f"Total entries: {log_data['total_entries']}",
         f"Errors: {log_data['error_count']}",
         f"Warnings: {log_data['warning_count']}",
         f"Sources: {', '.join(log_data['sources_queried'])}",
-        "",
-        "## Error Log Entries (most recent)",
-    ]
-    for entry in log_data["error_entries"][:20]:
-        lines.append(f"[{entry.get('level', '?')}] {entry.get('message', '')[:300]}")
+    )
 
-    lines.append("")
-    lines.append("## Pattern Matches")
+    # error_entries is not always a subset of the capped entries list
+    seen: set[int] = set()
+    entries: list[dict[str, Any]] = []
+    for entry in [*log_data["error_entries"], *log_data.get("entries", [])]:
+        if id(entry) not in seen:
+            seen.add(id(entry))
+            entries.append(entry)
+    builder.section("## Log Entries (grouped by template, most severe first)")
+    builder.add_logs(entries)
+
+    builder.section("## Pattern Matches")
     for pattern, matches in log_data["pattern_matches"].items():
-        lines.append(f"- '{pattern}': {len(matches)} matches")
-        for m in matches[:3]:
-            lines.append(f"  {m.get('message', '')[:200]}")
+        builder.require(f"- '{pattern}': {len(matches)} matches")
+        builder.add_logs(matches, score_offset=-5, max_chars=200, indent="  ")
 
-    return "\n".join(lines)
+    return builder.build()
 
 
-def _format_metric_context(state: InvestigationState, metric_data: dict[str, Any]) -> str:
-    """Format metric data into a prompt for LLM analysis."""
-    lines = [
-        "## Alert Context",
+def _format_metric_context(
+    state: InvestigationState, metric_data: dict[str, Any]
+) -> CompactedPrompt:
+    """Format metric data into a token-budgeted prompt for LLM analysis."""
+    builder = ContextBuilder("analyze_metrics", _prompt_budget("analyze_metrics"))
+    builder.section("## Alert Context").require(
         f"Alert: {state.alert_context.alert_name}",
         f"Resource: {state.alert_context.resource_id}",
-        "",
-        "## Current Metric Values",
-    ]
+    )
+
+    builder.section("## Current Metric Values")
     for metric, value in metric_data["current_values"].items():
-        lines.append(f"- {metric}: {value}")
+        builder.add(f"- {metric}: {value}", 15)
 
-    lines.append("")
-    lines.append(f"## Anomalies Detected ({metric_data['anomaly_count']})")
-    for a in metric_data["anomalies"][:10]:
-        lines.append(
+    builder.section(f"## Anomalies Detected ({metric_data['anomaly_count']})")
+    for a in metric_data["anomalies"]:
+        deviation = abs(float(a.get("deviation_percent") or 0))
+        builder.add(
             f"- {a.get('metric_name', '?')}: current={a.get('current_value')}, "
             f"baseline={a.get('baseline_value')}, "
-            f"deviation={a.get('deviation_percent')}%"
+            f"deviation={a.get('deviation_percent')}%",
+            20 + min(math.log10(deviation + 1), 5),
         )
 
-    # Include prior log findings for cross-referencing
-    if state.log_findings:
-        lines.append("")
-        lines.append("## Prior Log Findings")
-        for f in state.log_findings:
-            lines.append(f"- [{f.severity}] {f.summary}")
+    return builder.build()
 
-    return "\n".join(lines)
 
+def _severity_score(severity: str) -> float:
+    return LEVEL_SCORES.get(severity.lower(), 10.0)
 
-def _format_all_findings(state: InvestigationState) -> str:
-    """Format all findings for cross-source correlation."""
-    lines = [
-        "## Alert",
+
+def _findings_builder(state: InvestigationState, node: str) -> ContextBuilder:
+    """Alert, log findings, metric anomalies and trace analysis for *node*'s prompt."""
+    builder = ContextBuilder(node, _prompt_budget(node))
+    builder.section("## Alert").require(
         f"Name: {state.alert_context.alert_name}",
         f"Severity: {state.alert_context.severity}",
         f"Resource: {state.alert_context.resource_id}",
         f"Triggered: {state.alert_context.triggered_at}",
-        "",
-        f"## Log Findings ({len(state.log_findings)})",
-    ]
+    )
+
+    # Findings from one analysis usually share the same samples; show each once
+    builder.section(f"## Log Findings ({len(state.log_findings)})")
+    seen_samples: set[str] = set()
     for f in state.log_findings:
-        lines.append(f"- [{f.severity}] {f.summary} (count: {f.count})")
+        score = _severity_score(f.severity) + min(math.log2(f.count + 1), 9) / 10
+        builder.add(f"- [{f.severity}] {f.summary} (count: {f.count})", score)
         for sample in f.sample_entries[:3]:
-            lines.append(f"  > {sample[:200]}")
-
-    lines.append("")
-    lines.append(f"## Metric Anomalies ({len(state.metric_anomalies)})")
+            line = f"  > {sample[:200]}"
+            template = log_template(sample)
+            if template in seen_samples:
+                builder.add_duplicate(line)
+                continue
+            seen_samples.add(template)
+            builder.add(line, score - 15)
+
+    builder.section(f"## Metric Anomalies ({len(state.metric_anomalies)})")
     for a in state.metric_anomalies:
-        lines.append(
+        builder.add(
             f"- {a.metric_name}: {a.current_value} (baseline: {a.baseline_value}, "
-            f"deviation: {a.deviation_percent}%)"
+            f"deviation: {a.deviation_percent}%)",
+            20 + min(math.log10(abs(a.deviation_percent) + 1), 5),
         )
 
     if state.trace_analysis:
         t = state.trace_analysis
-        lines.append("")
-        lines.append("## Trace Analysis")
-        lines.append(f"Root service: {t.root_service}")
-        lines.append(f"Bottleneck: {t.bottleneck_service or 'none'}")
-        lines.append(f"Error service: {t.error_service or 'none'}")
-        lines.append(f"Total duration: {t.total_duration_ms}ms")
+        builder.section("## Trace Analysis").require(
+            f"Root service: {t.root_service}",
+            f"Bottleneck: {t.bottleneck_service or 'none'}",
+            f"Error service: {t.error_service or 'none'}",
+            f"Total duration: {t.total_duration_ms}ms",
+        )
 
-    return "\n".join(lines)
+    return builder
 
 
-def _format_full_investigation_context(state: InvestigationState) -> str:
+def _format_all_findings(state: InvestigationState) -> CompactedPrompt:
+    """Format all findings for cross-source correlation."""
+    return _findings_builder(state, "correlate_findings").build()
+
+
+def _format_full_investigation_context(state: InvestigationState) -> CompactedPrompt:
     """Format the complete investigation context for hypothesis generation."""
-    lines = [_format_all_findings(state)]
+    builder = _findings_builder(state, "generate_hypotheses")
 
-    lines.append("")
-    lines.append("## Correlated Events")
+    builder.section("## Correlated Events")
     for e in state.correlated_events:
-        lines.append(f"- [{e.source}] {e.description} (score: {e.correlation_score})")
+        builder.add(
+            f"- [{e.source}] {e.description} (score: {e.correlation_score})",
+            15 + 10 * e.correlation_score,
+        )
 
     if state.historical_patterns:
-        lines.append("")
-        lines.append(f"## Historical Patterns ({len(state.historical_patterns)})")
-        for p in state.historical_patterns[:5]:
-            lines.append(
+        builder.section(f"## Historical Patterns ({len(state.historical_patterns)})")
+        for p in state.historical_patterns:
+            builder.add(
                 f"- [{p.incident_id}] root_cause={p.root_cause[:100]}, "
                 f"action={p.resolution_action}, "
-                f"correct={p.was_correct}, score={p.similarity_score:.2f}"
+                f"correct={p.was_correct}, score={p.similarity_score:.2f}",
+                10 + 10 * p.similarity_score,
             )
 
-    lines.append("")
-    lines.append("## Investigation Reasoning Chain")
+    builder.section("## Investigation Reasoning Chain")
     for step in state.reasoning_chain:
-        lines.append(f"Step {step.step_number} ({step.action}): {step.output_summary}")
+        builder.add(f"Step {step.step_number} ({step.action}): {step.output_summary[:300]}", 25)
 
-    return "\n".join(lines)
+    return builder.build()
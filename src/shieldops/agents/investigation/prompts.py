@@ -105,7 +105,6 @@ Your task is to analyze metric data and anomalies to identify:
 1. Which metrics show abnormal behavior
 2. The overall resource pressure level
 3. The most likely bottleneck (CPU, memory, network, disk, connections)
-4. Whether the metrics support or contradict the log findings
 
 Focus on anomalies that deviate significantly from baseline values."""
 
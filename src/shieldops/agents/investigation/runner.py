@@ -18,6 +18,7 @@ from shieldops.connectors.base import ConnectorRouter
 from shieldops.models.base import AlertContext
 from shieldops.observability.base import LogSource, MetricSource, TraceSource
 from shieldops.observability.tracing import get_tracer
+from shieldops.utils.llm_gateway import llm_priority, priority_for_severity
 
 if __import__("typing").TYPE_CHECKING:
     from shieldops.db.repository import Repository
@@ -97,16 +98,18 @@ class InvestigationRunner:
                 span.set_attribute("investigation.alert_name", alert.alert_name)
                 span.set_attribute("investigation.severity", alert.severity)
 
-                # Run the LangGraph workflow
-                final_state_dict = await self._app.ainvoke(
-                    initial_state.model_dump(),  # type: ignore[arg-type]
-                    config={
-                        "metadata": {
-                            "investigation_id": investigation_id,
-                            "alert_id": alert.alert_id,
+                # Run the LangGraph workflow; its LLM calls queue at the
+                # alert's severity
+                with llm_priority(priority_for_severity(alert.severity)):
+                    final_state_dict = await self._app.ainvoke(
+                        initial_state.model_dump(),  # type: ignore[arg-type]
+                        config={
+                            "metadata": {
+                                "investigation_id": investigation_id,
+                                "alert_id": alert.alert_id,
+                            },
                         },
-                    },
-                )
+                    )
 
                 final_state = InvestigationState.model_validate(final_state_dict)
 
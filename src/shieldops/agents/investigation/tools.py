@@ -3,25 +3,45 @@
 These bridge observability connectors and infrastructure connectors to the
 agent's LangGraph nodes. Each tool is a self-contained async function that
 queries external systems and returns structured data.
+
+Log and metric queries fan out concurrently across sources (and, for
+metrics, across metric names).  Each source has its own bound on queries
+in flight and its own deadline, so a slow or failing source neither holds
+slots another source is waiting for nor loses anything but its own
+results; whatever it returned before the deadline is kept.  Per-source
+latency and status are returned alongside the data so the nodes can record
+them in the reasoning chain.
 """
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar
 
 import structlog
 
+from shieldops.config import settings
 from shieldops.connectors.base import ConnectorRouter
 from shieldops.models.base import TimeRange
 from shieldops.observability.base import LogSource, MetricSource, TraceSource
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 class InvestigationToolkit:
     """Collection of tools available to the investigation agent.
 
     Injected into nodes at graph construction time to decouple agent logic
     from specific connector implementations.
+
+    Args:
+        max_concurrent_queries: Queries in flight at once per source;
+            defaults to ``agent_investigation_max_concurrent_queries``.
+        source_timeout: Seconds each source has to answer one tool call;
+            defaults to ``agent_investigation_source_timeout_seconds``.
     """
 
     def __init__(
@@ -31,12 +51,24 @@ class InvestigationToolkit:
         metric_sources: list[MetricSource] | None = None,
         trace_sources: list[TraceSource] | None = None,
         repository: Any = None,
+        max_concurrent_queries: int | None = None,
+        source_timeout: float | None = None,
     ) -> None:
         self._router = connector_router
         self._log_sources = log_sources or []
         self._metric_sources = metric_sources or []
         self._trace_sources = trace_sources or []
         self._repository = repository
+        self._max_concurrent_queries = (
+            max_concurrent_queries or settings.agent_investigation_max_concurrent_queries
+        )
+        # source name -> its query slots
+        self._query_slots: dict[str, asyncio.Semaphore] = {}
+        self._source_timeout = (
+            source_timeout
+            if source_timeout is not None
+            else settings.agent_investigation_source_timeout_seconds
+        )
 
     async def query_logs(
         self,
@@ -55,23 +87,35 @@ class InvestigationToolkit:
         all_entries: list[dict[str, Any]] = []
         pattern_matches: dict[str, list[dict[str, Any]]] = {}
 
-        for source in self._log_sources:
-            try:
-                entries = await source.query_logs(resource_id, time_range)
-                all_entries.extend(entries)
+        async def query_source(source: LogSource) -> dict[str, Any]:
+            entries: list[dict[str, Any]] = []
+            matches: dict[str, list[dict[str, Any]]] = {}
 
-                if patterns:
-                    matches = await source.search_patterns(resource_id, patterns, time_range)
-                    for pattern, hits in matches.items():
-                        pattern_matches.setdefault(pattern, []).extend(hits)
-            except Exception as e:
-                logger.error(
-                    "log_query_failed",
-                    source=source.source_name,
-                    resource_id=resource_id,
-                    error=str(e),
+            async def fetch_entries() -> None:
+                entries.extend(
+                    await self._bounded(source, lambda: source.query_logs(resource_id, time_range))
+                )
+
+            async def fetch_matches() -> None:
+                matches.update(
+                    await self._bounded(
+                        source,
+                        lambda: source.search_patterns(resource_id, patterns or [], time_range),
+                    )
                 )
 
+            calls = [fetch_entries(), fetch_matches()] if patterns else [fetch_entries()]
+            status = await self._run_source(
+                "log_query_failed", source.source_name, calls, resource_id=resource_id
+            )
+            return {"entries": entries, "matches": matches, **status}
+
+        results = await asyncio.gather(*(query_source(s) for s in self._log_sources))
+        for result in results:
+            all_entries.extend(result["entries"])
+            for pattern, hits in result["matches"].items():
+                pattern_matches.setdefault(pattern, []).extend(hits)
+
         # Classify entries by severity
         error_entries = [e for e in all_entries if e.get("level") in ("error", "fatal")]
         warning_entries = [e for e in all_entries if e.get("level") == "warning"]
@@ -80,11 +124,13 @@ class InvestigationToolkit:
             "total_entries": len(all_entries),
             "error_count": len(error_entries),
             "warning_count": len(warning_entries),
-            "entries": all_entries[:100],  # Cap at 100 for LLM context
-            "error_entries": error_entries[:30],
-            "warning_entries": warning_entries[:20],
-            "pattern_matches": {k: v[:10] for k, v in pattern_matches.items()},
+            # Bounded for memory; analyze_logs dedups and token-budgets the prompt
+            "entries": all_entries[:500],
+            "error_entries": error_entries[:200],
+            "warning_entries": warning_entries[:100],
+            "pattern_matches": {k: v[:50] for k, v in pattern_matches.items()},
             "sources_queried": [s.source_name for s in self._log_sources],
+            **self._source_report(self._log_sources, results),
         }
 
     async def query_metrics(
@@ -112,35 +158,47 @@ class InvestigationToolkit:
             metric_names = self._default_metrics_for_resource(resource_id)
 
         labels = self._labels_from_resource_id(resource_id)
-        all_anomalies: list[dict[str, Any]] = []
-        current_values: dict[str, Any] = {}
+        selector = self._format_labels(labels)
+        names = metric_names
 
-        for source in self._metric_sources:
-            for metric in metric_names:
-                try:
-                    # Get current value
-                    instant = await source.query_instant(
-                        f"{metric}{{{self._format_labels(labels)}}}"
-                    )
-                    if instant:
-                        current_values[metric] = instant[0].get("value")
+        async def query_source(source: MetricSource) -> dict[str, Any]:
+            # Slots keep the output in (metric) order however calls complete.
+            values: list[list[dict[str, Any]] | None] = [None] * len(names)
+            anomalies: list[list[dict[str, Any]]] = [[] for _ in names]
 
-                    # Detect anomalies against baseline
-                    anomalies = await source.detect_anomalies(
+            async def fetch_value(i: int, metric: str) -> None:
+                values[i] = await self._bounded(
+                    source, lambda: source.query_instant(f"{metric}{{{selector}}}")
+                )
+
+            async def fetch_anomalies(i: int, metric: str) -> None:
+                # Detect anomalies against baseline
+                anomalies[i] = await self._bounded(
+                    source,
+                    lambda: source.detect_anomalies(
                         metric_name=metric,
                         labels=labels,
                         time_range=time_range,
                         baseline_range=baseline_range,
                         threshold_percent=50.0,
-                    )
-                    all_anomalies.extend(anomalies)
-                except Exception as e:
-                    logger.error(
-                        "metric_query_failed",
-                        source=source.source_name,
-                        metric=metric,
-                        error=str(e),
-                    )
+                    ),
+                )
+
+            calls = [fetch_value(i, m) for i, m in enumerate(names)]
+            calls += [fetch_anomalies(i, m) for i, m in enumerate(names)]
+            status = await self._run_source("metric_query_failed", source.source_name, calls)
+            return {"values": values, "anomalies": anomalies, **status}
+
+        results = await asyncio.gather(*(query_source(s) for s in self._metric_sources))
+        all_anomalies: list[dict[str, Any]] = []
+        current_values: dict[str, Any] = {}
+        for result in results:
+            for metric, instant, found in zip(
+                names, result["values"], result["anomalies"], strict=True
+            ):
+                if instant:
+                    current_values[metric] = instant[0].get("value")
+                all_anomalies.extend(found)
 
         return {
             "current_values": current_values,
@@ -148,6 +206,7 @@ class InvestigationToolkit:
             "anomaly_count": len(all_anomalies),
             "metrics_checked": metric_names,
             "sources_queried": [s.source_name for s in self._metric_sources],
+            **self._source_report(self._metric_sources, results),
         }
 
     async def query_traces(
@@ -268,6 +327,69 @@ class InvestigationToolkit:
 
     # --- Private helpers ---
 
+    async def _bounded(self, source: Any, call: Callable[[], Awaitable[T]]) -> T:
+        """Run one query once one of *source*'s concurrency slots is free."""
+        slots = self._query_slots.get(source.source_name)
+        if slots is None:
+            slots = self._query_slots[source.source_name] = asyncio.Semaphore(
+                self._max_concurrent_queries
+            )
+        async with slots:
+            return await call()
+
+    async def _run_source(
+        self,
+        event: str,
+        source_name: str,
+        calls: list[Awaitable[None]],
+        **log_context: Any,
+    ) -> dict[str, Any]:
+        """Run one source's calls concurrently under the source deadline.
+
+        Calls record their own results as they complete, so on timeout or
+        partial failure whatever already arrived is kept.  Returns the
+        source's status (``ok``, ``partial``, ``failed`` or ``timeout``)
+        and latency in milliseconds.
+        """
+        start = time.monotonic()
+        status = "ok"
+        try:
+            async with asyncio.timeout(self._source_timeout):
+                outcomes = await asyncio.gather(*calls, return_exceptions=True)
+        except TimeoutError:
+            status = "timeout"
+            logger.error(
+                event,
+                source=source_name,
+                error=f"timed out after {self._source_timeout}s",
+                **log_context,
+            )
+        else:
+            errors = [o for o in outcomes if isinstance(o, BaseException)]
+            if errors:
+                status = "failed" if len(errors) == len(outcomes) else "partial"
+                logger.error(
+                    event,
+                    source=source_name,
+                    error=str(errors[0]),
+                    failed_calls=len(errors),
+                    total_calls=len(outcomes),
+                    **log_context,
+                )
+        return {"status": status, "latency_ms": int((time.monotonic() - start) * 1000)}
+
+    @staticmethod
+    def _source_report(sources: list[Any], results: list[dict[str, Any]]) -> dict[str, Any]:
+        """Per-source latency and status, keyed by source name."""
+        return {
+            "source_latency_ms": {
+                s.source_name: r["latency_ms"] for s, r in zip(sources, results, strict=True)
+            },
+            "source_status": {
+                s.source_name: r["status"] for s, r in zip(sources, results, strict=True)
+            },
+        }
+
     @staticmethod
     def _default_metrics_for_resource(resource_id: str) -> list[str]:
         """Standard SRE metrics to check for any resource."""
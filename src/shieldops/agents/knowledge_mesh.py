@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentKnowledgeMesh:
     ) -> None:
         self._max_records = max_records
         self._ttl_seconds = ttl_seconds
-        self._records: list[KnowledgeEntry] = []
+        self._records: RecordStore[KnowledgeEntry] = RecordStore(self._max_records)
         self._propagations: list[PropagationEvent] = []
         logger.info(
             "knowledge_mesh.initialized",
@@ -115,8 +117,6 @@ class AgentKnowledgeMesh:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_mesh.entry_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class AgentKnowledgeMesh:
         return record
 
     def get_entry(self, record_id: str) -> KnowledgeEntry | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_entries(
         self,
@@ -201,6 +201,7 @@ async def analyze_patterns(state: LearningState) -> dict[str, Any]:
                     system_prompt=SYSTEM_PATTERN_ANALYSIS,
                     user_prompt="\n".join(context_lines),
                     schema=PatternAnalysisResult,
+                    agent_type="learning",
                 ),
             )
             output_summary = (
@@ -344,6 +345,7 @@ async def recommend_playbooks(state: LearningState) -> dict[str, Any]:
                     system_prompt=SYSTEM_PLAYBOOK_RECOMMENDATION,
                     user_prompt="\n".join(context_lines),
                     schema=PlaybookRecommendationResult,
+                    agent_type="learning",
                 ),
             )
             output_summary = (
@@ -462,6 +464,7 @@ async def recommend_thresholds(state: LearningState) -> dict[str, Any]:
                     system_prompt=SYSTEM_THRESHOLD_RECOMMENDATION,
                     user_prompt="\n".join(context_lines),
                     schema=ThresholdRecommendationResult,
+                    agent_type="learning",
                 ),
             )
             est_fp_reduction = assessment.estimated_noise_reduction
@@ -552,6 +555,7 @@ async def synthesize_improvements(state: LearningState) -> dict[str, Any]:
                 system_prompt=SYSTEM_IMPROVEMENT_SYNTHESIS,
                 user_prompt="\n".join(context_lines),
                 schema=ImprovementSynthesisResult,
+                agent_type="learning",
             ),
         )
         improvement_score = assessment.improvement_score
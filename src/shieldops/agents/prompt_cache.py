@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class PromptCacheManager:
     ) -> None:
         self._max_records = max_records
         self._ttl_seconds = ttl_seconds
-        self._records: list[CacheEntry] = []
+        self._records: RecordStore[CacheEntry] = RecordStore(self._max_records)
         self._events: list[CacheHitEvent] = []
         logger.info(
             "prompt_cache.initialized",
@@ -115,8 +117,6 @@ class PromptCacheManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "prompt_cache.entry_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class PromptCacheManager:
         return record
 
     def get_entry(self, record_id: str) -> CacheEntry | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_entries(
         self,
@@ -207,6 +207,7 @@ async def assess_risk(state: RemediationState) -> dict[str, Any]:
                 system_prompt=SYSTEM_RISK_ASSESSMENT,
                 user_prompt="\n".join(context_lines),
                 schema=RiskAssessmentResult,
+                agent_type="remediation",
             ),
         )
 
@@ -432,6 +433,7 @@ async def validate_health(state: RemediationState) -> dict[str, Any]:
                     system_prompt=SYSTEM_VALIDATION_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=ValidationAssessmentResult,
+                    agent_type="remediation",
                 ),
             )
             validation_passed = assessment.overall_healthy
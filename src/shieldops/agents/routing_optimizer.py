@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentRoutingOptimizer:
     ) -> None:
         self._max_records = max_records
         self._cost_limit = cost_limit
-        self._records: list[RoutingRecord] = []
+        self._records: RecordStore[RoutingRecord] = RecordStore(self._max_records)
         self._decisions: list[RoutingDecision] = []
         logger.info(
             "routing_optimizer.initialized",
@@ -115,8 +117,6 @@ class AgentRoutingOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "routing_optimizer.recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class AgentRoutingOptimizer:
         return record
 
     def get_routing(self, record_id: str) -> RoutingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_routings(
         self,
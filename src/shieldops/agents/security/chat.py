@@ -441,6 +441,7 @@ class SecurityChatAgent:
                 system_prompt=SYSTEM_PROMPT,
                 user_prompt=user_prompt,
                 schema=_ResponseSchema,
+                agent_type="security_chat",
             )
             return result.response  # type: ignore[union-attr]
 
@@ -153,6 +153,7 @@ async def assess_findings(state: SecurityScanState) -> dict[str, Any]:
                     system_prompt=SYSTEM_VULNERABILITY_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=VulnerabilityAssessmentResult,
+                    agent_type="security",
                 ),
             )
             output_summary = (
@@ -242,6 +243,7 @@ async def check_credentials(state: SecurityScanState) -> dict[str, Any]:
                     system_prompt=SYSTEM_CREDENTIAL_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=CredentialAssessmentResult,
+                    agent_type="security",
                 ),
             )
             output_summary = (
@@ -335,6 +337,7 @@ async def evaluate_compliance(state: SecurityScanState) -> dict[str, Any]:
                     system_prompt=SYSTEM_COMPLIANCE_ASSESSMENT,
                     user_prompt="\n".join(context_lines),
                     schema=ComplianceAssessmentResult,
+                    agent_type="security",
                 ),
             )
             compliance_score = assessment.overall_score
@@ -419,6 +422,7 @@ async def synthesize_posture(state: SecurityScanState) -> dict[str, Any]:
                 system_prompt=SYSTEM_POSTURE_SYNTHESIS,
                 user_prompt="\n".join(context_lines),
                 schema=SecurityPostureResult,
+                agent_type="security",
             ),
         )
         posture.overall_score = assessment.overall_score
@@ -101,6 +101,7 @@ async def classify_event(state: SupervisorState) -> dict[str, Any]:
                     system_prompt=SYSTEM_EVENT_CLASSIFICATION,
                     user_prompt="\n".join(context_lines),
                     schema=EventClassificationResult,
+                    agent_type="supervisor",
                 ),
             )
             task_type = TaskType(assessment.task_type)
@@ -232,6 +233,7 @@ async def evaluate_result(state: SupervisorState) -> dict[str, Any]:
                     system_prompt=SYSTEM_CHAIN_DECISION,
                     user_prompt="\n".join(context_lines),
                     schema=ChainDecisionResult,
+                    agent_type="supervisor",
                 ),
             )
             should_chain = assessment.should_chain
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentSwarmCoordinator:
     ) -> None:
         self._max_records = max_records
         self._max_agents = max_agents
-        self._records: list[SwarmRecord] = []
+        self._records: RecordStore[SwarmRecord] = RecordStore(self._max_records)
         self._assignments: list[AgentAssignment] = []
         logger.info(
             "swarm_coordinator.initialized",
@@ -115,8 +117,6 @@ class AgentSwarmCoordinator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "swarm_coordinator.swarm_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class AgentSwarmCoordinator:
         return record
 
     def get_swarm(self, record_id: str) -> SwarmRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_swarms(
         self,
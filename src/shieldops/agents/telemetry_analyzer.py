@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentTelemetryAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_performance_pct = min_performance_pct
-        self._records: list[TelemetryRecord] = []
+        self._records: RecordStore[TelemetryRecord] = RecordStore(self._max_records)
         self._baselines: list[TelemetryBaseline] = []
         logger.info(
             "telemetry_analyzer.initialized",
@@ -115,8 +117,6 @@ class AgentTelemetryAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "telemetry_analyzer.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class AgentTelemetryAnalyzer:
         return record
 
     def get_telemetry(self, record_id: str) -> TelemetryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_telemetry(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class AgentTokenOptimizer:
     ) -> None:
         self._max_records = max_records
         self._target_savings_pct = target_savings_pct
-        self._records: list[TokenUsageRecord] = []
+        self._records: RecordStore[TokenUsageRecord] = RecordStore(self._max_records)
         self._results: list[OptimizationResult] = []
         logger.info(
             "token_optimizer.initialized",
@@ -115,8 +117,6 @@ class AgentTokenOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "token_optimizer.usage_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class AgentTokenOptimizer:
         return record
 
     def get_usage(self, record_id: str) -> TokenUsageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_usages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ABTestingOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._min_effect_size = min_effect_size
-        self._records: list[ABTestRecord] = []
+        self._records: RecordStore[ABTestRecord] = RecordStore(self._max_records)
         self._analyses: list[ABTestAnalysis] = []
         logger.info(
             "ab_testing_orchestrator.initialized",
@@ -127,8 +129,6 @@ class ABTestingOrchestrator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ab_testing_orchestrator.test_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class ABTestingOrchestrator:
         return record
 
     def get_test(self, record_id: str) -> ABTestRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_tests(
         self,
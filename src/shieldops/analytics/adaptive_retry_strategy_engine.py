@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AdaptiveRetryStrategyEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AdaptiveRetryRecord] = []
+        self._records: RecordStore[AdaptiveRetryRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AdaptiveRetryAnalysis] = {}
         logger.info(
             "adaptive_retry_strategy.init",
@@ -119,8 +121,6 @@ class AdaptiveRetryStrategyEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adaptive_retry.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class AdaptiveRetryStrategyEngine:
         return record
 
     def process(self, key: str) -> AdaptiveRetryAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         svc_recs = [r for r in self._records if r.service_id == rec.service_id]
@@ -227,7 +223,7 @@ class AdaptiveRetryStrategyEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("adaptive_retry_strategy.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AgentConfidenceCalibrationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ConfidenceCalibrationRecord] = []
+        self._records: RecordStore[ConfidenceCalibrationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ConfidenceCalibrationAnalysis] = {}
         logger.info(
             "agent_confidence_calibration.init",
@@ -119,8 +121,6 @@ class AgentConfidenceCalibrationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "confidence_calibration.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class AgentConfidenceCalibrationEngine:
         return record
 
     def process(self, key: str) -> ConfidenceCalibrationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         agent_recs = [r for r in self._records if r.agent_id == rec.agent_id]
@@ -226,7 +222,7 @@ class AgentConfidenceCalibrationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("agent_confidence_calibration.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class AgentDecisionExplainer:
     ) -> None:
         self._max_records = max_records
         self._clarity_threshold = clarity_threshold
-        self._records: list[ExplanationRecord] = []
+        self._records: RecordStore[ExplanationRecord] = RecordStore(self._max_records)
         self._analyses: list[ExplanationAnalysis] = []
         logger.info(
             "agent_decision_explainer.initialized",
@@ -127,8 +129,6 @@ class AgentDecisionExplainer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "agent_decision_explainer.explanation_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class AgentDecisionExplainer:
         return record
 
     def get_explanation(self, record_id: str) -> ExplanationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_explanations(
         self,
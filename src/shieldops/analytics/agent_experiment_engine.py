@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AgentExperimentEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ExperimentRecord] = []
+        self._records: RecordStore[ExperimentRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ExperimentAnalysis] = {}
         logger.info(
             "agent_experiment_engine.initialized",
@@ -119,8 +121,6 @@ class AgentExperimentEngine:
             service=service,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "agent_experiment_engine.record_added",
             record_id=record.id,
@@ -129,10 +129,9 @@ class AgentExperimentEngine:
         return record
 
     def process(self, key: str) -> dict[str, Any]:
-        matching = [r for r in self._records if r.id == key]
-        if not matching:
+        rec = self._records.get(key)
+        if rec is None:
             return {"key": key, "status": "no_data"}
-        rec = matching[0]
         delta = rec.metric_value - rec.baseline_value
         analysis = ExperimentAnalysis(
             experiment_name=rec.experiment_name,
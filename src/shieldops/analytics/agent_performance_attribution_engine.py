@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AgentPerformanceAttributionEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[PerformanceAttributionRecord] = []
+        self._records: RecordStore[PerformanceAttributionRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, PerformanceAttributionAnalysis] = {}
         logger.info(
             "agent_performance_attribution.init",
@@ -118,8 +120,6 @@ class AgentPerformanceAttributionEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "performance_attribution.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class AgentPerformanceAttributionEngine:
         return record
 
     def process(self, key: str) -> PerformanceAttributionAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         agent_recs = [r for r in self._records if r.agent_id == rec.agent_id]
@@ -223,7 +219,7 @@ class AgentPerformanceAttributionEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("agent_performance_attribution.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AgentSpecializationScoringEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SpecializationScoringRecord] = []
+        self._records: RecordStore[SpecializationScoringRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SpecializationScoringAnalysis] = {}
         logger.info(
             "agent_specialization_scoring.init",
@@ -119,8 +121,6 @@ class AgentSpecializationScoringEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "specialization_scoring.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class AgentSpecializationScoringEngine:
         return record
 
     def process(self, key: str) -> SpecializationScoringAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         agent_recs = [r for r in self._records if r.agent_id == rec.agent_id]
@@ -212,7 +208,7 @@ class AgentSpecializationScoringEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("agent_specialization_scoring.cleared")
         return {"status": "cleared"}
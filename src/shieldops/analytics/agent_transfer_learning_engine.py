@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class AgentTransferLearningEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TransferLearningRecord] = []
+        self._records: RecordStore[TransferLearningRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TransferLearningAnalysis] = {}
         logger.info(
             "agent_transfer_learning.init",
@@ -122,8 +124,6 @@ class AgentTransferLearningEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "transfer_learning.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class AgentTransferLearningEngine:
         return record
 
     def process(self, key: str) -> TransferLearningAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         pair_recs = [
@@ -227,7 +223,7 @@ class AgentTransferLearningEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("agent_transfer_learning.cleared")
         return {"status": "cleared"}
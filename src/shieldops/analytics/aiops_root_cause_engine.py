@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class AIOpsRootCauseEngine:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[RootCauseRecord] = []
+        self._records: RecordStore[RootCauseRecord] = RecordStore(self._max_records)
         self._analyses: list[RootCauseAnalysis] = []
         logger.info(
             "aiops_root_cause_engine.initialized",
@@ -130,8 +132,6 @@ class AIOpsRootCauseEngine:
             resolution_time_minutes=resolution_time_minutes,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "aiops_root_cause_engine.record_added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AlertQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._quality_threshold = quality_threshold
-        self._records: list[AlertQualityRecord] = []
+        self._records: RecordStore[AlertQualityRecord] = RecordStore(self._max_records)
         self._analyses: list[AlertQualityAnalysis] = []
         logger.info(
             "alert_quality_scorer.initialized",
@@ -124,8 +126,6 @@ class AlertQualityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_quality_scorer.quality_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AlertQualityScorer:
         return record
 
     def get_quality(self, record_id: str) -> AlertQualityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_qualities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class AlertResponseAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_response_time_minutes = max_response_time_minutes
-        self._records: list[AlertResponseRecord] = []
+        self._records: RecordStore[AlertResponseRecord] = RecordStore(self._max_records)
         self._metrics: list[ResponseMetric] = []
         logger.info(
             "alert_response.initialized",
@@ -120,8 +122,6 @@ class AlertResponseAnalyzer:
             responder=responder,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_response.response_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class AlertResponseAnalyzer:
         return record
 
     def get_response(self, record_id: str) -> AlertResponseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_responses(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AlertTriageScorer:
     ) -> None:
         self._max_records = max_records
         self._triage_score_threshold = triage_score_threshold
-        self._records: list[TriageRecord] = []
+        self._records: RecordStore[TriageRecord] = RecordStore(self._max_records)
         self._analyses: list[TriageAnalysis] = []
         logger.info(
             "alert_triage_scorer.initialized",
@@ -122,8 +124,6 @@ class AlertTriageScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_triage_scorer.triage_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class AlertTriageScorer:
         return record
 
     def get_triage(self, record_id: str) -> TriageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_triages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class MetricAnomalyScorer:
     ) -> None:
         self._max_records = max_records
         self._min_anomaly_score = min_anomaly_score
-        self._records: list[AnomalyRecord] = []
+        self._records: RecordStore[AnomalyRecord] = RecordStore(self._max_records)
         self._contexts: list[AnomalyContext] = []
         logger.info(
             "anomaly_scorer.initialized",
@@ -122,8 +124,6 @@ class MetricAnomalyScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "anomaly_scorer.recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class MetricAnomalyScorer:
         return record
 
     def get_anomaly(self, record_id: str) -> AnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_anomalies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class APIPerformanceProfiler:
     ) -> None:
         self._max_records = max_records
         self._slow_threshold_ms = slow_threshold_ms
-        self._records: list[PerformanceRecord] = []
+        self._records: RecordStore[PerformanceRecord] = RecordStore(self._max_records)
         self._profiles: list[EndpointProfile] = []
         logger.info(
             "api_performance.initialized",
@@ -113,8 +115,6 @@ class APIPerformanceProfiler:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_performance.recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class APIPerformanceProfiler:
         return record
 
     def get_performance(self, record_id: str) -> PerformanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_performances(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuthenticationPatternAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AuthPatternRecord] = []
+        self._records: RecordStore[AuthPatternRecord] = RecordStore(self._max_records)
         self._analyses: list[AuthPatternAnalysis] = []
         logger.info(
             "authentication_pattern_analyzer.initialized",
@@ -124,8 +126,6 @@ class AuthenticationPatternAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "authentication_pattern_analyzer.pattern_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuthenticationPatternAnalyzer:
         return record
 
     def get_record(self, record_id: str) -> AuthPatternRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
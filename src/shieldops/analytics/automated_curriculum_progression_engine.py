@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class AutomatedCurriculumProgressionEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CurriculumRecord] = []
+        self._records: RecordStore[CurriculumRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CurriculumAnalysis] = {}
         logger.info(
             "automated_curriculum_progression_engine.init",
@@ -115,8 +117,6 @@ class AutomatedCurriculumProgressionEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_curriculum_progression.record_added",
             record_id=record.id,
@@ -125,11 +125,7 @@ class AutomatedCurriculumProgressionEngine:
         return record
 
     def process(self, key: str) -> CurriculumAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         cur_recs = [r for r in self._records if r.curriculum_id == rec.curriculum_id]
@@ -200,7 +196,7 @@ class AutomatedCurriculumProgressionEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("automated_curriculum_progression_engine.cleared")
         return {"status": "cleared"}
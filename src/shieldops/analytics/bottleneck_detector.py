@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class CapacityBottleneckDetector:
     ) -> None:
         self._max_records = max_records
         self._critical_utilization_pct = critical_utilization_pct
-        self._records: list[BottleneckRecord] = []
+        self._records: RecordStore[BottleneckRecord] = RecordStore(self._max_records)
         self._events: list[BottleneckEvent] = []
         logger.info(
             "bottleneck_detector.initialized",
@@ -121,8 +123,6 @@ class CapacityBottleneckDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "bottleneck_detector.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class CapacityBottleneckDetector:
         return record
 
     def get_bottleneck(self, record_id: str) -> BottleneckRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_bottlenecks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class BuildPipelineAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate_pct = min_success_rate_pct
-        self._records: list[BuildRecord] = []
+        self._records: RecordStore[BuildRecord] = RecordStore(self._max_records)
         self._optimizations: list[BuildOptimization] = []
         logger.info(
             "build_pipeline.initialized",
@@ -122,8 +124,6 @@ class BuildPipelineAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "build_pipeline.build_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class BuildPipelineAnalyzer:
         return record
 
     def get_build(self, record_id: str) -> BuildRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_builds(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BurnoutRiskDetector:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[BurnoutRecord] = []
+        self._records: RecordStore[BurnoutRecord] = RecordStore(self._max_records)
         self._analyses: list[BurnoutAnalysis] = []
         logger.info(
             "burnout_risk_detector.initialized",
@@ -124,8 +126,6 @@ class BurnoutRiskDetector:
             overtime_hours=overtime_hours,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "burnout_risk_detector.burnout_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BurnoutRiskDetector:
         return record
 
     def get_burnout(self, record_id: str) -> BurnoutRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_burnouts(
         self,
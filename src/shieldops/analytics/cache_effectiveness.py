@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CacheEffectivenessAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_hit_rate_pct = min_hit_rate_pct
-        self._records: list[CacheMetricRecord] = []
+        self._records: RecordStore[CacheMetricRecord] = RecordStore(self._max_records)
         self._recommendations: list[CacheRecommendation] = []
         logger.info(
             "cache_effectiveness.initialized",
@@ -139,8 +141,6 @@ class CacheEffectivenessAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cache_effectiveness.metrics_recorded",
             record_id=record.id,
@@ -151,10 +151,7 @@ class CacheEffectivenessAnalyzer:
         return record
 
     def get_metrics(self, record_id: str) -> CacheMetricRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CapabilityFrontierMapperEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[FrontierRecord] = []
+        self._records: RecordStore[FrontierRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, FrontierAnalysis] = {}
         logger.info(
             "capability_frontier_mapper_engine.init",
@@ -118,8 +120,6 @@ class CapabilityFrontierMapperEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capability_frontier_mapper.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class CapabilityFrontierMapperEngine:
         return record
 
     def process(self, key: str) -> FrontierAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         agent_recs = [r for r in self._records if r.agent_id == rec.agent_id]
@@ -211,7 +207,7 @@ class CapabilityFrontierMapperEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("capability_frontier_mapper_engine.cleared")
         return {"status": "cleared"}
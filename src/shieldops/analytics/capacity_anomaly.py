@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CapacityAnomalyDetector:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[AnomalyRecord] = []
+        self._records: RecordStore[AnomalyRecord] = RecordStore(self._max_records)
         self._patterns: list[AnomalyPattern] = []
         logger.info(
             "capacity_anomaly.initialized",
@@ -116,8 +118,6 @@ class CapacityAnomalyDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity_anomaly.anomaly_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class CapacityAnomalyDetector:
         return record
 
     def get_anomaly(self, record_id: str) -> AnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_anomalies(
         self,
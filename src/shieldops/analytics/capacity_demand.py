@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CapacityDemandModeler:
     ) -> None:
         self._max_records = max_records
         self._deficit_threshold_pct = deficit_threshold_pct
-        self._records: list[DemandRecord] = []
+        self._records: RecordStore[DemandRecord] = RecordStore(self._max_records)
         self._supply_gaps: list[SupplyGap] = []
         logger.info(
             "capacity_demand.initialized",
@@ -134,8 +136,6 @@ class CapacityDemandModeler:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity_demand.demand_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class CapacityDemandModeler:
         return record
 
     def get_demand(self, record_id: str) -> DemandRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_demands(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CapacityHeadroomAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_headroom_pct = min_headroom_pct
-        self._records: list[HeadroomRecord] = []
+        self._records: RecordStore[HeadroomRecord] = RecordStore(self._max_records)
         self._projections: list[HeadroomProjection] = []
         logger.info(
             "capacity_headroom.initialized",
@@ -124,8 +126,6 @@ class CapacityHeadroomAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity_headroom.headroom_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CapacityHeadroomAnalyzer:
         return record
 
     def get_headroom(self, record_id: str) -> HeadroomRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_headroom(
         self,
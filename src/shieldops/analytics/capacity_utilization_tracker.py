@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CapacityUtilizationTracker:
     ) -> None:
         self._max_records = max_records
         self._min_utilization_pct = min_utilization_pct
-        self._records: list[UtilizationRecord] = []
+        self._records: RecordStore[UtilizationRecord] = RecordStore(self._max_records)
         self._metrics: list[UtilizationMetric] = []
         logger.info(
             "capacity_utilization_tracker.initialized",
@@ -124,8 +126,6 @@ class CapacityUtilizationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity_utilization_tracker.utilization_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CapacityUtilizationTracker:
         return record
 
     def get_utilization(self, record_id: str) -> UtilizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_utilizations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CareerDevelopmentTracker:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CareerRecord] = []
+        self._records: RecordStore[CareerRecord] = RecordStore(self._max_records)
         self._analyses: list[CareerAnalysis] = []
         logger.info(
             "career_development_tracker.initialized",
@@ -124,8 +126,6 @@ class CareerDevelopmentTracker:
             months_in_role=months_in_role,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "career_development_tracker.career_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CareerDevelopmentTracker:
         return record
 
     def get_career(self, record_id: str) -> CareerRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_careers(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class CausalInferenceEngine:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[CausalRecord] = []
+        self._records: RecordStore[CausalRecord] = RecordStore(self._max_records)
         self._analyses: list[CausalAnalysis] = []
         logger.info(
             "causal_inference_engine.initialized",
@@ -127,8 +129,6 @@ class CausalInferenceEngine:
             blast_radius_overlap=blast_radius_overlap,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "causal_inference_engine.record_added",
             record_id=record.id,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CodeReviewEffectivenessEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CodeReviewRecord] = []
+        self._records: RecordStore[CodeReviewRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CodeReviewAnalysis] = {}
         logger.info(
             "code_review_effectiveness_engine.init",
@@ -120,8 +122,6 @@ class CodeReviewEffectivenessEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "code_review_effectiveness.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class CodeReviewEffectivenessEngine:
         return record
 
     def process(self, key: str) -> CodeReviewAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         rev_recs = [r for r in self._records if r.reviewer_id == rec.reviewer_id]
@@ -205,7 +201,7 @@ class CodeReviewEffectivenessEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("code_review_effectiveness_engine.cleared")
         return {"status": "cleared"}
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CoevolutionComputeEfficiencyEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ComputeEfficiencyRecord] = []
+        self._records: RecordStore[ComputeEfficiencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ComputeEfficiencyAnalysis] = {}
         logger.info(
             "coevolution_compute_efficiency_engine.init",
@@ -122,8 +124,6 @@ class CoevolutionComputeEfficiencyEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "coevolution_compute_efficiency.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class CoevolutionComputeEfficiencyEngine:
         return record
 
     def process(self, key: str) -> ComputeEfficiencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         exp_recs = [r for r in self._records if r.experiment_id == rec.experiment_id]
@@ -218,7 +214,7 @@ class CoevolutionComputeEfficiencyEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("coevolution_compute_efficiency_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CollaborationPatternAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CollaborationRecord] = []
+        self._records: RecordStore[CollaborationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CollaborationAnalysis] = {}
         logger.info(
             "collaboration_pattern_analyzer.init",
@@ -117,8 +119,6 @@ class CollaborationPatternAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "collaboration_pattern.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class CollaborationPatternAnalyzer:
         return record
 
     def process(self, key: str) -> CollaborationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         team_recs = [r for r in self._records if r.team_id == rec.team_id]
@@ -200,7 +196,7 @@ class CollaborationPatternAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("collaboration_pattern_analyzer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CrossTeamCollaborationScorer:
     ) -> None:
         self._max_records = max_records
         self._min_score = min_score
-        self._records: list[CollaborationRecord] = []
+        self._records: RecordStore[CollaborationRecord] = RecordStore(self._max_records)
         self._metrics: list[CollaborationMetric] = []
         logger.info(
             "collaboration_scorer.initialized",
@@ -116,8 +118,6 @@ class CrossTeamCollaborationScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "collaboration_scorer.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class CrossTeamCollaborationScorer:
         return record
 
     def get_collaboration(self, record_id: str) -> CollaborationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_collaborations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ConnectionPoolMonitor:
     ) -> None:
         self._max_records = max_records
         self._saturation_threshold_pct = saturation_threshold_pct
-        self._records: list[PoolMetricRecord] = []
+        self._records: RecordStore[PoolMetricRecord] = RecordStore(self._max_records)
         self._recommendations: list[PoolRecommendation] = []
         logger.info(
             "connection_pool.initialized",
@@ -124,8 +126,6 @@ class ConnectionPoolMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "connection_pool.metrics_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ConnectionPoolMonitor:
         return record
 
     def get_metrics(self, record_id: str) -> PoolMetricRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
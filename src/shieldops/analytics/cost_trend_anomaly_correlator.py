@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CostTrendAnomalyCorrelator:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CostTrendRecord] = []
+        self._records: RecordStore[CostTrendRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CostTrendAnalysis] = {}
         logger.info(
             "cost_trend_anomaly_correlator.init",
@@ -116,8 +118,6 @@ class CostTrendAnomalyCorrelator:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_trend_correlator.record_added",
             record_id=record.id,
@@ -126,11 +126,7 @@ class CostTrendAnomalyCorrelator:
         return record
 
     def process(self, key: str) -> CostTrendAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         change = 0.0
@@ -195,7 +191,7 @@ class CostTrendAnomalyCorrelator:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cost_trend_anomaly_correlator.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._quality_score_threshold = quality_score_threshold
-        self._records: list[QualityRecord] = []
+        self._records: RecordStore[QualityRecord] = RecordStore(self._max_records)
         self._analyses: list[QualityAnalysis] = []
         logger.info(
             "data_quality_scorer.initialized",
@@ -124,8 +126,6 @@ class DataQualityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_quality_scorer.quality_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataQualityScorer:
         return record
 
     def get_quality(self, record_id: str) -> QualityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_quality_records(
         self,
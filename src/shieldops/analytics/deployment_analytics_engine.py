@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -111,7 +113,7 @@ class DeploymentAnalyticsEngine:
     ) -> None:
         self._max_records = max_records
         self._performance_threshold = performance_threshold
-        self._records: list[DeploymentAnalyticsRecord] = []
+        self._records: RecordStore[DeploymentAnalyticsRecord] = RecordStore(self._max_records)
         self._analyses: list[DeploymentAnalyticsAnalysis] = []
         logger.info(
             "deployment.analytics.engine.initialized",
@@ -151,8 +153,6 @@ class DeploymentAnalyticsEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment.analytics.engine.item_recorded",
             record_id=record.id,
@@ -163,10 +163,7 @@ class DeploymentAnalyticsEngine:
         return record
 
     def get_record(self, record_id: str) -> DeploymentAnalyticsRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
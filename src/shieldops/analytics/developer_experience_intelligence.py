@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeveloperExperienceIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DevexRecord] = []
+        self._records: RecordStore[DevexRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DevexAnalysis] = {}
         logger.info(
             "developer_experience_intelligence.init",
@@ -117,8 +119,6 @@ class DeveloperExperienceIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "developer_experience.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class DeveloperExperienceIntelligence:
         return record
 
     def process(self, key: str) -> DevexAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         tool_recs = [r for r in self._records if r.tool_id == rec.tool_id]
@@ -209,7 +205,7 @@ class DeveloperExperienceIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("developer_experience_intelligence.cleared")
         return {"status": "cleared"}
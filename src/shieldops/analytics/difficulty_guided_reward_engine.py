@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class DifficultyGuidedRewardEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DifficultyRewardRecord] = []
+        self._records: RecordStore[DifficultyRewardRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DifficultyRewardAnalysis] = {}
         logger.info(
             "difficulty_guided_reward_engine.init",
@@ -115,8 +117,6 @@ class DifficultyGuidedRewardEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "difficulty_guided_reward.record_added",
             record_id=record.id,
@@ -125,11 +125,7 @@ class DifficultyGuidedRewardEngine:
         return record
 
     def process(self, key: str) -> DifficultyRewardAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         solver_recs = [r for r in self._records if r.solver_id == rec.solver_id]
@@ -203,7 +199,7 @@ class DifficultyGuidedRewardEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("difficulty_guided_reward_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class DynamicRiskScorer:
     ) -> None:
         self._max_records = max_records
         self._high_threshold = high_threshold
-        self._records: list[RiskScoreRecord] = []
+        self._records: RecordStore[RiskScoreRecord] = RecordStore(self._max_records)
         self._adjustments: list[ScoreAdjustmentEvent] = []
         logger.info(
             "dynamic_risk_scorer.initialized",
@@ -115,8 +117,6 @@ class DynamicRiskScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dynamic_risk_scorer.score_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class DynamicRiskScorer:
         return record
 
     def get_score(self, record_id: str) -> RiskScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scores(
         self,
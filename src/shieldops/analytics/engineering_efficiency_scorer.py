@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EngineeringEfficiencyScorer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EfficiencyRecord] = []
+        self._records: RecordStore[EfficiencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EfficiencyAnalysis] = {}
         logger.info(
             "engineering_efficiency_scorer.init",
@@ -117,8 +119,6 @@ class EngineeringEfficiencyScorer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "engineering_efficiency.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EngineeringEfficiencyScorer:
         return record
 
     def process(self, key: str) -> EfficiencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         wf_recs = [r for r in self._records if r.workflow_id == rec.workflow_id]
@@ -205,7 +201,7 @@ class EngineeringEfficiencyScorer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("engineering_efficiency_scorer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ErrorPatternClassifier:
     ) -> None:
         self._max_records = max_records
         self._max_error_rate_pct = max_error_rate_pct
-        self._records: list[ErrorRecord] = []
+        self._records: RecordStore[ErrorRecord] = RecordStore(self._max_records)
         self._patterns: list[ErrorPattern] = []
         logger.info(
             "error_classifier.initialized",
@@ -118,8 +120,6 @@ class ErrorPatternClassifier:
             occurrence_count=occurrence_count,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "error_classifier.error_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class ErrorPatternClassifier:
         return record
 
     def get_error(self, record_id: str) -> ErrorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_errors(
         self,
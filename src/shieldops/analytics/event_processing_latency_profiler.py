@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EventProcessingLatencyProfiler:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[LatencyRecord] = []
+        self._records: RecordStore[LatencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, LatencyAnalysis] = {}
         logger.info(
             "event_processing_latency_profiler.init",
@@ -117,8 +119,6 @@ class EventProcessingLatencyProfiler:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "latency_profiler.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EventProcessingLatencyProfiler:
         return record
 
     def process(self, key: str) -> LatencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         outlier = rec.p99_latency_ms > rec.latency_ms * 3
@@ -203,7 +199,7 @@ class EventProcessingLatencyProfiler:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("event_processing_latency_profiler.cleared")
         return {"status": "cleared"}
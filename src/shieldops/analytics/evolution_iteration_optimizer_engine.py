@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class EvolutionIterationOptimizerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[IterationOptimizerRecord] = []
+        self._records: RecordStore[IterationOptimizerRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, IterationOptimizerAnalysis] = {}
         logger.info(
             "evolution_iteration_optimizer_engine.init",
@@ -118,8 +120,6 @@ class EvolutionIterationOptimizerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evolution_iteration_optimizer.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class EvolutionIterationOptimizerEngine:
         return record
 
     def process(self, key: str) -> IterationOptimizerAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         run_recs = [r for r in self._records if r.run_id == rec.run_id]
@@ -205,7 +201,7 @@ class EvolutionIterationOptimizerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("evolution_iteration_optimizer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class FeatureDriftMonitor:
     ) -> None:
         self._max_records = max_records
         self._drift_threshold = drift_threshold
-        self._records: list[FeatureDriftRecord] = []
+        self._records: RecordStore[FeatureDriftRecord] = RecordStore(self._max_records)
         self._analyses: list[FeatureDriftAnalysis] = []
         logger.info(
             "feature_drift_monitor.initialized",
@@ -127,8 +129,6 @@ class FeatureDriftMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "feature_drift_monitor.drift_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class FeatureDriftMonitor:
         return record
 
     def get_drift(self, record_id: str) -> FeatureDriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
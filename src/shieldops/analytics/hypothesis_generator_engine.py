@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class HypothesisGeneratorEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[HypothesisRecord] = []
+        self._records: RecordStore[HypothesisRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, HypothesisAnalysis] = {}
         logger.info(
             "hypothesis_generator_engine.initialized",
@@ -118,8 +120,6 @@ class HypothesisGeneratorEngine:
             service=service,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "hypothesis_generator_engine.record_added",
             record_id=record.id,
@@ -128,10 +128,9 @@ class HypothesisGeneratorEngine:
         return record
 
     def process(self, key: str) -> dict[str, Any]:
-        matching = [r for r in self._records if r.id == key]
-        if not matching:
+        rec = self._records.get(key)
+        if rec is None:
             return {"key": key, "status": "no_data"}
-        rec = matching[0]
         analysis = HypothesisAnalysis(
             hypothesis_name=rec.hypothesis_name,
             source=rec.source,
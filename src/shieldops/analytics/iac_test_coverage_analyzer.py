@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class IacTestCoverageAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TestCoverageRecord] = []
+        self._records: RecordStore[TestCoverageRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TestCoverageAnalysis] = {}
         logger.info(
             "iac_test_coverage_analyzer.init",
@@ -120,8 +122,6 @@ class IacTestCoverageAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "test_coverage.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class IacTestCoverageAnalyzer:
         return record
 
     def process(self, key: str) -> TestCoverageAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         untested = rec.total_resources - rec.tested_resources
@@ -203,7 +199,7 @@ class IacTestCoverageAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("iac_test_coverage_analyzer.cleared")
         return {"status": "cleared"}
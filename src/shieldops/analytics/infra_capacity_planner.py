@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class InfraCapacityPlanner:
     ) -> None:
         self._max_records = max_records
         self._target_utilization_pct = target_utilization_pct
-        self._records: list[CapacityPlan] = []
+        self._records: RecordStore[CapacityPlan] = RecordStore(self._max_records)
         self._rules: list[PlanningRule] = []
         logger.info(
             "infra_capacity_planner.initialized",
@@ -116,8 +118,6 @@ class InfraCapacityPlanner:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "infra_capacity_planner.plan_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class InfraCapacityPlanner:
         return record
 
     def get_plan(self, record_id: str) -> CapacityPlan | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_plans(
         self,
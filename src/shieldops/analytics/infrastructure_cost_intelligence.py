@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -107,7 +109,7 @@ class InfrastructureCostIntelligence:
     ) -> None:
         self._max_records = max_records
         self._waste_threshold = waste_threshold
-        self._records: list[InfrastructureCostRecord] = []
+        self._records: RecordStore[InfrastructureCostRecord] = RecordStore(self._max_records)
         self._analyses: list[InfrastructureCostAnalysis] = []
         logger.info(
             "infrastructure.cost.intelligence.initialized",
@@ -147,8 +149,6 @@ class InfrastructureCostIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "infrastructure.cost.intelligence.item_recorded",
             record_id=record.id,
@@ -159,10 +159,7 @@ class InfrastructureCostIntelligence:
         return record
 
     def get_record(self, record_id: str) -> InfrastructureCostRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class LatencyDistributionAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[LatencyDistributionRecord] = []
+        self._records: RecordStore[LatencyDistributionRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, LatencyDistributionAnalysis] = {}
         logger.info(
             "latency_distribution_analyzer.init",
@@ -120,8 +122,6 @@ class LatencyDistributionAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "latency_distribution_analyzer.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class LatencyDistributionAnalyzer:
         return record
 
     def process(self, key: str) -> LatencyDistributionAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         points = sum(1 for r in self._records if r.endpoint_id == rec.endpoint_id)
@@ -194,7 +190,7 @@ class LatencyDistributionAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("latency_distribution_analyzer.cleared")
         return {"status": "cleared"}
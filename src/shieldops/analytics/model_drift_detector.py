@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ModelDriftDetector:
     ) -> None:
         self._max_records = max_records
         self._drift_threshold = drift_threshold
-        self._records: list[DriftRecord] = []
+        self._records: RecordStore[DriftRecord] = RecordStore(self._max_records)
         self._analyses: list[DriftAnalysis] = []
         logger.info(
             "model_drift_detector.initialized",
@@ -127,8 +129,6 @@ class ModelDriftDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_drift_detector.drift_recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class ModelDriftDetector:
         return record
 
     def get_drift(self, record_id: str) -> DriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ModelFairnessScorer:
     ) -> None:
         self._max_records = max_records
         self._fairness_threshold = fairness_threshold
-        self._records: list[FairnessRecord] = []
+        self._records: RecordStore[FairnessRecord] = RecordStore(self._max_records)
         self._analyses: list[FairnessAnalysis] = []
         logger.info(
             "model_fairness_scorer.initialized",
@@ -124,8 +126,6 @@ class ModelFairnessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_fairness_scorer.fairness_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ModelFairnessScorer:
         return record
 
     def get_fairness(self, record_id: str) -> FairnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_fairness(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ModelLineageTracker:
     ) -> None:
         self._max_records = max_records
         self._lineage_gap_threshold = lineage_gap_threshold
-        self._records: list[LineageRecord] = []
+        self._records: RecordStore[LineageRecord] = RecordStore(self._max_records)
         self._analyses: list[LineageAnalysis] = []
         logger.info(
             "model_lineage_tracker.initialized",
@@ -124,8 +126,6 @@ class ModelLineageTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_lineage_tracker.lineage_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ModelLineageTracker:
         return record
 
     def get_lineage(self, record_id: str) -> LineageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_lineages(
         self,
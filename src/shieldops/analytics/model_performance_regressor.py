@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ModelPerformanceRegressor:
     ) -> None:
         self._max_records = max_records
         self._regression_threshold = regression_threshold
-        self._records: list[PerformanceRecord] = []
+        self._records: RecordStore[PerformanceRecord] = RecordStore(self._max_records)
         self._analyses: list[PerformanceAnalysis] = []
         logger.info(
             "model_performance_regressor.initialized",
@@ -127,8 +129,6 @@ class ModelPerformanceRegressor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_performance_regressor.performance_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class ModelPerformanceRegressor:
         return record
 
     def get_performance(self, record_id: str) -> PerformanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_performances(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ModelRetrainingPipeline:
     ) -> None:
         self._max_records = max_records
         self._success_rate_threshold = success_rate_threshold
-        self._records: list[RetrainingRecord] = []
+        self._records: RecordStore[RetrainingRecord] = RecordStore(self._max_records)
         self._analyses: list[RetrainingAnalysis] = []
         logger.info(
             "model_retraining_pipeline.initialized",
@@ -124,8 +126,6 @@ class ModelRetrainingPipeline:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_retraining_pipeline.pipeline_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ModelRetrainingPipeline:
         return record
 
     def get_pipeline(self, record_id: str) -> RetrainingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_pipelines(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MTTDTrendAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._detection_time_threshold = detection_time_threshold
-        self._records: list[MTTDRecord] = []
+        self._records: RecordStore[MTTDRecord] = RecordStore(self._max_records)
         self._analyses: list[MTTDAnalysis] = []
         logger.info(
             "mttd_trend_analyzer.initialized",
@@ -124,8 +126,6 @@ class MTTDTrendAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mttd_trend_analyzer.mttd_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MTTDTrendAnalyzer:
         return record
 
     def get_mttd(self, record_id: str) -> MTTDRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mttds(
         self,
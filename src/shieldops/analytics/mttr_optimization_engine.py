@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MTTROptimizationEngine:
     ) -> None:
         self._max_records = max_records
         self._response_time_threshold = response_time_threshold
-        self._records: list[MTTRRecord] = []
+        self._records: RecordStore[MTTRRecord] = RecordStore(self._max_records)
         self._analyses: list[MTTRAnalysis] = []
         logger.info(
             "mttr_optimization_engine.initialized",
@@ -124,8 +126,6 @@ class MTTROptimizationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mttr_optimization_engine.mttr_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MTTROptimizationEngine:
         return record
 
     def get_mttr(self, record_id: str) -> MTTRRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mttrs(
         self,
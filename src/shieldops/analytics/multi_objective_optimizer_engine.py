@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class MultiObjectiveOptimizerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MultiObjectiveRecord] = []
+        self._records: RecordStore[MultiObjectiveRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MultiObjectiveAnalysis] = {}
         logger.info(
             "multi_objective_optimizer.init",
@@ -118,8 +120,6 @@ class MultiObjectiveOptimizerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "multi_objective.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class MultiObjectiveOptimizerEngine:
         return record
 
     def process(self, key: str) -> MultiObjectiveAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sol_recs = [r for r in self._records if r.solution_id == rec.solution_id]
@@ -210,7 +206,7 @@ class MultiObjectiveOptimizerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("multi_objective_optimizer.cleared")
         return {"status": "cleared"}
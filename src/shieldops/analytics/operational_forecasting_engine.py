@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -99,7 +101,7 @@ class OperationalForecastingEngine:
     ) -> None:
         self._max_records = max_records
         self._accuracy_threshold = accuracy_threshold
-        self._records: list[ForecastRecord] = []
+        self._records: RecordStore[ForecastRecord] = RecordStore(self._max_records)
         self._analyses: list[ForecastAnalysis] = []
         logger.info(
             "operational_forecasting_engine.initialized",
@@ -131,8 +133,6 @@ class OperationalForecastingEngine:
             breach_predicted=breach_predicted,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "operational_forecasting_engine.record_added",
             record_id=record.id,
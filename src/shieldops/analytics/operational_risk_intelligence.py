@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -112,7 +114,7 @@ class OperationalRiskIntelligence:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[OperationalRiskRecord] = []
+        self._records: RecordStore[OperationalRiskRecord] = RecordStore(self._max_records)
         self._analyses: list[OperationalRiskAnalysis] = []
         logger.info(
             "operational.risk.intelligence.initialized",
@@ -152,8 +154,6 @@ class OperationalRiskIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "operational.risk.intelligence.item_recorded",
             record_id=record.id,
@@ -164,10 +164,7 @@ class OperationalRiskIntelligence:
         return record
 
     def get_record(self, record_id: str) -> OperationalRiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
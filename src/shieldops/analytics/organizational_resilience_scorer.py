@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class OrganizationalResilienceScorer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ResilienceRecord] = []
+        self._records: RecordStore[ResilienceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ResilienceAnalysis] = {}
         logger.info(
             "organizational_resilience_scorer.init",
@@ -117,8 +119,6 @@ class OrganizationalResilienceScorer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "org_resilience.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class OrganizationalResilienceScorer:
         return record
 
     def process(self, key: str) -> ResilienceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         cap_recs = [r for r in self._records if r.capability_id == rec.capability_id]
@@ -197,7 +193,7 @@ class OrganizationalResilienceScorer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("organizational_resilience_scorer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PerformanceBenchmarkTracker:
     ) -> None:
         self._max_records = max_records
         self._max_regression_pct = max_regression_pct
-        self._records: list[BenchmarkRecord] = []
+        self._records: RecordStore[BenchmarkRecord] = RecordStore(self._max_records)
         self._baselines: list[BenchmarkBaseline] = []
         logger.info(
             "perf_benchmark.initialized",
@@ -124,8 +126,6 @@ class PerformanceBenchmarkTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "perf_benchmark.benchmark_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PerformanceBenchmarkTracker:
         return record
 
     def get_benchmark(self, record_id: str) -> BenchmarkRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_benchmarks(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -120,7 +122,7 @@ class PlatformObservabilityScore:
         self._max_records = max_records
         self._target_score = target_score
         self._min_pillar_coverage = min_pillar_coverage
-        self._records: list[ObservabilityScoreRecord] = []
+        self._records: RecordStore[ObservabilityScoreRecord] = RecordStore(self._max_records)
         self._gaps: list[CoverageGap] = []
         logger.info(
             "platform_observability_score.initialized",
@@ -156,8 +158,6 @@ class PlatformObservabilityScore:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         if coverage_pct < self._min_pillar_coverage:
             severity = (
                 GapSeverity.CRITICAL
@@ -188,10 +188,7 @@ class PlatformObservabilityScore:
         return record
 
     def get_record(self, record_id: str) -> ObservabilityScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PredictionConfidenceCalibrator:
     ) -> None:
         self._max_records = max_records
         self._calibration_error_threshold = calibration_error_threshold
-        self._records: list[CalibrationRecord] = []
+        self._records: RecordStore[CalibrationRecord] = RecordStore(self._max_records)
         self._analyses: list[CalibrationAnalysis] = []
         logger.info(
             "prediction_confidence_calibrator.initialized",
@@ -124,8 +126,6 @@ class PredictionConfidenceCalibrator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "prediction_confidence_calibrator.calibration_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class PredictionConfidenceCalibrator:
         return record
 
     def get_calibration(self, record_id: str) -> CalibrationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_calibrations(
         self,
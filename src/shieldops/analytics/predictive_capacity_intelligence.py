@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class PredictiveCapacityIntelligence:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CapacityIntelRecord] = []
+        self._records: RecordStore[CapacityIntelRecord] = RecordStore(self._max_records)
         self._analyses: list[CapacityIntelAnalysis] = []
         logger.info(
             "predictive_capacity_intelligence.initialized",
@@ -130,8 +132,6 @@ class PredictiveCapacityIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "predictive_capacity_intelligence.entry_recorded",
             record_id=record.id,
@@ -142,10 +142,7 @@ class PredictiveCapacityIntelligence:
         return record
 
     def get_record(self, record_id: str) -> CapacityIntelRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
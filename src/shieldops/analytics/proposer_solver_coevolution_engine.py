@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ProposerSolverCoevolutionEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CoevolutionRecord] = []
+        self._records: RecordStore[CoevolutionRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CoevolutionAnalysis] = {}
         logger.info(
             "proposer_solver_coevolution_engine.init",
@@ -119,8 +121,6 @@ class ProposerSolverCoevolutionEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "proposer_solver_coevolution.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class ProposerSolverCoevolutionEngine:
         return record
 
     def process(self, key: str) -> CoevolutionAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         coevo_recs = [r for r in self._records if r.coevolution_id == rec.coevolution_id]
@@ -210,7 +206,7 @@ class ProposerSolverCoevolutionEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("proposer_solver_coevolution_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ReliabilityMetricsCollector:
     ) -> None:
         self._max_records = max_records
         self._min_reliability_score = min_reliability_score
-        self._records: list[ReliabilityRecord] = []
+        self._records: RecordStore[ReliabilityRecord] = RecordStore(self._max_records)
         self._data_points: list[MetricDataPoint] = []
         logger.info(
             "reliability_metrics.initialized",
@@ -120,8 +122,6 @@ class ReliabilityMetricsCollector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_metrics.metric_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ReliabilityMetricsCollector:
         return record
 
     def get_metric(self, record_id: str) -> ReliabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
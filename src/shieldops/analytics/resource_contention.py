@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ResourceContentionDetector:
     ) -> None:
         self._max_records = max_records
         self._critical_threshold_pct = critical_threshold_pct
-        self._records: list[ContentionRecord] = []
+        self._records: RecordStore[ContentionRecord] = RecordStore(self._max_records)
         self._events: list[ContentionEvent] = []
         logger.info(
             "resource_contention.initialized",
@@ -116,8 +118,6 @@ class ResourceContentionDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "resource_contention.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class ResourceContentionDetector:
         return record
 
     def get_contention(self, record_id: str) -> ContentionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_contentions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class ResourceExhaustionForecaster:
     ) -> None:
         self._max_records = max_records
         self._default_critical_hours = default_critical_hours
-        self._records: list[ExhaustionRecord] = []
+        self._records: RecordStore[ExhaustionRecord] = RecordStore(self._max_records)
         self._thresholds: dict[str, ExhaustionThreshold] = {}
         logger.info(
             "resource_exhaustion.initialized",
@@ -127,8 +129,6 @@ class ResourceExhaustionForecaster:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "resource_exhaustion.recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class ResourceExhaustionForecaster:
         return record
 
     def get_record(self, record_id: str) -> ExhaustionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CodeReviewVelocityTracker:
     ) -> None:
         self._max_records = max_records
         self._max_cycle_hours = max_cycle_hours
-        self._records: list[ReviewCycleRecord] = []
+        self._records: RecordStore[ReviewCycleRecord] = RecordStore(self._max_records)
         self._loads: list[ReviewerLoad] = []
         logger.info(
             "review_velocity.initialized",
@@ -122,8 +124,6 @@ class CodeReviewVelocityTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "review_velocity.cycle_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class CodeReviewVelocityTracker:
         return record
 
     def get_review(self, record_id: str) -> ReviewCycleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reviews(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RiskPredictionEngine:
     ) -> None:
         self._max_records = max_records
         self._forecast_confidence_threshold = forecast_confidence_threshold
-        self._records: list[PredictionRecord] = []
+        self._records: RecordStore[PredictionRecord] = RecordStore(self._max_records)
         self._analyses: list[PredictionAnalysis] = []
         logger.info(
             "risk_prediction_engine.initialized",
@@ -124,8 +126,6 @@ class RiskPredictionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_prediction_engine.prediction_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RiskPredictionEngine:
         return record
 
     def get_prediction(self, record_id: str) -> PredictionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
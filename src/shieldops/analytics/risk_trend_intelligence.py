@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class RiskTrendIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RiskTrendRecord] = []
+        self._records: RecordStore[RiskTrendRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RiskTrendAnalysis] = {}
         logger.info(
             "risk_trend_intelligence.init",
@@ -117,8 +119,6 @@ class RiskTrendIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_trend_intelligence.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class RiskTrendIntelligence:
         return record
 
     def process(self, key: str) -> RiskTrendAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         trajectory = round(rec.risk_score - rec.previous_score, 2)
@@ -193,7 +189,7 @@ class RiskTrendIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("risk_trend_intelligence.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityAutomationROITracker:
     ) -> None:
         self._max_records = max_records
         self._roi_threshold = roi_threshold
-        self._records: list[ROIRecord] = []
+        self._records: RecordStore[ROIRecord] = RecordStore(self._max_records)
         self._analyses: list[ROIAnalysis] = []
         logger.info(
             "security_automation_roi_tracker.initialized",
@@ -124,8 +126,6 @@ class SecurityAutomationROITracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_automation_roi_tracker.roi_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityAutomationROITracker:
         return record
 
     def get_roi(self, record_id: str) -> ROIRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rois(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityKPITracker:
     ) -> None:
         self._max_records = max_records
         self._kpi_threshold = kpi_threshold
-        self._records: list[KPIRecord] = []
+        self._records: RecordStore[KPIRecord] = RecordStore(self._max_records)
         self._analyses: list[KPIAnalysis] = []
         logger.info(
             "security_kpi_tracker.initialized",
@@ -124,8 +126,6 @@ class SecurityKPITracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_kpi_tracker.kpi_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityKPITracker:
         return record
 
     def get_kpi(self, record_id: str) -> KPIRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_kpis(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class SelfPlayBenchmarkEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[BenchmarkRecord] = []
+        self._records: RecordStore[BenchmarkRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, BenchmarkAnalysis] = {}
         logger.info(
             "self_play_benchmark_engine.init",
@@ -118,8 +120,6 @@ class SelfPlayBenchmarkEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "self_play_benchmark.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class SelfPlayBenchmarkEngine:
         return record
 
     def process(self, key: str) -> BenchmarkAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         bench_recs = [r for r in self._records if r.benchmark_id == rec.benchmark_id]
@@ -220,7 +216,7 @@ class SelfPlayBenchmarkEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("self_play_benchmark_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ServiceLatencyAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_latency_threshold_ms = max_latency_threshold_ms
-        self._records: list[LatencyRecord] = []
+        self._records: RecordStore[LatencyRecord] = RecordStore(self._max_records)
         self._baselines: list[LatencyBaseline] = []
         logger.info(
             "service_latency.initialized",
@@ -124,8 +126,6 @@ class ServiceLatencyAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_latency.latency_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ServiceLatencyAnalyzer:
         return record
 
     def get_latency(self, record_id: str) -> LatencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_latencies(
         self,
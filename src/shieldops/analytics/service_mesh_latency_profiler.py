@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ServiceMeshLatencyProfiler:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MeshLatencyRecord] = []
+        self._records: RecordStore[MeshLatencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MeshLatencyAnalysis] = {}
         logger.info(
             "service_mesh_latency_profiler.init",
@@ -118,8 +120,6 @@ class ServiceMeshLatencyProfiler:
             proxy_overhead_ms=proxy_overhead_ms,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mesh_latency.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class ServiceMeshLatencyProfiler:
         return record
 
     def process(self, key: str) -> MeshLatencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         has_reg = rec.regression_severity in (
@@ -212,7 +208,7 @@ class ServiceMeshLatencyProfiler:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("service_mesh_latency_profiler.cleared")
         return {"status": "cleared"}
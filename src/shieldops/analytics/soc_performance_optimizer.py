@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SOCPerformanceOptimizer:
     ) -> None:
         self._max_records = max_records
         self._performance_threshold = performance_threshold
-        self._records: list[SOCPerformanceRecord] = []
+        self._records: RecordStore[SOCPerformanceRecord] = RecordStore(self._max_records)
         self._analyses: list[SOCPerformanceAnalysis] = []
         logger.info(
             "soc_performance_optimizer.initialized",
@@ -124,8 +126,6 @@ class SOCPerformanceOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "soc_performance_optimizer.performance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SOCPerformanceOptimizer:
         return record
 
     def get_performance(self, record_id: str) -> SOCPerformanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_performances(
         self,
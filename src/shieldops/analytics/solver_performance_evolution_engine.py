@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class SolverPerformanceEvolutionEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SolverPerformanceRecord] = []
+        self._records: RecordStore[SolverPerformanceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SolverPerformanceAnalysis] = {}
         logger.info(
             "solver_performance_evolution_engine.init",
@@ -119,8 +121,6 @@ class SolverPerformanceEvolutionEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "solver_performance_evolution.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class SolverPerformanceEvolutionEngine:
         return record
 
     def process(self, key: str) -> SolverPerformanceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         solver_recs = [r for r in self._records if r.solver_id == rec.solver_id]
@@ -202,7 +198,7 @@ class SolverPerformanceEvolutionEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("solver_performance_evolution_engine.cleared")
         return {"status": "cleared"}
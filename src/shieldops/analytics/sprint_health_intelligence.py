@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SprintHealthIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SprintHealthRecord] = []
+        self._records: RecordStore[SprintHealthRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SprintHealthAnalysis] = {}
         logger.info(
             "sprint_health_intelligence.init",
@@ -120,8 +122,6 @@ class SprintHealthIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sprint_health.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class SprintHealthIntelligence:
         return record
 
     def process(self, key: str) -> SprintHealthAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sprint_recs = [r for r in self._records if r.sprint_id == rec.sprint_id]
@@ -207,7 +203,7 @@ class SprintHealthIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("sprint_health_intelligence.cleared")
         return {"status": "cleared"}
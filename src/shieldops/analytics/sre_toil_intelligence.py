@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -116,7 +118,7 @@ class SreToilIntelligence:
         self._max_records = max_records
         self._toil_budget_pct = toil_budget_pct
         self._hourly_cost = engineer_hourly_cost
-        self._records: list[ToilRecord] = []
+        self._records: RecordStore[ToilRecord] = RecordStore(self._max_records)
         self._analyses: list[ToilAnalysis] = []
         logger.info(
             "sre_toil_intelligence.initialized",
@@ -157,8 +159,6 @@ class SreToilIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sre_toil_intelligence.record_added",
             record_id=record.id,
@@ -169,10 +169,7 @@ class SreToilIntelligence:
         return record
 
     def get_record(self, record_id: str) -> ToilRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
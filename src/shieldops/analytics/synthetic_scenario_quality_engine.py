@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class SyntheticScenarioQualityEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ScenarioQualityRecord] = []
+        self._records: RecordStore[ScenarioQualityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ScenarioQualityAnalysis] = {}
         logger.info(
             "synthetic_scenario_quality_engine.init",
@@ -118,8 +120,6 @@ class SyntheticScenarioQualityEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "synthetic_scenario_quality.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class SyntheticScenarioQualityEngine:
         return record
 
     def process(self, key: str) -> ScenarioQualityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         scen_recs = [r for r in self._records if r.scenario_id == rec.scenario_id]
@@ -212,7 +208,7 @@ class SyntheticScenarioQualityEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("synthetic_scenario_quality_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class TeamCapabilityGapAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CapabilityGapRecord] = []
+        self._records: RecordStore[CapabilityGapRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CapabilityGapAnalysis] = {}
         logger.info(
             "team_capability_gap_analyzer.init",
@@ -120,8 +122,6 @@ class TeamCapabilityGapAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capability_gap.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class TeamCapabilityGapAnalyzer:
         return record
 
     def process(self, key: str) -> CapabilityGapAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         gap_recs = [r for r in self._records if r.gap_id == rec.gap_id]
@@ -216,7 +212,7 @@ class TeamCapabilityGapAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("team_capability_gap_analyzer.cleared")
         return {"status": "cleared"}
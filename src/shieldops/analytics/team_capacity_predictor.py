@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class TeamCapacityPredictor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CapacityRecord] = []
+        self._records: RecordStore[CapacityRecord] = RecordStore(self._max_records)
         self._analyses: list[CapacityAnalysis] = []
         logger.info(
             "team_capacity_predictor.initialized",
@@ -121,8 +123,6 @@ class TeamCapacityPredictor:
             headcount=headcount,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "team_capacity_predictor.capacity_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class TeamCapacityPredictor:
         return record
 
     def get_capacity(self, record_id: str) -> CapacityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_capacities(
         self,
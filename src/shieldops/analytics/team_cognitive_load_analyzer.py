@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class TeamCognitiveLoadAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CognitiveLoadRecord] = []
+        self._records: RecordStore[CognitiveLoadRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CognitiveLoadAnalysis] = {}
         logger.info(
             "team_cognitive_load_analyzer.init",
@@ -117,8 +119,6 @@ class TeamCognitiveLoadAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cognitive_load.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class TeamCognitiveLoadAnalyzer:
         return record
 
     def process(self, key: str) -> CognitiveLoadAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         team_recs = [r for r in self._records if r.team_id == rec.team_id]
@@ -205,7 +201,7 @@ class TeamCognitiveLoadAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("team_cognitive_load_analyzer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class TeamVelocityTracker:
     ) -> None:
         self._max_records = max_records
         self._min_velocity_score = min_velocity_score
-        self._records: list[VelocityRecord] = []
+        self._records: RecordStore[VelocityRecord] = RecordStore(self._max_records)
         self._data_points: list[VelocityDataPoint] = []
         logger.info(
             "team_velocity_tracker.initialized",
@@ -116,8 +118,6 @@ class TeamVelocityTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "team_velocity_tracker.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class TeamVelocityTracker:
         return record
 
     def get_velocity(self, record_id: str) -> VelocityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_velocities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TechnicalDebtPredictor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[DebtRecord] = []
+        self._records: RecordStore[DebtRecord] = RecordStore(self._max_records)
         self._analyses: list[DebtAnalysis] = []
         logger.info(
             "technical_debt_predictor.initialized",
@@ -124,8 +126,6 @@ class TechnicalDebtPredictor:
             estimated_hours=estimated_hours,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "technical_debt_predictor.debt_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TechnicalDebtPredictor:
         return record
 
     def get_debt(self, record_id: str) -> DebtRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_debts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ThreatLandscapeForecaster:
     def __init__(self, max_records: int = 200000, quality_threshold: float = 50.0) -> None:
         self._max_records = max_records
         self._quality_threshold = quality_threshold
-        self._records: list[ForecastRecord] = []
+        self._records: RecordStore[ForecastRecord] = RecordStore(self._max_records)
         self._analyses: list[ForecastAnalysis] = []
         logger.info(
             "threat_landscape_forecaster.initialized",
@@ -118,8 +120,6 @@ class ThreatLandscapeForecaster:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_landscape_forecaster.recorded",
             record_id=record.id,
@@ -129,10 +129,7 @@ class ThreatLandscapeForecaster:
         return record
 
     def get_record(self, record_id: str) -> ForecastRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
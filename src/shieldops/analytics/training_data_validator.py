@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class TrainingDataValidator:
     ) -> None:
         self._max_records = max_records
         self._quality_threshold = quality_threshold
-        self._records: list[ValidationRecord] = []
+        self._records: RecordStore[ValidationRecord] = RecordStore(self._max_records)
         self._analyses: list[ValidationAnalysis] = []
         logger.info(
             "training_data_validator.initialized",
@@ -127,8 +129,6 @@ class TrainingDataValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "training_data_validator.validation_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class TrainingDataValidator:
         return record
 
     def get_validation(self, record_id: str) -> ValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CapacityUtilizationScorer:
     ) -> None:
         self._max_records = max_records
         self._optimal_utilization_pct = optimal_utilization_pct
-        self._records: list[UtilizationRecord] = []
+        self._records: RecordStore[UtilizationRecord] = RecordStore(self._max_records)
         self._metrics: list[UtilizationMetric] = []
         logger.info(
             "utilization_scorer.initialized",
@@ -118,8 +120,6 @@ class CapacityUtilizationScorer:
             environment=environment,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "utilization_scorer.utilization_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class CapacityUtilizationScorer:
         return record
 
     def get_utilization(self, record_id: str) -> UtilizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_utilizations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class WorkflowEfficiencyAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_efficiency_score = min_efficiency_score
-        self._records: list[WorkflowRecord] = []
+        self._records: RecordStore[WorkflowRecord] = RecordStore(self._max_records)
         self._steps: list[WorkflowStep] = []
         logger.info(
             "workflow_analyzer.initialized",
@@ -120,8 +122,6 @@ class WorkflowEfficiencyAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "workflow_analyzer.workflow_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class WorkflowEfficiencyAnalyzer:
         return record
 
     def get_workflow(self, record_id: str) -> WorkflowRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_workflows(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Callable, Coroutine
 from datetime import UTC, datetime
 from typing import Any
@@ -12,7 +13,9 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from shieldops.api.auth.api_keys import hash_api_key, validate_key_format
 from shieldops.api.auth.models import UserResponse, UserRole
-from shieldops.api.auth.service import decode_token
+from shieldops.api.auth.service import decode_request_token
+from shieldops.api.auth.token_cache import get_token_cache, token_cache_key
+from shieldops.config import settings
 
 logger = structlog.get_logger()
 
@@ -25,11 +28,20 @@ async def _authenticate_via_api_key(
 ) -> UserResponse | None:
     """Attempt to authenticate using an API key.
 
-    Returns a UserResponse if the key is valid, None otherwise.
+    Returns a UserResponse if the key is valid, None otherwise.  Valid
+    keys are cached for ``auth_api_key_cache_ttl_seconds`` (or until the
+    key expires, if sooner); revoking the key or deactivating its owner
+    drops the entry in every worker (see ``invalidate_everywhere``).
     """
     if not validate_key_format(token):
         return None
 
+    cache = get_token_cache()
+    cache_key = token_cache_key(token, "api_key")
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return UserResponse(**cached)
+
     key_hash = hash_api_key(token)
     key_record = await repository.get_api_key_by_hash(key_hash)
 
@@ -64,13 +76,24 @@ async def _authenticate_via_api_key(
             key_id=key_record["id"],
         )
 
-    return UserResponse(
+    user_response = UserResponse(
         id=user["id"],
         email=user["email"],
         name=user["name"],
         role=UserRole(user["role"]),
         is_active=user["is_active"],
     )
+    cache_until = time.time() + settings.auth_api_key_cache_ttl_seconds
+    if expires_at is not None:
+        cache_until = min(cache_until, expires_at.timestamp())
+    cache.put(
+        cache_key,
+        user_response.model_dump(),
+        cache_until,
+        subject=user["id"],
+        key_id=key_record["id"],
+    )
+    return user_response
 
 
 async def get_current_user(
@@ -106,7 +129,7 @@ async def get_current_user(
         )
 
     # ── Standard JWT authentication ──────────────────────────
-    payload = decode_token(raw_token)
+    payload = decode_request_token(request.scope, raw_token)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -17,6 +17,7 @@ from shieldops.api.auth.service import (
     hash_password,
     verify_password,
 )
+from shieldops.api.auth.token_cache import get_token_cache
 from shieldops.config import settings
 
 logger = structlog.get_logger()
@@ -130,6 +131,7 @@ async def revoke_token(
     jti = payload.get("jti", "")
     if not jti:
         return
+    get_token_cache().revoke_jti(jti, payload.get("exp", 0))
     try:
         import redis.asyncio as aioredis
 
@@ -5,9 +5,11 @@ import hashlib
 import hmac
 import json
 import secrets
+from collections.abc import MutableMapping
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from shieldops.api.auth.token_cache import get_token_cache, token_cache_key
 from shieldops.config import settings
 
 
@@ -65,7 +67,46 @@ def create_access_token(
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
-    """Decode and verify a JWT token. Returns payload dict or None."""
+    """Decode and verify a JWT token. Returns payload dict or None.
+
+    Verified payloads are cached process-wide (see ``token_cache``); a
+    cache hit skips the HMAC check and JSON parse but still honours the
+    token's expiry and any in-process revocation of its ``jti``.
+    """
+    cache = get_token_cache()
+    key = token_cache_key(token, settings.jwt_secret_key)
+    cached = cache.get(key)
+    if cached is not None:
+        if cache.is_revoked(cached.get("jti", "")):
+            return None
+        return dict(cached)
+
+    payload = _verify_token(token)
+    if payload is None or cache.is_revoked(payload.get("jti", "")):
+        return None
+    exp = payload.get("exp")
+    if exp:
+        cache.put(key, payload, float(exp), jti=payload.get("jti"), subject=payload.get("sub"))
+    return dict(payload)
+
+
+def decode_request_token(scope: MutableMapping[str, Any], token: str) -> dict[str, Any] | None:
+    """``decode_token`` memoised on the request scope for its lifetime.
+
+    Middleware and auth dependencies on the same request share the one
+    verified payload instead of each looking the token up again.
+    """
+    state = scope.setdefault("state", {})
+    memo = state.get("verified_token")
+    if memo is not None and memo[0] == token:
+        return memo[1]
+    payload = decode_token(token)
+    state["verified_token"] = (token, payload)
+    return payload
+
+
+def _verify_token(token: str) -> dict[str, Any] | None:
+    """HMAC-verify and parse a JWT, without consulting the cache."""
     try:
         parts = token.split(".")
         if len(parts) != 3:
@@ -0,0 +1,226 @@
+"""Process-level cache of verified bearer credentials.
+
+``decode_token`` HMAC-verifies and JSON-parses a JWT on every call, and
+API-key authentication costs a database round trip, yet the same token is
+presented on request after request.  ``VerifiedTokenCache`` remembers
+what a credential verified to, keyed by a SHA-256 hash of the token (raw
+tokens are never stored), bounded by LRU eviction and by the credential's
+own expiry.
+
+Revocation hooks keep the cache from outliving a credential:
+``revoke_jti`` drops a JWT and refuses it until it would have expired,
+``invalidate`` drops entries for a subject or API key.  Both only affect
+this process.  ``invalidate_everywhere`` also broadcasts the subject/key
+on the cache-invalidation channel (see ``shieldops.cache.invalidation``)
+so other workers drop their entries too; a worker that cannot hear the
+channel still falls back to the entry's expiry, which for API keys is
+capped at ``auth_api_key_cache_ttl_seconds``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import structlog
+
+from shieldops.cache.invalidation import InvalidationMessage, InvalidationOp
+from shieldops.config import settings
+
+if TYPE_CHECKING:
+    from shieldops.cache.invalidation import CacheInvalidationBus
+
+logger = structlog.get_logger()
+
+# Invalidation-channel namespace; keys are "subject:<id>" or "key:<id>".
+INVALIDATION_NAMESPACE = "auth_tokens"
+
+
+def token_cache_key(token: str, namespace: str = "") -> bytes:
+    """Hash a raw bearer token into its cache key.
+
+    *namespace* separates credential kinds; JWTs use the signing secret so
+    that rotating it invalidates every cached payload.
+    """
+    return hashlib.sha256(f"{namespace}\0{token}".encode()).digest()
+
+
+class _Entry:
+    __slots__ = ("expires_at", "jti", "key_id", "payload", "subject")
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        expires_at: float,
+        jti: str | None,
+        subject: str | None,
+        key_id: str | None,
+    ) -> None:
+        self.payload = payload
+        self.expires_at = expires_at
+        self.jti = jti
+        self.subject = subject
+        self.key_id = key_id
+
+
+class VerifiedTokenCache:
+    """Thread-safe LRU of verified token payloads with expiry and revocation."""
+
+    _instance: ClassVar[VerifiedTokenCache | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self._mu = threading.Lock()
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._revoked: dict[str, float] = {}  # jti -> wall-clock expiry
+        self._bus: CacheInvalidationBus | None = None
+
+    # ── Singleton access ────────────────────────────────────────
+
+    @classmethod
+    def get_instance(cls) -> VerifiedTokenCache:
+        """Return the global singleton, creating it on first call."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(settings.auth_token_cache_size)
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Destroy the singleton (useful in tests)."""
+        with cls._lock:
+            cls._instance = None
+
+    # ── Lookup ──────────────────────────────────────────────────
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        """Return the cached payload for *key*, or None if absent or expired."""
+        with self._mu:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.payload
+
+    def put(
+        self,
+        key: bytes,
+        payload: dict[str, Any],
+        expires_at: float,
+        *,
+        jti: str | None = None,
+        subject: str | None = None,
+        key_id: str | None = None,
+    ) -> None:
+        """Cache *payload* until *expires_at* (epoch seconds)."""
+        if self._maxsize <= 0:
+            return
+        with self._mu:
+            self._entries[key] = _Entry(payload, expires_at, jti, subject, key_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def is_revoked(self, jti: str) -> bool:
+        """Whether *jti* was revoked in this process and has not yet expired."""
+        if not self._revoked:
+            return False
+        with self._mu:
+            until = self._revoked.get(jti)
+            if until is None:
+                return False
+            if until <= time.time():
+                del self._revoked[jti]
+                return False
+            return True
+
+    # ── Revocation hooks ────────────────────────────────────────
+
+    def revoke_jti(self, jti: str, expires_at: float) -> None:
+        """Drop the JWT with *jti* and refuse it until *expires_at*."""
+        with self._mu:
+            self._revoked[jti] = expires_at
+            self._drop(lambda entry: entry.jti == jti)
+
+    def invalidate(self, *, subject: str | None = None, key_id: str | None = None) -> int:
+        """Drop every entry for *subject* and/or API key *key_id*."""
+        with self._mu:
+            return self._drop(
+                lambda entry: (
+                    (subject is not None and entry.subject == subject)
+                    or (key_id is not None and entry.key_id == key_id)
+                )
+            )
+
+    async def invalidate_everywhere(
+        self, *, subject: str | None = None, key_id: str | None = None
+    ) -> int:
+        """``invalidate`` here, then broadcast it to the other workers."""
+        removed = self.invalidate(subject=subject, key_id=key_id)
+        keys = [f"subject:{subject}"] if subject is not None else []
+        keys += [f"key:{key_id}"] if key_id is not None else []
+        if self._bus is not None and keys:
+            await self._bus.publish(
+                InvalidationOp.KEYS, namespace=INVALIDATION_NAMESPACE, keys=keys
+            )
+        return removed
+
+    # ── Cross-process invalidation ──────────────────────────────
+
+    async def start_invalidation_listener(self, bus: CacheInvalidationBus) -> None:
+        """Publish invalidations on *bus* and apply those from other workers."""
+        self._bus = bus
+        await bus.start(self.apply_invalidation, on_resubscribe=self._resync)
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._bus is not None:
+            await self._bus.stop()
+            self._bus = None
+
+    def apply_invalidation(self, message: InvalidationMessage) -> int:
+        """Drop the subjects/keys named in a broadcast from another worker."""
+        if message.namespace != INVALIDATION_NAMESPACE or message.op != InvalidationOp.KEYS:
+            return 0
+        removed = 0
+        for key in message.keys:
+            kind, _, value = key.partition(":")
+            if kind == "subject":
+                removed += self.invalidate(subject=value)
+            elif kind == "key":
+                removed += self.invalidate(key_id=value)
+        return removed
+
+    def _resync(self) -> None:
+        """Drop cached credentials after (re)subscribing: broadcasts may have been missed."""
+        with self._mu:
+            removed = self._drop(lambda entry: True)
+        if removed:
+            logger.info("token_cache_invalidation_resync", removed=removed)
+
+    def clear(self) -> None:
+        """Drop every cached entry and revoked JTI."""
+        with self._mu:
+            self._entries.clear()
+            self._revoked.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, predicate: Any) -> int:
+        stale = [key for key, entry in self._entries.items() if predicate(entry)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Convenience accessor for the global verified-token cache."""
+    return VerifiedTokenCache.get_instance()
@@ -14,6 +14,7 @@ import structlog
 from pydantic import BaseModel, Field
 
 from shieldops.api.auth.service import create_access_token, decode_token
+from shieldops.api.auth.token_cache import get_token_cache
 
 logger = structlog.get_logger()
 
@@ -152,6 +153,7 @@ class TokenManager:
         if not jti:
             return False
         await self._blacklist.add(jti, ttl=self._access_ttl)
+        get_token_cache().revoke_jti(jti, payload.get("exp", 0))
         logger.info("token_revoked", jti=jti)
         return True
 
@@ -0,0 +1,345 @@
+"""Lazy engine/route registry.
+
+Most analytics, security, compliance and operations engines follow the
+same wiring recipe: import the engine class, build it from a handful of
+settings, hand the singleton to a route module via ``set_engine()`` (or
+a similarly named setter), and include that module's router.  Doing
+this eagerly for hundreds of engines makes every worker pay the full
+import time and memory cost at startup, even for endpoints it never
+serves.
+
+This module describes each engine declaratively with an
+:class:`EngineSpec` and defers importing the engine module and building
+its singleton until the first request reaches the engine's router.
+Route modules themselves are still imported at startup so the routes
+show up in the OpenAPI schema; only the engine side is deferred.
+
+Each app owns its registry (``create_engine_registry()`` in
+``create_app``), so engine state never leaks between app instances.
+Engines are built in a worker thread so a first request never blocks the
+event loop; concurrent first requests to one router wait on the same
+build.
+
+Import time, construction time and resident-memory growth are recorded
+per engine and exposed through :meth:`LazyEngineRegistry.profile` (see
+the ``/startup-profile`` endpoint and the ``shieldops startup-profile``
+CLI command).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import resource
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+import structlog
+from fastapi import Depends, FastAPI
+
+logger = structlog.get_logger()
+
+
+class EngineState(StrEnum):
+    """Lifecycle state of a registered engine."""
+
+    DISABLED = "disabled"
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """Declarative description of a lazily-built engine and its routes.
+
+    Attributes:
+        name: Unique engine name (also used for the ``<name>_initialized``
+            and ``<name>_init_failed`` log events).
+        route_module: Module name under ``shieldops.api.routes``.
+        engine: Engine class path in ``"package.module:ClassName"`` form.
+        setter: Route-module function that receives the engine singleton.
+        tags: OpenAPI tags for the included router.
+        router_attr: Attribute of the route module holding the router.
+        settings_kwargs: Constructor kwargs mapped to ``settings`` fields.
+        const_kwargs: Constructor kwargs with literal values.
+        enabled_flag: ``settings`` field that must be truthy for the
+            engine to be registered, or ``None`` to always register.
+    """
+
+    name: str
+    route_module: str
+    engine: str
+    setter: str = "set_engine"
+    tags: tuple[str, ...] = ()
+    router_attr: str = "router"
+    settings_kwargs: dict[str, str] = field(default_factory=dict)
+    const_kwargs: dict[str, Any] = field(default_factory=dict)
+    enabled_flag: str | None = None
+
+
+@dataclass
+class EngineProfile:
+    """Startup cost measurements for a single engine."""
+
+    name: str
+    state: EngineState = EngineState.PENDING
+    import_ms: float = 0.0
+    init_ms: float = 0.0
+    rss_delta_bytes: int = 0
+    error: str | None = None
+    materialized_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "state": self.state.value,
+            "import_ms": round(self.import_ms, 3),
+            "init_ms": round(self.init_ms, 3),
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "error": self.error,
+            "materialized_at": self.materialized_at,
+        }
+
+
+def current_rss_bytes() -> int:
+    """Return the current resident set size of this process in bytes.
+
+    Reads ``/proc/self/statm`` where available (Linux) and falls back to
+    the peak RSS reported by ``getrusage`` elsewhere.
+    """
+    try:
+        with open("/proc/self/statm") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and kilobytes on Linux/BSD.
+        return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class LazyEngineRegistry:
+    """Registers routers eagerly and builds their engines on first use."""
+
+    def __init__(self, specs: Iterable[EngineSpec] = ()) -> None:
+        self._specs: dict[str, EngineSpec] = {}
+        self._profiles: dict[str, EngineProfile] = {}
+        self._by_route: dict[str, list[str]] = {}
+        self._lock = threading.RLock()
+        self._settings: Any = None
+        self._mounted = 0  # specs handled by mount() so far, in order
+        self._building: dict[str, asyncio.Future[None]] = {}
+        for spec in specs:
+            self.add(spec)
+
+    # ── Registration ────────────────────────────────────────────
+
+    def add(self, spec: EngineSpec) -> None:
+        """Add a spec to the registry.
+
+        Raises:
+            ValueError: If an engine with the same name is already registered.
+        """
+        if spec.name in self._specs:
+            raise ValueError(f"Engine '{spec.name}' is already registered")
+        self._specs[spec.name] = spec
+        self._profiles[spec.name] = EngineProfile(name=spec.name)
+        self._by_route.setdefault(spec.route_module, []).append(spec.name)
+
+    @property
+    def specs(self) -> list[EngineSpec]:
+        return list(self._specs.values())
+
+    def is_enabled(self, spec: EngineSpec, settings: Any) -> bool:
+        if spec.enabled_flag is None:
+            return True
+        return bool(getattr(settings, spec.enabled_flag, False))
+
+    def mount(self, app: FastAPI, settings: Any, *, through: str | None = None) -> int:
+        """Include the router of every enabled spec without building engines.
+
+        Specs are mounted in declaration order, continuing from where the
+        previous call stopped.  With ``through``, mounting stops after
+        that spec, so eager ``include_router`` calls can be interleaved
+        and route matching order stays what the declaration order says.
+
+        Each included router gets a dependency that materializes the
+        engines bound to its route module on the first request.  Specs
+        sharing a route module are materialized together, in declaration
+        order, so the last setter call wins exactly as with eager wiring.
+
+        Returns:
+            Number of routers included.
+
+        Raises:
+            ValueError: If ``through`` is not a registered spec.
+        """
+        self._settings = settings
+        specs = list(self._specs.values())
+        end = len(specs)
+        if through is not None:
+            if through not in self._specs:
+                raise ValueError(f"Engine '{through}' is not registered")
+            end = max(self._mounted, list(self._specs).index(through) + 1)
+        mounted = 0
+        for spec in specs[self._mounted : end]:
+            profile = self._profiles[spec.name]
+            if not self.is_enabled(spec, settings):
+                profile.state = EngineState.DISABLED
+                continue
+            try:
+                route_mod = importlib.import_module(f"shieldops.api.routes.{spec.route_module}")
+                app.include_router(
+                    getattr(route_mod, spec.router_attr),
+                    prefix=settings.api_prefix,
+                    tags=list(spec.tags),
+                    dependencies=[Depends(self._route_dependency(spec.route_module))],
+                )
+                mounted += 1
+            except Exception as e:
+                profile.state = EngineState.FAILED
+                profile.error = str(e)
+                logger.warning(f"{spec.name}_init_failed", error=str(e))
+        self._mounted = end
+        logger.info("lazy_engine_routes_mounted", routers=mounted, through=through)
+        return mounted
+
+    def _route_dependency(self, route_module: str) -> Any:
+        async def _ensure_engines() -> None:
+            await self.aensure_route(route_module)
+
+        return _ensure_engines
+
+    # ── Materialization ─────────────────────────────────────────
+
+    def _has_pending(self, route_module: str) -> bool:
+        return any(
+            self._profiles[name].state is EngineState.PENDING
+            for name in self._by_route.get(route_module, ())
+        )
+
+    def ensure_route(self, route_module: str) -> None:
+        """Materialize all pending engines bound to ``route_module``."""
+        for name in self._by_route.get(route_module, ()):
+            if self._profiles[name].state is EngineState.PENDING:
+                self.materialize(name)
+
+    async def aensure_route(self, route_module: str) -> None:
+        """Async :meth:`ensure_route`: builds off the event loop, once per route.
+
+        Concurrent callers share one build; a cancelled caller does not
+        cancel it for the others.
+        """
+        if not self._has_pending(route_module):
+            return
+        future = self._building.get(route_module)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(self.ensure_route, route_module))
+            self._building[route_module] = future
+            future.add_done_callback(lambda _: self._building.pop(route_module, None))
+        await asyncio.shield(future)
+
+    def materialize(self, name: str, settings: Any = None) -> Any:
+        """Import, build and inject the engine registered as ``name``.
+
+        Failures are recorded on the engine's profile and logged once;
+        the route module keeps returning its own 503 in that case.
+
+        Returns:
+            The engine instance, or ``None`` if it could not be built.
+        """
+        settings = settings if settings is not None else self._settings
+        if settings is None:
+            from shieldops.config import settings as _settings
+
+            settings = _settings
+
+        spec = self._specs[name]
+        profile = self._profiles[name]
+        with self._lock:
+            if profile.state not in (EngineState.PENDING, EngineState.DISABLED):
+                return None
+            rss_before = current_rss_bytes()
+            try:
+                start = time.perf_counter()
+                module_path, _, class_name = spec.engine.partition(":")
+                engine_cls = getattr(importlib.import_module(module_path), class_name)
+                route_mod = importlib.import_module(f"shieldops.api.routes.{spec.route_module}")
+                imported = time.perf_counter()
+
+                kwargs: dict[str, Any] = dict(spec.const_kwargs)
+                for kwarg, attr in spec.settings_kwargs.items():
+                    kwargs[kwarg] = getattr(settings, attr)
+                engine = engine_cls(**kwargs)
+                getattr(route_mod, spec.setter)(engine)
+                built = time.perf_counter()
+            except Exception as e:
+                profile.state = EngineState.FAILED
+                profile.error = str(e)
+                logger.warning(f"{spec.name}_init_failed", error=str(e))
+                return None
+
+            profile.import_ms = (imported - start) * 1000
+            profile.init_ms = (built - imported) * 1000
+            profile.rss_delta_bytes = max(0, current_rss_bytes() - rss_before)
+            profile.materialized_at = time.time()
+            profile.state = EngineState.READY
+            logger.info(
+                f"{spec.name}_initialized",
+                lazy=True,
+                import_ms=round(profile.import_ms, 3),
+                init_ms=round(profile.init_ms, 3),
+            )
+            return engine
+
+    def materialize_all(self, settings: Any = None, include_disabled: bool = False) -> int:
+        """Eagerly build every pending engine (used for profiling/warm-up).
+
+        Returns:
+            Number of engines successfully built.
+        """
+        settings = settings if settings is not None else self._settings
+        if settings is None:
+            from shieldops.config import settings as _settings
+
+            settings = _settings
+
+        built = 0
+        for name, spec in self._specs.items():
+            if not include_disabled and not self.is_enabled(spec, settings):
+                continue
+            if self.materialize(name, settings) is not None:
+                built += 1
+        return built
+
+    # ── Reporting ───────────────────────────────────────────────
+
+    def profile(self) -> dict[str, Any]:
+        """Return per-engine startup costs plus aggregate totals."""
+        engines = [p.to_dict() for p in self._profiles.values()]
+        by_state: dict[str, int] = {}
+        for p in self._profiles.values():
+            by_state[p.state.value] = by_state.get(p.state.value, 0) + 1
+        ready = [p for p in self._profiles.values() if p.state is EngineState.READY]
+        return {
+            "total_engines": len(self._profiles),
+            "by_state": by_state,
+            "total_import_ms": round(sum(p.import_ms for p in ready), 3),
+            "total_init_ms": round(sum(p.init_ms for p in ready), 3),
+            "total_rss_delta_bytes": sum(p.rss_delta_bytes for p in ready),
+            "process_rss_bytes": current_rss_bytes(),
+            "engines": engines,
+        }
+
+
+def create_engine_registry() -> LazyEngineRegistry:
+    """Return a new registry populated from ``ENGINE_SPECS``."""
+    from shieldops.api.engine_specs import ENGINE_SPECS
+
+    return LazyEngineRegistry(ENGINE_SPECS)
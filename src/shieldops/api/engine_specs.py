@@ -0,0 +1,6417 @@
+"""Declarative wiring table for lazily-built engines.
+
+Each entry replaces an eager ``try: import / build / set_engine /
+include_router`` block that used to live in ``api/app.py::lifespan``.
+Routers are included at startup; engines are imported and constructed
+on the first request to their router (see
+:mod:`shieldops.api.engine_registry`).
+
+Entries are kept in the original wiring order so that route matching
+and "last setter wins" semantics are unchanged.
+"""
+
+from __future__ import annotations
+
+from shieldops.api.engine_registry import EngineSpec
+
+ENGINE_SPECS: tuple[EngineSpec, ...] = (
+    EngineSpec(
+        name="stripe_billing",
+        route_module="billing",
+        engine="shieldops.integrations.billing.stripe_billing:StripeClient",
+        setter="set_stripe_client",
+        tags=("Billing",),
+        settings_kwargs={
+            "api_key": "stripe_api_key",
+            "webhook_secret": "stripe_webhook_secret",
+        },
+        enabled_flag="stripe_api_key",
+    ),
+    EngineSpec(
+        name="cost_autopilot",
+        route_module="autopilot",
+        engine="shieldops.agents.cost.autopilot:CostAutopilot",
+        setter="set_autopilot",
+        tags=("Cost Autopilot",),
+    ),
+    EngineSpec(
+        name="sla_engine",
+        route_module="sla",
+        engine="shieldops.sla.engine:SLAEngine",
+        tags=("SLA",),
+    ),
+    EngineSpec(
+        name="anomaly_detection",
+        route_module="anomaly",
+        engine="shieldops.analytics.anomaly:AnomalyDetector",
+        setter="set_detector",
+        tags=("Anomaly Detection",),
+    ),
+    EngineSpec(
+        name="service_topology",
+        route_module="topology",
+        engine="shieldops.topology.graph:ServiceGraphBuilder",
+        setter="set_builder",
+        tags=("Topology",),
+    ),
+    EngineSpec(
+        name="change_tracking",
+        route_module="changes",
+        engine="shieldops.changes.tracker:ChangeTracker",
+        setter="set_tracker",
+        tags=("Changes",),
+    ),
+    EngineSpec(
+        name="custom_agent_builder",
+        route_module="custom_agents",
+        engine="shieldops.agents.custom.builder:CustomAgentBuilder",
+        setter="set_builder",
+        tags=("Custom Agents",),
+    ),
+    EngineSpec(
+        name="sbom_generator",
+        route_module="sbom",
+        engine="shieldops.integrations.scanners.sbom_generator:SBOMGenerator",
+        setter="set_generator",
+        tags=("SBOM",),
+        settings_kwargs={
+            "syft_path": "syft_path",
+        },
+        enabled_flag="sbom_enabled",
+    ),
+    EngineSpec(
+        name="prediction_agent",
+        route_module="predictions",
+        engine="shieldops.agents.prediction.runner:PredictionRunner",
+        setter="set_runner",
+        tags=("Predictions",),
+    ),
+    EngineSpec(
+        name="rag_knowledge_store",
+        route_module="knowledge",
+        engine="shieldops.agents.knowledge.rag_store:RAGStore",
+        setter="set_store",
+        tags=("Knowledge",),
+    ),
+    EngineSpec(
+        name="capacity_planner",
+        route_module="capacity",
+        engine="shieldops.analytics.capacity_planner:CapacityPlanner",
+        setter="set_planner",
+        tags=("Capacity Planning",),
+    ),
+    EngineSpec(
+        name="outbound_webhooks",
+        route_module="webhook_subscriptions",
+        engine="shieldops.integrations.outbound.webhook_dispatcher:OutboundWebhookDispatcher",
+        setter="set_dispatcher",
+        tags=("Outbound Webhooks",),
+    ),
+    EngineSpec(
+        name="gdpr_processor",
+        route_module="gdpr",
+        engine="shieldops.compliance.gdpr:GDPRProcessor",
+        setter="set_processor",
+        tags=("GDPR",),
+    ),
+    EngineSpec(
+        name="request_correlator",
+        route_module="correlation",
+        engine="shieldops.observability.request_correlation:RequestCorrelator",
+        setter="set_correlator",
+        tags=("Correlation",),
+        settings_kwargs={
+            "max_traces": "correlation_max_traces",
+            "trace_ttl_minutes": "correlation_trace_ttl_minutes",
+        },
+    ),
+    EngineSpec(
+        name="agent_quota_manager",
+        route_module="agent_quotas",
+        engine="shieldops.agents.resource_quotas:ResourceQuotaManager",
+        setter="set_manager",
+        tags=("Agent Quotas",),
+        settings_kwargs={
+            "global_max_concurrent": "agent_global_max_concurrent",
+            "enabled": "agent_quota_enabled",
+        },
+    ),
+    EngineSpec(
+        name="batch_engine",
+        route_module="batch_operations",
+        engine="shieldops.api.batch_engine:BatchEngine",
+        tags=("Batch Operations",),
+        settings_kwargs={
+            "max_batch_size": "batch_max_size",
+            "max_parallel": "batch_max_parallel",
+            "job_ttl_hours": "batch_job_ttl_hours",
+        },
+    ),
+    EngineSpec(
+        name="timeline_builder",
+        route_module="timeline",
+        engine="shieldops.agents.investigation.timeline:TimelineBuilder",
+        setter="set_builder",
+        tags=("Incident Timeline",),
+        settings_kwargs={
+            "max_events_per_incident": "timeline_max_events_per_incident",
+            "retention_days": "timeline_retention_days",
+        },
+    ),
+    EngineSpec(
+        name="export_engine",
+        route_module="export_engine",
+        engine="shieldops.utils.export_engine:ExportEngine",
+        tags=("Exports",),
+        settings_kwargs={
+            "max_rows": "export_max_rows",
+            "pdf_enabled": "export_pdf_enabled",
+            "xlsx_enabled": "export_xlsx_enabled",
+        },
+    ),
+    EngineSpec(
+        name="promotion_manager",
+        route_module="environment_promotion",
+        engine="shieldops.config.environment_promotion:PromotionManager",
+        setter="set_manager",
+        tags=("Environment Promotion",),
+        settings_kwargs={
+            "require_approval_for_prod": "promotion_require_approval_for_prod",
+            "allowed_source_envs": "promotion_allowed_source_envs",
+        },
+    ),
+    EngineSpec(
+        name="agent_collaboration",
+        route_module="agent_collaboration",
+        engine="shieldops.agents.collaboration:AgentCollaborationProtocol",
+        setter="set_protocol",
+        tags=("Agent Collaboration",),
+        settings_kwargs={
+            "max_messages": "agent_collaboration_max_messages",
+            "session_timeout_minutes": "agent_collaboration_session_timeout_minutes",
+        },
+    ),
+    EngineSpec(
+        name="postmortem_generator",
+        route_module="postmortem",
+        engine="shieldops.agents.investigation.postmortem:PostMortemGenerator",
+        setter="set_generator",
+        tags=("Post-Mortems",),
+        settings_kwargs={
+            "max_reports": "postmortem_max_reports",
+        },
+    ),
+    EngineSpec(
+        name="alert_suppression",
+        route_module="alert_suppression",
+        engine="shieldops.observability.alert_suppression:AlertSuppressionEngine",
+        tags=("Alert Suppression",),
+        settings_kwargs={
+            "max_rules": "alert_suppression_max_rules",
+            "max_window_duration_hours": "maintenance_window_max_duration_hours",
+        },
+    ),
+    EngineSpec(
+        name="runbook_execution_tracker",
+        route_module="runbook_executions",
+        engine="shieldops.playbooks.execution_tracker:RunbookExecutionTracker",
+        setter="set_tracker",
+        tags=("Runbook Executions",),
+        settings_kwargs={
+            "max_executions": "runbook_max_executions",
+            "execution_ttl_days": "runbook_execution_ttl_days",
+        },
+    ),
+    EngineSpec(
+        name="incident_impact_scorer",
+        route_module="incident_impact",
+        engine="shieldops.agents.investigation.impact_scorer:IncidentImpactScorer",
+        setter="set_scorer",
+        tags=("Incident Impact",),
+        settings_kwargs={
+            "max_records": "impact_max_records",
+        },
+    ),
+    EngineSpec(
+        name="config_drift_detector",
+        route_module="drift_detection",
+        engine="shieldops.observability.drift_detector:ConfigDriftDetector",
+        setter="set_detector",
+        tags=("Config Drift Detection",),
+        settings_kwargs={
+            "max_snapshots_per_env": "drift_max_snapshots_per_env",
+            "retention_days": "drift_retention_days",
+        },
+    ),
+    EngineSpec(
+        name="cost_anomaly_detector",
+        route_module="cost_anomaly",
+        engine="shieldops.analytics.cost_anomaly:CostAnomalyDetector",
+        setter="set_detector",
+        tags=("Cost Anomaly",),
+        settings_kwargs={
+            "z_threshold": "cost_anomaly_z_threshold",
+            "lookback_days": "cost_anomaly_lookback_days",
+        },
+    ),
+    EngineSpec(
+        name="compliance_report_generator",
+        route_module="compliance_report_gen",
+        engine="shieldops.compliance.report_generator:ComplianceReportGenerator",
+        setter="set_generator",
+        tags=("Compliance Report Generator",),
+        settings_kwargs={
+            "max_reports": "compliance_max_reports",
+        },
+    ),
+    EngineSpec(
+        name="agent_benchmarker",
+        route_module="agent_benchmarks",
+        engine="shieldops.agents.benchmarker:AgentPerformanceBenchmarker",
+        setter="set_benchmarker",
+        tags=("Agent Benchmarks",),
+        settings_kwargs={
+            "baseline_days": "agent_benchmark_baseline_days",
+            "regression_threshold": "agent_benchmark_regression_threshold",
+        },
+    ),
+    EngineSpec(
+        name="webhook_replay_engine",
+        route_module="webhook_replay",
+        engine="shieldops.integrations.outbound.replay_engine:WebhookReplayEngine",
+        tags=("Webhook Replay",),
+        settings_kwargs={
+            "max_retries": "webhook_replay_max_retries",
+            "max_deliveries": "webhook_replay_max_deliveries",
+        },
+    ),
+    EngineSpec(
+        name="dependency_health_tracker",
+        route_module="dependency_health",
+        engine="shieldops.observability.dependency_health:DependencyHealthTracker",
+        setter="set_tracker",
+        tags=("Dependency Health",),
+        settings_kwargs={
+            "max_checks": "dependency_health_max_checks",
+            "cascade_threshold": "dependency_cascade_threshold",
+        },
+    ),
+    EngineSpec(
+        name="deployment_freeze_manager",
+        route_module="deployment_freeze",
+        engine="shieldops.config.deployment_freeze:DeploymentFreezeManager",
+        setter="set_manager",
+        tags=("Deployment Freezes",),
+        settings_kwargs={
+            "max_windows": "deployment_freeze_max_windows",
+            "max_duration_days": "deployment_freeze_max_duration_days",
+        },
+    ),
+    EngineSpec(
+        name="error_budget_tracker",
+        route_module="error_budget",
+        engine="shieldops.sla.error_budget:ErrorBudgetTracker",
+        setter="set_tracker",
+        tags=("Error Budgets",),
+        settings_kwargs={
+            "warning_threshold": "error_budget_warning_threshold",
+            "critical_threshold": "error_budget_critical_threshold",
+        },
+    ),
+    EngineSpec(
+        name="alert_grouping_engine",
+        route_module="alert_grouping",
+        engine="shieldops.observability.alert_grouping:AlertGroupingEngine",
+        tags=("Alert Grouping",),
+        settings_kwargs={
+            "window_seconds": "alert_grouping_window_seconds",
+            "max_groups": "alert_grouping_max_groups",
+        },
+    ),
+    EngineSpec(
+        name="status_page_manager",
+        route_module="status_page",
+        engine="shieldops.observability.status_page:StatusPageManager",
+        setter="set_manager",
+        tags=("Status Page",),
+        settings_kwargs={
+            "max_components": "status_page_max_components",
+            "max_incidents": "status_page_max_incidents",
+        },
+    ),
+    EngineSpec(
+        name="rollback_registry",
+        route_module="rollback_registry",
+        engine="shieldops.policy.rollback.registry:RollbackRegistry",
+        setter="set_registry",
+        tags=("Rollback Registry",),
+        settings_kwargs={
+            "max_events": "rollback_registry_max_events",
+            "pattern_lookback_days": "rollback_pattern_lookback_days",
+        },
+    ),
+    EngineSpec(
+        name="capacity_reservation_manager",
+        route_module="capacity_reservation",
+        engine="shieldops.analytics.capacity_reservation:CapacityReservationManager",
+        setter="set_manager",
+        tags=("Capacity Reservations",),
+        settings_kwargs={
+            "max_active": "capacity_reservation_max_active",
+            "max_duration_days": "capacity_reservation_max_duration_days",
+        },
+    ),
+    EngineSpec(
+        name="dependency_vuln_mapper",
+        route_module="dependency_vuln_map",
+        engine="shieldops.vulnerability.dependency_mapper:DependencyVulnerabilityMapper",
+        setter="set_mapper",
+        tags=("Dependency Vulnerability Map",),
+        settings_kwargs={
+            "max_services": "dep_vuln_max_services",
+            "max_depth": "dep_vuln_max_depth",
+        },
+    ),
+    EngineSpec(
+        name="readiness_reviewer",
+        route_module="readiness_review",
+        engine="shieldops.agents.investigation.readiness_review:OperationalReadinessReviewer",
+        setter="set_reviewer",
+        tags=("Readiness Reviews",),
+        settings_kwargs={
+            "max_checklists": "readiness_review_max_checklists",
+            "passing_threshold": "readiness_review_passing_threshold",
+        },
+    ),
+    EngineSpec(
+        name="rate_limit_analytics",
+        route_module="rate_limit_analytics",
+        engine="shieldops.analytics.rate_limit_analytics:RateLimitAnalyticsEngine",
+        tags=("Rate Limit Analytics",),
+        settings_kwargs={
+            "max_events": "rate_limit_analytics_max_events",
+            "retention_hours": "rate_limit_analytics_retention_hours",
+        },
+    ),
+    EngineSpec(
+        name="agent_decision_explainer",
+        route_module="agent_decisions",
+        engine="shieldops.agents.decision_explainer:AgentDecisionExplainer",
+        setter="set_explainer",
+        tags=("Agent Decisions",),
+        settings_kwargs={
+            "max_records": "agent_decision_max_records",
+            "retention_days": "agent_decision_retention_days",
+        },
+    ),
+    EngineSpec(
+        name="runbook_scheduler",
+        route_module="runbook_scheduler",
+        engine="shieldops.playbooks.runbook_scheduler:RunbookScheduler",
+        setter="set_scheduler",
+        tags=("Runbook Scheduler",),
+        settings_kwargs={
+            "max_schedules": "runbook_scheduler_max_schedules",
+            "lookahead_minutes": "runbook_scheduler_lookahead_minutes",
+        },
+    ),
+    EngineSpec(
+        name="war_room",
+        route_module="war_room",
+        engine="shieldops.incidents.war_room:WarRoomManager",
+        setter="set_manager",
+        tags=("War Rooms",),
+        settings_kwargs={
+            "max_rooms": "war_room_max_rooms",
+            "auto_escalate_minutes": "war_room_auto_escalate_minutes",
+        },
+    ),
+    EngineSpec(
+        name="retrospective",
+        route_module="retrospective",
+        engine="shieldops.incidents.retrospective:RetrospectiveManager",
+        setter="set_manager",
+        tags=("Retrospectives",),
+        settings_kwargs={
+            "max_retros": "retrospective_max_retros",
+        },
+    ),
+    EngineSpec(
+        name="change_risk_scorer",
+        route_module="change_risk",
+        engine="shieldops.analytics.change_risk_scorer:ChangeRiskScorer",
+        setter="set_scorer",
+        tags=("Change Risk",),
+        settings_kwargs={
+            "max_records": "change_risk_max_records",
+            "high_risk_threshold": "change_risk_high_threshold",
+            "critical_risk_threshold": "change_risk_critical_threshold",
+        },
+    ),
+    EngineSpec(
+        name="sla_violation_tracker",
+        route_module="sla_violations",
+        engine="shieldops.sla.violation_tracker:SLAViolationTracker",
+        setter="set_tracker",
+        tags=("SLA Violations",),
+        settings_kwargs={
+            "max_targets": "sla_violation_max_targets",
+            "max_violations": "sla_violation_max_violations",
+        },
+    ),
+    EngineSpec(
+        name="tagging_compliance",
+        route_module="tagging_compliance",
+        engine="shieldops.analytics.tagging_compliance:TaggingComplianceEngine",
+        tags=("Tagging Compliance",),
+        settings_kwargs={
+            "max_policies": "tagging_compliance_max_policies",
+            "max_records": "tagging_compliance_max_records",
+        },
+    ),
+    EngineSpec(
+        name="cost_attribution",
+        route_module="cost_attribution",
+        engine="shieldops.billing.cost_attribution:CostAttributionEngine",
+        tags=("Cost Attribution",),
+        settings_kwargs={
+            "max_rules": "cost_attribution_max_rules",
+            "max_entries": "cost_attribution_max_entries",
+        },
+    ),
+    EngineSpec(
+        name="cost_normalizer",
+        route_module="cost_normalizer",
+        engine="shieldops.analytics.cost_normalizer:CostNormalizer",
+        setter="set_normalizer",
+        tags=("Cost Normalizer",),
+        settings_kwargs={
+            "max_pricing_entries": "cost_normalizer_max_pricing",
+        },
+    ),
+    EngineSpec(
+        name="temporal_patterns",
+        route_module="temporal_patterns",
+        engine="shieldops.analytics.temporal_patterns:TemporalPatternEngine",
+        tags=("Temporal Patterns",),
+        settings_kwargs={
+            "max_events": "temporal_patterns_max_events",
+            "min_occurrences": "temporal_patterns_min_occurrences",
+        },
+    ),
+    EngineSpec(
+        name="continuous_compliance",
+        route_module="continuous_compliance",
+        engine="shieldops.compliance.continuous_validator:ContinuousComplianceValidator",
+        setter="set_validator",
+        tags=("Continuous Compliance",),
+        settings_kwargs={
+            "max_controls": "continuous_compliance_max_controls",
+            "max_records": "continuous_compliance_max_records",
+        },
+    ),
+    EngineSpec(
+        name="third_party_risk",
+        route_module="third_party_risk",
+        engine="shieldops.vulnerability.third_party_risk:ThirdPartyRiskTracker",
+        setter="set_tracker",
+        tags=("Third Party Risk",),
+        settings_kwargs={
+            "max_vendors": "third_party_risk_max_vendors",
+            "assessment_interval_days": "third_party_risk_reassessment_days",
+        },
+    ),
+    EngineSpec(
+        name="roi_tracker",
+        route_module="roi_tracker",
+        engine="shieldops.agents.roi_tracker:AgentROITracker",
+        setter="set_tracker",
+        tags=("ROI Tracker",),
+        settings_kwargs={
+            "max_entries": "roi_tracker_max_entries",
+        },
+    ),
+    EngineSpec(
+        name="infrastructure_map",
+        route_module="infrastructure_map",
+        engine="shieldops.topology.infrastructure_map:InfrastructureTopologyMapper",
+        setter="set_mapper",
+        tags=("Infrastructure Map",),
+        settings_kwargs={
+            "max_nodes": "infrastructure_map_max_nodes",
+            "max_relationships": "infrastructure_map_max_relationships",
+        },
+    ),
+    EngineSpec(
+        name="secret_rotation",
+        route_module="secret_rotation",
+        engine="shieldops.auth.secret_rotation:SecretRotationScheduler",
+        setter="set_scheduler",
+        tags=("Secret Rotation",),
+        settings_kwargs={
+            "max_secrets": "secret_rotation_max_secrets",
+            "default_rotation_days": "secret_rotation_default_days",
+        },
+    ),
+    EngineSpec(
+        name="anomaly_correlation",
+        route_module="anomaly_correlation",
+        engine="shieldops.analytics.anomaly_correlation:AnomalyCorrelationEngine",
+        tags=("Anomaly Correlation",),
+        settings_kwargs={
+            "max_events": "anomaly_correlation_max_events",
+            "correlation_window_seconds": "anomaly_correlation_window_seconds",
+        },
+    ),
+    EngineSpec(
+        name="synthetic_monitor",
+        route_module="synthetic_monitor",
+        engine="shieldops.observability.synthetic_monitor:SyntheticMonitorManager",
+        setter="set_manager",
+        tags=("Synthetic Monitors",),
+        settings_kwargs={
+            "max_monitors": "synthetic_monitor_max_monitors",
+            "max_results": "synthetic_monitor_max_results",
+            "failure_threshold": "synthetic_monitor_failure_threshold",
+        },
+    ),
+    EngineSpec(
+        name="chaos_experiments",
+        route_module="chaos_experiments",
+        engine="shieldops.observability.chaos_experiments:ChaosExperimentTracker",
+        setter="set_tracker",
+        tags=("Chaos Experiments",),
+        settings_kwargs={
+            "max_experiments": "chaos_experiments_max_experiments",
+            "max_results": "chaos_experiments_max_results",
+        },
+    ),
+    EngineSpec(
+        name="data_quality",
+        route_module="data_quality",
+        engine="shieldops.compliance.data_quality:DataQualityMonitor",
+        setter="set_monitor",
+        tags=("Data Quality",),
+        settings_kwargs={
+            "max_rules": "data_quality_max_rules",
+            "max_results": "data_quality_max_results",
+            "alert_cooldown_seconds": "data_quality_alert_cooldown",
+        },
+    ),
+    EngineSpec(
+        name="canary_tracker",
+        route_module="canary_tracker",
+        engine="shieldops.policy.rollback.canary_tracker:CanaryDeploymentTracker",
+        setter="set_tracker",
+        tags=("Canary Deployments",),
+        settings_kwargs={
+            "max_deployments": "canary_tracker_max_deployments",
+            "max_metrics": "canary_tracker_max_metrics",
+        },
+    ),
+    EngineSpec(
+        name="incident_comms",
+        route_module="incident_comms",
+        engine="shieldops.incidents.incident_comms:IncidentCommunicationManager",
+        setter="set_manager",
+        tags=("Incident Communications",),
+        settings_kwargs={
+            "max_templates": "incident_comms_max_templates",
+            "max_messages": "incident_comms_max_messages",
+        },
+    ),
+    EngineSpec(
+        name="dependency_sla",
+        route_module="dependency_sla",
+        engine="shieldops.sla.dependency_sla:DependencySLATracker",
+        setter="set_tracker",
+        tags=("Dependency SLAs",),
+        settings_kwargs={
+            "max_slas": "dependency_sla_max_slas",
+            "max_evaluations": "dependency_sla_max_evaluations",
+        },
+    ),
+    EngineSpec(
+        name="posture_scorer",
+        route_module="posture_scorer",
+        engine="shieldops.vulnerability.posture_scorer:SecurityPostureScorer",
+        setter="set_scorer",
+        tags=("Security Posture",),
+        settings_kwargs={
+            "max_checks": "posture_scorer_max_checks",
+            "max_scores": "posture_scorer_max_scores",
+        },
+    ),
+    EngineSpec(
+        name="workload_fingerprint",
+        route_module="workload_fingerprint",
+        engine="shieldops.analytics.workload_fingerprint:WorkloadFingerprintEngine",
+        tags=("Workload Fingerprints",),
+        settings_kwargs={
+            "max_samples": "workload_fingerprint_max_samples",
+            "min_samples_for_stable": "workload_fingerprint_min_stable",
+            "drift_threshold_pct": "workload_fingerprint_drift_threshold",
+        },
+    ),
+    EngineSpec(
+        name="maintenance_window",
+        route_module="maintenance_window",
+        engine="shieldops.scheduler.maintenance_window:MaintenanceWindowManager",
+        setter="set_manager",
+        tags=("Maintenance Windows",),
+        settings_kwargs={
+            "max_windows": "maintenance_window_max_windows",
+            "max_duration_hours": "maintenance_window_max_duration_hours",
+        },
+    ),
+    EngineSpec(
+        name="evidence_collector",
+        route_module="evidence_collector",
+        engine="shieldops.compliance.evidence_collector:ComplianceEvidenceCollector",
+        setter="set_collector",
+        tags=("Compliance Evidence",),
+        settings_kwargs={
+            "max_evidence": "evidence_collector_max_evidence",
+            "max_packages": "evidence_collector_max_packages",
+        },
+    ),
+    EngineSpec(
+        name="runbook_recommender",
+        route_module="runbook_recommender",
+        engine="shieldops.playbooks.runbook_recommender:RunbookRecommender",
+        setter="set_recommender",
+        tags=("Runbook Recommender",),
+        settings_kwargs={
+            "max_profiles": "runbook_recommender_max_profiles",
+            "max_candidates": "runbook_recommender_max_candidates",
+            "min_score": "runbook_recommender_min_score",
+        },
+    ),
+    EngineSpec(
+        name="incident_clustering",
+        route_module="incident_clustering",
+        engine="shieldops.analytics.incident_clustering:IncidentClusteringEngine",
+        tags=("Incident Clustering",),
+        settings_kwargs={
+            "max_incidents": "incident_clustering_max_incidents",
+            "max_clusters": "incident_clustering_max_clusters",
+            "similarity_threshold": "incident_clustering_similarity",
+        },
+    ),
+    EngineSpec(
+        name="policy_generator",
+        route_module="policy_generator",
+        engine="shieldops.policy.policy_generator:PolicyCodeGenerator",
+        setter="set_generator",
+        tags=("Policy Generator",),
+        settings_kwargs={
+            "max_requirements": "policy_generator_max_requirements",
+            "max_policies": "policy_generator_max_policies",
+        },
+    ),
+    EngineSpec(
+        name="change_advisory",
+        route_module="change_advisory",
+        engine="shieldops.changes.change_advisory:ChangeAdvisoryBoard",
+        setter="set_board",
+        tags=("Change Advisory",),
+        settings_kwargs={
+            "max_requests": "change_advisory_max_requests",
+            "max_votes": "change_advisory_max_votes",
+            "auto_approve_threshold": "change_advisory_auto_approve",
+        },
+    ),
+    EngineSpec(
+        name="sre_metrics",
+        route_module="sre_metrics",
+        engine="shieldops.analytics.sre_metrics:SREMetricsAggregator",
+        setter="set_aggregator",
+        tags=("SRE Metrics",),
+        settings_kwargs={
+            "max_datapoints": "sre_metrics_max_datapoints",
+            "max_scorecards": "sre_metrics_max_scorecards",
+        },
+    ),
+    EngineSpec(
+        name="health_report",
+        route_module="health_report",
+        engine="shieldops.observability.health_report:ServiceHealthReportGenerator",
+        setter="set_generator",
+        tags=("Health Reports",),
+        settings_kwargs={
+            "max_reports": "health_report_max_reports",
+        },
+    ),
+    EngineSpec(
+        name="approval_delegation",
+        route_module="approval_delegation",
+        engine="shieldops.policy.approval.approval_delegation:ApprovalDelegationEngine",
+        tags=("Approval Delegation",),
+        settings_kwargs={
+            "max_rules": "approval_delegation_max_rules",
+            "max_audit": "approval_delegation_max_audit",
+        },
+    ),
+    EngineSpec(
+        name="gap_analyzer",
+        route_module="gap_analyzer",
+        engine="shieldops.compliance.gap_analyzer:ComplianceGapAnalyzer",
+        setter="set_analyzer",
+        tags=("Compliance Gaps",),
+        settings_kwargs={
+            "max_controls": "gap_analyzer_max_controls",
+            "max_gaps": "gap_analyzer_max_gaps",
+        },
+    ),
+    EngineSpec(
+        name="cost_forecast",
+        route_module="cost_forecast",
+        engine="shieldops.billing.cost_forecast:CostForecastEngine",
+        tags=("Cost Forecast",),
+        settings_kwargs={
+            "max_datapoints": "cost_forecast_max_datapoints",
+            "max_forecasts": "cost_forecast_max_forecasts",
+            "budget_alert_threshold": "cost_forecast_alert_threshold",
+        },
+    ),
+    EngineSpec(
+        name="deployment_risk",
+        route_module="deployment_risk",
+        engine="shieldops.changes.deployment_risk:DeploymentRiskPredictor",
+        setter="set_predictor",
+        tags=("Deployment Risk",),
+        settings_kwargs={
+            "max_records": "deployment_risk_max_records",
+            "max_assessments": "deployment_risk_max_assessments",
+        },
+    ),
+    EngineSpec(
+        name="capacity_trends",
+        route_module="capacity_trends",
+        engine="shieldops.analytics.capacity_trends:CapacityTrendAnalyzer",
+        setter="set_analyzer",
+        tags=("Capacity Trends",),
+        settings_kwargs={
+            "max_snapshots": "capacity_trends_max_snapshots",
+            "max_analyses": "capacity_trends_max_analyses",
+            "exhaustion_threshold": "capacity_trends_exhaustion_threshold",
+        },
+    ),
+    EngineSpec(
+        name="incident_learning",
+        route_module="incident_learning",
+        engine="shieldops.agents.incident_learning:IncidentLearningTracker",
+        setter="set_tracker",
+        tags=("Incident Learning",),
+        settings_kwargs={
+            "max_lessons": "incident_learning_max_lessons",
+            "max_applications": "incident_learning_max_applications",
+        },
+    ),
+    EngineSpec(
+        name="tenant_isolation",
+        route_module="tenant_isolation",
+        engine="shieldops.policy.tenant_isolation:TenantResourceIsolationManager",
+        setter="set_manager",
+        tags=("Tenant Isolation",),
+        settings_kwargs={
+            "max_tenants": "tenant_isolation_max_tenants",
+            "max_violations": "tenant_isolation_max_violations",
+        },
+        enabled_flag="tenant_isolation_enabled",
+    ),
+    EngineSpec(
+        name="alert_noise",
+        route_module="alert_noise",
+        engine="shieldops.observability.alert_noise:AlertNoiseAnalyzer",
+        setter="set_analyzer",
+        tags=("Alert Noise",),
+        settings_kwargs={
+            "max_records": "alert_noise_max_records",
+            "noise_threshold": "alert_noise_threshold",
+        },
+        enabled_flag="alert_noise_enabled",
+    ),
+    EngineSpec(
+        name="threshold_tuner",
+        route_module="threshold_tuner",
+        engine="shieldops.observability.threshold_tuner:ThresholdTuningEngine",
+        tags=("Threshold Tuner",),
+        settings_kwargs={
+            "max_thresholds": "threshold_tuner_max_thresholds",
+            "max_samples": "threshold_tuner_max_samples",
+        },
+        enabled_flag="threshold_tuner_enabled",
+    ),
+    EngineSpec(
+        name="severity_predictor",
+        route_module="severity_predictor",
+        engine="shieldops.incidents.severity_predictor:IncidentSeverityPredictor",
+        setter="set_predictor",
+        tags=("Severity Predictor",),
+        settings_kwargs={
+            "max_predictions": "severity_predictor_max_predictions",
+            "max_profiles": "severity_predictor_max_profiles",
+        },
+        enabled_flag="severity_predictor_enabled",
+    ),
+    EngineSpec(
+        name="impact_analyzer",
+        route_module="impact_analyzer",
+        engine="shieldops.topology.impact_analyzer:ServiceDependencyImpactAnalyzer",
+        setter="set_analyzer",
+        tags=("Impact Analyzer",),
+        settings_kwargs={
+            "max_dependencies": "impact_analyzer_max_dependencies",
+            "max_simulations": "impact_analyzer_max_simulations",
+        },
+        enabled_flag="impact_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="config_audit",
+        route_module="config_audit",
+        engine="shieldops.audit.config_audit:ConfigurationAuditTrail",
+        setter="set_trail",
+        tags=("Config Audit",),
+        settings_kwargs={
+            "max_entries": "config_audit_max_entries",
+            "max_versions_per_key": "config_audit_max_versions_per_key",
+        },
+        enabled_flag="config_audit_enabled",
+    ),
+    EngineSpec(
+        name="deployment_velocity",
+        route_module="deployment_velocity",
+        engine="shieldops.analytics.deployment_velocity:DeploymentVelocityTracker",
+        setter="set_tracker",
+        tags=("Deployment Velocity",),
+        settings_kwargs={
+            "max_events": "deployment_velocity_max_events",
+            "default_period_days": "deployment_velocity_default_period_days",
+        },
+        enabled_flag="deployment_velocity_enabled",
+    ),
+    EngineSpec(
+        name="compliance_automation",
+        route_module="compliance_automation",
+        engine="shieldops.compliance.automation_rules:ComplianceAutomationEngine",
+        tags=("Compliance Automation",),
+        settings_kwargs={
+            "max_rules": "compliance_automation_max_rules",
+            "max_executions": "compliance_automation_max_executions",
+        },
+        enabled_flag="compliance_automation_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_base",
+        route_module="knowledge_articles",
+        engine="shieldops.knowledge.article_manager:KnowledgeBaseManager",
+        setter="set_manager",
+        tags=("Knowledge Articles",),
+        settings_kwargs={
+            "max_articles": "knowledge_base_max_articles",
+            "max_votes": "knowledge_base_max_votes",
+        },
+        enabled_flag="knowledge_base_enabled",
+    ),
+    EngineSpec(
+        name="oncall_fatigue",
+        route_module="oncall_fatigue",
+        engine="shieldops.incidents.oncall_fatigue:OnCallFatigueAnalyzer",
+        setter="set_analyzer",
+        tags=("On-Call Fatigue",),
+        settings_kwargs={
+            "max_events": "oncall_fatigue_max_events",
+            "burnout_threshold": "oncall_fatigue_burnout_threshold",
+        },
+        enabled_flag="oncall_fatigue_enabled",
+    ),
+    EngineSpec(
+        name="backup_verification",
+        route_module="backup_verification",
+        engine="shieldops.observability.backup_verification:BackupVerificationEngine",
+        tags=("Backup Verification",),
+        settings_kwargs={
+            "max_backups": "backup_verification_max_backups",
+            "stale_hours": "backup_verification_stale_hours",
+        },
+        enabled_flag="backup_verification_enabled",
+    ),
+    EngineSpec(
+        name="cost_tag_enforcer",
+        route_module="cost_tag_enforcer",
+        engine="shieldops.billing.cost_tag_enforcer:CostAllocationTagEnforcer",
+        setter="set_enforcer",
+        tags=("Cost Tag Enforcer",),
+        settings_kwargs={
+            "max_policies": "cost_tag_enforcer_max_policies",
+            "max_checks": "cost_tag_enforcer_max_checks",
+        },
+        enabled_flag="cost_tag_enforcer_enabled",
+    ),
+    EngineSpec(
+        name="dr_readiness",
+        route_module="dr_readiness",
+        engine="shieldops.observability.dr_readiness:DisasterRecoveryReadinessTracker",
+        setter="set_tracker",
+        tags=("DR Readiness",),
+        settings_kwargs={
+            "max_plans": "dr_readiness_max_plans",
+            "drill_max_age_days": "dr_readiness_drill_max_age_days",
+        },
+        enabled_flag="dr_readiness_enabled",
+    ),
+    EngineSpec(
+        name="service_catalog",
+        route_module="service_catalog",
+        engine="shieldops.topology.service_catalog:ServiceCatalogManager",
+        setter="set_manager",
+        tags=("Service Catalog",),
+        settings_kwargs={
+            "max_services": "service_catalog_max_services",
+            "stale_days": "service_catalog_stale_days",
+        },
+        enabled_flag="service_catalog_enabled",
+    ),
+    EngineSpec(
+        name="contract_testing",
+        route_module="contract_testing",
+        engine="shieldops.api.contract_testing:APIContractTestingEngine",
+        tags=("Contract Testing",),
+        settings_kwargs={
+            "max_schemas": "contract_testing_max_schemas",
+            "max_checks": "contract_testing_max_checks",
+        },
+        enabled_flag="contract_testing_enabled",
+    ),
+    EngineSpec(
+        name="orphan_detector",
+        route_module="orphan_detector",
+        engine="shieldops.billing.orphan_detector:OrphanedResourceDetector",
+        setter="set_detector",
+        tags=("Orphan Detector",),
+        settings_kwargs={
+            "max_resources": "orphan_detector_max_resources",
+            "stale_days": "orphan_detector_stale_days",
+        },
+        enabled_flag="orphan_detector_enabled",
+    ),
+    EngineSpec(
+        name="latency_profiler",
+        route_module="latency_profiler",
+        engine="shieldops.analytics.latency_profiler:ServiceLatencyProfiler",
+        setter="set_profiler",
+        tags=("Latency Profiler",),
+        settings_kwargs={
+            "max_samples": "latency_profiler_max_samples",
+            "regression_threshold": "latency_profiler_regression_threshold",
+        },
+        enabled_flag="latency_profiler_enabled",
+    ),
+    EngineSpec(
+        name="license_scanner",
+        route_module="license_scanner",
+        engine="shieldops.compliance.license_scanner:DependencyLicenseScanner",
+        setter="set_scanner",
+        tags=("License Scanner",),
+        settings_kwargs={
+            "max_dependencies": "license_scanner_max_dependencies",
+            "max_violations": "license_scanner_max_violations",
+        },
+        enabled_flag="license_scanner_enabled",
+    ),
+    EngineSpec(
+        name="release_manager",
+        route_module="release_manager",
+        engine="shieldops.changes.release_manager:ReleaseManagementTracker",
+        setter="set_tracker",
+        tags=("Release Manager",),
+        settings_kwargs={
+            "max_releases": "release_manager_max_releases",
+            "require_approval": "release_manager_require_approval",
+        },
+        enabled_flag="release_manager_enabled",
+    ),
+    EngineSpec(
+        name="budget_manager",
+        route_module="budget_manager",
+        engine="shieldops.billing.budget_manager:InfrastructureCostBudgetManager",
+        setter="set_manager",
+        tags=("Budget Manager",),
+        settings_kwargs={
+            "max_budgets": "budget_manager_max_budgets",
+            "warning_threshold": "budget_manager_warning_threshold",
+        },
+        enabled_flag="budget_manager_enabled",
+    ),
+    EngineSpec(
+        name="config_parity",
+        route_module="config_parity",
+        engine="shieldops.config.parity_validator:ConfigurationParityValidator",
+        setter="set_validator",
+        tags=("Config Parity",),
+        settings_kwargs={
+            "max_configs": "config_parity_max_configs",
+            "max_violations": "config_parity_max_violations",
+        },
+        enabled_flag="config_parity_enabled",
+    ),
+    EngineSpec(
+        name="incident_dedup",
+        route_module="incident_dedup",
+        engine="shieldops.incidents.dedup_engine:IncidentDeduplicationEngine",
+        tags=("Incident Dedup",),
+        settings_kwargs={
+            "max_incidents": "incident_dedup_max_incidents",
+            "similarity_threshold": "incident_dedup_similarity_threshold",
+        },
+        enabled_flag="incident_dedup_enabled",
+    ),
+    EngineSpec(
+        name="access_certification",
+        route_module="access_certification",
+        engine="shieldops.compliance.access_certification:AccessCertificationManager",
+        setter="set_manager",
+        tags=("Access Certification",),
+        settings_kwargs={
+            "max_grants": "access_certification_max_grants",
+            "default_expiry_days": "access_certification_default_expiry_days",
+        },
+        enabled_flag="access_certification_enabled",
+    ),
+    EngineSpec(
+        name="toil_tracker",
+        route_module="toil_tracker",
+        engine="shieldops.analytics.toil_tracker:ToilMeasurementTracker",
+        setter="set_tracker",
+        tags=("Toil Tracker",),
+        settings_kwargs={
+            "max_entries": "toil_tracker_max_entries",
+            "automation_min_occurrences": "toil_tracker_automation_min_occurrences",
+        },
+        enabled_flag="toil_tracker_enabled",
+    ),
+    EngineSpec(
+        name="trace_analyzer",
+        route_module="trace_analyzer",
+        engine="shieldops.analytics.trace_analyzer:DistributedTraceAnalyzer",
+        setter="set_analyzer",
+        tags=("Trace Analyzer",),
+        settings_kwargs={
+            "max_traces": "trace_analyzer_max_traces",
+            "bottleneck_threshold": "trace_analyzer_bottleneck_threshold",
+        },
+        enabled_flag="trace_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="log_anomaly",
+        route_module="log_anomaly",
+        engine="shieldops.analytics.log_anomaly:LogAnomalyDetector",
+        setter="set_detector",
+        tags=("Log Anomaly",),
+        settings_kwargs={
+            "max_patterns": "log_anomaly_max_patterns",
+            "sensitivity": "log_anomaly_sensitivity",
+        },
+        enabled_flag="log_anomaly_enabled",
+    ),
+    EngineSpec(
+        name="event_correlation",
+        route_module="event_correlation",
+        engine="shieldops.analytics.event_correlation:EventCorrelationEngine",
+        tags=("Event Correlation",),
+        settings_kwargs={
+            "max_events": "event_correlation_max_events",
+            "window_minutes": "event_correlation_window_minutes",
+        },
+        enabled_flag="event_correlation_enabled",
+    ),
+    EngineSpec(
+        name="security_incident",
+        route_module="security_incident",
+        engine="shieldops.security.incident_response:SecurityIncidentResponseTracker",
+        setter="set_tracker",
+        tags=("Security Incidents",),
+        settings_kwargs={
+            "max_incidents": "security_incident_max_incidents",
+            "auto_escalate_minutes": "security_incident_auto_escalate_minutes",
+        },
+        enabled_flag="security_incident_enabled",
+    ),
+    EngineSpec(
+        name="vuln_lifecycle",
+        route_module="vuln_lifecycle",
+        engine="shieldops.security.vuln_lifecycle:VulnerabilityLifecycleManager",
+        setter="set_manager",
+        tags=("Vulnerability Lifecycle",),
+        settings_kwargs={
+            "max_records": "vuln_lifecycle_max_records",
+            "patch_sla_days": "vuln_lifecycle_patch_sla_days",
+        },
+        enabled_flag="vuln_lifecycle_enabled",
+    ),
+    EngineSpec(
+        name="api_security",
+        route_module="api_security",
+        engine="shieldops.security.api_security:APISecurityMonitor",
+        setter="set_monitor",
+        tags=("API Security",),
+        settings_kwargs={
+            "max_endpoints": "api_security_max_endpoints",
+            "alert_threshold": "api_security_alert_threshold",
+        },
+        enabled_flag="api_security_enabled",
+    ),
+    EngineSpec(
+        name="tag_governance",
+        route_module="tag_governance",
+        engine="shieldops.billing.tag_governance:ResourceTagGovernanceEngine",
+        tags=("Tag Governance",),
+        settings_kwargs={
+            "max_policies": "tag_governance_max_policies",
+            "max_reports": "tag_governance_max_reports",
+        },
+        enabled_flag="tag_governance_enabled",
+    ),
+    EngineSpec(
+        name="team_performance",
+        route_module="team_performance",
+        engine="shieldops.analytics.team_performance:TeamPerformanceAnalyzer",
+        setter="set_analyzer",
+        tags=("Team Performance",),
+        settings_kwargs={
+            "max_members": "team_performance_max_members",
+            "burnout_threshold": "team_performance_burnout_threshold",
+        },
+        enabled_flag="team_performance_enabled",
+    ),
+    EngineSpec(
+        name="runbook_engine",
+        route_module="runbook_engine",
+        engine="shieldops.operations.runbook_engine:RunbookExecutionEngine",
+        tags=("Runbook Engine",),
+        settings_kwargs={
+            "max_executions": "runbook_engine_max_executions",
+            "step_timeout": "runbook_engine_step_timeout",
+        },
+        enabled_flag="runbook_engine_enabled",
+    ),
+    EngineSpec(
+        name="dependency_scorer",
+        route_module="dependency_scorer",
+        engine="shieldops.topology.dependency_scorer:DependencyHealthScorer",
+        setter="set_scorer",
+        tags=("Dependency Scorer",),
+        settings_kwargs={
+            "max_dependencies": "dependency_scorer_max_dependencies",
+            "check_interval": "dependency_scorer_check_interval",
+        },
+        enabled_flag="dependency_scorer_enabled",
+    ),
+    EngineSpec(
+        name="burn_predictor",
+        route_module="burn_predictor",
+        engine="shieldops.sla.burn_predictor:SLOBurnRatePredictor",
+        setter="set_predictor",
+        tags=("Burn Predictor",),
+        settings_kwargs={
+            "max_slos": "burn_predictor_max_slos",
+            "forecast_hours": "burn_predictor_forecast_hours",
+        },
+        enabled_flag="burn_predictor_enabled",
+    ),
+    EngineSpec(
+        name="change_intelligence",
+        route_module="change_intelligence",
+        engine="shieldops.changes.change_intelligence:ChangeIntelligenceAnalyzer",
+        setter="set_analyzer",
+        tags=("Change Intelligence",),
+        settings_kwargs={
+            "max_records": "change_intelligence_max_records",
+            "risk_threshold": "change_intelligence_risk_threshold",
+        },
+        enabled_flag="change_intelligence_enabled",
+    ),
+    EngineSpec(
+        name="db_performance",
+        route_module="db_performance",
+        engine="shieldops.analytics.db_performance:DatabasePerformanceAnalyzer",
+        setter="set_analyzer",
+        tags=("Database Performance",),
+        settings_kwargs={
+            "max_queries": "db_performance_max_queries",
+            "slow_threshold_ms": "db_performance_slow_threshold_ms",
+        },
+        enabled_flag="db_performance_enabled",
+    ),
+    EngineSpec(
+        name="queue_health",
+        route_module="queue_health",
+        engine="shieldops.observability.queue_health:QueueHealthMonitor",
+        setter="set_monitor",
+        tags=("Queue Health",),
+        settings_kwargs={
+            "max_metrics": "queue_health_max_metrics",
+            "stall_threshold_seconds": "queue_health_stall_threshold_seconds",
+        },
+        enabled_flag="queue_health_enabled",
+    ),
+    EngineSpec(
+        name="cert_monitor",
+        route_module="cert_monitor",
+        engine="shieldops.security.cert_monitor:CertificateExpiryMonitor",
+        setter="set_monitor",
+        tags=("Certificate Monitor",),
+        settings_kwargs={
+            "max_certificates": "cert_monitor_max_certificates",
+            "expiry_warning_days": "cert_monitor_expiry_warning_days",
+        },
+        enabled_flag="cert_monitor_enabled",
+    ),
+    EngineSpec(
+        name="network_flow",
+        route_module="network_flow",
+        engine="shieldops.security.network_flow:NetworkFlowAnalyzer",
+        setter="set_analyzer",
+        tags=("Network Flow",),
+        settings_kwargs={
+            "max_records": "network_flow_max_records",
+            "anomaly_threshold": "network_flow_anomaly_threshold",
+        },
+        enabled_flag="network_flow_enabled",
+    ),
+    EngineSpec(
+        name="dns_health",
+        route_module="dns_health",
+        engine="shieldops.observability.dns_health:DNSHealthMonitor",
+        setter="set_monitor",
+        tags=("DNS Health",),
+        settings_kwargs={
+            "max_checks": "dns_health_max_checks",
+            "timeout_ms": "dns_health_timeout_ms",
+        },
+        enabled_flag="dns_health_enabled",
+    ),
+    EngineSpec(
+        name="escalation_analyzer",
+        route_module="escalation_analyzer",
+        engine="shieldops.incidents.escalation_analyzer:EscalationPatternAnalyzer",
+        setter="set_analyzer",
+        tags=("Escalation Analyzer",),
+        settings_kwargs={
+            "max_events": "escalation_analyzer_max_events",
+            "false_alarm_threshold": "escalation_analyzer_false_alarm_threshold",
+        },
+        enabled_flag="escalation_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="right_sizer",
+        route_module="right_sizer",
+        engine="shieldops.billing.right_sizer:CapacityRightSizer",
+        setter="set_right_sizer",
+        tags=("Right Sizer",),
+        settings_kwargs={
+            "max_samples": "right_sizer_max_samples",
+            "underutil_threshold": "right_sizer_underutil_threshold",
+        },
+        enabled_flag="right_sizer_enabled",
+    ),
+    EngineSpec(
+        name="storage_optimizer",
+        route_module="storage_optimizer",
+        engine="shieldops.billing.storage_optimizer:StorageTierOptimizer",
+        setter="set_optimizer",
+        tags=("Storage Optimizer",),
+        settings_kwargs={
+            "max_assets": "storage_optimizer_max_assets",
+            "cold_threshold_days": "storage_optimizer_cold_threshold_days",
+        },
+        enabled_flag="storage_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="resource_lifecycle",
+        route_module="resource_lifecycle",
+        engine="shieldops.billing.resource_lifecycle:ResourceLifecycleTracker",
+        setter="set_tracker",
+        tags=("Resource Lifecycle",),
+        settings_kwargs={
+            "max_resources": "resource_lifecycle_max_resources",
+            "stale_days": "resource_lifecycle_stale_days",
+        },
+        enabled_flag="resource_lifecycle_enabled",
+    ),
+    EngineSpec(
+        name="alert_routing",
+        route_module="alert_routing",
+        engine="shieldops.observability.alert_routing:AlertRoutingOptimizer",
+        setter="set_optimizer",
+        tags=("Alert Routing",),
+        settings_kwargs={
+            "max_records": "alert_routing_max_records",
+            "reroute_threshold": "alert_routing_reroute_threshold",
+        },
+        enabled_flag="alert_routing_enabled",
+    ),
+    EngineSpec(
+        name="slo_advisor",
+        route_module="slo_advisor",
+        engine="shieldops.sla.slo_advisor:SLOTargetAdvisor",
+        setter="set_advisor",
+        tags=("SLO Advisor",),
+        settings_kwargs={
+            "max_samples": "slo_advisor_max_samples",
+            "min_sample_count": "slo_advisor_min_sample_count",
+        },
+        enabled_flag="slo_advisor_enabled",
+    ),
+    EngineSpec(
+        name="workload_scheduler",
+        route_module="workload_scheduler",
+        engine="shieldops.operations.workload_scheduler:WorkloadSchedulingOptimizer",
+        setter="set_optimizer",
+        tags=("Workload Scheduler",),
+        settings_kwargs={
+            "max_workloads": "workload_scheduler_max_workloads",
+            "conflict_window_seconds": "workload_scheduler_conflict_window_seconds",
+        },
+        enabled_flag="workload_scheduler_enabled",
+    ),
+    EngineSpec(
+        name="cascade_predictor",
+        route_module="cascade_predictor",
+        engine="shieldops.topology.cascade_predictor:CascadingFailurePredictor",
+        setter="set_predictor",
+        tags=("Cascade Predictor",),
+        settings_kwargs={
+            "max_services": "cascade_predictor_max_services",
+            "max_cascade_depth": "cascade_predictor_max_cascade_depth",
+        },
+        enabled_flag="cascade_predictor_enabled",
+    ),
+    EngineSpec(
+        name="resilience_scorer",
+        route_module="resilience_scorer",
+        engine="shieldops.observability.resilience_scorer:ResilienceScoreCalculator",
+        setter="set_scorer",
+        tags=("Resilience Scorer",),
+        settings_kwargs={
+            "max_profiles": "resilience_scorer_max_profiles",
+            "minimum_score_threshold": "resilience_scorer_minimum_score_threshold",
+        },
+        enabled_flag="resilience_scorer_enabled",
+    ),
+    EngineSpec(
+        name="timeline_reconstructor",
+        route_module="timeline_reconstructor",
+        engine="shieldops.incidents.timeline_reconstructor:IncidentTimelineReconstructor",
+        setter="set_reconstructor",
+        tags=("Timeline Reconstructor",),
+        settings_kwargs={
+            "max_events": "timeline_reconstructor_max_events",
+            "correlation_window_seconds": "timeline_reconstructor_correlation_window_seconds",
+        },
+        enabled_flag="timeline_reconstructor_enabled",
+    ),
+    EngineSpec(
+        name="reserved_instance_optimizer",
+        route_module="reserved_instance_optimizer",
+        engine="shieldops.billing.reserved_instance_optimizer:ReservedInstanceOptimizer",
+        setter="set_optimizer",
+        tags=("Reserved Instance Optimizer",),
+        settings_kwargs={
+            "max_reservations": "reserved_instance_optimizer_max_reservations",
+            "expiry_warning_days": "reserved_instance_optimizer_expiry_warning_days",
+        },
+        enabled_flag="reserved_instance_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="cost_anomaly_rca",
+        route_module="cost_anomaly_rca",
+        engine="shieldops.billing.cost_anomaly_rca:CostAnomalyRootCauseAnalyzer",
+        setter="set_analyzer",
+        tags=("Cost Anomaly RCA",),
+        settings_kwargs={
+            "max_spikes": "cost_anomaly_rca_max_spikes",
+            "deviation_threshold_pct": "cost_anomaly_rca_deviation_threshold_pct",
+        },
+        enabled_flag="cost_anomaly_rca_enabled",
+    ),
+    EngineSpec(
+        name="spend_allocation",
+        route_module="spend_allocation",
+        engine="shieldops.billing.spend_allocation:SpendAllocationEngine",
+        tags=("Spend Allocation",),
+        settings_kwargs={
+            "max_pools": "spend_allocation_max_pools",
+            "min_allocation_threshold": "spend_allocation_min_allocation_threshold",
+        },
+        enabled_flag="spend_allocation_enabled",
+    ),
+    EngineSpec(
+        name="container_scanner",
+        route_module="container_scanner",
+        engine="shieldops.security.container_scanner:ContainerImageScanner",
+        setter="set_scanner",
+        tags=("Container Scanner",),
+        settings_kwargs={
+            "max_images": "container_scanner_max_images",
+            "stale_threshold_days": "container_scanner_stale_threshold_days",
+        },
+        enabled_flag="container_scanner_enabled",
+    ),
+    EngineSpec(
+        name="cloud_posture_manager",
+        route_module="cloud_posture_manager",
+        engine="shieldops.security.cloud_posture_manager:CloudSecurityPostureManager",
+        setter="set_manager",
+        tags=("Cloud Posture Manager",),
+        settings_kwargs={
+            "max_resources": "cloud_posture_manager_max_resources",
+            "auto_resolve_days": "cloud_posture_manager_auto_resolve_days",
+        },
+        enabled_flag="cloud_posture_manager_enabled",
+    ),
+    EngineSpec(
+        name="secrets_detector",
+        route_module="secrets_detector",
+        engine="shieldops.security.secrets_detector:SecretsSprawlDetector",
+        setter="set_detector",
+        tags=("Secrets Detector",),
+        settings_kwargs={
+            "max_findings": "secrets_detector_max_findings",
+            "high_severity_threshold": "secrets_detector_high_severity_threshold",
+        },
+        enabled_flag="secrets_detector_enabled",
+    ),
+    EngineSpec(
+        name="runbook_effectiveness",
+        route_module="runbook_effectiveness",
+        engine="shieldops.operations.runbook_effectiveness:RunbookEffectivenessAnalyzer",
+        setter="set_analyzer",
+        tags=("Runbook Effectiveness",),
+        settings_kwargs={
+            "max_outcomes": "runbook_effectiveness_max_outcomes",
+            "decay_window_days": "runbook_effectiveness_decay_window_days",
+        },
+        enabled_flag="runbook_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="api_deprecation_tracker",
+        route_module="api_deprecation_tracker",
+        engine="shieldops.analytics.api_deprecation_tracker:APIDeprecationTracker",
+        setter="set_tracker",
+        tags=("API Deprecation Tracker",),
+        settings_kwargs={
+            "max_records": "api_deprecation_tracker_max_records",
+            "sunset_warning_days": "api_deprecation_tracker_sunset_warning_days",
+        },
+        enabled_flag="api_deprecation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="dependency_freshness",
+        route_module="dependency_freshness",
+        engine="shieldops.analytics.dependency_freshness:DependencyFreshnessMonitor",
+        setter="set_monitor",
+        tags=("Dependency Freshness",),
+        settings_kwargs={
+            "max_dependencies": "dependency_freshness_max_dependencies",
+            "stale_version_threshold": "dependency_freshness_stale_version_threshold",
+        },
+        enabled_flag="dependency_freshness_enabled",
+    ),
+    EngineSpec(
+        name="chaos_designer",
+        route_module="chaos_designer",
+        engine="shieldops.observability.chaos_designer:ChaosExperimentDesigner",
+        setter="set_designer",
+        tags=("Chaos Designer",),
+        settings_kwargs={
+            "max_experiments": "chaos_designer_max_experiments",
+            "max_blast_radius": "chaos_designer_max_blast_radius",
+        },
+        enabled_flag="chaos_designer_enabled",
+    ),
+    EngineSpec(
+        name="game_day_planner",
+        route_module="game_day_planner",
+        engine="shieldops.operations.game_day_planner:GameDayPlanner",
+        setter="set_planner",
+        tags=("Game Day Planner",),
+        settings_kwargs={
+            "max_game_days": "game_day_planner_max_game_days",
+            "min_scenarios_per_day": "game_day_planner_min_scenarios_per_day",
+        },
+        enabled_flag="game_day_planner_enabled",
+    ),
+    EngineSpec(
+        name="failure_mode_catalog",
+        route_module="failure_mode_catalog",
+        engine="shieldops.topology.failure_mode_catalog:FailureModeCatalog",
+        setter="set_catalog",
+        tags=("Failure Mode Catalog",),
+        settings_kwargs={
+            "max_modes": "failure_mode_catalog_max_modes",
+            "mtbf_window_days": "failure_mode_catalog_mtbf_window_days",
+        },
+        enabled_flag="failure_mode_catalog_enabled",
+    ),
+    EngineSpec(
+        name="oncall_optimizer",
+        route_module="oncall_optimizer",
+        engine="shieldops.incidents.oncall_optimizer:OnCallRotationOptimizer",
+        setter="set_optimizer",
+        tags=("On-Call Optimizer",),
+        settings_kwargs={
+            "max_members": "oncall_optimizer_max_members",
+            "max_consecutive_days": "oncall_optimizer_max_consecutive_days",
+        },
+        enabled_flag="oncall_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="alert_correlation_rules",
+        route_module="alert_correlation_rules",
+        engine="shieldops.observability.alert_correlation_rules:AlertCorrelationRuleEngine",
+        tags=("Alert Correlation Rules",),
+        settings_kwargs={
+            "max_rules": "alert_correlation_rules_max_rules",
+            "time_window_seconds": "alert_correlation_rules_time_window_seconds",
+        },
+        enabled_flag="alert_correlation_rules_enabled",
+    ),
+    EngineSpec(
+        name="review_board",
+        route_module="review_board",
+        engine="shieldops.incidents.review_board:IncidentReviewBoard",
+        setter="set_board",
+        tags=("Review Board",),
+        settings_kwargs={
+            "max_reviews": "review_board_max_reviews",
+            "action_sla_days": "review_board_action_sla_days",
+        },
+        enabled_flag="review_board_enabled",
+    ),
+    EngineSpec(
+        name="commitment_planner",
+        route_module="commitment_planner",
+        engine="shieldops.billing.commitment_planner:CloudCommitmentPlanner",
+        setter="set_planner",
+        tags=("Commitment Planner",),
+        settings_kwargs={
+            "max_workloads": "commitment_planner_max_workloads",
+            "min_savings_threshold_pct": "commitment_planner_min_savings_threshold_pct",
+        },
+        enabled_flag="commitment_planner_enabled",
+    ),
+    EngineSpec(
+        name="cost_simulator",
+        route_module="cost_simulator",
+        engine="shieldops.billing.cost_simulator:CostSimulationEngine",
+        tags=("Cost Simulator",),
+        settings_kwargs={
+            "max_scenarios": "cost_simulator_max_scenarios",
+            "budget_breach_threshold_pct": "cost_simulator_budget_breach_threshold_pct",
+        },
+        enabled_flag="cost_simulator_enabled",
+    ),
+    EngineSpec(
+        name="finops_maturity",
+        route_module="finops_maturity",
+        engine="shieldops.billing.finops_maturity:FinOpsMaturityScorer",
+        setter="set_scorer",
+        tags=("FinOps Maturity",),
+        settings_kwargs={
+            "max_assessments": "finops_maturity_max_assessments",
+            "target_level": "finops_maturity_target_level",
+        },
+        enabled_flag="finops_maturity_enabled",
+    ),
+    EngineSpec(
+        name="change_failure_tracker",
+        route_module="change_failure_tracker",
+        engine="shieldops.changes.change_failure_tracker:ChangeFailureRateTracker",
+        setter="set_tracker",
+        tags=("Change Failure Tracker",),
+        settings_kwargs={
+            "max_deployments": "change_failure_tracker_max_deployments",
+            "trend_window_days": "change_failure_tracker_trend_window_days",
+        },
+        enabled_flag="change_failure_tracker_enabled",
+    ),
+    EngineSpec(
+        name="toil_recommender",
+        route_module="toil_recommender",
+        engine="shieldops.operations.toil_recommender:ToilAutomationRecommender",
+        setter="set_recommender",
+        tags=("Toil Recommender",),
+        settings_kwargs={
+            "max_patterns": "toil_recommender_max_patterns",
+            "min_roi_multiplier": "toil_recommender_min_roi_multiplier",
+        },
+        enabled_flag="toil_recommender_enabled",
+    ),
+    EngineSpec(
+        name="sli_pipeline",
+        route_module="sli_pipeline",
+        engine="shieldops.sla.sli_pipeline:SLICalculationPipeline",
+        setter="set_pipeline",
+        tags=("SLI Pipeline",),
+        settings_kwargs={
+            "max_definitions": "sli_pipeline_max_definitions",
+            "data_retention_hours": "sli_pipeline_data_retention_hours",
+        },
+        enabled_flag="sli_pipeline_enabled",
+    ),
+    EngineSpec(
+        name="deployment_cadence",
+        route_module="deployment_cadence",
+        engine="shieldops.analytics.deployment_cadence:DeploymentCadenceAnalyzer",
+        setter="set_analyzer",
+        tags=("Deployment Cadence",),
+        settings_kwargs={
+            "max_deployments": "deployment_cadence_max_deployments",
+        },
+        enabled_flag="deployment_cadence_enabled",
+    ),
+    EngineSpec(
+        name="metric_baseline",
+        route_module="metric_baseline",
+        engine="shieldops.observability.metric_baseline:MetricBaselineManager",
+        setter="set_manager",
+        tags=("Metric Baseline",),
+        settings_kwargs={
+            "max_baselines": "metric_baseline_max_baselines",
+            "deviation_threshold_pct": "metric_baseline_deviation_threshold_pct",
+        },
+        enabled_flag="metric_baseline_enabled",
+    ),
+    EngineSpec(
+        name="incident_timeline",
+        route_module="incident_timeline",
+        engine="shieldops.incidents.incident_timeline:IncidentTimelineAnalyzer",
+        setter="set_analyzer",
+        tags=("Incident Timeline",),
+        settings_kwargs={
+            "max_entries": "incident_timeline_max_entries",
+            "target_resolution_minutes": "incident_timeline_target_resolution_minutes",
+        },
+        enabled_flag="incident_timeline_enabled",
+    ),
+    EngineSpec(
+        name="service_health_agg",
+        route_module="service_health_agg",
+        engine="shieldops.topology.service_health_agg:ServiceHealthAggregator",
+        setter="set_aggregator",
+        tags=("Service Health Aggregator",),
+        settings_kwargs={
+            "max_signals": "service_health_agg_max_signals",
+            "health_threshold": "service_health_agg_health_threshold",
+        },
+        enabled_flag="service_health_agg_enabled",
+    ),
+    EngineSpec(
+        name="alert_fatigue",
+        route_module="alert_fatigue",
+        engine="shieldops.observability.alert_fatigue:AlertFatigueScorer",
+        setter="set_scorer",
+        tags=("Alert Fatigue",),
+        settings_kwargs={
+            "max_records": "alert_fatigue_max_records",
+            "fatigue_threshold": "alert_fatigue_threshold",
+        },
+        enabled_flag="alert_fatigue_enabled",
+    ),
+    EngineSpec(
+        name="change_window",
+        route_module="change_window",
+        engine="shieldops.changes.change_window:ChangeWindowOptimizer",
+        setter="set_optimizer",
+        tags=("Change Window",),
+        settings_kwargs={
+            "max_records": "change_window_max_records",
+            "min_success_rate": "change_window_min_success_rate",
+        },
+        enabled_flag="change_window_enabled",
+    ),
+    EngineSpec(
+        name="resource_waste",
+        route_module="resource_waste",
+        engine="shieldops.billing.resource_waste:ResourceWasteDetector",
+        setter="set_detector",
+        tags=("Resource Waste",),
+        settings_kwargs={
+            "max_records": "resource_waste_max_records",
+            "idle_threshold_pct": "resource_waste_idle_threshold_pct",
+        },
+        enabled_flag="resource_waste_enabled",
+    ),
+    EngineSpec(
+        name="evidence_chain",
+        route_module="evidence_chain",
+        engine="shieldops.compliance.evidence_chain:ComplianceEvidenceChain",
+        setter="set_chain_manager",
+        tags=("Evidence Chain",),
+        settings_kwargs={
+            "max_chains": "evidence_chain_max_chains",
+            "max_items_per_chain": "evidence_chain_max_items_per_chain",
+        },
+        enabled_flag="evidence_chain_enabled",
+    ),
+    EngineSpec(
+        name="dependency_update_planner",
+        route_module="dependency_update_planner",
+        engine="shieldops.topology.dependency_update_planner:DependencyUpdatePlanner",
+        setter="set_planner",
+        tags=("Dependency Update Planner",),
+        settings_kwargs={
+            "max_updates": "dependency_update_planner_max_updates",
+            "max_risk_threshold": "dependency_update_planner_max_risk_threshold",
+        },
+        enabled_flag="dependency_update_planner_enabled",
+    ),
+    EngineSpec(
+        name="capacity_forecast_engine",
+        route_module="capacity_forecast_engine",
+        engine="shieldops.analytics.capacity_forecast_engine:CapacityForecastEngine",
+        tags=("Capacity Forecast Engine",),
+        settings_kwargs={
+            "max_data_points": "capacity_forecast_engine_max_data_points",
+            "headroom_target_pct": "capacity_forecast_engine_headroom_target_pct",
+        },
+        enabled_flag="capacity_forecast_engine_enabled",
+    ),
+    EngineSpec(
+        name="runbook_versioner",
+        route_module="runbook_versioner",
+        engine="shieldops.operations.runbook_versioner:RunbookVersionManager",
+        setter="set_manager",
+        tags=("Runbook Versioner",),
+        settings_kwargs={
+            "max_versions": "runbook_versioner_max_versions",
+            "stale_age_days": "runbook_versioner_stale_age_days",
+        },
+        enabled_flag="runbook_versioner_enabled",
+    ),
+    EngineSpec(
+        name="team_skill_matrix",
+        route_module="team_skill_matrix",
+        engine="shieldops.operations.team_skill_matrix:TeamSkillMatrix",
+        setter="set_matrix",
+        tags=("Team Skill Matrix",),
+        settings_kwargs={
+            "max_entries": "team_skill_matrix_max_entries",
+            "min_coverage_per_domain": "team_skill_matrix_min_coverage_per_domain",
+        },
+        enabled_flag="team_skill_matrix_enabled",
+    ),
+    EngineSpec(
+        name="error_budget_policy",
+        route_module="error_budget_policy",
+        engine="shieldops.sla.error_budget_policy:ErrorBudgetPolicyEngine",
+        tags=("Error Budget Policy",),
+        settings_kwargs={
+            "max_policies": "error_budget_policy_max_policies",
+            "warning_threshold_pct": "error_budget_policy_warning_threshold_pct",
+        },
+        enabled_flag="error_budget_policy_enabled",
+    ),
+    EngineSpec(
+        name="reliability_target",
+        route_module="reliability_target",
+        engine="shieldops.sla.reliability_target:ReliabilityTargetAdvisor",
+        setter="set_advisor",
+        tags=("Reliability Target",),
+        settings_kwargs={
+            "max_targets": "reliability_target_max_targets",
+            "default_target_pct": "reliability_target_default_target_pct",
+        },
+        enabled_flag="reliability_target_enabled",
+    ),
+    EngineSpec(
+        name="severity_calibrator",
+        route_module="severity_calibrator",
+        engine="shieldops.incidents.severity_calibrator:IncidentSeverityCalibrator",
+        setter="set_calibrator",
+        tags=("Severity Calibrator",),
+        settings_kwargs={
+            "max_records": "severity_calibrator_max_records",
+            "accuracy_target_pct": "severity_calibrator_accuracy_target_pct",
+        },
+        enabled_flag="severity_calibrator_enabled",
+    ),
+    EngineSpec(
+        name="dependency_mapper",
+        route_module="dependency_mapper",
+        engine="shieldops.topology.dependency_mapper:ServiceDependencyMapper",
+        setter="set_mapper",
+        tags=("Dependency Mapper",),
+        settings_kwargs={
+            "max_edges": "dependency_mapper_max_edges",
+            "max_chain_depth": "dependency_mapper_max_chain_depth",
+        },
+        enabled_flag="dependency_mapper_enabled",
+    ),
+    EngineSpec(
+        name="alert_rule_linter",
+        route_module="alert_rule_linter",
+        engine="shieldops.observability.alert_rule_linter:AlertRuleLinter",
+        setter="set_linter",
+        tags=("Alert Rule Linter",),
+        settings_kwargs={
+            "max_rules": "alert_rule_linter_max_rules",
+            "min_quality_score": "alert_rule_linter_min_quality_score",
+        },
+        enabled_flag="alert_rule_linter_enabled",
+    ),
+    EngineSpec(
+        name="deployment_gate",
+        route_module="deployment_gate",
+        engine="shieldops.changes.deployment_gate:DeploymentApprovalGate",
+        setter="set_gate_manager",
+        tags=("Deployment Gate",),
+        settings_kwargs={
+            "max_gates": "deployment_gate_max_gates",
+            "gate_expiry_hours": "deployment_gate_expiry_hours",
+        },
+        enabled_flag="deployment_gate_enabled",
+    ),
+    EngineSpec(
+        name="billing_reconciler",
+        route_module="billing_reconciler",
+        engine="shieldops.billing.billing_reconciler:CloudBillingReconciler",
+        setter="set_reconciler",
+        tags=("Billing Reconciler",),
+        settings_kwargs={
+            "max_records": "billing_reconciler_max_records",
+            "discrepancy_threshold_pct": "billing_reconciler_discrepancy_threshold_pct",
+        },
+        enabled_flag="billing_reconciler_enabled",
+    ),
+    EngineSpec(
+        name="chargeback_engine",
+        route_module="chargeback_engine",
+        engine="shieldops.billing.chargeback_engine:CostChargebackEngine",
+        tags=("Chargeback Engine",),
+        settings_kwargs={
+            "max_records": "chargeback_engine_max_records",
+            "unallocated_threshold_pct": "chargeback_engine_unallocated_threshold_pct",
+        },
+        enabled_flag="chargeback_engine_enabled",
+    ),
+    EngineSpec(
+        name="compliance_drift",
+        route_module="compliance_drift",
+        engine="shieldops.compliance.compliance_drift:ComplianceDriftDetector",
+        setter="set_detector",
+        tags=("Compliance Drift",),
+        settings_kwargs={
+            "max_records": "compliance_drift_max_records",
+            "max_drift_rate_pct": "compliance_drift_max_drift_rate_pct",
+        },
+        enabled_flag="compliance_drift_enabled",
+    ),
+    EngineSpec(
+        name="comm_planner",
+        route_module="comm_planner",
+        engine="shieldops.incidents.comm_planner:IncidentCommPlanner",
+        setter="set_planner",
+        tags=("Comm Planner",),
+        settings_kwargs={
+            "max_plans": "comm_planner_max_plans",
+            "max_overdue_minutes": "comm_planner_max_overdue_minutes",
+        },
+        enabled_flag="comm_planner_enabled",
+    ),
+    EngineSpec(
+        name="infra_drift_reconciler",
+        route_module="infra_drift_reconciler",
+        engine="shieldops.operations.infra_drift_reconciler:InfraDriftReconciler",
+        setter="set_reconciler",
+        tags=("Infra Drift Reconciler",),
+        settings_kwargs={
+            "max_drifts": "infra_drift_reconciler_max_drifts",
+            "auto_reconcile_enabled": "infra_drift_reconciler_auto_reconcile_enabled",
+        },
+        enabled_flag="infra_drift_reconciler_enabled",
+    ),
+    EngineSpec(
+        name="service_maturity",
+        route_module="service_maturity",
+        engine="shieldops.topology.service_maturity:ServiceMaturityModel",
+        setter="set_model",
+        tags=("Service Maturity",),
+        settings_kwargs={
+            "max_assessments": "service_maturity_max_assessments",
+            "target_maturity_level": "service_maturity_target_level",
+        },
+        enabled_flag="service_maturity_enabled",
+    ),
+    EngineSpec(
+        name="capacity_right_timing",
+        route_module="capacity_right_timing",
+        engine="shieldops.operations.capacity_right_timing:CapacityRightTimingAdvisor",
+        tags=("Capacity Right-Timing",),
+        router_attr="crt_route",
+        settings_kwargs={
+            "max_records": "capacity_right_timing_max_records",
+            "lookahead_hours": "capacity_right_timing_lookahead_hours",
+        },
+        enabled_flag="capacity_right_timing_enabled",
+    ),
+    EngineSpec(
+        name="outage_predictor",
+        route_module="outage_predictor",
+        engine="shieldops.observability.outage_predictor:PredictiveOutageDetector",
+        tags=("Outage Predictor",),
+        router_attr="op_route",
+        settings_kwargs={
+            "max_records": "outage_predictor_max_records",
+            "composite_threshold": "outage_predictor_composite_threshold",
+        },
+        enabled_flag="outage_predictor_enabled",
+    ),
+    EngineSpec(
+        name="impact_quantifier",
+        route_module="impact_quantifier",
+        engine="shieldops.incidents.impact_quantifier:IncidentImpactQuantifier",
+        tags=("Impact Quantifier",),
+        router_attr="iq_route",
+        settings_kwargs={
+            "max_assessments": "impact_quantifier_max_assessments",
+            "default_hourly_rate_usd": "impact_quantifier_default_hourly_rate_usd",
+        },
+        enabled_flag="impact_quantifier_enabled",
+    ),
+    EngineSpec(
+        name="policy_violation_tracker",
+        route_module="policy_violation_tracker",
+        engine="shieldops.compliance.policy_violation_tracker:PolicyViolationTracker",
+        tags=("Policy Violation Tracker",),
+        router_attr="pvt_route",
+        settings_kwargs={
+            "max_records": "policy_violation_tracker_max_records",
+            "repeat_threshold": "policy_violation_tracker_repeat_threshold",
+        },
+        enabled_flag="policy_violation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="deploy_health_scorer",
+        route_module="deploy_health_scorer",
+        engine="shieldops.changes.deploy_health_scorer:DeploymentHealthScorer",
+        tags=("Deploy Health Scorer",),
+        router_attr="dhs_route",
+        settings_kwargs={
+            "max_records": "deploy_health_scorer_max_records",
+            "failing_threshold": "deploy_health_scorer_failing_threshold",
+        },
+        enabled_flag="deploy_health_scorer_enabled",
+    ),
+    EngineSpec(
+        name="runbook_gap_analyzer",
+        route_module="runbook_gap_analyzer",
+        engine="shieldops.operations.runbook_gap_analyzer:RunbookGapAnalyzer",
+        tags=("Runbook Gap Analyzer",),
+        router_attr="rga_route",
+        settings_kwargs={
+            "max_gaps": "runbook_gap_analyzer_max_gaps",
+            "critical_incident_threshold": "runbook_gap_analyzer_critical_incident_threshold",
+        },
+        enabled_flag="runbook_gap_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="credential_expiry_forecaster",
+        route_module="credential_expiry_forecaster",
+        engine="shieldops.security.credential_expiry_forecaster:CredentialExpiryForecaster",
+        tags=("Credential Expiry Forecaster",),
+        router_attr="cef_route",
+        settings_kwargs={
+            "max_records": "credential_expiry_forecaster_max_records",
+            "warning_days": "credential_expiry_forecaster_warning_days",
+        },
+        enabled_flag="credential_expiry_forecaster_enabled",
+    ),
+    EngineSpec(
+        name="oncall_workload_balancer",
+        route_module="oncall_workload_balancer",
+        engine="shieldops.incidents.oncall_workload_balancer:OnCallWorkloadBalancer",
+        tags=("On-Call Workload Balancer",),
+        router_attr="owb_route",
+        settings_kwargs={
+            "max_records": "oncall_workload_balancer_max_records",
+            "imbalance_threshold_pct": "oncall_workload_balancer_imbalance_threshold_pct",
+        },
+        enabled_flag="oncall_workload_balancer_enabled",
+    ),
+    EngineSpec(
+        name="cost_anomaly_predictor",
+        route_module="cost_anomaly_predictor",
+        engine="shieldops.billing.cost_anomaly_predictor:CostAnomalyPredictor",
+        tags=("Cost Anomaly Predictor",),
+        router_attr="cap_route",
+        settings_kwargs={
+            "max_records": "cost_anomaly_predictor_max_records",
+            "spike_threshold_usd": "cost_anomaly_predictor_spike_threshold_usd",
+        },
+        enabled_flag="cost_anomaly_predictor_enabled",
+    ),
+    EngineSpec(
+        name="evidence_scheduler",
+        route_module="evidence_scheduler",
+        engine="shieldops.compliance.evidence_scheduler:ComplianceEvidenceScheduler",
+        tags=("Evidence Scheduler",),
+        router_attr="es_route",
+        settings_kwargs={
+            "max_schedules": "evidence_scheduler_max_schedules",
+            "overdue_grace_days": "evidence_scheduler_overdue_grace_days",
+        },
+        enabled_flag="evidence_scheduler_enabled",
+    ),
+    EngineSpec(
+        name="latency_budget_tracker",
+        route_module="latency_budget_tracker",
+        engine="shieldops.analytics.latency_budget_tracker:LatencyBudgetTracker",
+        tags=("Latency Budget Tracker",),
+        router_attr="lbt_route",
+        settings_kwargs={
+            "max_records": "latency_budget_tracker_max_records",
+            "chronic_violation_threshold": "latency_budget_tracker_chronic_violation_threshold",
+        },
+        enabled_flag="latency_budget_tracker_enabled",
+    ),
+    EngineSpec(
+        name="change_conflict_detector",
+        route_module="change_conflict_detector",
+        engine="shieldops.changes.change_conflict_detector:ChangeConflictDetector",
+        tags=("Change Conflict Detector",),
+        router_attr="ccd_route",
+        settings_kwargs={
+            "max_records": "change_conflict_detector_max_records",
+            "lookahead_hours": "change_conflict_detector_lookahead_hours",
+        },
+        enabled_flag="change_conflict_detector_enabled",
+    ),
+    EngineSpec(
+        name="duration_predictor",
+        route_module="duration_predictor",
+        engine="shieldops.incidents.duration_predictor:IncidentDurationPredictor",
+        tags=("Duration Predictor",),
+        router_attr="dp_route",
+        settings_kwargs={
+            "max_records": "duration_predictor_max_records",
+            "accuracy_target_pct": "duration_predictor_accuracy_target_pct",
+        },
+        enabled_flag="duration_predictor_enabled",
+    ),
+    EngineSpec(
+        name="resource_exhaustion",
+        route_module="resource_exhaustion",
+        engine="shieldops.analytics.resource_exhaustion:ResourceExhaustionForecaster",
+        tags=("Resource Exhaustion",),
+        router_attr="rex_route",
+        settings_kwargs={
+            "max_records": "resource_exhaustion_max_records",
+            "default_critical_hours": "resource_exhaustion_default_critical_hours",
+        },
+        enabled_flag="resource_exhaustion_enabled",
+    ),
+    EngineSpec(
+        name="alert_storm_correlator",
+        route_module="alert_storm_correlator",
+        engine="shieldops.observability.alert_storm_correlator:AlertStormCorrelator",
+        tags=("Alert Storm Correlator",),
+        router_attr="asc_route",
+        settings_kwargs={
+            "max_records": "alert_storm_correlator_max_records",
+            "storm_window_seconds": "alert_storm_correlator_storm_window_seconds",
+        },
+        enabled_flag="alert_storm_correlator_enabled",
+    ),
+    EngineSpec(
+        name="canary_analyzer",
+        route_module="canary_analyzer",
+        engine="shieldops.changes.canary_analyzer:DeploymentCanaryAnalyzer",
+        tags=("Canary Analyzer",),
+        router_attr="ca_route",
+        settings_kwargs={
+            "max_records": "canary_analyzer_max_records",
+            "deviation_threshold_pct": "canary_analyzer_deviation_threshold_pct",
+        },
+        enabled_flag="canary_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="sla_cascader",
+        route_module="sla_cascader",
+        engine="shieldops.sla.sla_cascader:ServiceSLACascader",
+        setter="set_cascader",
+        tags=("SLA Cascader",),
+        router_attr="sc_route",
+        settings_kwargs={
+            "max_records": "sla_cascader_max_records",
+            "min_acceptable_sla_pct": "sla_cascader_min_acceptable_sla_pct",
+        },
+        enabled_flag="sla_cascader_enabled",
+    ),
+    EngineSpec(
+        name="handoff_tracker",
+        route_module="handoff_tracker",
+        engine="shieldops.incidents.handoff_tracker:IncidentHandoffTracker",
+        setter="set_tracker",
+        tags=("Handoff Tracker",),
+        router_attr="ht_route",
+        settings_kwargs={
+            "max_records": "handoff_tracker_max_records",
+            "quality_threshold": "handoff_tracker_quality_threshold",
+        },
+        enabled_flag="handoff_tracker_enabled",
+    ),
+    EngineSpec(
+        name="unit_economics",
+        route_module="unit_economics",
+        engine="shieldops.billing.unit_economics:CostUnitEconomicsEngine",
+        tags=("Unit Economics",),
+        router_attr="ue_route",
+        settings_kwargs={
+            "max_records": "unit_economics_max_records",
+            "high_cost_threshold": "unit_economics_high_cost_threshold",
+        },
+        enabled_flag="unit_economics_enabled",
+    ),
+    EngineSpec(
+        name="idle_resource_detector",
+        route_module="idle_resource_detector",
+        engine="shieldops.billing.idle_resource_detector:IdleResourceDetector",
+        setter="set_detector",
+        tags=("Idle Resource Detector",),
+        router_attr="ird_route",
+        settings_kwargs={
+            "max_records": "idle_resource_detector_max_records",
+            "idle_threshold_pct": "idle_resource_detector_idle_threshold_pct",
+        },
+        enabled_flag="idle_resource_detector_enabled",
+    ),
+    EngineSpec(
+        name="penalty_calculator",
+        route_module="penalty_calculator",
+        engine="shieldops.sla.penalty_calculator:SLAPenaltyCalculator",
+        tags=("Penalty Calculator",),
+        router_attr="pc_route",
+        settings_kwargs={
+            "max_records": "penalty_calculator_max_records",
+            "default_credit_multiplier": "penalty_calculator_default_credit_multiplier",
+        },
+        enabled_flag="penalty_calculator_enabled",
+    ),
+    EngineSpec(
+        name="posture_trend",
+        route_module="posture_trend",
+        engine="shieldops.security.posture_trend:SecurityPostureTrendAnalyzer",
+        tags=("Posture Trend",),
+        router_attr="pt_route",
+        settings_kwargs={
+            "max_records": "posture_trend_max_records",
+            "regression_threshold": "posture_trend_regression_threshold",
+        },
+        enabled_flag="posture_trend_enabled",
+    ),
+    EngineSpec(
+        name="evidence_freshness",
+        route_module="evidence_freshness",
+        engine="shieldops.compliance.evidence_freshness:EvidenceFreshnessMonitor",
+        tags=("Evidence Freshness",),
+        router_attr="ef_route",
+        settings_kwargs={
+            "max_records": "evidence_freshness_max_records",
+            "stale_days": "evidence_freshness_stale_days",
+        },
+        enabled_flag="evidence_freshness_enabled",
+    ),
+    EngineSpec(
+        name="access_anomaly",
+        route_module="access_anomaly",
+        engine="shieldops.security.access_anomaly:AccessAnomalyDetector",
+        tags=("Access Anomaly",),
+        router_attr="aa_route",
+        settings_kwargs={
+            "max_records": "access_anomaly_max_records",
+            "threat_threshold": "access_anomaly_threat_threshold",
+        },
+        enabled_flag="access_anomaly_enabled",
+    ),
+    EngineSpec(
+        name="response_advisor",
+        route_module="response_advisor",
+        engine="shieldops.incidents.response_advisor:IncidentResponseAdvisor",
+        tags=("Response Advisor",),
+        router_attr="rad_route",
+        settings_kwargs={
+            "max_records": "response_advisor_max_records",
+            "confidence_threshold": "response_advisor_confidence_threshold",
+        },
+        enabled_flag="response_advisor_enabled",
+    ),
+    EngineSpec(
+        name="metric_rca",
+        route_module="metric_rca",
+        engine="shieldops.analytics.metric_rca:MetricRootCauseAnalyzer",
+        tags=("Metric RCA",),
+        router_attr="mrc_route",
+        settings_kwargs={
+            "max_records": "metric_rca_max_records",
+            "deviation_threshold_pct": "metric_rca_deviation_threshold_pct",
+        },
+        enabled_flag="metric_rca_enabled",
+    ),
+    EngineSpec(
+        name="slo_forecast",
+        route_module="slo_forecast",
+        engine="shieldops.sla.slo_forecast:SLOComplianceForecaster",
+        tags=("SLO Forecast",),
+        router_attr="sf_route",
+        settings_kwargs={
+            "max_records": "slo_forecast_max_records",
+            "risk_threshold_pct": "slo_forecast_risk_threshold_pct",
+        },
+        enabled_flag="slo_forecast_enabled",
+    ),
+    EngineSpec(
+        name="remediation_decision",
+        route_module="remediation_decision",
+        engine="shieldops.operations.remediation_decision:AutoRemediationDecisionEngine",
+        tags=("Remediation Decision",),
+        router_attr="rde_route",
+        settings_kwargs={
+            "max_records": "remediation_decision_max_records",
+            "max_risk_score": "remediation_decision_max_risk_score",
+        },
+        enabled_flag="remediation_decision_enabled",
+    ),
+    EngineSpec(
+        name="dependency_lag",
+        route_module="dependency_lag",
+        engine="shieldops.topology.dependency_lag:DependencyLagMonitor",
+        tags=("Dependency Lag",),
+        router_attr="dl_route",
+        settings_kwargs={
+            "max_records": "dependency_lag_max_records",
+            "degradation_threshold_pct": "dependency_lag_degradation_threshold_pct",
+        },
+        enabled_flag="dependency_lag_enabled",
+    ),
+    EngineSpec(
+        name="escalation_effectiveness",
+        route_module="escalation_effectiveness",
+        engine="shieldops.incidents.escalation_effectiveness:EscalationEffectivenessTracker",
+        tags=("Escalation Effectiveness",),
+        router_attr="ee_route",
+        settings_kwargs={
+            "max_records": "escalation_effectiveness_max_records",
+            "false_rate_threshold": "escalation_effectiveness_false_rate_threshold",
+        },
+        enabled_flag="escalation_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="discount_optimizer",
+        route_module="discount_optimizer",
+        engine="shieldops.billing.discount_optimizer:CloudDiscountOptimizer",
+        tags=("Discount Optimizer",),
+        router_attr="do_route",
+        settings_kwargs={
+            "max_records": "discount_optimizer_max_records",
+            "min_coverage_pct": "discount_optimizer_min_coverage_pct",
+        },
+        enabled_flag="discount_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="audit_trail_analyzer",
+        route_module="audit_trail_analyzer",
+        engine="shieldops.compliance.audit_trail_analyzer:ComplianceAuditTrailAnalyzer",
+        tags=("Audit Trail Analyzer",),
+        router_attr="ata_route",
+        settings_kwargs={
+            "max_records": "audit_trail_analyzer_max_records",
+            "min_completeness_pct": "audit_trail_analyzer_min_completeness_pct",
+        },
+        enabled_flag="audit_trail_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="velocity_throttle",
+        route_module="velocity_throttle",
+        engine="shieldops.changes.velocity_throttle:ChangeVelocityThrottle",
+        tags=("Velocity Throttle",),
+        router_attr="vt_route",
+        settings_kwargs={
+            "max_records": "velocity_throttle_max_records",
+            "max_changes_per_hour": "velocity_throttle_max_changes_per_hour",
+        },
+        enabled_flag="velocity_throttle_enabled",
+    ),
+    EngineSpec(
+        name="alert_tuning_feedback",
+        route_module="alert_tuning_feedback",
+        engine="shieldops.observability.alert_tuning_feedback:AlertTuningFeedbackLoop",
+        tags=("Alert Tuning Feedback",),
+        router_attr="atf_route",
+        settings_kwargs={
+            "max_records": "alert_tuning_feedback_max_records",
+            "precision_threshold": "alert_tuning_feedback_precision_threshold",
+        },
+        enabled_flag="alert_tuning_feedback_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_decay",
+        route_module="knowledge_decay",
+        engine="shieldops.knowledge.knowledge_decay:KnowledgeDecayDetector",
+        tags=("Knowledge Decay",),
+        router_attr="kd_route",
+        settings_kwargs={
+            "max_records": "knowledge_decay_max_records",
+            "stale_days": "knowledge_decay_stale_days",
+        },
+        enabled_flag="knowledge_decay_enabled",
+    ),
+    EngineSpec(
+        name="coverage_scorer",
+        route_module="coverage_scorer",
+        engine="shieldops.observability.coverage_scorer:ObservabilityCoverageScorer",
+        tags=("Observability Coverage",),
+        router_attr="ocs_route",
+        settings_kwargs={
+            "max_records": "coverage_scorer_max_records",
+            "min_coverage_pct": "coverage_scorer_min_coverage_pct",
+        },
+        enabled_flag="coverage_scorer_enabled",
+    ),
+    EngineSpec(
+        name="cardinality_manager",
+        route_module="cardinality_manager",
+        engine="shieldops.observability.cardinality_manager:MetricCardinalityManager",
+        tags=("Metric Cardinality",),
+        router_attr="cm_route",
+        settings_kwargs={
+            "max_records": "cardinality_manager_max_records",
+            "max_cardinality_threshold": "cardinality_manager_max_cardinality_threshold",
+        },
+        enabled_flag="cardinality_manager_enabled",
+    ),
+    EngineSpec(
+        name="log_retention_optimizer",
+        route_module="log_retention_optimizer",
+        engine="shieldops.observability.log_retention_optimizer:LogRetentionOptimizer",
+        tags=("Log Retention",),
+        router_attr="lro_route",
+        settings_kwargs={
+            "max_records": "log_retention_optimizer_max_records",
+            "default_retention_days": "log_retention_optimizer_default_retention_days",
+        },
+        enabled_flag="log_retention_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="dashboard_quality",
+        route_module="dashboard_quality",
+        engine="shieldops.observability.dashboard_quality:DashboardQualityScorer",
+        tags=("Dashboard Quality",),
+        router_attr="dq_route",
+        settings_kwargs={
+            "max_records": "dashboard_quality_max_records",
+            "min_quality_score": "dashboard_quality_min_quality_score",
+        },
+        enabled_flag="dashboard_quality_enabled",
+    ),
+    EngineSpec(
+        name="action_tracker",
+        route_module="action_tracker",
+        engine="shieldops.incidents.action_tracker:PostIncidentActionTracker",
+        tags=("Post-Incident Actions",),
+        router_attr="pia_route",
+        settings_kwargs={
+            "max_records": "action_tracker_max_records",
+            "overdue_threshold_days": "action_tracker_overdue_threshold_days",
+        },
+        enabled_flag="action_tracker_enabled",
+    ),
+    EngineSpec(
+        name="deployment_confidence",
+        route_module="deployment_confidence",
+        engine="shieldops.changes.deployment_confidence:DeploymentConfidenceScorer",
+        tags=("Deployment Confidence",),
+        router_attr="dc_route",
+        settings_kwargs={
+            "max_records": "deployment_confidence_max_records",
+            "min_confidence_score": "deployment_confidence_min_confidence_score",
+        },
+        enabled_flag="deployment_confidence_enabled",
+    ),
+    EngineSpec(
+        name="reliability_regression",
+        route_module="reliability_regression",
+        engine="shieldops.sla.reliability_regression:ReliabilityRegressionDetector",
+        tags=("Reliability Regression",),
+        router_attr="rr_route",
+        settings_kwargs={
+            "max_records": "reliability_regression_max_records",
+            "deviation_threshold_pct": "reliability_regression_deviation_threshold_pct",
+        },
+        enabled_flag="reliability_regression_enabled",
+    ),
+    EngineSpec(
+        name="permission_drift",
+        route_module="permission_drift",
+        engine="shieldops.security.permission_drift:PermissionDriftDetector",
+        tags=("Permission Drift",),
+        router_attr="pd_route",
+        settings_kwargs={
+            "max_records": "permission_drift_max_records",
+            "unused_days_threshold": "permission_drift_unused_days_threshold",
+        },
+        enabled_flag="permission_drift_enabled",
+    ),
+    EngineSpec(
+        name="flag_lifecycle",
+        route_module="flag_lifecycle",
+        engine="shieldops.config.flag_lifecycle:FeatureFlagLifecycleManager",
+        tags=("Flag Lifecycle",),
+        router_attr="fl_route",
+        settings_kwargs={
+            "max_records": "flag_lifecycle_max_records",
+            "stale_days_threshold": "flag_lifecycle_stale_days_threshold",
+        },
+        enabled_flag="flag_lifecycle_enabled",
+    ),
+    EngineSpec(
+        name="api_version_health",
+        route_module="api_version_health",
+        engine="shieldops.topology.api_version_health:APIVersionHealthMonitor",
+        tags=("API Version Health",),
+        router_attr="avh_route",
+        settings_kwargs={
+            "max_records": "api_version_health_max_records",
+            "sunset_warning_days": "api_version_health_sunset_warning_days",
+        },
+        enabled_flag="api_version_health_enabled",
+    ),
+    EngineSpec(
+        name="sre_maturity",
+        route_module="sre_maturity",
+        engine="shieldops.operations.sre_maturity:SREMaturityAssessor",
+        tags=("SRE Maturity",),
+        router_attr="sm_route",
+        settings_kwargs={
+            "max_records": "sre_maturity_max_records",
+            "target_maturity_score": "sre_maturity_target_maturity_score",
+        },
+        enabled_flag="sre_maturity_enabled",
+    ),
+    EngineSpec(
+        name="learning_tracker",
+        route_module="learning_tracker",
+        engine="shieldops.incidents.learning_tracker:IncidentLearningTracker",
+        tags=("Incident Learning",),
+        router_attr="lt_route",
+        settings_kwargs={
+            "max_records": "learning_tracker_max_records",
+            "min_adoption_rate_pct": "learning_tracker_min_adoption_rate_pct",
+        },
+        enabled_flag="learning_tracker_enabled",
+    ),
+    EngineSpec(
+        name="cache_effectiveness",
+        route_module="cache_effectiveness",
+        engine="shieldops.analytics.cache_effectiveness:CacheEffectivenessAnalyzer",
+        tags=("Cache Effectiveness",),
+        router_attr="ce_route",
+        settings_kwargs={
+            "max_records": "cache_effectiveness_max_records",
+            "min_hit_rate_pct": "cache_effectiveness_min_hit_rate_pct",
+        },
+        enabled_flag="cache_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="build_pipeline",
+        route_module="build_pipeline",
+        engine="shieldops.analytics.build_pipeline:BuildPipelineAnalyzer",
+        tags=("Build Pipeline",),
+        router_attr="bp_route",
+        settings_kwargs={
+            "max_records": "build_pipeline_max_records",
+            "min_success_rate_pct": "build_pipeline_min_success_rate_pct",
+        },
+        enabled_flag="build_pipeline_enabled",
+    ),
+    EngineSpec(
+        name="review_velocity",
+        route_module="review_velocity",
+        engine="shieldops.analytics.review_velocity:CodeReviewVelocityTracker",
+        tags=("Review Velocity",),
+        router_attr="rv_route",
+        settings_kwargs={
+            "max_records": "review_velocity_max_records",
+            "max_cycle_hours": "review_velocity_max_cycle_hours",
+        },
+        enabled_flag="review_velocity_enabled",
+    ),
+    EngineSpec(
+        name="dev_environment",
+        route_module="dev_environment",
+        engine="shieldops.operations.dev_environment:DevEnvironmentHealthMonitor",
+        tags=("Dev Environment",),
+        router_attr="deh_route",
+        settings_kwargs={
+            "max_records": "dev_environment_max_records",
+            "max_drift_days": "dev_environment_max_drift_days",
+        },
+        enabled_flag="dev_environment_enabled",
+    ),
+    EngineSpec(
+        name="traffic_pattern",
+        route_module="traffic_pattern",
+        engine="shieldops.topology.traffic_pattern:TrafficPatternAnalyzer",
+        tags=("Traffic Pattern",),
+        router_attr="tp_route",
+        settings_kwargs={
+            "max_records": "traffic_pattern_max_records",
+            "error_threshold_pct": "traffic_pattern_error_threshold_pct",
+        },
+        enabled_flag="traffic_pattern_enabled",
+    ),
+    EngineSpec(
+        name="rate_limit_policy",
+        route_module="rate_limit_policy",
+        engine="shieldops.topology.rate_limit_policy:RateLimitPolicyManager",
+        tags=("Rate Limit Policy",),
+        router_attr="rlp_route",
+        settings_kwargs={
+            "max_records": "rate_limit_policy_max_records",
+            "violation_threshold": "rate_limit_policy_violation_threshold",
+        },
+        enabled_flag="rate_limit_policy_enabled",
+    ),
+    EngineSpec(
+        name="circuit_breaker_health",
+        route_module="circuit_breaker_health",
+        engine="shieldops.topology.circuit_breaker_health:CircuitBreakerHealthMonitor",
+        tags=("Circuit Breaker Health",),
+        router_attr="cbh_route",
+        settings_kwargs={
+            "max_records": "circuit_breaker_health_max_records",
+            "max_trip_count_24h": "circuit_breaker_health_max_trip_count_24h",
+        },
+        enabled_flag="circuit_breaker_health_enabled",
+    ),
+    EngineSpec(
+        name="data_pipeline",
+        route_module="data_pipeline",
+        engine="shieldops.observability.data_pipeline:DataPipelineReliabilityMonitor",
+        tags=("Data Pipeline",),
+        router_attr="dpr_route",
+        settings_kwargs={
+            "max_records": "data_pipeline_max_records",
+            "freshness_threshold_seconds": "data_pipeline_freshness_threshold_seconds",
+        },
+        enabled_flag="data_pipeline_enabled",
+    ),
+    EngineSpec(
+        name="queue_depth_forecast",
+        route_module="queue_depth_forecast",
+        engine="shieldops.observability.queue_depth_forecast:QueueDepthForecaster",
+        tags=("Queue Depth Forecast",),
+        router_attr="qdf_route",
+        settings_kwargs={
+            "max_records": "queue_depth_forecast_max_records",
+            "overflow_threshold": "queue_depth_forecast_overflow_threshold",
+        },
+        enabled_flag="queue_depth_forecast_enabled",
+    ),
+    EngineSpec(
+        name="connection_pool",
+        route_module="connection_pool",
+        engine="shieldops.analytics.connection_pool:ConnectionPoolMonitor",
+        tags=("Connection Pool",),
+        router_attr="cpm_route",
+        settings_kwargs={
+            "max_records": "connection_pool_max_records",
+            "saturation_threshold_pct": "connection_pool_saturation_threshold_pct",
+        },
+        enabled_flag="connection_pool_enabled",
+    ),
+    EngineSpec(
+        name="license_risk",
+        route_module="license_risk",
+        engine="shieldops.compliance.license_risk:DependencyLicenseRiskAnalyzer",
+        tags=("License Risk",),
+        router_attr="lr_route",
+        settings_kwargs={
+            "max_records": "license_risk_max_records",
+            "max_transitive_depth": "license_risk_max_transitive_depth",
+        },
+        enabled_flag="license_risk_enabled",
+    ),
+    EngineSpec(
+        name="comm_effectiveness",
+        route_module="comm_effectiveness",
+        engine="shieldops.incidents.comm_effectiveness:CommEffectivenessAnalyzer",
+        tags=("Comm Effectiveness",),
+        router_attr="cef_route",
+        settings_kwargs={
+            "max_records": "comm_effectiveness_max_records",
+            "min_delivery_rate_pct": "comm_effectiveness_min_delivery_rate_pct",
+        },
+        enabled_flag="comm_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="readiness_scorer",
+        route_module="readiness_scorer",
+        engine="shieldops.operations.readiness_scorer:OperationalReadinessScorer",
+        tags=("Readiness Scorer",),
+        router_attr="ors_route",
+        settings_kwargs={
+            "max_records": "readiness_scorer_max_records",
+            "min_readiness_score": "readiness_scorer_min_readiness_score",
+        },
+        enabled_flag="readiness_scorer_enabled",
+    ),
+    EngineSpec(
+        name="auto_triage",
+        route_module="auto_triage",
+        engine="shieldops.incidents.auto_triage:IncidentAutoTriageEngine",
+        tags=("Auto Triage",),
+        router_attr="iat_route",
+        settings_kwargs={
+            "max_records": "auto_triage_max_records",
+            "min_confidence_pct": "auto_triage_min_confidence_pct",
+        },
+        enabled_flag="auto_triage_enabled",
+    ),
+    EngineSpec(
+        name="self_healing",
+        route_module="self_healing",
+        engine="shieldops.operations.self_healing:SelfHealingOrchestrator",
+        tags=("Self Healing",),
+        router_attr="slh_route",
+        settings_kwargs={
+            "max_records": "self_healing_max_records",
+            "min_success_rate_pct": "self_healing_min_success_rate_pct",
+        },
+        enabled_flag="self_healing_enabled",
+    ),
+    EngineSpec(
+        name="recurrence_pattern",
+        route_module="recurrence_pattern",
+        engine="shieldops.incidents.recurrence_pattern:RecurrencePatternDetector",
+        tags=("Recurrence Pattern",),
+        router_attr="rpa_route",
+        settings_kwargs={
+            "max_records": "recurrence_pattern_max_records",
+            "min_incidents": "recurrence_pattern_min_incidents",
+        },
+        enabled_flag="recurrence_pattern_enabled",
+    ),
+    EngineSpec(
+        name="policy_impact",
+        route_module="policy_impact",
+        engine="shieldops.compliance.policy_impact:PolicyImpactScorer",
+        tags=("Policy Impact",),
+        router_attr="pis_route",
+        settings_kwargs={
+            "max_records": "policy_impact_max_records",
+            "max_conflict_count": "policy_impact_max_conflict_count",
+        },
+        enabled_flag="policy_impact_enabled",
+    ),
+    EngineSpec(
+        name="audit_intelligence",
+        route_module="audit_intelligence",
+        engine="shieldops.audit.audit_intelligence:AuditIntelligenceAnalyzer",
+        tags=("Audit Intelligence",),
+        router_attr="ais_route",
+        settings_kwargs={
+            "max_records": "audit_intelligence_max_records",
+            "anomaly_threshold_pct": "audit_intelligence_anomaly_threshold_pct",
+        },
+        enabled_flag="audit_intelligence_enabled",
+    ),
+    EngineSpec(
+        name="automation_gap",
+        route_module="automation_gap",
+        engine="shieldops.operations.automation_gap:AutomationGapIdentifier",
+        tags=("Automation Gap",),
+        router_attr="agp_route",
+        settings_kwargs={
+            "max_records": "automation_gap_max_records",
+            "min_roi_score": "automation_gap_min_roi_score",
+        },
+        enabled_flag="automation_gap_enabled",
+    ),
+    EngineSpec(
+        name="capacity_demand",
+        route_module="capacity_demand",
+        engine="shieldops.analytics.capacity_demand:CapacityDemandModeler",
+        tags=("Capacity Demand",),
+        router_attr="cdm_route",
+        settings_kwargs={
+            "max_records": "capacity_demand_max_records",
+            "deficit_threshold_pct": "capacity_demand_deficit_threshold_pct",
+        },
+        enabled_flag="capacity_demand_enabled",
+    ),
+    EngineSpec(
+        name="spot_advisor",
+        route_module="spot_advisor",
+        engine="shieldops.billing.spot_advisor:SpotInstanceAdvisor",
+        tags=("Spot Advisor",),
+        router_attr="spa_route",
+        settings_kwargs={
+            "max_records": "spot_advisor_max_records",
+            "min_savings_pct": "spot_advisor_min_savings_pct",
+        },
+        enabled_flag="spot_advisor_enabled",
+    ),
+    EngineSpec(
+        name="scaling_efficiency",
+        route_module="scaling_efficiency",
+        engine="shieldops.operations.scaling_efficiency:ScalingEfficiencyTracker",
+        tags=("Scaling Efficiency",),
+        router_attr="sef_route",
+        settings_kwargs={
+            "max_records": "scaling_efficiency_max_records",
+            "max_duration_seconds": "scaling_efficiency_max_duration_seconds",
+        },
+        enabled_flag="scaling_efficiency_enabled",
+    ),
+    EngineSpec(
+        name="reliability_antipattern",
+        route_module="reliability_antipattern",
+        engine="shieldops.topology.reliability_antipattern:ReliabilityAntiPatternDetector",
+        tags=("Reliability Antipattern",),
+        router_attr="rap_route",
+        settings_kwargs={
+            "max_records": "reliability_antipattern_max_records",
+            "max_accepted_risks": "reliability_antipattern_max_accepted_risks",
+        },
+        enabled_flag="reliability_antipattern_enabled",
+    ),
+    EngineSpec(
+        name="error_budget_forecast",
+        route_module="error_budget_forecast",
+        engine="shieldops.sla.error_budget_forecast:ErrorBudgetForecaster",
+        tags=("Error Budget Forecast",),
+        router_attr="ebf_route",
+        settings_kwargs={
+            "max_records": "error_budget_forecast_max_records",
+            "risk_threshold_pct": "error_budget_forecast_risk_threshold_pct",
+        },
+        enabled_flag="error_budget_forecast_enabled",
+    ),
+    EngineSpec(
+        name="dependency_risk",
+        route_module="dependency_risk",
+        engine="shieldops.topology.dependency_risk:DependencyRiskScorer",
+        tags=("Dependency Risk",),
+        router_attr="drs_route",
+        settings_kwargs={
+            "max_records": "dependency_risk_max_records",
+            "critical_threshold": "dependency_risk_critical_threshold",
+        },
+        enabled_flag="dependency_risk_enabled",
+    ),
+    EngineSpec(
+        name="incident_similarity",
+        route_module="incident_similarity",
+        engine="shieldops.incidents.incident_similarity:IncidentSimilarityEngine",
+        tags=("Incident Similarity",),
+        router_attr="ism_route",
+        settings_kwargs={
+            "max_records": "incident_similarity_max_records",
+            "min_confidence_pct": "incident_similarity_min_confidence_pct",
+        },
+        enabled_flag="incident_similarity_enabled",
+    ),
+    EngineSpec(
+        name="incident_cost",
+        route_module="incident_cost",
+        engine="shieldops.incidents.incident_cost:IncidentCostCalculator",
+        tags=("Incident Cost",),
+        router_attr="icl_route",
+        settings_kwargs={
+            "max_records": "incident_cost_max_records",
+            "high_threshold": "incident_cost_high_threshold",
+        },
+        enabled_flag="incident_cost_enabled",
+    ),
+    EngineSpec(
+        name="followup_tracker",
+        route_module="followup_tracker",
+        engine="shieldops.incidents.followup_tracker:PostIncidentFollowupTracker",
+        tags=("Follow-up Tracker",),
+        router_attr="fut_route",
+        settings_kwargs={
+            "max_records": "followup_tracker_max_records",
+            "overdue_days": "followup_tracker_overdue_days",
+        },
+        enabled_flag="followup_tracker_enabled",
+    ),
+    EngineSpec(
+        name="cognitive_load",
+        route_module="cognitive_load",
+        engine="shieldops.operations.cognitive_load:TeamCognitiveLoadTracker",
+        tags=("Cognitive Load",),
+        router_attr="clt_route",
+        settings_kwargs={
+            "max_records": "cognitive_load_max_records",
+            "critical_threshold": "cognitive_load_critical_threshold",
+        },
+        enabled_flag="cognitive_load_enabled",
+    ),
+    EngineSpec(
+        name="collaboration_scorer",
+        route_module="collaboration_scorer",
+        engine="shieldops.analytics.collaboration_scorer:CrossTeamCollaborationScorer",
+        tags=("Collaboration Scorer",),
+        router_attr="css_route",
+        settings_kwargs={
+            "max_records": "collaboration_scorer_max_records",
+            "min_score": "collaboration_scorer_min_score",
+        },
+        enabled_flag="collaboration_scorer_enabled",
+    ),
+    EngineSpec(
+        name="contribution_tracker",
+        route_module="contribution_tracker",
+        engine="shieldops.knowledge.contribution_tracker:KnowledgeContributionTracker",
+        tags=("Contribution Tracker",),
+        router_attr="kct_route",
+        settings_kwargs={
+            "max_records": "contribution_tracker_max_records",
+            "min_quality_score": "contribution_tracker_min_quality_score",
+        },
+        enabled_flag="contribution_tracker_enabled",
+    ),
+    EngineSpec(
+        name="api_performance",
+        route_module="api_performance",
+        engine="shieldops.analytics.api_performance:APIPerformanceProfiler",
+        tags=("API Performance",),
+        router_attr="apf_route",
+        settings_kwargs={
+            "max_records": "api_performance_max_records",
+            "slow_threshold_ms": "api_performance_slow_threshold_ms",
+        },
+        enabled_flag="api_performance_enabled",
+    ),
+    EngineSpec(
+        name="resource_contention",
+        route_module="resource_contention",
+        engine="shieldops.analytics.resource_contention:ResourceContentionDetector",
+        tags=("Resource Contention",),
+        router_attr="rcd_route",
+        settings_kwargs={
+            "max_records": "resource_contention_max_records",
+            "critical_threshold_pct": "resource_contention_critical_threshold_pct",
+        },
+        enabled_flag="resource_contention_enabled",
+    ),
+    EngineSpec(
+        name="rollback_analyzer",
+        route_module="rollback_analyzer",
+        engine="shieldops.changes.rollback_analyzer:DeploymentRollbackAnalyzer",
+        tags=("Rollback Analyzer",),
+        router_attr="rba_route",
+        settings_kwargs={
+            "max_records": "rollback_analyzer_max_records",
+            "max_rate_pct": "rollback_analyzer_max_rate_pct",
+        },
+        enabled_flag="rollback_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="attack_surface_monitor",
+        route_module="attack_surface_monitor",
+        engine="shieldops.security.attack_surface:AttackSurfaceMonitor",
+        tags=("Attack Surface Monitor",),
+        router_attr="asm_route",
+        settings_kwargs={
+            "max_records": "attack_surface_max_records",
+            "max_critical_exposures": "attack_surface_max_critical_exposures",
+        },
+        enabled_flag="attack_surface_enabled",
+    ),
+    EngineSpec(
+        name="runbook_recommendation",
+        route_module="runbook_recommender",
+        engine="shieldops.operations.runbook_recommender:RunbookRecommendationEngine",
+        tags=("Runbook Recommender",),
+        router_attr="rbr_route",
+        settings_kwargs={
+            "max_records": "runbook_recommendation_max_records",
+            "min_confidence_pct": "runbook_recommendation_min_confidence_pct",
+        },
+        enabled_flag="runbook_recommendation_enabled",
+    ),
+    EngineSpec(
+        name="reliability_scorecard",
+        route_module="reliability_scorecard",
+        engine="shieldops.sla.reliability_scorecard:PlatformReliabilityScorecard",
+        tags=("Reliability Scorecard",),
+        router_attr="prs_route",
+        settings_kwargs={
+            "max_records": "reliability_scorecard_max_records",
+            "min_grade_score": "reliability_scorecard_min_grade_score",
+        },
+        enabled_flag="reliability_scorecard_enabled",
+    ),
+    EngineSpec(
+        name="llm_cost_tracker",
+        route_module="llm_cost_tracker",
+        engine="shieldops.billing.llm_cost_tracker:LLMTokenCostTracker",
+        tags=("LLM Cost Tracker",),
+        router_attr="lct_route",
+        settings_kwargs={
+            "max_records": "llm_cost_tracker_max_records",
+            "high_cost_threshold": "llm_cost_tracker_high_cost_threshold",
+        },
+        enabled_flag="llm_cost_tracker_enabled",
+    ),
+    EngineSpec(
+        name="cloud_arbitrage",
+        route_module="cloud_arbitrage",
+        engine="shieldops.billing.cloud_arbitrage:CloudCostArbitrageAnalyzer",
+        tags=("Cloud Arbitrage",),
+        router_attr="car_route",
+        settings_kwargs={
+            "max_records": "cloud_arbitrage_max_records",
+            "min_savings_pct": "cloud_arbitrage_min_savings_pct",
+        },
+        enabled_flag="cloud_arbitrage_enabled",
+    ),
+    EngineSpec(
+        name="observability_cost",
+        route_module="observability_cost",
+        engine="shieldops.observability.observability_cost:ObservabilityCostAllocator",
+        tags=("Observability Cost",),
+        router_attr="oca_route",
+        settings_kwargs={
+            "max_records": "observability_cost_max_records",
+            "high_cost_threshold": "observability_cost_high_cost_threshold",
+        },
+        enabled_flag="observability_cost_enabled",
+    ),
+    EngineSpec(
+        name="lead_time_analyzer",
+        route_module="lead_time_analyzer",
+        engine="shieldops.changes.lead_time_analyzer:ChangeLeadTimeAnalyzer",
+        tags=("Lead Time Analyzer",),
+        router_attr="lta_route",
+        settings_kwargs={
+            "max_records": "lead_time_analyzer_max_records",
+            "max_lead_time_hours": "lead_time_analyzer_max_lead_time_hours",
+        },
+        enabled_flag="lead_time_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="flag_impact",
+        route_module="flag_impact",
+        engine="shieldops.config.flag_impact:FeatureFlagImpactAnalyzer",
+        tags=("Flag Impact",),
+        router_attr="fia_route",
+        settings_kwargs={
+            "max_records": "flag_impact_max_records",
+            "min_reliability_pct": "flag_impact_min_reliability_pct",
+        },
+        enabled_flag="flag_impact_enabled",
+    ),
+    EngineSpec(
+        name="deployment_dependency",
+        route_module="deployment_dependency",
+        engine="shieldops.changes.deployment_dependency:DeploymentDependencyTracker",
+        tags=("Deployment Dependency",),
+        router_attr="ddy_route",
+        settings_kwargs={
+            "max_records": "deployment_dependency_max_records",
+            "max_depth": "deployment_dependency_max_depth",
+        },
+        enabled_flag="deployment_dependency_enabled",
+    ),
+    EngineSpec(
+        name="postmortem_quality",
+        route_module="postmortem_quality",
+        engine="shieldops.incidents.postmortem_quality:PostmortemQualityScorer",
+        tags=("Postmortem Quality",),
+        router_attr="pmq_route",
+        settings_kwargs={
+            "max_records": "postmortem_quality_max_records",
+            "min_score": "postmortem_quality_min_score",
+        },
+        enabled_flag="postmortem_quality_enabled",
+    ),
+    EngineSpec(
+        name="dr_drill_tracker",
+        route_module="dr_drill_tracker",
+        engine="shieldops.operations.dr_drill_tracker:DRDrillTracker",
+        tags=("DR Drill Tracker",),
+        router_attr="drt_route",
+        settings_kwargs={
+            "max_records": "dr_drill_tracker_max_records",
+            "min_success_rate_pct": "dr_drill_tracker_min_success_rate_pct",
+        },
+        enabled_flag="dr_drill_tracker_enabled",
+    ),
+    EngineSpec(
+        name="escalation_optimizer",
+        route_module="escalation_optimizer",
+        engine="shieldops.incidents.escalation_optimizer:IncidentEscalationOptimizer",
+        tags=("Escalation Optimizer",),
+        router_attr="epo_route",
+        settings_kwargs={
+            "max_records": "escalation_optimizer_max_records",
+            "max_escalation_time_min": "escalation_optimizer_max_escalation_time_min",
+        },
+        enabled_flag="escalation_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="tenant_quota",
+        route_module="tenant_quota",
+        engine="shieldops.operations.tenant_quota:TenantResourceQuotaManager",
+        tags=("Tenant Quota",),
+        router_attr="tqm_route",
+        settings_kwargs={
+            "max_records": "tenant_quota_max_records",
+            "max_utilization_pct": "tenant_quota_max_utilization_pct",
+        },
+        enabled_flag="tenant_quota_enabled",
+    ),
+    EngineSpec(
+        name="decision_audit",
+        route_module="decision_audit",
+        engine="shieldops.audit.decision_audit:DecisionAuditLogger",
+        tags=("Decision Audit",),
+        router_attr="dal_route",
+        settings_kwargs={
+            "max_records": "decision_audit_max_records",
+            "min_confidence_pct": "decision_audit_min_confidence_pct",
+        },
+        enabled_flag="decision_audit_enabled",
+    ),
+    EngineSpec(
+        name="retention_policy",
+        route_module="retention_policy",
+        engine="shieldops.observability.retention_policy:DataRetentionPolicyManager",
+        tags=("Retention Policy",),
+        router_attr="rpm_route",
+        settings_kwargs={
+            "max_records": "retention_policy_max_records",
+            "max_retention_days": "retention_policy_max_retention_days",
+        },
+        enabled_flag="retention_policy_enabled",
+    ),
+    EngineSpec(
+        name="twilio_sms",
+        route_module="twilio_sms",
+        engine="shieldops.integrations.notifications.twilio_sms:TwilioSMSGateway",
+        tags=("Twilio SMS",),
+        router_attr="tsg_route",
+        settings_kwargs={
+            "max_records": "twilio_sms_max_records",
+            "max_retries": "twilio_sms_max_retries",
+        },
+        enabled_flag="twilio_sms_enabled",
+    ),
+    EngineSpec(
+        name="twilio_voice",
+        route_module="twilio_voice",
+        engine="shieldops.integrations.notifications.twilio_voice:TwilioVoiceAlertSystem",
+        tags=("Twilio Voice",),
+        router_attr="tva_route",
+        settings_kwargs={
+            "max_records": "twilio_voice_max_records",
+            "max_ring_seconds": "twilio_voice_max_ring_seconds",
+        },
+        enabled_flag="twilio_voice_enabled",
+    ),
+    EngineSpec(
+        name="teams_notifier",
+        route_module="teams_notifier",
+        engine="shieldops.integrations.notifications.teams:MicrosoftTeamsNotifier",
+        tags=("Teams Notifier",),
+        router_attr="mtn_route",
+        settings_kwargs={
+            "max_records": "teams_notifier_max_records",
+            "max_retries": "teams_notifier_max_retries",
+        },
+        enabled_flag="teams_notifier_enabled",
+    ),
+    EngineSpec(
+        name="swarm_coordinator",
+        route_module="swarm_coordinator",
+        engine="shieldops.agents.swarm_coordinator:AgentSwarmCoordinator",
+        tags=("Swarm Coordinator",),
+        router_attr="swc_route",
+        settings_kwargs={
+            "max_records": "swarm_coordinator_max_records",
+            "max_agents": "swarm_coordinator_max_agents",
+        },
+        enabled_flag="swarm_coordinator_enabled",
+    ),
+    EngineSpec(
+        name="consensus_engine",
+        route_module="consensus_engine",
+        engine="shieldops.agents.consensus_engine:AgentConsensusEngine",
+        tags=("Consensus Engine",),
+        router_attr="ace_route",
+        settings_kwargs={
+            "max_records": "consensus_engine_max_records",
+            "quorum_pct": "consensus_engine_quorum_pct",
+        },
+        enabled_flag="consensus_engine_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_mesh",
+        route_module="knowledge_mesh",
+        engine="shieldops.agents.knowledge_mesh:AgentKnowledgeMesh",
+        tags=("Knowledge Mesh",),
+        router_attr="akm_route",
+        settings_kwargs={
+            "max_records": "knowledge_mesh_max_records",
+            "ttl_seconds": "knowledge_mesh_ttl_seconds",
+        },
+        enabled_flag="knowledge_mesh_enabled",
+    ),
+    EngineSpec(
+        name="risk_aggregator",
+        route_module="risk_aggregator",
+        engine="shieldops.security.risk_aggregator:RiskSignalAggregator",
+        tags=("Risk Aggregator",),
+        router_attr="rsa_route",
+        settings_kwargs={
+            "max_records": "risk_aggregator_max_records",
+            "critical_threshold": "risk_aggregator_critical_threshold",
+        },
+        enabled_flag="risk_aggregator_enabled",
+    ),
+    EngineSpec(
+        name="dynamic_risk_scorer",
+        route_module="dynamic_risk_scorer",
+        engine="shieldops.analytics.dynamic_risk_scorer:DynamicRiskScorer",
+        tags=("Dynamic Risk Scorer",),
+        router_attr="drs_route",
+        settings_kwargs={
+            "max_records": "dynamic_risk_scorer_max_records",
+            "high_threshold": "dynamic_risk_scorer_high_threshold",
+        },
+        enabled_flag="dynamic_risk_scorer_enabled",
+    ),
+    EngineSpec(
+        name="predictive_alert",
+        route_module="predictive_alert",
+        engine="shieldops.observability.predictive_alert:PredictiveAlertEngine",
+        tags=("Predictive Alert",),
+        router_attr="pae_route",
+        settings_kwargs={
+            "max_records": "predictive_alert_max_records",
+            "min_confidence_pct": "predictive_alert_min_confidence_pct",
+        },
+        enabled_flag="predictive_alert_enabled",
+    ),
+    EngineSpec(
+        name="token_optimizer",
+        route_module="token_optimizer",
+        engine="shieldops.agents.token_optimizer:AgentTokenOptimizer",
+        tags=("Token Optimizer",),
+        router_attr="ato_route",
+        settings_kwargs={
+            "max_records": "token_optimizer_max_records",
+            "target_savings_pct": "token_optimizer_target_savings_pct",
+        },
+        enabled_flag="token_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="prompt_cache",
+        route_module="prompt_cache",
+        engine="shieldops.agents.prompt_cache:PromptCacheManager",
+        tags=("Prompt Cache",),
+        router_attr="pcm_route",
+        settings_kwargs={
+            "max_records": "prompt_cache_max_records",
+            "ttl_seconds": "prompt_cache_ttl_seconds",
+        },
+        enabled_flag="prompt_cache_enabled",
+    ),
+    EngineSpec(
+        name="routing_optimizer",
+        route_module="routing_optimizer",
+        engine="shieldops.agents.routing_optimizer:AgentRoutingOptimizer",
+        tags=("Routing Optimizer",),
+        router_attr="aro_route",
+        settings_kwargs={
+            "max_records": "routing_optimizer_max_records",
+            "cost_limit": "routing_optimizer_cost_limit",
+        },
+        enabled_flag="routing_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="threat_hunt",
+        route_module="threat_hunt",
+        engine="shieldops.security.threat_hunt:ThreatHuntOrchestrator",
+        tags=("Threat Hunt",),
+        router_attr="tho_route",
+        settings_kwargs={
+            "max_records": "threat_hunt_max_records",
+            "min_detection_rate_pct": "threat_hunt_min_detection_rate_pct",
+        },
+        enabled_flag="threat_hunt_enabled",
+    ),
+    EngineSpec(
+        name="response_automator",
+        route_module="response_automator",
+        engine="shieldops.security.response_automator:SecurityResponseAutomator",
+        tags=("Response Automator",),
+        router_attr="sra_route",
+        settings_kwargs={
+            "max_records": "response_automator_max_records",
+            "min_success_rate_pct": "response_automator_min_success_rate_pct",
+        },
+        enabled_flag="response_automator_enabled",
+    ),
+    EngineSpec(
+        name="zero_trust",
+        route_module="zero_trust_verifier",
+        engine="shieldops.security.zero_trust_verifier:ZeroTrustVerifier",
+        tags=("Zero Trust",),
+        router_attr="ztv_route",
+        settings_kwargs={
+            "max_records": "zero_trust_max_records",
+            "min_trust_score": "zero_trust_min_trust_score",
+        },
+        enabled_flag="zero_trust_enabled",
+    ),
+    EngineSpec(
+        name="remediation_pipeline",
+        route_module="remediation_pipeline",
+        engine="shieldops.operations.remediation_pipeline:RemediationPipelineOrchestrator",
+        tags=("Remediation Pipeline",),
+        router_attr="rpo_route",
+        settings_kwargs={
+            "max_records": "remediation_pipeline_max_records",
+            "max_step_count": "remediation_pipeline_max_step_count",
+        },
+        enabled_flag="remediation_pipeline_enabled",
+    ),
+    EngineSpec(
+        name="recovery_coordinator",
+        route_module="recovery_coordinator",
+        engine="shieldops.operations.recovery_coordinator:RecoveryCoordinator",
+        tags=("Recovery Coordinator",),
+        router_attr="rcc_route",
+        settings_kwargs={
+            "max_records": "recovery_coordinator_max_records",
+            "max_recovery_hours": "recovery_coordinator_max_recovery_hours",
+        },
+        enabled_flag="recovery_coordinator_enabled",
+    ),
+    EngineSpec(
+        name="runbook_chainer",
+        route_module="runbook_chainer",
+        engine="shieldops.operations.runbook_chainer:RunbookChainExecutor",
+        tags=("Runbook Chainer",),
+        router_attr="rce_route",
+        settings_kwargs={
+            "max_records": "runbook_chainer_max_records",
+            "max_chain_length": "runbook_chainer_max_chain_length",
+        },
+        enabled_flag="runbook_chainer_enabled",
+    ),
+    EngineSpec(
+        name="slo_auto_scaler",
+        route_module="slo_auto_scaler",
+        engine="shieldops.sla.slo_auto_scaler:SLOAutoScaler",
+        tags=("SLO Auto-Scaler",),
+        router_attr="sas_route",
+        settings_kwargs={
+            "max_records": "slo_auto_scaler_max_records",
+            "max_replica_delta": "slo_auto_scaler_max_replica_delta",
+        },
+        enabled_flag="slo_auto_scaler_enabled",
+    ),
+    EngineSpec(
+        name="reliability_automator",
+        route_module="reliability_automator",
+        engine="shieldops.sla.reliability_automator:ReliabilityAutomationEngine",
+        tags=("Reliability Automator",),
+        router_attr="rae_route",
+        settings_kwargs={
+            "max_records": "reliability_automator_max_records",
+            "min_impact_score": "reliability_automator_min_impact_score",
+        },
+        enabled_flag="reliability_automator_enabled",
+    ),
+    EngineSpec(
+        name="prevention_engine",
+        route_module="prevention_engine",
+        engine="shieldops.incidents.prevention_engine:IncidentPreventionEngine",
+        tags=("Prevention Engine",),
+        router_attr="ipe_route",
+        settings_kwargs={
+            "max_records": "prevention_engine_max_records",
+            "min_confidence_pct": "prevention_engine_min_confidence_pct",
+        },
+        enabled_flag="prevention_engine_enabled",
+    ),
+    EngineSpec(
+        name="cross_agent_enforcer",
+        route_module="cross_agent_enforcer",
+        engine="shieldops.policy.cross_agent_enforcer:CrossAgentPolicyEnforcer",
+        tags=("Cross-Agent Enforcer",),
+        router_attr="cap_route",
+        settings_kwargs={
+            "max_records": "cross_agent_enforcer_max_records",
+            "max_violations_per_agent": "cross_agent_enforcer_max_violations",
+        },
+        enabled_flag="cross_agent_enforcer_enabled",
+    ),
+    EngineSpec(
+        name="telemetry_analyzer",
+        route_module="telemetry_analyzer",
+        engine="shieldops.agents.telemetry_analyzer:AgentTelemetryAnalyzer",
+        tags=("Telemetry Analyzer",),
+        router_attr="ata_route",
+        settings_kwargs={
+            "max_records": "telemetry_analyzer_max_records",
+            "min_performance_pct": "telemetry_analyzer_min_performance_pct",
+        },
+        enabled_flag="telemetry_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="compliance_auditor",
+        route_module="compliance_auditor",
+        engine="shieldops.agents.compliance_auditor:AgentComplianceAuditor",
+        tags=("Compliance Auditor",),
+        router_attr="aca_route",
+        settings_kwargs={
+            "max_records": "compliance_auditor_max_records",
+            "min_pass_rate_pct": "compliance_auditor_min_pass_rate_pct",
+        },
+        enabled_flag="compliance_auditor_enabled",
+    ),
+    EngineSpec(
+        name="war_room_orchestrator",
+        route_module="war_room_orchestrator",
+        engine="shieldops.incidents.war_room_orchestrator:IncidentWarRoomOrchestrator",
+        tags=("War Room",),
+        router_attr="wro_route",
+        settings_kwargs={
+            "max_records": "war_room_orchestrator_max_records",
+            "min_resolution_rate_pct": "war_room_orchestrator_min_resolution_rate_pct",
+        },
+        enabled_flag="war_room_orchestrator_enabled",
+    ),
+    EngineSpec(
+        name="root_cause_verifier",
+        route_module="root_cause_verifier",
+        engine="shieldops.incidents.root_cause_verifier:RootCauseVerificationEngine",
+        tags=("Root Cause Verifier",),
+        router_attr="rcv_route",
+        settings_kwargs={
+            "max_records": "root_cause_verifier_max_records",
+            "min_confidence_pct": "root_cause_verifier_min_confidence_pct",
+        },
+        enabled_flag="root_cause_verifier_enabled",
+    ),
+    EngineSpec(
+        name="comm_automator",
+        route_module="comm_automator",
+        engine="shieldops.incidents.comm_automator:IncidentCommunicationAutomator",
+        tags=("Comm Automator",),
+        router_attr="ica_route",
+        settings_kwargs={
+            "max_records": "comm_automator_max_records",
+            "min_delivery_rate_pct": "comm_automator_min_delivery_rate_pct",
+        },
+        enabled_flag="comm_automator_enabled",
+    ),
+    EngineSpec(
+        name="posture_simulator",
+        route_module="posture_simulator",
+        engine="shieldops.security.posture_simulator:SecurityPostureSimulator",
+        tags=("Posture Simulator",),
+        router_attr="sps_route",
+        settings_kwargs={
+            "max_records": "posture_simulator_max_records",
+            "min_blocked_rate_pct": "posture_simulator_min_blocked_rate_pct",
+        },
+        enabled_flag="posture_simulator_enabled",
+    ),
+    EngineSpec(
+        name="credential_rotator",
+        route_module="credential_rotator",
+        engine="shieldops.security.credential_rotator:CredentialRotationOrchestrator",
+        tags=("Credential Rotator",),
+        router_attr="cro_route",
+        settings_kwargs={
+            "max_records": "credential_rotator_max_records",
+            "min_completion_rate_pct": "credential_rotator_min_completion_rate_pct",
+        },
+        enabled_flag="credential_rotator_enabled",
+    ),
+    EngineSpec(
+        name="evidence_automator",
+        route_module="evidence_automator",
+        engine="shieldops.compliance.evidence_automator:ComplianceEvidenceAutomator",
+        tags=("Evidence Automator",),
+        router_attr="cea_route",
+        settings_kwargs={
+            "max_records": "evidence_automator_max_records",
+            "min_freshness_pct": "evidence_automator_min_freshness_pct",
+        },
+        enabled_flag="evidence_automator_enabled",
+    ),
+    EngineSpec(
+        name="chaos_automator",
+        route_module="chaos_automator",
+        engine="shieldops.observability.chaos_automator:ChaosExperimentAutomator",
+        tags=("Chaos Automator",),
+        router_attr="cxa_route",
+        settings_kwargs={
+            "max_records": "chaos_automator_max_records",
+            "min_pass_rate_pct": "chaos_automator_min_pass_rate_pct",
+        },
+        enabled_flag="chaos_automator_enabled",
+    ),
+    EngineSpec(
+        name="failover_coordinator",
+        route_module="failover_coordinator",
+        engine="shieldops.operations.failover_coordinator:MultiRegionFailoverCoordinator",
+        tags=("Failover Coordinator",),
+        router_attr="mfc_route",
+        settings_kwargs={
+            "max_records": "failover_coordinator_max_records",
+            "max_rto_seconds": "failover_coordinator_max_rto_seconds",
+        },
+        enabled_flag="failover_coordinator_enabled",
+    ),
+    EngineSpec(
+        name="burst_manager",
+        route_module="burst_manager",
+        engine="shieldops.operations.burst_manager:CapacityBurstManager",
+        tags=("Burst Manager",),
+        router_attr="cbm_route",
+        settings_kwargs={
+            "max_records": "burst_manager_max_records",
+            "max_burst_budget": "burst_manager_max_burst_budget",
+        },
+        enabled_flag="burst_manager_enabled",
+    ),
+    EngineSpec(
+        name="platform_cost",
+        route_module="platform_cost_optimizer",
+        engine="shieldops.billing.platform_cost_optimizer:PlatformCostOptimizer",
+        tags=("Platform Cost",),
+        router_attr="pco_route",
+        settings_kwargs={
+            "max_records": "platform_cost_max_records",
+            "min_savings_threshold": "platform_cost_min_savings_threshold",
+        },
+        enabled_flag="platform_cost_enabled",
+    ),
+    EngineSpec(
+        name="service_mesh_intel",
+        route_module="service_mesh_intel",
+        engine="shieldops.topology.service_mesh_intel:ServiceMeshIntelligence",
+        tags=("Service Mesh",),
+        router_attr="smi_route",
+        settings_kwargs={
+            "max_records": "service_mesh_intel_max_records",
+            "max_latency_ms": "service_mesh_intel_max_latency_ms",
+        },
+        enabled_flag="service_mesh_intel_enabled",
+    ),
+    EngineSpec(
+        name="runbook_generator",
+        route_module="runbook_generator",
+        engine="shieldops.operations.runbook_generator:OperationalRunbookGenerator",
+        tags=("Runbook Generator",),
+        router_attr="org_route",
+        settings_kwargs={
+            "max_records": "runbook_generator_max_records",
+            "min_accuracy_pct": "runbook_generator_min_accuracy_pct",
+        },
+        enabled_flag="runbook_generator_enabled",
+    ),
+    EngineSpec(
+        name="breach_predictor",
+        route_module="breach_predictor",
+        engine="shieldops.sla.breach_predictor:SLABreachPredictor",
+        tags=("SLA Breach Predictor",),
+        router_attr="sbp_route",
+        settings_kwargs={
+            "max_records": "breach_predictor_max_records",
+            "min_confidence_pct": "breach_predictor_min_confidence_pct",
+        },
+        enabled_flag="breach_predictor_enabled",
+    ),
+    EngineSpec(
+        name="error_budget_allocator",
+        route_module="error_budget_allocator",
+        engine="shieldops.sla.error_budget_allocator:ErrorBudgetAllocator",
+        tags=("Error Budget Allocator",),
+        router_attr="eba_route",
+        settings_kwargs={
+            "max_records": "error_budget_allocator_max_records",
+            "min_healthy_rate_pct": "error_budget_allocator_min_healthy_rate_pct",
+        },
+        enabled_flag="error_budget_allocator_enabled",
+    ),
+    EngineSpec(
+        name="dependency_topology",
+        route_module="dependency_topology",
+        engine="shieldops.topology.dependency_topology:DependencyTopologyAnalyzer",
+        tags=("Dependency Topology Analyzer",),
+        router_attr="dta_route",
+        settings_kwargs={
+            "max_records": "dependency_topology_max_records",
+            "max_coupling_depth": "dependency_topology_max_coupling_depth",
+        },
+        enabled_flag="dependency_topology_enabled",
+    ),
+    EngineSpec(
+        name="infra_capacity_planner",
+        route_module="infra_capacity_planner",
+        engine="shieldops.analytics.infra_capacity_planner:InfraCapacityPlanner",
+        tags=("Infra Capacity Planner",),
+        router_attr="icp_route",
+        settings_kwargs={
+            "max_records": "infra_capacity_planner_max_records",
+            "target_utilization_pct": "infra_capacity_planner_target_utilization_pct",
+        },
+        enabled_flag="infra_capacity_planner_enabled",
+    ),
+    EngineSpec(
+        name="dns_health_monitor",
+        route_module="dns_health_monitor",
+        engine="shieldops.observability.dns_health_monitor:DNSHealthMonitor",
+        tags=("DNS Health Monitor",),
+        router_attr="dhm_route",
+        settings_kwargs={
+            "max_records": "dns_health_monitor_max_records",
+            "max_resolution_ms": "dns_health_monitor_max_resolution_ms",
+        },
+        enabled_flag="dns_health_monitor_enabled",
+    ),
+    EngineSpec(
+        name="drift_analyzer",
+        route_module="drift_analyzer",
+        engine="shieldops.config.drift_analyzer:ConfigDriftAnalyzer",
+        tags=("Config Drift Analyzer",),
+        router_attr="cda_route",
+        settings_kwargs={
+            "max_records": "drift_analyzer_max_records",
+            "max_deviation_pct": "drift_analyzer_max_deviation_pct",
+        },
+        enabled_flag="drift_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="timeline_correlator",
+        route_module="timeline_correlator",
+        engine="shieldops.incidents.timeline_correlator:IncidentTimelineCorrelator",
+        tags=("Incident Timeline Correlator",),
+        router_attr="itc_route",
+        settings_kwargs={
+            "max_records": "timeline_correlator_max_records",
+            "min_confidence_pct": "timeline_correlator_min_confidence_pct",
+        },
+        enabled_flag="timeline_correlator_enabled",
+    ),
+    EngineSpec(
+        name="deployment_impact",
+        route_module="deployment_impact",
+        engine="shieldops.changes.deployment_impact:DeploymentImpactAnalyzer",
+        tags=("Deployment Impact Analyzer",),
+        router_attr="dia_route",
+        settings_kwargs={
+            "max_records": "deployment_impact_max_records",
+            "max_impact_score": "deployment_impact_max_impact_score",
+        },
+        enabled_flag="deployment_impact_enabled",
+    ),
+    EngineSpec(
+        name="alert_routing_optimizer",
+        route_module="alert_routing_optimizer",
+        engine="shieldops.observability.alert_routing_optimizer:AlertRoutingOptimizer",
+        tags=("Alert Routing Optimizer",),
+        router_attr="aop_route",
+        settings_kwargs={
+            "max_records": "alert_routing_optimizer_max_records",
+            "max_response_seconds": "alert_routing_optimizer_max_response_seconds",
+        },
+        enabled_flag="alert_routing_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="compliance_posture",
+        route_module="compliance_posture",
+        engine="shieldops.compliance.posture_scorer:CompliancePostureScorer",
+        tags=("Compliance Posture Scorer",),
+        router_attr="cps_route",
+        settings_kwargs={
+            "max_records": "compliance_posture_max_records",
+            "min_score_pct": "compliance_posture_min_score_pct",
+        },
+        enabled_flag="compliance_posture_enabled",
+    ),
+    EngineSpec(
+        name="toil_quantifier",
+        route_module="toil_quantifier",
+        engine="shieldops.operations.toil_quantifier:TeamToilQuantifier",
+        tags=("Team Toil Quantifier",),
+        router_attr="ttq_route",
+        settings_kwargs={
+            "max_records": "toil_quantifier_max_records",
+            "max_toil_hours_weekly": "toil_quantifier_max_toil_hours_weekly",
+        },
+        enabled_flag="toil_quantifier_enabled",
+    ),
+    EngineSpec(
+        name="governance_dashboard",
+        route_module="governance_dashboard",
+        engine="shieldops.policy.governance_dashboard:PlatformGovernanceDashboard",
+        tags=("Platform Governance Dashboard",),
+        router_attr="pgd_route",
+        settings_kwargs={
+            "max_records": "governance_dashboard_max_records",
+            "min_governance_score_pct": "governance_dashboard_min_governance_score_pct",
+        },
+        enabled_flag="governance_dashboard_enabled",
+    ),
+    EngineSpec(
+        name="incident_replay",
+        route_module="incident_replay",
+        engine="shieldops.incidents.incident_replay:IncidentReplayEngine",
+        tags=("Incident Replay Engine",),
+        router_attr="ire_route",
+        settings_kwargs={
+            "max_records": "incident_replay_max_records",
+            "min_effectiveness_pct": "incident_replay_min_effectiveness_pct",
+        },
+        enabled_flag="incident_replay_enabled",
+    ),
+    EngineSpec(
+        name="response_timer",
+        route_module="response_timer",
+        engine="shieldops.incidents.response_timer:IncidentResponseTimer",
+        tags=("Incident Response Timer",),
+        router_attr="irt_route",
+        settings_kwargs={
+            "max_records": "response_timer_max_records",
+            "target_minutes": "response_timer_target_minutes",
+        },
+        enabled_flag="response_timer_enabled",
+    ),
+    EngineSpec(
+        name="slo_aggregator",
+        route_module="slo_aggregator",
+        engine="shieldops.sla.slo_aggregator:SLOAggregationDashboard",
+        tags=("SLO Aggregation Dashboard",),
+        router_attr="sad_route",
+        settings_kwargs={
+            "max_records": "slo_aggregator_max_records",
+            "min_compliance_pct": "slo_aggregator_min_compliance_pct",
+        },
+        enabled_flag="slo_aggregator_enabled",
+    ),
+    EngineSpec(
+        name="network_latency",
+        route_module="network_latency",
+        engine="shieldops.topology.network_latency:NetworkLatencyMapper",
+        tags=("Network Latency Mapper",),
+        router_attr="nlm_route",
+        settings_kwargs={
+            "max_records": "network_latency_max_records",
+            "max_acceptable_ms": "network_latency_max_acceptable_ms",
+        },
+        enabled_flag="network_latency_enabled",
+    ),
+    EngineSpec(
+        name="health_index",
+        route_module="health_index",
+        engine="shieldops.observability.health_index:PlatformHealthIndex",
+        tags=("Platform Health Index",),
+        router_attr="phi_route",
+        settings_kwargs={
+            "max_records": "health_index_max_records",
+            "min_score_pct": "health_index_min_score_pct",
+        },
+        enabled_flag="health_index_enabled",
+    ),
+    EngineSpec(
+        name="observability_gap",
+        route_module="observability_gap",
+        engine="shieldops.observability.observability_gap:ObservabilityGapDetector",
+        tags=("Observability Gap Detector",),
+        router_attr="ogd_route",
+        settings_kwargs={
+            "max_records": "observability_gap_max_records",
+            "min_coverage_pct": "observability_gap_min_coverage_pct",
+        },
+        enabled_flag="observability_gap_enabled",
+    ),
+    EngineSpec(
+        name="capacity_anomaly",
+        route_module="capacity_anomaly",
+        engine="shieldops.analytics.capacity_anomaly:CapacityAnomalyDetector",
+        tags=("Capacity Anomaly Detector",),
+        router_attr="cad_route",
+        settings_kwargs={
+            "max_records": "capacity_anomaly_max_records",
+            "min_confidence_pct": "capacity_anomaly_min_confidence_pct",
+        },
+        enabled_flag="capacity_anomaly_enabled",
+    ),
+    EngineSpec(
+        name="change_freeze",
+        route_module="change_freeze",
+        engine="shieldops.changes.change_freeze:ChangeFreezeManager",
+        tags=("Change Freeze Manager",),
+        router_attr="cfm_route",
+        settings_kwargs={
+            "max_records": "change_freeze_max_records",
+            "max_exception_rate_pct": "change_freeze_max_exception_rate_pct",
+        },
+        enabled_flag="change_freeze_enabled",
+    ),
+    EngineSpec(
+        name="pipeline_analyzer",
+        route_module="pipeline_analyzer",
+        engine="shieldops.changes.pipeline_analyzer:DeploymentPipelineAnalyzer",
+        tags=("Deployment Pipeline Analyzer",),
+        router_attr="dpa_route",
+        settings_kwargs={
+            "max_records": "pipeline_analyzer_max_records",
+            "max_duration_minutes": "pipeline_analyzer_max_duration_minutes",
+        },
+        enabled_flag="pipeline_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="release_readiness",
+        route_module="release_readiness",
+        engine="shieldops.changes.release_readiness:ReleaseReadinessChecker",
+        tags=("Release Readiness Checker",),
+        router_attr="rrc_route",
+        settings_kwargs={
+            "max_records": "release_readiness_max_records",
+            "min_score_pct": "release_readiness_min_score_pct",
+        },
+        enabled_flag="release_readiness_enabled",
+    ),
+    EngineSpec(
+        name="config_validator",
+        route_module="config_validator",
+        engine="shieldops.config.config_validator:ConfigValidationEngine",
+        tags=("Config Validation Engine",),
+        router_attr="cvn_route",
+        settings_kwargs={
+            "max_records": "config_validator_max_records",
+            "max_failure_rate_pct": "config_validator_max_failure_rate_pct",
+        },
+        enabled_flag="config_validator_enabled",
+    ),
+    EngineSpec(
+        name="ownership_tracker",
+        route_module="ownership_tracker",
+        engine="shieldops.topology.ownership_tracker:ServiceOwnershipTracker",
+        tags=("Service Ownership Tracker",),
+        router_attr="sot_route",
+        settings_kwargs={
+            "max_records": "ownership_tracker_max_records",
+            "max_orphan_days": "ownership_tracker_max_orphan_days",
+        },
+        enabled_flag="ownership_tracker_enabled",
+    ),
+    EngineSpec(
+        name="vendor_lockin",
+        route_module="vendor_lockin",
+        engine="shieldops.billing.vendor_lockin:VendorLockinAnalyzer",
+        tags=("Vendor Lock-in",),
+        router_attr="vla_route",
+        settings_kwargs={
+            "max_records": "vendor_lockin_max_records",
+            "max_risk_score": "vendor_lockin_max_risk_score",
+        },
+        enabled_flag="vendor_lockin_enabled",
+    ),
+    EngineSpec(
+        name="cost_efficiency",
+        route_module="cost_efficiency",
+        engine="shieldops.billing.cost_efficiency:CostEfficiencyScorer",
+        tags=("Cost Efficiency",),
+        router_attr="ces_route",
+        settings_kwargs={
+            "max_records": "cost_efficiency_max_records",
+            "min_efficiency_pct": "cost_efficiency_min_efficiency_pct",
+        },
+        enabled_flag="cost_efficiency_enabled",
+    ),
+    EngineSpec(
+        name="budget_variance",
+        route_module="budget_variance",
+        engine="shieldops.billing.budget_variance:BudgetVarianceTracker",
+        tags=("Budget Variance",),
+        router_attr="bvt_route",
+        settings_kwargs={
+            "max_records": "budget_variance_max_records",
+            "max_variance_pct": "budget_variance_max_variance_pct",
+        },
+        enabled_flag="budget_variance_enabled",
+    ),
+    EngineSpec(
+        name="evidence_validator",
+        route_module="evidence_validator",
+        engine="shieldops.compliance.evidence_validator:ComplianceEvidenceValidator",
+        tags=("Evidence Validator",),
+        router_attr="evl_route",
+        settings_kwargs={
+            "max_records": "evidence_validator_max_records",
+            "min_validity_pct": "evidence_validator_min_validity_pct",
+        },
+        enabled_flag="evidence_validator_enabled",
+    ),
+    EngineSpec(
+        name="policy_enforcer",
+        route_module="policy_enforcer",
+        engine="shieldops.compliance.policy_enforcer:PolicyEnforcementMonitor",
+        tags=("Policy Enforcer",),
+        router_attr="pen_route",
+        settings_kwargs={
+            "max_records": "policy_enforcer_max_records",
+            "max_violation_rate_pct": "policy_enforcer_max_violation_rate_pct",
+        },
+        enabled_flag="policy_enforcer_enabled",
+    ),
+    EngineSpec(
+        name="audit_readiness",
+        route_module="audit_readiness",
+        engine="shieldops.audit.audit_readiness:AuditReadinessScorer",
+        tags=("Audit Readiness",),
+        router_attr="ard_route",
+        settings_kwargs={
+            "max_records": "audit_readiness_max_records",
+            "min_readiness_pct": "audit_readiness_min_readiness_pct",
+        },
+        enabled_flag="audit_readiness_enabled",
+    ),
+    EngineSpec(
+        name="toil_classifier",
+        route_module="toil_classifier",
+        engine="shieldops.operations.toil_classifier:OperationalToilClassifier",
+        tags=("Toil Classifier",),
+        router_attr="tcl_route",
+        settings_kwargs={
+            "max_records": "toil_classifier_max_records",
+            "max_toil_hours_weekly": "toil_classifier_max_toil_hours_weekly",
+        },
+        enabled_flag="toil_classifier_enabled",
+    ),
+    EngineSpec(
+        name="governance_scorer",
+        route_module="governance_scorer",
+        engine="shieldops.policy.governance_scorer:PlatformGovernanceScorer",
+        tags=("Governance Scorer",),
+        router_attr="pgs_route",
+        settings_kwargs={
+            "max_records": "governance_scorer_max_records",
+            "min_governance_score": "governance_scorer_min_governance_score",
+        },
+        enabled_flag="governance_scorer_enabled",
+    ),
+    EngineSpec(
+        name="deprecation_tracker",
+        route_module="deprecation_tracker",
+        engine="shieldops.topology.deprecation_tracker:ServiceDeprecationTracker",
+        tags=("Deprecation Tracker",),
+        router_attr="sdt_route",
+        settings_kwargs={
+            "max_records": "deprecation_tracker_max_records",
+            "max_overdue_days": "deprecation_tracker_max_overdue_days",
+        },
+        enabled_flag="deprecation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="severity_validator",
+        route_module="severity_validator",
+        engine="shieldops.incidents.severity_validator:IncidentSeverityValidator",
+        tags=("Severity Validator",),
+        router_attr="svl_route",
+        settings_kwargs={
+            "max_records": "severity_validator_max_records",
+            "min_accuracy_pct": "severity_validator_min_accuracy_pct",
+        },
+        enabled_flag="severity_validator_enabled",
+    ),
+    EngineSpec(
+        name="approval_analyzer",
+        route_module="approval_analyzer",
+        engine="shieldops.changes.approval_analyzer:ChangeApprovalAnalyzer",
+        tags=("Approval Analyzer",),
+        router_attr="caa_route",
+        settings_kwargs={
+            "max_records": "approval_analyzer_max_records",
+            "max_approval_hours": "approval_analyzer_max_approval_hours",
+        },
+        enabled_flag="approval_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="slo_compliance",
+        route_module="slo_compliance",
+        engine="shieldops.sla.slo_compliance:SLOComplianceChecker",
+        tags=("SLO Compliance",),
+        router_attr="scc_route",
+        settings_kwargs={
+            "max_records": "slo_compliance_max_records",
+            "min_compliance_pct": "slo_compliance_min_compliance_pct",
+        },
+        enabled_flag="slo_compliance_enabled",
+    ),
+    EngineSpec(
+        name="alert_dedup",
+        route_module="alert_dedup",
+        engine="shieldops.observability.alert_dedup:AlertDeduplicationEngine",
+        tags=("Alert Dedup",),
+        router_attr="ade_route",
+        settings_kwargs={
+            "max_records": "alert_dedup_max_records",
+            "min_dedup_ratio_pct": "alert_dedup_min_dedup_ratio_pct",
+        },
+        enabled_flag="alert_dedup_enabled",
+    ),
+    EngineSpec(
+        name="priority_ranker",
+        route_module="priority_ranker",
+        engine="shieldops.incidents.priority_ranker:IncidentPriorityRanker",
+        tags=("Priority Ranker",),
+        router_attr="ipr_route",
+        settings_kwargs={
+            "max_records": "priority_ranker_max_records",
+            "min_accuracy_pct": "priority_ranker_min_accuracy_pct",
+        },
+        enabled_flag="priority_ranker_enabled",
+    ),
+    EngineSpec(
+        name="deploy_frequency",
+        route_module="deploy_frequency",
+        engine="shieldops.changes.deploy_frequency:DeploymentFrequencyAnalyzer",
+        tags=("Deploy Frequency",),
+        router_attr="dfa_route",
+        settings_kwargs={
+            "max_records": "deploy_frequency_max_records",
+            "min_deploy_per_week": "deploy_frequency_min_deploy_per_week",
+        },
+        enabled_flag="deploy_frequency_enabled",
+    ),
+    EngineSpec(
+        name="infra_cost_allocator",
+        route_module="infra_cost_allocator",
+        engine="shieldops.billing.infra_cost_allocator:InfrastructureCostAllocator",
+        tags=("Infra Cost Allocator",),
+        router_attr="ica_route",
+        settings_kwargs={
+            "max_records": "infra_cost_allocator_max_records",
+            "max_unallocated_pct": "infra_cost_allocator_max_unallocated_pct",
+        },
+        enabled_flag="infra_cost_allocator_enabled",
+    ),
+    EngineSpec(
+        name="team_velocity",
+        route_module="team_velocity",
+        engine="shieldops.analytics.team_velocity:TeamVelocityTracker",
+        tags=("Team Velocity",),
+        router_attr="tvt_route",
+        settings_kwargs={
+            "max_records": "team_velocity_max_records",
+            "min_velocity_score": "team_velocity_min_velocity_score",
+        },
+        enabled_flag="team_velocity_enabled",
+    ),
+    EngineSpec(
+        name="comm_mapper",
+        route_module="comm_mapper",
+        engine="shieldops.topology.comm_mapper:ServiceCommunicationMapper",
+        tags=("Comm Mapper",),
+        router_attr="scm_route",
+        settings_kwargs={
+            "max_records": "comm_mapper_max_records",
+            "max_unhealthy_links": "comm_mapper_max_unhealthy_links",
+        },
+        enabled_flag="comm_mapper_enabled",
+    ),
+    EngineSpec(
+        name="automation_scorer",
+        route_module="automation_scorer",
+        engine="shieldops.compliance.automation_scorer:ComplianceAutomationScorer",
+        tags=("Automation Scorer",),
+        router_attr="cas_route",
+        settings_kwargs={
+            "max_records": "automation_scorer_max_records",
+            "min_automation_pct": "automation_scorer_min_automation_pct",
+        },
+        enabled_flag="automation_scorer_enabled",
+    ),
+    EngineSpec(
+        name="scaling_advisor",
+        route_module="scaling_advisor",
+        engine="shieldops.operations.scaling_advisor:PredictiveScalingAdvisor",
+        tags=("Scaling Advisor",),
+        router_attr="psa_route",
+        settings_kwargs={
+            "max_records": "scaling_advisor_max_records",
+            "min_confidence_pct": "scaling_advisor_min_confidence_pct",
+        },
+        enabled_flag="scaling_advisor_enabled",
+    ),
+    EngineSpec(
+        name="error_classifier",
+        route_module="error_classifier",
+        engine="shieldops.analytics.error_classifier:ErrorPatternClassifier",
+        tags=("Error Classifier",),
+        router_attr="ecl_route",
+        settings_kwargs={
+            "max_records": "error_classifier_max_records",
+            "max_error_rate_pct": "error_classifier_max_error_rate_pct",
+        },
+        enabled_flag="error_classifier_enabled",
+    ),
+    EngineSpec(
+        name="compliance_bridge",
+        route_module="compliance_bridge",
+        engine="shieldops.security.compliance_bridge:SecurityComplianceBridge",
+        tags=("Compliance Bridge",),
+        router_attr="scb_route",
+        settings_kwargs={
+            "max_records": "compliance_bridge_max_records",
+            "min_alignment_pct": "compliance_bridge_min_alignment_pct",
+        },
+        enabled_flag="compliance_bridge_enabled",
+    ),
+    EngineSpec(
+        name="utilization_scorer",
+        route_module="utilization_scorer",
+        engine="shieldops.analytics.utilization_scorer:CapacityUtilizationScorer",
+        tags=("Utilization Scorer",),
+        router_attr="cus_route",
+        settings_kwargs={
+            "max_records": "utilization_scorer_max_records",
+            "optimal_utilization_pct": "utilization_scorer_optimal_utilization_pct",
+        },
+        enabled_flag="utilization_scorer_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_linker",
+        route_module="knowledge_linker",
+        engine="shieldops.incidents.knowledge_linker:IncidentKnowledgeLinker",
+        tags=("Knowledge Linker",),
+        router_attr="ikl_route",
+        settings_kwargs={
+            "max_records": "knowledge_linker_max_records",
+            "min_relevance_pct": "knowledge_linker_min_relevance_pct",
+        },
+        enabled_flag="knowledge_linker_enabled",
+    ),
+    EngineSpec(
+        name="dep_vuln_mapper",
+        route_module="dep_vuln_mapper",
+        engine="shieldops.topology.dep_vuln_mapper:DependencyVulnerabilityMapper",
+        tags=("Dependency Vulnerability Mapper",),
+        router_attr="dvm_route",
+        settings_kwargs={
+            "max_records": "dep_vuln_mapper_max_records",
+            "max_critical_vulns": "dep_vuln_mapper_max_critical_vulns",
+        },
+        enabled_flag="dep_vuln_mapper_enabled",
+    ),
+    EngineSpec(
+        name="trend_forecaster",
+        route_module="trend_forecaster",
+        engine="shieldops.incidents.trend_forecaster:IncidentTrendForecaster",
+        tags=("Incident Trend Forecaster",),
+        router_attr="itf_route",
+        settings_kwargs={
+            "max_records": "trend_forecaster_max_records",
+            "max_growth_rate_pct": "trend_forecaster_max_growth_rate_pct",
+        },
+        enabled_flag="trend_forecaster_enabled",
+    ),
+    EngineSpec(
+        name="risk_predictor",
+        route_module="risk_predictor",
+        engine="shieldops.changes.risk_predictor:ChangeRiskPredictor",
+        tags=("Change Risk Predictor",),
+        router_attr="crp_route",
+        settings_kwargs={
+            "max_records": "risk_predictor_max_records",
+            "max_risk_threshold": "risk_predictor_max_risk_threshold",
+        },
+        enabled_flag="risk_predictor_enabled",
+    ),
+    EngineSpec(
+        name="optimization_planner",
+        route_module="optimization_planner",
+        engine="shieldops.billing.optimization_planner:CostOptimizationPlanner",
+        tags=("Cost Optimization Planner",),
+        router_attr="cop_route",
+        settings_kwargs={
+            "max_records": "optimization_planner_max_records",
+            "min_savings_pct": "optimization_planner_min_savings_pct",
+        },
+        enabled_flag="optimization_planner_enabled",
+    ),
+    EngineSpec(
+        name="noise_classifier",
+        route_module="noise_classifier",
+        engine="shieldops.observability.noise_classifier:AlertNoiseClassifier",
+        tags=("Alert Noise Classifier",),
+        router_attr="anc_route",
+        settings_kwargs={
+            "max_records": "noise_classifier_max_records",
+            "max_noise_ratio_pct": "noise_classifier_max_noise_ratio_pct",
+        },
+        enabled_flag="noise_classifier_enabled",
+    ),
+    EngineSpec(
+        name="sla_impact_analyzer",
+        route_module="sla_impact",
+        engine="shieldops.sla.impact_analyzer:SLAImpactAnalyzer",
+        tags=("SLA Impact Analyzer",),
+        router_attr="sia_route",
+        settings_kwargs={
+            "max_records": "sla_impact_analyzer_max_records",
+            "max_breach_count": "sla_impact_analyzer_max_breach_count",
+        },
+        enabled_flag="sla_impact_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="runbook_coverage",
+        route_module="runbook_coverage",
+        engine="shieldops.operations.runbook_coverage:RunbookCoverageAnalyzer",
+        tags=("Runbook Coverage Analyzer",),
+        router_attr="rca_route",
+        settings_kwargs={
+            "max_records": "runbook_coverage_max_records",
+            "min_coverage_pct": "runbook_coverage_min_coverage_pct",
+        },
+        enabled_flag="runbook_coverage_enabled",
+    ),
+    EngineSpec(
+        name="posture_benchmark",
+        route_module="posture_benchmark",
+        engine="shieldops.security.posture_benchmark:SecurityPostureBenchmarker",
+        tags=("Security Posture Benchmarker",),
+        router_attr="spb_route",
+        settings_kwargs={
+            "max_records": "posture_benchmark_max_records",
+            "min_benchmark_score": "posture_benchmark_min_benchmark_score",
+        },
+        enabled_flag="posture_benchmark_enabled",
+    ),
+    EngineSpec(
+        name="workload_balancer",
+        route_module="workload_balancer",
+        engine="shieldops.operations.workload_balancer:TeamWorkloadBalancer",
+        tags=("Team Workload Balancer",),
+        router_attr="twb_route",
+        settings_kwargs={
+            "max_records": "workload_balancer_max_records",
+            "max_imbalance_pct": "workload_balancer_max_imbalance_pct",
+        },
+        enabled_flag="workload_balancer_enabled",
+    ),
+    EngineSpec(
+        name="report_automator",
+        route_module="report_automator",
+        engine="shieldops.compliance.report_automator:ComplianceReportAutomator",
+        tags=("Compliance Report Automator",),
+        router_attr="cra_route",
+        settings_kwargs={
+            "max_records": "report_automator_max_records",
+            "max_overdue_days": "report_automator_max_overdue_days",
+        },
+        enabled_flag="report_automator_enabled",
+    ),
+    EngineSpec(
+        name="infra_health_scorer",
+        route_module="infra_health_scorer",
+        engine="shieldops.topology.infra_health_scorer:InfrastructureHealthScorer",
+        tags=("Infrastructure Health Scorer",),
+        router_attr="ihs_route",
+        settings_kwargs={
+            "max_records": "infra_health_scorer_max_records",
+            "min_health_score": "infra_health_scorer_min_health_score",
+        },
+        enabled_flag="infra_health_scorer_enabled",
+    ),
+    EngineSpec(
+        name="impact_predictor",
+        route_module="impact_predictor",
+        engine="shieldops.changes.impact_predictor:DeploymentImpactPredictor",
+        tags=("Deployment Impact Predictor",),
+        router_attr="dip_route",
+        settings_kwargs={
+            "max_records": "impact_predictor_max_records",
+            "max_impact_score": "impact_predictor_max_impact_score",
+        },
+        enabled_flag="impact_predictor_enabled",
+    ),
+    EngineSpec(
+        name="response_time",
+        route_module="response_time",
+        engine="shieldops.incidents.response_time:IncidentResponseTimeAnalyzer",
+        tags=("Response Time",),
+        router_attr="rta_route",
+        settings_kwargs={
+            "max_records": "response_time_max_records",
+            "max_response_time_minutes": "response_time_max_response_time_minutes",
+        },
+        enabled_flag="response_time_enabled",
+    ),
+    EngineSpec(
+        name="service_dep_risk",
+        route_module="service_dep_risk",
+        engine="shieldops.topology.service_dep_risk:ServiceDependencyRiskScorer",
+        tags=("Service Dependency Risk",),
+        router_attr="sdr_route",
+        settings_kwargs={
+            "max_records": "service_dep_risk_max_records",
+            "max_risk_score": "service_dep_risk_max_risk_score",
+        },
+        enabled_flag="service_dep_risk_enabled",
+    ),
+    EngineSpec(
+        name="alert_escalation",
+        route_module="alert_escalation",
+        engine="shieldops.observability.escalation_analyzer:AlertEscalationAnalyzer",
+        tags=("Alert Escalation",),
+        router_attr="ean_route",
+        settings_kwargs={
+            "max_records": "alert_escalation_max_records",
+            "max_escalation_rate_pct": "alert_escalation_max_escalation_rate_pct",
+        },
+        enabled_flag="alert_escalation_enabled",
+    ),
+    EngineSpec(
+        name="capacity_utilizer",
+        route_module="capacity_utilizer",
+        engine="shieldops.billing.capacity_utilizer:CapacityUtilizationOptimizer",
+        tags=("Capacity Utilization",),
+        router_attr="cup_route",
+        settings_kwargs={
+            "max_records": "capacity_utilizer_max_records",
+            "optimal_utilization_pct": "capacity_utilizer_optimal_utilization_pct",
+        },
+        enabled_flag="capacity_utilizer_enabled",
+    ),
+    EngineSpec(
+        name="freeze_validator",
+        route_module="freeze_validator",
+        engine="shieldops.changes.freeze_validator:ChangeFreezeValidator",
+        tags=("Change Freeze Validator",),
+        router_attr="cfv_route",
+        settings_kwargs={
+            "max_records": "freeze_validator_max_records",
+            "max_violation_rate_pct": "freeze_validator_max_violation_rate_pct",
+        },
+        enabled_flag="freeze_validator_enabled",
+    ),
+    EngineSpec(
+        name="availability_tracker",
+        route_module="availability_tracker",
+        engine="shieldops.sla.availability_tracker:PlatformAvailabilityTracker",
+        tags=("Platform Availability",),
+        router_attr="pat_route",
+        settings_kwargs={
+            "max_records": "availability_tracker_max_records",
+            "min_availability_pct": "availability_tracker_min_availability_pct",
+        },
+        enabled_flag="availability_tracker_enabled",
+    ),
+    EngineSpec(
+        name="root_cause_classifier",
+        route_module="root_cause_classifier",
+        engine="shieldops.incidents.root_cause_classifier:IncidentRootCauseClassifier",
+        tags=("Root Cause Classifier",),
+        router_attr="rcc_route",
+        settings_kwargs={
+            "max_records": "root_cause_classifier_max_records",
+            "min_confidence_pct": "root_cause_classifier_min_confidence_pct",
+        },
+        enabled_flag="root_cause_classifier_enabled",
+    ),
+    EngineSpec(
+        name="canary_scorer",
+        route_module="canary_scorer",
+        engine="shieldops.changes.canary_scorer:DeploymentCanaryScorer",
+        tags=("Canary Scorer",),
+        router_attr="dcs_route",
+        settings_kwargs={
+            "max_records": "canary_scorer_max_records",
+            "min_canary_score": "canary_scorer_min_canary_score",
+        },
+        enabled_flag="canary_scorer_enabled",
+    ),
+    EngineSpec(
+        name="config_drift_monitor",
+        route_module="config_drift_monitor",
+        engine="shieldops.operations.config_drift_monitor:ConfigDriftMonitor",
+        tags=("Config Drift Monitor",),
+        router_attr="cdm_route",
+        settings_kwargs={
+            "max_records": "config_drift_monitor_max_records",
+            "max_drift_count": "config_drift_monitor_max_drift_count",
+        },
+        enabled_flag="config_drift_monitor_enabled",
+    ),
+    EngineSpec(
+        name="compliance_mapper",
+        route_module="compliance_mapper",
+        engine="shieldops.security.compliance_mapper:SecurityComplianceMapper",
+        tags=("Security Compliance Mapper",),
+        router_attr="scm2_route",
+        settings_kwargs={
+            "max_records": "compliance_mapper_max_records",
+            "min_compliance_score": "compliance_mapper_min_compliance_score",
+        },
+        enabled_flag="compliance_mapper_enabled",
+    ),
+    EngineSpec(
+        name="oncall_equity",
+        route_module="oncall_equity",
+        engine="shieldops.operations.oncall_equity:TeamOnCallEquityAnalyzer",
+        tags=("On-Call Equity",),
+        router_attr="oce_route",
+        settings_kwargs={
+            "max_records": "oncall_equity_max_records",
+            "max_inequity_pct": "oncall_equity_max_inequity_pct",
+        },
+        enabled_flag="oncall_equity_enabled",
+    ),
+    EngineSpec(
+        name="incident_cluster",
+        route_module="incident_cluster",
+        engine="shieldops.incidents.incident_cluster:IncidentClusterEngine",
+        tags=("Incident Cluster",),
+        router_attr="icr_route",
+        settings_kwargs={
+            "max_records": "incident_cluster_max_records",
+            "min_cluster_confidence": "incident_cluster_min_cluster_confidence",
+        },
+        enabled_flag="incident_cluster_enabled",
+    ),
+    EngineSpec(
+        name="dep_latency",
+        route_module="dep_latency",
+        engine="shieldops.topology.dep_latency:DependencyLatencyTracker",
+        tags=("Dependency Latency",),
+        router_attr="dlt_route",
+        settings_kwargs={
+            "max_records": "dep_latency_max_records",
+            "max_latency_ms": "dep_latency_max_latency_ms",
+        },
+        enabled_flag="dep_latency_enabled",
+    ),
+    EngineSpec(
+        name="suppression_mgr",
+        route_module="suppression_manager",
+        engine="shieldops.observability.suppression_manager:AlertSuppressionManager",
+        tags=("Suppression Manager",),
+        router_attr="asn_route",
+        settings_kwargs={
+            "max_records": "suppression_mgr_max_records",
+            "max_suppression_rate_pct": "suppression_mgr_max_suppression_rate_pct",
+        },
+        enabled_flag="suppression_mgr_enabled",
+    ),
+    EngineSpec(
+        name="cost_trend",
+        route_module="cost_trend",
+        engine="shieldops.billing.cost_trend:CostTrendForecaster",
+        tags=("Cost Trend",),
+        router_attr="ctf_route",
+        settings_kwargs={
+            "max_records": "cost_trend_max_records",
+            "max_growth_rate_pct": "cost_trend_max_growth_rate_pct",
+        },
+        enabled_flag="cost_trend_enabled",
+    ),
+    EngineSpec(
+        name="batch_analyzer",
+        route_module="batch_analyzer",
+        engine="shieldops.changes.batch_analyzer:ChangeBatchAnalyzer",
+        tags=("Change Batch Analyzer",),
+        router_attr="cba_route",
+        settings_kwargs={
+            "max_records": "batch_analyzer_max_records",
+            "max_batch_risk_score": "batch_analyzer_max_batch_risk_score",
+        },
+        enabled_flag="batch_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="slo_alignment",
+        route_module="slo_alignment",
+        engine="shieldops.sla.slo_alignment:SLOAlignmentValidator",
+        tags=("SLO Alignment",),
+        router_attr="sal_route",
+        settings_kwargs={
+            "max_records": "slo_alignment_max_records",
+            "min_alignment_score": "slo_alignment_min_alignment_score",
+        },
+        enabled_flag="slo_alignment_enabled",
+    ),
+    EngineSpec(
+        name="runbook_exec_tracker",
+        route_module="runbook_exec_tracker",
+        engine="shieldops.operations.runbook_exec_tracker:RunbookExecutionTracker",
+        tags=("Runbook Execution Tracker",),
+        router_attr="ret_route",
+        settings_kwargs={
+            "max_records": "runbook_exec_tracker_max_records",
+            "min_success_rate_pct": "runbook_exec_tracker_min_success_rate_pct",
+        },
+        enabled_flag="runbook_exec_tracker_enabled",
+    ),
+    EngineSpec(
+        name="threat_correlator",
+        route_module="threat_correlator",
+        engine="shieldops.security.threat_correlator:ThreatIntelligenceCorrelator",
+        tags=("Threat Correlator",),
+        router_attr="tic_route",
+        settings_kwargs={
+            "max_records": "threat_correlator_max_records",
+            "min_relevance_score": "threat_correlator_min_relevance_score",
+        },
+        enabled_flag="threat_correlator_enabled",
+    ),
+    EngineSpec(
+        name="freshness_monitor",
+        route_module="freshness_monitor",
+        engine="shieldops.knowledge.freshness_monitor:KnowledgeFreshnessMonitor",
+        tags=("Knowledge Freshness",),
+        router_attr="kfm_route",
+        settings_kwargs={
+            "max_records": "freshness_monitor_max_records",
+            "max_stale_days": "freshness_monitor_max_stale_days",
+        },
+        enabled_flag="freshness_monitor_enabled",
+    ),
+    EngineSpec(
+        name="control_tester",
+        route_module="control_tester",
+        engine="shieldops.compliance.control_tester:ComplianceControlTester",
+        tags=("Control Tester",),
+        router_attr="cct_route",
+        settings_kwargs={
+            "max_records": "control_tester_max_records",
+            "min_pass_rate_pct": "control_tester_min_pass_rate_pct",
+        },
+        enabled_flag="control_tester_enabled",
+    ),
+    EngineSpec(
+        name="bottleneck_detector",
+        route_module="bottleneck_detector",
+        engine="shieldops.analytics.bottleneck_detector:CapacityBottleneckDetector",
+        tags=("Bottleneck Detector",),
+        router_attr="cbd_route",
+        settings_kwargs={
+            "max_records": "bottleneck_detector_max_records",
+            "critical_utilization_pct": "bottleneck_detector_critical_utilization_pct",
+        },
+        enabled_flag="bottleneck_detector_enabled",
+    ),
+    EngineSpec(
+        name="anomaly_scorer",
+        route_module="anomaly_scorer",
+        engine="shieldops.analytics.anomaly_scorer:MetricAnomalyScorer",
+        tags=("Anomaly Scorer",),
+        router_attr="mas_route",
+        settings_kwargs={
+            "max_records": "anomaly_scorer_max_records",
+            "min_anomaly_score": "anomaly_scorer_min_anomaly_score",
+        },
+        enabled_flag="anomaly_scorer_enabled",
+    ),
+    EngineSpec(
+        name="noise_filter",
+        route_module="noise_filter",
+        engine="shieldops.incidents.noise_filter:IncidentNoiseFilter",
+        tags=("Noise Filter",),
+        router_attr="inf_route",
+        settings_kwargs={
+            "max_records": "noise_filter_max_records",
+            "max_false_alarm_rate_pct": "noise_filter_max_false_alarm_rate_pct",
+        },
+        enabled_flag="noise_filter_enabled",
+    ),
+    EngineSpec(
+        name="dep_validator",
+        route_module="dep_validator",
+        engine="shieldops.topology.dep_validator:ServiceDependencyValidator",
+        tags=("Dependency Validator",),
+        router_attr="dvl_route",
+        settings_kwargs={
+            "max_records": "dep_validator_max_records",
+            "max_invalid_pct": "dep_validator_max_invalid_pct",
+        },
+        enabled_flag="dep_validator_enabled",
+    ),
+    EngineSpec(
+        name="alert_priority",
+        route_module="alert_priority",
+        engine="shieldops.observability.alert_priority:AlertPriorityOptimizer",
+        tags=("Alert Priority",),
+        router_attr="apo_route",
+        settings_kwargs={
+            "max_records": "alert_priority_max_records",
+            "max_misalignment_pct": "alert_priority_max_misalignment_pct",
+        },
+        enabled_flag="alert_priority_enabled",
+    ),
+    EngineSpec(
+        name="cost_alloc_validator",
+        route_module="cost_alloc_validator",
+        engine="shieldops.billing.cost_alloc_validator:CostAllocationValidator",
+        tags=("Cost Allocation Validator",),
+        router_attr="cav_route",
+        settings_kwargs={
+            "max_records": "cost_alloc_validator_max_records",
+            "max_variance_pct": "cost_alloc_validator_max_variance_pct",
+        },
+        enabled_flag="cost_alloc_validator_enabled",
+    ),
+    EngineSpec(
+        name="change_correlator",
+        route_module="change_correlator",
+        engine="shieldops.changes.change_correlator:ChangeCorrelationEngine",
+        tags=("Change Correlator",),
+        router_attr="ccr_route",
+        settings_kwargs={
+            "max_records": "change_correlator_max_records",
+            "min_correlation_strength_pct": "change_correlator_min_correlation_strength_pct",
+        },
+        enabled_flag="change_correlator_enabled",
+    ),
+    EngineSpec(
+        name="slo_dep_mapper",
+        route_module="slo_dep_mapper",
+        engine="shieldops.sla.slo_dep_mapper:SLODependencyMapper",
+        tags=("SLO Dependency Mapper",),
+        router_attr="sdm_route",
+        settings_kwargs={
+            "max_records": "slo_dep_mapper_max_records",
+            "min_slo_target_pct": "slo_dep_mapper_min_slo_target_pct",
+        },
+        enabled_flag="slo_dep_mapper_enabled",
+    ),
+    EngineSpec(
+        name="metric_aggregator",
+        route_module="metric_aggregator",
+        engine="shieldops.operations.metric_aggregator:OperationalMetricAggregator",
+        tags=("Metric Aggregator",),
+        router_attr="oma_route",
+        settings_kwargs={
+            "max_records": "metric_aggregator_max_records",
+            "min_metric_health_pct": "metric_aggregator_min_metric_health_pct",
+        },
+        enabled_flag="metric_aggregator_enabled",
+    ),
+    EngineSpec(
+        name="security_event_correlator",
+        route_module="event_correlator",
+        engine="shieldops.security.event_correlator:SecurityEventCorrelator",
+        tags=("Event Correlator",),
+        router_attr="sec_route",
+        settings_kwargs={
+            "max_records": "security_event_correlator_max_records",
+            "min_threat_confidence_pct": "security_event_correlator_min_threat_confidence_pct",
+        },
+        enabled_flag="security_event_correlator_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_search",
+        route_module="search_optimizer",
+        engine="shieldops.knowledge.search_optimizer:KnowledgeSearchOptimizer",
+        tags=("Search Optimizer",),
+        router_attr="kso_route",
+        settings_kwargs={
+            "max_records": "knowledge_search_max_records",
+            "min_relevance_score": "knowledge_search_min_relevance_score",
+        },
+        enabled_flag="knowledge_search_enabled",
+    ),
+    EngineSpec(
+        name="evidence_consolidator",
+        route_module="evidence_consolidator",
+        engine="shieldops.compliance.evidence_consolidator:ComplianceEvidenceConsolidator",
+        tags=("Evidence Consolidator",),
+        router_attr="ecn_route",
+        settings_kwargs={
+            "max_records": "evidence_consolidator_max_records",
+            "min_completeness_pct": "evidence_consolidator_min_completeness_pct",
+        },
+        enabled_flag="evidence_consolidator_enabled",
+    ),
+    EngineSpec(
+        name="service_latency",
+        route_module="service_latency",
+        engine="shieldops.analytics.service_latency:ServiceLatencyAnalyzer",
+        tags=("Service Latency",),
+        router_attr="slt_route",
+        settings_kwargs={
+            "max_records": "service_latency_max_records",
+            "max_latency_threshold_ms": "service_latency_max_latency_threshold_ms",
+        },
+        enabled_flag="service_latency_enabled",
+    ),
+    EngineSpec(
+        name="audit_compliance_reporter",
+        route_module="compliance_reporter",
+        engine="shieldops.audit.compliance_reporter:AuditComplianceReporter",
+        tags=("Compliance Reporter",),
+        router_attr="acr_route",
+        settings_kwargs={
+            "max_records": "audit_compliance_reporter_max_records",
+            "min_compliance_score": "audit_compliance_reporter_min_compliance_score",
+        },
+        enabled_flag="audit_compliance_reporter_enabled",
+    ),
+    EngineSpec(
+        name="response_optimizer",
+        route_module="response_optimizer",
+        engine="shieldops.incidents.response_optimizer:IncidentResponseOptimizer",
+        tags=("Response Optimizer",),
+        router_attr="iro_route",
+        settings_kwargs={
+            "max_records": "response_optimizer_max_records",
+            "max_response_time_minutes": "response_optimizer_max_response_time_minutes",
+        },
+        enabled_flag="response_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="dep_change_tracker",
+        route_module="dep_change_tracker",
+        engine="shieldops.topology.dep_change_tracker:DependencyChangeTracker",
+        tags=("Dependency Change Tracker",),
+        router_attr="dct_route",
+        settings_kwargs={
+            "max_records": "dep_change_tracker_max_records",
+            "max_breaking_change_pct": "dep_change_tracker_max_breaking_change_pct",
+        },
+        enabled_flag="dep_change_tracker_enabled",
+    ),
+    EngineSpec(
+        name="alert_correlation_opt",
+        route_module="alert_correlation_opt",
+        engine="shieldops.observability.alert_correlation_opt:AlertCorrelationOptimizer",
+        tags=("Alert Correlation Optimizer",),
+        router_attr="aco_route",
+        settings_kwargs={
+            "max_records": "alert_correlation_opt_max_records",
+            "min_correlation_strength": "alert_correlation_opt_min_correlation_strength",
+        },
+        enabled_flag="alert_correlation_opt_enabled",
+    ),
+    EngineSpec(
+        name="forecast_validator",
+        route_module="forecast_validator",
+        engine="shieldops.billing.forecast_validator:CostForecastValidator",
+        tags=("Forecast Validator",),
+        router_attr="fvl_route",
+        settings_kwargs={
+            "max_records": "forecast_validator_max_records",
+            "max_forecast_error_pct": "forecast_validator_max_forecast_error_pct",
+        },
+        enabled_flag="forecast_validator_enabled",
+    ),
+    EngineSpec(
+        name="rollback_tracker",
+        route_module="rollback_tracker",
+        engine="shieldops.changes.rollback_tracker:DeploymentRollbackTracker",
+        tags=("Rollback Tracker",),
+        router_attr="rbt_route",
+        settings_kwargs={
+            "max_records": "rollback_tracker_max_records",
+            "max_rollback_rate_pct": "rollback_tracker_max_rollback_rate_pct",
+        },
+        enabled_flag="rollback_tracker_enabled",
+    ),
+    EngineSpec(
+        name="slo_health",
+        route_module="slo_health",
+        engine="shieldops.sla.slo_health:SLOHealthDashboard",
+        tags=("SLO Health",),
+        router_attr="shd_route",
+        settings_kwargs={
+            "max_records": "slo_health_max_records",
+            "min_health_score": "slo_health_min_health_score",
+        },
+        enabled_flag="slo_health_enabled",
+    ),
+    EngineSpec(
+        name="runbook_compliance",
+        route_module="runbook_compliance",
+        engine="shieldops.operations.runbook_compliance:RunbookComplianceChecker",
+        tags=("Runbook Compliance",),
+        router_attr="rcp_route",
+        settings_kwargs={
+            "max_records": "runbook_compliance_max_records",
+            "min_compliance_pct": "runbook_compliance_min_compliance_pct",
+        },
+        enabled_flag="runbook_compliance_enabled",
+    ),
+    EngineSpec(
+        name="vuln_prioritizer",
+        route_module="vuln_prioritizer",
+        engine="shieldops.security.vuln_prioritizer:VulnerabilityPrioritizer",
+        tags=("Vulnerability Prioritizer",),
+        router_attr="vpr_route",
+        settings_kwargs={
+            "max_records": "vuln_prioritizer_max_records",
+            "critical_cvss_threshold": "vuln_prioritizer_critical_cvss_threshold",
+        },
+        enabled_flag="vuln_prioritizer_enabled",
+    ),
+    EngineSpec(
+        name="usage_analyzer",
+        route_module="usage_analyzer",
+        engine="shieldops.knowledge.usage_analyzer:KnowledgeUsageAnalyzer",
+        tags=("Usage Analyzer",),
+        router_attr="kua_route",
+        settings_kwargs={
+            "max_records": "usage_analyzer_max_records",
+            "min_usage_score": "usage_analyzer_min_usage_score",
+        },
+        enabled_flag="usage_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="compliance_risk_scorer",
+        route_module="risk_scorer",
+        engine="shieldops.compliance.risk_scorer:ComplianceRiskScorer",
+        tags=("Compliance Risk Scorer",),
+        router_attr="crs_route",
+        settings_kwargs={
+            "max_records": "compliance_risk_scorer_max_records",
+            "max_risk_score": "compliance_risk_scorer_max_risk_score",
+        },
+        enabled_flag="compliance_risk_scorer_enabled",
+    ),
+    EngineSpec(
+        name="perf_benchmark",
+        route_module="perf_benchmark",
+        engine="shieldops.analytics.perf_benchmark:PerformanceBenchmarkTracker",
+        tags=("Performance Benchmark",),
+        router_attr="pbt_route",
+        settings_kwargs={
+            "max_records": "perf_benchmark_max_records",
+            "max_regression_pct": "perf_benchmark_max_regression_pct",
+        },
+        enabled_flag="perf_benchmark_enabled",
+    ),
+    EngineSpec(
+        name="evidence_tracker",
+        route_module="evidence_tracker",
+        engine="shieldops.audit.evidence_tracker:AuditEvidenceTracker",
+        tags=("Evidence Tracker",),
+        router_attr="aet_route",
+        settings_kwargs={
+            "max_records": "evidence_tracker_max_records",
+            "min_completeness_pct": "evidence_tracker_min_completeness_pct",
+        },
+        enabled_flag="evidence_tracker_enabled",
+    ),
+    EngineSpec(
+        name="triage_quality",
+        route_module="triage_quality",
+        engine="shieldops.incidents.triage_quality:TriageQualityAnalyzer",
+        tags=("Triage Quality",),
+        router_attr="tqa_route",
+        settings_kwargs={
+            "max_records": "triage_quality_max_records",
+            "min_triage_quality_pct": "triage_quality_min_triage_quality_pct",
+        },
+        enabled_flag="triage_quality_enabled",
+    ),
+    EngineSpec(
+        name="health_trend",
+        route_module="health_trend",
+        engine="shieldops.topology.health_trend:ServiceHealthTrendAnalyzer",
+        tags=("Health Trend",),
+        router_attr="sht_route",
+        settings_kwargs={
+            "max_records": "health_trend_max_records",
+            "min_health_trend_score": "health_trend_min_health_trend_score",
+        },
+        enabled_flag="health_trend_enabled",
+    ),
+    EngineSpec(
+        name="metric_quality",
+        route_module="metric_quality",
+        engine="shieldops.observability.metric_quality:MetricQualityScorer",
+        tags=("Metric Quality",),
+        router_attr="mqs_route",
+        settings_kwargs={
+            "max_records": "metric_quality_max_records",
+            "min_metric_quality_pct": "metric_quality_min_metric_quality_pct",
+        },
+        enabled_flag="metric_quality_enabled",
+    ),
+    EngineSpec(
+        name="invoice_validator",
+        route_module="invoice_validator",
+        engine="shieldops.billing.invoice_validator:InvoiceValidationEngine",
+        tags=("Invoice Validator",),
+        router_attr="ivl_route",
+        settings_kwargs={
+            "max_records": "invoice_validator_max_records",
+            "max_discrepancy_pct": "invoice_validator_max_discrepancy_pct",
+        },
+        enabled_flag="invoice_validator_enabled",
+    ),
+    EngineSpec(
+        name="deploy_stability",
+        route_module="deploy_stability",
+        engine="shieldops.changes.deploy_stability:DeploymentStabilityTracker",
+        tags=("Deploy Stability",),
+        router_attr="dst_route",
+        settings_kwargs={
+            "max_records": "deploy_stability_max_records",
+            "min_stability_score": "deploy_stability_min_stability_score",
+        },
+        enabled_flag="deploy_stability_enabled",
+    ),
+    EngineSpec(
+        name="breach_impact",
+        route_module="breach_impact",
+        engine="shieldops.sla.breach_impact:SLABreachImpactAnalyzer",
+        tags=("Breach Impact",),
+        router_attr="sbi_route",
+        settings_kwargs={
+            "max_records": "breach_impact_max_records",
+            "max_breach_impact_score": "breach_impact_max_breach_impact_score",
+        },
+        enabled_flag="breach_impact_enabled",
+    ),
+    EngineSpec(
+        name="shift_optimizer",
+        route_module="shift_optimizer",
+        engine="shieldops.operations.shift_optimizer:ShiftScheduleOptimizer",
+        tags=("Shift Optimizer",),
+        router_attr="sso_route",
+        settings_kwargs={
+            "max_records": "shift_optimizer_max_records",
+            "max_coverage_gap_pct": "shift_optimizer_max_coverage_gap_pct",
+        },
+        enabled_flag="shift_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="lateral_movement",
+        route_module="lateral_movement",
+        engine="shieldops.security.lateral_movement:LateralMovementDetector",
+        tags=("Lateral Movement",),
+        router_attr="lmd_route",
+        settings_kwargs={
+            "max_records": "lateral_movement_max_records",
+            "min_detection_confidence_pct": "lateral_movement_min_detection_confidence_pct",
+        },
+        enabled_flag="lateral_movement_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_coverage",
+        route_module="knowledge_coverage",
+        engine="shieldops.knowledge.knowledge_coverage:KnowledgeCoverageAnalyzer",
+        tags=("Knowledge Coverage",),
+        router_attr="kca_route",
+        settings_kwargs={
+            "max_records": "knowledge_coverage_max_records",
+            "min_coverage_pct": "knowledge_coverage_min_coverage_pct",
+        },
+        enabled_flag="knowledge_coverage_enabled",
+    ),
+    EngineSpec(
+        name="regulation_tracker",
+        route_module="regulation_tracker",
+        engine="shieldops.compliance.regulation_tracker:RegulatoryChangeTracker",
+        tags=("Regulation Tracker",),
+        router_attr="rct_route",
+        settings_kwargs={
+            "max_records": "regulation_tracker_max_records",
+            "max_impact_score": "regulation_tracker_max_impact_score",
+        },
+        enabled_flag="regulation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="workflow_analyzer",
+        route_module="workflow_analyzer",
+        engine="shieldops.analytics.workflow_analyzer:WorkflowEfficiencyAnalyzer",
+        tags=("Workflow Analyzer",),
+        router_attr="wea_route",
+        settings_kwargs={
+            "max_records": "workflow_analyzer_max_records",
+            "min_efficiency_score": "workflow_analyzer_min_efficiency_score",
+        },
+        enabled_flag="workflow_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="finding_tracker",
+        route_module="finding_tracker",
+        engine="shieldops.audit.finding_tracker:AuditFindingTracker",
+        tags=("Finding Tracker",),
+        router_attr="aft_route",
+        settings_kwargs={
+            "max_records": "finding_tracker_max_records",
+            "max_open_finding_pct": "finding_tracker_max_open_finding_pct",
+        },
+        enabled_flag="finding_tracker_enabled",
+    ),
+    EngineSpec(
+        name="blast_radius",
+        route_module="blast_radius",
+        engine="shieldops.incidents.blast_radius:IncidentBlastRadiusAnalyzer",
+        tags=("Blast Radius",),
+        router_attr="ibr_route",
+        settings_kwargs={
+            "max_records": "blast_radius_max_records",
+            "max_blast_radius_score": "blast_radius_max_blast_radius_score",
+        },
+        enabled_flag="blast_radius_enabled",
+    ),
+    EngineSpec(
+        name="api_gateway_health",
+        route_module="api_gateway_health",
+        engine="shieldops.topology.api_gateway_health:APIGatewayHealthMonitor",
+        tags=("API Gateway Health",),
+        router_attr="agh_route",
+        settings_kwargs={
+            "max_records": "api_gateway_health_max_records",
+            "max_error_rate_pct": "api_gateway_health_max_error_rate_pct",
+        },
+        enabled_flag="api_gateway_health_enabled",
+    ),
+    EngineSpec(
+        name="log_quality",
+        route_module="log_quality",
+        engine="shieldops.observability.log_quality:LogQualityAnalyzer",
+        tags=("Log Quality",),
+        router_attr="lqa_route",
+        settings_kwargs={
+            "max_records": "log_quality_max_records",
+            "min_log_quality_pct": "log_quality_min_log_quality_pct",
+        },
+        enabled_flag="log_quality_enabled",
+    ),
+    EngineSpec(
+        name="commitment_tracker",
+        route_module="commitment_tracker",
+        engine="shieldops.billing.commitment_tracker:CommitmentUtilizationTracker",
+        tags=("Commitment Tracker",),
+        router_attr="cut_route",
+        settings_kwargs={
+            "max_records": "commitment_tracker_max_records",
+            "min_utilization_pct": "commitment_tracker_min_utilization_pct",
+        },
+        enabled_flag="commitment_tracker_enabled",
+    ),
+    EngineSpec(
+        name="feature_flag_impact",
+        route_module="feature_flag_impact",
+        engine="shieldops.changes.feature_flag_impact:FeatureFlagImpactTracker",
+        tags=("Feature Flag Impact",),
+        router_attr="ffi_route",
+        settings_kwargs={
+            "max_records": "feature_flag_impact_max_records",
+            "max_negative_impact_pct": "feature_flag_impact_max_negative_impact_pct",
+        },
+        enabled_flag="feature_flag_impact_enabled",
+    ),
+    EngineSpec(
+        name="customer_impact",
+        route_module="customer_impact",
+        engine="shieldops.sla.customer_impact:CustomerImpactScorer",
+        tags=("Customer Impact",),
+        router_attr="cis_route",
+        settings_kwargs={
+            "max_records": "customer_impact_max_records",
+            "max_impact_score": "customer_impact_max_impact_score",
+        },
+        enabled_flag="customer_impact_enabled",
+    ),
+    EngineSpec(
+        name="toil_automator",
+        route_module="toil_automator",
+        engine="shieldops.operations.toil_automator:ToilAutomationTracker",
+        tags=("Toil Automator",),
+        router_attr="tat_route",
+        settings_kwargs={
+            "max_records": "toil_automator_max_records",
+            "min_automation_pct": "toil_automator_min_automation_pct",
+        },
+        enabled_flag="toil_automator_enabled",
+    ),
+    EngineSpec(
+        name="insider_threat",
+        route_module="insider_threat",
+        engine="shieldops.security.insider_threat:InsiderThreatDetector",
+        tags=("Insider Threat",),
+        router_attr="itd_route",
+        settings_kwargs={
+            "max_records": "insider_threat_max_records",
+            "min_threat_confidence_pct": "insider_threat_min_threat_confidence_pct",
+        },
+        enabled_flag="insider_threat_enabled",
+    ),
+    EngineSpec(
+        name="expertise_mapper",
+        route_module="expertise_mapper",
+        engine="shieldops.knowledge.expertise_mapper:TeamExpertiseMapper",
+        tags=("Expertise Mapper",),
+        router_attr="tem_route",
+        settings_kwargs={
+            "max_records": "expertise_mapper_max_records",
+            "min_expertise_coverage_pct": "expertise_mapper_min_expertise_coverage_pct",
+        },
+        enabled_flag="expertise_mapper_enabled",
+    ),
+    EngineSpec(
+        name="control_effectiveness",
+        route_module="control_effectiveness",
+        engine="shieldops.compliance.control_effectiveness:ControlEffectivenessTracker",
+        tags=("Control Effectiveness",),
+        router_attr="cet_route",
+        settings_kwargs={
+            "max_records": "control_effectiveness_max_records",
+            "min_effectiveness_pct": "control_effectiveness_min_effectiveness_pct",
+        },
+        enabled_flag="control_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="reliability_metrics",
+        route_module="reliability_metrics",
+        engine="shieldops.analytics.reliability_metrics:ReliabilityMetricsCollector",
+        tags=("Reliability Metrics",),
+        router_attr="rmc_route",
+        settings_kwargs={
+            "max_records": "reliability_metrics_max_records",
+            "min_reliability_score": "reliability_metrics_min_reliability_score",
+        },
+        enabled_flag="reliability_metrics_enabled",
+    ),
+    EngineSpec(
+        name="remediation_tracker",
+        route_module="remediation_tracker",
+        engine="shieldops.audit.remediation_tracker:AuditRemediationTracker",
+        tags=("Remediation Tracker",),
+        router_attr="art_route",
+        settings_kwargs={
+            "max_records": "remediation_tracker_max_records",
+            "max_overdue_pct": "remediation_tracker_max_overdue_pct",
+        },
+        enabled_flag="remediation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="response_playbook",
+        route_module="response_playbook",
+        engine="shieldops.incidents.response_playbook:IncidentResponsePlaybookManager",
+        tags=("Response Playbook",),
+        router_attr="irp_route",
+        settings_kwargs={
+            "max_records": "response_playbook_max_records",
+            "min_playbook_coverage_pct": "response_playbook_min_playbook_coverage_pct",
+        },
+        enabled_flag="response_playbook_enabled",
+    ),
+    EngineSpec(
+        name="service_communication",
+        route_module="service_communication",
+        engine="shieldops.topology.service_communication:ServiceCommunicationAnalyzer",
+        tags=("Service Communication",),
+        router_attr="sca_route",
+        settings_kwargs={
+            "max_records": "service_communication_max_records",
+            "max_anomaly_rate_pct": "service_communication_max_anomaly_rate_pct",
+        },
+        enabled_flag="service_communication_enabled",
+    ),
+    EngineSpec(
+        name="dashboard_effectiveness",
+        route_module="dashboard_effectiveness",
+        engine="shieldops.observability.dashboard_effectiveness:DashboardEffectivenessScorer",
+        tags=("Dashboard Effectiveness",),
+        router_attr="des_route",
+        settings_kwargs={
+            "max_records": "dashboard_effectiveness_max_records",
+            "min_effectiveness_score": "dashboard_effectiveness_min_effectiveness_score",
+        },
+        enabled_flag="dashboard_effectiveness_enabled",
+    ),
+    EngineSpec(
+        name="procurement_optimizer",
+        route_module="procurement_optimizer",
+        engine="shieldops.billing.procurement_optimizer:ProcurementOptimizer",
+        tags=("Procurement Optimizer",),
+        router_attr="pro_route",
+        settings_kwargs={
+            "max_records": "procurement_optimizer_max_records",
+            "max_waste_pct": "procurement_optimizer_max_waste_pct",
+        },
+        enabled_flag="procurement_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="merge_risk",
+        route_module="merge_risk",
+        engine="shieldops.changes.merge_risk:MergeRiskAssessor",
+        tags=("Merge Risk",),
+        router_attr="mra_route",
+        settings_kwargs={
+            "max_records": "merge_risk_max_records",
+            "max_risk_score": "merge_risk_max_risk_score",
+        },
+        enabled_flag="merge_risk_enabled",
+    ),
+    EngineSpec(
+        name="degradation_tracker",
+        route_module="degradation_tracker",
+        engine="shieldops.sla.degradation_tracker:ServiceDegradationTracker",
+        tags=("Degradation Tracker",),
+        router_attr="sdg_route",
+        settings_kwargs={
+            "max_records": "degradation_tracker_max_records",
+            "max_degradation_minutes": "degradation_tracker_max_degradation_minutes",
+        },
+        enabled_flag="degradation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="handover_quality",
+        route_module="handover_quality",
+        engine="shieldops.operations.handover_quality:HandoverQualityTracker",
+        tags=("Handover Quality",),
+        router_attr="hqt_route",
+        settings_kwargs={
+            "max_records": "handover_quality_max_records",
+            "min_handover_quality_pct": "handover_quality_min_handover_quality_pct",
+        },
+        enabled_flag="handover_quality_enabled",
+    ),
+    EngineSpec(
+        name="data_classification",
+        route_module="data_classification",
+        engine="shieldops.security.data_classification:DataClassificationEngine",
+        tags=("Data Classification",),
+        router_attr="dce_route",
+        settings_kwargs={
+            "max_records": "data_classification_max_records",
+            "min_classification_coverage_pct": (
+                "data_classification_min_classification_coverage_pct"
+            ),
+        },
+        enabled_flag="data_classification_enabled",
+    ),
+    EngineSpec(
+        name="feedback_loop",
+        route_module="feedback_loop",
+        engine="shieldops.knowledge.feedback_loop:KnowledgeFeedbackAnalyzer",
+        tags=("Feedback Loop",),
+        router_attr="kfa_route",
+        settings_kwargs={
+            "max_records": "feedback_loop_max_records",
+            "min_satisfaction_score": "feedback_loop_min_satisfaction_score",
+        },
+        enabled_flag="feedback_loop_enabled",
+    ),
+    EngineSpec(
+        name="policy_coverage",
+        route_module="policy_coverage",
+        engine="shieldops.compliance.policy_coverage:PolicyCoverageAnalyzer",
+        tags=("Policy Coverage",),
+        router_attr="pca_route",
+        settings_kwargs={
+            "max_records": "policy_coverage_max_records",
+            "min_policy_coverage_pct": "policy_coverage_min_policy_coverage_pct",
+        },
+        enabled_flag="policy_coverage_enabled",
+    ),
+    EngineSpec(
+        name="alert_response",
+        route_module="alert_response",
+        engine="shieldops.analytics.alert_response:AlertResponseAnalyzer",
+        tags=("Alert Response",),
+        router_attr="ara_route",
+        settings_kwargs={
+            "max_records": "alert_response_max_records",
+            "max_response_time_minutes": "alert_response_max_response_time_minutes",
+        },
+        enabled_flag="alert_response_enabled",
+    ),
+    EngineSpec(
+        name="change_audit",
+        route_module="change_audit",
+        engine="shieldops.audit.change_audit:ChangeAuditAnalyzer",
+        tags=("Change Audit",),
+        router_attr="cau_route",
+        settings_kwargs={
+            "max_records": "change_audit_max_records",
+            "min_audit_compliance_pct": "change_audit_min_audit_compliance_pct",
+        },
+        enabled_flag="change_audit_enabled",
+    ),
+    EngineSpec(
+        name="severity_impact",
+        route_module="severity_impact",
+        engine="shieldops.incidents.severity_impact:SeverityImpactAnalyzer",
+        tags=("Severity Impact",),
+        router_attr="svi_route",
+        settings_kwargs={
+            "max_records": "severity_impact_max_records",
+            "max_high_impact_pct": "severity_impact_max_high_impact_pct",
+        },
+        enabled_flag="severity_impact_enabled",
+    ),
+    EngineSpec(
+        name="api_contract_drift",
+        route_module="api_contract_drift",
+        engine="shieldops.topology.api_contract_drift:APIContractDriftDetector",
+        tags=("API Contract Drift",),
+        router_attr="acd_route",
+        settings_kwargs={
+            "max_records": "api_contract_drift_max_records",
+            "max_breaking_drift_pct": "api_contract_drift_max_breaking_drift_pct",
+        },
+        enabled_flag="api_contract_drift_enabled",
+    ),
+    EngineSpec(
+        name="trace_coverage",
+        route_module="trace_coverage",
+        engine="shieldops.observability.trace_coverage:TraceCoverageAnalyzer",
+        tags=("Trace Coverage",),
+        router_attr="tca_route",
+        settings_kwargs={
+            "max_records": "trace_coverage_max_records",
+            "min_coverage_pct": "trace_coverage_min_coverage_pct",
+        },
+        enabled_flag="trace_coverage_enabled",
+    ),
+    EngineSpec(
+        name="showback_engine",
+        route_module="showback_engine",
+        engine="shieldops.billing.showback_engine:ShowbackEngine",
+        tags=("Showback Engine",),
+        router_attr="sbe_route",
+        settings_kwargs={
+            "max_records": "showback_engine_max_records",
+            "max_over_budget_pct": "showback_engine_max_over_budget_pct",
+        },
+        enabled_flag="showback_engine_enabled",
+    ),
+    EngineSpec(
+        name="deploy_canary_health",
+        route_module="deploy_canary_health",
+        engine="shieldops.changes.deploy_canary_health:DeployCanaryHealthMonitor",
+        tags=("Deploy Canary Health",),
+        router_attr="dch_route",
+        settings_kwargs={
+            "max_records": "deploy_canary_health_max_records",
+            "max_unhealthy_pct": "deploy_canary_health_max_unhealthy_pct",
+        },
+        enabled_flag="deploy_canary_health_enabled",
+    ),
+    EngineSpec(
+        name="maintenance_impact",
+        route_module="maintenance_impact",
+        engine="shieldops.sla.maintenance_impact:MaintenanceImpactAnalyzer",
+        tags=("Maintenance Impact",),
+        router_attr="mia_route",
+        settings_kwargs={
+            "max_records": "maintenance_impact_max_records",
+            "max_impact_minutes": "maintenance_impact_max_impact_minutes",
+        },
+        enabled_flag="maintenance_impact_enabled",
+    ),
+    EngineSpec(
+        name="reservation_optimizer",
+        route_module="reservation_optimizer",
+        engine="shieldops.operations.reservation_optimizer:ReservationOptimizer",
+        tags=("Reservation Optimizer",),
+        router_attr="rvo_route",
+        settings_kwargs={
+            "max_records": "reservation_optimizer_max_records",
+            "min_utilization_pct": "reservation_optimizer_min_utilization_pct",
+        },
+        enabled_flag="reservation_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="secret_rotation_planner",
+        route_module="secret_rotation_planner",
+        engine="shieldops.security.secret_rotation_planner:SecretRotationPlanner",
+        tags=("Secret Rotation",),
+        router_attr="srp_route",
+        settings_kwargs={
+            "max_records": "secret_rotation_planner_max_records",
+            "max_overdue_pct": "secret_rotation_planner_max_overdue_pct",
+        },
+        enabled_flag="secret_rotation_planner_enabled",
+    ),
+    EngineSpec(
+        name="taxonomy_manager",
+        route_module="taxonomy_manager",
+        engine="shieldops.knowledge.taxonomy_manager:TaxonomyManager",
+        tags=("Taxonomy Manager",),
+        router_attr="txm_route",
+        settings_kwargs={
+            "max_records": "taxonomy_manager_max_records",
+            "min_completeness_score": "taxonomy_manager_min_completeness_score",
+        },
+        enabled_flag="taxonomy_manager_enabled",
+    ),
+    EngineSpec(
+        name="audit_evidence_mapper",
+        route_module="audit_evidence_mapper",
+        engine="shieldops.compliance.audit_evidence_mapper:AuditEvidenceMapper",
+        tags=("Audit Evidence Mapper",),
+        router_attr="aem_route",
+        settings_kwargs={
+            "max_records": "audit_evidence_mapper_max_records",
+            "min_mapping_coverage_pct": "audit_evidence_mapper_min_mapping_coverage_pct",
+        },
+        enabled_flag="audit_evidence_mapper_enabled",
+    ),
+    EngineSpec(
+        name="capacity_simulation",
+        route_module="capacity_simulation",
+        engine="shieldops.analytics.capacity_simulation:CapacitySimulationEngine",
+        tags=("Capacity Simulation",),
+        router_attr="cse_route",
+        settings_kwargs={
+            "max_records": "capacity_simulation_max_records",
+            "max_over_capacity_pct": "capacity_simulation_max_over_capacity_pct",
+        },
+        enabled_flag="capacity_simulation_enabled",
+    ),
+    EngineSpec(
+        name="access_review",
+        route_module="access_review",
+        engine="shieldops.audit.access_review:AccessReviewTracker",
+        tags=("Access Review",),
+        router_attr="arv_route",
+        settings_kwargs={
+            "max_records": "access_review_max_records",
+            "min_review_completion_pct": "access_review_min_review_completion_pct",
+        },
+        enabled_flag="access_review_enabled",
+    ),
+    EngineSpec(
+        name="incident_pattern",
+        route_module="incident_pattern",
+        engine="shieldops.incidents.incident_pattern:IncidentPatternDetector",
+        tags=("Incident Pattern",),
+        router_attr="ipt_route",
+        settings_kwargs={
+            "max_records": "incident_pattern_max_records",
+            "max_critical_pattern_pct": "incident_pattern_max_critical_pattern_pct",
+        },
+        enabled_flag="incident_pattern_enabled",
+    ),
+    EngineSpec(
+        name="escalation_path",
+        route_module="escalation_path",
+        engine="shieldops.incidents.escalation_path:EscalationPathAnalyzer",
+        tags=("Escalation Path",),
+        router_attr="esp_route",
+        settings_kwargs={
+            "max_records": "escalation_path_max_records",
+            "max_resolution_time_minutes": "escalation_path_max_resolution_time_minutes",
+        },
+        enabled_flag="escalation_path_enabled",
+    ),
+    EngineSpec(
+        name="dependency_freshness_monitor",
+        route_module="dependency_freshness_monitor",
+        engine="shieldops.topology.dependency_freshness_monitor:DependencyFreshnessMonitor",
+        tags=("Dependency Freshness",),
+        router_attr="dfm_route",
+        settings_kwargs={
+            "max_records": "dependency_freshness_monitor_max_records",
+            "max_stale_pct": "dependency_freshness_monitor_max_stale_pct",
+        },
+        enabled_flag="dependency_freshness_monitor_enabled",
+    ),
+    EngineSpec(
+        name="cost_attribution_engine",
+        route_module="cost_attribution_engine",
+        engine="shieldops.billing.cost_attribution_engine:CostAttributionEngine",
+        tags=("Cost Attribution",),
+        router_attr="cae_route",
+        settings_kwargs={
+            "max_records": "cost_attribution_engine_max_records",
+            "max_disputed_pct": "cost_attribution_engine_max_disputed_pct",
+        },
+        enabled_flag="cost_attribution_engine_enabled",
+    ),
+    EngineSpec(
+        name="deploy_rollback_health",
+        route_module="deploy_rollback_health",
+        engine="shieldops.changes.deploy_rollback_health:DeployRollbackHealthTracker",
+        tags=("Deploy Rollback Health",),
+        router_attr="drh_route",
+        settings_kwargs={
+            "max_records": "deploy_rollback_health_max_records",
+            "max_recovery_time_seconds": "deploy_rollback_health_max_recovery_time_seconds",
+        },
+        enabled_flag="deploy_rollback_health_enabled",
+    ),
+    EngineSpec(
+        name="slo_error_budget_tracker",
+        route_module="slo_error_budget_tracker",
+        engine="shieldops.sla.slo_error_budget_tracker:SLOErrorBudgetTracker",
+        tags=("SLO Error Budget",),
+        router_attr="ebt_route",
+        settings_kwargs={
+            "max_records": "slo_error_budget_tracker_max_records",
+            "min_remaining_budget_pct": "slo_error_budget_tracker_min_remaining_budget_pct",
+        },
+        enabled_flag="slo_error_budget_tracker_enabled",
+    ),
+    EngineSpec(
+        name="operational_readiness",
+        route_module="operational_readiness",
+        engine="shieldops.operations.operational_readiness:OperationalReadinessScorer",
+        tags=("Operational Readiness",),
+        router_attr="opr_route",
+        settings_kwargs={
+            "max_records": "operational_readiness_max_records",
+            "min_readiness_score": "operational_readiness_min_readiness_score",
+        },
+        enabled_flag="operational_readiness_enabled",
+    ),
+    EngineSpec(
+        name="threat_intelligence",
+        route_module="threat_intelligence",
+        engine="shieldops.security.threat_intelligence:ThreatIntelligenceTracker",
+        tags=("Threat Intelligence",),
+        router_attr="tin_route",
+        settings_kwargs={
+            "max_records": "threat_intelligence_max_records",
+            "min_threat_confidence_pct": "threat_intelligence_min_threat_confidence_pct",
+        },
+        enabled_flag="threat_intelligence_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_graph",
+        route_module="knowledge_graph",
+        engine="shieldops.knowledge.knowledge_graph:KnowledgeGraphManager",
+        tags=("Knowledge Graph",),
+        router_attr="kgm_route",
+        settings_kwargs={
+            "max_records": "knowledge_graph_max_records",
+            "max_orphan_pct": "knowledge_graph_max_orphan_pct",
+        },
+        enabled_flag="knowledge_graph_enabled",
+    ),
+    EngineSpec(
+        name="compliance_evidence_chain",
+        route_module="compliance_evidence_chain",
+        engine="shieldops.compliance.compliance_evidence_chain:ComplianceEvidenceChainTracker",
+        tags=("Compliance Evidence Chain",),
+        router_attr="cec_route",
+        settings_kwargs={
+            "max_records": "compliance_evidence_chain_max_records",
+            "max_broken_chain_pct": "compliance_evidence_chain_max_broken_chain_pct",
+        },
+        enabled_flag="compliance_evidence_chain_enabled",
+    ),
+    EngineSpec(
+        name="capacity_headroom",
+        route_module="capacity_headroom",
+        engine="shieldops.analytics.capacity_headroom:CapacityHeadroomAnalyzer",
+        tags=("Capacity Headroom",),
+        router_attr="chm_route",
+        settings_kwargs={
+            "max_records": "capacity_headroom_max_records",
+            "min_headroom_pct": "capacity_headroom_min_headroom_pct",
+        },
+        enabled_flag="capacity_headroom_enabled",
+    ),
+    EngineSpec(
+        name="change_velocity",
+        route_module="change_velocity",
+        engine="shieldops.changes.change_velocity:ChangeVelocityTracker",
+        tags=("Change Velocity",),
+        router_attr="cvl_route",
+        settings_kwargs={
+            "max_records": "change_velocity_max_records",
+            "max_changes_per_day": "change_velocity_max_changes_per_day",
+        },
+        enabled_flag="change_velocity_enabled",
+    ),
+    EngineSpec(
+        name="incident_debrief",
+        route_module="incident_debrief",
+        engine="shieldops.incidents.incident_debrief:IncidentDebriefTracker",
+        tags=("Incident Debrief",),
+        router_attr="idb_route",
+        settings_kwargs={
+            "max_records": "incident_debrief_max_records",
+            "min_debrief_quality_pct": "incident_debrief_min_debrief_quality_pct",
+        },
+        enabled_flag="incident_debrief_enabled",
+    ),
+    EngineSpec(
+        name="dependency_circuit_breaker",
+        route_module="dependency_circuit_breaker",
+        engine="shieldops.topology.dependency_circuit_breaker:DependencyCircuitBreakerMonitor",
+        tags=("Dependency Circuit Breaker",),
+        router_attr="dcb_route",
+        settings_kwargs={
+            "max_records": "dependency_circuit_breaker_max_records",
+            "max_open_circuit_pct": "dependency_circuit_breaker_max_open_circuit_pct",
+        },
+        enabled_flag="dependency_circuit_breaker_enabled",
+    ),
+    EngineSpec(
+        name="metric_cardinality_planner",
+        route_module="metric_cardinality_planner",
+        engine="shieldops.observability.metric_cardinality_planner:MetricCardinalityPlanner",
+        tags=("Metric Cardinality",),
+        router_attr="mcp_route",
+        settings_kwargs={
+            "max_records": "metric_cardinality_planner_max_records",
+            "max_high_cardinality_pct": "metric_cardinality_planner_max_high_cardinality_pct",
+        },
+        enabled_flag="metric_cardinality_planner_enabled",
+    ),
+    EngineSpec(
+        name="cost_forecast_accuracy",
+        route_module="cost_forecast_accuracy",
+        engine="shieldops.billing.cost_forecast_accuracy:CostForecastAccuracyTracker",
+        tags=("Cost Forecast Accuracy",),
+        router_attr="cfa_route",
+        settings_kwargs={
+            "max_records": "cost_forecast_accuracy_max_records",
+            "min_accuracy_pct": "cost_forecast_accuracy_min_accuracy_pct",
+        },
+        enabled_flag="cost_forecast_accuracy_enabled",
+    ),
+    EngineSpec(
+        name="deploy_gate_tracker",
+        route_module="deploy_gate_tracker",
+        engine="shieldops.changes.deploy_gate_tracker:DeployGateTracker",
+        tags=("Deploy Gate",),
+        router_attr="dgt_route",
+        settings_kwargs={
+            "max_records": "deploy_gate_tracker_max_records",
+            "max_gate_failure_pct": "deploy_gate_tracker_max_gate_failure_pct",
+        },
+        enabled_flag="deploy_gate_tracker_enabled",
+    ),
+    EngineSpec(
+        name="slo_window_analyzer",
+        route_module="slo_window_analyzer",
+        engine="shieldops.sla.slo_window_analyzer:SLOWindowAnalyzer",
+        tags=("SLO Window",),
+        router_attr="swa_route",
+        settings_kwargs={
+            "max_records": "slo_window_analyzer_max_records",
+            "min_compliance_pct": "slo_window_analyzer_min_compliance_pct",
+        },
+        enabled_flag="slo_window_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="runbook_dependency",
+        route_module="runbook_dependency",
+        engine="shieldops.operations.runbook_dependency:RunbookDependencyMapper",
+        tags=("Runbook Dependency",),
+        router_attr="rbd_route",
+        settings_kwargs={
+            "max_records": "runbook_dependency_max_records",
+            "max_broken_dependency_pct": "runbook_dependency_max_broken_dependency_pct",
+        },
+        enabled_flag="runbook_dependency_enabled",
+    ),
+    EngineSpec(
+        name="security_posture_gap",
+        route_module="security_posture_gap",
+        engine="shieldops.security.security_posture_gap:SecurityPostureGapAnalyzer",
+        tags=("Security Posture Gap",),
+        router_attr="spg_route",
+        settings_kwargs={
+            "max_records": "security_posture_gap_max_records",
+            "max_critical_gap_pct": "security_posture_gap_max_critical_gap_pct",
+        },
+        enabled_flag="security_posture_gap_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_retention",
+        route_module="knowledge_retention",
+        engine="shieldops.knowledge.knowledge_retention:KnowledgeRetentionTracker",
+        tags=("Knowledge Retention",),
+        router_attr="krt_route",
+        settings_kwargs={
+            "max_records": "knowledge_retention_max_records",
+            "min_retention_score": "knowledge_retention_min_retention_score",
+        },
+        enabled_flag="knowledge_retention_enabled",
+    ),
+    EngineSpec(
+        name="audit_finding_tracker",
+        route_module="audit_finding_tracker",
+        engine="shieldops.audit.audit_finding_tracker:AuditFindingTracker",
+        tags=("Audit Finding",),
+        router_attr="afk_route",
+        settings_kwargs={
+            "max_records": "audit_finding_tracker_max_records",
+            "max_open_finding_pct": "audit_finding_tracker_max_open_finding_pct",
+        },
+        enabled_flag="audit_finding_tracker_enabled",
+    ),
+    EngineSpec(
+        name="capacity_reservation_planner",
+        route_module="capacity_reservation_planner",
+        engine="shieldops.billing.capacity_reservation_planner:CapacityReservationPlanner",
+        tags=("Capacity Reservation",),
+        router_attr="crv_route",
+        settings_kwargs={
+            "max_records": "capacity_reservation_planner_max_records",
+            "min_utilization_pct": "capacity_reservation_planner_min_utilization_pct",
+        },
+        enabled_flag="capacity_reservation_planner_enabled",
+    ),
+    EngineSpec(
+        name="change_approval_flow",
+        route_module="change_approval_flow",
+        engine="shieldops.changes.change_approval_flow:ChangeApprovalFlowTracker",
+        tags=("Change Approval Flow",),
+        router_attr="caf_route",
+        settings_kwargs={
+            "max_records": "change_approval_flow_max_records",
+            "max_approval_time_hours": "change_approval_flow_max_approval_time_hours",
+        },
+        enabled_flag="change_approval_flow_enabled",
+    ),
+    EngineSpec(
+        name="incident_response_time",
+        route_module="incident_response_time",
+        engine="shieldops.incidents.incident_response_time:IncidentResponseTimeTracker",
+        tags=("Incident Response Time",),
+        router_attr="irs_route",
+        settings_kwargs={
+            "max_records": "incident_response_time_max_records",
+            "max_response_time_minutes": "incident_response_time_max_response_time_minutes",
+        },
+        enabled_flag="incident_response_time_enabled",
+    ),
+    EngineSpec(
+        name="topology_change_tracker",
+        route_module="topology_change_tracker",
+        engine="shieldops.topology.topology_change_tracker:TopologyChangeTracker",
+        tags=("Topology Change Tracker",),
+        router_attr="tct_route",
+        settings_kwargs={
+            "max_records": "topology_change_tracker_max_records",
+            "max_high_impact_pct": "topology_change_tracker_max_high_impact_pct",
+        },
+        enabled_flag="topology_change_tracker_enabled",
+    ),
+    EngineSpec(
+        name="observability_budget_planner",
+        route_module="observability_budget_planner",
+        engine="shieldops.observability.observability_budget_planner:ObservabilityBudgetPlanner",
+        tags=("Observability Budget Planner",),
+        router_attr="obp_route",
+        settings_kwargs={
+            "max_records": "observability_budget_planner_max_records",
+            "max_over_budget_pct": "observability_budget_planner_max_over_budget_pct",
+        },
+        enabled_flag="observability_budget_planner_enabled",
+    ),
+    EngineSpec(
+        name="cost_variance_analyzer",
+        route_module="cost_variance_analyzer",
+        engine="shieldops.billing.cost_variance_analyzer:CostVarianceAnalyzer",
+        tags=("Cost Variance Analyzer",),
+        router_attr="cva_route",
+        settings_kwargs={
+            "max_records": "cost_variance_analyzer_max_records",
+            "max_variance_pct": "cost_variance_analyzer_max_variance_pct",
+        },
+        enabled_flag="cost_variance_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="deploy_dependency_tracker",
+        route_module="deploy_dependency_tracker",
+        engine="shieldops.changes.deploy_dependency_tracker:DeployDependencyTracker",
+        tags=("Deploy Dependency Tracker",),
+        router_attr="ddt_route",
+        settings_kwargs={
+            "max_records": "deploy_dependency_tracker_max_records",
+            "max_wait_time_minutes": "deploy_dependency_tracker_max_wait_time_minutes",
+        },
+        enabled_flag="deploy_dependency_tracker_enabled",
+    ),
+    EngineSpec(
+        name="slo_breach_analyzer",
+        route_module="slo_breach_analyzer",
+        engine="shieldops.sla.slo_breach_analyzer:SLOBreachAnalyzer",
+        tags=("SLO Breach Analyzer",),
+        router_attr="sba_route",
+        settings_kwargs={
+            "max_records": "slo_breach_analyzer_max_records",
+            "max_breach_duration_minutes": "slo_breach_analyzer_max_breach_duration_minutes",
+        },
+        enabled_flag="slo_breach_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="runbook_effectiveness_scorer",
+        route_module="runbook_effectiveness_scorer",
+        engine="shieldops.operations.runbook_effectiveness_scorer:RunbookEffectivenessScorer",
+        tags=("Runbook Effectiveness Scorer",),
+        router_attr="res_route",
+        settings_kwargs={
+            "max_records": "runbook_effectiveness_scorer_max_records",
+            "min_effectiveness_score": "runbook_effectiveness_scorer_min_effectiveness_score",
+        },
+        enabled_flag="runbook_effectiveness_scorer_enabled",
+    ),
+    EngineSpec(
+        name="threat_response_tracker",
+        route_module="threat_response_tracker",
+        engine="shieldops.security.threat_response_tracker:ThreatResponseTracker",
+        tags=("Threat Response Tracker",),
+        router_attr="trt_route",
+        settings_kwargs={
+            "max_records": "threat_response_tracker_max_records",
+            "max_response_time_hours": "threat_response_tracker_max_response_time_hours",
+        },
+        enabled_flag="threat_response_tracker_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_gap_detector",
+        route_module="knowledge_gap_detector",
+        engine="shieldops.knowledge.knowledge_gap_detector:KnowledgeGapDetector",
+        tags=("Knowledge Gap Detector",),
+        router_attr="kgd_route",
+        settings_kwargs={
+            "max_records": "knowledge_gap_detector_max_records",
+            "min_coverage_pct": "knowledge_gap_detector_min_coverage_pct",
+        },
+        enabled_flag="knowledge_gap_detector_enabled",
+    ),
+    EngineSpec(
+        name="audit_compliance_mapper",
+        route_module="audit_compliance_mapper",
+        engine="shieldops.audit.audit_compliance_mapper:AuditComplianceMapper",
+        tags=("Audit Compliance Mapper",),
+        router_attr="acm_route",
+        settings_kwargs={
+            "max_records": "audit_compliance_mapper_max_records",
+            "min_coverage_score": "audit_compliance_mapper_min_coverage_score",
+        },
+        enabled_flag="audit_compliance_mapper_enabled",
+    ),
+    EngineSpec(
+        name="capacity_scaling_advisor",
+        route_module="capacity_scaling_advisor",
+        engine="shieldops.analytics.capacity_scaling_advisor:CapacityScalingAdvisor",
+        tags=("Capacity Scaling Advisor",),
+        router_attr="csa_route",
+        settings_kwargs={
+            "max_records": "capacity_scaling_advisor_max_records",
+            "min_efficiency_score": "capacity_scaling_advisor_min_efficiency_score",
+        },
+        enabled_flag="capacity_scaling_advisor_enabled",
+    ),
+    EngineSpec(
+        name="change_risk_classifier",
+        route_module="change_risk_classifier",
+        engine="shieldops.changes.change_risk_classifier:ChangeRiskClassifier",
+        tags=("Change Risk Classifier",),
+        router_attr="crc_route",
+        settings_kwargs={
+            "max_records": "change_risk_classifier_max_records",
+            "max_high_risk_pct": "change_risk_classifier_max_high_risk_pct",
+        },
+        enabled_flag="change_risk_classifier_enabled",
+    ),
+    EngineSpec(
+        name="incident_pattern_analyzer",
+        route_module="incident_pattern_analyzer",
+        engine="shieldops.incidents.incident_pattern_analyzer:IncidentPatternAnalyzer",
+        tags=("Incident Pattern Analyzer",),
+        router_attr="ipz_route",
+        settings_kwargs={
+            "max_records": "incident_pattern_analyzer_max_records",
+            "max_recurring_pct": "incident_pattern_analyzer_max_recurring_pct",
+        },
+        enabled_flag="incident_pattern_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="service_dependency_scorer",
+        route_module="service_dependency_scorer",
+        engine="shieldops.topology.service_dependency_scorer:ServiceDependencyScorer",
+        tags=("Service Dependency Scorer",),
+        router_attr="sdx_route",
+        settings_kwargs={
+            "max_records": "service_dependency_scorer_max_records",
+            "min_health_score": "service_dependency_scorer_min_health_score",
+        },
+        enabled_flag="service_dependency_scorer_enabled",
+    ),
+    EngineSpec(
+        name="alert_noise_profiler",
+        route_module="alert_noise_profiler",
+        engine="shieldops.observability.alert_noise_profiler:AlertNoiseProfiler",
+        tags=("Alert Noise Profiler",),
+        router_attr="anf_route",
+        settings_kwargs={
+            "max_records": "alert_noise_profiler_max_records",
+            "max_noise_ratio": "alert_noise_profiler_max_noise_ratio",
+        },
+        enabled_flag="alert_noise_profiler_enabled",
+    ),
+    EngineSpec(
+        name="cost_optimization_tracker",
+        route_module="cost_optimization_tracker",
+        engine="shieldops.billing.cost_optimization_tracker:CostOptimizationTracker",
+        tags=("Cost Optimization Tracker",),
+        router_attr="cox_route",
+        settings_kwargs={
+            "max_records": "cost_optimization_tracker_max_records",
+            "min_savings_pct": "cost_optimization_tracker_min_savings_pct",
+        },
+        enabled_flag="cost_optimization_tracker_enabled",
+    ),
+    EngineSpec(
+        name="deploy_verification_tracker",
+        route_module="deploy_verification_tracker",
+        engine="shieldops.changes.deploy_verification_tracker:DeployVerificationTracker",
+        tags=("Deploy Verification Tracker",),
+        router_attr="dhx_route",
+        settings_kwargs={
+            "max_records": "deploy_verification_tracker_max_records",
+            "min_coverage_pct": "deploy_verification_tracker_min_coverage_pct",
+        },
+        enabled_flag="deploy_verification_tracker_enabled",
+    ),
+    EngineSpec(
+        name="slo_compliance_monitor",
+        route_module="slo_compliance_monitor",
+        engine="shieldops.sla.slo_compliance_monitor:SLOComplianceMonitor",
+        tags=("SLO Compliance Monitor",),
+        router_attr="slc_route",
+        settings_kwargs={
+            "max_records": "slo_compliance_monitor_max_records",
+            "min_compliance_pct": "slo_compliance_monitor_min_compliance_pct",
+        },
+        enabled_flag="slo_compliance_monitor_enabled",
+    ),
+    EngineSpec(
+        name="runbook_quality_scorer",
+        route_module="runbook_quality_scorer",
+        engine="shieldops.operations.runbook_quality_scorer:RunbookQualityScorer",
+        tags=("Runbook Quality Scorer",),
+        router_attr="rqx_route",
+        settings_kwargs={
+            "max_records": "runbook_quality_scorer_max_records",
+            "min_quality_score": "runbook_quality_scorer_min_quality_score",
+        },
+        enabled_flag="runbook_quality_scorer_enabled",
+    ),
+    EngineSpec(
+        name="vulnerability_response_tracker",
+        route_module="vulnerability_response_tracker",
+        engine="shieldops.security.vulnerability_response_tracker:VulnerabilityResponseTracker",
+        tags=("Vulnerability Response Tracker",),
+        router_attr="vrx_route",
+        settings_kwargs={
+            "max_records": "vulnerability_response_tracker_max_records",
+            "max_remediation_days": "vulnerability_response_tracker_max_remediation_days",
+        },
+        enabled_flag="vulnerability_response_tracker_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_freshness_scorer",
+        route_module="knowledge_freshness_scorer",
+        engine="shieldops.knowledge.knowledge_freshness_scorer:KnowledgeFreshnessScorer",
+        tags=("Knowledge Freshness Scorer",),
+        router_attr="kfx_route",
+        settings_kwargs={
+            "max_records": "knowledge_freshness_scorer_max_records",
+            "min_freshness_score": "knowledge_freshness_scorer_min_freshness_score",
+        },
+        enabled_flag="knowledge_freshness_scorer_enabled",
+    ),
+    EngineSpec(
+        name="audit_control_assessor",
+        route_module="audit_control_assessor",
+        engine="shieldops.audit.audit_control_assessor:AuditControlAssessor",
+        tags=("Audit Control Assessor",),
+        router_attr="acx_route",
+        settings_kwargs={
+            "max_records": "audit_control_assessor_max_records",
+            "min_effectiveness_score": "audit_control_assessor_min_effectiveness_score",
+        },
+        enabled_flag="audit_control_assessor_enabled",
+    ),
+    EngineSpec(
+        name="capacity_utilization_tracker",
+        route_module="capacity_utilization_tracker",
+        engine="shieldops.analytics.capacity_utilization_tracker:CapacityUtilizationTracker",
+        tags=("Capacity Utilization Tracker",),
+        router_attr="cux_route",
+        settings_kwargs={
+            "max_records": "capacity_utilization_tracker_max_records",
+            "min_utilization_pct": "capacity_utilization_tracker_min_utilization_pct",
+        },
+        enabled_flag="capacity_utilization_tracker_enabled",
+    ),
+    EngineSpec(
+        name="change_impact_predictor",
+        route_module="change_impact_predictor",
+        engine="shieldops.changes.change_impact_predictor:ChangeImpactPredictor",
+        tags=("Change Impact Predictor",),
+        router_attr="cpx_route",
+        settings_kwargs={
+            "max_records": "change_impact_predictor_max_records",
+            "max_high_impact_pct": "change_impact_predictor_max_high_impact_pct",
+        },
+        enabled_flag="change_impact_predictor_enabled",
+    ),
+    EngineSpec(
+        name="incident_escalation_scorer",
+        route_module="incident_escalation_scorer",
+        engine="shieldops.incidents.incident_escalation_scorer:IncidentEscalationScorer",
+        tags=("Incident Escalation Scorer",),
+        router_attr="iex_route",
+        settings_kwargs={
+            "max_records": "incident_escalation_scorer_max_records",
+            "min_quality_score": "incident_escalation_scorer_min_quality_score",
+        },
+        enabled_flag="incident_escalation_scorer_enabled",
+    ),
+    EngineSpec(
+        name="topology_drift_detector",
+        route_module="topology_drift_detector",
+        engine="shieldops.topology.topology_drift_detector:TopologyDriftDetector",
+        tags=("Topology Drift Detector",),
+        router_attr="tdx_route",
+        settings_kwargs={
+            "max_records": "topology_drift_detector_max_records",
+            "max_critical_drift_pct": "topology_drift_detector_max_critical_drift_pct",
+        },
+        enabled_flag="topology_drift_detector_enabled",
+    ),
+    EngineSpec(
+        name="alert_correlation_profiler",
+        route_module="alert_correlation_profiler",
+        engine="shieldops.observability.alert_correlation_profiler:AlertCorrelationProfiler",
+        tags=("Alert Correlation Profiler",),
+        router_attr="acq_route",
+        settings_kwargs={
+            "max_records": "alert_correlation_profiler_max_records",
+            "min_correlation_score": "alert_correlation_profiler_min_correlation_score",
+        },
+        enabled_flag="alert_correlation_profiler_enabled",
+    ),
+    EngineSpec(
+        name="cost_allocation_validator",
+        route_module="cost_allocation_validator",
+        engine="shieldops.billing.cost_allocation_validator:CostAllocationValidator",
+        tags=("Cost Allocation Validator",),
+        router_attr="clv_route",
+        settings_kwargs={
+            "max_records": "cost_allocation_validator_max_records",
+            "min_accuracy_pct": "cost_allocation_validator_min_accuracy_pct",
+        },
+        enabled_flag="cost_allocation_validator_enabled",
+    ),
+    EngineSpec(
+        name="deploy_canary_analyzer",
+        route_module="deploy_canary_analyzer",
+        engine="shieldops.changes.deploy_canary_analyzer:DeployCanaryAnalyzer",
+        tags=("Deploy Canary Analyzer",),
+        router_attr="dcx_route",
+        settings_kwargs={
+            "max_records": "deploy_canary_analyzer_max_records",
+            "min_success_rate": "deploy_canary_analyzer_min_success_rate",
+        },
+        enabled_flag="deploy_canary_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="slo_error_budget_forecaster",
+        route_module="slo_error_budget_forecaster",
+        engine="shieldops.sla.slo_error_budget_forecaster:SLOErrorBudgetForecaster",
+        tags=("SLO Error Budget Forecaster",),
+        router_attr="ebx_route",
+        settings_kwargs={
+            "max_records": "slo_error_budget_forecaster_max_records",
+            "min_remaining_pct": "slo_error_budget_forecaster_min_remaining_pct",
+        },
+        enabled_flag="slo_error_budget_forecaster_enabled",
+    ),
+    EngineSpec(
+        name="runbook_automation_scorer",
+        route_module="runbook_automation_scorer",
+        engine="shieldops.operations.runbook_automation_scorer:RunbookAutomationScorer",
+        tags=("Runbook Automation Scorer",),
+        router_attr="rax_route",
+        settings_kwargs={
+            "max_records": "runbook_automation_scorer_max_records",
+            "min_automation_score": "runbook_automation_scorer_min_automation_score",
+        },
+        enabled_flag="runbook_automation_scorer_enabled",
+    ),
+    EngineSpec(
+        name="threat_surface_analyzer",
+        route_module="threat_surface_analyzer",
+        engine="shieldops.security.threat_surface_analyzer:ThreatSurfaceAnalyzer",
+        tags=("Threat Surface Analyzer",),
+        router_attr="tsx_route",
+        settings_kwargs={
+            "max_records": "threat_surface_analyzer_max_records",
+            "max_exposure_score": "threat_surface_analyzer_max_exposure_score",
+        },
+        enabled_flag="threat_surface_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_quality_assessor",
+        route_module="knowledge_quality_assessor",
+        engine="shieldops.knowledge.knowledge_quality_assessor:KnowledgeQualityAssessor",
+        tags=("Knowledge Quality Assessor",),
+        router_attr="kqx_route",
+        settings_kwargs={
+            "max_records": "knowledge_quality_assessor_max_records",
+            "min_quality_score": "knowledge_quality_assessor_min_quality_score",
+        },
+        enabled_flag="knowledge_quality_assessor_enabled",
+    ),
+    EngineSpec(
+        name="audit_remediation_tracker",
+        route_module="audit_remediation_tracker",
+        engine="shieldops.audit.audit_remediation_tracker:AuditRemediationTracker",
+        tags=("Audit Remediation Tracker",),
+        router_attr="arx_route",
+        settings_kwargs={
+            "max_records": "audit_remediation_tracker_max_records",
+            "max_remediation_days": "audit_remediation_tracker_max_remediation_days",
+        },
+        enabled_flag="audit_remediation_tracker_enabled",
+    ),
+    EngineSpec(
+        name="capacity_forecast_validator",
+        route_module="capacity_forecast_validator",
+        engine="shieldops.analytics.capacity_forecast_validator:CapacityForecastValidator",
+        tags=("Capacity Forecast Validator",),
+        router_attr="cfx_route",
+        settings_kwargs={
+            "max_records": "capacity_forecast_validator_max_records",
+            "min_accuracy_pct": "capacity_forecast_validator_min_accuracy_pct",
+        },
+        enabled_flag="capacity_forecast_validator_enabled",
+    ),
+    EngineSpec(
+        name="change_window_analyzer",
+        route_module="change_window_analyzer",
+        engine="shieldops.changes.change_window_analyzer:ChangeWindowAnalyzer",
+        tags=("Change Window Analyzer",),
+        router_attr="cwx_route",
+        settings_kwargs={
+            "max_records": "change_window_analyzer_max_records",
+            "min_compliance_pct": "change_window_analyzer_min_compliance_pct",
+        },
+        enabled_flag="change_window_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="incident_mitigation_tracker",
+        route_module="incident_mitigation_tracker",
+        engine="shieldops.incidents.incident_mitigation_tracker:IncidentMitigationTracker",
+        tags=("Incident Mitigation Tracker",),
+        router_attr="imt_route",
+        settings_kwargs={
+            "max_records": "incident_mitigation_max_records",
+            "effectiveness_threshold": "incident_mitigation_effectiveness_threshold",
+        },
+        enabled_flag="incident_mitigation_enabled",
+    ),
+    EngineSpec(
+        name="service_routing_optimizer",
+        route_module="service_routing_optimizer",
+        engine="shieldops.topology.service_routing_optimizer:ServiceRoutingOptimizer",
+        tags=("Service Routing Optimizer",),
+        router_attr="sro_route",
+        settings_kwargs={
+            "max_records": "service_routing_opt_max_records",
+            "latency_threshold_ms": "service_routing_opt_latency_threshold_ms",
+        },
+        enabled_flag="service_routing_opt_enabled",
+    ),
+    EngineSpec(
+        name="metric_anomaly_classifier",
+        route_module="metric_anomaly_classifier",
+        engine="shieldops.observability.metric_anomaly_classifier:MetricAnomalyClassifier",
+        tags=("Metric Anomaly Classifier",),
+        router_attr="mac_route",
+        settings_kwargs={
+            "max_records": "metric_anomaly_cls_max_records",
+            "confidence_threshold": "metric_anomaly_cls_confidence_threshold",
+        },
+        enabled_flag="metric_anomaly_cls_enabled",
+    ),
+    EngineSpec(
+        name="cost_governance_enforcer",
+        route_module="cost_governance_enforcer",
+        engine="shieldops.billing.cost_governance_enforcer:CostGovernanceEnforcer",
+        tags=("Cost Governance Enforcer",),
+        router_attr="cge_route",
+        settings_kwargs={
+            "max_records": "cost_governance_max_records",
+            "max_violation_rate": "cost_governance_max_violation_rate",
+        },
+        enabled_flag="cost_governance_enabled",
+    ),
+    EngineSpec(
+        name="change_rollout_planner",
+        route_module="change_rollout_planner",
+        engine="shieldops.changes.change_rollout_planner:ChangeRolloutPlanner",
+        tags=("Change Rollout Planner",),
+        router_attr="crl_route",
+        settings_kwargs={
+            "max_records": "change_rollout_max_records",
+            "risk_tolerance_threshold": "change_rollout_risk_tolerance_threshold",
+        },
+        enabled_flag="change_rollout_enabled",
+    ),
+    EngineSpec(
+        name="slo_threshold_optimizer",
+        route_module="slo_threshold_optimizer",
+        engine="shieldops.sla.slo_threshold_optimizer:SloThresholdOptimizer",
+        tags=("SLO Threshold Optimizer",),
+        router_attr="sto_route",
+        settings_kwargs={
+            "max_records": "slo_threshold_opt_max_records",
+            "adjustment_sensitivity": "slo_threshold_opt_adjustment_sensitivity",
+        },
+        enabled_flag="slo_threshold_opt_enabled",
+    ),
+    EngineSpec(
+        name="operational_hygiene_scorer",
+        route_module="operational_hygiene_scorer",
+        engine="shieldops.operations.operational_hygiene_scorer:OperationalHygieneScorer",
+        tags=("Operational Hygiene Scorer",),
+        router_attr="ohs_route",
+        settings_kwargs={
+            "max_records": "operational_hygiene_max_records",
+            "min_hygiene_score": "operational_hygiene_min_hygiene_score",
+        },
+        enabled_flag="operational_hygiene_enabled",
+    ),
+    EngineSpec(
+        name="security_signal_correlator",
+        route_module="security_signal_correlator",
+        engine="shieldops.security.security_signal_correlator:SecuritySignalCorrelator",
+        tags=("Security Signal Correlator",),
+        router_attr="ssc_route",
+        settings_kwargs={
+            "max_records": "security_signal_corr_max_records",
+            "correlation_confidence_threshold": (
+                "security_signal_corr_correlation_confidence_threshold"
+            ),
+        },
+        enabled_flag="security_signal_corr_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_reuse_tracker",
+        route_module="knowledge_reuse_tracker",
+        engine="shieldops.knowledge.knowledge_reuse_tracker:KnowledgeReuseTracker",
+        tags=("Knowledge Reuse Tracker",),
+        router_attr="kru_route",
+        settings_kwargs={
+            "max_records": "knowledge_reuse_max_records",
+            "min_reuse_score": "knowledge_reuse_min_reuse_score",
+        },
+        enabled_flag="knowledge_reuse_enabled",
+    ),
+    EngineSpec(
+        name="audit_workflow_optimizer",
+        route_module="audit_workflow_optimizer",
+        engine="shieldops.audit.audit_workflow_optimizer:AuditWorkflowOptimizer",
+        tags=("Audit Workflow Optimizer",),
+        router_attr="awo_route",
+        settings_kwargs={
+            "max_records": "audit_workflow_opt_max_records",
+            "cycle_time_threshold": "audit_workflow_opt_cycle_time_threshold",
+        },
+        enabled_flag="audit_workflow_opt_enabled",
+    ),
+    EngineSpec(
+        name="performance_baseline_tracker",
+        route_module="performance_baseline_tracker",
+        engine="shieldops.analytics.performance_baseline_tracker:PerformanceBaselineTracker",
+        tags=("Performance Baseline Tracker",),
+        router_attr="pbk_route",
+        settings_kwargs={
+            "max_records": "perf_baseline_tracker_max_records",
+            "deviation_threshold": "perf_baseline_tracker_deviation_threshold",
+        },
+        enabled_flag="perf_baseline_tracker_enabled",
+    ),
+    EngineSpec(
+        name="compliance_control_mapper",
+        route_module="compliance_control_mapper",
+        engine="shieldops.compliance.compliance_control_mapper:ComplianceControlMapper",
+        tags=("Compliance Control Mapper",),
+        router_attr="ccm_route",
+        settings_kwargs={
+            "max_records": "compliance_control_map_max_records",
+            "coverage_gap_threshold": "compliance_control_map_coverage_gap_threshold",
+        },
+        enabled_flag="compliance_control_map_enabled",
+    ),
+    EngineSpec(
+        name="stakeholder_impact_tracker",
+        route_module="stakeholder_impact_tracker",
+        engine="shieldops.incidents.stakeholder_impact_tracker:StakeholderImpactTracker",
+        tags=("Stakeholder Impact Tracker",),
+        router_attr="sit_route",
+        settings_kwargs={
+            "max_records": "stakeholder_impact_tracker_max_records",
+            "impact_score_threshold": "stakeholder_impact_tracker_impact_score_threshold",
+        },
+        enabled_flag="stakeholder_impact_tracker_enabled",
+    ),
+    EngineSpec(
+        name="service_health_predictor",
+        route_module="service_health_predictor",
+        engine="shieldops.topology.service_health_predictor:ServiceHealthPredictor",
+        tags=("Service Health Predictor",),
+        router_attr="shp_route",
+        settings_kwargs={
+            "max_records": "service_health_predictor_max_records",
+            "prediction_confidence_threshold": (
+                "service_health_predictor_prediction_confidence_threshold"
+            ),
+        },
+        enabled_flag="service_health_predictor_enabled",
+    ),
+    EngineSpec(
+        name="metric_collection_optimizer",
+        route_module="metric_collection_optimizer",
+        engine="shieldops.observability.metric_collection_optimizer:MetricCollectionOptimizer",
+        tags=("Metric Collection Optimizer",),
+        router_attr="mco_route",
+        settings_kwargs={
+            "max_records": "metric_collection_optimizer_max_records",
+            "collection_efficiency_threshold": (
+                "metric_collection_optimizer_collection_efficiency_threshold"
+            ),
+        },
+        enabled_flag="metric_collection_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="cost_forecast_precision",
+        route_module="cost_forecast_precision",
+        engine="shieldops.billing.cost_forecast_precision:CostForecastPrecision",
+        tags=("Cost Forecast Precision",),
+        router_attr="cfp_route",
+        settings_kwargs={
+            "max_records": "cost_forecast_precision_max_records",
+            "precision_accuracy_threshold": "cost_forecast_precision_precision_accuracy_threshold",
+        },
+        enabled_flag="cost_forecast_precision_enabled",
+    ),
+    EngineSpec(
+        name="change_coordination_planner",
+        route_module="change_coordination_planner",
+        engine="shieldops.changes.change_coordination_planner:ChangeCoordinationPlanner",
+        tags=("Change Coordination Planner",),
+        router_attr="ccp_route",
+        settings_kwargs={
+            "max_records": "change_coordination_planner_max_records",
+            "coordination_risk_threshold": (
+                "change_coordination_planner_coordination_risk_threshold"
+            ),
+        },
+        enabled_flag="change_coordination_planner_enabled",
+    ),
+    EngineSpec(
+        name="slo_cross_correlation",
+        route_module="slo_cross_correlation",
+        engine="shieldops.sla.slo_cross_correlation:SLOCrossCorrelation",
+        tags=("SLO Cross-Correlation",),
+        router_attr="sxc_route",
+        settings_kwargs={
+            "max_records": "slo_cross_correlation_max_records",
+            "correlation_strength_threshold": (
+                "slo_cross_correlation_correlation_strength_threshold"
+            ),
+        },
+        enabled_flag="slo_cross_correlation_enabled",
+    ),
+    EngineSpec(
+        name="team_capacity_planner",
+        route_module="team_capacity_planner",
+        engine="shieldops.operations.team_capacity_planner:TeamCapacityPlanner",
+        tags=("Team Capacity Planner",),
+        router_attr="tcp_route",
+        settings_kwargs={
+            "max_records": "team_capacity_planner_max_records",
+            "capacity_utilization_threshold": (
+                "team_capacity_planner_capacity_utilization_threshold"
+            ),
+        },
+        enabled_flag="team_capacity_planner_enabled",
+    ),
+    EngineSpec(
+        name="security_compliance_scorer",
+        route_module="security_compliance_scorer",
+        engine="shieldops.security.security_compliance_scorer:SecurityComplianceScorer",
+        tags=("Security Compliance Scorer",),
+        router_attr="scs_route",
+        settings_kwargs={
+            "max_records": "security_compliance_scorer_max_records",
+            "compliance_gap_threshold": "security_compliance_scorer_compliance_gap_threshold",
+        },
+        enabled_flag="security_compliance_scorer_enabled",
+    ),
+    EngineSpec(
+        name="knowledge_impact_analyzer",
+        route_module="knowledge_impact_analyzer",
+        engine="shieldops.knowledge.knowledge_impact_analyzer:KnowledgeImpactAnalyzer",
+        tags=("Knowledge Impact Analyzer",),
+        router_attr="kia_route",
+        settings_kwargs={
+            "max_records": "knowledge_impact_analyzer_max_records",
+            "impact_relevance_threshold": "knowledge_impact_analyzer_impact_relevance_threshold",
+        },
+        enabled_flag="knowledge_impact_analyzer_enabled",
+    ),
+    EngineSpec(
+        name="audit_scope_optimizer",
+        route_module="audit_scope_optimizer",
+        engine="shieldops.audit.audit_scope_optimizer:AuditScopeOptimizer",
+        tags=("Audit Scope Optimizer",),
+        router_attr="aso_route",
+        settings_kwargs={
+            "max_records": "audit_scope_optimizer_max_records",
+            "scope_efficiency_threshold": "audit_scope_optimizer_scope_efficiency_threshold",
+        },
+        enabled_flag="audit_scope_optimizer_enabled",
+    ),
+    EngineSpec(
+        name="data_quality_scorer",
+        route_module="data_quality_scorer",
+        engine="shieldops.analytics.data_quality_scorer:DataQualityScorer",
+        tags=("Data Quality Scorer",),
+        router_attr="dqm_route",
+        settings_kwargs={
+            "max_records": "data_quality_scorer_max_records",
+            "quality_score_threshold": "data_quality_scorer_quality_score_threshold",
+        },
+        enabled_flag="data_quality_scorer_enabled",
+    ),
+    EngineSpec(
+        name="regulatory_impact_tracker",
+        route_module="regulatory_impact_tracker",
+        engine="shieldops.compliance.regulatory_impact_tracker:RegulatoryImpactTracker",
+        tags=("Regulatory Impact Tracker",),
+        router_attr="rci_route",
+        settings_kwargs={
+            "max_records": "regulatory_impact_tracker_max_records",
+            "impact_severity_threshold": "regulatory_impact_tracker_impact_severity_threshold",
+        },
+        enabled_flag="regulatory_impact_tracker_enabled",
+    ),
+)
@@ -1,8 +1,18 @@
-"""Request middleware stack."""
+"""Request middleware stack.
+
+Every middleware here is a plain ASGI callable (no ``BaseHTTPMiddleware``),
+so a layer costs one function call per request rather than a task hop
+and a wrapped response stream.
+"""
 
 from shieldops.api.middleware.billing_enforcement import (
     BillingEnforcementMiddleware,
 )
+from shieldops.api.middleware.context import (
+    RequestContext,
+    RequestContextMiddleware,
+    get_request_context,
+)
 from shieldops.api.middleware.error_handler import ErrorHandlerMiddleware
 from shieldops.api.middleware.logging import RequestLoggingMiddleware
 from shieldops.api.middleware.metrics import MetricsMiddleware
@@ -28,10 +38,13 @@ __all__ = [
     "GracefulShutdownMiddleware",
     "MetricsMiddleware",
     "RateLimitMiddleware",
+    "RequestContext",
+    "RequestContextMiddleware",
     "RequestLoggingMiddleware",
     "RequestIDMiddleware",
     "SecurityHeadersMiddleware",
     "SlidingWindowRateLimiter",
     "TenantMiddleware",
     "UsageTrackerMiddleware",
+    "get_request_context",
 ]
@@ -0,0 +1,208 @@
+"""Atomic Redis rate limiting and an in-process token bucket.
+
+``AtomicRateLimiter`` evaluates a fixed-window counter -- and, optionally,
+a sliding-window log for the same request -- in one Lua script, so every
+decision costs a single ``EVALSHA`` round trip and the counter can never
+be left without a TTL between an ``INCR`` and its ``EXPIRE``.
+
+``LocalTokenBucket`` sits in front of it and leases quota from the Redis
+window in chunks: one script call reserves ``lease_size`` requests, which
+are then served from process memory.  Leases trade accuracy for latency --
+tokens a replica has leased but not yet spent are unavailable to other
+replicas until the window rolls over, so under contention a client can
+be rejected slightly before reaching its limit (the limit itself is never
+exceeded).  ``lease_size=0`` keeps every decision exact.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from typing import Any, NamedTuple
+
+from redis.exceptions import NoScriptError
+
+# KEYS[1]  fixed-window counter
+# KEYS[2]  sliding-window log (optional)
+# ARGV     window_s, limit, cost[, sliding_limit, sliding_window_ms, now_ms, member]
+#
+# Returns {count, sliding_count}; sliding_count is -1 when the sliding
+# window rejected the request, in which case the counter is rolled back.
+RATE_LIMIT_SCRIPT = """
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local count = redis.call("INCRBY", KEYS[1], cost)
+if count == cost then
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+end
+if KEYS[2] == nil or count - cost >= limit then
+    return {count, 0}
+end
+local window = tonumber(ARGV[5])
+local now = tonumber(ARGV[6])
+redis.call("ZREMRANGEBYSCORE", KEYS[2], "-inf", now - window)
+local used = redis.call("ZCARD", KEYS[2])
+if used >= tonumber(ARGV[4]) then
+    redis.call("DECRBY", KEYS[1], cost)
+    return {count - cost, -1}
+end
+redis.call("ZADD", KEYS[2], now, ARGV[7])
+redis.call("PEXPIRE", KEYS[2], window + 1000)
+return {count, used + 1}
+"""
+
+_SCRIPT_SHA = hashlib.sha1(RATE_LIMIT_SCRIPT.encode()).hexdigest()  # noqa: S324
+
+
+class SlidingWindow(NamedTuple):
+    """Sliding-window tier checked alongside the fixed window."""
+
+    key: str
+    limit: int
+    window: int
+
+
+class RateLimitDecision(NamedTuple):
+    """Outcome of one rate-limit check."""
+
+    allowed: bool
+    remaining: int
+    source: str  # "redis" or "local"
+    denied_by: str | None = None  # "fixed" or "sliding" when rejected
+
+
+class AtomicRateLimiter:
+    """Single-round-trip fixed (+ sliding) window limiter."""
+
+    def __init__(self, redis: Any) -> None:
+        self._redis = redis
+
+    async def _run(self, keys: list[str], args: list[Any]) -> list[int]:
+        try:
+            return await self._redis.evalsha(_SCRIPT_SHA, len(keys), *keys, *args)
+        except NoScriptError:
+            # First call against this server (or after SCRIPT FLUSH); EVAL
+            # also loads the script so later calls hit the cache again.
+            return await self._redis.eval(RATE_LIMIT_SCRIPT, len(keys), *keys, *args)
+
+    async def incr(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        cost: int = 1,
+        sliding: SlidingWindow | None = None,
+    ) -> tuple[int, int]:
+        """Add *cost* to the window; return ``(count, sliding_count)``."""
+        keys = [key]
+        args: list[Any] = [window, limit, cost]
+        if sliding is not None:
+            now_ms = int(time.time() * 1000)
+            keys.append(sliding.key)
+            args += [
+                sliding.limit,
+                sliding.window * 1000,
+                now_ms,
+                f"{now_ms}:{os.urandom(4).hex()}",
+            ]
+        result = await self._run(keys, args)
+        return int(result[0]), int(result[1])
+
+    async def check(
+        self,
+        key: str,
+        limit: int,
+        window: int,
+        sliding: SlidingWindow | None = None,
+    ) -> RateLimitDecision:
+        """Count one request against the window(s)."""
+        count, sliding_count = await self.incr(key, limit, window, sliding=sliding)
+        if sliding_count < 0:
+            return RateLimitDecision(False, 0, "redis", "sliding")
+        if count > limit:
+            return RateLimitDecision(False, 0, "redis", "fixed")
+        return RateLimitDecision(True, limit - count, "redis")
+
+
+class _Lease:
+    __slots__ = ("expires_at", "remaining", "tokens")
+
+    def __init__(self, tokens: int, remaining: int, expires_at: float) -> None:
+        self.tokens = tokens
+        self.remaining = remaining  # what the rest of the cluster can still use
+        self.expires_at = expires_at
+
+
+class LocalTokenBucket:
+    """Serve fixed-window quota from memory, leased from Redis in chunks.
+
+    Each refill reserves ``min(lease_size, limit * max_fraction)`` tokens
+    with one script call, so a single replica never holds more than that
+    fraction of any caller's window.  Concurrent misses on the same key
+    share one refill.  Once the window is exhausted in Redis the key is
+    rejected locally until its window expires, since fixed-window
+    counters only grow.
+    """
+
+    def __init__(
+        self,
+        limiter: AtomicRateLimiter,
+        lease_size: int,
+        max_fraction: float = 0.1,
+        max_keys: int = 10_000,
+    ) -> None:
+        self._limiter = limiter
+        self._lease_size = lease_size
+        self._max_fraction = max_fraction
+        self._max_keys = max_keys
+        self._leases: dict[str, _Lease] = {}
+        self._refills: dict[str, asyncio.Task[None]] = {}
+
+    def _chunk(self, limit: int) -> int:
+        return max(1, min(self._lease_size, int(limit * self._max_fraction)))
+
+    @staticmethod
+    def _take(lease: _Lease) -> RateLimitDecision | None:
+        if lease.tokens > 0:
+            lease.tokens -= 1
+            return RateLimitDecision(True, lease.remaining + lease.tokens, "local")
+        if lease.remaining == 0:
+            return RateLimitDecision(False, 0, "local", "fixed")
+        return None
+
+    async def acquire(
+        self, key: str, limit: int, window: int, expires_at: float
+    ) -> RateLimitDecision:
+        """Take one token for *key*, refilling from Redis when empty."""
+        lease = self._leases.get(key)
+        if lease is not None:
+            decision = self._take(lease)
+            if decision is not None:
+                return decision
+
+        while True:
+            refill = self._refills.get(key)
+            if refill is None:
+                refill = asyncio.ensure_future(self._refill(key, limit, window, expires_at))
+                self._refills[key] = refill
+                refill.add_done_callback(lambda _: self._refills.pop(key, None))
+            await refill
+            # Other waiters may drain a small lease first; refill again if so.
+            decision = self._take(self._leases[key])
+            if decision is not None:
+                return decision._replace(source="redis")
+
+    async def _refill(self, key: str, limit: int, window: int, expires_at: float) -> None:
+        chunk = self._chunk(limit)
+        count, _ = await self._limiter.incr(key, limit, window, cost=chunk)
+        granted = max(0, min(chunk, limit - (count - chunk)))
+        if len(self._leases) >= self._max_keys:
+            self._prune()
+        self._leases[key] = _Lease(granted, max(0, limit - count), expires_at)
+
+    def _prune(self) -> None:
+        now = time.time()
+        for key in [k for k, lease in self._leases.items() if lease.expires_at <= now]:
+            del self._leases[key]
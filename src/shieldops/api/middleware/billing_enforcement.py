@@ -14,12 +14,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import structlog
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 if TYPE_CHECKING:
     from shieldops.billing.enforcement import PlanEnforcementService
@@ -75,7 +72,7 @@ def _build_402_response(
     )
 
 
-class BillingEnforcementMiddleware(BaseHTTPMiddleware):
+class BillingEnforcementMiddleware:
     """Reject requests that exceed the org's plan limits.
 
     The middleware is wired into the Starlette stack via ``app.add_middleware``
@@ -86,6 +83,9 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
 
     _enforcement: PlanEnforcementService | None = None
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
     @classmethod
     def set_enforcement_service(
         cls,
@@ -103,28 +103,27 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
         """Return the current enforcement service (or ``None``)."""
         return cls._enforcement
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        path = request.url.path
-        method = request.method
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # 1. Skip exempt paths (health, billing, docs, etc.)
-        if _is_exempt(path):
-            return await call_next(request)
+        path = scope["path"]
+        method = scope["method"]
 
+        # 1. Skip exempt paths (health, billing, docs, etc.)
         # 2. Skip if enforcement is not wired up
         enforcement = self.__class__._enforcement
-        if enforcement is None:
-            return await call_next(request)
+        if enforcement is None or _is_exempt(path):
+            await self.app(scope, receive, send)
+            return
 
         # 3. Resolve org_id from tenant middleware
-        org_id: str | None = getattr(request.state, "organization_id", None)
+        org_id: str | None = scope.get("state", {}).get("organization_id")
         if org_id is None:
             # No org context -- cannot enforce, let the request through
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         plan = await enforcement.get_org_plan(org_id)
 
@@ -139,7 +138,7 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
                     current=current,
                     limit=limit,
                 )
-                return _build_402_response(
+                response = _build_402_response(
                     message=(
                         f"Agent limit reached ({current}/{limit}). "
                         f"Upgrade your plan to add more agents."
@@ -148,6 +147,8 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
                     usage=current,
                     limit=limit,
                 )
+                await response(scope, receive, send)
+                return
 
         # 5. API quota check (applies to every non-exempt request)
         allowed, used, limit = await enforcement.check_api_quota(org_id, plan=plan)
@@ -159,7 +160,7 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
                 used=used,
                 limit=limit,
             )
-            return _build_402_response(
+            response = _build_402_response(
                 message=(
                     f"API call quota exceeded ({used}/{limit}). "
                     f"Upgrade your plan for higher limits."
@@ -168,10 +169,16 @@ class BillingEnforcementMiddleware(BaseHTTPMiddleware):
                 usage=used,
                 limit=limit,
             )
+            await response(scope, receive, send)
+            return
 
         # 6. Proceed and attach plan info as response headers
-        response = await call_next(request)
-        response.headers["X-Plan-Name"] = plan
-        response.headers["X-Plan-Usage"] = str(used)
-        response.headers["X-Plan-Limit"] = str(limit)
-        return response
+        async def send_with_plan(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Plan-Name"] = plan
+                headers["X-Plan-Usage"] = str(used)
+                headers["X-Plan-Limit"] = str(limit)
+            await send(message)
+
+        await self.app(scope, receive, send_with_plan)
@@ -0,0 +1,178 @@
+"""Fused request-context middleware.
+
+Resolves what the rest of the stack needs to know about a request --
+request ID, authenticated user (from the JWT), tenant, and the metrics
+labels -- once, in a single pure-ASGI layer, and records the request's
+metrics and access-log line when it finishes.  It stands in for the
+separate ``RequestIDMiddleware``, ``TenantMiddleware``,
+``MetricsMiddleware`` and ``RequestLoggingMiddleware`` layers, each of
+which re-derived part of the same information (the rate limiter decoded
+the JWT yet again).
+
+Downstream middleware and routes read the result from
+``request.state.request_context`` (or :func:`get_request_context` on a
+raw ASGI scope).  The individual ``request_id``, ``organization_id`` and
+``user_id`` state attributes are still set for existing readers.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import structlog
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shieldops.api.middleware.metrics import (
+    get_metrics_registry,
+    normalize_path,
+    record_http_request,
+)
+from shieldops.api.middleware.request_id import REQUEST_ID_HEADER, resolve_request_id
+from shieldops.api.middleware.tenant import _PUBLIC_PATHS
+from shieldops.utils.llm_cache import llm_cache_scope
+
+logger = structlog.get_logger()
+
+
+class RequestContext:
+    """Per-request facts resolved once by :class:`RequestContextMiddleware`."""
+
+    __slots__ = (
+        "client_ip",
+        "claims",
+        "method",
+        "organization_id",
+        "path",
+        "path_template",
+        "request_id",
+        "role",
+        "user_id",
+    )
+
+    def __init__(
+        self,
+        *,
+        request_id: str,
+        method: str,
+        path: str,
+        client_ip: str,
+        claims: dict[str, Any] | None = None,
+        organization_id: str | None = None,
+    ) -> None:
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.path_template = normalize_path(path)
+        self.client_ip = client_ip
+        self.claims = claims
+        self.user_id: str | None = claims.get("sub") if claims else None
+        self.role: str | None = claims.get("role") if claims else None
+        self.organization_id = organization_id
+
+
+def get_request_context(scope: Scope) -> RequestContext | None:
+    """Return the context attached by :class:`RequestContextMiddleware`, if any."""
+    state = scope.get("state")
+    return state.get("request_context") if state else None
+
+
+def _decode_bearer(scope: Scope, headers: Headers) -> dict[str, Any] | None:
+    from shieldops.api.auth.service import decode_request_token
+
+    auth_header = headers.get("authorization", "")
+    if not auth_header.startswith("Bearer "):
+        return None
+    return decode_request_token(scope, auth_header[7:])
+
+
+def _client_ip(scope: Scope, headers: Headers) -> str:
+    forwarded = headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RequestContextMiddleware:
+    """Resolve request ID, JWT claims, tenant and metrics labels once.
+
+    Also records the HTTP metrics (in-progress gauge, request counter,
+    duration histogram) and the ``http_request`` access-log line, using
+    the status code read off ``http.response.start``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        state = scope.setdefault("state", {})
+        path = scope["path"]
+        request_id = resolve_request_id(scope)
+
+        claims = _decode_bearer(scope, headers)
+        organization_id: str | None = None
+        if path not in _PUBLIC_PATHS:
+            # Anything an outer layer resolved wins, then the JWT, then the header.
+            organization_id = (
+                state.get("organization_id")
+                or (claims.get("org_id") if claims else None)
+                or headers.get("X-Organization-ID")
+            )
+
+        context = RequestContext(
+            request_id=request_id,
+            method=scope["method"],
+            path=path,
+            client_ip=_client_ip(scope, headers),
+            claims=claims,
+            organization_id=organization_id,
+        )
+        state["request_context"] = context
+        state["request_id"] = request_id
+        state["organization_id"] = organization_id
+        if context.user_id is not None:
+            state["user_id"] = context.user_id
+
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        registry = get_metrics_registry()
+        gauge_labels = {"method": context.method}
+        registry.inc_gauge("http_requests_in_progress", gauge_labels)
+        start = time.perf_counter()
+        try:
+            # Cached LLM responses are keyed per organization.
+            with llm_cache_scope(organization_id):
+                await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            registry.dec_gauge("http_requests_in_progress", gauge_labels)
+            record_http_request(
+                registry, context.method, context.path_template, status_code, duration
+            )
+            logger.info(
+                "http_request",
+                method=context.method,
+                path=path,
+                status=status_code,
+                duration_ms=round(duration * 1000, 2),
+            )
@@ -4,55 +4,60 @@ from __future__ import annotations
 
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from shieldops.observability.request_correlation import SpanStatus
 
 
-class CorrelationMiddleware(BaseHTTPMiddleware):
+class CorrelationMiddleware:
     """Creates a correlation trace and root span for every request.
 
-    Reads the request_id from ``request.state.request_id`` (set by
+    Reads the request_id from the request state (set by
     ``RequestIDMiddleware``) and auto-creates a trace + root span.
     """
 
-    def __init__(self, app: Any, correlator: Any = None) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, correlator: Any = None) -> None:
+        self.app = app
         self._correlator = correlator
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if self._correlator is None:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._correlator is None:
+            await self.app(scope, receive, send)
+            return
 
-        state = getattr(request, "state", None)
-        request_id = getattr(state, "request_id", None) if state else None
+        request_id = scope.get("state", {}).get("request_id")
         if not request_id:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        entry_point = f"{request.method} {request.url.path}"
+        entry_point = f"{scope['method']} {scope['path']}"
         self._correlator.start_trace(request_id, entry_point=entry_point)
         span = self._correlator.start_span(request_id, operation=entry_point)
+        status_code = 500
+
+        async def send_with_correlation(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add correlation header
+                MutableHeaders(scope=message)["X-Correlation-ID"] = request_id
+            await send(message)
 
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_correlation)
         except Exception:
             if span:
                 self._correlator.end_span(request_id, span.span_id, SpanStatus.ERROR)
             self._correlator.end_trace(request_id, SpanStatus.ERROR)
             raise
 
-        status = SpanStatus.COMPLETED if response.status_code < 500 else SpanStatus.ERROR
+        status = SpanStatus.COMPLETED if status_code < 500 else SpanStatus.ERROR
         if span:
             self._correlator.end_span(
                 request_id,
                 span.span_id,
                 status,
-                metadata={"status_code": response.status_code},
+                metadata={"status_code": status_code},
             )
         self._correlator.end_trace(request_id, status)
-
-        # Add correlation header
-        response.headers["X-Correlation-ID"] = request_id
-        return response
@@ -1,30 +1,48 @@
 """Middleware that catches unhandled exceptions and returns structured JSON errors."""
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+class ErrorHandlerMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            request_id = getattr(request.state, "request_id", "unknown")
+            # Too late for a JSON error once headers are on the wire.
+            if response_started:
+                raise
+            request_id = scope.get("state", {}).get("request_id", "unknown")
             logger.error(
                 "unhandled_exception",
                 error=str(exc),
                 exc_type=type(exc).__name__,
-                path=request.url.path,
+                path=scope["path"],
                 request_id=request_id,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "detail": "Internal server error",
                     "request_id": request_id,
                 },
             )
+            await response(scope, receive, send)
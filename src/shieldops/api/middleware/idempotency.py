@@ -2,30 +2,51 @@
 
 Reads the ``Idempotency-Key`` header and caches responses for a configurable
 TTL window.  Duplicate requests within the window receive the cached response.
+
+Responses are stored as raw status, headers and body bytes and replayed
+verbatim, so any content type can be replayed and nothing is re-parsed.
+A duplicate that arrives while the first request is still running waits
+for its result instead of executing again.  Responses larger than
+``max_body_bytes`` and server-sent event streams are not stored.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import time
 from typing import Any, Protocol, runtime_checkable
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from redis.asyncio import Redis
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shieldops.config import settings
 
 logger = structlog.get_logger()
 
 IDEMPOTENT_METHODS = {"POST", "PUT", "PATCH"}
 IDEMPOTENCY_HEADER = "Idempotency-Key"
 DEFAULT_TTL = 86400  # 24 hours
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+IN_FLIGHT_TTL = 60
+
+_IN_FLIGHT: dict[str, Any] = {"status": "processing"}
+_NOT_STORED: dict[str, Any] = {"status": "not_stored"}
+_TIMED_OUT = object()
 
 
 @runtime_checkable
 class IdempotencyStore(Protocol):
-    """Protocol for pluggable idempotency backends (e.g. Redis)."""
+    """Protocol for pluggable idempotency backends (e.g. Redis).
+
+    Stores may also provide ``add(key, value, ttl) -> bool``, which sets
+    *key* only if it is absent.  The middleware uses it to claim a key
+    atomically; without it two concurrent first requests can both run.
+    """
 
     async def get(self, key: str) -> dict[str, Any] | None: ...
     async def set(self, key: str, value: dict[str, Any], ttl: int) -> None: ...
@@ -54,6 +75,12 @@ class InMemoryIdempotencyStore:
         effective_ttl = ttl if ttl is not None else self._ttl
         self._store[key] = (value, time.monotonic() + effective_ttl)
 
+    async def add(self, key: str, value: dict[str, Any], ttl: int | None = None) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
     async def delete(self, key: str) -> None:
         self._store.pop(key, None)
 
@@ -69,78 +96,235 @@ class InMemoryIdempotencyStore:
         return len(self._store)
 
 
-class IdempotencyMiddleware(BaseHTTPMiddleware):
+class RedisIdempotencyStore:
+    """Idempotency store shared by every API worker through Redis.
+
+    Each entry is one string value: a JSON line holding everything but
+    the body, a newline, then the body bytes untouched.
+
+    Args:
+        redis: Client to use; created from ``settings.redis_url`` if omitted.
+            It must not decode responses, since bodies are raw bytes.
+        prefix: Key prefix for stored entries.
+    """
+
+    def __init__(
+        self, redis: Redis | None = None, *, prefix: str = "shieldops:idempotency:"
+    ) -> None:
+        self._client: Redis | None = redis
+        self._prefix = prefix
+
+    def _ensure_client(self) -> Redis:
+        if self._client is None:
+            import redis.asyncio as aioredis
+
+            self._client = aioredis.from_url(settings.redis_url)  # type: ignore[no-untyped-call]
+        return self._client
+
+    @staticmethod
+    def _encode(value: dict[str, Any]) -> bytes:
+        meta = {k: v for k, v in value.items() if k != "body"}
+        return json.dumps(meta, separators=(",", ":")).encode() + b"\n" + value.get("body", b"")
+
+    @staticmethod
+    def _decode(raw: bytes) -> dict[str, Any]:
+        meta, _, body = raw.partition(b"\n")
+        value: dict[str, Any] = json.loads(meta)
+        if "status_code" in value:
+            value["body"] = body
+        return value
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raw = await self._ensure_client().get(self._prefix + key)
+        return None if raw is None else self._decode(raw)
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int = DEFAULT_TTL) -> None:
+        await self._ensure_client().set(self._prefix + key, self._encode(value), ex=ttl)
+
+    async def add(self, key: str, value: dict[str, Any], ttl: int = DEFAULT_TTL) -> bool:
+        return bool(
+            await self._ensure_client().set(
+                self._prefix + key, self._encode(value), ex=ttl, nx=True
+            )
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._ensure_client().delete(self._prefix + key)
+
+
+class IdempotencyMiddleware:
     """ASGI middleware that enforces idempotency on mutating requests.
 
     If a request includes an ``Idempotency-Key`` header, the response is
-    cached and replayed on subsequent requests with the same key.
+    cached and replayed on subsequent requests with the same key.  The
+    first response is streamed to the client as it is produced; a copy of
+    the body is kept only for requests that carry the header.
+
+    Args:
+        store: Backend for cached responses; per-process memory if omitted.
+        ttl: Seconds a response stays replayable.
+        max_body_bytes: Responses larger than this are sent but not stored;
+            later duplicates get 409 rather than a second execution.
+        wait_timeout: Seconds a duplicate waits for an in-flight original
+            before giving up with 409.
     """
 
-    def __init__(self, app: Any, store: IdempotencyStore | None = None, ttl: int = DEFAULT_TTL):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: IdempotencyStore | None = None,
+        ttl: int = DEFAULT_TTL,
+        *,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        wait_timeout: float = 30.0,
+    ) -> None:
+        self.app = app
         self.store: IdempotencyStore = store or InMemoryIdempotencyStore(ttl=ttl)
         self.ttl = ttl
+        self.max_body_bytes = max_body_bytes
+        self.wait_timeout = wait_timeout
+        # Originals running in this process; local duplicates await these.
+        self._in_flight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.method not in IDEMPOTENT_METHODS:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
 
-        idempotency_key = request.headers.get(IDEMPOTENCY_HEADER)
+        idempotency_key = Headers(scope=scope).get(IDEMPOTENCY_HEADER)
         if not idempotency_key:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Build composite key from method + path + idempotency key
-        composite_key = self._build_key(request.method, str(request.url.path), idempotency_key)
+        method, path = scope["method"], scope["path"]
+        composite_key = self._build_key(method, path, idempotency_key)
 
-        # Check for cached response
-        cached = await self.store.get(composite_key)
-        if cached is not None:
+        while True:
+            entry = await self._lookup(composite_key)
+            if entry is None:
+                if await self._claim(composite_key):
+                    break
+                continue  # lost the race; the winner's marker is now visible
+            if entry is _TIMED_OUT or "status_code" not in entry:
+                detail = (
+                    "A request with this Idempotency-Key is in progress"
+                    if entry is _TIMED_OUT
+                    else "The original response for this Idempotency-Key was not stored"
+                )
+                await JSONResponse(content={"detail": detail}, status_code=409)(
+                    scope, receive, send
+                )
+                return
             logger.info(
                 "idempotency_cache_hit",
                 key=idempotency_key,
-                method=request.method,
-                path=request.url.path,
-            )
-            return JSONResponse(
-                content=cached["body"],
-                status_code=cached["status_code"],
-                headers={"X-Idempotency-Replayed": "true"},
+                method=method,
+                path=path,
             )
+            await self._replay(entry, send)
+            return
 
-        # Mark key as in-flight to prevent concurrent processing
-        await self.store.set(
-            composite_key,
-            {"status": "processing"},
-            ttl=60,  # Short TTL for in-flight marker
-        )
+        await self._run_original(composite_key, scope, receive, send)
 
-        response = await call_next(request)
+    async def _lookup(self, key: str) -> Any:
+        """Return the stored entry, waiting out an in-flight original.
 
-        # Cache the response
-        try:
-            body = b""
-            async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-                if isinstance(chunk, str):
-                    body += chunk.encode()
+        Returns None when the key is free, a response or not-stored entry
+        once the original finishes, or ``_TIMED_OUT``.
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), self.wait_timeout)
+            except TimeoutError:
+                return _TIMED_OUT
+            return result
+
+        entry = await self.store.get(key)
+        if entry is None or entry.get("status") != _IN_FLIGHT["status"]:
+            return entry
+
+        # Running in another worker: poll the shared store until it lands.
+        deadline = time.monotonic() + self.wait_timeout
+        delay = 0.02
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+            entry = await self.store.get(key)
+            if entry is None or entry.get("status") != _IN_FLIGHT["status"]:
+                return entry
+        return _TIMED_OUT
+
+    async def _claim(self, key: str) -> bool:
+        add = getattr(self.store, "add", None)
+        if add is None:
+            await self.store.set(key, _IN_FLIGHT, ttl=IN_FLIGHT_TTL)
+            return True
+        return bool(await add(key, _IN_FLIGHT, IN_FLIGHT_TTL))
+
+    async def _run_original(self, key: str, scope: Scope, receive: Receive, send: Send) -> None:
+        future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        status_code = 500
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+        size = 0
+        storable = True
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status_code, headers, size, storable
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                content_type = Headers(raw=headers).get("content-type", "")
+                storable = not content_type.startswith("text/event-stream")
+            elif message["type"] == "http.response.body" and storable:
+                body = message.get("body", b"")
+                size += len(body)
+                if size > self.max_body_bytes:
+                    storable = False
+                    chunks.clear()
                 else:
-                    body += chunk
+                    chunks.append(body)
+            await send(message)
 
-            body_json = json.loads(body) if body else {}
-            await self.store.set(
-                composite_key,
-                {"body": body_json, "status_code": response.status_code},
-                ttl=self.ttl,
-            )
+        result: dict[str, Any] | None = None
+        try:
+            await self.app(scope, receive, send_and_capture)
+            if status_code >= 500:
+                # Let the client retry a server error under the same key.
+                await self.store.delete(key)
+            elif storable:
+                result = {
+                    "status_code": status_code,
+                    "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in headers],
+                    "body": b"".join(chunks),
+                }
+                await self.store.set(key, result, ttl=self.ttl)
+            else:
+                result = _NOT_STORED
+                await self.store.set(key, result, ttl=self.ttl)
+        except BaseException:
+            await self.store.delete(key)
+            raise
+        finally:
+            del self._in_flight[key]
+            future.set_result(result)
 
-            return JSONResponse(
-                content=body_json,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-            )
-        except (json.JSONDecodeError, Exception):
-            # Non-JSON responses — pass through without caching
-            await self.store.delete(composite_key)
-            return response
+    @staticmethod
+    async def _replay(entry: dict[str, Any], send: Send) -> None:
+        raw_headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in entry["headers"]]
+        raw_headers.append((b"x-idempotency-replayed", b"true"))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": entry["status_code"],
+                "headers": raw_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": entry["body"]})
 
     @staticmethod
     def _build_key(method: str, path: str, idempotency_key: str) -> str:
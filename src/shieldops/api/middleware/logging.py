@@ -3,24 +3,36 @@
 import time
 
 import structlog
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+class RequestLoggingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         start = time.perf_counter()
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
         duration_ms = round((time.perf_counter() - start) * 1000, 2)
 
         logger.info(
             "http_request",
-            method=request.method,
-            path=request.url.path,
-            status=response.status_code,
+            method=scope["method"],
+            path=scope["path"],
+            status=status_code,
             duration_ms=duration_ms,
         )
-        return response
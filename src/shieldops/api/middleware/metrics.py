@@ -7,18 +7,19 @@ Prometheus text exposition format via ``MetricsRegistry.collect()``.
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
 import re
 import threading
 import time
-from typing import ClassVar
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, ClassVar
 
 import structlog
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
@@ -37,6 +38,20 @@ DEFAULT_BUCKETS: tuple[float, ...] = (
     10.0,
 )
 
+# Rate-limit checks are sub-millisecond when served locally.
+RATE_LIMIT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+)
+
 # ── Path-normalisation patterns ─────────────────────────────────────
 # UUID v4 (standard 8-4-4-4-12 hex format)
 _UUID_RE = re.compile(
@@ -49,12 +64,14 @@ _HEX_ID_RE = re.compile(r"[0-9a-fA-F]{8,}")
 _NUMERIC_RE = re.compile(r"^[0-9]+$")
 
 
+@lru_cache(maxsize=4096)
 def normalize_path(path: str) -> str:
     """Replace dynamic path segments with ``{id}`` placeholders.
 
     Handles UUIDs, hex identifiers, and numeric IDs so that
     ``/api/v1/investigations/abc123de`` becomes
-    ``/api/v1/investigations/{id}``.
+    ``/api/v1/investigations/{id}``.  Results are memoised: the same
+    handful of paths make up most traffic.
     """
     # Fast-path: skip known static paths
     if path in {"/health", "/ready", "/metrics"}:
@@ -76,24 +93,153 @@ def normalize_path(path: str) -> str:
 # ── Metrics Registry (singleton) ────────────────────────────────────
 
 
+class _Histogram:
+    """Array-backed histogram: one slot per bucket, cumulated at collect time."""
+
+    __slots__ = ("bounds", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        # ``le`` buckets: a value equal to a bound belongs to that bucket.
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: _Histogram) -> None:
+        if other.bounds != self.bounds:
+            return
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            counts[i] += n
+        self.sum += other.sum
+        self.count += other.count
+
+    def copy(self) -> _Histogram:
+        clone = _Histogram(self.bounds)
+        clone.counts = list(self.counts)
+        clone.sum = self.sum
+        clone.count = self.count
+        return clone
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return ``(le, cumulative_count)`` pairs, ending with +Inf."""
+        running = 0
+        out: list[tuple[float, int]] = []
+        for le, n in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            running += n
+            out.append((le, running))
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"bounds": list(self.bounds), "counts": self.counts, "sum": self.sum}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _Histogram:
+        hist = cls(tuple(data["bounds"]))
+        hist.counts = list(data["counts"])
+        hist.sum = data["sum"]
+        hist.count = sum(hist.counts)
+        return hist
+
+
+class _Shard:
+    """Counters and histograms written by a single thread."""
+
+    __slots__ = ("counters", "histograms", "thread")
+
+    def __init__(self, thread: threading.Thread | None) -> None:
+        self.thread = thread
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, _Histogram] = {}
+
+    def merge_into(self, counters: dict[str, int], histograms: dict[str, _Histogram]) -> None:
+        # ``dict.copy()`` is atomic under the GIL, so the owning thread can
+        # keep writing while another thread reads.
+        for key, value in self.counters.copy().items():
+            counters[key] = counters.get(key, 0) + value
+        for key, hist in self.histograms.copy().items():
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = hist.copy()
+            else:
+                merged.merge(hist)
+
+
+class CounterHandle:
+    """A counter with its labels resolved once; see ``MetricsRegistry.counter``."""
+
+    __slots__ = ("_registry", "key")
+
+    def __init__(self, registry: MetricsRegistry, key: str) -> None:
+        self._registry = registry
+        self.key = key
+
+    def inc(self, amount: int = 1) -> None:
+        counters = self._registry._shard().counters
+        counters[self.key] = counters.get(self.key, 0) + amount
+
+
+class HistogramHandle:
+    """A histogram with its labels and buckets resolved once."""
+
+    __slots__ = ("_registry", "bounds", "key")
+
+    def __init__(self, registry: MetricsRegistry, key: str, bounds: tuple[float, ...]) -> None:
+        self._registry = registry
+        self.key = key
+        self.bounds = bounds
+
+    def observe(self, value: float) -> None:
+        histograms = self._registry._shard().histograms
+        hist = histograms.get(self.key)
+        if hist is None:
+            hist = histograms[self.key] = _Histogram(self.bounds)
+        hist.observe(value)
+
+
 class MetricsRegistry:
-    """Thread-safe, dict-backed metrics store.
+    """Sharded, mostly lock-free metrics store.
 
     Supports counters, histograms (with configurable buckets), and
-    gauges.  The ``collect()`` method emits Prometheus text exposition
-    format (version 0.0.4).
+    gauges.  Counters and histograms are written to a per-thread shard
+    without locking and merged when read; gauges, which are set as well
+    as incremented, live in one locked dict.  ``counter()`` and
+    ``histogram()`` return handles with the label encoding done once, for
+    hot paths.
+
+    With *multiproc_dir* set, each worker process also writes its
+    snapshot to that directory (every *flush_interval* seconds and on
+    exit) and ``collect()`` sums every worker's snapshot, so any worker
+    can serve the whole deployment's ``/metrics``.  Gauges from workers
+    that have exited are dropped; their counters and histograms are kept.
+
+    The ``collect()`` method emits Prometheus text exposition format
+    (version 0.0.4).
     """
 
     _instance: ClassVar[MetricsRegistry | None] = None
     _lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self) -> None:
+    def __init__(self, multiproc_dir: str | None = None, flush_interval: float = 5.0) -> None:
         self._mu = threading.Lock()
-        self.counters: dict[str, int] = {}
-        self.histograms: dict[str, list[tuple[float, int]]] = {}
-        self._histogram_sums: dict[str, float] = {}
-        self._histogram_counts: dict[str, int] = {}
-        self.gauges: dict[str, int] = {}
+        self._local = threading.local()
+        self._shards: list[_Shard] = []
+        self._retired = _Shard(None)  # folded shards of exited threads
+        self._gauges: dict[str, int] = {}
+        self._counter_handles: dict[tuple[Any, ...], CounterHandle] = {}
+        self._histogram_handles: dict[tuple[Any, ...], HistogramHandle] = {}
+        self._multiproc_dir = Path(multiproc_dir) if multiproc_dir else None
+        self._flush_interval = flush_interval
+        self._flusher: threading.Thread | None = None
+        if self._multiproc_dir is not None:
+            self._multiproc_dir.mkdir(parents=True, exist_ok=True)
+            atexit.register(self.flush)
+            os.register_at_fork(after_in_child=self._reset_after_fork)
 
     # ── Singleton access ────────────────────────────────────────
 
@@ -103,7 +249,12 @@ class MetricsRegistry:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = cls()
+                    from shieldops.config import settings
+
+                    cls._instance = cls(
+                        settings.metrics_multiproc_dir or None,
+                        settings.metrics_multiproc_flush_seconds,
+                    )
         return cls._instance
 
     @classmethod
@@ -112,6 +263,31 @@ class MetricsRegistry:
         with cls._lock:
             cls._instance = None
 
+    # ── Handles ─────────────────────────────────────────────────
+
+    def counter(self, name: str, labels: dict[str, str]) -> CounterHandle:
+        """Return a handle for the counter *name* with *labels*."""
+        cache_key = (name, *labels.items())
+        handle = self._counter_handles.get(cache_key)
+        if handle is None:
+            handle = CounterHandle(self, self._label_key(name, labels))
+            self._counter_handles[cache_key] = handle
+        return handle
+
+    def histogram(
+        self,
+        name: str,
+        labels: dict[str, str],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> HistogramHandle:
+        """Return a handle for the histogram *name* with *labels*."""
+        cache_key = (name, buckets, *labels.items())
+        handle = self._histogram_handles.get(cache_key)
+        if handle is None:
+            handle = HistogramHandle(self, self._label_key(name, labels), tuple(sorted(buckets)))
+            self._histogram_handles[cache_key] = handle
+        return handle
+
     # ── Counter operations ──────────────────────────────────────
 
     def inc_counter(
@@ -121,9 +297,7 @@ class MetricsRegistry:
         amount: int = 1,
     ) -> None:
         """Increment a labelled counter by *amount* (default 1)."""
-        key = self._label_key(name, labels)
-        with self._mu:
-            self.counters[key] = self.counters.get(key, 0) + amount
+        self.counter(name, labels).inc(amount)
 
     # ── Histogram operations ────────────────────────────────────
 
@@ -135,22 +309,7 @@ class MetricsRegistry:
         buckets: tuple[float, ...] = DEFAULT_BUCKETS,
     ) -> None:
         """Record an observation in the histogram."""
-        key = self._label_key(name, labels)
-        with self._mu:
-            if key not in self.histograms:
-                # Initialise bucket counts (including +Inf)
-                self.histograms[key] = [(b, 0) for b in buckets] + [(float("inf"), 0)]
-                self._histogram_sums[key] = 0.0
-                self._histogram_counts[key] = 0
-            updated: list[tuple[float, int]] = []
-            for le, count in self.histograms[key]:
-                if value <= le:
-                    updated.append((le, count + 1))
-                else:
-                    updated.append((le, count))
-            self.histograms[key] = updated
-            self._histogram_sums[key] += value
-            self._histogram_counts[key] += 1
+        self.histogram(name, labels, buckets).observe(value)
 
     # ── Gauge operations ────────────────────────────────────────
 
@@ -158,47 +317,174 @@ class MetricsRegistry:
         """Increment a gauge by 1."""
         key = self._label_key(name, labels)
         with self._mu:
-            self.gauges[key] = self.gauges.get(key, 0) + 1
+            self._gauges[key] = self._gauges.get(key, 0) + 1
 
     def dec_gauge(self, name: str, labels: dict[str, str]) -> None:
         """Decrement a gauge by 1."""
         key = self._label_key(name, labels)
         with self._mu:
-            self.gauges[key] = self.gauges.get(key, 0) - 1
+            self._gauges[key] = self._gauges.get(key, 0) - 1
 
     def set_gauge(self, name: str, labels: dict[str, str], value: int) -> None:
         """Set a gauge to an absolute value."""
         key = self._label_key(name, labels)
         with self._mu:
-            self.gauges[key] = value
+            self._gauges[key] = value
+
+    # ── Merged views ────────────────────────────────────────────
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Counter totals across all threads of this process."""
+        return self._snapshot()[0]
+
+    @property
+    def histograms(self) -> dict[str, list[tuple[float, int]]]:
+        """Cumulative ``(le, count)`` buckets per histogram key."""
+        return {key: hist.cumulative() for key, hist in self._snapshot()[1].items()}
+
+    @property
+    def _histogram_sums(self) -> dict[str, float]:
+        return {key: hist.sum for key, hist in self._snapshot()[1].items()}
+
+    @property
+    def _histogram_counts(self) -> dict[str, int]:
+        return {key: hist.count for key, hist in self._snapshot()[1].items()}
+
+    @property
+    def gauges(self) -> dict[str, int]:
+        """Current gauge values."""
+        with self._mu:
+            return dict(self._gauges)
 
     # ── Reset (testing) ─────────────────────────────────────────
 
     def reset(self) -> None:
         """Clear all stored metrics."""
         with self._mu:
-            self.counters.clear()
-            self.histograms.clear()
-            self._histogram_sums.clear()
-            self._histogram_counts.clear()
-            self.gauges.clear()
+            for shard in (self._retired, *self._shards):
+                shard.counters.clear()
+                shard.histograms.clear()
+            self._gauges.clear()
+
+    # ── Multiprocess aggregation ────────────────────────────────
+
+    def flush(self) -> None:
+        """Write this process's snapshot to the multiprocess directory."""
+        if self._multiproc_dir is None:
+            return
+        counters, histograms, gauges = self._snapshot()
+        data = {
+            "counters": counters,
+            "histograms": {key: hist.to_dict() for key, hist in histograms.items()},
+            "gauges": gauges,
+        }
+        path = self._multiproc_dir / f"metrics-{os.getpid()}.json"
+        tmp = path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("metrics_flush_failed", path=str(path), error=str(exc))
+
+    def _merge_other_processes(
+        self,
+        counters: dict[str, int],
+        histograms: dict[str, _Histogram],
+        gauges: dict[str, int],
+    ) -> None:
+        assert self._multiproc_dir is not None
+        own = os.getpid()
+        for path in self._multiproc_dir.glob("metrics-*.json"):
+            try:
+                pid = int(path.stem.split("-", 1)[1])
+                if pid == own:
+                    continue
+                data = json.loads(path.read_text())
+            except (ValueError, OSError):
+                continue
+            for key, value in data.get("counters", {}).items():
+                counters[key] = counters.get(key, 0) + value
+            for key, raw in data.get("histograms", {}).items():
+                hist = _Histogram.from_dict(raw)
+                merged = histograms.get(key)
+                if merged is None:
+                    histograms[key] = hist
+                else:
+                    merged.merge(hist)
+            if _pid_alive(pid):
+                for key, value in data.get("gauges", {}).items():
+                    gauges[key] = gauges.get(key, 0) + value
+
+    def _start_flusher(self) -> None:
+        def loop() -> None:
+            while True:
+                time.sleep(self._flush_interval)
+                self.flush()
+
+        self._flusher = threading.Thread(target=loop, name="metrics-flush", daemon=True)
+        self._flusher.start()
+
+    def _reset_after_fork(self) -> None:
+        # Each worker reports only what it records itself; anything the
+        # parent recorded before forking is in the parent's own file.
+        self._mu = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard(None)
+        self._gauges = {}
+        self._flusher = None
 
     # ── Prometheus text exposition ──────────────────────────────
 
     def collect(self) -> str:
         """Return all metrics in Prometheus text exposition format."""
-        with self._mu:
-            lines: list[str] = []
-            self._collect_counters(lines)
-            self._collect_histograms(lines)
-            self._collect_gauges(lines)
+        counters, histograms, gauges = self._snapshot()
+        if self._multiproc_dir is not None:
+            self.flush()
+            self._merge_other_processes(counters, histograms, gauges)
+        lines: list[str] = []
+        self._collect_counters(lines, counters)
+        self._collect_histograms(lines, histograms)
+        self._collect_gauges(lines, gauges)
         return "\n".join(lines) + "\n" if lines else ""
 
     # -- private helpers --
 
-    def _collect_counters(self, lines: list[str]) -> None:
+    def _shard(self) -> _Shard:
+        """Return the calling thread's shard, creating it on first use."""
+        try:
+            return self._local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard = _Shard(threading.current_thread())
+            with self._mu:
+                self._shards.append(shard)
+                if self._multiproc_dir is not None and self._flusher is None:
+                    self._start_flusher()
+            self._local.shard = shard
+            return shard
+
+    def _snapshot(self) -> tuple[dict[str, int], dict[str, _Histogram], dict[str, int]]:
+        """Merge every shard into fresh counter, histogram and gauge dicts."""
+        counters: dict[str, int] = {}
+        histograms: dict[str, _Histogram] = {}
+        with self._mu:
+            live: list[_Shard] = []
+            for shard in self._shards:
+                if shard.thread is not None and shard.thread.is_alive():
+                    live.append(shard)
+                else:
+                    shard.merge_into(self._retired.counters, self._retired.histograms)
+            self._shards = live
+            gauges = dict(self._gauges)
+            self._retired.merge_into(counters, histograms)
+        for shard in live:
+            shard.merge_into(counters, histograms)
+        return counters, histograms, gauges
+
+    def _collect_counters(self, lines: list[str], counters: dict[str, int]) -> None:
         emitted_help: set[str] = set()
-        for key, value in sorted(self.counters.items()):
+        for key, value in sorted(counters.items()):
             name, label_str = self._parse_key(key)
             if name not in emitted_help:
                 lines.append(f"# HELP {name} Total count")
@@ -206,23 +492,24 @@ class MetricsRegistry:
                 emitted_help.add(name)
             lines.append(f"{name}{{{label_str}}} {value}")
 
-    def _collect_histograms(self, lines: list[str]) -> None:
+    def _collect_histograms(self, lines: list[str], histograms: dict[str, _Histogram]) -> None:
         emitted_help: set[str] = set()
-        for key in sorted(self.histograms):
+        for key in sorted(histograms):
             name, label_str = self._parse_key(key)
             if name not in emitted_help:
                 lines.append(f"# HELP {name} Duration histogram")
                 lines.append(f"# TYPE {name} histogram")
                 emitted_help.add(name)
-            for le, count in self.histograms[key]:
+            hist = histograms[key]
+            for le, count in hist.cumulative():
                 le_str = "+Inf" if le == float("inf") else (f"{le:g}")
                 lines.append(f'{name}_bucket{{{label_str},le="{le_str}"}} {count}')
-            lines.append(f"{name}_sum{{{label_str}}} {self._histogram_sums[key]}")
-            lines.append(f"{name}_count{{{label_str}}} {self._histogram_counts[key]}")
+            lines.append(f"{name}_sum{{{label_str}}} {hist.sum}")
+            lines.append(f"{name}_count{{{label_str}}} {hist.count}")
 
-    def _collect_gauges(self, lines: list[str]) -> None:
+    def _collect_gauges(self, lines: list[str], gauges: dict[str, int]) -> None:
         emitted_help: set[str] = set()
-        for key, value in sorted(self.gauges.items()):
+        for key, value in sorted(gauges.items()):
             name, label_str = self._parse_key(key)
             if name not in emitted_help:
                 lines.append(f"# HELP {name} Gauge value")
@@ -243,67 +530,96 @@ class MetricsRegistry:
         return name, label_str
 
 
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
 def get_metrics_registry() -> MetricsRegistry:
     """Convenience accessor for the global metrics registry."""
     return MetricsRegistry.get_instance()
 
 
-# ── Starlette Middleware ────────────────────────────────────────────
+def record_http_request(
+    registry: MetricsRegistry,
+    method: str,
+    path_template: str,
+    status_code: int,
+    duration: float,
+) -> None:
+    """Record one finished request in the HTTP counter and histogram."""
+    registry.counter(
+        "http_requests_total",
+        {
+            "method": method,
+            "path_template": path_template,
+            "status_code": str(status_code),
+        },
+    ).inc()
+    registry.histogram(
+        "http_request_duration_seconds",
+        {"method": method, "path_template": path_template},
+    ).observe(duration)
+
+
+def record_rate_limit_check(
+    registry: MetricsRegistry,
+    limiter: str,
+    source: str,
+    duration: float,
+) -> None:
+    """Record how long one rate-limit decision took and where it came from."""
+    registry.histogram(
+        "rate_limit_check_duration_seconds",
+        {"limiter": limiter, "source": source},
+        RATE_LIMIT_BUCKETS,
+    ).observe(duration)
+
+
+# ── ASGI Middleware ─────────────────────────────────────────────────
+
+
+class MetricsMiddleware:
+    """Record HTTP request metrics for Prometheus scraping.
+
+    Pure ASGI: the status code is read off ``http.response.start`` and
+    the body is passed through untouched.  Requests whose handler raises
+    are recorded as 500s before the exception propagates.
+    """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Record HTTP request metrics for Prometheus scraping."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
         registry = get_metrics_registry()
-        method = request.method
-        path = normalize_path(request.url.path)
+        method = scope["method"]
+        path = normalize_path(scope["path"])
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Track in-progress requests
         gauge_labels = {"method": method}
         registry.inc_gauge("http_requests_in_progress", gauge_labels)
-
         start = time.perf_counter()
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception:
-            # Record a 500 even if the exception propagates
-            duration = time.perf_counter() - start
-            registry.inc_counter(
-                "http_requests_total",
-                {
-                    "method": method,
-                    "path_template": path,
-                    "status_code": "500",
-                },
-            )
-            registry.observe_histogram(
-                "http_request_duration_seconds",
-                {"method": method, "path_template": path},
-                duration,
-            )
+            status_code = 500
             raise
         finally:
             registry.dec_gauge("http_requests_in_progress", gauge_labels)
-
-        duration = time.perf_counter() - start
-        status_code = str(response.status_code)
-
-        registry.inc_counter(
-            "http_requests_total",
-            {
-                "method": method,
-                "path_template": path,
-                "status_code": status_code,
-            },
-        )
-        registry.observe_histogram(
-            "http_request_duration_seconds",
-            {"method": method, "path_template": path},
-            duration,
-        )
-        return response
+            record_http_request(registry, method, path, status_code, time.perf_counter() - start)
@@ -1,4 +1,10 @@
-"""HTTP rate limiting middleware using Redis fixed-window counters."""
+"""HTTP rate limiting middleware using Redis fixed-window counters.
+
+Each decision is one atomic script call (see ``atomic_rate_limit``), which
+can also check the per-tier sliding window for the same request.  With
+``lease_size`` set, quota is leased into a local token bucket and most
+requests are decided without touching Redis.
+"""
 
 from __future__ import annotations
 
@@ -6,11 +12,19 @@ import time
 
 import structlog
 from redis.asyncio import Redis
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
-
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shieldops.api.middleware.atomic_rate_limit import (
+    AtomicRateLimiter,
+    LocalTokenBucket,
+    RateLimitDecision,
+    SlidingWindow,
+)
+from shieldops.api.middleware.metrics import get_metrics_registry, record_rate_limit_check
+from shieldops.api.middleware.sliding_window import resolve_sliding_window
 from shieldops.config import settings
 
 logger = structlog.get_logger()
@@ -50,27 +64,57 @@ def _get_client_ip(request: Request) -> str:
 def _extract_user(request: Request) -> tuple[str | None, str | None]:
     """Lightweight JWT extraction — no DB lookup.
 
-    Returns (user_id, role) or (None, None) if unauthenticated.
+    Reuses the claims already decoded by ``RequestContextMiddleware``
+    when it runs earlier in the stack.  Returns (user_id, role) or
+    (None, None) if unauthenticated.
     """
-    from shieldops.api.auth.service import decode_token
+    from shieldops.api.auth.service import decode_request_token
+    from shieldops.api.middleware.context import get_request_context
+
+    context = get_request_context(request.scope)
+    if context is not None:
+        return context.user_id, context.role
 
     auth_header = request.headers.get("authorization", "")
     if not auth_header.startswith("Bearer "):
         return None, None
 
-    payload = decode_token(auth_header[7:])
+    payload = decode_request_token(request.scope, auth_header[7:])
     if payload is None:
         return None, None
 
     return payload.get("sub"), payload.get("role")
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Fixed-window rate limiter backed by Redis INCR + EXPIRE."""
+class RateLimitMiddleware:
+    """Fixed-window rate limiter backed by an atomic Redis script.
 
-    def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
-        self._client: Redis | None = None
+    Args:
+        redis: Client to use; created from ``settings.redis_url`` if omitted.
+        sliding_window: Also enforce the ``sliding_window`` tier limits in
+            the same script call.
+        lease_size: Requests to lease per refill of the local token bucket;
+            0 sends every request to Redis (exact counts).  Leasing covers
+            the fixed window only, so it is ignored with ``sliding_window``.
+        lease_max_fraction: Cap on a single lease as a fraction of the limit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis: Redis | None = None,
+        *,
+        sliding_window: bool = False,
+        lease_size: int = 0,
+        lease_max_fraction: float = 0.1,
+    ) -> None:
+        self.app = app
+        self._client: Redis | None = redis
+        self._sliding_window = sliding_window
+        self._lease_size = 0 if sliding_window else lease_size
+        self._lease_max_fraction = lease_max_fraction
+        self._limiter: AtomicRateLimiter | None = None
+        self._bucket: LocalTokenBucket | None = None
 
     async def _ensure_client(self) -> Redis:
         if self._client is None:
@@ -81,42 +125,67 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             )
         return self._client
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if not settings.rate_limit_enabled:
-            return await call_next(request)
+    async def _ensure_limiter(self) -> AtomicRateLimiter:
+        if self._limiter is None:
+            self._limiter = AtomicRateLimiter(await self._ensure_client())
+            if self._lease_size > 0:
+                self._bucket = LocalTokenBucket(
+                    self._limiter, self._lease_size, self._lease_max_fraction
+                )
+        return self._limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.rate_limit_enabled:
+            await self.app(scope, receive, send)
+            return
 
-        path = request.url.path
+        path = scope["path"]
 
         # Skip exempt paths
         if path in _EXEMPT_PATHS:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Determine identity and limit
+        request = Request(scope)
         limit, key_identity = self._resolve_limit_and_key(request, path)
 
         # Build Redis key with window bucket
         window = settings.rate_limit_window_seconds
-        bucket = int(time.time()) // window
+        now = time.time()
+        bucket = int(now) // window
         redis_key = f"shieldops:http_rate:{bucket}:{key_identity}"
+        reset_at = (bucket + 1) * window
+
+        sliding: SlidingWindow | None = None
+        if self._sliding_window:
+            sliding_key, _, _, sliding_limit, sliding_window = resolve_sliding_window(scope)
+            sliding = SlidingWindow(sliding_key, sliding_limit, sliding_window)
 
-        # Try Redis counter
+        start = time.perf_counter()
         try:
-            client = await self._ensure_client()
-            count = await client.incr(redis_key)
-            if count == 1:
-                await client.expire(redis_key, window)
+            limiter = await self._ensure_limiter()
+            decision: RateLimitDecision
+            if self._bucket is not None:
+                decision = await self._bucket.acquire(redis_key, limit, window, reset_at)
+            else:
+                decision = await limiter.check(redis_key, limit, window, sliding)
         except Exception as exc:
             # Fail-open: let request through, log warning
             logger.warning("rate_limit_redis_error", error=str(exc), path=path)
-            return await call_next(request)
-
-        reset_at = (bucket + 1) * window
-        remaining = max(0, limit - count)
+            await self.app(scope, receive, send)
+            return
+        record_rate_limit_check(
+            get_metrics_registry(), "fixed_window", decision.source, time.perf_counter() - start
+        )
 
         # Over limit → 429
-        if count > limit:
+        if not decision.allowed:
+            if decision.denied_by == "sliding" and sliding is not None:
+                limit = sliding.limit
+                reset_at = int(now) + sliding.window
             retry_after = reset_at - int(time.time())
-            request_id = getattr(request.state, "request_id", "unknown")
+            request_id = scope.get("state", {}).get("request_id", "unknown")
             logger.warning(
                 "rate_limit_exceeded",
                 identity=key_identity,
@@ -135,14 +204,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             resp.headers["X-RateLimit-Remaining"] = "0"
             resp.headers["X-RateLimit-Reset"] = str(reset_at)
             resp.headers["Retry-After"] = str(retry_after)
-            return resp
+            await resp(scope, receive, send)
+            return
+
+        remaining = decision.remaining
 
         # Normal response with rate limit headers
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(reset_at)
-        return response
+        async def send_with_limits(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(reset_at)
+            await send(message)
+
+        await self.app(scope, receive, send_with_limits)
 
     def _resolve_limit_and_key(self, request: Request, path: str) -> tuple[int, str]:
         """Return (limit, identity_key) based on path and auth status."""
@@ -11,12 +11,8 @@ from __future__ import annotations
 import asyncio
 
 import structlog
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
@@ -119,10 +115,10 @@ def reset_shutdown_state() -> None:
     _shutdown_state = None
 
 
-# ── Starlette Middleware ────────────────────────────────────────────
+# ── ASGI Middleware ─────────────────────────────────────────────────
 
 
-class GracefulShutdownMiddleware(BaseHTTPMiddleware):
+class GracefulShutdownMiddleware:
     """Tracks in-flight requests and rejects new ones during shutdown.
 
     During normal operation each request increments an atomic counter
@@ -137,31 +133,35 @@ class GracefulShutdownMiddleware(BaseHTTPMiddleware):
     finished draining.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         state = get_shutdown_state()
-        path = request.url.path
+        path = scope["path"]
 
         if state.shutting_down and path not in _SHUTDOWN_EXEMPT_PATHS:
             logger.debug(
                 "request_rejected_during_shutdown",
                 path=path,
-                method=request.method,
+                method=scope["method"],
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=503,
                 content={
                     "detail": "Server is shutting down",
                 },
                 headers={"Retry-After": "5"},
             )
+            await response(scope, receive, send)
+            return
 
         await state.increment()
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             await state.decrement()
-        return response
@@ -6,13 +6,11 @@ import time
 
 import structlog
 from redis.asyncio import Redis
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shieldops.api.middleware.metrics import get_metrics_registry, record_rate_limit_check
 
 logger = structlog.get_logger()
 
@@ -38,37 +36,53 @@ METHOD_TIERS: dict[str, str] = {
 _EXEMPT_PATHS: set[str] = {"/health", "/ready", "/metrics"}
 
 
-class SlidingWindowRateLimiter(BaseHTTPMiddleware):
-    """Redis sliding window rate limiter with per-tenant limits."""
+def resolve_sliding_window(scope: Scope) -> tuple[str, str, str, int, int]:
+    """Return ``(key, identity, tier, limit, window)`` for an HTTP scope."""
+    # Determine identity key (tenant > user > IP)
+    state = scope.setdefault("state", {})
+    org_id = state.get("organization_id")
+    user_id = state.get("user_id")
+    client = scope.get("client")
+    client_ip = client[0] if client else "unknown"
+    identity = org_id or user_id or client_ip
 
-    def __init__(self, app: ASGIApp, redis: Redis | None = None) -> None:
-        super().__init__(app)
-        self._redis = redis
+    # Determine tier
+    tier = METHOD_TIERS.get(scope["method"], "read")
+    if "/auth/" in scope["path"]:
+        tier = "auth"
+
+    # Get limit (check tenant override from request.state)
+    tenant_limit = state.get("rate_limit_override")
+    default_limit, window = TIER_LIMITS[tier]
+    limit = tenant_limit if tenant_limit else default_limit
+    return f"ratelimit:{tier}:{identity}", identity, tier, limit, window
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if self._redis is None or request.url.path in _EXEMPT_PATHS:
-            return await call_next(request)
 
-        # Determine identity key (tenant > user > IP)
-        org_id = getattr(request.state, "organization_id", None)
-        user_id = getattr(request.state, "user_id", None)
-        client_ip = request.client.host if request.client else "unknown"
-        identity = org_id or user_id or client_ip
+class SlidingWindowRateLimiter:
+    """Redis sliding window rate limiter with per-tenant limits.
 
-        # Determine tier
-        tier = METHOD_TIERS.get(request.method, "read")
-        if "/auth/" in request.url.path:
-            tier = "auth"
+    ``create_app()`` does not mount this layer: ``RateLimitMiddleware``
+    checks the same tiers inside its own script call when
+    ``sliding_window_rate_limit_enabled`` is set.
+    """
 
-        # Get limit (check tenant override from request.state)
-        tenant_limit = getattr(request.state, "rate_limit_override", None)
-        default_limit, window = TIER_LIMITS[tier]
-        limit = tenant_limit if tenant_limit else default_limit
+    def __init__(self, app: ASGIApp, redis: Redis | None = None) -> None:
+        self.app = app
+        self._redis = redis
 
-        # Sliding window check
-        key = f"ratelimit:{tier}:{identity}"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if scope["type"] != "http" or self._redis is None or path in _EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        key, identity, tier, limit, window = resolve_sliding_window(scope)
         now = time.time()
+        start = time.perf_counter()
         allowed, remaining, reset_at = await self._check_rate(key, limit, window, now)
+        record_rate_limit_check(
+            get_metrics_registry(), "sliding_window", "redis", time.perf_counter() - start
+        )
 
         if not allowed:
             logger.warning(
@@ -77,7 +91,7 @@ class SlidingWindowRateLimiter(BaseHTTPMiddleware):
                 tier=tier,
                 limit=limit,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Rate limit exceeded",
@@ -90,12 +104,18 @@ class SlidingWindowRateLimiter(BaseHTTPMiddleware):
                     "Retry-After": str(int(reset_at - now)),
                 },
             )
-
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(reset_at))
-        return response
+            await response(scope, receive, send)
+            return
+
+        async def send_with_limits(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(int(reset_at))
+            await send(message)
+
+        await self.app(scope, receive, send_with_limits)
 
     async def _check_rate(
         self, key: str, limit: int, window: int, now: float
@@ -3,12 +3,8 @@
 from __future__ import annotations
 
 import structlog
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = structlog.get_logger()
 
@@ -25,31 +21,38 @@ _PUBLIC_PATHS: set[str] = {
 }
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class TenantMiddleware:
     """Extract organization_id and place it on ``request.state``."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        path = scope["path"]
+
         # Skip tenant resolution for unauthenticated paths
-        if request.url.path in _PUBLIC_PATHS:
-            request.state.organization_id = None
-            return await call_next(request)
+        if path in _PUBLIC_PATHS:
+            state["organization_id"] = None
+            await self.app(scope, receive, send)
+            return
 
         # Prefer org_id already set by auth (e.g. JWT claim)
-        org_id: str | None = getattr(request.state, "organization_id", None)
+        org_id: str | None = state.get("organization_id")
         if org_id is None:
             # Fallback: API-key-style header
-            org_id = request.headers.get("X-Organization-ID")
-            request.state.organization_id = org_id
+            org_id = Headers(scope=scope).get("X-Organization-ID")
+            state["organization_id"] = org_id
 
         if org_id:
             logger.debug(
                 "tenant_resolved",
                 organization_id=org_id,
-                path=request.url.path,
+                path=path,
             )
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -1,20 +1,31 @@
-"""API usage tracking middleware -- records per-endpoint call counts."""
+"""API usage tracking middleware -- records per-endpoint call counts.
+
+Endpoints are recorded by route template (``GET /api/v1/agents/{id}``),
+not raw path, so the set of keys stays proportional to the API surface.
+``record`` only touches one of several striped buffers; the buffers are
+drained into the per-org store when it is queried or rolled up.  Hours
+that have ended are compacted into arrays and evicted after the
+retention window.  When a sink is attached, compacted hours are written
+to it in bulk so billing can read them from the database.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import threading
 import time
+from array import array
 from collections import defaultdict
-from datetime import UTC, datetime, timedelta
-from typing import Any, ClassVar
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, datetime
+from typing import Any, ClassVar, NamedTuple, Protocol, runtime_checkable
 
 import structlog
-from starlette.middleware.base import (
-    BaseHTTPMiddleware,
-    RequestResponseEndpoint,
-)
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from shieldops.api.middleware.metrics import normalize_path
+from shieldops.config import settings
 
 logger = structlog.get_logger()
 
@@ -27,28 +38,144 @@ _SKIP_PATHS: frozenset[str] = frozenset(
     }
 )
 
+# Endpoints an org records past ``max_endpoints_per_org`` are folded into this.
+OVERFLOW_ENDPOINT = "<other>"
+
+_STRIPES = 16
+
+
+def _hour_index(ts: float) -> int:
+    return int(ts // 3600)
+
+
+def _hour_key(hour: int) -> str:
+    return datetime.fromtimestamp(hour * 3600, UTC).strftime("%Y-%m-%dT%H")
+
+
+class UsageRollup(NamedTuple):
+    """One org's calls to one endpoint during one hour."""
+
+    org_id: str
+    endpoint: str
+    hour: datetime
+    call_count: int
+    total_latency_ms: float
+
+
+@runtime_checkable
+class UsageSink(Protocol):
+    """Destination for completed hourly rollups (e.g. the Repository)."""
+
+    async def write_usage_rollups(self, rows: Sequence[UsageRollup]) -> None: ...
+
+
+class _HourRollup:
+    """A completed hour of one org's usage in columnar form."""
+
+    __slots__ = ("counts", "endpoints", "hour", "latency_ms", "persisted", "total")
+
+    def __init__(self, hour: int, cells: dict[int, list[float]]) -> None:
+        ids = sorted(cells)
+        self.hour = hour
+        self.endpoints = array("I", ids)
+        self.counts = array("Q", (int(cells[i][0]) for i in ids))
+        self.latency_ms = array("d", (cells[i][1] for i in ids))
+        self.total = sum(self.counts)
+        self.persisted = False
+
+
+class _OrgUsage:
+    """Per-org endpoint names, the still-open hour(s) and compacted hours."""
+
+    __slots__ = ("closed", "endpoint_ids", "endpoints", "open")
+
+    def __init__(self) -> None:
+        self.endpoint_ids: dict[str, int] = {}
+        self.endpoints: list[str] = []
+        # {hour: {endpoint_id: [count, total_ms]}}
+        self.open: dict[int, dict[int, list[float]]] = {}
+        # A late write for an already-compacted hour produces a second
+        # rollup for that hour; readers and the sink just add them up.
+        self.closed: list[_HourRollup] = []
+
+    def endpoint_id(self, endpoint: str, limit: int) -> int:
+        ep = self.endpoint_ids.get(endpoint)
+        if ep is None:
+            if len(self.endpoints) >= limit:
+                endpoint = OVERFLOW_ENDPOINT
+                ep = self.endpoint_ids.get(endpoint)
+            if ep is None:
+                ep = len(self.endpoints)
+                self.endpoints.append(endpoint)
+                self.endpoint_ids[endpoint] = ep
+        return ep
+
+    def cells(self, first_hour: int) -> Iterator[tuple[int, str, int, float]]:
+        """Yield ``(hour, endpoint, count, total_ms)`` from *first_hour* on."""
+        names = self.endpoints
+        for rollup in self.closed:
+            if rollup.hour >= first_hour:
+                for ep, count, ms in zip(
+                    rollup.endpoints, rollup.counts, rollup.latency_ms, strict=True
+                ):
+                    yield rollup.hour, names[ep], count, ms
+        for hour, cells in self.open.items():
+            if hour >= first_hour:
+                for ep, (count, ms) in cells.items():
+                    yield hour, names[ep], int(count), ms
+
+    def total(self, first_hour: int, unpersisted_only: bool = False) -> int:
+        total = sum(
+            r.total
+            for r in self.closed
+            if r.hour >= first_hour and not (unpersisted_only and r.persisted)
+        )
+        for hour, cells in self.open.items():
+            if hour >= first_hour:
+                total += sum(int(c[0]) for c in cells.values())
+        return total
+
+
+class _Stripe:
+    __slots__ = ("lock", "pending")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # {(org, endpoint, hour): [count, total_ms]}
+        self.pending: dict[tuple[str, str, int], list[float]] = {}
+
 
 class UsageTracker:
     """In-memory, thread-safe API usage tracker.
 
     Stores per-org, per-endpoint, per-hour call counts and latencies.
     Designed for lightweight analytics without external dependencies.
+
+    Args:
+        retention_hours: Hours of usage kept in memory.
+        max_endpoints_per_org: Distinct endpoints tracked per org before
+            the rest are counted under ``OVERFLOW_ENDPOINT``.
+        sink: Receives completed hours from ``flush_to_sink``.
     """
 
     _instance: ClassVar[UsageTracker | None] = None
     _lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        retention_hours: int = 720,
+        max_endpoints_per_org: int = 500,
+        sink: UsageSink | None = None,
+    ) -> None:
         self._mu = threading.Lock()
-        # {org_key: {endpoint: {hour_key: count}}}
-        self._counts: dict[str, dict[str, dict[str, int]]] = defaultdict(
-            lambda: defaultdict(lambda: defaultdict(int))
-        )
-        # {org_key: {endpoint: {hour_key: total_ms}}}
-        self._latencies: dict[str, dict[str, dict[str, float]]] = defaultdict(
-            lambda: defaultdict(lambda: defaultdict(float))
-        )
-        self._total_calls: dict[str, int] = defaultdict(int)
+        self._stripes = tuple(_Stripe() for _ in range(_STRIPES))
+        self._orgs: dict[str, _OrgUsage] = {}
+        self._retention_hours = retention_hours
+        self._max_endpoints = max_endpoints_per_org
+        self.sink = sink
+        self._writing: asyncio.Future[None] | None = None
+        self._flush_listeners: list[Callable[[set[str]], None]] = []
 
     # -- Singleton access --------------------------------------------------
 
@@ -58,7 +185,10 @@ class UsageTracker:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = cls()
+                    cls._instance = cls(
+                        retention_hours=settings.usage_retention_hours,
+                        max_endpoints_per_org=settings.usage_max_endpoints_per_org,
+                    )
         return cls._instance
 
     @classmethod
@@ -75,25 +205,141 @@ class UsageTracker:
         method: str,
         path: str,
         duration_ms: float = 0.0,
+        *,
+        timestamp: float | None = None,
     ) -> None:
         """Record a single API call."""
         key = org_id or "_anonymous"
-        endpoint = f"{method} {path}"
-        hour = datetime.now(UTC).strftime("%Y-%m-%dT%H")
+        ts = time.time() if timestamp is None else timestamp
+        cell_key = (key, f"{method} {path}", _hour_index(ts))
+        stripe = self._stripes[hash(key) % _STRIPES]
+        with stripe.lock:
+            cell = stripe.pending.get(cell_key)
+            if cell is None:
+                stripe.pending[cell_key] = [1, duration_ms]
+            else:
+                cell[0] += 1
+                cell[1] += duration_ms
+
+    def _drain_locked(self) -> None:
+        """Move every stripe's pending counts into the per-org store."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                pending, stripe.pending = stripe.pending, {}
+            for (org, endpoint, hour), (count, ms) in pending.items():
+                usage = self._orgs.get(org)
+                if usage is None:
+                    usage = self._orgs[org] = _OrgUsage()
+                ep = usage.endpoint_id(endpoint, self._max_endpoints)
+                cell = usage.open.setdefault(hour, {}).get(ep)
+                if cell is None:
+                    usage.open[hour][ep] = [count, ms]
+                else:
+                    cell[0] += count
+                    cell[1] += ms
+
+    # -- Rollup and persistence ---------------------------------------------
+
+    def rollup(self, *, final: bool = False) -> None:
+        """Compact ended hours into arrays and evict expired ones.
+
+        With *final* the current hour is compacted too, so that a last
+        ``flush_to_sink`` at shutdown persists it.
+        """
+        current = _hour_index(time.time())
+        close_before = current + 1 if final else current
+        cutoff = current - self._retention_hours
+        with self._mu:
+            self._drain_locked()
+            for org, usage in list(self._orgs.items()):
+                for hour in [h for h in usage.open if h < close_before]:
+                    cells = usage.open.pop(hour)
+                    if hour > cutoff:
+                        usage.closed.append(_HourRollup(hour, cells))
+                usage.closed = [r for r in usage.closed if r.hour > cutoff]
+                if not usage.open and not usage.closed:
+                    del self._orgs[org]
+
+    def add_flush_listener(self, callback: Callable[[set[str]], None]) -> None:
+        """Call *callback* with the affected org IDs after each successful flush.
+
+        Counts of those orgs have just moved from the unpersisted local
+        total to the sink, so anything caching the sink's total for them
+        is stale.
+        """
+        self._flush_listeners.append(callback)
+
+    async def flush_to_sink(self) -> int:
+        """Write compacted hours not yet persisted to the sink in one batch.
+
+        Returns the number of rows written.  On failure the hours stay
+        unpersisted and are retried on the next flush.  The write and
+        the marking of its hours as persisted run as one shielded step:
+        cancelling a flush never leaves rows written but unmarked, and a
+        following flush waits for that write instead of repeating it.
+        """
+        if self.sink is None:
+            return 0
+        if self._writing is not None and not self._writing.done():
+            with contextlib.suppress(Exception):
+                await asyncio.shield(self._writing)
         with self._mu:
-            self._counts[key][endpoint][hour] += 1
-            self._latencies[key][endpoint][hour] += duration_ms
-            self._total_calls[key] += 1
+            batch = [r for usage in self._orgs.values() for r in usage.closed if not r.persisted]
+            rows = [
+                UsageRollup(
+                    org,
+                    usage.endpoints[ep],
+                    datetime.fromtimestamp(r.hour * 3600, UTC),
+                    count,
+                    ms,
+                )
+                for org, usage in self._orgs.items()
+                for r in usage.closed
+                if not r.persisted
+                for ep, count, ms in zip(r.endpoints, r.counts, r.latency_ms, strict=True)
+            ]
+        if not rows:
+            return 0
+        self._writing = asyncio.ensure_future(self._write_batch(self.sink, batch, rows))
+        # Retrieve the outcome even when the flush that started it was cancelled
+        self._writing.add_done_callback(lambda f: f.cancelled() or f.exception())
+        await asyncio.shield(self._writing)
+        return len(rows)
+
+    async def _write_batch(
+        self, sink: UsageSink, batch: list[_HourRollup], rows: list[UsageRollup]
+    ) -> None:
+        await sink.write_usage_rollups(rows)
+        for rollup in batch:
+            rollup.persisted = True
+        orgs = {row.org_id for row in rows}
+        for callback in self._flush_listeners:
+            try:
+                callback(orgs)
+            except Exception as exc:
+                logger.warning("usage_flush_listener_failed", error=str(exc))
+
+    async def run(self, interval: float) -> None:
+        """Roll up and persist every *interval* seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self.rollup()
+            try:
+                await self.flush_to_sink()
+            except Exception as exc:
+                logger.warning("usage_rollup_persist_failed", error=str(exc))
 
     # -- Query helpers -----------------------------------------------------
 
-    def _hour_keys_in_range(
-        self,
-        hours: int,
-    ) -> set[str]:
-        """Return the set of hour-key strings within the window."""
-        now = datetime.now(UTC)
-        return {(now - timedelta(hours=i)).strftime("%Y-%m-%dT%H") for i in range(hours)}
+    def _first_hour(self, hours: int) -> int:
+        return _hour_index(time.time()) - hours + 1
+
+    def _selected_orgs_locked(self, org_id: str | None) -> list[tuple[str, _OrgUsage]]:
+        self._drain_locked()
+        if org_id is None:
+            return list(self._orgs.items())
+        usage = self._orgs.get(org_id or "_anonymous")
+        return [] if usage is None else [(org_id, usage)]
 
     def get_usage(
         self,
@@ -101,27 +347,41 @@ class UsageTracker:
         hours: int = 24,
     ) -> dict[str, Any]:
         """Get aggregated usage stats, optionally filtered by org."""
-        valid_hours = self._hour_keys_in_range(hours)
+        first_hour = self._first_hour(hours)
+        total = 0
+        seen_endpoints: set[str] = set()
         with self._mu:
-            orgs = [org_id or "_anonymous"] if org_id is not None else list(self._counts.keys())
-            total = 0
-            endpoint_count = 0
-            seen_endpoints: set[str] = set()
-            for org in orgs:
-                for ep, hour_map in self._counts.get(org, {}).items():
-                    for h, cnt in hour_map.items():
-                        if h in valid_hours:
-                            total += cnt
-                            seen_endpoints.add(ep)
-                    endpoint_count = len(seen_endpoints)
+            for _org, usage in self._selected_orgs_locked(org_id):
+                for _h, ep, count, _ms in usage.cells(first_hour):
+                    total += count
+                    seen_endpoints.add(ep)
 
         return {
             "period_hours": hours,
             "total_calls": total,
-            "unique_endpoints": endpoint_count,
+            "unique_endpoints": len(seen_endpoints),
             "org_id": org_id,
         }
 
+    def get_org_total(
+        self,
+        org_id: str | None,
+        hours: int = 24,
+        *,
+        unpersisted_only: bool = False,
+    ) -> int:
+        """Total calls for one org, without per-endpoint detail.
+
+        With *unpersisted_only*, hours already written to the sink are
+        left out -- add the sink's own total to get the full figure.
+        """
+        first_hour = self._first_hour(hours)
+        with self._mu:
+            return sum(
+                usage.total(first_hour, unpersisted_only)
+                for _org, usage in self._selected_orgs_locked(org_id)
+            )
+
     def get_top_endpoints(
         self,
         org_id: str | None = None,
@@ -129,18 +389,14 @@ class UsageTracker:
         hours: int = 24,
     ) -> list[dict[str, Any]]:
         """Get the most-called endpoints within the time window."""
-        valid_hours = self._hour_keys_in_range(hours)
+        first_hour = self._first_hour(hours)
         # {endpoint: (count, total_latency_ms)}
         agg: dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
         with self._mu:
-            orgs = [org_id or "_anonymous"] if org_id is not None else list(self._counts.keys())
-            for org in orgs:
-                for ep, hour_map in self._counts.get(org, {}).items():
-                    for h, cnt in hour_map.items():
-                        if h in valid_hours:
-                            agg[ep][0] += cnt
-                            lat_map = self._latencies.get(org, {}).get(ep, {})
-                            agg[ep][1] += lat_map.get(h, 0.0)
+            for _org, usage in self._selected_orgs_locked(org_id):
+                for _h, ep, count, ms in usage.cells(first_hour):
+                    agg[ep][0] += count
+                    agg[ep][1] += ms
 
         ranked = sorted(
             agg.items(),
@@ -166,36 +422,33 @@ class UsageTracker:
         hours: int = 24,
     ) -> list[dict[str, Any]]:
         """Get call volume broken down by hour."""
-        valid_hours = self._hour_keys_in_range(hours)
-        # {hour_key: count}
-        hourly: dict[str, int] = defaultdict(int)
+        first_hour = self._first_hour(hours)
+        # {hour: count}
+        hourly: dict[int, int] = defaultdict(int)
         with self._mu:
-            orgs = [org_id or "_anonymous"] if org_id is not None else list(self._counts.keys())
-            for org in orgs:
-                for _ep, hour_map in self._counts.get(org, {}).items():
-                    for h, cnt in hour_map.items():
-                        if h in valid_hours:
-                            hourly[h] += cnt
+            for _org, usage in self._selected_orgs_locked(org_id):
+                for h, _ep, count, _ms in usage.cells(first_hour):
+                    hourly[h] += count
 
         # Return sorted by hour ascending
-        return [{"hour": h, "count": hourly[h]} for h in sorted(valid_hours)]
+        return [
+            {"hour": _hour_key(h), "count": hourly[h]}
+            for h in range(first_hour, first_hour + hours)
+        ]
 
     def get_usage_by_org(
         self,
         hours: int = 24,
     ) -> list[dict[str, Any]]:
         """Get per-organization usage breakdown (admin view)."""
-        valid_hours = self._hour_keys_in_range(hours)
-        org_totals: dict[str, int] = defaultdict(int)
+        first_hour = self._first_hour(hours)
         with self._mu:
-            for org, ep_map in self._counts.items():
-                for _ep, hour_map in ep_map.items():
-                    for h, cnt in hour_map.items():
-                        if h in valid_hours:
-                            org_totals[org] += cnt
+            org_totals = {
+                org: usage.total(first_hour) for org, usage in self._selected_orgs_locked(None)
+            }
 
         ranked = sorted(
-            org_totals.items(),
+            ((org, cnt) for org, cnt in org_totals.items() if cnt),
             key=lambda x: x[1],
             reverse=True,
         )
@@ -204,9 +457,8 @@ class UsageTracker:
     def reset(self) -> None:
         """Clear all stored data (useful in tests)."""
         with self._mu:
-            self._counts.clear()
-            self._latencies.clear()
-            self._total_calls.clear()
+            self._drain_locked()
+            self._orgs.clear()
 
 
 def get_usage_tracker() -> UsageTracker:
@@ -214,40 +466,44 @@ def get_usage_tracker() -> UsageTracker:
     return UsageTracker.get_instance()
 
 
-# -- Starlette Middleware --------------------------------------------------
+def _endpoint_path(scope: Scope) -> str:
+    """The matched route's template, or the path with IDs normalised.
 
+    Inside a mounted sub-app the route path is relative to the mount,
+    which the router has moved into ``root_path``.
+    """
+    template = getattr(scope.get("route"), "path", None)
+    if template:
+        return scope.get("root_path", "") + template
+    return normalize_path(scope["path"])
 
-class UsageTrackerMiddleware(BaseHTTPMiddleware):
+
+# -- ASGI Middleware -------------------------------------------------------
+
+
+class UsageTrackerMiddleware:
     """Middleware that records API call counts and latencies."""
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        path = request.url.path
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip infrastructure endpoints
-        if path in _SKIP_PATHS:
-            return await call_next(request)
-
-        method = request.method
-        org_id: str | None = getattr(
-            request.state,
-            "organization_id",
-            None,
-        )
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         start = time.perf_counter()
-        response = await call_next(request)
+        await self.app(scope, receive, send)
         duration_ms = (time.perf_counter() - start) * 1000.0
 
+        # Read after the call: an inner auth layer may have set it, and
+        # the router has recorded the matched route.
+        org_id: str | None = scope.get("state", {}).get("organization_id")
         tracker = get_usage_tracker()
         tracker.record(
             org_id=org_id,
-            method=method,
-            path=path,
+            method=scope["method"],
+            path=_endpoint_path(scope),
             duration_ms=duration_ms,
         )
-
-        return response
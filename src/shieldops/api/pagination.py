@@ -1,12 +1,22 @@
 """Cursor-based pagination utilities.
 
 Provides base64-encoded cursor pagination for all list endpoints.
+
+Two cursor kinds are supported:
+
+* offset cursors (:func:`encode_cursor` / :func:`paginate`) for lists that
+  are already in memory;
+* keyset cursors (:func:`encode_keyset_cursor` / :func:`keyset_paginate`)
+  for database-backed lists, which carry the ``(sort timestamp, id)`` of
+  the last row returned so the next page is a bounded index seek rather
+  than an ``OFFSET`` scan that grows with page depth.
 """
 
 from __future__ import annotations
 
 import base64
 import json
+from datetime import datetime
 from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
@@ -27,25 +37,52 @@ class PaginatedResponse(BaseModel, Generic[T]):  # noqa: UP046
     limit: int = DEFAULT_LIMIT
 
 
+def _encode(data: dict[str, Any]) -> str:
+    payload = json.dumps(data).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Any:
+    padding = 4 - len(cursor) % 4
+    if padding != 4:
+        cursor += "=" * padding
+    return json.loads(base64.urlsafe_b64decode(cursor))
+
+
 def encode_cursor(offset: int) -> str:
     """Encode an offset as a base64 cursor string."""
-    payload = json.dumps({"offset": offset}).encode()
-    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    return _encode({"offset": offset})
 
 
 def parse_cursor(cursor: str) -> int:
     """Decode a base64 cursor string to an offset."""
     try:
-        padding = 4 - len(cursor) % 4
-        if padding != 4:
-            cursor += "=" * padding
-        payload = base64.urlsafe_b64decode(cursor)
-        data = json.loads(payload)
+        data = _decode(cursor)
         return int(data.get("offset", 0))
     except Exception:
         return 0
 
 
+def encode_keyset_cursor(sort_value: datetime | str, row_id: str) -> str:
+    """Encode the ``(sort timestamp, id)`` of the last row on a page."""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    return _encode({"ts": sort_value, "id": row_id})
+
+
+def parse_keyset_cursor(cursor: str) -> tuple[datetime, str] | None:
+    """Decode a keyset cursor to ``(sort timestamp, id)``.
+
+    Returns ``None`` for malformed cursors (including offset cursors), so
+    callers fall back to the first page as :func:`parse_cursor` does.
+    """
+    try:
+        data = _decode(cursor)
+        return datetime.fromisoformat(data["ts"]), str(data["id"])
+    except Exception:
+        return None
+
+
 def paginate(
     items: list[Any],
     cursor: str | None = None,
@@ -76,3 +113,48 @@ def paginate(
         total_count=total,
         limit=limit,
     )
+
+
+def next_keyset_cursor(
+    rows: list[dict[str, Any]],
+    limit: int,
+    *,
+    sort_key: str = "created_at",
+    id_key: str = "id",
+) -> str | None:
+    """Cursor for the page after *rows*, or ``None`` if *rows* is not full.
+
+    The cursor is taken from the last row that has a sort value.  Rows
+    without one cannot be sought past; descending order puts NULLs first,
+    so they already come before any row that does have a value.
+    """
+    if not rows or len(rows) < limit:
+        return None
+    for row in reversed(rows):
+        if row.get(sort_key) is not None:
+            return encode_keyset_cursor(row[sort_key], row[id_key])
+    return None
+
+
+def keyset_paginate(
+    rows: list[dict[str, Any]],
+    limit: int,
+    *,
+    sort_key: str = "created_at",
+    id_key: str = "id",
+) -> PaginatedResponse[Any]:
+    """Wrap one keyset page fetched from the database.
+
+    *rows* is the page as returned for *limit*; a full page is assumed to
+    have more after it (the final page may therefore come back empty).
+    ``total_count`` is the size of this page: counting the whole table is
+    exactly the cost keyset pagination avoids.
+    """
+    next_cursor = next_keyset_cursor(rows, limit, sort_key=sort_key, id_key=id_key)
+    return PaginatedResponse(
+        items=rows,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None,
+        total_count=len(rows),
+        limit=limit,
+    )
@@ -22,6 +22,7 @@ from shieldops.api.auth.api_keys import (
 )
 from shieldops.api.auth.dependencies import get_current_user
 from shieldops.api.auth.models import UserResponse
+from shieldops.api.auth.token_cache import get_token_cache
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/api-keys", tags=["API Keys"])
@@ -190,6 +191,7 @@ async def revoke_api_key_endpoint(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="API key not found",
         )
+    await get_token_cache().invalidate_everywhere(key_id=key_id)
 
     logger.info(
         "api_key_revoked_by_user",
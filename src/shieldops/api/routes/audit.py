@@ -6,6 +6,7 @@ import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from shieldops.api.auth.dependencies import require_role
+from shieldops.api.pagination import next_keyset_cursor, parse_keyset_cursor
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/audit-logs", tags=["Audit"])
@@ -27,9 +28,14 @@ async def list_audit_logs(
     action: str | None = Query(None),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     _user: Any = Depends(require_role("admin")),  # type: ignore[arg-type]
 ) -> dict[str, Any]:
-    """List audit log entries (admin only). Paginated, filterable."""
+    """List audit log entries (admin only). Paginated, filterable.
+
+    Prefer *cursor* over *offset* for deep pages: it seeks on
+    ``(timestamp, id)`` instead of scanning past skipped rows.
+    """
     repo = _repository or getattr(request.app.state, "repository", None)
     if repo is None:
         raise HTTPException(
@@ -37,7 +43,12 @@ async def list_audit_logs(
             detail="DB unavailable",
         )
 
-    entries = await repo.list_audit_logs(environment=environment, limit=limit, offset=offset)
+    after = parse_keyset_cursor(cursor) if cursor else None
+    entries = await repo.list_audit_logs(
+        environment=environment, limit=limit, offset=offset, after=after
+    )
+    # Computed before the client-side filters below, which shrink the page.
+    next_cursor = next_keyset_cursor(entries, limit, sort_key="timestamp")
 
     # Client-side filtering for agent_type and action
     # (repository only supports environment filter)
@@ -51,4 +62,5 @@ async def list_audit_logs(
         "total": len(entries),
         "limit": limit,
         "offset": offset,
+        "next_cursor": next_cursor,
     }
@@ -2,11 +2,13 @@
 
 Provides CSV and JSON exports for investigations, remediations, and
 security compliance data.  All endpoints require at least ``viewer``
-role and stream CSV output for efficient handling of large result sets.
+role.  Rows are streamed from a server-side database cursor straight
+into the response, so memory use does not grow with the export size.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from enum import StrEnum
 from typing import Any
@@ -17,7 +19,7 @@ from fastapi.responses import StreamingResponse
 
 from shieldops.api.auth.dependencies import require_role
 from shieldops.api.auth.models import UserRole
-from shieldops.utils.export_helpers import dicts_to_csv
+from shieldops.utils.export_helpers import iter_csv, iter_json_array
 
 logger = structlog.get_logger()
 router = APIRouter(prefix="/export", tags=["Export"])
@@ -97,13 +99,17 @@ def _clamp_limit(limit: int) -> int:
     return max(1, min(limit, 10_000))
 
 
-def _csv_streaming_response(
-    csv_body: str,
+def _export_response(
+    rows: AsyncIterator[dict[str, Any]],
+    format: ExportFormat,
+    fieldnames: list[str],
     filename: str,
 ) -> StreamingResponse:
-    """Wrap a CSV string in a StreamingResponse with proper headers."""
+    """Stream *rows* as a JSON array or as a CSV attachment."""
+    if format == ExportFormat.JSON:
+        return StreamingResponse(iter_json_array(rows), media_type="application/json")
     return StreamingResponse(
-        iter([csv_body]),
+        iter_csv(rows, fieldnames=fieldnames),
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
@@ -131,19 +137,14 @@ async def export_investigations(
     parsed_start = _parse_date(start_date)
     parsed_end = _parse_date(end_date)
 
-    rows = await repo.export_investigations(
+    rows = repo.export_investigations(
         start_date=parsed_start,
         end_date=parsed_end,
         status=status,
         severity=severity,
         limit=limit,
     )
-
-    if format == ExportFormat.JSON:
-        return rows
-
-    csv_body = dicts_to_csv(rows, fieldnames=_INVESTIGATION_CSV_FIELDS)
-    return _csv_streaming_response(csv_body, "investigations_export.csv")
+    return _export_response(rows, format, _INVESTIGATION_CSV_FIELDS, "investigations_export.csv")
 
 
 # ── Remediations export ──────────────────────────────────────────────
@@ -166,19 +167,14 @@ async def export_remediations(
     parsed_start = _parse_date(start_date)
     parsed_end = _parse_date(end_date)
 
-    rows = await repo.export_remediations(
+    rows = repo.export_remediations(
         start_date=parsed_start,
         end_date=parsed_end,
         status=status,
         severity=severity,
         limit=limit,
     )
-
-    if format == ExportFormat.JSON:
-        return rows
-
-    csv_body = dicts_to_csv(rows, fieldnames=_REMEDIATION_CSV_FIELDS)
-    return _csv_streaming_response(csv_body, "remediations_export.csv")
+    return _export_response(rows, format, _REMEDIATION_CSV_FIELDS, "remediations_export.csv")
 
 
 # ── Compliance report export ─────────────────────────────────────────
@@ -199,17 +195,12 @@ async def export_compliance(
     parsed_start = _parse_date(start_date)
     parsed_end = _parse_date(end_date)
 
-    rows = await repo.export_compliance_data(
+    rows = repo.export_compliance_data(
         start_date=parsed_start,
         end_date=parsed_end,
         limit=limit,
     )
-
-    if format == ExportFormat.JSON:
-        return rows
-
-    csv_body = dicts_to_csv(rows, fieldnames=_COMPLIANCE_CSV_FIELDS)
-    return _csv_streaming_response(csv_body, "compliance_export.csv")
+    return _export_response(rows, format, _COMPLIANCE_CSV_FIELDS, "compliance_export.csv")
 
 
 # ── Helpers ──────────────────────────────────────────────────────────
@@ -23,6 +23,7 @@ from pydantic import BaseModel, Field
 from shieldops.agents.investigation.runner import InvestigationRunner
 from shieldops.api.auth.dependencies import get_current_user, require_role
 from shieldops.api.auth.models import UserResponse, UserRole
+from shieldops.api.pagination import next_keyset_cursor, parse_keyset_cursor
 from shieldops.models.base import AlertContext
 
 if TYPE_CHECKING:
@@ -154,20 +155,27 @@ async def list_investigations(
     status: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     _user: UserResponse = Depends(get_current_user),
 ) -> dict[str, Any]:
     """List active and recent investigations.
 
     Queries from PostgreSQL when available, falls back to in-memory.
+    Pass the previous response's ``next_cursor`` as *cursor* to page
+    through the database by key instead of by *offset*.
     """
     if _repository:
-        items = await _repository.list_investigations(status=status, limit=limit, offset=offset)
+        after = parse_keyset_cursor(cursor) if cursor else None
+        items = await _repository.list_investigations(
+            status=status, limit=limit, offset=offset, after=after
+        )
         total = await _repository.count_investigations(status=status)
         return {
             "investigations": items,
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_keyset_cursor(items, limit, id_key="investigation_id"),
         }
 
     # Fallback to in-memory
@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field
 from shieldops.agents.remediation.runner import RemediationRunner
 from shieldops.api.auth.dependencies import get_current_user, require_role
 from shieldops.api.auth.models import UserResponse, UserRole
+from shieldops.api.pagination import next_keyset_cursor, parse_keyset_cursor
 from shieldops.models.base import Environment, RemediationAction, RiskLevel
 
 if TYPE_CHECKING:
@@ -144,15 +145,19 @@ async def list_remediations(
     status: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
     _user: UserResponse = Depends(get_current_user),
 ) -> dict[str, Any]:
     """List remediation timeline (newest first).
 
     Queries from PostgreSQL when available, falls back to in-memory.
+    Pass the previous response's ``next_cursor`` as *cursor* to page
+    through the database by key instead of by *offset*.
     """
     if _repository:
+        after = parse_keyset_cursor(cursor) if cursor else None
         items = await _repository.list_remediations(
-            environment=environment, status=status, limit=limit, offset=offset
+            environment=environment, status=status, limit=limit, offset=offset, after=after
         )
         total = await _repository.count_remediations(environment=environment, status=status)
         return {
@@ -160,6 +165,7 @@ async def list_remediations(
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_keyset_cursor(items, limit, id_key="remediation_id"),
         }
 
     # Fallback to in-memory
@@ -367,6 +367,7 @@ async def _fallback_response(
             system_prompt=system_prompt,
             user_prompt=message,
             schema=_ChatReply,
+            agent_type="security_chat",
         )
         return result.response  # type: ignore[union-attr]
 
@@ -0,0 +1,38 @@
+"""Startup profile routes — import time and memory cost per engine."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request
+
+from shieldops.api.auth.dependencies import require_role
+from shieldops.api.auth.models import UserRole
+from shieldops.api.engine_registry import LazyEngineRegistry
+
+router = APIRouter()
+
+
+@router.get("/startup-profile")
+async def get_startup_profile(
+    request: Request,
+    state: str | None = Query(None, description="Filter engines by state"),
+    limit: int = Query(50, ge=1, le=5000),
+    _user: Any = Depends(require_role(UserRole.ADMIN)),
+) -> dict[str, Any]:
+    """Report startup duration, process RSS and per-engine build costs.
+
+    Engines are sorted by combined import + init time, slowest first.
+    """
+    registry: LazyEngineRegistry = request.app.state.engine_registry
+    profile = registry.profile()
+    engines = profile.pop("engines")
+    if state:
+        engines = [e for e in engines if e["state"] == state]
+    engines.sort(key=lambda e: e["import_ms"] + e["init_ms"], reverse=True)
+    return {
+        "startup_ms": getattr(request.app.state, "startup_ms", None),
+        "startup_rss_bytes": getattr(request.app.state, "startup_rss_bytes", None),
+        **profile,
+        "engines": engines[:limit],
+    }
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from shieldops.api.auth.dependencies import require_role
 from shieldops.api.auth.models import UserRole
+from shieldops.api.auth.token_cache import get_token_cache
 
 router = APIRouter()
 
@@ -75,6 +76,8 @@ async def update_user_role(
     updated: dict[str, Any] | None = await repository.update_user_role(user_id, role)
     if updated is None:
         raise HTTPException(status_code=404, detail="User not found")
+    # Cached API-key logins carry the old role.
+    await get_token_cache().invalidate_everywhere(subject=user_id)
     return updated
 
 
@@ -96,4 +99,6 @@ async def toggle_user_active(
     updated: dict[str, Any] | None = await repository.update_user_active(user_id, is_active)
     if updated is None:
         raise HTTPException(status_code=404, detail="User not found")
+    if not is_active:
+        await get_token_cache().invalidate_everywhere(subject=user_id)
     return updated
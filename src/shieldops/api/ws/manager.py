@@ -1,42 +1,110 @@
-"""WebSocket connection manager — per-channel subscriber tracking."""
+"""WebSocket connection manager — per-channel subscriber tracking.
 
+A broadcast serialises the event once and drops the text into each
+subscriber's bounded outbound queue; a writer task per connection drains
+its queue onto the socket.  Broadcasting therefore never waits on a
+client, and a slow client only ever delays itself.  When its queue is
+full the slow-consumer policy either drops its oldest queued event or
+closes it; a send that stalls past ``send_timeout`` closes it too.
+
+With a ``RedisBroadcastBackplane`` attached, broadcasts are also
+published on Redis so subscribers connected to other API workers
+receive them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import uuid
 from collections import defaultdict
+from collections.abc import Callable
 from typing import Any
 
 import structlog
 from starlette.websockets import WebSocket
 
+from shieldops.config import settings
+
 logger = structlog.get_logger()
 
+SLOW_CONSUMER_POLICIES = frozenset({"drop_oldest", "close"})
+
+# RFC 6455 "Try Again Later": the client fell too far behind.
+_SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def _serialize(event: dict[str, Any]) -> str:
+    # Same encoding as ``WebSocket.send_json``; non-JSON values (datetimes,
+    # enums) are stringified rather than failing the whole broadcast.
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class _Connection:
+    """One subscribed socket with its outbound queue and writer task."""
+
+    __slots__ = ("channel", "dropped", "queue", "websocket", "writer")
+
+    def __init__(self, websocket: WebSocket, channel: str, queue_size: int) -> None:
+        self.websocket = websocket
+        self.channel = channel
+        self.queue: asyncio.Queue[str] = asyncio.Queue(queue_size)
+        self.dropped = 0
+        self.writer: asyncio.Task[None] | None = None
+
 
 class ConnectionManager:
-    """Manages WebSocket connections with per-channel subscription."""
+    """Manages WebSocket connections with per-channel subscription.
+
+    Args:
+        queue_size: Events buffered per connection before the
+            slow-consumer policy applies.
+        slow_consumer_policy: ``"drop_oldest"`` discards the connection's
+            oldest queued event to make room; ``"close"`` disconnects it.
+        send_timeout: Seconds a single send may take before the
+            connection is closed as stalled.
+    """
 
-    def __init__(self) -> None:
-        # channel -> set of connected websockets
-        self._channels: dict[str, set[WebSocket]] = defaultdict(set)
+    def __init__(
+        self,
+        *,
+        queue_size: int = 256,
+        slow_consumer_policy: str = "drop_oldest",
+        send_timeout: float = 10.0,
+    ) -> None:
+        if slow_consumer_policy not in SLOW_CONSUMER_POLICIES:
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy!r}")
+        # channel -> {websocket: connection}
+        self._channels: dict[str, dict[WebSocket, _Connection]] = defaultdict(dict)
+        self._queue_size = queue_size
+        self._policy = slow_consumer_policy
+        self._send_timeout = send_timeout
+        self._backplane: RedisBroadcastBackplane | None = None
 
     async def connect(self, websocket: WebSocket, channel: str = "global") -> None:
         await websocket.accept()
-        self._channels[channel].add(websocket)
+        conn = _Connection(websocket, channel, self._queue_size)
+        conn.writer = asyncio.get_running_loop().create_task(self._write(conn))
+        self._channels[channel][websocket] = conn
         logger.info("ws_connected", channel=channel)
 
     def disconnect(self, websocket: WebSocket, channel: str = "global") -> None:
-        self._channels[channel].discard(websocket)
+        conn = self._channels[channel].pop(websocket, None)
+        if conn is not None and conn.writer is not None:
+            conn.writer.cancel()
         if not self._channels[channel]:
             del self._channels[channel]
         logger.info("ws_disconnected", channel=channel)
 
     async def broadcast(self, channel: str, event: dict[str, Any]) -> None:
-        """Send an event to all subscribers of a channel."""
-        dead: list[WebSocket] = []
-        for ws in self._channels.get(channel, set()):
-            try:
-                await ws.send_json(event)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self._channels[channel].discard(ws)
+        """Send an event to all subscribers of a channel, on every worker."""
+        if self._backplane is None and not self._channels.get(channel):
+            return
+        text = _serialize(event)
+        self._deliver(channel, text)
+        if self._backplane is not None:
+            await self._backplane.publish(channel, text)
 
     async def send_personal(self, websocket: WebSocket, event: dict[str, Any]) -> None:
         await websocket.send_json(event)
@@ -45,6 +113,181 @@ class ConnectionManager:
     def active_connections(self) -> int:
         return sum(len(subs) for subs in self._channels.values())
 
+    # ── Cross-process fan-out ────────────────────────────────────
+
+    async def start_backplane(self, backplane: RedisBroadcastBackplane) -> None:
+        """Share channels with other workers through *backplane*."""
+        self._backplane = backplane
+        await backplane.start(self._deliver)
+
+    async def stop_backplane(self) -> None:
+        if self._backplane is not None:
+            await self._backplane.stop()
+            self._backplane = None
+
+    # ── Delivery ─────────────────────────────────────────────────
+
+    def _deliver(self, channel: str, text: str) -> None:
+        """Queue pre-serialised *text* for every local subscriber of *channel*."""
+        subscribers = self._channels.get(channel)
+        if not subscribers:
+            return
+        for conn in list(subscribers.values()):
+            try:
+                conn.queue.put_nowait(text)
+                continue
+            except asyncio.QueueFull:
+                pass
+            if self._policy == "close":
+                self._evict(conn, "queue_full")
+                continue
+            conn.queue.get_nowait()
+            conn.queue.put_nowait(text)
+            conn.dropped += 1
+            if conn.dropped == 1 or conn.dropped % 100 == 0:
+                logger.warning("ws_slow_consumer_dropping", channel=channel, dropped=conn.dropped)
+
+    async def _write(self, conn: _Connection) -> None:
+        try:
+            while True:
+                text = await conn.queue.get()
+                async with asyncio.timeout(self._send_timeout):
+                    await conn.websocket.send_text(text)
+        except asyncio.CancelledError:
+            raise
+        except TimeoutError:
+            self._evict(conn, "send_timeout", cancel_writer=False)
+        except Exception as exc:
+            # The client went away; the route's receive loop will notice too.
+            logger.info("ws_send_failed", channel=conn.channel, error=str(exc))
+            self._forget(conn)
+
+    def _forget(self, conn: _Connection) -> None:
+        subscribers = self._channels.get(conn.channel)
+        if subscribers is not None and subscribers.get(conn.websocket) is conn:
+            del subscribers[conn.websocket]
+            if not subscribers:
+                del self._channels[conn.channel]
+
+    def _evict(self, conn: _Connection, reason: str, cancel_writer: bool = True) -> None:
+        """Drop a slow consumer and close its socket in the background."""
+        self._forget(conn)
+        if cancel_writer and conn.writer is not None:
+            conn.writer.cancel()
+        logger.warning("ws_slow_consumer_closed", channel=conn.channel, reason=reason)
+
+        async def _close() -> None:
+            with contextlib.suppress(Exception):
+                await conn.websocket.close(code=_SLOW_CONSUMER_CLOSE_CODE, reason=reason)
+
+        asyncio.get_running_loop().create_task(_close())
+
+
+class RedisBroadcastBackplane:
+    """Relay WebSocket broadcasts between API workers over Redis pub/sub.
+
+    Every worker publishes each broadcast to ``<prefix><channel>`` and
+    pattern-subscribes to ``<prefix>*``, delivering what other workers
+    published to its own local subscribers.  Like the cache invalidation
+    bus, delivery is fire-and-forget: events published while a worker is
+    disconnected from Redis are not replayed.
+
+    Parameters
+    ----------
+    redis_url:
+        Redis connection string. Ignored when *client* is given.
+    prefix:
+        Pub/sub channel prefix.
+    node_id:
+        Identifier of this process; its own messages are skipped on
+        receipt since they were already delivered locally.
+    client:
+        Pre-built ``redis.asyncio`` client (mainly for tests).
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "",
+        prefix: str = "shieldops:ws:",
+        node_id: str | None = None,
+        client: Any = None,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._redis_url = redis_url
+        self._prefix = prefix
+        self._node_id = node_id or uuid.uuid4().hex[:12]
+        self._client = client
+        self._reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import redis.asyncio as aioredis
+
+            self._client = aioredis.from_url(self._redis_url, decode_responses=False)
+        return self._client
+
+    async def publish(self, channel: str, text: str) -> bool:
+        """Publish *text* for *channel*. Errors are logged, never raised."""
+        try:
+            await self._get_client().publish(
+                self._prefix + channel, f"{self._node_id}\n{text}".encode()
+            )
+        except Exception as exc:
+            logger.warning("ws_backplane_publish_failed", channel=channel, error=str(exc))
+            return False
+        return True
+
+    async def start(self, deliver: Callable[[str, str], None]) -> None:
+        """Start the background listener task."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._listen(deliver))
+        logger.info("ws_backplane_started", prefix=self._prefix)
+
+    async def stop(self) -> None:
+        """Stop the listener and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as exc:
+                logger.debug("ws_backplane_close_failed", error=str(exc))
+            self._client = None
+
+    async def _listen(self, deliver: Callable[[str, str], None]) -> None:
+        origin_prefix = f"{self._node_id}\n".encode()
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub()
+                await pubsub.psubscribe(self._prefix + "*")
+                while True:
+                    raw = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if raw is None or raw.get("type") != "pmessage":
+                        continue
+                    data: bytes = raw["data"]
+                    if data.startswith(origin_prefix):
+                        continue
+                    channel = raw["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    _, _, text = data.partition(b"\n")
+                    deliver(channel[len(self._prefix) :], text.decode())
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("ws_backplane_listener_error", error=str(exc))
+                await asyncio.sleep(self._reconnect_delay)
+            finally:
+                if pubsub is not None:
+                    with contextlib.suppress(Exception):
+                        await pubsub.aclose()
+
 
 # Module-level singleton for cross-module access
 _default_manager: ConnectionManager | None = None
@@ -54,5 +297,9 @@ def get_ws_manager() -> ConnectionManager:
     """Get or create the default WebSocket connection manager."""
     global _default_manager
     if _default_manager is None:
-        _default_manager = ConnectionManager()
+        _default_manager = ConnectionManager(
+            queue_size=settings.ws_send_queue_size,
+            slow_consumer_policy=settings.ws_slow_consumer_policy,
+            send_timeout=settings.ws_send_timeout_seconds,
+        )
     return _default_manager
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AccessGovernanceReviewer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ReviewRecord] = []
+        self._records: RecordStore[ReviewRecord] = RecordStore(self._max_records)
         self._analyses: list[ReviewAnalysis] = []
         logger.info(
             "access_governance_reviewer.initialized",
@@ -124,8 +126,6 @@ class AccessGovernanceReviewer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "access_governance_reviewer.review_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AccessGovernanceReviewer:
         return record
 
     def get_record(self, record_id: str) -> ReviewRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
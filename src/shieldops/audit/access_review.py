@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AccessReviewTracker:
     ) -> None:
         self._max_records = max_records
         self._min_review_completion_pct = min_review_completion_pct
-        self._records: list[AccessReviewRecord] = []
+        self._records: RecordStore[AccessReviewRecord] = RecordStore(self._max_records)
         self._findings: list[ReviewFinding] = []
         logger.info(
             "access_review.initialized",
@@ -124,8 +126,6 @@ class AccessReviewTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "access_review.review_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AccessReviewTracker:
         return record
 
     def get_review(self, record_id: str) -> AccessReviewRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reviews(
         self,
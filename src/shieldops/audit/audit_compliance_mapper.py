@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditComplianceMapper:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_score = min_coverage_score
-        self._records: list[ComplianceMappingRecord] = []
+        self._records: RecordStore[ComplianceMappingRecord] = RecordStore(self._max_records)
         self._assessments: list[MappingAssessment] = []
         logger.info(
             "audit_compliance_mapper.initialized",
@@ -124,8 +126,6 @@ class AuditComplianceMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_compliance_mapper.mapping_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditComplianceMapper:
         return record
 
     def get_mapping(self, record_id: str) -> ComplianceMappingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
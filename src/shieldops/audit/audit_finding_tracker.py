@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditFindingTracker:
     ) -> None:
         self._max_records = max_records
         self._max_open_finding_pct = max_open_finding_pct
-        self._records: list[FindingRecord] = []
+        self._records: RecordStore[FindingRecord] = RecordStore(self._max_records)
         self._remediations: list[FindingRemediation] = []
         logger.info(
             "audit_finding.initialized",
@@ -124,8 +126,6 @@ class AuditFindingTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_finding.finding_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditFindingTracker:
         return record
 
     def get_finding(self, record_id: str) -> FindingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_findings(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AuditIntelligenceAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._anomaly_threshold_pct = anomaly_threshold_pct
-        self._records: list[AuditFinding] = []
+        self._records: RecordStore[AuditFinding] = RecordStore(self._max_records)
         self._anomalies: list[AuditAnomaly] = []
         logger.info(
             "audit_intelligence.initialized",
@@ -135,8 +137,6 @@ class AuditIntelligenceAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_intelligence.finding_recorded",
             record_id=record.id,
@@ -146,10 +146,7 @@ class AuditIntelligenceAnalyzer:
         return record
 
     def get_finding(self, record_id: str) -> AuditFinding | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_findings(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditReadinessScorer:
     ) -> None:
         self._max_records = max_records
         self._readiness_threshold = readiness_threshold
-        self._records: list[ReadinessRecord] = []
+        self._records: RecordStore[ReadinessRecord] = RecordStore(self._max_records)
         self._analyses: list[ReadinessAnalysis] = []
         logger.info(
             "audit_readiness_scorer.initialized",
@@ -124,8 +126,6 @@ class AuditReadinessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_readiness_scorer.readiness_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditReadinessScorer:
         return record
 
     def get_readiness(self, record_id: str) -> ReadinessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_readiness(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditRemediationTracker:
     ) -> None:
         self._max_records = max_records
         self._max_remediation_days = max_remediation_days
-        self._records: list[RemediationRecord] = []
+        self._records: RecordStore[RemediationRecord] = RecordStore(self._max_records)
         self._assessments: list[RemediationAssessment] = []
         logger.info(
             "audit_remediation_tracker.initialized",
@@ -124,8 +126,6 @@ class AuditRemediationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_remediation_tracker.remediation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditRemediationTracker:
         return record
 
     def get_remediation(self, record_id: str) -> RemediationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_remediations(
         self,
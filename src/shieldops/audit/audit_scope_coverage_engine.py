@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AuditScopeCoverageEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AuditScopeRecord] = []
+        self._records: RecordStore[AuditScopeRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AuditScopeAnalysis] = {}
         logger.info(
             "audit_scope_coverage_engine.init",
@@ -120,8 +122,6 @@ class AuditScopeCoverageEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_scope_coverage.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class AuditScopeCoverageEngine:
         return record
 
     def process(self, key: str) -> AuditScopeAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         untested = rec.total_controls - rec.tested_controls
@@ -199,7 +195,7 @@ class AuditScopeCoverageEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("audit_scope_coverage_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditScopeOptimizer:
     ) -> None:
         self._max_records = max_records
         self._scope_efficiency_threshold = scope_efficiency_threshold
-        self._records: list[ScopeRecord] = []
+        self._records: RecordStore[ScopeRecord] = RecordStore(self._max_records)
         self._analyses: list[ScopeAnalysis] = []
         logger.info(
             "audit_scope_optimizer.initialized",
@@ -124,8 +126,6 @@ class AuditScopeOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_scope_optimizer.scope_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditScopeOptimizer:
         return record
 
     def get_scope(self, record_id: str) -> ScopeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scopes(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AuditTimelineOptimizer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AuditTimelineRecord] = []
+        self._records: RecordStore[AuditTimelineRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AuditTimelineAnalysis] = {}
         logger.info(
             "audit_timeline_optimizer.init",
@@ -120,8 +122,6 @@ class AuditTimelineOptimizer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_timeline_optimizer.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class AuditTimelineOptimizer:
         return record
 
     def process(self, key: str) -> AuditTimelineAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_bottleneck = rec.duration_days > rec.planned_days and rec.slack_days <= 0
@@ -199,7 +195,7 @@ class AuditTimelineOptimizer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("audit_timeline_optimizer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AutomatedPrivacyAuditor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AuditRecord] = []
+        self._records: RecordStore[AuditRecord] = RecordStore(self._max_records)
         self._analyses: list[AuditAnalysis] = []
         logger.info(
             "automated_privacy_auditor.initialized",
@@ -124,8 +126,6 @@ class AutomatedPrivacyAuditor:
             business_unit=business_unit,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_privacy_auditor.audit_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AutomatedPrivacyAuditor:
         return record
 
     def get_audit(self, record_id: str) -> AuditRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_audits(
         self,
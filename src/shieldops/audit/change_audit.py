@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ChangeAuditAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_audit_compliance_pct = min_audit_compliance_pct
-        self._records: list[ChangeAuditRecord] = []
+        self._records: RecordStore[ChangeAuditRecord] = RecordStore(self._max_records)
         self._observations: list[AuditObservation] = []
         logger.info(
             "change_audit.initialized",
@@ -120,8 +122,6 @@ class ChangeAuditAnalyzer:
             auditor=auditor,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_audit.audit_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ChangeAuditAnalyzer:
         return record
 
     def get_audit(self, record_id: str) -> ChangeAuditRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_audits(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AuditComplianceReporter:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_score = min_compliance_score
-        self._records: list[ComplianceRecord] = []
+        self._records: RecordStore[ComplianceRecord] = RecordStore(self._max_records)
         self._rules: list[ComplianceRule] = []
         logger.info(
             "compliance_reporter.initialized",
@@ -123,8 +125,6 @@ class AuditComplianceReporter:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_reporter.compliance_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class AuditComplianceReporter:
         return record
 
     def get_compliance(self, record_id: str) -> ComplianceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_compliance_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DecisionAuditLogger:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[DecisionRecord] = []
+        self._records: RecordStore[DecisionRecord] = RecordStore(self._max_records)
         self._rationales: list[DecisionRationale] = []
         logger.info(
             "decision_audit.initialized",
@@ -116,8 +118,6 @@ class DecisionAuditLogger:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "decision_audit.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DecisionAuditLogger:
         return record
 
     def get_decision(self, record_id: str) -> DecisionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_decisions(
         self,
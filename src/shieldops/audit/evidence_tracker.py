@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class AuditEvidenceTracker:
     ) -> None:
         self._max_records = max_records
         self._min_completeness_pct = min_completeness_pct
-        self._records: list[EvidenceRecord] = []
+        self._records: RecordStore[EvidenceRecord] = RecordStore(self._max_records)
         self._rules: list[EvidenceRule] = []
         logger.info(
             "evidence_tracker.initialized",
@@ -120,8 +122,6 @@ class AuditEvidenceTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evidence_tracker.evidence_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class AuditEvidenceTracker:
         return record
 
     def get_evidence(self, record_id: str) -> EvidenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_evidence(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class IntelligentAuditPlanner:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AuditPlanRecord] = []
+        self._records: RecordStore[AuditPlanRecord] = RecordStore(self._max_records)
         self._analyses: list[AuditPlanAnalysis] = []
         logger.info(
             "intelligent_audit_planner.initialized",
@@ -121,8 +123,6 @@ class IntelligentAuditPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "intelligent_audit_planner.record_added",
             record_id=record.id,
@@ -131,10 +131,7 @@ class IntelligentAuditPlanner:
         return record
 
     def get_record(self, record_id: str) -> AuditPlanRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
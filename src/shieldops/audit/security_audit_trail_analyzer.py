@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityAuditTrailAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._analysis_gap_threshold = analysis_gap_threshold
-        self._records: list[AuditTrailRecord] = []
+        self._records: RecordStore[AuditTrailRecord] = RecordStore(self._max_records)
         self._analyses: list[AuditTrailAnalysis] = []
         logger.info(
             "security_audit_trail_analyzer.initialized",
@@ -124,8 +126,6 @@ class SecurityAuditTrailAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_audit_trail_analyzer.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityAuditTrailAnalyzer:
         return record
 
     def get_trail(self, record_id: str) -> AuditTrailRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trails(
         self,
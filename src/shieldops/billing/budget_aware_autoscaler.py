@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BudgetAwareAutoscaler:
     ) -> None:
         self._max_records = max_records
         self._budget_alert_threshold = budget_alert_threshold
-        self._records: list[AutoscalingRecord] = []
+        self._records: RecordStore[AutoscalingRecord] = RecordStore(self._max_records)
         self._analyses: list[AutoscalingAnalysis] = []
         logger.info(
             "budget_aware_autoscaler.initialized",
@@ -126,8 +128,6 @@ class BudgetAwareAutoscaler:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "budget_aware_autoscaler.event_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class BudgetAwareAutoscaler:
         return record
 
     def get_scaling_event(self, record_id: str) -> AutoscalingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scaling_events(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class BudgetVarianceTracker:
     ) -> None:
         self._max_records = max_records
         self._max_variance_pct = max_variance_pct
-        self._records: list[VarianceRecord] = []
+        self._records: RecordStore[VarianceRecord] = RecordStore(self._max_records)
         self._details: list[VarianceDetail] = []
         logger.info(
             "budget_variance.initialized",
@@ -150,8 +152,6 @@ class BudgetVarianceTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "budget_variance.variance_recorded",
             record_id=record.id,
@@ -162,10 +162,7 @@ class BudgetVarianceTracker:
         return record
 
     def get_variance(self, record_id: str) -> VarianceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_variances(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CapacityUtilizationOptimizer:
     ) -> None:
         self._max_records = max_records
         self._optimal_utilization_pct = optimal_utilization_pct
-        self._records: list[UtilizationRecord] = []
+        self._records: RecordStore[UtilizationRecord] = RecordStore(self._max_records)
         self._suggestions: list[OptimizationSuggestion] = []
         logger.info(
             "capacity_utilizer.initialized",
@@ -126,8 +128,6 @@ class CapacityUtilizationOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity_utilizer.recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class CapacityUtilizationOptimizer:
         return record
 
     def get_utilization(self, record_id: str) -> UtilizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_utilizations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CloudCostArbitrageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_savings_pct = min_savings_pct
-        self._records: list[ArbitrageRecord] = []
+        self._records: RecordStore[ArbitrageRecord] = RecordStore(self._max_records)
         self._opportunities: list[MigrationOpportunity] = []
         logger.info(
             "cloud_arbitrage.initialized",
@@ -113,8 +115,6 @@ class CloudCostArbitrageAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cloud_arbitrage.recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class CloudCostArbitrageAnalyzer:
         return record
 
     def get_arbitrage(self, record_id: str) -> ArbitrageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_arbitrages(
         self,
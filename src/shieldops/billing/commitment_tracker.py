@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class CommitmentUtilizationTracker:
     ) -> None:
         self._max_records = max_records
         self._min_utilization_pct = min_utilization_pct
-        self._records: list[CommitmentRecord] = []
+        self._records: RecordStore[CommitmentRecord] = RecordStore(self._max_records)
         self._details: list[UtilizationDetail] = []
         logger.info(
             "commitment_tracker.initialized",
@@ -120,8 +122,6 @@ class CommitmentUtilizationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "commitment_tracker.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class CommitmentUtilizationTracker:
         return record
 
     def get_commitment(self, record_id: str) -> CommitmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_commitments(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CommitmentUtilizationTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CommitmentRecord] = []
+        self._records: RecordStore[CommitmentRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CommitmentAnalysis] = {}
         logger.info(
             "commitment_utilization.init",
@@ -114,8 +116,6 @@ class CommitmentUtilizationTracker:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "commitment_utilization.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class CommitmentUtilizationTracker:
         return record
 
     def process(self, key: str) -> CommitmentAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         waste = round(
@@ -197,7 +193,7 @@ class CommitmentUtilizationTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("commitment_utilization.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ContainerizationROICalculator:
     ) -> None:
         self._max_records = max_records
         self._roi_threshold = roi_threshold
-        self._records: list[ContainerizationRecord] = []
+        self._records: RecordStore[ContainerizationRecord] = RecordStore(self._max_records)
         self._analyses: list[ROIAnalysis] = []
         logger.info(
             "containerization_roi_calculator.initialized",
@@ -126,8 +128,6 @@ class ContainerizationROICalculator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "containerization_roi_calculator.roi_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class ContainerizationROICalculator:
         return record
 
     def get_roi(self, record_id: str) -> ContainerizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rois(
         self,
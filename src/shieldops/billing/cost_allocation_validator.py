@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostAllocationValidator:
     ) -> None:
         self._max_records = max_records
         self._min_accuracy_pct = min_accuracy_pct
-        self._records: list[AllocationRecord] = []
+        self._records: RecordStore[AllocationRecord] = RecordStore(self._max_records)
         self._checks: list[AllocationCheck] = []
         logger.info(
             "cost_allocation_validator.initialized",
@@ -124,8 +126,6 @@ class CostAllocationValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_allocation_validator.allocation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostAllocationValidator:
         return record
 
     def get_allocation(self, record_id: str) -> AllocationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_allocations(
         self,
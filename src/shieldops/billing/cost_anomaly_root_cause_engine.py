@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CostAnomalyRootCauseEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CostAnomalyRecord] = []
+        self._records: RecordStore[CostAnomalyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CostAnomalyAnalysis] = {}
         logger.info(
             "cost_anomaly_root_cause.init",
@@ -117,8 +119,6 @@ class CostAnomalyRootCauseEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_anomaly.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class CostAnomalyRootCauseEngine:
         return record
 
     def process(self, key: str) -> CostAnomalyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         dev = 0.0
@@ -194,7 +190,7 @@ class CostAnomalyRootCauseEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cost_anomaly_root_cause.cleared")
         return {"status": "cleared"}
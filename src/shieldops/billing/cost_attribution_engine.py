@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostAttributionEngine:
     ) -> None:
         self._max_records = max_records
         self._max_disputed_pct = max_disputed_pct
-        self._records: list[AttributionRecord] = []
+        self._records: RecordStore[AttributionRecord] = RecordStore(self._max_records)
         self._details: list[AttributionDetail] = []
         logger.info(
             "cost_attribution_engine.initialized",
@@ -124,8 +126,6 @@ class CostAttributionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_attribution_engine.attribution_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostAttributionEngine:
         return record
 
     def get_attribution(self, record_id: str) -> AttributionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_attributions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostAttributionMLModel:
     ) -> None:
         self._max_records = max_records
         self._accuracy_threshold = accuracy_threshold
-        self._records: list[AttributionRecord] = []
+        self._records: RecordStore[AttributionRecord] = RecordStore(self._max_records)
         self._analyses: list[AttributionAnalysis] = []
         logger.info(
             "cost_attribution_ml_model.initialized",
@@ -126,8 +128,6 @@ class CostAttributionMLModel:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_attribution_ml_model.attribution_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class CostAttributionMLModel:
         return record
 
     def get_attribution(self, record_id: str) -> AttributionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_attributions(
         self,
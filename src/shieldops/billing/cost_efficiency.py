@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CostEfficiencyScorer:
     ) -> None:
         self._max_records = max_records
         self._min_efficiency_pct = min_efficiency_pct
-        self._records: list[EfficiencyRecord] = []
+        self._records: RecordStore[EfficiencyRecord] = RecordStore(self._max_records)
         self._metrics: list[EfficiencyMetric] = []
         logger.info(
             "cost_efficiency.initialized",
@@ -137,8 +139,6 @@ class CostEfficiencyScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_efficiency.efficiency_recorded",
             record_id=record.id,
@@ -149,10 +149,7 @@ class CostEfficiencyScorer:
         return record
 
     def get_efficiency(self, record_id: str) -> EfficiencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_efficiencies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostForecastAccuracyTracker:
     ) -> None:
         self._max_records = max_records
         self._min_accuracy_pct = min_accuracy_pct
-        self._records: list[ForecastRecord] = []
+        self._records: RecordStore[ForecastRecord] = RecordStore(self._max_records)
         self._evaluations: list[ForecastEvaluation] = []
         logger.info(
             "cost_forecast_accuracy.initialized",
@@ -124,8 +126,6 @@ class CostForecastAccuracyTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_forecast_accuracy.forecast_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostForecastAccuracyTracker:
         return record
 
     def get_forecast(self, record_id: str) -> ForecastRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_forecasts(
         self,
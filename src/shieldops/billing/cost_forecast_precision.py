@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostForecastPrecision:
     ) -> None:
         self._max_records = max_records
         self._precision_accuracy_threshold = precision_accuracy_threshold
-        self._records: list[PrecisionRecord] = []
+        self._records: RecordStore[PrecisionRecord] = RecordStore(self._max_records)
         self._analyses: list[PrecisionAnalysis] = []
         logger.info(
             "cost_forecast_precision.initialized",
@@ -124,8 +126,6 @@ class CostForecastPrecision:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_forecast_precision.precision_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostForecastPrecision:
         return record
 
     def get_precision(self, record_id: str) -> PrecisionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_precisions(
         self,
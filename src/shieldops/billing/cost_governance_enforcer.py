@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostGovernanceEnforcer:
     ) -> None:
         self._max_records = max_records
         self._max_violation_rate = max_violation_rate
-        self._records: list[GovernanceRecord] = []
+        self._records: RecordStore[GovernanceRecord] = RecordStore(self._max_records)
         self._violations: list[GovernanceViolation] = []
         logger.info(
             "cost_governance_enforcer.initialized",
@@ -124,8 +126,6 @@ class CostGovernanceEnforcer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_governance_enforcer.governance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostGovernanceEnforcer:
         return record
 
     def get_governance(self, record_id: str) -> GovernanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_governance_records(
         self,
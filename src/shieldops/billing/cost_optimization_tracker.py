@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostOptimizationTracker:
     ) -> None:
         self._max_records = max_records
         self._min_savings_pct = min_savings_pct
-        self._records: list[OptimizationRecord] = []
+        self._records: RecordStore[OptimizationRecord] = RecordStore(self._max_records)
         self._metrics: list[OptimizationMetric] = []
         logger.info(
             "cost_optimization_tracker.initialized",
@@ -124,8 +126,6 @@ class CostOptimizationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_optimization_tracker.optimization_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostOptimizationTracker:
         return record
 
     def get_optimization(self, record_id: str) -> OptimizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_optimizations(
         self,
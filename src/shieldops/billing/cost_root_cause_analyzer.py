@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class CostRootCauseAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[RootCauseRecord] = []
+        self._records: RecordStore[RootCauseRecord] = RecordStore(self._max_records)
         self._analyses: list[CauseAnalysis] = []
         logger.info(
             "cost_root_cause_analyzer.initialized",
@@ -123,8 +125,6 @@ class CostRootCauseAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_root_cause_analyzer.cause_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class CostRootCauseAnalyzer:
         return record
 
     def get_root_cause(self, record_id: str) -> RootCauseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_root_causes(
         self,
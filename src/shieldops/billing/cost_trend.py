@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class CostTrendForecaster:
     ) -> None:
         self._max_records = max_records
         self._max_growth_rate_pct = max_growth_rate_pct
-        self._records: list[CostTrendRecord] = []
+        self._records: RecordStore[CostTrendRecord] = RecordStore(self._max_records)
         self._forecasts: list[CostForecast] = []
         logger.info(
             "cost_trend.initialized",
@@ -122,8 +124,6 @@ class CostTrendForecaster:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_trend.trend_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class CostTrendForecaster:
         return record
 
     def get_trend(self, record_id: str) -> CostTrendRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trends(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CostVarianceAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_variance_pct = max_variance_pct
-        self._records: list[VarianceRecord] = []
+        self._records: RecordStore[VarianceRecord] = RecordStore(self._max_records)
         self._analyses: list[VarianceAnalysis] = []
         logger.info(
             "cost_variance_analyzer.initialized",
@@ -124,8 +126,6 @@ class CostVarianceAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_variance_analyzer.variance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CostVarianceAnalyzer:
         return record
 
     def get_variance(self, record_id: str) -> VarianceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_variances(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataTransferOptimizer:
     ) -> None:
         self._max_records = max_records
         self._cost_reduction_threshold = cost_reduction_threshold
-        self._records: list[DataTransferRecord] = []
+        self._records: RecordStore[DataTransferRecord] = RecordStore(self._max_records)
         self._analyses: list[TransferAnalysis] = []
         logger.info(
             "data_transfer_optimizer.initialized",
@@ -126,8 +128,6 @@ class DataTransferOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_transfer_optimizer.transfer_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class DataTransferOptimizer:
         return record
 
     def get_transfer(self, record_id: str) -> DataTransferRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_transfers(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class CloudDiscountOptimizer:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[DiscountRecord] = []
+        self._records: RecordStore[DiscountRecord] = RecordStore(self._max_records)
         self._strategies: list[DiscountStrategy] = []
         logger.info(
             "discount_optimizer.initialized",
@@ -137,8 +139,6 @@ class CloudDiscountOptimizer:
             expiry_days=expiry_days,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "discount_optimizer.discount_recorded",
             record_id=record.id,
@@ -149,10 +149,7 @@ class CloudDiscountOptimizer:
         return record
 
     def get_discount(self, record_id: str) -> DiscountRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_discounts(
         self,
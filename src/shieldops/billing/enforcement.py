@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
@@ -16,7 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from shieldops.api.middleware.usage_tracker import UsageTracker
-from shieldops.db.models import AgentRegistration, OrganizationRecord
+from shieldops.db.models import AgentRegistration, APIUsageHourlyRecord, OrganizationRecord
 from shieldops.integrations.billing.stripe_billing import PLANS
 
 logger = structlog.get_logger()
@@ -44,6 +46,11 @@ class PlanEnforcementService:
         self._sf = session_factory
         # {org_id: (plan_key, fetched_at_monotonic)}
         self._plan_cache: dict[str, tuple[str, float]] = {}
+        # {org_id: (persisted_calls, fetched_at_monotonic)}
+        self._usage_cache: dict[str, tuple[int, float]] = {}
+        # Bumped per org on invalidation so a lookup that started before
+        # a flush does not cache the pre-flush sum.
+        self._usage_generation: dict[str, int] = {}
         self._cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -102,7 +109,9 @@ class PlanEnforcementService:
 
         Uses the in-memory :class:`UsageTracker` to count calls
         within the current billing period (approximated as 30 days /
-        720 hours).
+        720 hours).  When the tracker persists hourly rollups, completed
+        hours are read from ``api_usage_hourly`` instead, so calls served
+        by every API worker count towards the quota.
 
         Returns:
             ``(allowed, used, limit)`` where *limit* is ``-1`` for
@@ -115,8 +124,7 @@ class PlanEnforcementService:
         limit: int = plan_def["api_calls_limit"]
 
         tracker = UsageTracker.get_instance()
-        usage = tracker.get_usage(org_id=org_id, hours=720)  # ~30 days
-        used: int = usage["total_calls"]
+        used = await self._count_api_calls(tracker, org_id, hours=720)  # ~30 days
 
         if limit == -1:
             return (True, used, limit)
@@ -184,8 +192,22 @@ class PlanEnforcementService:
         with self._cache_lock:
             if org_id is None:
                 self._plan_cache.clear()
+                self._usage_cache.clear()
             else:
                 self._plan_cache.pop(org_id, None)
+                self._usage_cache.pop(org_id, None)
+
+    def invalidate_usage(self, org_ids: Iterable[str]) -> None:
+        """Evict cached persisted-call totals for *org_ids*.
+
+        Registered with ``UsageTracker.add_flush_listener``: once a flush
+        marks hours persisted they leave the tracker's unpersisted total,
+        so the cached database sum must be re-read to include them.
+        """
+        with self._cache_lock:
+            for org_id in org_ids:
+                self._usage_cache.pop(org_id, None)
+                self._usage_generation[org_id] = self._usage_generation.get(org_id, 0) + 1
 
     async def _fetch_plan_from_db(self, org_id: str) -> str:
         """Look up the org's plan in the database."""
@@ -209,6 +231,39 @@ class PlanEnforcementService:
             )
             return _DEFAULT_PLAN
 
+    async def _count_api_calls(self, tracker: UsageTracker, org_id: str, hours: int) -> int:
+        """Calls by *org_id* in the last *hours*, preferring persisted rollups."""
+        if tracker.sink is None or self._sf is None:
+            return tracker.get_org_total(org_id, hours)
+
+        # Read the local term first: a flush that lands during the query
+        # below can then only be counted twice, never missed.
+        local = tracker.get_org_total(org_id, hours, unpersisted_only=True)
+        with self._cache_lock:
+            entry = self._usage_cache.get(org_id)
+            generation = self._usage_generation.get(org_id, 0)
+        if entry is not None and (time.monotonic() - entry[1]) <= _PLAN_CACHE_TTL_SECONDS:
+            persisted = entry[0]
+        else:
+            since = datetime.fromtimestamp((int(time.time() // 3600) - hours + 1) * 3600, UTC)
+            try:
+                async with self._sf() as session:
+                    stmt = select(
+                        sa_func.coalesce(sa_func.sum(APIUsageHourlyRecord.call_count), 0)
+                    ).where(
+                        APIUsageHourlyRecord.org_id == org_id,
+                        APIUsageHourlyRecord.hour >= since,
+                    )
+                    persisted = int((await session.execute(stmt)).scalar_one())
+            except Exception:
+                logger.warning("billing_usage_lookup_failed", org_id=org_id, exc_info=True)
+                return tracker.get_org_total(org_id, hours)
+            with self._cache_lock:
+                if self._usage_generation.get(org_id, 0) == generation:
+                    self._usage_cache[org_id] = (persisted, time.monotonic())
+
+        return persisted + local
+
     async def _count_agents(self, org_id: str) -> int:
         """Count active agent registrations for *org_id*.
 
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class FinOpsMaturityScorer:
     ) -> None:
         self._max_records = max_records
         self._maturity_threshold = maturity_threshold
-        self._records: list[MaturityRecord] = []
+        self._records: RecordStore[MaturityRecord] = RecordStore(self._max_records)
         self._analyses: list[MaturityAnalysis] = []
         logger.info(
             "finops_maturity_scorer.initialized",
@@ -126,8 +128,6 @@ class FinOpsMaturityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "finops_maturity_scorer.maturity_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class FinOpsMaturityScorer:
         return record
 
     def get_maturity(self, record_id: str) -> MaturityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_maturities(
         self,
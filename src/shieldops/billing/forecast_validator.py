@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class CostForecastValidator:
     ) -> None:
         self._max_records = max_records
         self._max_forecast_error_pct = max_forecast_error_pct
-        self._records: list[ForecastRecord] = []
+        self._records: RecordStore[ForecastRecord] = RecordStore(self._max_records)
         self._rules: list[ForecastRule] = []
         logger.info(
             "forecast_validator.initialized",
@@ -123,8 +125,6 @@ class CostForecastValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "forecast_validator.forecast_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class CostForecastValidator:
         return record
 
     def get_forecast(self, record_id: str) -> ForecastRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_forecasts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class IdleResourceDetector:
     ) -> None:
         self._max_records = max_records
         self._idle_threshold_pct = idle_threshold_pct
-        self._records: list[IdleResourceRecord] = []
+        self._records: RecordStore[IdleResourceRecord] = RecordStore(self._max_records)
         logger.info(
             "idle_resource_detector.initialized",
             max_records=max_records,
@@ -137,8 +139,6 @@ class IdleResourceDetector:
             last_active_at=last_active_at,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "idle_resource_detector.resource_recorded",
             record_id=record.id,
@@ -150,10 +150,7 @@ class IdleResourceDetector:
 
     def get_resource(self, record_id: str) -> IdleResourceRecord | None:
         """Get a single resource record by ID."""
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_resources(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -101,7 +103,7 @@ class InfrastructureCostAllocator:
     ) -> None:
         self._max_records = max_records
         self._max_unallocated_pct = max_unallocated_pct
-        self._records: list[AllocationRecord] = []
+        self._records: RecordStore[AllocationRecord] = RecordStore(self._max_records)
         self._splits: list[AllocationSplit] = []
         logger.info(
             "infra_cost_allocator.initialized",
@@ -139,8 +141,6 @@ class InfrastructureCostAllocator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "infra_cost_allocator.recorded",
             record_id=record.id,
@@ -151,10 +151,7 @@ class InfrastructureCostAllocator:
         return record
 
     def get_allocation(self, record_id: str) -> AllocationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_allocations(
         self,
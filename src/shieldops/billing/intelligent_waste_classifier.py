@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class IntelligentWasteClassifier:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[WasteRecord] = []
+        self._records: RecordStore[WasteRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, WasteAnalysis] = {}
         logger.info(
             "intelligent_waste_classifier.init",
@@ -113,8 +115,6 @@ class IntelligentWasteClassifier:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "waste_classifier.record_added",
             record_id=record.id,
@@ -123,11 +123,7 @@ class IntelligentWasteClassifier:
         return record
 
     def process(self, key: str) -> WasteAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         complexity_mult = {
@@ -190,7 +186,7 @@ class IntelligentWasteClassifier:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("intelligent_waste_classifier.cleared")
         return {"status": "cleared"}
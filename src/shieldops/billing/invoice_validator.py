@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class InvoiceValidationEngine:
     ) -> None:
         self._max_records = max_records
         self._max_discrepancy_pct = max_discrepancy_pct
-        self._records: list[InvoiceRecord] = []
+        self._records: RecordStore[InvoiceRecord] = RecordStore(self._max_records)
         self._discrepancies: list[DiscrepancyDetail] = []
         logger.info(
             "invoice_validator.initialized",
@@ -120,8 +122,6 @@ class InvoiceValidationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "invoice_validator.invoice_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class InvoiceValidationEngine:
         return record
 
     def get_invoice(self, record_id: str) -> InvoiceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_invoices(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class LLMTokenCostTracker:
     ) -> None:
         self._max_records = max_records
         self._high_cost_threshold = high_cost_threshold
-        self._records: list[LLMCostRecord] = []
+        self._records: RecordStore[LLMCostRecord] = RecordStore(self._max_records)
         self._breakdowns: list[ProviderCostBreakdown] = []
         logger.info(
             "llm_cost_tracker.initialized",
@@ -116,8 +118,6 @@ class LLMTokenCostTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "llm_cost_tracker.cost_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class LLMTokenCostTracker:
         return record
 
     def get_cost(self, record_id: str) -> LLMCostRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_costs(
         self,
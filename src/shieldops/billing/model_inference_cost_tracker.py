@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ModelInferenceCostTracker:
     ) -> None:
         self._max_records = max_records
         self._cost_threshold_usd = cost_threshold_usd
-        self._records: list[InferenceCostRecord] = []
+        self._records: RecordStore[InferenceCostRecord] = RecordStore(self._max_records)
         self._analyses: list[CostAnalysis] = []
         logger.info(
             "model_inference_cost_tracker.initialized",
@@ -124,8 +126,6 @@ class ModelInferenceCostTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "model_inference_cost_tracker.cost_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ModelInferenceCostTracker:
         return record
 
     def get_cost(self, record_id: str) -> InferenceCostRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_costs(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class MultiCloudCostNormalizer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CloudCostRecord] = []
+        self._records: RecordStore[CloudCostRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CloudCostAnalysis] = {}
         logger.info(
             "multi_cloud_cost_normalizer.init",
@@ -117,8 +119,6 @@ class MultiCloudCostNormalizer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "multi_cloud_cost.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class MultiCloudCostNormalizer:
         return record
 
     def process(self, key: str) -> CloudCostAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         var = 0.0
@@ -195,7 +191,7 @@ class MultiCloudCostNormalizer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("multi_cloud_cost_normalizer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class CostOptimizationPlanner:
     ) -> None:
         self._max_records = max_records
         self._min_savings_pct = min_savings_pct
-        self._records: list[OptimizationRecord] = []
+        self._records: RecordStore[OptimizationRecord] = RecordStore(self._max_records)
         self._actions: list[OptimizationAction] = []
         logger.info(
             "optimization_planner.initialized",
@@ -121,8 +123,6 @@ class CostOptimizationPlanner:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "optimization_planner.optimization_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class CostOptimizationPlanner:
         return record
 
     def get_optimization(self, record_id: str) -> OptimizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_optimizations(
         self,
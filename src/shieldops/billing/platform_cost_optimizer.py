@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PlatformCostOptimizer:
     ) -> None:
         self._max_records = max_records
         self._min_savings_threshold = min_savings_threshold
-        self._records: list[OptimizationRecord] = []
+        self._records: RecordStore[OptimizationRecord] = RecordStore(self._max_records)
         self._rules: list[OptimizationRule] = []
         logger.info(
             "platform_cost.initialized",
@@ -116,8 +118,6 @@ class PlatformCostOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "platform_cost.optimization_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PlatformCostOptimizer:
         return record
 
     def get_optimization(self, record_id: str) -> OptimizationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_optimizations(
         self,
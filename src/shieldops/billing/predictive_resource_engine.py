@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class PredictiveResourceEngine:
     ) -> None:
         self._max_records = max_records
         self._usage_threshold = usage_threshold
-        self._records: list[ResourceRecord] = []
+        self._records: RecordStore[ResourceRecord] = RecordStore(self._max_records)
         self._analyses: list[ResourceAnalysis] = []
         logger.info(
             "predictive_resource_engine.initialized",
@@ -130,8 +132,6 @@ class PredictiveResourceEngine:
             potential_savings=potential_savings,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "predictive_resource_engine.record_added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ProcurementOptimizer:
     ) -> None:
         self._max_records = max_records
         self._max_waste_pct = max_waste_pct
-        self._records: list[ProcurementRecord] = []
+        self._records: RecordStore[ProcurementRecord] = RecordStore(self._max_records)
         self._opportunities: list[OptimizationOpportunity] = []
         logger.info(
             "procurement_optimizer.initialized",
@@ -120,8 +122,6 @@ class ProcurementOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "procurement_optimizer.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ProcurementOptimizer:
         return record
 
     def get_procurement(self, record_id: str) -> ProcurementRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_procurements(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RealtimeCostAnomalyDetector:
     ) -> None:
         self._max_records = max_records
         self._deviation_threshold = deviation_threshold
-        self._records: list[CostAnomalyRecord] = []
+        self._records: RecordStore[CostAnomalyRecord] = RecordStore(self._max_records)
         self._analyses: list[AnomalyAnalysis] = []
         logger.info(
             "realtime_cost_anomaly_detector.initialized",
@@ -126,8 +128,6 @@ class RealtimeCostAnomalyDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "realtime_cost_anomaly_detector.anomaly_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class RealtimeCostAnomalyDetector:
         return record
 
     def get_anomaly(self, record_id: str) -> CostAnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_anomalies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RIPurchaseOptimizer:
     ) -> None:
         self._max_records = max_records
         self._savings_threshold = savings_threshold
-        self._records: list[RIPurchaseRecord] = []
+        self._records: RecordStore[RIPurchaseRecord] = RecordStore(self._max_records)
         self._analyses: list[PurchaseAnalysis] = []
         logger.info(
             "ri_purchase_optimizer.initialized",
@@ -126,8 +128,6 @@ class RIPurchaseOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ri_purchase_optimizer.purchase_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class RIPurchaseOptimizer:
         return record
 
     def get_purchase(self, record_id: str) -> RIPurchaseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_purchases(
         self,
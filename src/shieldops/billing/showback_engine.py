@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ShowbackEngine:
     ) -> None:
         self._max_records = max_records
         self._max_over_budget_pct = max_over_budget_pct
-        self._records: list[ShowbackRecord] = []
+        self._records: RecordStore[ShowbackRecord] = RecordStore(self._max_records)
         self._allocations: list[ShowbackAllocation] = []
         logger.info(
             "showback_engine.initialized",
@@ -124,8 +126,6 @@ class ShowbackEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "showback_engine.showback_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ShowbackEngine:
         return record
 
     def get_showback(self, record_id: str) -> ShowbackRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_showbacks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SpotInstanceAdvisor:
     ) -> None:
         self._max_records = max_records
         self._min_savings_pct = min_savings_pct
-        self._records: list[SpotUsageRecord] = []
+        self._records: RecordStore[SpotUsageRecord] = RecordStore(self._max_records)
         self._recommendations: list[SpotRecommendation] = []
         logger.info(
             "spot_advisor.initialized",
@@ -132,8 +134,6 @@ class SpotInstanceAdvisor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "spot_advisor.usage_recorded",
             record_id=record.id,
@@ -143,10 +143,7 @@ class SpotInstanceAdvisor:
         return record
 
     def get_usage(self, record_id: str) -> SpotUsageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_usage(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class CostUnitEconomicsEngine:
     ) -> None:
         self._max_records = max_records
         self._high_cost_threshold = high_cost_threshold
-        self._records: list[UnitCostRecord] = []
+        self._records: RecordStore[UnitCostRecord] = RecordStore(self._max_records)
         self._benchmarks: list[UnitBenchmark] = []
         logger.info(
             "unit_economics.initialized",
@@ -125,8 +127,6 @@ class CostUnitEconomicsEngine:
             period=period,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "unit_economics.cost_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class CostUnitEconomicsEngine:
 
     def get_record(self, record_id: str) -> UnitCostRecord | None:
         """Get a single unit cost record by ID."""
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class UnitEconomicsTracker:
     ) -> None:
         self._max_records = max_records
         self._cost_increase_threshold = cost_increase_threshold
-        self._records: list[UnitEconomicsRecord] = []
+        self._records: RecordStore[UnitEconomicsRecord] = RecordStore(self._max_records)
         self._analyses: list[EconomicsAnalysis] = []
         logger.info(
             "unit_economics_tracker.initialized",
@@ -126,8 +128,6 @@ class UnitEconomicsTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "unit_economics_tracker.economics_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class UnitEconomicsTracker:
         return record
 
     def get_unit_economics(self, record_id: str) -> UnitEconomicsRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_unit_economics(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class VendorLockinAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_risk_score = max_risk_score
-        self._records: list[LockinRecord] = []
+        self._records: RecordStore[LockinRecord] = RecordStore(self._max_records)
         self._assessments: list[LockinAssessment] = []
         logger.info(
             "vendor_lockin.initialized",
@@ -123,8 +125,6 @@ class VendorLockinAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vendor_lockin.lockin_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class VendorLockinAnalyzer:
         return record
 
     def get_lockin(self, record_id: str) -> LockinRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_lockins(
         self,
@@ -2,19 +2,30 @@
 
 Provides ``@cached`` for transparent read-through caching and
 ``@cache_invalidate`` for clearing a namespace after write operations.
+
+``@cached`` protects against cache stampedes: concurrent misses on the
+same key share one in-flight computation, an optional short Redis lock
+extends that across processes, and stale-while-revalidate serves the
+previous value while a single background refresh runs.
 """
 
 from __future__ import annotations
 
 import functools
 import hashlib
+import time
 from collections.abc import Callable
 from typing import Any
 
 import structlog
 
+from shieldops.cache.single_flight import SingleFlight, SWREntry, compute_with_lock
+
 logger = structlog.get_logger()
 
+# Process-wide coalescing group shared by every ``@cached`` function.
+_flights = SingleFlight()
+
 # Module-level reference to the active RedisCache instance.
 # Set via ``set_cache()`` at application startup.
 _cache_instance: Any = None
@@ -47,15 +58,39 @@ def _build_cache_key(
 def cached(
     ttl: int = 300,
     namespace: str = "default",
+    *,
+    single_flight: bool = True,
+    lock_ttl: float | None = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0,
 ) -> Callable[..., Any]:
     """Decorator that caches the return value of an async function.
 
+    Parameters
+    ----------
+    ttl:
+        Seconds a value is considered fresh.
+    namespace:
+        Cache namespace for the generated keys.
+    single_flight:
+        Coalesce concurrent misses for the same key into one call.
+    lock_ttl:
+        When set, also coalesce across processes with a Redis lock held
+        for at most this many seconds.
+    stale_ttl:
+        Seconds past ``ttl`` during which a stale value is still served
+        while one background refresh recomputes it.
+    early_refresh_beta:
+        XFetch aggressiveness for probabilistic refresh *before* expiry
+        (``0`` disables, ``1.0`` is the usual setting).
+
     Usage::
 
-        @cached(ttl=300, namespace="investigations")
+        @cached(ttl=300, namespace="investigations", stale_ttl=60)
         async def list_investigations(...):
             ...
     """
+    swr = stale_ttl > 0 or early_refresh_beta > 0
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
@@ -66,13 +101,40 @@ def cached(
                 return await func(*args, **kwargs)
 
             key = _build_cache_key(func, args, kwargs)
+            flight_key = f"{namespace}:{key}"
+
+            async def compute() -> Any:
+                started = time.perf_counter()
+                result = await func(*args, **kwargs)
+                if swr:
+                    envelope = SWREntry.wrap(result, ttl, time.perf_counter() - started)
+                    await cache.set(key, envelope, ttl=ttl + stale_ttl, namespace=namespace)
+                else:
+                    await cache.set(key, result, ttl=ttl, namespace=namespace)
+                return result
+
+            async def read() -> Any:
+                raw = await cache.get(key, namespace=namespace)
+                entry = SWREntry.unwrap(raw) if swr else None
+                return entry.value if entry is not None else raw
+
+            async def coalesced_compute() -> Any:
+                if lock_ttl:
+                    return await compute_with_lock(cache, flight_key, compute, read, lock_ttl)
+                return await compute()
+
             cached_value = await cache.get(key, namespace=namespace)
             if cached_value is not None:
-                return cached_value
-
-            result = await func(*args, **kwargs)
-            await cache.set(key, result, ttl=ttl, namespace=namespace)
-            return result
+                entry = SWREntry.unwrap(cached_value) if swr else None
+                if entry is None:
+                    return cached_value
+                if entry.should_refresh(early_refresh_beta):
+                    _flights.do_background(flight_key, coalesced_compute)
+                return entry.value
+
+            if not single_flight:
+                return await coalesced_compute()
+            return await _flights.do(flight_key, coalesced_compute)
 
         return wrapper
 
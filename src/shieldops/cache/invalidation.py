@@ -0,0 +1,200 @@
+"""Cross-process L1 invalidation over Redis pub/sub.
+
+Each API pod keeps its own in-memory L1 in front of Redis. Without
+coordination, a write on one pod leaves stale L1 entries on every other
+pod until their TTL expires. ``CacheInvalidationBus`` broadcasts key,
+namespace and flush invalidations on a Redis channel so every pod can
+drop the affected L1 entries within milliseconds, which makes long L1
+TTLs safe.
+
+Pub/sub is fire-and-forget: messages sent while a subscriber is
+disconnected are lost. The listener therefore reports every
+(re)subscription through ``on_resubscribe`` so the cache can clear its
+L1 rather than risk serving entries it missed invalidations for.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import enum
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, Field
+
+logger = structlog.get_logger()
+
+DEFAULT_CHANNEL = "shieldops:cache:invalidate"
+
+
+class InvalidationOp(enum.StrEnum):
+    """Kind of invalidation being broadcast."""
+
+    KEYS = "keys"
+    NAMESPACE = "namespace"
+    FLUSH = "flush"
+
+
+class InvalidationMessage(BaseModel):
+    """A single invalidation broadcast."""
+
+    op: InvalidationOp
+    namespace: str = ""
+    keys: list[str] = Field(default_factory=list)
+    origin: str = ""
+    sent_at: float = Field(default_factory=time.time)
+
+
+class CacheInvalidationBus:
+    """Publish and receive cache invalidations on a Redis channel.
+
+    Parameters
+    ----------
+    redis_url:
+        Redis connection string. Ignored when *client* is given.
+    channel:
+        Pub/sub channel shared by all pods.
+    node_id:
+        Identifier of this process; messages it published itself are
+        ignored on receipt. Defaults to a random id.
+    client:
+        Pre-built ``redis.asyncio`` client (mainly for tests).
+    """
+
+    def __init__(
+        self,
+        redis_url: str = "",
+        channel: str = DEFAULT_CHANNEL,
+        node_id: str | None = None,
+        client: Any = None,
+        reconnect_delay: float = 1.0,
+    ) -> None:
+        self._redis_url = redis_url
+        self._channel = channel
+        self._node_id = node_id or uuid.uuid4().hex[:12]
+        self._client = client
+        self._reconnect_delay = reconnect_delay
+        self._task: asyncio.Task[None] | None = None
+        self._connected = False
+        self._published = 0
+        self._publish_errors = 0
+
+    @property
+    def node_id(self) -> str:
+        return self._node_id
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def published(self) -> int:
+        return self._published
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import redis.asyncio as aioredis
+
+            self._client = aioredis.from_url(self._redis_url, decode_responses=False)
+        return self._client
+
+    # ── Publishing ───────────────────────────────────────────────
+
+    async def publish(
+        self,
+        op: InvalidationOp,
+        namespace: str = "",
+        keys: list[str] | None = None,
+    ) -> bool:
+        """Broadcast an invalidation. Errors are logged, never raised."""
+        message = InvalidationMessage(
+            op=op, namespace=namespace, keys=keys or [], origin=self._node_id
+        )
+        try:
+            await self._get_client().publish(self._channel, message.model_dump_json())
+        except Exception as exc:
+            self._publish_errors += 1
+            logger.warning("cache_invalidation_publish_failed", op=op, error=str(exc))
+            return False
+        self._published += 1
+        return True
+
+    # ── Subscribing ──────────────────────────────────────────────
+
+    async def start(
+        self,
+        handler: Callable[[InvalidationMessage], Any],
+        on_resubscribe: Callable[[], Any] | None = None,
+    ) -> None:
+        """Start the background listener task."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._listen(handler, on_resubscribe))
+        logger.info("cache_invalidation_listener_started", channel=self._channel)
+
+    async def stop(self) -> None:
+        """Stop the listener and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._connected = False
+        if self._client is not None:
+            try:
+                await self._client.aclose()
+            except Exception as exc:
+                logger.debug("cache_invalidation_close_failed", error=str(exc))
+            self._client = None
+
+    async def _listen(
+        self,
+        handler: Callable[[InvalidationMessage], Any],
+        on_resubscribe: Callable[[], Any] | None,
+    ) -> None:
+        while True:
+            pubsub = None
+            try:
+                pubsub = self._get_client().pubsub()
+                await pubsub.subscribe(self._channel)
+                self._connected = True
+                if on_resubscribe is not None:
+                    await _maybe_await(on_resubscribe())
+                while True:
+                    raw = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if raw is None or raw.get("type") != "message":
+                        continue
+                    message = self._decode(raw.get("data"))
+                    if message is None or message.origin == self._node_id:
+                        continue
+                    await _maybe_await(handler(message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._connected = False
+                logger.warning("cache_invalidation_listener_error", error=str(exc))
+                await asyncio.sleep(self._reconnect_delay)
+            finally:
+                self._connected = False
+                if pubsub is not None:
+                    # The connection may already be gone; nothing to clean up then.
+                    with contextlib.suppress(Exception):
+                        await pubsub.aclose()
+
+    @staticmethod
+    def _decode(data: Any) -> InvalidationMessage | None:
+        try:
+            return InvalidationMessage.model_validate_json(data)
+        except Exception as exc:
+            logger.debug("cache_invalidation_bad_message", error=str(exc))
+            return None
+
+
+async def _maybe_await(result: Any) -> Any:
+    if isinstance(result, Awaitable):
+        return await result
+    return result
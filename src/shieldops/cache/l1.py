@@ -0,0 +1,528 @@
+"""In-process L1 stores for ``MultiLevelCache``.
+
+Two interchangeable implementations share the same small interface
+(``get``/``put``/``delete``/``clear``/``remove_namespace``/``stats``):
+
+``LRUStore``
+    The original design: one ``OrderedDict`` behind one global lock,
+    bounded by entry count and evicting strictly by recency.
+
+``TinyLFUStore``
+    A byte-budgeted, lock-sharded store using the W-TinyLFU policy
+    (Einziger, Friedman & Manes, 2017). New entries land in a small LRU
+    *window*; entries leaving the window must beat the main segment's
+    eviction victim on estimated access frequency to be admitted. One-off
+    scans therefore churn only the window instead of flushing the hot
+    set, and a few large payloads cannot push the cache over its memory
+    budget. Optional per-namespace byte budgets stop one namespace from
+    monopolising L1.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# ── Size estimation ──────────────────────────────────────────────────
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Approximate the in-memory footprint of a JSON-like value in bytes.
+
+    Walks dicts, lists, tuples and sets (up to a fixed depth) and sums
+    ``sys.getsizeof`` of the containers and their items. Shared objects
+    are counted once per reference, which over- rather than
+    under-estimates.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= 8:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1)
+    return size
+
+
+# ── Entries ──────────────────────────────────────────────────────────
+
+
+class _L1Entry:
+    """Single entry in the L1 cache with timestamp for TTL."""
+
+    __slots__ = ("value", "expires_at", "namespace", "size", "segment")
+
+    def __init__(self, value: Any, ttl: int, namespace: str, size: int = 0) -> None:
+        self.value = value
+        self.expires_at = time.monotonic() + ttl
+        self.namespace = namespace
+        self.size = size
+        self.segment = 0
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+# ── LRU store (baseline) ─────────────────────────────────────────────
+
+
+class LRUStore:
+    """Entry-count bounded LRU behind a single lock."""
+
+    policy = "lru"
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self._max_size = max_size
+        # LRU implemented via OrderedDict (most-recently-used at end)
+        self._data: OrderedDict[str, _L1Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            if entry.expired:
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, entry.value
+
+    def put(self, key: str, value: Any, ttl: int, namespace: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._data[key] = _L1Entry(value, ttl, namespace)
+                return
+            while self._data and len(self._data) >= self._max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._data[key] = _L1Entry(value, ttl, namespace)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            return count
+
+    def remove_namespace(self, namespace: str) -> int:
+        with self._lock:
+            keys = [k for k, e in self._data.items() if e.namespace == namespace]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def reset_counters(self) -> None:
+        self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "size": len(self._data),
+            "bytes": 0,
+            "max_bytes": 0,
+            "evictions": self.evictions,
+            "rejections": 0,
+        }
+
+
+# ── Frequency sketch ─────────────────────────────────────────────────
+
+_MASK64 = (1 << 64) - 1
+# Odd 64-bit multiplier used to mix ``hash(key)`` before slicing it into
+# four 16-bit row indexes.
+_MIX = 0x9E3779B97F4A7C15
+_MAX_WIDTH = 1 << 16
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+class FrequencySketch:
+    """Count-min sketch of 4-bit counters with periodic aging.
+
+    Estimates how often a key was accessed recently. After
+    ``10 * width`` increments every counter is halved, so the popularity
+    of keys that were hot an hour ago decays instead of pinning them.
+    The four row indexes are 16-bit slices of one mixed 64-bit hash,
+    which caps each row at 65,536 counters.
+    """
+
+    __slots__ = ("_table", "_width", "_mask", "_additions", "_sample_size")
+
+    def __init__(self, capacity: int) -> None:
+        width = 16
+        while width < capacity and width < _MAX_WIDTH:
+            width <<= 1
+        self._width = width
+        self._mask = width - 1
+        self._table = bytearray(width * 4)
+        self._additions = 0
+        self._sample_size = 10 * width
+
+    def _indexes(self, key: str) -> tuple[int, int, int, int]:
+        h = (hash(key) * _MIX) & _MASK64
+        mask, width = self._mask, self._width
+        return (
+            h & mask,
+            width + ((h >> 16) & mask),
+            2 * width + ((h >> 32) & mask),
+            3 * width + ((h >> 48) & mask),
+        )
+
+    def increment(self, key: str) -> None:
+        # Unrolled: this runs on every L1 read.
+        h = (hash(key) * _MIX) & _MASK64
+        mask, width, table = self._mask, self._width, self._table
+        i = h & mask
+        if table[i] < 15:
+            table[i] += 1
+        i = width + ((h >> 16) & mask)
+        if table[i] < 15:
+            table[i] += 1
+        i = 2 * width + ((h >> 32) & mask)
+        if table[i] < 15:
+            table[i] += 1
+        i = 3 * width + ((h >> 48) & mask)
+        if table[i] < 15:
+            table[i] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = bytearray(table.translate(_HALVE))
+            self._additions //= 2
+
+    def frequency(self, key: str) -> int:
+        table = self._table
+        a, b, c, d = self._indexes(key)
+        return min(table[a], table[b], table[c], table[d])
+
+
+# ── W-TinyLFU store ──────────────────────────────────────────────────
+
+_WINDOW, _PROBATION, _PROTECTED = 0, 1, 2
+
+
+class _Shard:
+    """One lock-protected W-TinyLFU partition.
+
+    Layout: a small LRU *window* for new entries, and a segmented-LRU
+    *main* area split into *probation* (admitted, seen once since) and
+    *protected* (hit while on probation). All limits are enforced both in
+    bytes and entries.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        max_entries: int,
+        window_ratio: float,
+        protected_ratio: float,
+        namespace_budgets: Mapping[str, int],
+    ) -> None:
+        self.lock = threading.Lock()
+        self.index: dict[str, _L1Entry] = {}
+        self.segments: tuple[OrderedDict[str, _L1Entry], ...] = (
+            OrderedDict(),
+            OrderedDict(),
+            OrderedDict(),
+        )
+        self.seg_bytes = [0, 0, 0]
+        self.ns_bytes: dict[str, int] = {}
+        self.namespace_budgets = dict(namespace_budgets)
+        self.sketch = FrequencySketch(max_entries)
+
+        self.max_window_bytes = max(1, int(max_bytes * window_ratio))
+        self.max_window_entries = max(1, int(max_entries * window_ratio))
+        self.max_main_bytes = max(1, max_bytes - self.max_window_bytes)
+        self.max_main_entries = max(1, max_entries - self.max_window_entries)
+        self.max_protected_bytes = int(self.max_main_bytes * protected_ratio)
+        self.max_protected_entries = int(self.max_main_entries * protected_ratio)
+
+        self.evictions = 0
+        self.rejections = 0
+
+    # Called with ``lock`` held.
+
+    def _unlink(self, key: str, entry: _L1Entry) -> None:
+        del self.segments[entry.segment][key]
+        del self.index[key]
+        self.seg_bytes[entry.segment] -= entry.size
+        remaining = self.ns_bytes.get(entry.namespace, 0) - entry.size
+        if remaining > 0:
+            self.ns_bytes[entry.namespace] = remaining
+        else:
+            self.ns_bytes.pop(entry.namespace, None)
+
+    def _link(self, key: str, entry: _L1Entry, segment: int) -> None:
+        entry.segment = segment
+        self.segments[segment][key] = entry
+        self.index[key] = entry
+        self.seg_bytes[segment] += entry.size
+        self.ns_bytes[entry.namespace] = self.ns_bytes.get(entry.namespace, 0) + entry.size
+
+    def _move(self, key: str, entry: _L1Entry, segment: int) -> None:
+        del self.segments[entry.segment][key]
+        self.seg_bytes[entry.segment] -= entry.size
+        entry.segment = segment
+        self.segments[segment][key] = entry
+        self.seg_bytes[segment] += entry.size
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        self.sketch.increment(key)
+        entry = self.index.get(key)
+        if entry is None:
+            return False, None
+        if time.monotonic() >= entry.expires_at:
+            self._unlink(key, entry)
+            return False, None
+        if entry.segment == _PROBATION:
+            self._move(key, entry, _PROTECTED)
+            self._demote_protected()
+        else:
+            self.segments[entry.segment].move_to_end(key)
+        return True, entry.value
+
+    def _demote_protected(self) -> None:
+        protected = self.segments[_PROTECTED]
+        while len(protected) > 1 and (
+            self.seg_bytes[_PROTECTED] > self.max_protected_bytes
+            or len(protected) > self.max_protected_entries
+        ):
+            key, entry = next(iter(protected.items()))
+            self._move(key, entry, _PROBATION)
+
+    def put(self, key: str, value: Any, ttl: int, namespace: str, size: int) -> None:
+        self.sketch.increment(key)
+        existing = self.index.get(key)
+        if existing is not None:
+            self._unlink(key, existing)
+        entry = _L1Entry(value, ttl, namespace, size)
+        segment = existing.segment if existing is not None else _WINDOW
+        self._link(key, entry, segment)
+        if not self._enforce_namespace_budget(key, entry):
+            return
+        if segment == _WINDOW:
+            self._drain_window()
+        elif segment == _PROTECTED:
+            self._demote_protected()
+        self._evict_main_overflow()
+
+    def _enforce_namespace_budget(self, key: str, entry: _L1Entry) -> bool:
+        """Evict oldest same-namespace entries; returns False if *entry* itself was dropped."""
+        budget = self.namespace_budgets.get(entry.namespace)
+        if budget is None or self.ns_bytes.get(entry.namespace, 0) <= budget:
+            return True
+        if entry.size > budget:
+            self._unlink(key, entry)
+            self.rejections += 1
+            return False
+        for segment in (_WINDOW, _PROBATION, _PROTECTED):
+            victims = [
+                k
+                for k, e in self.segments[segment].items()
+                if e.namespace == entry.namespace and k != key
+            ]
+            for victim in victims:
+                if self.ns_bytes.get(entry.namespace, 0) <= budget:
+                    return True
+                self._unlink(victim, self.index[victim])
+                self.evictions += 1
+        return True
+
+    def _main_over(self, extra_bytes: int, extra_entries: int) -> bool:
+        main_bytes = self.seg_bytes[_PROBATION] + self.seg_bytes[_PROTECTED]
+        main_entries = len(self.segments[_PROBATION]) + len(self.segments[_PROTECTED])
+        return (
+            main_bytes + extra_bytes > self.max_main_bytes
+            or main_entries + extra_entries > self.max_main_entries
+        )
+
+    def _drain_window(self) -> None:
+        window = self.segments[_WINDOW]
+        while window and (
+            self.seg_bytes[_WINDOW] > self.max_window_bytes or len(window) > self.max_window_entries
+        ):
+            key, candidate = next(iter(window.items()))
+            self._unlink(key, candidate)
+            self._admit(key, candidate)
+
+    def _admit(self, key: str, candidate: _L1Entry) -> None:
+        """Move a window evictee into probation if it out-ranks the main victims."""
+        if candidate.size > self.max_main_bytes:
+            self.rejections += 1
+            return
+        if self._main_over(candidate.size, 1):
+            frequency = self.sketch.frequency(key)
+            victims: list[tuple[str, _L1Entry]] = []
+            freed_bytes = 0
+            for segment in (_PROBATION, _PROTECTED):
+                for victim_key, victim in self.segments[segment].items():
+                    if not self._main_over(candidate.size - freed_bytes, 1 - len(victims)):
+                        break
+                    if not victim.expired and self.sketch.frequency(victim_key) >= frequency:
+                        self.rejections += 1
+                        return
+                    victims.append((victim_key, victim))
+                    freed_bytes += victim.size
+            for victim_key, victim in victims:
+                self._unlink(victim_key, victim)
+                self.evictions += 1
+        self._link(key, candidate, _PROBATION)
+
+    def _evict_main_overflow(self) -> None:
+        """Trim main after an in-place update grew an entry."""
+        for segment in (_PROBATION, _PROTECTED):
+            entries = self.segments[segment]
+            while entries and self._main_over(0, 0):
+                key, entry = next(iter(entries.items()))
+                self._unlink(key, entry)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        entry = self.index.get(key)
+        if entry is None:
+            return False
+        self._unlink(key, entry)
+        return True
+
+    def clear(self) -> int:
+        count = len(self.index)
+        self.index.clear()
+        for segment in self.segments:
+            segment.clear()
+        self.seg_bytes = [0, 0, 0]
+        self.ns_bytes.clear()
+        return count
+
+    def remove_namespace(self, namespace: str) -> int:
+        keys = [k for k, e in self.index.items() if e.namespace == namespace]
+        for k in keys:
+            self._unlink(k, self.index[k])
+        return len(keys)
+
+
+class TinyLFUStore:
+    """Byte-budgeted, lock-sharded W-TinyLFU store.
+
+    Parameters
+    ----------
+    max_bytes:
+        Total memory budget across all shards.
+    max_size:
+        Total entry-count limit across all shards.
+    shards:
+        Number of independently locked partitions. Keys are assigned by
+        hash, and budgets are split evenly between shards.
+    window_ratio:
+        Fraction of each shard reserved for the admission window.
+    protected_ratio:
+        Fraction of the main area reserved for the protected segment.
+    namespace_budgets:
+        Optional per-namespace byte limits (also split across shards).
+    sizer:
+        Callable returning a value's size in bytes; ``estimate_size`` by
+        default.
+    """
+
+    policy = "tinylfu"
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_size: int = 10_000,
+        shards: int = 16,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+        namespace_budgets: Mapping[str, int] | None = None,
+        sizer: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        shards = max(1, min(shards, max_size))
+        self._max_bytes = max_bytes
+        self._sizer = sizer
+        per_shard_budgets = {ns: max(1, b // shards) for ns, b in (namespace_budgets or {}).items()}
+        self._shards = [
+            _Shard(
+                max_bytes=max(1, max_bytes // shards),
+                max_entries=max(1, max_size // shards),
+                window_ratio=window_ratio,
+                protected_ratio=protected_ratio,
+                namespace_budgets=per_shard_budgets,
+            )
+            for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        shard = self._shards[hash(key) % len(self._shards)]
+        with shard.lock:
+            return shard.get(key)
+
+    def put(self, key: str, value: Any, ttl: int, namespace: str) -> None:
+        size = self._sizer(value)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.put(key, value, ttl, namespace, size)
+
+    def delete(self, key: str) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.delete(key)
+
+    def clear(self) -> int:
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.clear()
+        return removed
+
+    def remove_namespace(self, namespace: str) -> int:
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.remove_namespace(namespace)
+        return removed
+
+    def __len__(self) -> int:
+        return sum(len(shard.index) for shard in self._shards)
+
+    @property
+    def evictions(self) -> int:
+        return sum(shard.evictions for shard in self._shards)
+
+    def reset_counters(self) -> None:
+        for shard in self._shards:
+            shard.evictions = 0
+            shard.rejections = 0
+
+    def namespace_bytes(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for ns, size in shard.ns_bytes.items():
+                    totals[ns] = totals.get(ns, 0) + size
+        return totals
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "size": len(self),
+            "bytes": sum(sum(shard.seg_bytes) for shard in self._shards),
+            "max_bytes": self._max_bytes,
+            "evictions": self.evictions,
+            "rejections": sum(shard.rejections for shard in self._shards),
+        }
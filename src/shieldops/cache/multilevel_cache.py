@@ -2,26 +2,48 @@
 
 Every cache read currently hits Redis over the network. This module adds an
 in-process LRU cache (L1) in front of Redis (L2) with auto-promotion,
-per-namespace statistics, and TTL-based eviction.
+per-namespace statistics, and TTL-based eviction. The L1 store is either
+the original entry-count LRU or a byte-budgeted, sharded W-TinyLFU store
+(``l1_policy="tinylfu"``) that keeps the hot set through one-off scans.
+
+With an invalidation bus attached, writes and deletes are broadcast over
+Redis pub/sub so other processes drop their L1 copies immediately instead
+of serving them until the L1 TTL runs out.
 """
 
 from __future__ import annotations
 
+import asyncio
 import enum
-import threading
 import time
-from collections import OrderedDict
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 import structlog
 from pydantic import BaseModel
 
+from shieldops.cache.invalidation import (
+    CacheInvalidationBus,
+    InvalidationMessage,
+    InvalidationOp,
+)
+from shieldops.cache.l1 import LRUStore, TinyLFUStore
+from shieldops.cache.single_flight import SingleFlight, compute_with_lock
+
 logger = structlog.get_logger()
 
 
 # ── Enums ────────────────────────────────────────────────────────────
 
 
+class L1Policy(enum.StrEnum):
+    """Eviction/admission policy for the in-memory L1."""
+
+    LRU = "lru"
+    TINYLFU = "tinylfu"
+
+
 class CacheLevel(enum.StrEnum):
     """Where a cache hit occurred."""
 
@@ -40,27 +62,23 @@ class CacheStats(BaseModel):
     l2_hits: int = 0
     misses: int = 0
     l1_evictions: int = 0
+    l1_rejections: int = 0
     l1_size: int = 0
     l1_max_size: int = 0
+    l1_bytes: int = 0
+    l1_max_bytes: int = 0
+    l1_policy: str = L1Policy.LRU
     total_requests: int = 0
+    coalesced_requests: int = 0
     l1_hit_ratio: float = 0.0
     l2_hit_ratio: float = 0.0
     overall_hit_ratio: float = 0.0
-
-
-class _L1Entry:
-    """Single entry in the L1 cache with timestamp for TTL."""
-
-    __slots__ = ("value", "expires_at", "namespace")
-
-    def __init__(self, value: Any, ttl: int, namespace: str) -> None:
-        self.value = value
-        self.expires_at = time.monotonic() + ttl
-        self.namespace = namespace
-
-    @property
-    def expired(self) -> bool:
-        return time.monotonic() >= self.expires_at
+    invalidations_published: int = 0
+    invalidations_received: int = 0
+    invalidation_resyncs: int = 0
+    invalidation_lag_avg_ms: float = 0.0
+    invalidation_lag_p99_ms: float = 0.0
+    invalidation_lag_max_ms: float = 0.0
 
 
 class MultiLevelCache:
@@ -76,6 +94,19 @@ class MultiLevelCache:
         Default TTL for L1 entries. A shorter TTL keeps L1 fresher.
     l1_enabled:
         When ``False``, L1 is bypassed and all reads go straight to L2.
+    l1_policy:
+        ``"lru"`` (single-lock, entry-count bounded LRU) or ``"tinylfu"``
+        (byte-budgeted, sharded W-TinyLFU; see ``shieldops.cache.l1``).
+    l1_max_bytes:
+        Memory budget for the ``tinylfu`` policy.
+    l1_shards:
+        Number of independently locked partitions for ``tinylfu``.
+    l1_namespace_budgets:
+        Optional per-namespace byte limits for ``tinylfu``.
+    invalidation_bus:
+        Optional ``CacheInvalidationBus``. When set, local writes are
+        broadcast to other processes and their invalidations are applied
+        to this process's L1 once ``start_invalidation_listener`` runs.
     """
 
     def __init__(
@@ -84,21 +115,41 @@ class MultiLevelCache:
         l1_max_size: int = 1000,
         l1_ttl_seconds: int = 60,
         l1_enabled: bool = True,
+        invalidation_bus: CacheInvalidationBus | None = None,
+        l1_policy: str = L1Policy.LRU,
+        l1_max_bytes: int = 64 * 1024 * 1024,
+        l1_shards: int = 16,
+        l1_namespace_budgets: Mapping[str, int] | None = None,
     ) -> None:
         self._l2 = l2_cache
         self._l1_max_size = l1_max_size
         self._l1_ttl = l1_ttl_seconds
         self._l1_enabled = l1_enabled
 
-        # LRU implemented via OrderedDict (most-recently-used at end)
-        self._l1: OrderedDict[str, _L1Entry] = OrderedDict()
-        self._lock = threading.Lock()
+        self._l1: LRUStore | TinyLFUStore
+        if L1Policy(l1_policy) == L1Policy.TINYLFU:
+            self._l1 = TinyLFUStore(
+                max_bytes=l1_max_bytes,
+                max_size=l1_max_size,
+                shards=l1_shards,
+                namespace_budgets=l1_namespace_budgets,
+            )
+        else:
+            self._l1 = LRUStore(max_size=l1_max_size)
+        # Concurrent L1 misses on the same key share one L2 fetch/compute.
+        self._flights = SingleFlight()
 
         # Stats counters
         self._l1_hits = 0
         self._l2_hits = 0
         self._misses = 0
-        self._l1_evictions = 0
+
+        self._bus = invalidation_bus
+        self._invalidations_received = 0
+        self._invalidation_resyncs = 0
+        # Recent publish→apply lags (ms) for the lag percentiles in stats.
+        self._invalidation_lags: deque[float] = deque(maxlen=1024)
+        self._invalidation_lag_max = 0.0
 
     # ── Key helpers ──────────────────────────────────────────────
 
@@ -112,43 +163,29 @@ class MultiLevelCache:
         """Get from L1. Returns (found, value)."""
         if not self._l1_enabled:
             return False, None
-        with self._lock:
-            entry = self._l1.get(fq_key)
-            if entry is None:
-                return False, None
-            if entry.expired:
-                del self._l1[fq_key]
-                return False, None
-            # Move to end (most-recently-used)
-            self._l1.move_to_end(fq_key)
-            return True, entry.value
+        return self._l1.get(fq_key)
 
     def _l1_put(self, fq_key: str, value: Any, ttl: int | None, namespace: str) -> None:
-        """Insert/update L1 entry, evicting LRU if at capacity."""
+        """Insert/update L1 entry; the store evicts or rejects as its policy dictates."""
         if not self._l1_enabled:
             return
-        effective_ttl = ttl if ttl is not None else self._l1_ttl
-        with self._lock:
-            if fq_key in self._l1:
-                self._l1.move_to_end(fq_key)
-                self._l1[fq_key] = _L1Entry(value, effective_ttl, namespace)
-                return
-            # Evict LRU entries if at capacity
-            while len(self._l1) >= self._l1_max_size:
-                self._l1.popitem(last=False)
-                self._l1_evictions += 1
-            self._l1[fq_key] = _L1Entry(value, effective_ttl, namespace)
-
-    def _l1_delete(self, fq_key: str) -> None:
-        with self._lock:
-            self._l1.pop(fq_key, None)
+        self._l1.put(fq_key, value, ttl if ttl is not None else self._l1_ttl, namespace)
+
+    def _l1_delete(self, fq_key: str) -> bool:
+        return self._l1.delete(fq_key)
 
     def _l1_clear(self) -> int:
         """Clear all L1 entries. Returns count removed."""
-        with self._lock:
-            count = len(self._l1)
-            self._l1.clear()
-            return count
+        return self._l1.clear()
+
+    def _l1_remove_namespace(self, namespace: str) -> int:
+        return self._l1.remove_namespace(namespace)
+
+    async def _l2_get(self, key: str, namespace: str) -> Any | None:
+        return await self._flights.do(
+            self._fq(key, namespace),
+            lambda: self._l2.get(key, namespace=namespace),
+        )
 
     # ── Public API ───────────────────────────────────────────────
 
@@ -162,8 +199,8 @@ class MultiLevelCache:
             self._l1_hits += 1
             return value
 
-        # L2 check
-        value = await self._l2.get(key, namespace=namespace)
+        # L2 check (concurrent misses on the same key share one fetch)
+        value = await self._l2_get(key, namespace)
         if value is not None:
             self._l2_hits += 1
             # Auto-promote to L1
@@ -184,7 +221,7 @@ class MultiLevelCache:
             self._l1_hits += 1
             return value, CacheLevel.L1_MEMORY
 
-        value = await self._l2.get(key, namespace=namespace)
+        value = await self._l2_get(key, namespace)
         if value is not None:
             self._l2_hits += 1
             self._l1_put(fq_key, value, None, namespace)
@@ -193,6 +230,50 @@ class MultiLevelCache:
         self._misses += 1
         return None, CacheLevel.MISS
 
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        ttl: int | None = None,
+        namespace: str = "default",
+        lock_ttl: float | None = None,
+    ) -> Any:
+        """Return the cached value or compute it once for all concurrent callers.
+
+        Concurrent misses in this process await a single *factory* call.
+        With *lock_ttl*, a short L2 lock also coalesces recomputes across
+        processes. The factory may be sync or async.
+        """
+        value = await self.get(key, namespace=namespace)
+        if value is not None:
+            return value
+
+        async def compute() -> Any:
+            result = factory()
+            if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                result = await result
+            await self.set(key, result, ttl=ttl, namespace=namespace)
+            return result
+
+        async def read() -> Any:
+            return await self._l2.get(key, namespace=namespace)
+
+        async def coalesced() -> Any:
+            if lock_ttl:
+                return await compute_with_lock(
+                    self._l2, self._fq(key, namespace), compute, read, lock_ttl
+                )
+            return await compute()
+
+        return await self._flights.do(f"compute:{self._fq(key, namespace)}", coalesced)
+
+    async def acquire_lock(self, name: str, ttl_ms: int = 5000) -> str | None:
+        """Delegate to the L2 lock so ``@cached(lock_ttl=...)`` works with L1+L2."""
+        return await self._l2.acquire_lock(name, ttl_ms=ttl_ms)  # type: ignore[no-any-return]
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        return bool(await self._l2.release_lock(name, token))
+
     async def set(
         self,
         key: str,
@@ -204,23 +285,74 @@ class MultiLevelCache:
         fq_key = self._fq(key, namespace)
         self._l1_put(fq_key, value, ttl, namespace)
         await self._l2.set(key, value, ttl=ttl, namespace=namespace)
+        await self._publish(InvalidationOp.KEYS, namespace, [key])
 
     async def delete(self, key: str, namespace: str = "default") -> None:
         """Remove from both L1 and L2."""
         fq_key = self._fq(key, namespace)
         self._l1_delete(fq_key)
         await self._l2.delete(key, namespace=namespace)
+        await self._publish(InvalidationOp.KEYS, namespace, [key])
+
+    async def get_many(self, keys: Iterable[str], namespace: str = "default") -> dict[str, Any]:
+        """Bulk ``get``: serve what L1 has, fetch all L1 misses from L2 at once.
+
+        An L1 miss on N keys costs a single L2 round-trip. Keys that are
+        missing from both levels are absent from the returned dict.
+        """
+        key_list = list(dict.fromkeys(keys))
+        found: dict[str, Any] = {}
+        l1_misses: list[str] = []
+        for key in key_list:
+            hit, value = self._l1_get(self._fq(key, namespace))
+            if hit:
+                self._l1_hits += 1
+                found[key] = value
+            else:
+                l1_misses.append(key)
+
+        if not l1_misses:
+            return found
+
+        l2_values = await self._l2.get_many(l1_misses, namespace=namespace)
+        for key in l1_misses:
+            value = l2_values.get(key)
+            if value is None:
+                self._misses += 1
+                continue
+            self._l2_hits += 1
+            self._l1_put(self._fq(key, namespace), value, None, namespace)
+            found[key] = value
+        return found
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: int | None = None,
+        namespace: str = "default",
+        ttls: Mapping[str, int] | None = None,
+    ) -> None:
+        """Bulk ``set``: populate L1 and write all entries to L2 in one round-trip."""
+        per_key = ttls or {}
+        for key, value in items.items():
+            self._l1_put(self._fq(key, namespace), value, per_key.get(key, ttl), namespace)
+        await self._l2.set_many(items, ttl=ttl, namespace=namespace, ttls=ttls)
+        await self._publish(InvalidationOp.KEYS, namespace, list(items))
+
+    async def delete_many(self, keys: Iterable[str], namespace: str = "default") -> int:
+        """Bulk ``delete`` from both levels. Returns the number of L2 keys removed."""
+        key_list = list(dict.fromkeys(keys))
+        for key in key_list:
+            self._l1_delete(self._fq(key, namespace))
+        removed = int(await self._l2.delete_many(key_list, namespace=namespace))
+        await self._publish(InvalidationOp.KEYS, namespace, key_list)
+        return removed
 
     async def invalidate_namespace(self, namespace: str) -> int:
         """Clear all L1 entries for *namespace* and invalidate L2 pattern."""
-        l1_removed = 0
-        with self._lock:
-            keys_to_remove = [k for k, e in self._l1.items() if e.namespace == namespace]
-            for k in keys_to_remove:
-                del self._l1[k]
-                l1_removed += 1
-
+        l1_removed = self._l1_remove_namespace(namespace)
         l2_removed = await self._l2.invalidate_pattern(f"{namespace}:*")
+        await self._publish(InvalidationOp.NAMESPACE, namespace)
         logger.info(
             "namespace_invalidated",
             namespace=namespace,
@@ -233,6 +365,7 @@ class MultiLevelCache:
         """Clear both L1 and L2 completely."""
         l1_count = self._l1_clear()
         l2_count = await self._l2.flush_all()
+        await self._publish(InvalidationOp.FLUSH)
         return l1_count + int(l2_count)
 
     async def warmup(self, keys: list[dict[str, str]]) -> int:
@@ -255,26 +388,81 @@ class MultiLevelCache:
         logger.info("cache_warmup_complete", warmed=warmed, requested=len(keys))
         return warmed
 
+    # ── Cross-process invalidation ───────────────────────────────
+
+    async def _publish(
+        self, op: InvalidationOp, namespace: str = "", keys: list[str] | None = None
+    ) -> None:
+        if self._bus is not None and self._l1_enabled:
+            await self._bus.publish(op, namespace=namespace, keys=keys)
+
+    async def start_invalidation_listener(self) -> None:
+        """Subscribe to remote invalidations. No-op without a bus."""
+        if self._bus is not None:
+            await self._bus.start(self.apply_invalidation, on_resubscribe=self._resync_l1)
+
+    async def stop_invalidation_listener(self) -> None:
+        if self._bus is not None:
+            await self._bus.stop()
+
+    def _resync_l1(self) -> None:
+        """Drop L1 after (re)subscribing: invalidations may have been missed."""
+        removed = self._l1_clear()
+        self._invalidation_resyncs += 1
+        if removed:
+            logger.info("cache_invalidation_resync", l1_removed=removed)
+
+    def apply_invalidation(self, message: InvalidationMessage) -> int:
+        """Apply an invalidation received from another process to L1 only.
+
+        Returns the number of L1 entries removed.
+        """
+        if message.op == InvalidationOp.FLUSH:
+            removed = self._l1_clear()
+        elif message.op == InvalidationOp.NAMESPACE:
+            removed = self._l1_remove_namespace(message.namespace)
+        else:
+            removed = sum(self._l1_delete(self._fq(key, message.namespace)) for key in message.keys)
+
+        self._invalidations_received += 1
+        lag_ms = max(0.0, (time.time() - message.sent_at) * 1000)
+        self._invalidation_lags.append(lag_ms)
+        self._invalidation_lag_max = max(self._invalidation_lag_max, lag_ms)
+        return removed
+
     # ── Stats ────────────────────────────────────────────────────
 
     def get_stats(self) -> CacheStats:
         """Return aggregate cache statistics."""
         total = self._l1_hits + self._l2_hits + self._misses
-        with self._lock:
-            l1_size = len(self._l1)
+        l1_stats = self._l1.stats()
+        lags = sorted(self._invalidation_lags)
         return CacheStats(
             l1_hits=self._l1_hits,
             l2_hits=self._l2_hits,
             misses=self._misses,
-            l1_evictions=self._l1_evictions,
-            l1_size=l1_size,
+            l1_evictions=l1_stats["evictions"],
+            l1_rejections=l1_stats["rejections"],
+            l1_size=l1_stats["size"],
             l1_max_size=self._l1_max_size,
+            l1_bytes=l1_stats["bytes"],
+            l1_max_bytes=l1_stats["max_bytes"],
+            l1_policy=l1_stats["policy"],
             total_requests=total,
+            coalesced_requests=self._flights.stats()["coalesced"],
             l1_hit_ratio=round(self._l1_hits / total * 100, 2) if total else 0.0,
             l2_hit_ratio=round(self._l2_hits / total * 100, 2) if total else 0.0,
             overall_hit_ratio=(
                 round((self._l1_hits + self._l2_hits) / total * 100, 2) if total else 0.0
             ),
+            invalidations_published=self._bus.published if self._bus is not None else 0,
+            invalidations_received=self._invalidations_received,
+            invalidation_resyncs=self._invalidation_resyncs,
+            invalidation_lag_avg_ms=round(sum(lags) / len(lags), 3) if lags else 0.0,
+            invalidation_lag_p99_ms=(
+                round(lags[min(len(lags) - 1, int(len(lags) * 0.99))], 3) if lags else 0.0
+            ),
+            invalidation_lag_max_ms=round(self._invalidation_lag_max, 3),
         )
 
     def reset_stats(self) -> None:
@@ -282,7 +470,10 @@ class MultiLevelCache:
         self._l1_hits = 0
         self._l2_hits = 0
         self._misses = 0
-        self._l1_evictions = 0
+        self._l1.reset_counters()
+        self._invalidations_received = 0
+        self._invalidation_lags.clear()
+        self._invalidation_lag_max = 0.0
 
     @property
     def l1_enabled(self) -> bool:
@@ -2,11 +2,15 @@
 
 Provides async cache-aside caching with JSON serialization,
 key namespacing, TTL management, and hit/miss tracking.
+
+Bulk operations (``get_many``/``set_many``/``delete_many``) cost a single
+network round-trip regardless of how many keys are involved, and
+pattern/namespace invalidation deletes keys one SCAN page at a time.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 import structlog
@@ -32,6 +36,14 @@ except ImportError:
 
 logger = structlog.get_logger()
 
+# Compare-and-delete so a lock is only released by the holder that set it.
+_RELEASE_LOCK_LUA = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 
 class RedisCache:
     """Async Redis cache with JSON serialization and hit/miss tracking.
@@ -46,6 +58,9 @@ class RedisCache:
         Default time-to-live in seconds for cached entries.
     key_prefix:
         Global prefix prepended to all cache keys.
+    scan_batch_size:
+        ``COUNT`` hint for SCAN and the number of keys deleted per
+        round-trip during pattern/namespace invalidation.
     """
 
     def __init__(
@@ -53,10 +68,12 @@ class RedisCache:
         redis_url: str,
         default_ttl: int = 300,
         key_prefix: str = "shieldops",
+        scan_batch_size: int = 500,
     ) -> None:
         self._redis_url = redis_url
         self._default_ttl = default_ttl
         self._key_prefix = key_prefix
+        self._scan_batch_size = max(1, scan_batch_size)
         self._client: Any = None
         self._hits: int = 0
         self._misses: int = 0
@@ -119,16 +136,26 @@ class RedisCache:
         fq_key = self._make_key(key, namespace)
         await self._client.delete(fq_key)
 
-    async def invalidate_pattern(self, pattern: str) -> int:
+    async def invalidate_pattern(self, pattern: str, batch_size: int | None = None) -> int:
         """Delete all keys matching a glob pattern.
 
+        Keys are collected one SCAN page at a time and removed with a single
+        multi-key ``DEL`` per page, so invalidating N keys costs roughly
+        ``N / batch_size`` round-trips instead of N.
+
         Returns the number of keys deleted.
         """
         full_pattern = f"{self._key_prefix}:{pattern}"
+        batch_size = batch_size or self._scan_batch_size
         deleted = 0
-        async for matched_key in self._client.scan_iter(match=full_pattern):
-            await self._client.delete(matched_key)
-            deleted += 1
+        batch: list[Any] = []
+        async for matched_key in self._client.scan_iter(match=full_pattern, count=batch_size):
+            batch.append(matched_key)
+            if len(batch) >= batch_size:
+                deleted += await self._delete_batch(batch)
+                batch = []
+        if batch:
+            deleted += await self._delete_batch(batch)
         logger.info(
             "cache_invalidated",
             pattern=full_pattern,
@@ -136,6 +163,74 @@ class RedisCache:
         )
         return deleted
 
+    async def invalidate_namespace(self, namespace: str, batch_size: int | None = None) -> int:
+        """Delete every key in *namespace* using batched SCAN + DEL.
+
+        Returns the number of keys deleted.
+        """
+        return await self.invalidate_pattern(f"{namespace}:*", batch_size=batch_size)
+
+    async def _delete_batch(self, fq_keys: list[Any]) -> int:
+        """Delete a batch of fully-qualified keys in one round-trip."""
+        removed: int = await self._client.delete(*fq_keys)
+        return removed
+
+    # ── Bulk operations ──────────────────────────────────────────
+
+    async def get_many(self, keys: Iterable[str], namespace: str = "default") -> dict[str, Any]:
+        """Retrieve several keys with a single ``MGET``.
+
+        Returns a dict containing only the keys that were found. Hit and
+        miss counters are updated per key.
+        """
+        key_list = list(dict.fromkeys(keys))
+        if not key_list:
+            return {}
+        raw_values = await self._client.mget([self._make_key(k, namespace) for k in key_list])
+        found: dict[str, Any] = {}
+        for key, raw in zip(key_list, raw_values, strict=False):
+            if raw is None:
+                self._misses += 1
+                continue
+            self._hits += 1
+            found[key] = _loads(raw)
+        return found
+
+    async def set_many(
+        self,
+        items: Mapping[str, Any],
+        ttl: int | None = None,
+        namespace: str = "default",
+        ttls: Mapping[str, int] | None = None,
+    ) -> None:
+        """Store several values in one pipelined round-trip.
+
+        *ttl* overrides the default TTL for every key; *ttls* overrides it
+        for individual keys.
+        """
+        if not items:
+            return
+        default_ttl = ttl if ttl is not None else self._default_ttl
+        per_key = ttls or {}
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(
+                self._make_key(key, namespace),
+                _dumps(value),
+                ex=per_key.get(key, default_ttl),
+            )
+        await pipe.execute()
+
+    async def delete_many(self, keys: Iterable[str], namespace: str = "default") -> int:
+        """Remove several keys with a single multi-key ``DEL``.
+
+        Returns the number of keys deleted.
+        """
+        fq_keys = [self._make_key(k, namespace) for k in dict.fromkeys(keys)]
+        if not fq_keys:
+            return 0
+        return await self._delete_batch(fq_keys)
+
     async def get_or_set(
         self,
         key: str,
@@ -160,6 +255,29 @@ class RedisCache:
         await self.set(key, result, ttl=ttl, namespace=namespace)
         return result
 
+    # ── Short-lived locks (cross-process request coalescing) ─────
+
+    async def acquire_lock(self, name: str, ttl_ms: int = 5000) -> str | None:
+        """Try to take a short-lived lock via ``SET NX PX``.
+
+        Returns an opaque token on success, or ``None`` if another process
+        holds the lock. The lock expires on its own after *ttl_ms*.
+        """
+        import secrets
+
+        token = secrets.token_hex(8)
+        acquired = await self._client.set(
+            self._make_key(name, "lock"), token.encode(), nx=True, px=ttl_ms
+        )
+        return token if acquired else None
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        """Release a lock previously returned by :meth:`acquire_lock`."""
+        released = await self._client.eval(
+            _RELEASE_LOCK_LUA, 1, self._make_key(name, "lock"), token.encode()
+        )
+        return bool(released)
+
     # ── Stats & health ───────────────────────────────────────────
 
     async def get_stats(self) -> dict[str, Any]:
@@ -171,6 +289,7 @@ class RedisCache:
         keys_count = 0
         async for _ in self._client.scan_iter(
             match=f"{self._key_prefix}:*",
+            count=self._scan_batch_size,
         ):
             keys_count += 1
 
@@ -0,0 +1,211 @@
+"""Request coalescing ("single-flight") and stale-while-revalidate helpers.
+
+When a hot cache key expires, every concurrent caller would otherwise
+recompute the same value at once and stampede the backing store.
+``SingleFlight`` makes concurrent callers for the same key await one
+in-flight computation instead.
+
+``SWREntry`` wraps a cached value with its logical expiry and recompute
+cost so callers can serve stale data while a single background refresh
+runs, and refresh hot keys probabilistically *before* they expire
+(XFetch, Vattani et al. 2015) so expiry never lines up across callers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Marker stored alongside stale-while-revalidate envelopes so they can be
+# told apart from plain cached values written by older code paths.
+_SWR_MARKER = "__swr__"
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the coroutine; callers arriving while
+    it is in flight await the same result (or exception). Once the call
+    completes the key is forgotten, so the next call runs again.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+        self._coalesced = 0
+        self._executed = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run *fn* once for all concurrent callers of *key*."""
+        existing = self._inflight.get(key)
+        if existing is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(existing)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not us: take over the computation.
+                task = asyncio.current_task()
+                if existing.cancelled() and task is not None and not task.cancelling():
+                    return await self.do(key, fn)
+                raise
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self._executed += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # Mark retrieved so waiter-less failures don't log warnings.
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def do_background(self, key: str, fn: Callable[[], Awaitable[Any]]) -> bool:
+        """Schedule *fn* for *key* unless a call for it is already in flight.
+
+        Returns ``True`` if a new background task was started.
+        """
+        if key in self._inflight:
+            return False
+
+        async def _run() -> None:
+            try:
+                await self.do(key, fn)
+            except Exception as exc:
+                logger.warning("single_flight_background_failed", key=key, error=str(exc))
+
+        task = asyncio.get_running_loop().create_task(_run())
+        # Hold a strong reference until the task finishes.
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return True
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "executed": self._executed,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+class SWREntry:
+    """A cached value plus the metadata needed for stale-while-revalidate.
+
+    Parameters
+    ----------
+    value:
+        The cached payload.
+    expires_at:
+        Wall-clock time (``time.time()``) after which the value is stale.
+    delta:
+        Seconds it took to compute the value; larger recompute costs make
+        early refresh more likely as expiry approaches.
+    """
+
+    __slots__ = ("value", "expires_at", "delta")
+
+    def __init__(self, value: Any, expires_at: float, delta: float) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.delta = delta
+
+    @classmethod
+    def wrap(cls, value: Any, ttl: float, delta: float) -> dict[str, Any]:
+        """Build the JSON-serializable envelope stored in the cache."""
+        return {
+            _SWR_MARKER: 1,
+            "v": value,
+            "exp": time.time() + ttl,
+            "d": round(delta, 6),
+        }
+
+    @classmethod
+    def unwrap(cls, raw: Any) -> SWREntry | None:
+        """Parse an envelope, or return ``None`` if *raw* is not one."""
+        if isinstance(raw, dict) and raw.get(_SWR_MARKER) == 1:
+            return cls(raw.get("v"), float(raw.get("exp", 0.0)), float(raw.get("d", 0.0)))
+        return None
+
+    def is_stale(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+    def should_refresh(self, beta: float = 1.0, now: float | None = None) -> bool:
+        """Return ``True`` if the value is stale or selected for early refresh.
+
+        Uses the XFetch rule ``now - delta * beta * ln(rand) >= expiry``:
+        the closer to expiry and the costlier the recompute, the more
+        likely a given caller is to refresh early.
+        """
+        now = now if now is not None else time.time()
+        if now >= self.expires_at:
+            return True
+        if beta <= 0 or self.delta <= 0:
+            return False
+        rand = random.random() or 1e-12  # noqa: S311 — not security sensitive
+        return now - self.delta * beta * math.log(rand) >= self.expires_at
+
+
+async def compute_with_lock(
+    cache: Any,
+    name: str,
+    compute: Callable[[], Awaitable[Any]],
+    read: Callable[[], Awaitable[Any]],
+    lock_ttl: float,
+    poll_interval: float = 0.05,
+) -> Any:
+    """Coalesce a recompute across processes with a short Redis lock.
+
+    The process that wins the lock runs *compute*. Losers poll *read*
+    until the winner has published a value or the lock TTL elapses, then
+    fall back to computing themselves so a crashed holder cannot block
+    callers for longer than *lock_ttl*.
+    """
+    acquire = getattr(cache, "acquire_lock", None)
+    if acquire is None:
+        return await compute()
+
+    try:
+        token = await acquire(name, ttl_ms=int(lock_ttl * 1000))
+    except Exception as exc:
+        logger.debug("single_flight_lock_unavailable", key=name, error=str(exc))
+        return await compute()
+
+    if token:
+        try:
+            return await compute()
+        finally:
+            try:
+                await cache.release_lock(name, token)
+            except Exception as exc:
+                logger.debug("single_flight_lock_release_failed", key=name, error=str(exc))
+
+    deadline = time.monotonic() + lock_ttl
+    delay = poll_interval
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        value = await read()
+        if value is not None:
+            return value
+        delay = min(delay * 2, 0.5)
+    logger.debug("single_flight_lock_wait_timeout", key=name)
+    return await compute()
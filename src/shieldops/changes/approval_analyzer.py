@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ChangeApprovalAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_approval_hours = max_approval_hours
-        self._records: list[ApprovalRecord] = []
+        self._records: RecordStore[ApprovalRecord] = RecordStore(self._max_records)
         self._bottlenecks: list[ApprovalBottleneckDetail] = []
         logger.info(
             "approval_analyzer.initialized",
@@ -119,8 +121,6 @@ class ChangeApprovalAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "approval_analyzer.approval_recorded",
             record_id=record.id,
@@ -131,10 +131,7 @@ class ChangeApprovalAnalyzer:
         return record
 
     def get_approval(self, record_id: str) -> ApprovalRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_approvals(
         self,
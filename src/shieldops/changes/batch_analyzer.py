@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class ChangeBatchAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_batch_risk_score = max_batch_risk_score
-        self._records: list[BatchRecord] = []
+        self._records: RecordStore[BatchRecord] = RecordStore(self._max_records)
         self._conflicts: list[BatchConflict] = []
         logger.info(
             "batch_analyzer.initialized",
@@ -121,8 +123,6 @@ class ChangeBatchAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "batch_analyzer.batch_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class ChangeBatchAnalyzer:
         return record
 
     def get_batch(self, record_id: str) -> BatchRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_batches(
         self,
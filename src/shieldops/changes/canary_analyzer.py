@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeploymentCanaryAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._deviation_threshold_pct = deviation_threshold_pct
-        self._records: list[CanaryAnalysis] = []
+        self._records: RecordStore[CanaryAnalysis] = RecordStore(self._max_records)
         self._comparisons: list[CanaryComparison] = []
         logger.info(
             "canary_analyzer.initialized",
@@ -120,8 +122,6 @@ class DeploymentCanaryAnalyzer:
             traffic_pct=traffic_pct,
         )
         self._records.append(analysis)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "canary_analyzer.created",
             analysis_id=analysis.id,
@@ -131,10 +131,7 @@ class DeploymentCanaryAnalyzer:
         return analysis
 
     def get_analysis(self, analysis_id: str) -> CanaryAnalysis | None:
-        for a in self._records:
-            if a.id == analysis_id:
-                return a
-        return None
+        return self._records.get(analysis_id)
 
     def list_analyses(
         self,
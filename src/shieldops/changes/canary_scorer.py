@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class DeploymentCanaryScorer:
     ) -> None:
         self._max_records = max_records
         self._min_canary_score = min_canary_score
-        self._records: list[CanaryRecord] = []
+        self._records: RecordStore[CanaryRecord] = RecordStore(self._max_records)
         self._comparisons: list[MetricComparison] = []
         logger.info(
             "canary_scorer.initialized",
@@ -125,8 +127,6 @@ class DeploymentCanaryScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "canary_scorer.canary_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class DeploymentCanaryScorer:
         return record
 
     def get_canary(self, record_id: str) -> CanaryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_canaries(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeApprovalFlowTracker:
     ) -> None:
         self._max_records = max_records
         self._max_approval_time_hours = max_approval_time_hours
-        self._records: list[ApprovalRecord] = []
+        self._records: RecordStore[ApprovalRecord] = RecordStore(self._max_records)
         self._metrics: list[ApprovalMetric] = []
         logger.info(
             "change_approval_flow.initialized",
@@ -124,8 +126,6 @@ class ChangeApprovalFlowTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_approval_flow.approval_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeApprovalFlowTracker:
         return record
 
     def get_approval(self, record_id: str) -> ApprovalRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_approvals(
         self,
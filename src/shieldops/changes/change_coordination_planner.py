@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeCoordinationPlanner:
     ) -> None:
         self._max_records = max_records
         self._coordination_risk_threshold = coordination_risk_threshold
-        self._records: list[CoordinationRecord] = []
+        self._records: RecordStore[CoordinationRecord] = RecordStore(self._max_records)
         self._assessments: list[CoordinationAssessment] = []
         logger.info(
             "change_coordination_planner.initialized",
@@ -124,8 +126,6 @@ class ChangeCoordinationPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_coordination_planner.coordination_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeCoordinationPlanner:
         return record
 
     def get_coordination(self, record_id: str) -> CoordinationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coordinations(
         self,
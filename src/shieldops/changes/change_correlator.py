@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ChangeCorrelationEngine:
     ) -> None:
         self._max_records = max_records
         self._min_correlation_strength_pct = min_correlation_strength_pct
-        self._records: list[CorrelationRecord] = []
+        self._records: RecordStore[CorrelationRecord] = RecordStore(self._max_records)
         self._patterns: list[CorrelationPattern] = []
         logger.info(
             "change_correlator.initialized",
@@ -122,8 +124,6 @@ class ChangeCorrelationEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_correlator.correlation_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class ChangeCorrelationEngine:
         return record
 
     def get_correlation(self, record_id: str) -> CorrelationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_correlations(
         self,
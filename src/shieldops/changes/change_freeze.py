@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ChangeFreezeManager:
     ) -> None:
         self._max_records = max_records
         self._max_exception_rate_pct = max_exception_rate_pct
-        self._records: list[FreezeRecord] = []
+        self._records: RecordStore[FreezeRecord] = RecordStore(self._max_records)
         self._exceptions: list[FreezeException] = []
         logger.info(
             "change_freeze.initialized",
@@ -116,8 +118,6 @@ class ChangeFreezeManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_freeze.freeze_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ChangeFreezeManager:
         return record
 
     def get_freeze(self, record_id: str) -> FreezeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_freezes(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeImpactPredictor:
     ) -> None:
         self._max_records = max_records
         self._max_high_impact_pct = max_high_impact_pct
-        self._records: list[ImpactPredictionRecord] = []
+        self._records: RecordStore[ImpactPredictionRecord] = RecordStore(self._max_records)
         self._accuracy_checks: list[PredictionAccuracy] = []
         logger.info(
             "change_impact_predictor.initialized",
@@ -124,8 +126,6 @@ class ChangeImpactPredictor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_impact_predictor.prediction_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeImpactPredictor:
         return record
 
     def get_prediction(self, record_id: str) -> ImpactPredictionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeRiskClassifier:
     ) -> None:
         self._max_records = max_records
         self._max_high_risk_pct = max_high_risk_pct
-        self._records: list[RiskClassificationRecord] = []
+        self._records: RecordStore[RiskClassificationRecord] = RecordStore(self._max_records)
         self._assessments: list[RiskAssessment] = []
         logger.info(
             "change_risk_classifier.initialized",
@@ -124,8 +126,6 @@ class ChangeRiskClassifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_risk_classifier.classification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeRiskClassifier:
         return record
 
     def get_classification(self, record_id: str) -> RiskClassificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_classifications(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeRolloutPlanner:
     ) -> None:
         self._max_records = max_records
         self._risk_tolerance_threshold = risk_tolerance_threshold
-        self._records: list[RolloutRecord] = []
+        self._records: RecordStore[RolloutRecord] = RecordStore(self._max_records)
         self._assessments: list[RolloutAssessment] = []
         logger.info(
             "change_rollout_planner.initialized",
@@ -124,8 +126,6 @@ class ChangeRolloutPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_rollout_planner.rollout_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeRolloutPlanner:
         return record
 
     def get_rollout(self, record_id: str) -> RolloutRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rollouts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeVelocityTracker:
     ) -> None:
         self._max_records = max_records
         self._max_changes_per_day = max_changes_per_day
-        self._records: list[VelocityRecord] = []
+        self._records: RecordStore[VelocityRecord] = RecordStore(self._max_records)
         self._metrics: list[VelocityMetric] = []
         logger.info(
             "change_velocity.initialized",
@@ -124,8 +126,6 @@ class ChangeVelocityTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_velocity.velocity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeVelocityTracker:
         return record
 
     def get_velocity(self, record_id: str) -> VelocityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_velocities(
         self,
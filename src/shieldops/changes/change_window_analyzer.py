@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChangeWindowAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_pct = min_compliance_pct
-        self._records: list[WindowRecord] = []
+        self._records: RecordStore[WindowRecord] = RecordStore(self._max_records)
         self._metrics: list[WindowMetric] = []
         logger.info(
             "change_window_analyzer.initialized",
@@ -124,8 +126,6 @@ class ChangeWindowAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_window_analyzer.window_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ChangeWindowAnalyzer:
         return record
 
     def get_window(self, record_id: str) -> WindowRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_windows(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployCanaryAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate = min_success_rate
-        self._records: list[CanaryRecord] = []
+        self._records: RecordStore[CanaryRecord] = RecordStore(self._max_records)
         self._metrics: list[CanaryMetric] = []
         logger.info(
             "deploy_canary_analyzer.initialized",
@@ -124,8 +126,6 @@ class DeployCanaryAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_canary_analyzer.canary_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployCanaryAnalyzer:
         return record
 
     def get_canary(self, record_id: str) -> CanaryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_canaries(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployCanaryHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_unhealthy_pct = max_unhealthy_pct
-        self._records: list[CanaryHealthRecord] = []
+        self._records: RecordStore[CanaryHealthRecord] = RecordStore(self._max_records)
         self._comparisons: list[CanaryComparison] = []
         logger.info(
             "deploy_canary_health.initialized",
@@ -124,8 +126,6 @@ class DeployCanaryHealthMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_canary_health.canary_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployCanaryHealthMonitor:
         return record
 
     def get_canary(self, record_id: str) -> CanaryHealthRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_canaries(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployDependencyTracker:
     ) -> None:
         self._max_records = max_records
         self._max_wait_time_minutes = max_wait_time_minutes
-        self._records: list[DeployDependencyRecord] = []
+        self._records: RecordStore[DeployDependencyRecord] = RecordStore(self._max_records)
         self._chains: list[DependencyChain] = []
         logger.info(
             "deploy_dependency_tracker.initialized",
@@ -124,8 +126,6 @@ class DeployDependencyTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_dependency_tracker.dependency_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployDependencyTracker:
         return record
 
     def get_dependency(self, record_id: str) -> DeployDependencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dependencies(
         self,
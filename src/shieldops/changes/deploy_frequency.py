@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class DeploymentFrequencyAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_deploy_per_week = min_deploy_per_week
-        self._records: list[FrequencyRecord] = []
+        self._records: RecordStore[FrequencyRecord] = RecordStore(self._max_records)
         self._metrics: list[FrequencyMetric] = []
         logger.info(
             "deploy_frequency.initialized",
@@ -128,8 +130,6 @@ class DeploymentFrequencyAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_frequency.recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class DeploymentFrequencyAnalyzer:
         return record
 
     def get_frequency(self, record_id: str) -> FrequencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_frequencies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployGateTracker:
     ) -> None:
         self._max_records = max_records
         self._max_gate_failure_pct = max_gate_failure_pct
-        self._records: list[GateRecord] = []
+        self._records: RecordStore[GateRecord] = RecordStore(self._max_records)
         self._metrics: list[GateMetric] = []
         logger.info(
             "deploy_gate.initialized",
@@ -124,8 +126,6 @@ class DeployGateTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_gate.gate_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployGateTracker:
         return record
 
     def get_gate(self, record_id: str) -> GateRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gates(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployRollbackHealthTracker:
     ) -> None:
         self._max_records = max_records
         self._max_recovery_time_seconds = max_recovery_time_seconds
-        self._records: list[RollbackHealthRecord] = []
+        self._records: RecordStore[RollbackHealthRecord] = RecordStore(self._max_records)
         self._metrics: list[RollbackMetric] = []
         logger.info(
             "deploy_rollback_health.initialized",
@@ -124,8 +126,6 @@ class DeployRollbackHealthTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_rollback_health.rollback_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployRollbackHealthTracker:
         return record
 
     def get_rollback(self, record_id: str) -> RollbackHealthRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rollbacks(
         self,
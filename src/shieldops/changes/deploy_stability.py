@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeploymentStabilityTracker:
     ) -> None:
         self._max_records = max_records
         self._min_stability_score = min_stability_score
-        self._records: list[StabilityRecord] = []
+        self._records: RecordStore[StabilityRecord] = RecordStore(self._max_records)
         self._measurements: list[StabilityMeasurement] = []
         logger.info(
             "deploy_stability.initialized",
@@ -124,8 +126,6 @@ class DeploymentStabilityTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_stability.stability_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeploymentStabilityTracker:
         return record
 
     def get_stability(self, record_id: str) -> StabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_stabilities(
         self,
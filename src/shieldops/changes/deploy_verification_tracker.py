@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeployVerificationTracker:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[VerificationRecord] = []
+        self._records: RecordStore[VerificationRecord] = RecordStore(self._max_records)
         self._metrics: list[VerificationMetric] = []
         logger.info(
             "deploy_verification_tracker.initialized",
@@ -124,8 +126,6 @@ class DeployVerificationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deploy_verification_tracker.verification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeployVerificationTracker:
         return record
 
     def get_verification(self, record_id: str) -> VerificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_verifications(
         self,
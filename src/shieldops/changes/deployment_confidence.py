@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentConfidenceScorer:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_score = min_confidence_score
-        self._records: list[ConfidenceAssessment] = []
+        self._records: RecordStore[ConfidenceAssessment] = RecordStore(self._max_records)
         self._factors: list[ConfidenceFactorRecord] = []
         logger.info(
             "deployment_confidence.initialized",
@@ -148,10 +150,7 @@ class DeploymentConfidenceScorer:
         return record
 
     def get_assessment(self, record_id: str) -> ConfidenceAssessment | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
@@ -193,8 +192,6 @@ class DeploymentConfidenceScorer:
                 decision=decision,
             )
         self._records.append(assessment)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment_confidence.assessed",
             deployment_id=deployment_id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentDependencyTracker:
     ) -> None:
         self._max_records = max_records
         self._max_depth = max_depth
-        self._records: list[DeployDependencyRecord] = []
+        self._records: RecordStore[DeployDependencyRecord] = RecordStore(self._max_records)
         self._constraints: list[DependencyConstraint] = []
         logger.info(
             "deployment_dependency.initialized",
@@ -116,8 +118,6 @@ class DeploymentDependencyTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment_dependency.dependency_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class DeploymentDependencyTracker:
         return record
 
     def get_dependency(self, record_id: str) -> DeployDependencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dependencies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_impact_score = max_impact_score
-        self._records: list[ImpactRecord] = []
+        self._records: RecordStore[ImpactRecord] = RecordStore(self._max_records)
         self._policies: list[ImpactRule] = []
         logger.info(
             "deployment_impact.initialized",
@@ -116,8 +118,6 @@ class DeploymentImpactAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment_impact.impact_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DeploymentImpactAnalyzer:
         return record
 
     def get_impact(self, record_id: str) -> ImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -107,7 +109,7 @@ class DeploymentIntelligenceEngine:
     ) -> None:
         self._max_records = max_records
         self._success_threshold = success_threshold
-        self._records: list[DeploymentIntelligenceRecord] = []
+        self._records: RecordStore[DeploymentIntelligenceRecord] = RecordStore(self._max_records)
         self._analyses: list[DeploymentIntelligenceAnalysis] = []
         logger.info(
             "deployment.intelligence.engine.initialized",
@@ -151,8 +153,6 @@ class DeploymentIntelligenceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment.intelligence.engine.item_recorded",
             record_id=record.id,
@@ -163,10 +163,7 @@ class DeploymentIntelligenceEngine:
         return record
 
     def get_record(self, record_id: str) -> DeploymentIntelligenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -70,7 +72,7 @@ class DeploymentRiskPredictor:
     ) -> None:
         self._max_records = max_records
         self._max_assessments = max_assessments
-        self._records: list[DeploymentRecord] = []
+        self._records: RecordStore[DeploymentRecord] = RecordStore(self._max_records)
         self._assessments: dict[str, RiskAssessment] = {}
         logger.info(
             "deployment_risk_predictor.initialized",
@@ -87,8 +89,6 @@ class DeploymentRiskPredictor:
         """Record a deployment outcome."""
         rec = DeploymentRecord(service=service, version=version, **kw)
         self._records.append(rec)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deployment_risk_predictor.deployment_recorded",
             record_id=rec.id,
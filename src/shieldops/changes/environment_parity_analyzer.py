@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EnvironmentParityAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EnvironmentParityRecord] = []
+        self._records: RecordStore[EnvironmentParityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EnvironmentParityAnalysis] = {}
         logger.info(
             "environment_parity_analyzer.init",
@@ -117,8 +119,6 @@ class EnvironmentParityAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "environment_parity.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EnvironmentParityAnalyzer:
         return record
 
     def process(self, key: str) -> EnvironmentParityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         dims = sum(1 for r in self._records if r.env_id == rec.env_id)
@@ -205,7 +201,7 @@ class EnvironmentParityAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("environment_parity_analyzer.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EventContractTestingEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ContractTestRecord] = []
+        self._records: RecordStore[ContractTestRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ContractTestAnalysis] = {}
         logger.info(
             "event_contract_testing_engine.init",
@@ -117,8 +119,6 @@ class EventContractTestingEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "contract_testing.item_recorded",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EventContractTestingEngine:
         return record
 
     def process(self, key: str) -> ContractTestAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         compliance = round(rec.coverage_pct, 2)
@@ -204,7 +200,7 @@ class EventContractTestingEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("event_contract_testing_engine.cleared")
         return {"status": "cleared"}
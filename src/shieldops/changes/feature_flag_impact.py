@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class FeatureFlagImpactTracker:
     ) -> None:
         self._max_records = max_records
         self._max_negative_impact_pct = max_negative_impact_pct
-        self._records: list[FlagImpactRecord] = []
+        self._records: RecordStore[FlagImpactRecord] = RecordStore(self._max_records)
         self._measurements: list[ImpactMeasurement] = []
         logger.info(
             "feature_flag_impact.initialized",
@@ -124,8 +126,6 @@ class FeatureFlagImpactTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "feature_flag_impact.impact_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class FeatureFlagImpactTracker:
         return record
 
     def get_impact(self, record_id: str) -> FlagImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
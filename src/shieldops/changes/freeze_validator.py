@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class ChangeFreezeValidator:
     ) -> None:
         self._max_records = max_records
         self._max_violation_rate_pct = max_violation_rate_pct
-        self._records: list[FreezeRecord] = []
+        self._records: RecordStore[FreezeRecord] = RecordStore(self._max_records)
         self._violations: list[FreezeViolationRecord] = []
         logger.info(
             "freeze_validator.initialized",
@@ -125,8 +127,6 @@ class ChangeFreezeValidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "freeze_validator.freeze_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class ChangeFreezeValidator:
         return record
 
     def get_freeze(self, record_id: str) -> FreezeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_freezes(
         self,
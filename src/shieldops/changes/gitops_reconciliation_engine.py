@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -105,7 +107,7 @@ class GitOpsReconciliationEngine:
     ) -> None:
         self._max_records = max_records
         self._drift_threshold = drift_threshold
-        self._records: list[ReconciliationRecord] = []
+        self._records: RecordStore[ReconciliationRecord] = RecordStore(self._max_records)
         self._analyses: list[ReconciliationAnalysis] = []
         logger.info(
             "gitops.reconciliation.engine.initialized",
@@ -149,8 +151,6 @@ class GitOpsReconciliationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "gitops.reconciliation.engine.item_recorded",
             record_id=record.id,
@@ -161,10 +161,7 @@ class GitOpsReconciliationEngine:
         return record
 
     def get_record(self, record_id: str) -> ReconciliationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -115,7 +117,7 @@ class IacValidationEngine:
     ) -> None:
         self._max_records = max_records
         self._violation_threshold = violation_threshold
-        self._records: list[IacValidationRecord] = []
+        self._records: RecordStore[IacValidationRecord] = RecordStore(self._max_records)
         self._analyses: list[IacValidationAnalysis] = []
         logger.info(
             "iac.validation.engine.initialized",
@@ -157,8 +159,6 @@ class IacValidationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "iac.validation.engine.item_recorded",
             record_id=record.id,
@@ -169,10 +169,7 @@ class IacValidationEngine:
         return record
 
     def get_record(self, record_id: str) -> IacValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentImpactPredictor:
     ) -> None:
         self._max_records = max_records
         self._max_impact_score = max_impact_score
-        self._records: list[ImpactPredictionRecord] = []
+        self._records: RecordStore[ImpactPredictionRecord] = RecordStore(self._max_records)
         self._details: list[ImpactDetail] = []
         logger.info(
             "impact_predictor.initialized",
@@ -116,8 +118,6 @@ class DeploymentImpactPredictor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "impact_predictor.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DeploymentImpactPredictor:
         return record
 
     def get_prediction(self, record_id: str) -> ImpactPredictionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class InfrastructureChangeRiskScorer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ChangeRiskRecord] = []
+        self._records: RecordStore[ChangeRiskRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ChangeRiskAnalysis] = {}
         logger.info(
             "infrastructure_change_risk_scorer.init",
@@ -117,8 +119,6 @@ class InfrastructureChangeRiskScorer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "change_risk.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class InfrastructureChangeRiskScorer:
         return record
 
     def process(self, key: str) -> ChangeRiskAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_high = rec.risk_score >= 70.0
@@ -189,7 +185,7 @@ class InfrastructureChangeRiskScorer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("infrastructure_change_risk_scorer.cleared")
         return {"status": "cleared"}
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -111,7 +113,7 @@ class InfrastructureDriftIntelligenceV2:
     ) -> None:
         self._max_records = max_records
         self._drift_threshold = drift_threshold
-        self._records: list[InfrastructureDriftRecord] = []
+        self._records: RecordStore[InfrastructureDriftRecord] = RecordStore(self._max_records)
         self._analyses: list[InfrastructureDriftAnalysis] = []
         logger.info(
             "infrastructure.drift.intelligence.v2.initialized",
@@ -153,8 +155,6 @@ class InfrastructureDriftIntelligenceV2:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "infrastructure.drift.intelligence.v2.item_recorded",
             record_id=record.id,
@@ -165,10 +165,7 @@ class InfrastructureDriftIntelligenceV2:
         return record
 
     def get_record(self, record_id: str) -> InfrastructureDriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ChangeLeadTimeAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_lead_time_hours = max_lead_time_hours
-        self._records: list[LeadTimeRecord] = []
+        self._records: RecordStore[LeadTimeRecord] = RecordStore(self._max_records)
         self._breakdowns: list[PhaseBreakdown] = []
         logger.info(
             "lead_time_analyzer.initialized",
@@ -113,8 +115,6 @@ class ChangeLeadTimeAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "lead_time_analyzer.recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class ChangeLeadTimeAnalyzer:
         return record
 
     def get_lead_time(self, record_id: str) -> LeadTimeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_lead_times(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MergeRiskAssessor:
     ) -> None:
         self._max_records = max_records
         self._max_risk_score = max_risk_score
-        self._records: list[MergeRiskRecord] = []
+        self._records: RecordStore[MergeRiskRecord] = RecordStore(self._max_records)
         self._assessments: list[RiskAssessment] = []
         logger.info(
             "merge_risk.initialized",
@@ -124,8 +126,6 @@ class MergeRiskAssessor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "merge_risk.merge_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MergeRiskAssessor:
         return record
 
     def get_merge(self, record_id: str) -> MergeRiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_merges(
         self,
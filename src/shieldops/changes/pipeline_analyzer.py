@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentPipelineAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_duration_minutes = max_duration_minutes
-        self._records: list[PipelineRecord] = []
+        self._records: RecordStore[PipelineRecord] = RecordStore(self._max_records)
         self._metrics: list[StageMetric] = []
         logger.info(
             "pipeline_analyzer.initialized",
@@ -116,8 +118,6 @@ class DeploymentPipelineAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "pipeline_analyzer.pipeline_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DeploymentPipelineAnalyzer:
         return record
 
     def get_pipeline(self, record_id: str) -> PipelineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_pipelines(
         self,
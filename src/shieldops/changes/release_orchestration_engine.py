@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -107,7 +109,7 @@ class ReleaseOrchestrationEngine:
     ) -> None:
         self._max_records = max_records
         self._error_rate_threshold = error_rate_threshold
-        self._records: list[ReleaseOrchestrationRecord] = []
+        self._records: RecordStore[ReleaseOrchestrationRecord] = RecordStore(self._max_records)
         self._analyses: list[ReleaseOrchestrationAnalysis] = []
         logger.info(
             "release.orchestration.engine.initialized",
@@ -149,8 +151,6 @@ class ReleaseOrchestrationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "release.orchestration.engine.item_recorded",
             record_id=record.id,
@@ -161,10 +161,7 @@ class ReleaseOrchestrationEngine:
         return record
 
     def get_record(self, record_id: str) -> ReleaseOrchestrationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
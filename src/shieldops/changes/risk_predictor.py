@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ChangeRiskPredictor:
     ) -> None:
         self._max_records = max_records
         self._max_risk_threshold = max_risk_threshold
-        self._records: list[RiskPredictionRecord] = []
+        self._records: RecordStore[RiskPredictionRecord] = RecordStore(self._max_records)
         self._factors: list[RiskFactorDetail] = []
         logger.info(
             "risk_predictor.initialized",
@@ -116,8 +118,6 @@ class ChangeRiskPredictor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_predictor.prediction_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class ChangeRiskPredictor:
         return record
 
     def get_prediction(self, record_id: str) -> RiskPredictionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
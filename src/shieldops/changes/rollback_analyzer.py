@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeploymentRollbackAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_rate_pct = max_rate_pct
-        self._records: list[RollbackRecord] = []
+        self._records: RecordStore[RollbackRecord] = RecordStore(self._max_records)
         self._patterns: list[RollbackPattern] = []
         logger.info(
             "rollback_analyzer.initialized",
@@ -116,8 +118,6 @@ class DeploymentRollbackAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "rollback_analyzer.rollback_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DeploymentRollbackAnalyzer:
         return record
 
     def get_rollback(self, record_id: str) -> RollbackRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rollbacks(
         self,
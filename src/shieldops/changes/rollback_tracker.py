@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DeploymentRollbackTracker:
     ) -> None:
         self._max_records = max_records
         self._max_rollback_rate_pct = max_rollback_rate_pct
-        self._records: list[RollbackRecord] = []
+        self._records: RecordStore[RollbackRecord] = RecordStore(self._max_records)
         self._patterns: list[RollbackPattern] = []
         logger.info(
             "rollback_tracker.initialized",
@@ -120,8 +122,6 @@ class DeploymentRollbackTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "rollback_tracker.rollback_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class DeploymentRollbackTracker:
         return record
 
     def get_rollback(self, record_id: str) -> RollbackRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rollbacks(
         self,
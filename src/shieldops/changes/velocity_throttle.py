@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ChangeVelocityThrottle:
     ) -> None:
         self._max_records = max_records
         self._max_changes_per_hour = max_changes_per_hour
-        self._records: list[ChangeVelocityRecord] = []
+        self._records: RecordStore[ChangeVelocityRecord] = RecordStore(self._max_records)
         self._policies: list[ThrottlePolicy] = []
         logger.info(
             "velocity_throttle.initialized",
@@ -195,8 +197,6 @@ class ChangeVelocityThrottle:
             velocity_per_hour=float(velocity),
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "velocity_throttle.change_evaluated",
             record_id=record.id,
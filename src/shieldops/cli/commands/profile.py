@@ -0,0 +1,115 @@
+"""Startup profiling command -- shieldops startup-profile."""
+# mypy: disable-error-code="misc,untyped-decorator"
+
+from __future__ import annotations
+
+import importlib
+import time
+from typing import Any
+
+import click
+
+from shieldops.cli.http import api_request
+from shieldops.cli.output import print_json, print_table
+
+
+def _mib(num_bytes: int | None) -> str:
+    if num_bytes is None:
+        return "-"
+    return f"{num_bytes / (1024 * 1024):.1f}"
+
+
+def _local_profile(materialize: bool, include_disabled: bool) -> dict[str, Any]:
+    """Import the API app in-process and optionally build every engine."""
+    from shieldops.api.engine_registry import current_rss_bytes
+
+    rss_start = current_rss_bytes()
+    start = time.perf_counter()
+    importlib.import_module("shieldops.api.app")
+    app_import_ms = (time.perf_counter() - start) * 1000
+    rss_after_import = current_rss_bytes()
+
+    from shieldops.api.engine_registry import create_engine_registry
+
+    registry = create_engine_registry()
+    if materialize:
+        registry.materialize_all(include_disabled=include_disabled)
+
+    profile = registry.profile()
+    profile["app_import_ms"] = round(app_import_ms, 1)
+    profile["app_import_rss_delta_bytes"] = rss_after_import - rss_start
+    return profile
+
+
+@click.command("startup-profile")
+@click.option(
+    "--remote",
+    is_flag=True,
+    help="Fetch the profile from the running API instead of profiling locally.",
+)
+@click.option(
+    "--materialize/--no-materialize",
+    default=True,
+    help="Build every enabled engine to measure the full eager startup cost.",
+)
+@click.option("--include-disabled", is_flag=True, help="Also build feature-flagged engines.")
+@click.option("--top", default=25, type=int, help="Number of slowest engines to show.")
+@click.pass_context
+def startup_profile(
+    ctx: click.Context,
+    remote: bool,
+    materialize: bool,
+    include_disabled: bool,
+    top: int,
+) -> None:
+    """Report import time and RSS per engine."""
+    output_format: str = ctx.obj.get("format", "table")
+
+    if remote:
+        data = api_request(ctx, "GET", "/startup-profile", params={"limit": top})
+        if data is None:
+            ctx.exit(1)
+            return
+    else:
+        data = _local_profile(materialize, include_disabled)
+
+    if not isinstance(data, dict):
+        click.echo("Unexpected response from API.")
+        ctx.exit(1)
+        return
+
+    engines: list[dict[str, Any]] = sorted(
+        data.get("engines", []),
+        key=lambda e: e.get("import_ms", 0) + e.get("init_ms", 0),
+        reverse=True,
+    )[:top]
+
+    if output_format == "json":
+        print_json({**data, "engines": engines})
+        return
+
+    click.echo("Startup Profile")
+    click.echo("=" * 40)
+    if "app_import_ms" in data:
+        click.echo(f"  App import:      {data['app_import_ms']} ms")
+        click.echo(f"  App import RSS:  {_mib(data.get('app_import_rss_delta_bytes'))} MiB")
+    if data.get("startup_ms") is not None:
+        click.echo(f"  Lifespan startup: {data['startup_ms']} ms")
+    click.echo(f"  Engines:         {data.get('total_engines', 0)} {data.get('by_state', {})}")
+    click.echo(f"  Engine import:   {data.get('total_import_ms', 0)} ms")
+    click.echo(f"  Engine init:     {data.get('total_init_ms', 0)} ms")
+    click.echo(f"  Engine RSS:      {_mib(data.get('total_rss_delta_bytes'))} MiB")
+    click.echo(f"  Process RSS:     {_mib(data.get('process_rss_bytes'))} MiB")
+    click.echo()
+
+    rows = [
+        [
+            e.get("name", ""),
+            e.get("state", ""),
+            f"{e.get('import_ms', 0):.1f}",
+            f"{e.get('init_ms', 0):.1f}",
+            f"{e.get('rss_delta_bytes', 0) / 1024:.0f}",
+        ]
+        for e in engines
+    ]
+    print_table(["Engine", "State", "Import ms", "Init ms", "RSS KiB"], rows)
@@ -7,6 +7,7 @@ import click
 
 from shieldops.cli.commands.agents import agents
 from shieldops.cli.commands.investigate import investigate
+from shieldops.cli.commands.profile import startup_profile
 from shieldops.cli.commands.remediate import remediate
 from shieldops.cli.commands.scan import scan
 from shieldops.cli.commands.status import status
@@ -56,6 +57,7 @@ cli.add_command(scan)
 
 
 # -- Local-only commands (no API required) --
+cli.add_command(startup_profile)
 
 
 @cli.command()
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AuditEvidenceMapper:
     ) -> None:
         self._max_records = max_records
         self._min_mapping_coverage_pct = min_mapping_coverage_pct
-        self._records: list[EvidenceMappingRecord] = []
+        self._records: RecordStore[EvidenceMappingRecord] = RecordStore(self._max_records)
         self._gaps: list[MappingGap] = []
         logger.info(
             "audit_evidence_mapper.initialized",
@@ -124,8 +126,6 @@ class AuditEvidenceMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "audit_evidence_mapper.mapping_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AuditEvidenceMapper:
         return record
 
     def get_mapping(self, record_id: str) -> EvidenceMappingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ComplianceAutomationScorer:
     ) -> None:
         self._max_records = max_records
         self._min_automation_pct = min_automation_pct
-        self._records: list[AutomationScoreRecord] = []
+        self._records: RecordStore[AutomationScoreRecord] = RecordStore(self._max_records)
         self._controls: list[AutomationControl] = []
         logger.info(
             "automation_scorer.initialized",
@@ -116,8 +118,6 @@ class ComplianceAutomationScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automation_scorer.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class ComplianceAutomationScorer:
         return record
 
     def get_score(self, record_id: str) -> AutomationScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scores(
         self,
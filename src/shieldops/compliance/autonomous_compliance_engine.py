@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AutonomousComplianceEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ComplianceRecord] = []
+        self._records: RecordStore[ComplianceRecord] = RecordStore(self._max_records)
         self._analyses: list[ComplianceAnalysis] = []
         logger.info(
             "autonomous_compliance_engine.initialized",
@@ -121,8 +123,6 @@ class AutonomousComplianceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "autonomous_compliance_engine.record_added",
             record_id=record.id,
@@ -131,10 +131,7 @@ class AutonomousComplianceEngine:
         return record
 
     def get_record(self, record_id: str) -> ComplianceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
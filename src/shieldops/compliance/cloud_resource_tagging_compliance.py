@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CloudResourceTaggingCompliance:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TagComplianceRecord] = []
+        self._records: RecordStore[TagComplianceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TagComplianceAnalysis] = {}
         logger.info(
             "cloud_resource_tagging_compliance.init",
@@ -120,8 +122,6 @@ class CloudResourceTaggingCompliance:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "tag_compliance.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class CloudResourceTaggingCompliance:
         return record
 
     def process(self, key: str) -> TagComplianceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         score = (
@@ -206,7 +202,7 @@ class CloudResourceTaggingCompliance:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cloud_resource_tagging_compliance.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ComplianceAutomationGapAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AutomationGapRecord] = []
+        self._records: RecordStore[AutomationGapRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AutomationGapAnalysis] = {}
         logger.info(
             "compliance_automation_gap_analyzer.init",
@@ -117,8 +119,6 @@ class ComplianceAutomationGapAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_automation_gap.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class ComplianceAutomationGapAnalyzer:
         return record
 
     def process(self, key: str) -> AutomationGapAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_bottleneck = rec.automation_level == AutomationLevel.MANUAL and rec.manual_hours > 10
@@ -192,7 +188,7 @@ class ComplianceAutomationGapAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("compliance_automation_gap_analyzer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ComplianceEvidenceAutomatorV2:
     ) -> None:
         self._max_records = max_records
         self._completeness_threshold = completeness_threshold
-        self._records: list[EvidenceRecord] = []
+        self._records: RecordStore[EvidenceRecord] = RecordStore(self._max_records)
         self._analyses: list[EvidenceAnalysis] = []
         logger.info(
             "compliance_evidence_automator_v2.initialized",
@@ -122,8 +124,6 @@ class ComplianceEvidenceAutomatorV2:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_evidence_automator_v2.evidence_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class ComplianceEvidenceAutomatorV2:
         return record
 
     def get_evidence(self, record_id: str) -> EvidenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_evidence(
         self,
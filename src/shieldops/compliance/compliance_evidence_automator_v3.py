@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ComplianceEvidenceAutomatorV3:
     ) -> None:
         self._max_records = max_records
         self._evidence_threshold = evidence_threshold
-        self._records: list[EvidenceRecord] = []
+        self._records: RecordStore[EvidenceRecord] = RecordStore(self._max_records)
         self._analyses: list[EvidenceAnalysis] = []
         logger.info(
             "compliance_evidence_automator_v3.initialized",
@@ -124,8 +126,6 @@ class ComplianceEvidenceAutomatorV3:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_evidence_automator_v3.evidence_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ComplianceEvidenceAutomatorV3:
         return record
 
     def get_evidence(self, record_id: str) -> EvidenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_evidences(
         self,
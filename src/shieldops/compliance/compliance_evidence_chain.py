@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ComplianceEvidenceChainTracker:
     ) -> None:
         self._max_records = max_records
         self._max_broken_chain_pct = max_broken_chain_pct
-        self._records: list[EvidenceChainRecord] = []
+        self._records: RecordStore[EvidenceChainRecord] = RecordStore(self._max_records)
         self._validations: list[ChainValidation] = []
         logger.info(
             "compliance_evidence_chain.initialized",
@@ -124,8 +126,6 @@ class ComplianceEvidenceChainTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_evidence_chain.chain_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ComplianceEvidenceChainTracker:
         return record
 
     def get_chain(self, record_id: str) -> EvidenceChainRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_chains(
         self,
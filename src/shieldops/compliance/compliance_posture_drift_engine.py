@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CompliancePostureDriftEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[PostureDriftRecord] = []
+        self._records: RecordStore[PostureDriftRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, PostureDriftAnalysis] = {}
         logger.info(
             "compliance_posture_drift_engine.init",
@@ -117,8 +119,6 @@ class CompliancePostureDriftEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_posture_drift.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class CompliancePostureDriftEngine:
         return record
 
     def process(self, key: str) -> PostureDriftAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         drift_vals = [r.drift_score for r in self._records if r.domain_id == rec.domain_id]
@@ -196,7 +192,7 @@ class CompliancePostureDriftEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("compliance_posture_drift_engine.cleared")
         return {"status": "cleared"}
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class ContinuousAuditEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AuditRecord] = []
+        self._records: RecordStore[AuditRecord] = RecordStore(self._max_records)
         self._analyses: list[AuditAnalysis] = []
         logger.info(
             "continuous_audit_engine.initialized",
@@ -134,8 +136,6 @@ class ContinuousAuditEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "continuous_audit_engine.record_added",
             record_id=record.id,
@@ -145,10 +145,7 @@ class ContinuousAuditEngine:
         return record
 
     def get_record(self, record_id: str) -> AuditRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
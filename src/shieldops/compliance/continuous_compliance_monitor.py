@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ContinuousComplianceMonitor:
     ) -> None:
         self._max_records = max_records
         self._compliance_drift_threshold = compliance_drift_threshold
-        self._records: list[ComplianceMonitorRecord] = []
+        self._records: RecordStore[ComplianceMonitorRecord] = RecordStore(self._max_records)
         self._analyses: list[ComplianceMonitorAnalysis] = []
         logger.info(
             "continuous_compliance_monitor.initialized",
@@ -124,8 +126,6 @@ class ContinuousComplianceMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "continuous_compliance_monitor.control_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ContinuousComplianceMonitor:
         return record
 
     def get_control(self, record_id: str) -> ComplianceMonitorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_controls(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ContinuousEvidenceFreshnessEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EvidenceFreshnessRecord] = []
+        self._records: RecordStore[EvidenceFreshnessRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EvidenceFreshnessAnalysis] = {}
         logger.info(
             "continuous_evidence_freshness_engine.init",
@@ -117,8 +119,6 @@ class ContinuousEvidenceFreshnessEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "continuous_evidence_freshness.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class ContinuousEvidenceFreshnessEngine:
         return record
 
     def process(self, key: str) -> EvidenceFreshnessAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_stale = rec.freshness_status in (
@@ -199,7 +195,7 @@ class ContinuousEvidenceFreshnessEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("continuous_evidence_freshness_engine.cleared")
         return {"status": "cleared"}
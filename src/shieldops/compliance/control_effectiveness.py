@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ControlEffectivenessTracker:
     ) -> None:
         self._max_records = max_records
         self._min_effectiveness_pct = min_effectiveness_pct
-        self._records: list[ControlRecord] = []
+        self._records: RecordStore[ControlRecord] = RecordStore(self._max_records)
         self._tests: list[EffectivenessTest] = []
         logger.info(
             "control_effectiveness.initialized",
@@ -120,8 +122,6 @@ class ControlEffectivenessTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "control_effectiveness.control_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ControlEffectivenessTracker:
         return record
 
     def get_control(self, record_id: str) -> ControlRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_controls(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ControlEffectivenessScorer:
     ) -> None:
         self._max_records = max_records
         self._control_effectiveness_threshold = control_effectiveness_threshold
-        self._records: list[ControlRecord] = []
+        self._records: RecordStore[ControlRecord] = RecordStore(self._max_records)
         self._analyses: list[ControlAnalysis] = []
         logger.info(
             "control_effectiveness_scorer.initialized",
@@ -124,8 +126,6 @@ class ControlEffectivenessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "control_effectiveness_scorer.control_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ControlEffectivenessScorer:
         return record
 
     def get_control(self, record_id: str) -> ControlRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_controls(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ComplianceControlTester:
     ) -> None:
         self._max_records = max_records
         self._min_pass_rate_pct = min_pass_rate_pct
-        self._records: list[ControlTestRecord] = []
+        self._records: RecordStore[ControlTestRecord] = RecordStore(self._max_records)
         self._evidence: list[ControlTestEvidence] = []
         logger.info(
             "control_tester.initialized",
@@ -122,8 +124,6 @@ class ComplianceControlTester:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "control_tester.recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class ComplianceControlTester:
         return record
 
     def get_test(self, record_id: str) -> ControlTestRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_tests(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CostGovernancePolicyEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[GovernanceRecord] = []
+        self._records: RecordStore[GovernanceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, GovernanceAnalysis] = {}
         logger.info(
             "cost_governance_policy.init",
@@ -116,8 +118,6 @@ class CostGovernancePolicyEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cost_governance.record_added",
             record_id=record.id,
@@ -126,11 +126,7 @@ class CostGovernancePolicyEngine:
         return record
 
     def process(self, key: str) -> GovernanceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         util = 0.0
@@ -196,7 +192,7 @@ class CostGovernancePolicyEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cost_governance_policy.cleared")
         return {"status": "cleared"}
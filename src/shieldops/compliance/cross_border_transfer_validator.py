@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CrossBorderTransferValidator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[TransferRecord] = []
+        self._records: RecordStore[TransferRecord] = RecordStore(self._max_records)
         self._analyses: list[TransferAnalysis] = []
         logger.info(
             "cross_border_transfer_validator.initialized",
@@ -124,8 +126,6 @@ class CrossBorderTransferValidator:
             data_owner=data_owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_border_transfer_validator.transfer_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CrossBorderTransferValidator:
         return record
 
     def get_transfer(self, record_id: str) -> TransferRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_transfers(
         self,
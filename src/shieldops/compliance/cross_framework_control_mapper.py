@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CrossFrameworkControlMapper:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ControlMappingRecord] = []
+        self._records: RecordStore[ControlMappingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ControlMappingAnalysis] = {}
         logger.info(
             "cross_framework_control_mapper.init",
@@ -117,8 +119,6 @@ class CrossFrameworkControlMapper:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_framework_control_mapper.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class CrossFrameworkControlMapper:
         return record
 
     def process(self, key: str) -> ControlMappingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         mappings = sum(1 for r in self._records if r.control_id == rec.control_id)
@@ -190,7 +186,7 @@ class CrossFrameworkControlMapper:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cross_framework_control_mapper.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CyberInsuranceRiskAssessor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CyberInsuranceRecord] = []
+        self._records: RecordStore[CyberInsuranceRecord] = RecordStore(self._max_records)
         self._analyses: list[CyberInsuranceAnalysis] = []
         logger.info(
             "cyber_insurance_risk_assessor.initialized",
@@ -124,8 +126,6 @@ class CyberInsuranceRiskAssessor:
             team=team,
         )
         self._records.append(rec)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cyber_insurance_risk_assessor.recorded",
             record_id=rec.id,
@@ -134,10 +134,7 @@ class CyberInsuranceRiskAssessor:
         return rec
 
     def get_record(self, record_id: str) -> CyberInsuranceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataPrivacyImpactAssessor:
     ) -> None:
         self._max_records = max_records
         self._privacy_impact_threshold = privacy_impact_threshold
-        self._records: list[PrivacyRecord] = []
+        self._records: RecordStore[PrivacyRecord] = RecordStore(self._max_records)
         self._analyses: list[PrivacyAnalysis] = []
         logger.info(
             "data_privacy_impact_assessor.initialized",
@@ -124,8 +126,6 @@ class DataPrivacyImpactAssessor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_privacy_impact_assessor.assessment_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataPrivacyImpactAssessor:
         return record
 
     def get_assessment(self, record_id: str) -> PrivacyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
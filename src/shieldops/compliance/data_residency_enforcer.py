@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataResidencyEnforcer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ResidencyRecord] = []
+        self._records: RecordStore[ResidencyRecord] = RecordStore(self._max_records)
         self._analyses: list[ResidencyAnalysis] = []
         logger.info(
             "data_residency_enforcer.initialized",
@@ -124,8 +126,6 @@ class DataResidencyEnforcer:
             data_owner=data_owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_residency_enforcer.residency_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataResidencyEnforcer:
         return record
 
     def get_residency(self, record_id: str) -> ResidencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_residencies(
         self,
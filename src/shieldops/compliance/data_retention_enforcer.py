@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataRetentionEnforcer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[RetentionRecord] = []
+        self._records: RecordStore[RetentionRecord] = RecordStore(self._max_records)
         self._analyses: list[RetentionAnalysis] = []
         logger.info(
             "data_retention_enforcer.initialized",
@@ -124,8 +126,6 @@ class DataRetentionEnforcer:
             data_owner=data_owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_retention_enforcer.retention_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataRetentionEnforcer:
         return record
 
     def get_retention(self, record_id: str) -> RetentionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_retentions(
         self,
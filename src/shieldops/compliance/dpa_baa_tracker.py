@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DPABAATracker:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AgreementRecord] = []
+        self._records: RecordStore[AgreementRecord] = RecordStore(self._max_records)
         self._analyses: list[AgreementAnalysis] = []
         logger.info(
             "dpa_baa_tracker.initialized",
@@ -124,8 +126,6 @@ class DPABAATracker:
             business_unit=business_unit,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dpa_baa_tracker.agreement_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DPABAATracker:
         return record
 
     def get_agreement(self, record_id: str) -> AgreementRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_agreements(
         self,
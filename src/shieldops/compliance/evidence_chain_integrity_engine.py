@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EvidenceChainIntegrityEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EvidenceChainRecord] = []
+        self._records: RecordStore[EvidenceChainRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EvidenceChainAnalysis] = {}
         logger.info(
             "evidence_chain_integrity_engine.init",
@@ -117,8 +119,6 @@ class EvidenceChainIntegrityEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evidence_chain_integrity.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EvidenceChainIntegrityEngine:
         return record
 
     def process(self, key: str) -> EvidenceChainAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_broken = rec.integrity_status in (
@@ -198,7 +194,7 @@ class EvidenceChainIntegrityEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("evidence_chain_integrity_engine.cleared")
         return {"status": "cleared"}
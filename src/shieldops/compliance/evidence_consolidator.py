@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class ComplianceEvidenceConsolidator:
     ) -> None:
         self._max_records = max_records
         self._min_completeness_pct = min_completeness_pct
-        self._records: list[ConsolidationRecord] = []
+        self._records: RecordStore[ConsolidationRecord] = RecordStore(self._max_records)
         self._rules: list[ConsolidationRule] = []
         logger.info(
             "evidence_consolidator.initialized",
@@ -123,8 +125,6 @@ class ComplianceEvidenceConsolidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evidence_consolidator.consolidation_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ComplianceEvidenceConsolidator:
         return record
 
     def get_consolidation(self, record_id: str) -> ConsolidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_consolidations(
         self,
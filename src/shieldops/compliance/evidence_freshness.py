@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class EvidenceFreshnessMonitor:
     ) -> None:
         self._max_records = max_records
         self._stale_days = stale_days
-        self._records: list[FreshnessRecord] = []
+        self._records: RecordStore[FreshnessRecord] = RecordStore(self._max_records)
         self._gaps: list[FreshnessGap] = []
         logger.info(
             "evidence_freshness.initialized",
@@ -154,8 +156,6 @@ class EvidenceFreshnessMonitor:
             owner=owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evidence_freshness.evidence_recorded",
             record_id=record.id,
@@ -165,10 +165,7 @@ class EvidenceFreshnessMonitor:
         return record
 
     def get_evidence(self, record_id: str) -> FreshnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_evidence(
         self,
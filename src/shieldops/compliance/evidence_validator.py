@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class ComplianceEvidenceValidator:
     ) -> None:
         self._max_records = max_records
         self._min_validity_pct = min_validity_pct
-        self._records: list[ValidationRecord] = []
+        self._records: RecordStore[ValidationRecord] = RecordStore(self._max_records)
         self._findings: list[ValidationFinding] = []
         logger.info(
             "evidence_validator.initialized",
@@ -136,8 +138,6 @@ class ComplianceEvidenceValidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "evidence_validator.validation_recorded",
             record_id=record.id,
@@ -148,10 +148,7 @@ class ComplianceEvidenceValidator:
         return record
 
     def get_validation(self, record_id: str) -> ValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class FAIRRiskModeler:
     ) -> None:
         self._max_records = max_records
         self._risk_estimate_threshold = risk_estimate_threshold
-        self._records: list[RiskModelRecord] = []
+        self._records: RecordStore[RiskModelRecord] = RecordStore(self._max_records)
         self._analyses: list[RiskModelAnalysis] = []
         logger.info(
             "fair_risk_modeler.initialized",
@@ -124,8 +126,6 @@ class FAIRRiskModeler:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "fair_risk_modeler.scenario_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class FAIRRiskModeler:
         return record
 
     def get_scenario(self, record_id: str) -> RiskModelRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scenarios(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DependencyLicenseRiskAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_transitive_depth = max_transitive_depth
-        self._records: list[LicenseRiskRecord] = []
+        self._records: RecordStore[LicenseRiskRecord] = RecordStore(self._max_records)
         self._conflicts: list[LicenseConflict] = []
         logger.info(
             "license_risk.initialized",
@@ -124,8 +126,6 @@ class DependencyLicenseRiskAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "license_risk.license_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class DependencyLicenseRiskAnalyzer:
         return record
 
     def get_license(self, record_id: str) -> LicenseRiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_licenses(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class LicensingAuditTracker:
     ) -> None:
         self._max_records = max_records
         self._utilization_threshold = utilization_threshold
-        self._records: list[LicenseAuditRecord] = []
+        self._records: RecordStore[LicenseAuditRecord] = RecordStore(self._max_records)
         self._analyses: list[LicenseAnalysis] = []
         logger.info(
             "licensing_audit_tracker.initialized",
@@ -126,8 +128,6 @@ class LicensingAuditTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "licensing_audit_tracker.audit_recorded",
             record_id=record.id,
@@ -137,10 +137,7 @@ class LicensingAuditTracker:
         return record
 
     def get_license_audit(self, record_id: str) -> LicenseAuditRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_license_audits(
         self,
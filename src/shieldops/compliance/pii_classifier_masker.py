@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PIIClassifierMasker:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[PIIRecord] = []
+        self._records: RecordStore[PIIRecord] = RecordStore(self._max_records)
         self._analyses: list[MaskingAnalysis] = []
         logger.info(
             "pii_classifier_masker.initialized",
@@ -124,8 +126,6 @@ class PIIClassifierMasker:
             data_owner=data_owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "pii_classifier_masker.pii_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PIIClassifierMasker:
         return record
 
     def get_pii(self, record_id: str) -> PIIRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_piis(
         self,
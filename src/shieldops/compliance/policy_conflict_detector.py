@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PolicyConflictDetector:
     ) -> None:
         self._max_records = max_records
         self._conflict_threshold = conflict_threshold
-        self._records: list[PolicyConflictRecord] = []
+        self._records: RecordStore[PolicyConflictRecord] = RecordStore(self._max_records)
         self._analyses: list[PolicyConflictAnalysis] = []
         logger.info(
             "policy_conflict_detector.initialized",
@@ -124,8 +126,6 @@ class PolicyConflictDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_conflict_detector.conflict_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PolicyConflictDetector:
         return record
 
     def get_conflict(self, record_id: str) -> PolicyConflictRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_conflicts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class PolicyCoverageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_policy_coverage_pct = min_policy_coverage_pct
-        self._records: list[PolicyCoverageRecord] = []
+        self._records: RecordStore[PolicyCoverageRecord] = RecordStore(self._max_records)
         self._assessments: list[CoverageAssessment] = []
         logger.info(
             "policy_coverage.initialized",
@@ -120,8 +122,6 @@ class PolicyCoverageAnalyzer:
             owner=owner,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_coverage.coverage_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class PolicyCoverageAnalyzer:
         return record
 
     def get_coverage(self, record_id: str) -> PolicyCoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coverages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class PolicyEnforcementMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_violation_rate_pct = max_violation_rate_pct
-        self._records: list[EnforcementRecord] = []
+        self._records: RecordStore[EnforcementRecord] = RecordStore(self._max_records)
         self._violations: list[EnforcementViolation] = []
         logger.info(
             "policy_enforcer.initialized",
@@ -117,8 +119,6 @@ class PolicyEnforcementMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_enforcer.enforcement_recorded",
             record_id=record.id,
@@ -129,10 +129,7 @@ class PolicyEnforcementMonitor:
         return record
 
     def get_enforcement(self, record_id: str) -> EnforcementRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_enforcements(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class PolicyImpactScorer:
     ) -> None:
         self._max_records = max_records
         self._max_conflict_count = max_conflict_count
-        self._records: list[PolicyImpactRecord] = []
+        self._records: RecordStore[PolicyImpactRecord] = RecordStore(self._max_records)
         self._conflicts: list[PolicyConflict] = []
         logger.info(
             "policy_impact.initialized",
@@ -134,8 +136,6 @@ class PolicyImpactScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_impact.impact_recorded",
             record_id=record.id,
@@ -146,10 +146,7 @@ class PolicyImpactScorer:
         return record
 
     def get_impact(self, record_id: str) -> PolicyImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
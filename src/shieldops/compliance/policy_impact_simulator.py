@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PolicyImpactSimulator:
     ) -> None:
         self._max_records = max_records
         self._impact_threshold = impact_threshold
-        self._records: list[SimulationRecord] = []
+        self._records: RecordStore[SimulationRecord] = RecordStore(self._max_records)
         self._analyses: list[SimulationAnalysis] = []
         logger.info(
             "policy_impact_simulator.initialized",
@@ -124,8 +126,6 @@ class PolicyImpactSimulator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_impact_simulator.simulation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PolicyImpactSimulator:
         return record
 
     def get_simulation(self, record_id: str) -> SimulationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_simulations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CompliancePostureScorer:
     ) -> None:
         self._max_records = max_records
         self._min_score_pct = min_score_pct
-        self._records: list[PostureRecord] = []
+        self._records: RecordStore[PostureRecord] = RecordStore(self._max_records)
         self._policies: list[PosturePolicy] = []
         logger.info(
             "posture_scorer.initialized",
@@ -116,8 +118,6 @@ class CompliancePostureScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "posture_scorer.assessment_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class CompliancePostureScorer:
         return record
 
     def get_assessment(self, record_id: str) -> PostureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
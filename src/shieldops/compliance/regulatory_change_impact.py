@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RegulatoryChangeImpact:
     ) -> None:
         self._max_records = max_records
         self._regulatory_impact_threshold = regulatory_impact_threshold
-        self._records: list[RegulatoryChangeRecord] = []
+        self._records: RecordStore[RegulatoryChangeRecord] = RecordStore(self._max_records)
         self._analyses: list[RegulatoryChangeAnalysis] = []
         logger.info(
             "regulatory_change_impact.initialized",
@@ -124,8 +126,6 @@ class RegulatoryChangeImpact:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "regulatory_change_impact.change_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RegulatoryChangeImpact:
         return record
 
     def get_change(self, record_id: str) -> RegulatoryChangeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_changes(
         self,
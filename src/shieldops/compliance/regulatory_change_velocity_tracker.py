@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class RegulatoryChangeVelocityTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RegulatoryChangeRecord] = []
+        self._records: RecordStore[RegulatoryChangeRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RegulatoryChangeAnalysis] = {}
         logger.info(
             "regulatory_change_velocity_tracker.init",
@@ -117,8 +119,6 @@ class RegulatoryChangeVelocityTracker:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "regulatory_change_velocity.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class RegulatoryChangeVelocityTracker:
         return record
 
     def process(self, key: str) -> RegulatoryChangeAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         changes = sum(1 for r in self._records if r.regulation_id == rec.regulation_id)
@@ -196,7 +192,7 @@ class RegulatoryChangeVelocityTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("regulatory_change_velocity_tracker.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RegulatoryDeadlineTracker:
     ) -> None:
         self._max_records = max_records
         self._compliance_threshold = compliance_threshold
-        self._records: list[DeadlineRecord] = []
+        self._records: RecordStore[DeadlineRecord] = RecordStore(self._max_records)
         self._analyses: list[DeadlineAnalysis] = []
         logger.info(
             "regulatory_deadline_tracker.initialized",
@@ -124,8 +126,6 @@ class RegulatoryDeadlineTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "regulatory_deadline_tracker.deadline_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RegulatoryDeadlineTracker:
         return record
 
     def get_deadline(self, record_id: str) -> DeadlineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_deadlines(
         self,
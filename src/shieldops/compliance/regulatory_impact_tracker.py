@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RegulatoryImpactTracker:
     ) -> None:
         self._max_records = max_records
         self._impact_severity_threshold = impact_severity_threshold
-        self._records: list[RegulatoryRecord] = []
+        self._records: RecordStore[RegulatoryRecord] = RecordStore(self._max_records)
         self._analyses: list[RegulatoryAnalysis] = []
         logger.info(
             "regulatory_impact_tracker.initialized",
@@ -124,8 +126,6 @@ class RegulatoryImpactTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "regulatory_impact_tracker.regulatory_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RegulatoryImpactTracker:
         return record
 
     def get_regulatory(self, record_id: str) -> RegulatoryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_regulatory_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ComplianceReportAutomator:
     ) -> None:
         self._max_records = max_records
         self._max_overdue_days = max_overdue_days
-        self._records: list[ReportRecord] = []
+        self._records: RecordStore[ReportRecord] = RecordStore(self._max_records)
         self._sections: list[ReportSection] = []
         logger.info(
             "report_automator.initialized",
@@ -116,8 +118,6 @@ class ComplianceReportAutomator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "report_automator.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ComplianceReportAutomator:
         return record
 
     def get_report(self, record_id: str) -> ReportRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reports(
         self,
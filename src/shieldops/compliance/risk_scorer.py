@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ComplianceRiskScorer:
     ) -> None:
         self._max_records = max_records
         self._max_risk_score = max_risk_score
-        self._records: list[RiskRecord] = []
+        self._records: RecordStore[RiskRecord] = RecordStore(self._max_records)
         self._rules: list[RiskRule] = []
         logger.info(
             "risk_scorer.initialized",
@@ -120,8 +122,6 @@ class ComplianceRiskScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_scorer.risk_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ComplianceRiskScorer:
         return record
 
     def get_risk(self, record_id: str) -> RiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_risks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RiskTreatmentTracker:
     ) -> None:
         self._max_records = max_records
         self._residual_risk_threshold = residual_risk_threshold
-        self._records: list[TreatmentRecord] = []
+        self._records: RecordStore[TreatmentRecord] = RecordStore(self._max_records)
         self._analyses: list[TreatmentAnalysis] = []
         logger.info(
             "risk_treatment_tracker.initialized",
@@ -124,8 +126,6 @@ class RiskTreatmentTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_treatment_tracker.treatment_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RiskTreatmentTracker:
         return record
 
     def get_treatment(self, record_id: str) -> TreatmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_treatments(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityExceptionWorkflow:
     ) -> None:
         self._max_records = max_records
         self._exception_gap_threshold = exception_gap_threshold
-        self._records: list[ExceptionRecord] = []
+        self._records: RecordStore[ExceptionRecord] = RecordStore(self._max_records)
         self._analyses: list[ExceptionAnalysis] = []
         logger.info(
             "security_exception_workflow.initialized",
@@ -124,8 +126,6 @@ class SecurityExceptionWorkflow:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_exception_workflow.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityExceptionWorkflow:
         return record
 
     def get_exception(self, record_id: str) -> ExceptionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_exceptions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class VendorRiskIntelligence:
     ) -> None:
         self._max_records = max_records
         self._vendor_risk_threshold = vendor_risk_threshold
-        self._records: list[VendorRecord] = []
+        self._records: RecordStore[VendorRecord] = RecordStore(self._max_records)
         self._analyses: list[VendorAnalysis] = []
         logger.info(
             "vendor_risk_intelligence.initialized",
@@ -124,8 +126,6 @@ class VendorRiskIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vendor_risk_intelligence.vendor_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class VendorRiskIntelligence:
         return record
 
     def get_vendor(self, record_id: str) -> VendorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_vendors(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ConfigValidationEngine:
     ) -> None:
         self._max_records = max_records
         self._max_failure_rate_pct = max_failure_rate_pct
-        self._records: list[ValidationRecord] = []
+        self._records: RecordStore[ValidationRecord] = RecordStore(self._max_records)
         self._rules: list[ValidationRule] = []
         logger.info(
             "config_validator.initialized",
@@ -116,8 +118,6 @@ class ConfigValidationEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "config_validator.validation_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ConfigValidationEngine:
         return record
 
     def get_validation(self, record_id: str) -> ValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
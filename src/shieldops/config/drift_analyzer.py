@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ConfigDriftAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_deviation_pct = max_deviation_pct
-        self._records: list[DriftRecord] = []
+        self._records: RecordStore[DriftRecord] = RecordStore(self._max_records)
         self._policies: list[DriftRule] = []
         logger.info(
             "drift_analyzer.initialized",
@@ -116,8 +118,6 @@ class ConfigDriftAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "drift_analyzer.drift_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ConfigDriftAnalyzer:
         return record
 
     def get_drift(self, record_id: str) -> DriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class FeatureFlagImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_reliability_pct = min_reliability_pct
-        self._records: list[FlagImpactRecord] = []
+        self._records: RecordStore[FlagImpactRecord] = RecordStore(self._max_records)
         self._analyses: list[FlagAnalysis] = []
         logger.info(
             "flag_impact.initialized",
@@ -113,8 +115,6 @@ class FeatureFlagImpactAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "flag_impact.impact_recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class FeatureFlagImpactAnalyzer:
         return record
 
     def get_impact(self, record_id: str) -> FlagImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
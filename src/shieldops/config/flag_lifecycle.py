@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class FeatureFlagLifecycleManager:
     ) -> None:
         self._max_records = max_records
         self._stale_days_threshold = stale_days_threshold
-        self._records: list[FlagLifecycleRecord] = []
+        self._records: RecordStore[FlagLifecycleRecord] = RecordStore(self._max_records)
         self._candidates: list[FlagCleanupCandidate] = []
         logger.info(
             "flag_lifecycle.initialized",
@@ -134,8 +136,6 @@ class FeatureFlagLifecycleManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "flag_lifecycle.flag_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class FeatureFlagLifecycleManager:
         return record
 
     def get_flag(self, record_id: str) -> FlagLifecycleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_flags(
         self,
@@ -35,10 +35,31 @@ class Settings(BaseSettings):
     rate_limit_default: int = 60
     rate_limit_auth_login: int = 10
     rate_limit_auth_register: int = 5
+    # Requests leased per Redis round trip into the in-process token bucket.
+    # 0 = every request hits Redis (exact); larger = fewer round trips, but
+    # unspent leases can reject callers slightly before their limit.
+    rate_limit_local_lease_size: int = 0
+    rate_limit_lease_max_fraction: float = 0.1
 
     # Kafka
     kafka_brokers: str = "localhost:9092"
     kafka_consumer_group: str = "shieldops-agents"
+    # Handlers run concurrently per partition (ordered per resource/correlation
+    # key) with manual offset commits; 1 keeps the sequential consume loop.
+    kafka_consumer_max_in_flight_per_partition: int = 16
+    # Producer batching for publish_many / publish_nowait ("" = no compression;
+    # "gzip" needs no extra deps, "lz4"/"zstd"/"snappy" need their codecs)
+    kafka_producer_linger_ms: int = 5
+    kafka_producer_max_batch_size: int = 65536
+    kafka_producer_compression: str = ""
+    kafka_producer_max_buffered_messages: int = 10000
+    # Failed events are retried via delay topics (shieldops.retry.10s/1m/10m),
+    # one tier per attempt; an empty list retries in place without redelivery.
+    kafka_retry_delays_s: list[float] = [10.0, 60.0, 600.0]
+    # Per-topic wire encoding for published events, e.g.
+    # {"shieldops.events": "msgpack"}; unlisted topics use JSON. Consumers
+    # read both, so switch a topic only after its consumers are upgraded.
+    kafka_topic_encodings: dict[str, str] = {}
 
     # LLM Providers
     anthropic_api_key: str = ""
@@ -51,15 +72,25 @@ class Settings(BaseSettings):
     agent_confidence_threshold_approval: float = 0.50
     agent_max_investigation_time_seconds: int = 600
     agent_max_remediation_retries: int = 3
+    agent_investigation_max_concurrent_queries: int = 8  # log/metric queries in flight per source
+    agent_investigation_source_timeout_seconds: float = 10.0  # per source, per tool call
 
     # OPA Policy Engine
     opa_endpoint: str = "http://localhost:8181"
+    opa_decision_cache_ttl_seconds: float = 5.0  # 0 disables the decision cache
+    opa_decision_cache_max_entries: int = 10000
+    opa_evaluation_mode: str = "http"  # "http" (OPA server) or "local" (in-process)
+    opa_bundle_path: str = ""  # Rego bundle for local mode; default playbooks/policies
+    opa_bundle_reload_seconds: float = 2.0
 
     # Observability
     langsmith_api_key: str = ""
     langsmith_project: str = "shieldops"
     langsmith_enabled: bool = False
     otel_exporter_endpoint: str = "http://localhost:4317"
+    # Shared directory for multi-worker /metrics (empty = single process).
+    metrics_multiproc_dir: str = ""
+    metrics_multiproc_flush_seconds: float = 5.0
 
     # Observability — Prometheus
     prometheus_url: str = "http://localhost:9090"
@@ -137,6 +168,12 @@ class Settings(BaseSettings):
     stripe_price_professional: str = ""  # $8K/month Professional plan
     stripe_price_enterprise: str = ""  # $25K/month Enterprise plan
 
+    # API usage tracking (analytics endpoints and plan API quotas)
+    usage_retention_hours: int = 720
+    usage_max_endpoints_per_org: int = 500
+    usage_rollup_interval_seconds: float = 60.0
+    usage_persist_rollups: bool = False  # write hourly rollups to api_usage_hourly
+
     # NVD CVE Source
     nvd_api_key: str = ""
 
@@ -204,6 +241,11 @@ class Settings(BaseSettings):
     jwt_secret_key: str = "change-me-in-production"  # noqa: S105
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60
+    # Verified bearer credentials cached per process (0 disables).  API-key
+    # entries also expire after the TTL so revocations made by another
+    # worker are picked up within it.
+    auth_token_cache_size: int = 10000
+    auth_api_key_cache_ttl_seconds: int = 30
 
     # Phase 12: Prediction Agent
     prediction_confidence_threshold: float = 0.75
@@ -219,6 +261,42 @@ class Settings(BaseSettings):
     llm_moderate_model: str = "claude-sonnet-4-20250514"
     llm_complex_model: str = "claude-opus-4-20250514"
 
+    # LLM response cache for llm_structured / llm_analyze
+    llm_cache_enabled: bool = True
+    llm_cache_backend: str = "memory"  # "memory" (per process) or "redis" (shared)
+    llm_cache_ttl_seconds: int = 900
+    llm_cache_max_bytes: int = 32 * 1024 * 1024  # per-process budget
+    llm_cache_disabled_agents: list[str] = ["chatops", "security_chat"]
+    # Mask timestamps and UUIDs in user prompts before keying.  Off by
+    # default: prompts that differ only in an entity UUID or incident time
+    # would otherwise share an answer.
+    llm_cache_mask_volatile: bool = False
+
+    # LLM gateway: per-process budgets, priority queueing and adaptive
+    # concurrency for agent LLM calls (see shieldops.utils.llm_gateway)
+    llm_gateway_enabled: bool = True
+    llm_gateway_requests_per_minute: int = 50  # per model
+    llm_gateway_tokens_per_minute: int = 80000  # per model, input + output reserve
+    llm_gateway_max_concurrency: int = 16
+    llm_gateway_min_concurrency: int = 2
+    llm_gateway_target_latency_ms: int = 20000
+    llm_gateway_max_retries: int = 3
+    llm_gateway_output_token_reserve: int = 1024
+    # Queue depth past which non-critical calls overflow to the simple-tier
+    # model (requires llm_routing_enabled); 0 disables overflow
+    llm_gateway_overflow_queue_depth: int = 20
+
+    # Prompt token budgets for context-heavy agent nodes; evidence beyond
+    # the budget is deduplicated and dropped lowest-signal first
+    # (see shieldops.utils.context_compactor)
+    agent_prompt_token_budget_default: int = 4000
+    agent_prompt_token_budgets: dict[str, int] = {
+        "analyze_logs": 3000,
+        "analyze_metrics": 2000,
+        "correlate_findings": 3000,
+        "generate_hypotheses": 4000,
+    }
+
     # Phase 12: Observability — New Relic
     newrelic_api_key: str = ""
     newrelic_account_id: str = ""
@@ -236,6 +314,15 @@ class Settings(BaseSettings):
 
     # Phase 13: Idempotency
     idempotency_ttl_seconds: int = 86400
+    idempotency_backend: str = "memory"  # "memory" (per process) or "redis" (shared)
+    idempotency_max_body_bytes: int = 1048576
+    idempotency_wait_timeout_seconds: float = 30.0
+
+    # WebSocket broadcasting
+    ws_send_queue_size: int = 256  # events buffered per connection
+    ws_slow_consumer_policy: str = "drop_oldest"  # "drop_oldest" or "close"
+    ws_send_timeout_seconds: float = 10.0
+    ws_redis_fanout_enabled: bool = False  # relay broadcasts between workers
 
     # Phase 13: Hot Reload
     hot_reload_enabled: bool = False
@@ -252,6 +339,14 @@ class Settings(BaseSettings):
     cache_l1_max_size: int = 1000
     cache_l1_ttl_seconds: int = 60
     cache_l1_enabled: bool = True
+    # "tinylfu" = byte-budgeted, sharded W-TinyLFU; "lru" = legacy entry-count LRU
+    cache_l1_policy: str = "tinylfu"
+    cache_l1_max_bytes: int = 64 * 1024 * 1024
+    cache_l1_shards: int = 16
+    cache_l1_namespace_budgets: dict[str, int] = {}
+    # Broadcast L1 invalidations across pods over Redis pub/sub
+    cache_invalidation_enabled: bool = True
+    cache_invalidation_channel: str = "shieldops:cache:invalidate"
 
     # Phase 14: Feature Flags
     feature_flags_enabled: bool = True
@@ -5,8 +5,10 @@ from typing import Any
 from uuid import uuid4
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
+    Float,
     Index,
     Integer,
     String,
@@ -67,6 +69,8 @@ class InvestigationRecord(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (Index("ix_investigations_created_id", "created_at", "id"),)
+
 
 class RemediationRecord(Base):
     """Persisted remediation result."""
@@ -92,6 +96,8 @@ class RemediationRecord(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (Index("ix_remediations_created_id", "created_at", "id"),)
+
 
 class AuditLog(Base):
     """Immutable audit trail — append-only, never UPDATE."""
@@ -116,7 +122,10 @@ class AuditLog(Base):
     actor: Mapped[str] = mapped_column(String(128))
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    __table_args__ = (Index("ix_audit_log_env_ts", "environment", "timestamp"),)
+    __table_args__ = (
+        Index("ix_audit_log_env_ts", "environment", "timestamp"),
+        Index("ix_audit_log_ts_id", "timestamp", "id"),
+    )
 
 
 class IncidentOutcomeRecord(Base):
@@ -207,7 +216,10 @@ class SecurityScanRecord(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
-    __table_args__ = (Index("ix_security_scans_env_created", "environment", "created_at"),)
+    __table_args__ = (
+        Index("ix_security_scans_env_created", "environment", "created_at"),
+        Index("ix_security_scans_created_id", "created_at", "id"),
+    )
 
 
 class AgentSession(Base):
@@ -615,3 +627,21 @@ class WarRoomResponderRecord(Base):
     joined_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (Index("ix_wrr_room_user", "war_room_id", "user_name"),)
+
+
+class APIUsageHourlyRecord(Base):
+    """Per-org, per-endpoint API call totals for one hour.
+
+    Written in bulk by the usage tracker's rollup sink; each API worker
+    adds its own counts to the shared row.
+    """
+
+    __tablename__ = "api_usage_hourly"
+
+    org_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    endpoint: Mapped[str] = mapped_column(String(512), primary_key=True)
+    hour: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    call_count: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    total_latency_ms: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+
+    __table_args__ = (Index("ix_api_usage_hourly_org_hour", "org_id", "hour"),)
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 import structlog
-from sqlalchemy import select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import InstrumentedAttribute
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from shieldops.agents.security.models import SecurityScanState
+    from shieldops.api.middleware.usage_tracker import UsageRollup
 
 from shieldops.agents.investigation.models import InvestigationState
 from shieldops.agents.remediation.models import RemediationState
@@ -18,6 +23,7 @@ from shieldops.db.models import (
     AgentContextRecord,
     AgentSession,
     APIKeyRecord,
+    APIUsageHourlyRecord,
     AuditLog,
     IncidentOutcomeRecord,
     InvestigationRecord,
@@ -39,6 +45,32 @@ from shieldops.models.base import AuditEntry
 
 logger = structlog.get_logger()
 
+# Rows fetched per round-trip when streaming exports through a server-side cursor.
+EXPORT_BATCH_SIZE = 500
+
+# Rows per usage-rollup upsert: 5 bind parameters each keeps a statement
+# well under the 32767 parameters Postgres allows.
+USAGE_ROLLUP_CHUNK_ROWS = 5000
+
+
+def _newest_first(
+    stmt: Select[Any],
+    sort_col: InstrumentedAttribute[Any],
+    id_col: InstrumentedAttribute[Any],
+    after: tuple[datetime, str] | None = None,
+) -> Select[Any]:
+    """Order by ``(sort_col, id_col)`` descending and seek past *after*.
+
+    *after* is the ``(sort value, id)`` of the last row of the previous
+    page. The row-value comparison lets the database seek straight to the
+    next page on the ``(sort_col, id)`` index, so deep pages cost the same
+    as the first; ``id`` breaks ties between rows with equal timestamps.
+    """
+    stmt = stmt.order_by(sort_col.desc(), id_col.desc())
+    if after is not None:
+        stmt = stmt.where(tuple_(sort_col, id_col) < tuple_(*after))
+    return stmt
+
 
 class Repository:
     """Unified persistence repository for all ShieldOps domain objects."""
@@ -165,14 +197,29 @@ class Repository:
             return self._investigation_to_dict(record)
 
     async def list_investigations(
-        self, status: str | None = None, limit: int = 50, offset: int = 0
+        self,
+        status: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
-        """List investigation summaries from the database."""
+        """List investigation summaries from the database, newest first.
+
+        Pass *after* (the ``created_at`` and id of the last row seen) for
+        keyset pagination; *offset* is ignored in that case.
+        """
         async with self._sf() as session:
-            stmt = select(InvestigationRecord).order_by(InvestigationRecord.created_at.desc())
+            stmt = _newest_first(
+                select(InvestigationRecord),
+                InvestigationRecord.created_at,
+                InvestigationRecord.id,
+                after,
+            )
             if status:
                 stmt = stmt.where(InvestigationRecord.status == status)
-            stmt = stmt.offset(offset).limit(limit)
+            if after is None:
+                stmt = stmt.offset(offset)
+            stmt = stmt.limit(limit)
             result = await session.execute(stmt)
             return [self._investigation_to_dict(r) for r in result.scalars().all()]
 
@@ -254,15 +301,27 @@ class Repository:
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
-        """List remediation summaries from the database."""
+        """List remediation summaries from the database, newest first.
+
+        Pass *after* (the ``created_at`` and id of the last row seen) for
+        keyset pagination; *offset* is ignored in that case.
+        """
         async with self._sf() as session:
-            stmt = select(RemediationRecord).order_by(RemediationRecord.created_at.desc())
+            stmt = _newest_first(
+                select(RemediationRecord),
+                RemediationRecord.created_at,
+                RemediationRecord.id,
+                after,
+            )
             if environment:
                 stmt = stmt.where(RemediationRecord.environment == environment)
             if status:
                 stmt = stmt.where(RemediationRecord.status == status)
-            stmt = stmt.offset(offset).limit(limit)
+            if after is None:
+                stmt = stmt.offset(offset)
+            stmt = stmt.limit(limit)
             result = await session.execute(stmt)
             return [self._remediation_to_dict(r) for r in result.scalars().all()]
 
@@ -350,17 +409,29 @@ class Repository:
         status: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
-        """List security scan summaries from the database."""
+        """List security scan summaries from the database, newest first.
+
+        Pass *after* (the ``created_at`` and id of the last row seen) for
+        keyset pagination; *offset* is ignored in that case.
+        """
         async with self._sf() as session:
-            stmt = select(SecurityScanRecord).order_by(SecurityScanRecord.created_at.desc())
+            stmt = _newest_first(
+                select(SecurityScanRecord),
+                SecurityScanRecord.created_at,
+                SecurityScanRecord.id,
+                after,
+            )
             if environment:
                 stmt = stmt.where(SecurityScanRecord.environment == environment)
             if scan_type:
                 stmt = stmt.where(SecurityScanRecord.scan_type == scan_type)
             if status:
                 stmt = stmt.where(SecurityScanRecord.status == status)
-            stmt = stmt.offset(offset).limit(limit)
+            if after is None:
+                stmt = stmt.offset(offset)
+            stmt = stmt.limit(limit)
             result = await session.execute(stmt)
             return [self._security_scan_to_dict(r) for r in result.scalars().all()]
 
@@ -412,13 +483,24 @@ class Repository:
             logger.info("audit_log_appended", audit_id=entry.id, action=entry.action)
 
     async def list_audit_logs(
-        self, environment: str | None = None, limit: int = 100, offset: int = 0
+        self,
+        environment: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
+        """List audit entries newest first.
+
+        Pass *after* (the ``timestamp`` and id of the last entry seen) for
+        keyset pagination; *offset* is ignored in that case.
+        """
         async with self._sf() as session:
-            stmt = select(AuditLog).order_by(AuditLog.timestamp.desc())
+            stmt = _newest_first(select(AuditLog), AuditLog.timestamp, AuditLog.id, after)
             if environment:
                 stmt = stmt.where(AuditLog.environment == environment)
-            stmt = stmt.offset(offset).limit(limit)
+            if after is None:
+                stmt = stmt.offset(offset)
+            stmt = stmt.limit(limit)
             result = await session.execute(stmt)
             return [
                 {
@@ -1721,6 +1803,53 @@ class Repository:
                 status=status,
             )
 
+    # ── API Usage Rollups ───────────────────────────────────────
+
+    async def write_usage_rollups(self, rows: Sequence[UsageRollup]) -> None:
+        """Add hourly usage rollups to ``api_usage_hourly`` in one transaction.
+
+        Counts are added to any existing row for the same org, endpoint
+        and hour, since every API worker writes its own share.  Rows are
+        upserted ``USAGE_ROLLUP_CHUNK_ROWS`` per statement.
+        """
+        from sqlalchemy.dialects.postgresql import insert
+
+        merged: dict[tuple[str, str, datetime], list[float]] = {}
+        for row in rows:
+            totals = merged.setdefault((row.org_id, row.endpoint, row.hour), [0, 0.0])
+            totals[0] += row.call_count
+            totals[1] += row.total_latency_ms
+        if not merged:
+            return
+
+        values = [
+            {
+                "org_id": org_id,
+                "endpoint": endpoint,
+                "hour": hour,
+                "call_count": int(count),
+                "total_latency_ms": latency,
+            }
+            for (org_id, endpoint, hour), (count, latency) in merged.items()
+        ]
+        async with self._sf() as session:
+            for start in range(0, len(values), USAGE_ROLLUP_CHUNK_ROWS):
+                stmt = insert(APIUsageHourlyRecord).values(
+                    values[start : start + USAGE_ROLLUP_CHUNK_ROWS]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["org_id", "endpoint", "hour"],
+                    set_={
+                        "call_count": APIUsageHourlyRecord.call_count + stmt.excluded.call_count,
+                        "total_latency_ms": (
+                            APIUsageHourlyRecord.total_latency_ms + stmt.excluded.total_latency_ms
+                        ),
+                    },
+                )
+                await session.execute(stmt)
+            await session.commit()
+        logger.debug("usage_rollups_written", rows=len(merged))
+
     # ── Global Search ────────────────────────────────────────────
 
     async def search_investigations(
@@ -1806,6 +1935,21 @@ class Repository:
             return [self._vulnerability_to_dict(r) for r in result.scalars().all()]
 
     # ── Data Export ───────────────────────────────────────────────
+    #
+    # Exports are async generators over a server-side cursor: rows are
+    # fetched EXPORT_BATCH_SIZE at a time and converted one by one, so an
+    # export never holds more than one batch of ORM objects in memory.
+
+    async def _stream(
+        self,
+        stmt: Select[Any],
+        to_dict: Callable[[Any], dict[str, Any]],
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async with self._sf() as session:
+            result = await session.stream_scalars(stmt.execution_options(yield_per=batch_size))
+            async for record in result:
+                yield to_dict(record)
 
     async def export_investigations(
         self,
@@ -1813,25 +1957,27 @@ class Repository:
         end_date: datetime | None = None,
         status: str | None = None,
         severity: str | None = None,
-        limit: int = 1000,
-    ) -> list[dict[str, Any]]:
-        """Export investigation records with optional filters.
+        limit: int | None = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream investigation records with optional filters, newest first.
 
-        Returns flat dicts suitable for CSV/JSON export.
+        Yields flat dicts suitable for CSV/JSON export.
         """
-        async with self._sf() as session:
-            stmt = select(InvestigationRecord).order_by(InvestigationRecord.created_at.desc())
-            if start_date:
-                stmt = stmt.where(InvestigationRecord.created_at >= start_date)
-            if end_date:
-                stmt = stmt.where(InvestigationRecord.created_at <= end_date)
-            if status:
-                stmt = stmt.where(InvestigationRecord.status == status)
-            if severity:
-                stmt = stmt.where(InvestigationRecord.severity == severity)
+        stmt = _newest_first(
+            select(InvestigationRecord), InvestigationRecord.created_at, InvestigationRecord.id
+        )
+        if start_date:
+            stmt = stmt.where(InvestigationRecord.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(InvestigationRecord.created_at <= end_date)
+        if status:
+            stmt = stmt.where(InvestigationRecord.status == status)
+        if severity:
+            stmt = stmt.where(InvestigationRecord.severity == severity)
+        if limit is not None:
             stmt = stmt.limit(limit)
-            result = await session.execute(stmt)
-            return [self._investigation_to_dict(r) for r in result.scalars().all()]
+        async for row in self._stream(stmt, self._investigation_to_dict):
+            yield row
 
     async def export_remediations(
         self,
@@ -1839,43 +1985,47 @@ class Repository:
         end_date: datetime | None = None,
         status: str | None = None,
         severity: str | None = None,
-        limit: int = 1000,
-    ) -> list[dict[str, Any]]:
-        """Export remediation records with optional filters.
+        limit: int | None = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream remediation records with optional filters, newest first.
 
         The *severity* filter maps to the ``risk_level`` column.
-        Returns flat dicts suitable for CSV/JSON export.
+        Yields flat dicts suitable for CSV/JSON export.
         """
-        async with self._sf() as session:
-            stmt = select(RemediationRecord).order_by(RemediationRecord.created_at.desc())
-            if start_date:
-                stmt = stmt.where(RemediationRecord.created_at >= start_date)
-            if end_date:
-                stmt = stmt.where(RemediationRecord.created_at <= end_date)
-            if status:
-                stmt = stmt.where(RemediationRecord.status == status)
-            if severity:
-                stmt = stmt.where(RemediationRecord.risk_level == severity)
+        stmt = _newest_first(
+            select(RemediationRecord), RemediationRecord.created_at, RemediationRecord.id
+        )
+        if start_date:
+            stmt = stmt.where(RemediationRecord.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(RemediationRecord.created_at <= end_date)
+        if status:
+            stmt = stmt.where(RemediationRecord.status == status)
+        if severity:
+            stmt = stmt.where(RemediationRecord.risk_level == severity)
+        if limit is not None:
             stmt = stmt.limit(limit)
-            result = await session.execute(stmt)
-            return [self._remediation_to_dict(r) for r in result.scalars().all()]
+        async for row in self._stream(stmt, self._remediation_to_dict):
+            yield row
 
     async def export_compliance_data(
         self,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-        limit: int = 1000,
-    ) -> list[dict[str, Any]]:
-        """Export security scan records for compliance reporting.
+        limit: int | None = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream security scan records for compliance reporting.
 
-        Returns flat dicts with compliance scores and posture data.
+        Yields flat dicts with compliance scores and posture data.
         """
-        async with self._sf() as session:
-            stmt = select(SecurityScanRecord).order_by(SecurityScanRecord.created_at.desc())
-            if start_date:
-                stmt = stmt.where(SecurityScanRecord.created_at >= start_date)
-            if end_date:
-                stmt = stmt.where(SecurityScanRecord.created_at <= end_date)
+        stmt = _newest_first(
+            select(SecurityScanRecord), SecurityScanRecord.created_at, SecurityScanRecord.id
+        )
+        if start_date:
+            stmt = stmt.where(SecurityScanRecord.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(SecurityScanRecord.created_at <= end_date)
+        if limit is not None:
             stmt = stmt.limit(limit)
-            result = await session.execute(stmt)
-            return [self._security_scan_to_dict(r) for r in result.scalars().all()]
+        async for row in self._stream(stmt, self._security_scan_to_dict):
+            yield row
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class PostIncidentActionTracker:
     ) -> None:
         self._max_records = max_records
         self._overdue_threshold_days = overdue_threshold_days
-        self._records: list[PostIncidentAction] = []
+        self._records: RecordStore[PostIncidentAction] = RecordStore(self._max_records)
         self._summaries: list[ActionSummary] = []
         logger.info(
             "action_tracker.initialized",
@@ -120,8 +122,6 @@ class PostIncidentActionTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "action_tracker.action_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class PostIncidentActionTracker:
         return record
 
     def get_action(self, record_id: str) -> PostIncidentAction | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_actions(
         self,
@@ -154,11 +151,11 @@ class PostIncidentActionTracker:
         return results[-limit:]
 
     def complete_action(self, record_id: str) -> PostIncidentAction | None:
-        for r in self._records:
-            if r.id == record_id:
-                r.status = ActionStatus.COMPLETED
-                logger.info("action_tracker.action_completed", record_id=record_id)
-                return r
+        r = self._records.get(record_id)
+        if r is not None:
+            r.status = ActionStatus.COMPLETED
+            logger.info("action_tracker.action_completed", record_id=record_id)
+            return r
         return None
 
     # -- domain operations -----------------------------------------------
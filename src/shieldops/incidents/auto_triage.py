@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class IncidentAutoTriageEngine:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[TriageRecord] = []
+        self._records: RecordStore[TriageRecord] = RecordStore(self._max_records)
         self._rules: list[TriageRule] = []
         logger.info(
             "auto_triage.initialized",
@@ -140,8 +142,6 @@ class IncidentAutoTriageEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "auto_triage.triage_recorded",
             record_id=record.id,
@@ -152,10 +152,7 @@ class IncidentAutoTriageEngine:
         return record
 
     def get_triage(self, record_id: str) -> TriageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_triages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentBlastRadiusAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_blast_radius_score = max_blast_radius_score
-        self._records: list[BlastRadiusRecord] = []
+        self._records: RecordStore[BlastRadiusRecord] = RecordStore(self._max_records)
         self._zones: list[ImpactZone] = []
         logger.info(
             "blast_radius.initialized",
@@ -120,8 +122,6 @@ class IncidentBlastRadiusAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "blast_radius.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class IncidentBlastRadiusAnalyzer:
         return record
 
     def get_blast_radius(self, record_id: str) -> BlastRadiusRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_blast_radii(
         self,
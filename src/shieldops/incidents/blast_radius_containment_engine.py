@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class BlastRadiusContainmentEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[BlastRadiusRecord] = []
+        self._records: RecordStore[BlastRadiusRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, BlastRadiusAnalysis] = {}
         logger.info(
             "blast_radius_containment_engine.init",
@@ -117,8 +119,6 @@ class BlastRadiusContainmentEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "blast_radius_containment.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class BlastRadiusContainmentEngine:
         return record
 
     def process(self, key: str) -> BlastRadiusAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_expanding = rec.containment_status == ContainmentStatus.SPREADING
@@ -189,7 +185,7 @@ class BlastRadiusContainmentEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("blast_radius_containment_engine.cleared")
         return {"status": "cleared"}
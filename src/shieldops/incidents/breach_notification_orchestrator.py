@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BreachNotificationOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[NotificationRecord] = []
+        self._records: RecordStore[NotificationRecord] = RecordStore(self._max_records)
         self._analyses: list[NotificationAnalysis] = []
         logger.info(
             "breach_notification_orchestrator.initialized",
@@ -124,8 +126,6 @@ class BreachNotificationOrchestrator:
             business_unit=business_unit,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "breach_notification_orchestrator.notification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BreachNotificationOrchestrator:
         return record
 
     def get_notification(self, record_id: str) -> NotificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_notifications(
         self,
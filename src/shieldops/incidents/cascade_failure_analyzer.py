@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CascadeFailureAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CascadeFailureRecord] = []
+        self._records: RecordStore[CascadeFailureRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CascadeFailureAnalysis] = {}
         logger.info(
             "cascade_failure_analyzer.init",
@@ -124,8 +126,6 @@ class CascadeFailureAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cascade_failure.record_added",
             record_id=record.id,
@@ -134,11 +134,7 @@ class CascadeFailureAnalyzer:
         return record
 
     def process(self, key: str) -> CascadeFailureAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.incident_id == rec.incident_id]
@@ -199,7 +195,7 @@ class CascadeFailureAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cascade_failure_analyzer.cleared")
         return {"status": "cleared"}
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class CognitiveIncidentTriageEngine:
     ) -> None:
         self._max_records = max_records
         self._auto_resolve_threshold = auto_resolve_threshold
-        self._records: list[TriageRecord] = []
+        self._records: RecordStore[TriageRecord] = RecordStore(self._max_records)
         self._analyses: list[TriageAnalysis] = []
         logger.info(
             "cognitive_incident_triage_engine.initialized",
@@ -130,8 +132,6 @@ class CognitiveIncidentTriageEngine:
             resolution_time_minutes=(resolution_time_minutes),
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cognitive_incident_triage_engine.record_added",
             record_id=record.id,
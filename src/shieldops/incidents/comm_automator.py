@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class IncidentCommunicationAutomator:
     ) -> None:
         self._max_records = max_records
         self._min_delivery_rate_pct = min_delivery_rate_pct
-        self._records: list[CommRecord] = []
+        self._records: RecordStore[CommRecord] = RecordStore(self._max_records)
         self._templates: list[CommTemplate] = []
         logger.info(
             "comm_automator.initialized",
@@ -117,8 +119,6 @@ class IncidentCommunicationAutomator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "comm_automator.recorded",
             record_id=record.id,
@@ -129,10 +129,7 @@ class IncidentCommunicationAutomator:
         return record
 
     def get_comm(self, record_id: str) -> CommRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_comms(
         self,
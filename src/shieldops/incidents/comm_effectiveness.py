@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CommEffectivenessAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_delivery_rate_pct = min_delivery_rate_pct
-        self._records: list[CommDeliveryRecord] = []
+        self._records: RecordStore[CommDeliveryRecord] = RecordStore(self._max_records)
         self._channel_metrics: list[CommChannelMetrics] = []
         logger.info(
             "comm_effectiveness.initialized",
@@ -120,8 +122,6 @@ class CommEffectivenessAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "comm_effectiveness.delivery_recorded",
             record_id=record.id,
@@ -131,10 +131,7 @@ class CommEffectivenessAnalyzer:
         return record
 
     def get_delivery(self, record_id: str) -> CommDeliveryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_deliveries(
         self,
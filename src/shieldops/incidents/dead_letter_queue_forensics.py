@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DeadLetterQueueForensics:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DlqRecord] = []
+        self._records: RecordStore[DlqRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DlqAnalysis] = {}
         logger.info(
             "dead_letter_queue_forensics.init",
@@ -117,8 +119,6 @@ class DeadLetterQueueForensics:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dlq_forensics.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class DeadLetterQueueForensics:
         return record
 
     def process(self, key: str) -> DlqAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.dlq_name == rec.dlq_name]
@@ -207,7 +203,7 @@ class DeadLetterQueueForensics:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("dead_letter_queue_forensics.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -123,7 +125,7 @@ class IncidentDurationPredictor:
     ) -> None:
         self._max_records = max_records
         self._accuracy_target_pct = accuracy_target_pct
-        self._records: list[DurationRecord] = []
+        self._records: RecordStore[DurationRecord] = RecordStore(self._max_records)
         logger.info(
             "duration_predictor.initialized",
             max_records=max_records,
@@ -157,8 +159,6 @@ class IncidentDurationPredictor:
             is_business_hours=is_business_hours,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "duration_predictor.recorded",
             record_id=record.id,
@@ -169,10 +169,7 @@ class IncidentDurationPredictor:
         return record
 
     def get_prediction(self, record_id: str) -> DurationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class EscalationEffectivenessTracker:
     ) -> None:
         self._max_records = max_records
         self._false_rate_threshold = false_rate_threshold
-        self._records: list[EscalationEffectivenessRecord] = []
+        self._records: RecordStore[EscalationEffectivenessRecord] = RecordStore(self._max_records)
         self._profiles: dict[str, ResponderProfile] = {}
         logger.info(
             "escalation_effectiveness.initialized",
@@ -138,8 +140,6 @@ class EscalationEffectivenessTracker:
             was_correct_target=was_correct_target,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "escalation_effectiveness.escalation_recorded",
             record_id=record.id,
@@ -150,10 +150,7 @@ class EscalationEffectivenessTracker:
         return record
 
     def get_escalation(self, record_id: str) -> EscalationEffectivenessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_escalations(
         self,
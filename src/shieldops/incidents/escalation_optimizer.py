@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class IncidentEscalationOptimizer:
     ) -> None:
         self._max_records = max_records
         self._max_escalation_time_min = max_escalation_time_min
-        self._records: list[EscalationRecord] = []
+        self._records: RecordStore[EscalationRecord] = RecordStore(self._max_records)
         self._recommendations: list[PathRecommendation] = []
         logger.info(
             "escalation_optimizer.initialized",
@@ -113,8 +115,6 @@ class IncidentEscalationOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "escalation_optimizer.recorded",
             record_id=record.id,
@@ -125,10 +125,7 @@ class IncidentEscalationOptimizer:
         return record
 
     def get_escalation(self, record_id: str) -> EscalationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_escalations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class EscalationPathAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_resolution_time_minutes = max_resolution_time_minutes
-        self._records: list[EscalationPathRecord] = []
+        self._records: RecordStore[EscalationPathRecord] = RecordStore(self._max_records)
         self._metrics: list[PathMetric] = []
         logger.info(
             "escalation_path.initialized",
@@ -124,8 +126,6 @@ class EscalationPathAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "escalation_path.path_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class EscalationPathAnalyzer:
         return record
 
     def get_path(self, record_id: str) -> EscalationPathRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_paths(
         self,
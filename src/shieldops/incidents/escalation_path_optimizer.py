@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class EscalationPathOptimizer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EscalationPathRecord] = []
+        self._records: RecordStore[EscalationPathRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EscalationPathAnalysis] = {}
         logger.info(
             "escalation_path_optimizer.init",
@@ -118,8 +120,6 @@ class EscalationPathOptimizer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "escalation_path.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class EscalationPathOptimizer:
         return record
 
     def process(self, key: str) -> EscalationPathAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         efficiency = max(
@@ -208,7 +204,7 @@ class EscalationPathOptimizer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("escalation_path_optimizer.cleared")
         return {"status": "cleared"}
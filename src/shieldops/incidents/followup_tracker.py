@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PostIncidentFollowupTracker:
     ) -> None:
         self._max_records = max_records
         self._overdue_days = overdue_days
-        self._records: list[FollowupRecord] = []
+        self._records: RecordStore[FollowupRecord] = RecordStore(self._max_records)
         self._assignments: list[FollowupAssignment] = []
         logger.info(
             "followup_tracker.initialized",
@@ -116,8 +118,6 @@ class PostIncidentFollowupTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "followup_tracker.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PostIncidentFollowupTracker:
         return record
 
     def get_followup(self, record_id: str) -> FollowupRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_followups(
         self,
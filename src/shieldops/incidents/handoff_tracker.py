@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentHandoffTracker:
     ) -> None:
         self._max_records = max_records
         self._quality_threshold = quality_threshold
-        self._records: list[HandoffRecord] = []
+        self._records: RecordStore[HandoffRecord] = RecordStore(self._max_records)
         self._patterns: list[HandoffPattern] = []
         logger.info(
             "handoff_tracker.initialized",
@@ -133,8 +135,6 @@ class IncidentHandoffTracker:
             quality_score=score,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "handoff_tracker.handoff_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class IncidentHandoffTracker:
 
     def get_handoff(self, record_id: str) -> HandoffRecord | None:
         """Get a single handoff record by ID."""
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_handoffs(
         self,
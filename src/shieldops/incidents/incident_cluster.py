@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentClusterEngine:
     ) -> None:
         self._max_records = max_records
         self._min_cluster_confidence = min_cluster_confidence
-        self._records: list[ClusterRecord] = []
+        self._records: RecordStore[ClusterRecord] = RecordStore(self._max_records)
         self._members: list[ClusterMember] = []
         logger.info(
             "incident_cluster.initialized",
@@ -122,8 +124,6 @@ class IncidentClusterEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_cluster.cluster_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentClusterEngine:
         return record
 
     def get_cluster(self, record_id: str) -> ClusterRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_clusters(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,9 @@ class IncidentCommunicationEffectivenessEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CommunicationEffectivenessRecord] = []
+        self._records: RecordStore[CommunicationEffectivenessRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: dict[str, CommunicationEffectivenessAnalysis] = {}
         logger.info(
             "incident_communication_effectiveness_engine.init",
@@ -120,8 +124,6 @@ class IncidentCommunicationEffectivenessEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_communication_effectiveness.record_added",
             record_id=record.id,
@@ -130,11 +132,7 @@ class IncidentCommunicationEffectivenessEngine:
         return record
 
     def process(self, key: str) -> CommunicationEffectivenessAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.incident_id == rec.incident_id]
@@ -189,7 +187,7 @@ class IncidentCommunicationEffectivenessEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("incident_communication_effectiveness_engine.cleared")
         return {"status": "cleared"}
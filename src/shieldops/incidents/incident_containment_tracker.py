@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentContainmentTracker:
     ) -> None:
         self._max_records = max_records
         self._effectiveness_threshold = effectiveness_threshold
-        self._records: list[ContainmentRecord] = []
+        self._records: RecordStore[ContainmentRecord] = RecordStore(self._max_records)
         self._analyses: list[ContainmentAnalysis] = []
         logger.info(
             "incident_containment_tracker.initialized",
@@ -122,8 +124,6 @@ class IncidentContainmentTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_containment_tracker.containment_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentContainmentTracker:
         return record
 
     def get_containment(self, record_id: str) -> ContainmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_containments(
         self,
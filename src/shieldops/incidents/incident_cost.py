@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class IncidentCostCalculator:
     ) -> None:
         self._max_records = max_records
         self._high_threshold = high_threshold
-        self._records: list[IncidentCostRecord] = []
+        self._records: RecordStore[IncidentCostRecord] = RecordStore(self._max_records)
         self._breakdowns: list[CostBreakdown] = []
         logger.info(
             "incident_cost.initialized",
@@ -113,8 +115,6 @@ class IncidentCostCalculator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_cost.recorded",
             record_id=record.id,
@@ -125,10 +125,7 @@ class IncidentCostCalculator:
         return record
 
     def get_cost(self, record_id: str) -> IncidentCostRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_costs(
         self,
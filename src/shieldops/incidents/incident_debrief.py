@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentDebriefTracker:
     ) -> None:
         self._max_records = max_records
         self._min_debrief_quality_pct = min_debrief_quality_pct
-        self._records: list[DebriefRecord] = []
+        self._records: RecordStore[DebriefRecord] = RecordStore(self._max_records)
         self._metrics: list[DebriefMetric] = []
         logger.info(
             "incident_debrief.initialized",
@@ -124,8 +126,6 @@ class IncidentDebriefTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_debrief.debrief_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IncidentDebriefTracker:
         return record
 
     def get_debrief(self, record_id: str) -> DebriefRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_debriefs(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentEscalationScorer:
     ) -> None:
         self._max_records = max_records
         self._min_quality_score = min_quality_score
-        self._records: list[EscalationScoreRecord] = []
+        self._records: RecordStore[EscalationScoreRecord] = RecordStore(self._max_records)
         self._assessments: list[EscalationAssessment] = []
         logger.info(
             "incident_escalation_scorer.initialized",
@@ -124,8 +126,6 @@ class IncidentEscalationScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_escalation_scorer.escalation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IncidentEscalationScorer:
         return record
 
     def get_escalation(self, record_id: str) -> EscalationScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_escalations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentForensicsTracker:
     ) -> None:
         self._max_records = max_records
         self._integrity_threshold = integrity_threshold
-        self._records: list[ForensicRecord] = []
+        self._records: RecordStore[ForensicRecord] = RecordStore(self._max_records)
         self._analyses: list[ForensicAnalysis] = []
         logger.info(
             "incident_forensics_tracker.initialized",
@@ -122,8 +124,6 @@ class IncidentForensicsTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_forensics_tracker.artifact_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentForensicsTracker:
         return record
 
     def get_artifact(self, record_id: str) -> ForensicRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_artifacts(
         self,
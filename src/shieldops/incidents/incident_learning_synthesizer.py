@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class IncidentLearningSynthesizer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[LearningRecord] = []
+        self._records: RecordStore[LearningRecord] = RecordStore(self._max_records)
         self._analyses: list[LearningAnalysis] = []
         logger.info(
             "incident_learning_synthesizer.initialized",
@@ -121,8 +123,6 @@ class IncidentLearningSynthesizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_learning_synthesizer.record_added",
             record_id=record.id,
@@ -131,10 +131,7 @@ class IncidentLearningSynthesizer:
         return record
 
     def get_record(self, record_id: str) -> LearningRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class IncidentLifecycleStateEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[LifecycleStateRecord] = []
+        self._records: RecordStore[LifecycleStateRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, LifecycleStateAnalysis] = {}
         logger.info(
             "incident_lifecycle_state_engine.init",
@@ -115,8 +117,6 @@ class IncidentLifecycleStateEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_lifecycle_state.record_added",
             record_id=record.id,
@@ -125,11 +125,7 @@ class IncidentLifecycleStateEngine:
         return record
 
     def process(self, key: str) -> LifecycleStateAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.incident_id == rec.incident_id]
@@ -188,7 +184,7 @@ class IncidentLifecycleStateEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("incident_lifecycle_state_engine.cleared")
         return {"status": "cleared"}
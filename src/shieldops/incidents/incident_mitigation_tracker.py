@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentMitigationTracker:
     ) -> None:
         self._max_records = max_records
         self._effectiveness_threshold = effectiveness_threshold
-        self._records: list[MitigationRecord] = []
+        self._records: RecordStore[MitigationRecord] = RecordStore(self._max_records)
         self._analyses: list[MitigationAnalysis] = []
         logger.info(
             "incident_mitigation_tracker.initialized",
@@ -124,8 +126,6 @@ class IncidentMitigationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_mitigation_tracker.mitigation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IncidentMitigationTracker:
         return record
 
     def get_mitigation(self, record_id: str) -> MitigationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mitigations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentPatternDetector:
     ) -> None:
         self._max_records = max_records
         self._max_critical_pattern_pct = max_critical_pattern_pct
-        self._records: list[PatternRecord] = []
+        self._records: RecordStore[PatternRecord] = RecordStore(self._max_records)
         self._occurrences: list[PatternOccurrence] = []
         logger.info(
             "incident_pattern.initialized",
@@ -124,8 +126,6 @@ class IncidentPatternDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_pattern.pattern_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IncidentPatternDetector:
         return record
 
     def get_pattern(self, record_id: str) -> PatternRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_patterns(
         self,
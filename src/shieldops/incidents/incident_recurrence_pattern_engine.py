@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class IncidentRecurrencePatternEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RecurrencePatternRecord] = []
+        self._records: RecordStore[RecurrencePatternRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RecurrencePatternAnalysis] = {}
         logger.info(
             "incident_recurrence_pattern_engine.init",
@@ -117,8 +119,6 @@ class IncidentRecurrencePatternEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_recurrence_pattern.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class IncidentRecurrencePatternEngine:
         return record
 
     def process(self, key: str) -> RecurrencePatternAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sig_count = sum(1 for r in self._records if r.pattern_signature == rec.pattern_signature)
@@ -188,7 +184,7 @@ class IncidentRecurrencePatternEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("incident_recurrence_pattern_engine.cleared")
         return {"status": "cleared"}
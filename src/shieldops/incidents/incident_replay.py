@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class IncidentReplayEngine:
     ) -> None:
         self._max_records = max_records
         self._min_effectiveness_pct = min_effectiveness_pct
-        self._records: list[ReplayRecord] = []
+        self._records: RecordStore[ReplayRecord] = RecordStore(self._max_records)
         self._scenarios: list[ReplayScenario] = []
         logger.info(
             "incident_replay.initialized",
@@ -116,8 +118,6 @@ class IncidentReplayEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_replay.replay_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class IncidentReplayEngine:
         return record
 
     def get_replay(self, record_id: str) -> ReplayRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_replays(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class IntelligentNoiseReductionEngine:
     ) -> None:
         self._max_records = max_records
         self._similarity_threshold = similarity_threshold
-        self._records: list[NoiseReductionRecord] = []
+        self._records: RecordStore[NoiseReductionRecord] = RecordStore(self._max_records)
         self._analyses: list[NoiseReductionAnalysis] = []
         logger.info(
             "intelligent_noise_reduction_engine.initialized",
@@ -130,8 +132,6 @@ class IntelligentNoiseReductionEngine:
             reduction_outcome=reduction_outcome,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "intelligent_noise_reduction_engine.record_added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentKnowledgeLinker:
     ) -> None:
         self._max_records = max_records
         self._min_relevance_pct = min_relevance_pct
-        self._records: list[KnowledgeLinkRecord] = []
+        self._records: RecordStore[KnowledgeLinkRecord] = RecordStore(self._max_records)
         self._suggestions: list[LinkSuggestion] = []
         logger.info(
             "knowledge_linker.initialized",
@@ -122,8 +124,6 @@ class IncidentKnowledgeLinker:
             notes=notes,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_linker.link_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentKnowledgeLinker:
         return record
 
     def get_link(self, record_id: str) -> KnowledgeLinkRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_links(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class IncidentLearningTracker:
     ) -> None:
         self._max_records = max_records
         self._min_adoption_rate_pct = min_adoption_rate_pct
-        self._records: list[LessonRecord] = []
+        self._records: RecordStore[LessonRecord] = RecordStore(self._max_records)
         self._applications: list[LessonApplication] = []
         logger.info(
             "learning_tracker.initialized",
@@ -115,8 +117,6 @@ class IncidentLearningTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "learning_tracker.lesson_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class IncidentLearningTracker:
         return record
 
     def get_lesson(self, record_id: str) -> LessonRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_lessons(
         self,
@@ -173,15 +170,15 @@ class IncidentLearningTracker:
         return app
 
     def update_lesson_status(self, record_id: str, status: LessonStatus) -> LessonRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                r.status = status
-                logger.info(
-                    "learning_tracker.status_updated",
-                    record_id=record_id,
-                    new_status=status.value,
-                )
-                return r
+        r = self._records.get(record_id)
+        if r is not None:
+            r.status = status
+            logger.info(
+                "learning_tracker.status_updated",
+                record_id=record_id,
+                new_status=status.value,
+            )
+            return r
         return None
 
     # -- domain operations -----------------------------------------------
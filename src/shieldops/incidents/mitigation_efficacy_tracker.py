@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class MitigationEfficacyTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MitigationEfficacyRecord] = []
+        self._records: RecordStore[MitigationEfficacyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MitigationEfficacyAnalysis] = {}
         logger.info(
             "mitigation_efficacy_tracker.init",
@@ -120,8 +122,6 @@ class MitigationEfficacyTracker:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mitigation_efficacy.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class MitigationEfficacyTracker:
         return record
 
     def process(self, key: str) -> MitigationEfficacyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.strategy_name == rec.strategy_name]
@@ -193,7 +189,7 @@ class MitigationEfficacyTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("mitigation_efficacy_tracker.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class IncidentNoiseFilter:
     ) -> None:
         self._max_records = max_records
         self._max_false_alarm_rate_pct = max_false_alarm_rate_pct
-        self._records: list[NoiseRecord] = []
+        self._records: RecordStore[NoiseRecord] = RecordStore(self._max_records)
         self._patterns: list[NoisePattern] = []
         logger.info(
             "noise_filter.initialized",
@@ -117,8 +119,6 @@ class IncidentNoiseFilter:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "noise_filter.noise_recorded",
             record_id=record.id,
@@ -129,10 +129,7 @@ class IncidentNoiseFilter:
         return record
 
     def get_noise(self, record_id: str) -> NoiseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_noise(
         self,
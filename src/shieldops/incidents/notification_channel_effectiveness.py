@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class NotificationChannelEffectiveness:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[NotificationChannelRecord] = []
+        self._records: RecordStore[NotificationChannelRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, NotificationChannelAnalysis] = {}
         logger.info(
             "notification_channel_effectiveness.init",
@@ -115,8 +117,6 @@ class NotificationChannelEffectiveness:
             incident_id=incident_id,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "notification_channel.record_added",
             record_id=record.id,
@@ -125,11 +125,7 @@ class NotificationChannelEffectiveness:
         return record
 
     def process(self, key: str) -> NotificationChannelAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.channel_type == rec.channel_type]
@@ -208,7 +204,7 @@ class NotificationChannelEffectiveness:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("notification_channel_eff.cleared")
         return {"status": "cleared"}
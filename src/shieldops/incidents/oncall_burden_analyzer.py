@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class OncallBurdenAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[OncallBurdenRecord] = []
+        self._records: RecordStore[OncallBurdenRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, OncallBurdenAnalysis] = {}
         logger.info(
             "oncall_burden_analyzer.init",
@@ -118,8 +120,6 @@ class OncallBurdenAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "oncall_burden.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class OncallBurdenAnalyzer:
         return record
 
     def process(self, key: str) -> OncallBurdenAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.responder_id == rec.responder_id]
@@ -207,7 +203,7 @@ class OncallBurdenAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("oncall_burden_analyzer.cleared")
         return {"status": "cleared"}
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class PostmortemInsightExtractor:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[PostmortemInsightRecord] = []
+        self._records: RecordStore[PostmortemInsightRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, PostmortemInsightAnalysis] = {}
         logger.info(
             "postmortem_insight_extractor.init",
@@ -117,8 +119,6 @@ class PostmortemInsightExtractor:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "postmortem_insight.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class PostmortemInsightExtractor:
         return record
 
     def process(self, key: str) -> PostmortemInsightAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         theme_count = sum(1 for r in self._records if r.theme_category == rec.theme_category)
@@ -185,7 +181,7 @@ class PostmortemInsightExtractor:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("postmortem_insight_extractor.cleared")
         return {"status": "cleared"}
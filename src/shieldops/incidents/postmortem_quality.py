@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class PostmortemQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._min_score = min_score
-        self._records: list[PostmortemRecord] = []
+        self._records: RecordStore[PostmortemRecord] = RecordStore(self._max_records)
         self._dimensions: list[DimensionScore] = []
         logger.info(
             "postmortem_quality.initialized",
@@ -113,8 +115,6 @@ class PostmortemQualityScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "postmortem_quality.postmortem_recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class PostmortemQualityScorer:
         return record
 
     def get_postmortem(self, record_id: str) -> PostmortemRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_postmortems(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class IncidentPreventionEngine:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[PreventionRecord] = []
+        self._records: RecordStore[PreventionRecord] = RecordStore(self._max_records)
         self._signals: list[PrecursorSignal] = []
         logger.info(
             "prevention_engine.initialized",
@@ -115,8 +117,6 @@ class IncidentPreventionEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "prevention_engine.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class IncidentPreventionEngine:
         return record
 
     def get_prevention(self, record_id: str) -> PreventionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_preventions(
         self,
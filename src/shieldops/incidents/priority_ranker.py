@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class IncidentPriorityRanker:
     ) -> None:
         self._max_records = max_records
         self._min_accuracy_pct = min_accuracy_pct
-        self._records: list[PriorityRecord] = []
+        self._records: RecordStore[PriorityRecord] = RecordStore(self._max_records)
         self._factors: list[PriorityFactorDetail] = []
         logger.info(
             "priority_ranker.initialized",
@@ -129,8 +131,6 @@ class IncidentPriorityRanker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "priority_ranker.recorded",
             record_id=record.id,
@@ -141,10 +141,7 @@ class IncidentPriorityRanker:
         return record
 
     def get_priority(self, record_id: str) -> PriorityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_priorities(
         self,
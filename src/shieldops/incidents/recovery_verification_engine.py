@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -84,7 +86,7 @@ class RecoveryVerificationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RecoveryVerificationRecord] = []
+        self._records: RecordStore[RecoveryVerificationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RecoveryVerificationAnalysis] = {}
         logger.info(
             "recovery_verification_engine.init",
@@ -113,8 +115,6 @@ class RecoveryVerificationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "recovery_verification.record_added",
             record_id=record.id,
@@ -123,11 +123,7 @@ class RecoveryVerificationEngine:
         return record
 
     def process(self, key: str) -> RecoveryVerificationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_partial = rec.recovery_status == RecoveryStatus.PARTIAL or rec.completeness_pct < 100.0
@@ -183,7 +179,7 @@ class RecoveryVerificationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("recovery_verification_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class RecurrencePatternDetector:
     ) -> None:
         self._max_records = max_records
         self._min_incidents = min_incidents
-        self._records: list[RecurrenceRecord] = []
+        self._records: RecordStore[RecurrenceRecord] = RecordStore(self._max_records)
         self._clusters: list[RecurrenceCluster] = []
         logger.info(
             "recurrence_pattern.initialized",
@@ -132,8 +134,6 @@ class RecurrencePatternDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "recurrence_pattern.recurrence_recorded",
             record_id=record.id,
@@ -144,10 +144,7 @@ class RecurrencePatternDetector:
         return record
 
     def get_recurrence(self, record_id: str) -> RecurrenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_recurrences(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentResponsePlaybookManager:
     ) -> None:
         self._max_records = max_records
         self._min_playbook_coverage_pct = min_playbook_coverage_pct
-        self._records: list[PlaybookRecord] = []
+        self._records: RecordStore[PlaybookRecord] = RecordStore(self._max_records)
         self._usages: list[PlaybookUsage] = []
         logger.info(
             "response_playbook.initialized",
@@ -120,8 +122,6 @@ class IncidentResponsePlaybookManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "response_playbook.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class IncidentResponsePlaybookManager:
         return record
 
     def get_playbook(self, record_id: str) -> PlaybookRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_playbooks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class IncidentResponseTimeAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_response_time_minutes = max_response_time_minutes
-        self._records: list[ResponseTimeRecord] = []
+        self._records: RecordStore[ResponseTimeRecord] = RecordStore(self._max_records)
         self._breakdowns: list[PhaseBreakdown] = []
         logger.info(
             "response_time.initialized",
@@ -122,8 +124,6 @@ class IncidentResponseTimeAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "response_time.recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentResponseTimeAnalyzer:
         return record
 
     def get_response(self, record_id: str) -> ResponseTimeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_responses(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class IncidentResponseTimer:
     ) -> None:
         self._max_records = max_records
         self._target_minutes = target_minutes
-        self._records: list[ResponseTimerRecord] = []
+        self._records: RecordStore[ResponseTimerRecord] = RecordStore(self._max_records)
         self._benchmarks: list[ResponseBenchmark] = []
         logger.info(
             "response_timer.initialized",
@@ -116,8 +118,6 @@ class IncidentResponseTimer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "response_timer.response_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class IncidentResponseTimer:
         return record
 
     def get_response_time(self, record_id: str) -> ResponseTimerRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_response_times(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class RiskAlertCorrelationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RiskAlertCorrelationRecord] = []
+        self._records: RecordStore[RiskAlertCorrelationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RiskAlertCorrelationAnalysis] = {}
         logger.info(
             "risk_alert_correlation_engine.init",
@@ -120,8 +122,6 @@ class RiskAlertCorrelationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_alert_correlation.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class RiskAlertCorrelationEngine:
         return record
 
     def process(self, key: str) -> RiskAlertCorrelationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         entity_corrs = [r for r in self._records if r.entity_id == rec.entity_id]
@@ -199,7 +195,7 @@ class RiskAlertCorrelationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("risk_alert_correlation_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class IncidentRootCauseClassifier:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[RootCauseRecord] = []
+        self._records: RecordStore[RootCauseRecord] = RecordStore(self._max_records)
         self._patterns: list[CausePattern] = []
         logger.info(
             "root_cause_classifier.initialized",
@@ -121,8 +123,6 @@ class IncidentRootCauseClassifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "root_cause_classifier.recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class IncidentRootCauseClassifier:
         return record
 
     def get_classification(self, record_id: str) -> RootCauseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_classifications(
         self,
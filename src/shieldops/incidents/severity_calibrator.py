@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -112,7 +114,7 @@ class IncidentSeverityCalibrator:
     ) -> None:
         self._max_records = max_records
         self._accuracy_target_pct = accuracy_target_pct
-        self._records: list[SeverityRecord] = []
+        self._records: RecordStore[SeverityRecord] = RecordStore(self._max_records)
         self._rules: list[CalibrationRule] = []
         logger.info(
             "severity_calibrator.initialized",
@@ -138,8 +140,6 @@ class IncidentSeverityCalibrator:
             duration_minutes=duration_minutes,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "severity_calibrator.recorded",
             record_id=record.id,
@@ -148,10 +148,7 @@ class IncidentSeverityCalibrator:
         return record
 
     def get_record(self, record_id: str) -> SeverityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class IncidentSeverityValidator:
     ) -> None:
         self._max_records = max_records
         self._min_accuracy_pct = min_accuracy_pct
-        self._records: list[SeverityValidationRecord] = []
+        self._records: RecordStore[SeverityValidationRecord] = RecordStore(self._max_records)
         self._criteria: list[ValidationCriterion] = []
         logger.info(
             "severity_validator.initialized",
@@ -122,8 +124,6 @@ class IncidentSeverityValidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "severity_validator.validation_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class IncidentSeverityValidator:
         return record
 
     def get_validation(self, record_id: str) -> SeverityValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class StakeholderImpactTracker:
     ) -> None:
         self._max_records = max_records
         self._impact_score_threshold = impact_score_threshold
-        self._records: list[StakeholderRecord] = []
+        self._records: RecordStore[StakeholderRecord] = RecordStore(self._max_records)
         self._assessments: list[StakeholderAssessment] = []
         logger.info(
             "stakeholder_impact_tracker.initialized",
@@ -124,8 +126,6 @@ class StakeholderImpactTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "stakeholder_impact_tracker.impact_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class StakeholderImpactTracker:
         return record
 
     def get_impact(self, record_id: str) -> StakeholderRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
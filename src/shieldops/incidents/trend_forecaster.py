@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class IncidentTrendForecaster:
     ) -> None:
         self._max_records = max_records
         self._max_growth_rate_pct = max_growth_rate_pct
-        self._records: list[TrendRecord] = []
+        self._records: RecordStore[TrendRecord] = RecordStore(self._max_records)
         self._data_points: list[ForecastDataPoint] = []
         logger.info(
             "trend_forecaster.initialized",
@@ -116,8 +118,6 @@ class IncidentTrendForecaster:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trend_forecaster.trend_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class IncidentTrendForecaster:
         return record
 
     def get_trend(self, record_id: str) -> TrendRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trends(
         self,
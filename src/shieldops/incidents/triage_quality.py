@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class TriageQualityAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_triage_quality_pct = min_triage_quality_pct
-        self._records: list[TriageRecord] = []
+        self._records: RecordStore[TriageRecord] = RecordStore(self._max_records)
         self._metrics: list[TriageMetric] = []
         logger.info(
             "triage_quality.initialized",
@@ -120,8 +122,6 @@ class TriageQualityAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "triage_quality.triage_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class TriageQualityAnalyzer:
         return record
 
     def get_triage(self, record_id: str) -> TriageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_triages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class IncidentWarRoomOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._min_resolution_rate_pct = min_resolution_rate_pct
-        self._records: list[WarRoomRecord] = []
+        self._records: RecordStore[WarRoomRecord] = RecordStore(self._max_records)
         self._templates: list[WarRoomTemplate] = []
         logger.info(
             "war_room_orchestrator.initialized",
@@ -116,8 +118,6 @@ class IncidentWarRoomOrchestrator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "war_room_orchestrator.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class IncidentWarRoomOrchestrator:
         return record
 
     def get_war_room(self, record_id: str) -> WarRoomRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_war_rooms(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class TwilioSMSGateway:
     ) -> None:
         self._max_records = max_records
         self._max_retries = max_retries
-        self._records: list[SMSRecord] = []
+        self._records: RecordStore[SMSRecord] = RecordStore(self._max_records)
         self._receipts: list[DeliveryReceipt] = []
         logger.info(
             "twilio_sms.initialized",
@@ -115,8 +117,6 @@ class TwilioSMSGateway:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "twilio_sms.message_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class TwilioSMSGateway:
         return record
 
     def get_message(self, record_id: str) -> SMSRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_messages(
         self,
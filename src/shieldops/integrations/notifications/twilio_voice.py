@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class TwilioVoiceAlertSystem:
     ) -> None:
         self._max_records = max_records
         self._max_ring_seconds = max_ring_seconds
-        self._records: list[VoiceCallRecord] = []
+        self._records: RecordStore[VoiceCallRecord] = RecordStore(self._max_records)
         self._responses: list[IVRResponse] = []
         logger.info(
             "twilio_voice.initialized",
@@ -115,8 +117,6 @@ class TwilioVoiceAlertSystem:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "twilio_voice.call_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class TwilioVoiceAlertSystem:
         return record
 
     def get_call(self, record_id: str) -> VoiceCallRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_calls(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class KnowledgeContributionTracker:
     ) -> None:
         self._max_records = max_records
         self._min_quality_score = min_quality_score
-        self._records: list[ContributionRecord] = []
+        self._records: RecordStore[ContributionRecord] = RecordStore(self._max_records)
         self._profiles: list[ContributorProfile] = []
         logger.info(
             "contribution_tracker.initialized",
@@ -116,8 +118,6 @@ class KnowledgeContributionTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "contribution_tracker.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class KnowledgeContributionTracker:
         return record
 
     def get_contribution(self, record_id: str) -> ContributionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_contributions(
         self,
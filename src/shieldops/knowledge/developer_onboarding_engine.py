@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class DeveloperOnboardingEngine:
     ) -> None:
         self._max_records = max_records
         self._productivity_threshold = productivity_threshold_days
-        self._records: list[OnboardingRecord] = []
+        self._records: RecordStore[OnboardingRecord] = RecordStore(self._max_records)
         self._analyses: list[OnboardingAnalysis] = []
         logger.info(
             "developer_onboarding_engine.init",
@@ -105,8 +107,6 @@ class DeveloperOnboardingEngine:
         """Add an onboarding record."""
         record = OnboardingRecord(**kwargs)
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "developer_onboarding_engine.add_record",
             record_id=record.id,
@@ -116,10 +116,7 @@ class DeveloperOnboardingEngine:
 
     def process(self, key: str) -> OnboardingAnalysis:
         """Process a record by ID."""
-        record = next(
-            (r for r in self._records if r.id == key),
-            None,
-        )
+        record = self._records.get(key)
         if not record:
             return OnboardingAnalysis()
         prod_score = self._score_productivity(record)
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class TeamExpertiseMapper:
     ) -> None:
         self._max_records = max_records
         self._min_expertise_coverage_pct = min_expertise_coverage_pct
-        self._records: list[ExpertiseRecord] = []
+        self._records: RecordStore[ExpertiseRecord] = RecordStore(self._max_records)
         self._assessments: list[SkillAssessment] = []
         logger.info(
             "expertise_mapper.initialized",
@@ -120,8 +122,6 @@ class TeamExpertiseMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "expertise_mapper.expertise_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class TeamExpertiseMapper:
         return record
 
     def get_expertise(self, record_id: str) -> ExpertiseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_expertise(
         self,
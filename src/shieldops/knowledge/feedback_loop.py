@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class KnowledgeFeedbackAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_satisfaction_score = min_satisfaction_score
-        self._records: list[FeedbackRecord] = []
+        self._records: RecordStore[FeedbackRecord] = RecordStore(self._max_records)
         self._summaries: list[FeedbackSummary] = []
         logger.info(
             "feedback_loop.initialized",
@@ -120,8 +122,6 @@ class KnowledgeFeedbackAnalyzer:
             reviewer=reviewer,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "feedback_loop.feedback_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class KnowledgeFeedbackAnalyzer:
         return record
 
     def get_feedback(self, record_id: str) -> FeedbackRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_feedbacks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class KnowledgeFreshnessMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_stale_days = max_stale_days
-        self._records: list[FreshnessRecord] = []
+        self._records: RecordStore[FreshnessRecord] = RecordStore(self._max_records)
         self._alerts: list[FreshnessAlert] = []
         logger.info(
             "freshness_monitor.initialized",
@@ -123,8 +125,6 @@ class KnowledgeFreshnessMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "freshness_monitor.recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class KnowledgeFreshnessMonitor:
         return record
 
     def get_freshness(self, record_id: str) -> FreshnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_freshness_records(
         self,
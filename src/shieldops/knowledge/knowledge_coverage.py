@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class KnowledgeCoverageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[CoverageRecord] = []
+        self._records: RecordStore[CoverageRecord] = RecordStore(self._max_records)
         self._gaps: list[CoverageGapDetail] = []
         logger.info(
             "knowledge_coverage.initialized",
@@ -120,8 +122,6 @@ class KnowledgeCoverageAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_coverage.coverage_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class KnowledgeCoverageAnalyzer:
         return record
 
     def get_coverage(self, record_id: str) -> CoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coverages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class KnowledgeDecayDetector:
     ) -> None:
         self._max_records = max_records
         self._stale_days = stale_days
-        self._records: list[KnowledgeDecayRecord] = []
+        self._records: RecordStore[KnowledgeDecayRecord] = RecordStore(self._max_records)
         self._thresholds: dict[str, DecayThreshold] = {}
         logger.info(
             "knowledge_decay.initialized",
@@ -168,8 +170,6 @@ class KnowledgeDecayDetector:
             usage_count_30d=usage_count_30d,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_decay.decay_assessed",
             record_id=record.id,
@@ -180,10 +180,7 @@ class KnowledgeDecayDetector:
         return record
 
     def get_assessment(self, record_id: str) -> KnowledgeDecayRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class KnowledgeFreshnessScorer:
     ) -> None:
         self._max_records = max_records
         self._min_freshness_score = min_freshness_score
-        self._records: list[FreshnessRecord] = []
+        self._records: RecordStore[FreshnessRecord] = RecordStore(self._max_records)
         self._metrics: list[FreshnessMetric] = []
         logger.info(
             "knowledge_freshness_scorer.initialized",
@@ -124,8 +126,6 @@ class KnowledgeFreshnessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_freshness_scorer.freshness_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class KnowledgeFreshnessScorer:
         return record
 
     def get_freshness(self, record_id: str) -> FreshnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_freshness(
         self,
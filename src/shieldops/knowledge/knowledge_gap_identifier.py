@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class KnowledgeGapIdentifier:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[KnowledgeGapRecord] = []
+        self._records: RecordStore[KnowledgeGapRecord] = RecordStore(self._max_records)
         self._analyses: list[GapAnalysis] = []
         logger.info(
             "knowledge_gap_identifier.initialized",
@@ -124,8 +126,6 @@ class KnowledgeGapIdentifier:
             coverage_pct=coverage_pct,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_gap_identifier.gap_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class KnowledgeGapIdentifier:
         return record
 
     def get_gap(self, record_id: str) -> KnowledgeGapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gaps(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class KnowledgeGraphManager:
     ) -> None:
         self._max_records = max_records
         self._max_orphan_pct = max_orphan_pct
-        self._records: list[GraphRecord] = []
+        self._records: RecordStore[GraphRecord] = RecordStore(self._max_records)
         self._edges: list[GraphEdge] = []
         logger.info(
             "knowledge_graph.initialized",
@@ -124,8 +126,6 @@ class KnowledgeGraphManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_graph.node_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class KnowledgeGraphManager:
         return record
 
     def get_node(self, record_id: str) -> GraphRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_nodes(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class KnowledgeImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._impact_relevance_threshold = impact_relevance_threshold
-        self._records: list[ImpactRecord] = []
+        self._records: RecordStore[ImpactRecord] = RecordStore(self._max_records)
         self._assessments: list[ImpactAssessment] = []
         logger.info(
             "knowledge_impact_analyzer.initialized",
@@ -124,8 +126,6 @@ class KnowledgeImpactAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_impact_analyzer.impact_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class KnowledgeImpactAnalyzer:
         return record
 
     def get_impact(self, record_id: str) -> ImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
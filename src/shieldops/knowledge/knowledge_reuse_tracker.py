@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class KnowledgeReuseTracker:
     ) -> None:
         self._max_records = max_records
         self._min_reuse_score = min_reuse_score
-        self._records: list[ReuseRecord] = []
+        self._records: RecordStore[ReuseRecord] = RecordStore(self._max_records)
         self._analyses: list[ReuseAnalysis] = []
         logger.info(
             "knowledge_reuse_tracker.initialized",
@@ -124,8 +126,6 @@ class KnowledgeReuseTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_reuse_tracker.reuse_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class KnowledgeReuseTracker:
         return record
 
     def get_reuse(self, record_id: str) -> ReuseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reuse_records(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class LearningFeedbackLoopEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[FeedbackRecord] = []
+        self._records: RecordStore[FeedbackRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, FeedbackAnalysis] = {}
         logger.info(
             "learning_feedback_loop_engine.initialized",
@@ -115,8 +117,6 @@ class LearningFeedbackLoopEngine:
             service=service,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "learning_feedback_loop_engine.record_added",
             record_id=record.id,
@@ -125,10 +125,9 @@ class LearningFeedbackLoopEngine:
         return record
 
     def process(self, key: str) -> dict[str, Any]:
-        matching = [r for r in self._records if r.id == key]
-        if not matching:
+        rec = self._records.get(key)
+        if rec is None:
             return {"key": key, "status": "no_data"}
-        rec = matching[0]
         analysis = FeedbackAnalysis(
             agent_id=rec.agent_id,
             signal=rec.signal,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class KnowledgeSearchOptimizer:
     ) -> None:
         self._max_records = max_records
         self._min_relevance_score = min_relevance_score
-        self._records: list[SearchRecord] = []
+        self._records: RecordStore[SearchRecord] = RecordStore(self._max_records)
         self._patterns: list[SearchPattern] = []
         logger.info(
             "knowledge_search.initialized",
@@ -123,8 +125,6 @@ class KnowledgeSearchOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "knowledge_search.search_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class KnowledgeSearchOptimizer:
         return record
 
     def get_search(self, record_id: str) -> SearchRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_searches(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TaxonomyManager:
     ) -> None:
         self._max_records = max_records
         self._min_completeness_score = min_completeness_score
-        self._records: list[TaxonomyRecord] = []
+        self._records: RecordStore[TaxonomyRecord] = RecordStore(self._max_records)
         self._mappings: list[TaxonomyMapping] = []
         logger.info(
             "taxonomy_manager.initialized",
@@ -124,8 +126,6 @@ class TaxonomyManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "taxonomy_manager.taxonomy_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TaxonomyManager:
         return record
 
     def get_taxonomy(self, record_id: str) -> TaxonomyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_taxonomies(
         self,
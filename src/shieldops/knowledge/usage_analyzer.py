@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class KnowledgeUsageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_usage_score = min_usage_score
-        self._records: list[UsageRecord] = []
+        self._records: RecordStore[UsageRecord] = RecordStore(self._max_records)
         self._rules: list[UsageRule] = []
         logger.info(
             "usage_analyzer.initialized",
@@ -120,8 +122,6 @@ class KnowledgeUsageAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "usage_analyzer.usage_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class KnowledgeUsageAnalyzer:
         return record
 
     def get_usage(self, record_id: str) -> UsageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_usages(
         self,
@@ -5,6 +5,7 @@ from shieldops.messaging.consumer import EventConsumer
 from shieldops.messaging.dlq import DeadLetterQueue
 from shieldops.messaging.dlq_consumer import DLQConsumer
 from shieldops.messaging.producer import EventProducer
+from shieldops.messaging.retry import RetryTopicConsumer
 
 __all__ = [
     "DeadLetterQueue",
@@ -12,4 +13,5 @@ __all__ = [
     "EventBus",
     "EventConsumer",
     "EventProducer",
+    "RetryTopicConsumer",
 ]
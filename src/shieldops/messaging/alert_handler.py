@@ -29,12 +29,16 @@ class AlertEventHandler:
     root-cause analysis.  Unknown event types are logged and skipped.
     """
 
+    # Event types this handler acts on; pass to ``EventBus(event_types=...)``
+    # so other events are dropped before their payload is decoded.
+    EVENT_TYPES: frozenset[str] = frozenset({"alert.triggered"})
+
     def __init__(self, investigation_runner: InvestigationRunner) -> None:
         self._runner = investigation_runner
 
     async def handle(self, event: EventEnvelope) -> None:
         """Dispatch a single event envelope."""
-        if event.event_type == "alert.triggered":
+        if event.event_type in self.EVENT_TYPES:
             await self._handle_alert(event)
         else:
             logger.debug(
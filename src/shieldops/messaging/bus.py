@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection, Mapping, Sequence
 from typing import Any
 
 import structlog
@@ -29,6 +30,15 @@ class EventBus:
 
     Set *enable_dlq* to ``True`` (the default) to route failed
     consumer messages to a dead letter queue after retry exhaustion.
+    Set *enable_auto_commit* to ``False`` when consuming with
+    :meth:`EventConsumer.consume_concurrent`, which commits offsets itself.
+    *producer_options* are passed to :class:`EventProducer` (``linger_ms``,
+    ``max_batch_size``, ``compression_type``, ``max_buffered_messages``,
+    ``buffer_timeout_s``, ``encodings``). *event_types* limits which
+    events the consumer hands to its handler. *retry_delays* turns on delay-retry topics for
+    the DLQ (see :class:`DeadLetterQueue`); run a
+    :class:`~shieldops.messaging.retry.RetryTopicConsumer` alongside to
+    forward due retries.
     """
 
     def __init__(
@@ -37,14 +47,22 @@ class EventBus:
         group_id: str,
         *,
         enable_dlq: bool = True,
+        enable_auto_commit: bool = True,
+        producer_options: Mapping[str, Any] | None = None,
+        retry_delays: Sequence[float] | None = None,
+        event_types: Collection[str] | None = None,
     ) -> None:
-        self._producer = EventProducer(brokers=brokers)
-        self._dlq: DeadLetterQueue | None = DeadLetterQueue(self._producer) if enable_dlq else None
+        self._producer = EventProducer(brokers=brokers, **(producer_options or {}))
+        self._dlq: DeadLetterQueue | None = (
+            DeadLetterQueue(self._producer, retry_delays=retry_delays) if enable_dlq else None
+        )
         self._consumer = EventConsumer(
             brokers=brokers,
             group_id=group_id,
             topics=ALL_TOPICS,
             dlq=self._dlq,
+            enable_auto_commit=enable_auto_commit,
+            event_types=event_types,
         )
 
     # ── Properties ───────────────────────────────────────────────────────
@@ -2,16 +2,86 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection
+from typing import Any
 
 import structlog
-from aiokafka import AIOKafkaConsumer  # type: ignore[import-untyped]
+from aiokafka import AIOKafkaConsumer, TopicPartition  # type: ignore[import-untyped]
 
 from shieldops.messaging.dlq import DeadLetterQueue
-from shieldops.messaging.topics import EventEnvelope, deserialize_event
+from shieldops.messaging.retry import RetryMetadata, message_key
+from shieldops.messaging.topics import EventEnvelope, decode_event_lazy, deserialize_event
 
 logger = structlog.get_logger()
 
+# Cap on the in-memory retry tracker used when the DLQ has no retry tiers.
+_MAX_TRACKED_RETRIES = 10_000
+
+# (partition, message, previous same-key future, own done future, key)
+_WorkItem = tuple[Any, Any, "asyncio.Future[None] | None", "asyncio.Future[None]", str]
+
+
+def event_ordering_key(event: EventEnvelope) -> str:
+    """Default ordering key for :meth:`EventConsumer.consume_concurrent`.
+
+    Events about the same resource (``payload["resource_id"]``) or the same
+    workflow (``correlation_id``) are processed in order; anything else is
+    keyed by its own ``event_id`` and may run fully in parallel.
+    """
+    resource_id = event.payload.get("resource_id") if event.payload else None
+    if resource_id:
+        return f"resource:{resource_id}"
+    if event.correlation_id:
+        return f"correlation:{event.correlation_id}"
+    return f"event:{event.event_id}"
+
+
+class PartitionOffsetTracker:
+    """Track in-flight offsets per partition and the highest safe commit point.
+
+    An offset is *tracked* from the moment its message is received until
+    its handler finishes. The committable offset for a partition is the
+    lowest still-tracked offset, or one past the highest seen offset when
+    nothing is outstanding, so a commit never skips over unfinished work.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Any, set[int]] = {}
+        self._next: dict[Any, int] = {}
+        self._committed: dict[Any, int] = {}
+
+    def track(self, tp: Any, offset: int) -> None:
+        self._pending.setdefault(tp, set()).add(offset)
+        if offset + 1 > self._next.get(tp, 0):
+            self._next[tp] = offset + 1
+
+    def complete(self, tp: Any, offset: int) -> None:
+        pending = self._pending.get(tp)
+        if pending is not None:
+            pending.discard(offset)
+
+    def pending(self, tp: Any) -> int:
+        return len(self._pending.get(tp, ()))
+
+    def committable(self) -> dict[Any, int]:
+        """Offsets that advanced past the last commit, keyed by partition."""
+        offsets: dict[Any, int] = {}
+        for tp, next_offset in self._next.items():
+            pending = self._pending.get(tp)
+            safe = min(pending) if pending else next_offset
+            if safe > self._committed.get(tp, -1):
+                offsets[tp] = safe
+        return offsets
+
+    def mark_committed(self, offsets: dict[Any, int]) -> None:
+        self._committed.update(offsets)
+
+    def committed(self) -> dict[Any, int]:
+        return dict(self._committed)
+
 
 class EventConsumer:
     """Subscribes to Kafka topics and dispatches deserialized events.
@@ -21,8 +91,21 @@ class EventConsumer:
 
     If a :class:`DeadLetterQueue` is provided, failed messages are
     retried up to ``dlq.max_retries`` times before being routed to the
-    dead letter topic.  When *dlq* is ``None`` the original
-    log-and-continue behaviour is preserved.
+    dead letter topic.  When the DLQ has ``retry_delays``, each retry is
+    published to a delay tier topic with its attempt count in the message
+    headers, so the partition is not held up and no per-event state is
+    kept; otherwise attempts are counted in a bounded in-memory map.
+    When *dlq* is ``None`` the original log-and-continue behaviour is
+    preserved.
+
+    :meth:`consume_concurrent` processes messages in parallel while keeping
+    per-key ordering; construct the consumer with
+    ``enable_auto_commit=False`` for it so offsets are committed only once
+    their handlers have finished.
+
+    With *event_types*, only events of those types reach the handler.
+    Others are dropped during deserialization from the envelope header
+    alone, without decoding the payload of binary-encoded events.
     """
 
     def __init__(
@@ -31,13 +114,19 @@ class EventConsumer:
         group_id: str,
         topics: list[str],
         dlq: DeadLetterQueue | None = None,
+        enable_auto_commit: bool = True,
+        event_types: Collection[str] | None = None,
     ) -> None:
         self._brokers = brokers
         self._group_id = group_id
         self._topics = topics
         self._consumer: AIOKafkaConsumer | None = None
         self._dlq = dlq
-        # In-memory retry tracker: event_id -> current retry count
+        self._enable_auto_commit = enable_auto_commit
+        self._event_types = frozenset(event_types) if event_types is not None else None
+        self._offsets = PartitionOffsetTracker()
+        # In-memory retry tracker (no retry tiers): event_id -> retry count,
+        # oldest first, capped at _MAX_TRACKED_RETRIES.
         self._retry_counts: dict[str, int] = {}
 
     # ── Lifecycle ────────────────────────────────────────────────────────
@@ -48,7 +137,8 @@ class EventConsumer:
             *self._topics,
             bootstrap_servers=self._brokers,
             group_id=self._group_id,
-            value_deserializer=lambda raw: deserialize_event(raw),
+            enable_auto_commit=self._enable_auto_commit,
+            value_deserializer=self._deserialize,
         )
         await self._consumer.start()
         logger.info(
@@ -58,6 +148,15 @@ class EventConsumer:
             topics=self._topics,
         )
 
+    def _deserialize(self, raw: bytes) -> EventEnvelope | None:
+        """Decode a message value; ``None`` if its event type is filtered out."""
+        if self._event_types is None:
+            return deserialize_event(raw)
+        event = decode_event_lazy(raw)
+        if event.event_type not in self._event_types:
+            return None
+        return event.envelope()
+
     async def stop(self) -> None:
         """Commit offsets and stop the consumer."""
         if self._consumer is not None:
@@ -85,23 +184,164 @@ class EventConsumer:
             logger.warning("kafka_consumer_not_started")
             return
         async for message in self._consumer:
+            await self._process_message(handler, message)
+
+    async def _process_message(
+        self,
+        handler: Callable[[EventEnvelope], Awaitable[None]],
+        message: Any,
+    ) -> None:
+        if message.value is None:
+            return  # filtered out by event type
+        try:
+            event: EventEnvelope = message.value
+            await handler(event)
+            # Success — clear any tracked retries.
+            self._retry_counts.pop(event.event_id, None)
+            logger.debug(
+                "kafka_event_handled",
+                event_id=event.event_id,
+                event_type=event.event_type,
+            )
+        except Exception as exc:
+            await self._handle_consume_error(
+                exc,
+                message.value,
+                message.topic,
+                message.offset,
+                message=message,
+            )
+
+    async def consume_concurrent(
+        self,
+        handler: Callable[[EventEnvelope], Awaitable[None]],
+        *,
+        max_in_flight_per_partition: int = 16,
+        key_fn: Callable[[EventEnvelope], str] = event_ordering_key,
+        max_records: int = 500,
+        timeout_ms: int = 500,
+        commit_interval_s: float = 1.0,
+        drain_timeout_s: float = 30.0,
+    ) -> None:
+        """Dispatch messages to *handler* concurrently, ordered per key.
+
+        Up to *max_in_flight_per_partition* handlers run at once for each
+        partition; when a partition is saturated it is paused and further
+        messages wait in a per-partition backlog, so one slow handler no
+        longer stalls the whole bus. Messages sharing a ``key_fn`` key run
+        strictly one after another in the order they were received.
+
+        Offsets are committed every *commit_interval_s* up to the lowest
+        offset whose handler has not finished (at-least-once delivery).
+        Errors go through the same retry/DLQ path as :meth:`consume`. On
+        cancellation, running handlers get *drain_timeout_s* to finish
+        before a final commit.
+        """
+        if self._consumer is None:
+            logger.warning("kafka_consumer_not_started")
+            return
+        if self._enable_auto_commit:
+            logger.warning("kafka_concurrent_consume_with_auto_commit")
+
+        consumer = self._consumer
+        tracker = self._offsets
+        limit = max(1, max_in_flight_per_partition)
+        loop = asyncio.get_running_loop()
+        # Tail of each key's chain: a future resolved when the last
+        # received message for that key has been handled.
+        lanes: dict[str, asyncio.Future[None]] = {}
+        running: dict[Any, int] = {}
+        backlog: dict[Any, deque[_WorkItem]] = {}
+        paused: set[Any] = set()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def run(
+            tp: Any,
+            message: Any,
+            prev: asyncio.Future[None] | None,
+            done: asyncio.Future[None],
+            key: str,
+        ) -> None:
             try:
-                event: EventEnvelope = message.value
-                await handler(event)
-                # Success — clear any tracked retries.
-                self._retry_counts.pop(event.event_id, None)
-                logger.debug(
-                    "kafka_event_handled",
-                    event_id=event.event_id,
-                    event_type=event.event_type,
-                )
-            except Exception as exc:
-                await self._handle_consume_error(
-                    exc,
-                    message.value,
-                    message.topic,
-                    message.offset,
-                )
+                if prev is not None and not prev.done():
+                    await prev
+                await self._process_message(handler, message)
+            finally:
+                done.set_result(None)
+                if lanes.get(key) is done:
+                    del lanes[key]
+                tracker.complete(tp, message.offset)
+                running[tp] -= 1
+                drain(tp)
+
+        def spawn(item: _WorkItem) -> None:
+            tp = item[0]
+            running[tp] = running.get(tp, 0) + 1
+            task = loop.create_task(run(*item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        def drain(tp: Any) -> None:
+            queue = backlog.get(tp)
+            while queue and running.get(tp, 0) < limit:
+                spawn(queue.popleft())
+            if not queue and tp in paused:
+                paused.discard(tp)
+                consumer.resume(tp)
+
+        def receive(message: Any) -> None:
+            # Lanes are assigned at receipt (not dispatch) so per-key order
+            # follows fetch order even when a partition is backlogged.
+            tp = TopicPartition(message.topic, message.partition)
+            tracker.track(tp, message.offset)
+            if message.value is None:
+                # Filtered out by event type; nothing to run.
+                tracker.complete(tp, message.offset)
+                return
+            key = key_fn(message.value)
+            done: asyncio.Future[None] = loop.create_future()
+            item: _WorkItem = (tp, message, lanes.get(key), done, key)
+            lanes[key] = done
+            queue = backlog.setdefault(tp, deque())
+            if queue or running.get(tp, 0) >= limit:
+                queue.append(item)
+                if tp not in paused:
+                    paused.add(tp)
+                    consumer.pause(tp)
+            else:
+                spawn(item)
+
+        last_commit = time.monotonic()
+        try:
+            while True:
+                batch = await consumer.getmany(timeout_ms=timeout_ms, max_records=max_records)
+                for _tp, messages in batch.items():
+                    for message in messages:
+                        receive(message)
+                if time.monotonic() - last_commit >= commit_interval_s:
+                    await self._commit_completed()
+                    last_commit = time.monotonic()
+        finally:
+            if tasks:
+                _, still_running = await asyncio.wait(set(tasks), timeout=drain_timeout_s)
+                for task in still_running:
+                    task.cancel()
+                if still_running:
+                    logger.warning("kafka_concurrent_drain_timeout", remaining=len(still_running))
+            await self._commit_completed()
+
+    async def _commit_completed(self) -> None:
+        """Commit each partition up to its lowest unfinished offset."""
+        offsets = self._offsets.committable()
+        if not offsets or self._consumer is None:
+            return
+        try:
+            await self._consumer.commit(offsets)
+        except Exception as exc:
+            # e.g. CommitFailedError during a rebalance; the next commit retries.
+            logger.warning("kafka_commit_failed", error=str(exc))
+            return
+        self._offsets.mark_committed(offsets)
 
     async def consume_batch(
         self,
@@ -127,12 +367,14 @@ class EventConsumer:
                 max_records=max_records,
             )
             events: list[EventEnvelope] = []
-            topic_for_events: str = ""
+            event_messages: list[Any] = []
             for _tp, messages in batch.items():
                 for message in messages:
+                    if message.value is None:
+                        continue
                     try:
                         events.append(message.value)
-                        topic_for_events = message.topic
+                        event_messages.append(message)
                     except Exception:
                         logger.exception(
                             "kafka_batch_deserialize_error",
@@ -153,11 +395,7 @@ class EventConsumer:
                         count=len(events),
                     )
                 except Exception as exc:
-                    await self._handle_batch_error(
-                        exc,
-                        events,
-                        topic_for_events,
-                    )
+                    await self._handle_batch_error(exc, event_messages)
 
     # ── DLQ helpers ───────────────────────────────────────────────────
 
@@ -167,6 +405,7 @@ class EventConsumer:
         event: EventEnvelope,
         topic: str,
         offset: int,
+        message: Any = None,
     ) -> None:
         """Retry or route a single failed message to the DLQ."""
         if self._dlq is None:
@@ -177,7 +416,14 @@ class EventConsumer:
             )
             return
 
-        retry = self._retry_counts.get(event.event_id, 0) + 1
+        if self._dlq.retry_delays:
+            await self._route_to_retry_topic(self._dlq, exc, event, topic, message)
+            return
+
+        retry = self._retry_counts.pop(event.event_id, 0) + 1
+        if len(self._retry_counts) >= _MAX_TRACKED_RETRIES:
+            # Forget the oldest entry; dicts iterate in insertion order.
+            self._retry_counts.pop(next(iter(self._retry_counts)))
         self._retry_counts[event.event_id] = retry
 
         if await self._dlq.should_retry(retry):
@@ -196,24 +442,53 @@ class EventConsumer:
             )
             self._retry_counts.pop(event.event_id, None)
 
-    async def _handle_batch_error(
+    async def _route_to_retry_topic(
         self,
+        dlq: DeadLetterQueue,
         exc: Exception,
-        events: list[EventEnvelope],
+        event: EventEnvelope,
         topic: str,
+        message: Any,
     ) -> None:
-        """Route each event in a failed batch through DLQ logic."""
+        """Publish a failed message to its next delay tier, or the DLQ."""
+        meta = RetryMetadata.from_headers(getattr(message, "headers", None))
+        retry = meta.retry_count + 1
+        source_topic = meta.original_topic or topic
+        if await dlq.should_retry(retry):
+            await dlq.send_to_retry(
+                event,
+                exc,
+                source_topic,
+                retry,
+                key=message_key(message),
+                first_failed_at_ms=meta.first_failed_at_ms,
+            )
+        else:
+            await dlq.send_to_dlq(
+                event=event,
+                error=exc,
+                source_topic=source_topic,
+                retry_count=retry,
+            )
+
+    async def _handle_batch_error(
+        self,
+        exc: Exception,
+        messages: list[Any],
+    ) -> None:
+        """Route each message in a failed batch through DLQ logic."""
         if self._dlq is None:
             logger.exception(
                 "kafka_batch_handler_error",
-                count=len(events),
+                count=len(messages),
             )
             return
 
-        for event in events:
+        for message in messages:
             await self._handle_consume_error(
                 exc,
-                event,
-                topic,
-                offset=0,
+                message.value,
+                message.topic,
+                message.offset,
+                message=message,
             )
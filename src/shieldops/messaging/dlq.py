@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import time
+from collections.abc import Sequence
+
 import structlog
 
 from shieldops.messaging.producer import EventProducer
+from shieldops.messaging.retry import RetryMetadata, retry_topic_name
 from shieldops.messaging.topics import (
     DLQ_TOPIC,
     DLQEnvelope,
@@ -20,21 +24,80 @@ class DeadLetterQueue:
     When a consumer handler fails repeatedly, the original event is
     wrapped in a :class:`DLQEnvelope` with error metadata and published
     to :data:`DLQ_TOPIC` for later inspection or replay.
+
+    With *retry_delays* (e.g. ``(10, 60, 600)``) each retry is published
+    to a delay tier topic by :meth:`send_to_retry`, with its attempt count
+    in the message headers; attempts beyond the last tier reuse it. A
+    :class:`~shieldops.messaging.retry.RetryTopicConsumer` forwards the
+    message back to its source topic once the delay has elapsed.
     """
 
     def __init__(
         self,
         producer: EventProducer,
         max_retries: int = 3,
+        retry_delays: Sequence[float] | None = None,
     ) -> None:
         self._producer = producer
         self._max_retries = max_retries
+        self._retry_delays = tuple(retry_delays or ())
 
     @property
     def max_retries(self) -> int:
         """Return the configured maximum retry count."""
         return self._max_retries
 
+    @property
+    def retry_delays(self) -> tuple[float, ...]:
+        """Delay tiers in seconds; empty when retries are not topic-based."""
+        return self._retry_delays
+
+    def retry_topic_for(self, retry_count: int) -> str:
+        """Return the tier topic for the *retry_count*-th retry (1-based)."""
+        return retry_topic_name(self._tier_delay(retry_count))
+
+    def _tier_delay(self, retry_count: int) -> float:
+        if not self._retry_delays:
+            raise ValueError("no retry delays configured")
+        tier = min(max(retry_count, 1), len(self._retry_delays)) - 1
+        return self._retry_delays[tier]
+
+    async def send_to_retry(
+        self,
+        event: EventEnvelope,
+        error: Exception,
+        source_topic: str,
+        retry_count: int,
+        *,
+        key: str | None = None,
+        first_failed_at_ms: int = 0,
+    ) -> RetryMetadata:
+        """Publish *event* to the delay tier for *retry_count*.
+
+        Returns the :class:`RetryMetadata` attached to the message headers.
+        """
+        now_ms = int(time.time() * 1000)
+        delay_s = self._tier_delay(retry_count)
+        topic = retry_topic_name(delay_s)
+        meta = RetryMetadata(
+            retry_count=retry_count,
+            original_topic=source_topic,
+            not_before_ms=now_ms + int(delay_s * 1000),
+            error_type=type(error).__name__,
+            first_failed_at_ms=first_failed_at_ms or now_ms,
+        )
+        await self._producer.publish(topic, event, key=key, headers=meta.to_headers())
+
+        logger.warning(
+            "message_scheduled_for_retry",
+            event_id=event.event_id,
+            error_type=meta.error_type,
+            source_topic=source_topic,
+            retry_topic=topic,
+            retry_count=retry_count,
+        )
+        return meta
+
     async def send_to_dlq(
         self,
         event: EventEnvelope,
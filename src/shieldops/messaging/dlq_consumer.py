@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import Awaitable, Callable
 
 import structlog
 from aiokafka import AIOKafkaConsumer  # type: ignore[import-untyped]
+from pydantic import BaseModel, Field
 
 from shieldops.messaging.producer import EventProducer
 from shieldops.messaging.topics import (
@@ -18,6 +21,17 @@ from shieldops.messaging.topics import (
 logger = structlog.get_logger()
 
 
+class DLQReplayReport(BaseModel):
+    """Outcome of a :meth:`DLQConsumer.replay_bulk` run."""
+
+    replayed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    by_topic: dict[str, int] = Field(default_factory=dict)
+    elapsed_s: float = 0.0
+    completed: bool = False
+
+
 class DLQConsumer:
     """Consumes DLQ messages for inspection and replay.
 
@@ -25,15 +39,20 @@ class DLQConsumer:
     ``payload`` contains a serialised :class:`DLQEnvelope`.  This
     consumer deserialises the inner envelope and hands it to the
     caller-supplied handler.
+
+    Pass ``enable_auto_commit=False`` for :meth:`replay_bulk`, which then
+    commits a batch only once it has been republished.
     """
 
     def __init__(
         self,
         brokers: str,
         group_id: str = "shieldops-dlq",
+        enable_auto_commit: bool = True,
     ) -> None:
         self._brokers = brokers
         self._group_id = group_id
+        self._enable_auto_commit = enable_auto_commit
         self._consumer: AIOKafkaConsumer | None = None
 
     # ── Lifecycle ────────────────────────────────────────────────────
@@ -44,6 +63,7 @@ class DLQConsumer:
             DLQ_TOPIC,
             bootstrap_servers=self._brokers,
             group_id=self._group_id,
+            enable_auto_commit=self._enable_auto_commit,
             value_deserializer=lambda raw: deserialize_event(raw),
         )
         await self._consumer.start()
@@ -141,3 +161,99 @@ class DLQConsumer:
                     offset=message.offset,
                 )
         return replayed
+
+    async def replay_bulk(
+        self,
+        producer: EventProducer,
+        filter_fn: Callable[[DLQEnvelope], bool] | None = None,
+        *,
+        rate_per_s: float = 100.0,
+        batch_size: int = 100,
+        max_messages: int | None = None,
+        idle_timeout_ms: int = 1000,
+        dry_run: bool = False,
+    ) -> DLQReplayReport:
+        """Replay the DLQ backlog in batches, at most *rate_per_s* events/s.
+
+        Fetches up to *batch_size* messages at a time, republishes the
+        matching ones to their source topics with
+        :meth:`EventProducer.publish_many`, commits, and then sleeps as
+        needed to hold the replay rate so a large backlog does not swamp
+        the consumers it is replayed into. Replayed events carry no retry
+        headers, so they get a fresh set of retries.
+
+        Stops once a fetch comes back empty after *idle_timeout_ms* (the
+        backlog is drained; ``completed`` is set), after *max_messages*
+        DLQ messages, or on the first publish failure, in which case the
+        batch is left uncommitted to be replayed again next time. With
+        *dry_run* nothing is published or committed; the report shows what
+        would have been replayed.
+        """
+        report = DLQReplayReport()
+        if self._consumer is None:
+            logger.warning("dlq_consumer_not_started")
+            return report
+
+        consumer = self._consumer
+        started = time.monotonic()
+        seen = 0
+        while max_messages is None or seen < max_messages:
+            limit = batch_size if max_messages is None else min(batch_size, max_messages - seen)
+            batch = await consumer.getmany(timeout_ms=idle_timeout_ms, max_records=limit)
+            if not batch:
+                report.completed = True
+                break
+
+            by_topic: dict[str, list[EventEnvelope]] = {}
+            for _tp, messages in batch.items():
+                for message in messages:
+                    seen += 1
+                    try:
+                        carrier: EventEnvelope = message.value
+                        dlq_envelope = DLQEnvelope.model_validate(carrier.payload)
+                    except Exception:
+                        report.failed += 1
+                        logger.exception(
+                            "dlq_replay_error",
+                            topic=message.topic,
+                            offset=message.offset,
+                        )
+                        continue
+                    if filter_fn and not filter_fn(dlq_envelope):
+                        report.skipped += 1
+                        continue
+                    by_topic.setdefault(dlq_envelope.source_topic, []).append(
+                        dlq_envelope.original_event,
+                    )
+
+            count = sum(len(events) for events in by_topic.values())
+            if not dry_run:
+                try:
+                    for topic, events in by_topic.items():
+                        await producer.publish_many(topic, events)
+                except Exception as exc:
+                    report.failed += count
+                    logger.error("dlq_bulk_replay_publish_failed", error=str(exc))
+                    break
+                await consumer.commit()
+            report.replayed += count
+            for topic, events in by_topic.items():
+                report.by_topic[topic] = report.by_topic.get(topic, 0) + len(events)
+
+            # Pace on events sent so the average rate stays at rate_per_s.
+            if rate_per_s > 0:
+                delay = started + report.replayed / rate_per_s - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+        report.elapsed_s = time.monotonic() - started
+        logger.info(
+            "dlq_bulk_replay_finished",
+            replayed=report.replayed,
+            skipped=report.skipped,
+            failed=report.failed,
+            completed=report.completed,
+            dry_run=dry_run,
+            elapsed_s=round(report.elapsed_s, 3),
+        )
+        return report
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
 import structlog
@@ -11,23 +13,83 @@ from shieldops.messaging.topics import (
     AGENT_RESULTS_TOPIC,
     AUDIT_TOPIC,
     EVENTS_TOPIC,
+    EventEncoding,
     EventEnvelope,
+    encode_event,
     serialize_event,
 )
 
 logger = structlog.get_logger()
 
 
+class ProducerBufferFullError(RuntimeError):
+    """Raised when the in-memory send buffer stays full past the timeout."""
+
+
+def _record_options(
+    key: str | None,
+    headers: Sequence[tuple[str, bytes]] | None,
+) -> dict[str, Any]:
+    """Optional ``send`` keyword arguments, omitted when unset."""
+    options: dict[str, Any] = {}
+    if key is not None:
+        options["key"] = key.encode("utf-8")
+    if headers:
+        options["headers"] = list(headers)
+    return options
+
+
+def _serialize_value(value: EventEnvelope | bytes) -> bytes:
+    # Events for binary topics arrive already encoded by EventProducer.
+    if isinstance(value, bytes):
+        return value
+    return serialize_event(value)
+
+
 class EventProducer:
     """Publishes ``EventEnvelope`` messages to Kafka topics.
 
     The producer is **not** started automatically.  Call :meth:`start` before
     publishing and :meth:`stop` when shutting down.
+
+    :meth:`publish` waits for the broker acknowledgement of each event.
+    :meth:`publish_nowait` and :meth:`publish_many` instead hand events to
+    the client's batching accumulator (tuned by *linger_ms*,
+    *max_batch_size* and *compression_type*) and return delivery futures.
+    At most *max_buffered_messages* events may be awaiting delivery; further
+    sends wait for space (backpressure), or raise
+    :class:`ProducerBufferFullError` after *buffer_timeout_s* if set.
+
+    *encodings* maps topics to an :class:`EventEncoding`; topics not
+    listed are published as JSON. Consumers decode either format, so a
+    topic can be moved to ``msgpack`` once all of its consumers run a
+    version that understands binary frames.
     """
 
-    def __init__(self, brokers: str) -> None:
+    def __init__(
+        self,
+        brokers: str,
+        *,
+        linger_ms: int = 5,
+        max_batch_size: int = 16384,
+        compression_type: str | None = None,
+        max_buffered_messages: int = 10_000,
+        buffer_timeout_s: float | None = None,
+        encodings: Mapping[str, EventEncoding | str] | None = None,
+    ) -> None:
         self._brokers = brokers
+        self._encodings = {
+            topic: EventEncoding(encoding) for topic, encoding in (encodings or {}).items()
+        }
         self._producer: AIOKafkaProducer | None = None
+        self._linger_ms = linger_ms
+        self._max_batch_size = max_batch_size
+        self._compression_type = compression_type or None
+        self._max_buffered = max_buffered_messages
+        self._buffer_timeout_s = buffer_timeout_s
+        self._buffer = asyncio.Semaphore(max_buffered_messages)
+        self._buffered = 0
+        self._delivery_failures = 0
 
     # ── Lifecycle ────────────────────────────────────────────────────────
 
@@ -35,7 +97,10 @@ class EventProducer:
         """Create the underlying ``AIOKafkaProducer`` and start it."""
         self._producer = AIOKafkaProducer(
             bootstrap_servers=self._brokers,
-            value_serializer=serialize_event,
+            value_serializer=_serialize_value,
+            linger_ms=self._linger_ms,
+            max_batch_size=self._max_batch_size,
+            compression_type=self._compression_type,
         )
         await self._producer.start()
         logger.info("kafka_producer_started", brokers=self._brokers)
@@ -49,16 +114,28 @@ class EventProducer:
 
     # ── Core publish ─────────────────────────────────────────────────────
 
-    async def publish(self, topic: str, event: EventEnvelope) -> None:
+    async def publish(
+        self,
+        topic: str,
+        event: EventEnvelope,
+        key: str | None = None,
+        headers: Sequence[tuple[str, bytes]] | None = None,
+    ) -> None:
         """Serialize *event* and send it to *topic*.
 
         If the producer has not been started, the call is silently skipped
         with a warning log so that callers do not need to guard every call.
+        *key* selects the partition; *headers* are attached as Kafka record
+        headers (used for retry metadata).
         """
         if self._producer is None:
             logger.warning("kafka_producer_not_started", topic=topic)
             return
-        await self._producer.send_and_wait(topic, value=event)
+        await self._producer.send_and_wait(
+            topic,
+            value=self._encode(topic, event),
+            **_record_options(key, headers),
+        )
         logger.debug(
             "kafka_event_published",
             topic=topic,
@@ -66,6 +143,116 @@ class EventProducer:
             event_type=event.event_type,
         )
 
+    # ── Non-blocking / batched publish ───────────────────────────────────
+
+    async def publish_nowait(
+        self,
+        topic: str,
+        event: EventEnvelope,
+        key: str | None = None,
+        headers: Sequence[tuple[str, bytes]] | None = None,
+    ) -> asyncio.Future[Any]:
+        """Enqueue *event* for *topic* and return its delivery future.
+
+        Returns as soon as the event is in the client's send buffer. The
+        future resolves to the record metadata once the broker has
+        acknowledged the batch, or raises the delivery error. Failures are
+        also logged, so fire-and-forget callers may drop the future.
+        """
+        if self._producer is None:
+            logger.warning("kafka_producer_not_started", topic=topic)
+            skipped: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+            skipped.set_result(None)
+            return skipped
+
+        await self._acquire_buffer_slot(topic)
+        try:
+            delivery: asyncio.Future[Any] = await self._producer.send(
+                topic,
+                value=self._encode(topic, event),
+                key=key.encode("utf-8") if key is not None else None,
+                **({"headers": list(headers)} if headers else {}),
+            )
+        except BaseException:
+            self._release_buffer_slot()
+            raise
+        delivery.add_done_callback(
+            lambda fut: self._on_delivered(fut, topic, event.event_id),
+        )
+        return delivery
+
+    async def publish_many(
+        self,
+        topic: str,
+        events: Iterable[EventEnvelope],
+        *,
+        wait: bool = True,
+    ) -> list[asyncio.Future[Any]]:
+        """Publish *events* to *topic* in as few broker round-trips as possible.
+
+        All events are enqueued first so they share linger windows and
+        batches. With *wait* (the default) this returns once every event
+        has been acknowledged and raises the first delivery error; otherwise
+        it returns the delivery futures immediately after enqueueing.
+        """
+        futures = [await self.publish_nowait(topic, event) for event in events]
+        if wait and futures:
+            await asyncio.gather(*futures)
+        logger.debug("kafka_events_published", topic=topic, count=len(futures))
+        return futures
+
+    async def flush(self) -> None:
+        """Send everything buffered now, without waiting for *linger_ms*."""
+        if self._producer is not None:
+            await self._producer.flush()
+
+    def encoding_for(self, topic: str) -> EventEncoding:
+        """Return the wire encoding used for *topic*."""
+        return self._encodings.get(topic, EventEncoding.JSON)
+
+    def _encode(self, topic: str, event: EventEnvelope) -> EventEnvelope | bytes:
+        encoding = self._encodings.get(topic)
+        if encoding is None or encoding == EventEncoding.JSON:
+            return event
+        return encode_event(event, encoding)
+
+    @property
+    def buffered(self) -> int:
+        """Number of events enqueued but not yet acknowledged."""
+        return self._buffered
+
+    @property
+    def delivery_failures(self) -> int:
+        return self._delivery_failures
+
+    async def _acquire_buffer_slot(self, topic: str) -> None:
+        if self._buffer.locked():
+            logger.debug("kafka_producer_backpressure", topic=topic, buffered=self._buffered)
+        if self._buffer_timeout_s is None:
+            await self._buffer.acquire()
+        else:
+            try:
+                await asyncio.wait_for(self._buffer.acquire(), self._buffer_timeout_s)
+            except TimeoutError:
+                raise ProducerBufferFullError(
+                    f"{self._max_buffered} events awaiting delivery; "
+                    f"no space after {self._buffer_timeout_s}s"
+                ) from None
+        self._buffered += 1
+
+    def _release_buffer_slot(self) -> None:
+        self._buffered -= 1
+        self._buffer.release()
+
+    def _on_delivered(self, future: asyncio.Future[Any], topic: str, event_id: str) -> None:
+        self._release_buffer_slot()
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self._delivery_failures += 1
+            logger.error("kafka_delivery_failed", topic=topic, event_id=event_id, error=str(exc))
+
     # ── Convenience publishers ───────────────────────────────────────────
 
     async def publish_event(
@@ -88,27 +275,45 @@ class EventProducer:
         agent_type: str,
         result: dict[str, Any],
         correlation_id: str | None = None,
+        *,
+        wait: bool = True,
     ) -> EventEnvelope:
-        """Publish an agent result to the results topic."""
+        """Publish an agent result to the results topic.
+
+        Pass ``wait=False`` to return once the event is buffered instead of
+        waiting for the broker acknowledgement.
+        """
         envelope = EventEnvelope(
             event_type=f"agent.result.{agent_type}",
             source=f"agent.{agent_type}",
             payload=result,
             correlation_id=correlation_id,
         )
-        await self.publish(AGENT_RESULTS_TOPIC, envelope)
+        if wait:
+            await self.publish(AGENT_RESULTS_TOPIC, envelope)
+        else:
+            await self.publish_nowait(AGENT_RESULTS_TOPIC, envelope)
         return envelope
 
     async def publish_audit(
         self,
         action: str,
         details: dict[str, Any],
+        *,
+        wait: bool = True,
     ) -> EventEnvelope:
-        """Publish an audit entry to the immutable audit topic."""
+        """Publish an audit entry to the immutable audit topic.
+
+        Pass ``wait=False`` to return once the event is buffered instead of
+        waiting for the broker acknowledgement.
+        """
         envelope = EventEnvelope(
             event_type=f"audit.{action}",
             source="shieldops.audit",
             payload=details,
         )
-        await self.publish(AUDIT_TOPIC, envelope)
+        if wait:
+            await self.publish(AUDIT_TOPIC, envelope)
+        else:
+            await self.publish_nowait(AUDIT_TOPIC, envelope)
         return envelope
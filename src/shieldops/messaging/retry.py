@@ -0,0 +1,320 @@
+"""Tiered delay-retry topics for failed Kafka messages.
+
+A message whose handler fails is re-published to a retry topic chosen by
+its attempt number (``shieldops.retry.10s``, ``shieldops.retry.1m``,
+``shieldops.retry.10m`` by default) instead of being retried in place, so
+the source partition keeps moving. Retry state travels with the message
+in Kafka headers, which means it survives restarts and costs the consumer
+no memory.
+
+:class:`RetryTopicConsumer` reads the retry topics and, once a message's
+delay has elapsed, forwards it back to its original topic. Every message
+on a tier topic has the same delay, so the head of each partition is
+always the next one due: the partition is paused until then rather than
+sleeping in a handler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import structlog
+from aiokafka import (  # type: ignore[import-untyped]
+    AIOKafkaConsumer,
+    ConsumerRebalanceListener,
+)
+from pydantic import BaseModel
+
+from shieldops.messaging.producer import EventProducer
+from shieldops.messaging.topics import deserialize_event
+
+logger = structlog.get_logger()
+
+RETRY_TOPIC_PREFIX = "shieldops.retry"
+DEFAULT_RETRY_DELAYS_S: tuple[float, ...] = (10.0, 60.0, 600.0)
+
+# ── Retry headers ────────────────────────────────────────────────────────────
+
+HEADER_RETRY_COUNT = "shieldops-retry-count"
+HEADER_ORIGINAL_TOPIC = "shieldops-original-topic"
+HEADER_NOT_BEFORE = "shieldops-retry-not-before"
+HEADER_ERROR_TYPE = "shieldops-error-type"
+HEADER_FIRST_FAILED_AT = "shieldops-first-failed-at"
+
+_RETRY_HEADERS = frozenset(
+    {
+        HEADER_RETRY_COUNT,
+        HEADER_ORIGINAL_TOPIC,
+        HEADER_NOT_BEFORE,
+        HEADER_ERROR_TYPE,
+        HEADER_FIRST_FAILED_AT,
+    }
+)
+
+
+def retry_topic_name(delay_s: float) -> str:
+    """Return the tier topic for *delay_s*, e.g. ``shieldops.retry.1m``."""
+    seconds = int(delay_s)
+    if seconds >= 3600 and seconds % 3600 == 0:
+        label = f"{seconds // 3600}h"
+    elif seconds >= 60 and seconds % 60 == 0:
+        label = f"{seconds // 60}m"
+    else:
+        label = f"{seconds}s"
+    return f"{RETRY_TOPIC_PREFIX}.{label}"
+
+
+def retry_topics(delays: Sequence[float] = DEFAULT_RETRY_DELAYS_S) -> list[str]:
+    """Return the tier topics for *delays*, shortest delay first."""
+    return [retry_topic_name(delay) for delay in delays]
+
+
+class RetryMetadata(BaseModel):
+    """Retry state carried in the headers of a retried message.
+
+    Timestamps are epoch milliseconds so that they are comparable across
+    pods.
+    """
+
+    retry_count: int = 0
+    original_topic: str | None = None
+    not_before_ms: int = 0
+    error_type: str = ""
+    first_failed_at_ms: int = 0
+
+    @classmethod
+    def from_headers(cls, headers: Iterable[tuple[str, bytes]] | None) -> RetryMetadata:
+        """Parse the retry headers out of a Kafka message's headers.
+
+        Messages that were never retried (or carry malformed values) yield
+        the defaults, i.e. a first attempt.
+        """
+        values: dict[str, str] = {}
+        for name, raw in headers or ():
+            if name in _RETRY_HEADERS and isinstance(raw, bytes):
+                values[name] = raw.decode("utf-8", errors="replace")
+        if not values:
+            return cls()
+        try:
+            return cls(
+                retry_count=int(values.get(HEADER_RETRY_COUNT, 0)),
+                original_topic=values.get(HEADER_ORIGINAL_TOPIC) or None,
+                not_before_ms=int(values.get(HEADER_NOT_BEFORE, 0)),
+                error_type=values.get(HEADER_ERROR_TYPE, ""),
+                first_failed_at_ms=int(values.get(HEADER_FIRST_FAILED_AT, 0)),
+            )
+        except ValueError:
+            logger.warning("kafka_retry_headers_invalid", headers=sorted(values))
+            return cls()
+
+    def to_headers(self) -> list[tuple[str, bytes]]:
+        """Encode as Kafka ``(name, value)`` header pairs."""
+        headers = [
+            (HEADER_RETRY_COUNT, str(self.retry_count).encode()),
+            (HEADER_NOT_BEFORE, str(self.not_before_ms).encode()),
+            (HEADER_FIRST_FAILED_AT, str(self.first_failed_at_ms).encode()),
+        ]
+        if self.original_topic:
+            headers.append((HEADER_ORIGINAL_TOPIC, self.original_topic.encode()))
+        if self.error_type:
+            headers.append((HEADER_ERROR_TYPE, self.error_type.encode()))
+        return headers
+
+
+def message_key(message: Any) -> str | None:
+    """Return a Kafka message's key as text, or ``None`` when it has none."""
+    key = getattr(message, "key", None)
+    if isinstance(key, bytes):
+        return key.decode("utf-8", errors="replace")
+    return None
+
+
+# ── Retry topic consumer ─────────────────────────────────────────────────────
+
+
+class _ForgetRevokedPartitions(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Drops the pause state of partitions this worker no longer owns."""
+
+    def __init__(self, paused: dict[Any, float]) -> None:
+        self._paused = paused
+
+    async def on_partitions_revoked(self, revoked: Iterable[Any]) -> None:
+        for tp in revoked:
+            self._paused.pop(tp, None)
+
+    async def on_partitions_assigned(self, assigned: Iterable[Any]) -> None:
+        return None
+
+
+class RetryTopicConsumer:
+    """Forwards messages from the retry tiers back to their original topics.
+
+    Offsets are committed manually, and only after a message has been
+    forwarded, so a crash re-forwards rather than drops it (consumers are
+    expected to be idempotent, as with any at-least-once delivery).
+    A failed poll (a fetch or commit during a rebalance, say) is logged
+    and retried after ``error_backoff_s``.
+    """
+
+    def __init__(
+        self,
+        brokers: str,
+        producer: EventProducer,
+        delays: Sequence[float] = DEFAULT_RETRY_DELAYS_S,
+        group_id: str = "shieldops-retry",
+        *,
+        max_records: int = 500,
+        poll_timeout_ms: int = 1000,
+        forward_backoff_s: float = 1.0,
+        error_backoff_s: float = 5.0,
+    ) -> None:
+        self._brokers = brokers
+        self._producer = producer
+        self._topics = retry_topics(delays)
+        self._group_id = group_id
+        self._max_records = max_records
+        self._poll_timeout_ms = poll_timeout_ms
+        self._forward_backoff_s = forward_backoff_s
+        self._error_backoff_s = error_backoff_s
+        self._consumer: AIOKafkaConsumer | None = None
+        # Paused partition -> epoch seconds at which to resume it.
+        self._paused: dict[Any, float] = {}
+        self._forwarded = 0
+
+    @property
+    def topics(self) -> list[str]:
+        return list(self._topics)
+
+    @property
+    def forwarded(self) -> int:
+        """Number of messages forwarded back to their original topics."""
+        return self._forwarded
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Create and start the underlying Kafka consumer."""
+        self._consumer = AIOKafkaConsumer(
+            bootstrap_servers=self._brokers,
+            group_id=self._group_id,
+            enable_auto_commit=False,
+            value_deserializer=lambda raw: deserialize_event(raw),
+        )
+        self._consumer.subscribe(self._topics, listener=_ForgetRevokedPartitions(self._paused))
+        await self._consumer.start()
+        logger.info("kafka_retry_consumer_started", topics=self._topics)
+
+    async def stop(self) -> None:
+        """Stop the consumer and release resources."""
+        if self._consumer is not None:
+            await self._consumer.stop()
+            self._consumer = None
+            self._paused.clear()
+            logger.info("kafka_retry_consumer_stopped")
+
+    # ── Processing ───────────────────────────────────────────────────────
+
+    async def run(self) -> None:
+        """Forward due messages until cancelled."""
+        if self._consumer is None:
+            logger.warning("kafka_retry_consumer_not_started")
+            return
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "kafka_retry_poll_failed",
+                    error=str(exc),
+                    backoff_s=self._error_backoff_s,
+                )
+                await asyncio.sleep(self._error_backoff_s)
+
+    async def poll_once(self) -> int:
+        """Fetch one batch, forward every due message, and commit.
+
+        Returns the number of messages forwarded.
+        """
+        consumer = self._consumer
+        if consumer is None:
+            return 0
+        self._resume_due()
+
+        timeout_ms = self._poll_timeout_ms
+        if self._paused:
+            until_next = (min(self._paused.values()) - time.time()) * 1000
+            timeout_ms = max(0, min(timeout_ms, int(until_next)))
+        batch = await consumer.getmany(timeout_ms=timeout_ms, max_records=self._max_records)
+
+        forwarded = 0
+        offsets: dict[Any, int] = {}
+        for tp, messages in batch.items():
+            for message in messages:
+                meta = RetryMetadata.from_headers(message.headers)
+                if meta.not_before_ms > time.time() * 1000:
+                    self._hold(tp, message.offset, meta.not_before_ms / 1000)
+                    break
+                if not await self._forward(message, meta):
+                    self._hold(tp, message.offset, time.time() + self._forward_backoff_s)
+                    break
+                offsets[tp] = message.offset + 1
+                forwarded += 1
+
+        if offsets:
+            await consumer.commit(offsets)
+        self._forwarded += forwarded
+        return forwarded
+
+    def _hold(self, tp: Any, offset: int, resume_at: float) -> None:
+        # Rewind so the held message is fetched again once resumed.
+        if self._consumer is None:
+            return
+        self._consumer.seek(tp, offset)
+        self._consumer.pause(tp)
+        self._paused[tp] = resume_at
+
+    def _resume_due(self) -> None:
+        now = time.time()
+        due = [tp for tp, resume_at in self._paused.items() if resume_at <= now]
+        if due and self._consumer is not None:
+            for tp in due:
+                del self._paused[tp]
+            self._consumer.resume(*due)
+
+    async def _forward(self, message: Any, meta: RetryMetadata) -> bool:
+        event = message.value
+        if not meta.original_topic:
+            # Nowhere to send it; skipping keeps the tier from wedging.
+            logger.error(
+                "kafka_retry_missing_original_topic",
+                topic=message.topic,
+                offset=message.offset,
+            )
+            return True
+        try:
+            await self._producer.publish(
+                meta.original_topic,
+                event,
+                key=message_key(message),
+                headers=meta.to_headers(),
+            )
+        except Exception as exc:
+            logger.warning(
+                "kafka_retry_forward_failed",
+                topic=message.topic,
+                offset=message.offset,
+                error=str(exc),
+            )
+            return False
+        logger.debug(
+            "kafka_retry_forwarded",
+            event_id=event.event_id,
+            original_topic=meta.original_topic,
+            retry_count=meta.retry_count,
+        )
+        return True
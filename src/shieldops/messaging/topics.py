@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import json
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from typing import Any
 
+import msgpack  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field
+from pydantic_core import to_jsonable_python
 
 # ── Topic constants ──────────────────────────────────────────────────────────
 
@@ -60,6 +64,32 @@ class DLQEnvelope(BaseModel):
 
 
 # ── Serialization helpers ────────────────────────────────────────────────────
+#
+# Two wire formats share every topic, told apart by their first byte:
+#
+# * JSON — the envelope as a UTF-8 JSON object (always starts with ``{``).
+# * Binary — ``0xC1`` (a byte msgpack never emits), a schema version byte,
+#   then a msgpack array ``[event_id, event_type, source, timestamp_us,
+#   correlation_id, payload]`` where ``payload`` is itself msgpack carried
+#   as an opaque ``bin`` so the header can be read without decoding it.
+#
+# Consumers accept both, so a topic is switched to binary by configuring
+# its producers (``EventProducer(encodings=...)``) once every consumer of
+# it understands the binary frame.
+
+
+class EventEncoding(StrEnum):
+    """Wire encoding used for events published to a topic."""
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+BINARY_MAGIC = 0xC1
+EVENT_SCHEMA_VERSION = 1
+
+_BINARY_PREFIX = bytes((BINARY_MAGIC, EVENT_SCHEMA_VERSION))
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 
 def serialize_event(envelope: EventEnvelope) -> bytes:
@@ -67,6 +97,143 @@ def serialize_event(envelope: EventEnvelope) -> bytes:
     return envelope.model_dump_json().encode("utf-8")
 
 
+def encode_event(
+    envelope: EventEnvelope,
+    encoding: EventEncoding | str = EventEncoding.JSON,
+) -> bytes:
+    """Serialize *envelope* in the given wire *encoding*."""
+    if encoding == EventEncoding.MSGPACK:
+        return _encode_binary(envelope)
+    return serialize_event(envelope)
+
+
 def deserialize_event(data: bytes) -> EventEnvelope:
-    """Deserialize UTF-8 JSON bytes back into an ``EventEnvelope``."""
+    """Deserialize a JSON or binary frame back into an ``EventEnvelope``."""
+    if data[:1] == _BINARY_PREFIX[:1]:
+        return decode_event_lazy(data).envelope()
     return EventEnvelope.model_validate(json.loads(data))
+
+
+def decode_event_lazy(data: bytes) -> LazyEvent:
+    """Decode the envelope header of a frame, leaving the payload encoded.
+
+    For binary frames the payload is only unpacked when
+    :attr:`LazyEvent.payload` is first read, so routing on
+    ``event_type`` costs no payload decoding. JSON frames are parsed in
+    full, as the format cannot be read partially.
+    """
+    if data[:1] != _BINARY_PREFIX[:1]:
+        return LazyEvent.from_envelope(EventEnvelope.model_validate(json.loads(data)))
+    version = data[1] if len(data) > 1 else None
+    if version != EVENT_SCHEMA_VERSION:
+        raise ValueError(f"unsupported event schema version: {version}")
+    fields = msgpack.unpackb(data[2:], raw=False)
+    if not isinstance(fields, list) or len(fields) != 6:
+        raise ValueError("malformed binary event frame")
+    event_id, event_type, source, timestamp_us, correlation_id, payload = fields
+    return LazyEvent(event_id, event_type, source, timestamp_us, correlation_id, payload)
+
+
+def _timestamp_us(timestamp: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def _encode_binary(envelope: EventEnvelope) -> bytes:
+    timestamp_us = _timestamp_us(envelope.timestamp)
+    payload = msgpack.packb(envelope.payload, default=to_jsonable_python)
+    body = msgpack.packb(
+        [
+            envelope.event_id,
+            envelope.event_type,
+            envelope.source,
+            timestamp_us,
+            envelope.correlation_id,
+            payload,
+        ],
+        use_bin_type=True,
+    )
+    return _BINARY_PREFIX + body
+
+
+class LazyEvent:
+    """Envelope header of a decoded frame with an on-demand payload.
+
+    :meth:`envelope` builds the full :class:`EventEnvelope`; binary frames
+    come only from :func:`encode_event`, so it is constructed without
+    re-validation.
+    """
+
+    __slots__ = (
+        "_envelope",
+        "_payload",
+        "_raw_payload",
+        "correlation_id",
+        "event_id",
+        "event_type",
+        "source",
+        "timestamp_us",
+    )
+
+    def __init__(
+        self,
+        event_id: str,
+        event_type: str,
+        source: str,
+        timestamp_us: int,
+        correlation_id: str | None,
+        raw_payload: bytes | None,
+    ) -> None:
+        self.event_id = event_id
+        self.event_type = event_type
+        self.source = source
+        self.timestamp_us = timestamp_us
+        self.correlation_id = correlation_id
+        self._raw_payload = raw_payload
+        self._payload: dict[str, Any] | None = None
+        self._envelope: EventEnvelope | None = None
+
+    @classmethod
+    def from_envelope(cls, envelope: EventEnvelope) -> LazyEvent:
+        lazy = cls(
+            envelope.event_id,
+            envelope.event_type,
+            envelope.source,
+            _timestamp_us(envelope.timestamp),
+            envelope.correlation_id,
+            None,
+        )
+        lazy._payload = envelope.payload
+        lazy._envelope = envelope
+        return lazy
+
+    @property
+    def payload_decoded(self) -> bool:
+        return self._payload is not None
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        if self._payload is None:
+            raw = self._raw_payload
+            self._payload = msgpack.unpackb(raw, raw=False) if raw else {}
+            self._raw_payload = None
+        return self._payload
+
+    @property
+    def timestamp(self) -> datetime:
+        return _EPOCH + timedelta(microseconds=self.timestamp_us)
+
+    def envelope(self) -> EventEnvelope:
+        """Return the full :class:`EventEnvelope`, decoding the payload."""
+        if self._envelope is None:
+            self._envelope = EventEnvelope.model_construct(
+                event_id=self.event_id,
+                event_type=self.event_type,
+                source=self.source,
+                timestamp=self.timestamp,
+                payload=self.payload,
+                correlation_id=self.correlation_id,
+            )
+        return self._envelope
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class AdaptiveRetrievalStrategyEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AdaptiveRetrievalRecord] = []
+        self._records: RecordStore[AdaptiveRetrievalRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AdaptiveRetrievalAnalysis] = {}
         logger.info("adaptive_retrieval_strategy_engine.init", max_records=max_records)
 
@@ -114,8 +116,6 @@ class AdaptiveRetrievalStrategyEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adaptive_retrieval.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class AdaptiveRetrievalStrategyEngine:
         return record
 
     def process(self, key: str) -> AdaptiveRetrievalAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         eff = round(rec.signal_score / max(rec.query_cost_ms, 1.0) * 1000, 4)
@@ -197,7 +193,7 @@ class AdaptiveRetrievalStrategyEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("adaptive_retrieval_strategy_engine.cleared")
         return {"status": "cleared"}
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class AdaptiveThresholdEngine:
     ) -> None:
         self._max_records = max_records
         self._fp_rate_threshold = fp_rate_threshold
-        self._records: list[ThresholdRecord] = []
+        self._records: RecordStore[ThresholdRecord] = RecordStore(self._max_records)
         self._analyses: list[ThresholdAnalysis] = []
         logger.info(
             "adaptive_threshold_engine.initialized",
@@ -130,8 +132,6 @@ class AdaptiveThresholdEngine:
             health=health,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adaptive_threshold_engine.record_added",
             record_id=record.id,
@@ -77,7 +77,7 @@ class AgentMetricsCollector:
 
     Each method corresponds to a specific instrumentation point in the
     agent lifecycle.  All operations are thread-safe (delegated to the
-    registry's internal lock).
+    registry's per-thread shards).
     """
 
     def __init__(self, registry: MetricsRegistry | None = None) -> None:
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AlertCorrelationCascadeEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AlertCorrelationRecord] = []
+        self._records: RecordStore[AlertCorrelationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AlertCorrelationAnalysis] = {}
         logger.info(
             "alert_correlation_cascade.init",
@@ -118,8 +120,6 @@ class AlertCorrelationCascadeEngine:
             source=source,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_correlation.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class AlertCorrelationCascadeEngine:
         return record
 
     def process(self, key: str) -> AlertCorrelationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         cascade_members = [r for r in self._records if r.cascade_id == rec.cascade_id]
@@ -204,7 +200,7 @@ class AlertCorrelationCascadeEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("alert_correlation_cascade.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class AlertCorrelationOptimizer:
     ) -> None:
         self._max_records = max_records
         self._min_correlation_strength = min_correlation_strength
-        self._records: list[CorrelationRecord] = []
+        self._records: RecordStore[CorrelationRecord] = RecordStore(self._max_records)
         self._rules: list[CorrelationRule] = []
         logger.info(
             "alert_correlation_opt.initialized",
@@ -120,8 +122,6 @@ class AlertCorrelationOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_correlation_opt.correlation_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class AlertCorrelationOptimizer:
         return record
 
     def get_correlation(self, record_id: str) -> CorrelationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_correlations(
         self,
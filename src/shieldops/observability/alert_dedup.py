@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,9 @@ class AlertDeduplicationEngine:
     ) -> None:
         self._max_records = max_records
         self._min_dedup_ratio_pct = min_dedup_ratio_pct
-        self._records: list[DedupRecord] = []
+        self._records: RecordStore[DedupRecord] = RecordStore(
+            max_records, indexes=("strategy", "result", "priority")
+        )
         self._rules: list[DedupRule] = []
         logger.info(
             "alert_dedup.initialized",
@@ -131,8 +135,6 @@ class AlertDeduplicationEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_dedup.recorded",
             record_id=record.id,
@@ -142,10 +144,7 @@ class AlertDeduplicationEngine:
         return record
 
     def get_dedup(self, record_id: str) -> DedupRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dedups(
         self,
@@ -154,14 +153,14 @@ class AlertDeduplicationEngine:
         priority: AlertPriority | None = None,
         limit: int = 50,
     ) -> list[DedupRecord]:
-        results = list(self._records)
+        filters: dict[str, Any] = {}
         if strategy is not None:
-            results = [r for r in results if r.strategy == strategy]
+            filters["strategy"] = strategy
         if result is not None:
-            results = [r for r in results if r.result == result]
+            filters["result"] = result
         if priority is not None:
-            results = [r for r in results if r.priority == priority]
-        return results[-limit:]
+            filters["priority"] = priority
+        return self._records.where(**filters)[-limit:]
 
     def add_rule(
         self,
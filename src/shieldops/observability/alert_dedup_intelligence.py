@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AlertDedupIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AlertDedupRecord] = []
+        self._records: RecordStore[AlertDedupRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AlertDedupAnalysis] = {}
         logger.info(
             "alert_dedup_intelligence.init",
@@ -118,8 +120,6 @@ class AlertDedupIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_dedup.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class AlertDedupIntelligence:
         return record
 
     def process(self, key: str) -> AlertDedupAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         dupes = sum(1 for r in self._records if r.fingerprint == rec.fingerprint)
@@ -200,7 +196,7 @@ class AlertDedupIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("alert_dedup_intelligence.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AlertNoiseProfiler:
     ) -> None:
         self._max_records = max_records
         self._max_noise_ratio = max_noise_ratio
-        self._records: list[NoiseProfileRecord] = []
+        self._records: RecordStore[NoiseProfileRecord] = RecordStore(self._max_records)
         self._assessments: list[NoiseAssessment] = []
         logger.info(
             "alert_noise_profiler.initialized",
@@ -124,8 +126,6 @@ class AlertNoiseProfiler:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_noise_profiler.profile_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AlertNoiseProfiler:
         return record
 
     def get_profile(self, record_id: str) -> NoiseProfileRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_profiles(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AlertPriorityOptimizer:
     ) -> None:
         self._max_records = max_records
         self._max_misalignment_pct = max_misalignment_pct
-        self._records: list[PriorityRecord] = []
+        self._records: RecordStore[PriorityRecord] = RecordStore(self._max_records)
         self._rules: list[PriorityRule] = []
         logger.info(
             "alert_priority.initialized",
@@ -123,8 +125,6 @@ class AlertPriorityOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_priority.priority_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class AlertPriorityOptimizer:
         return record
 
     def get_priority(self, record_id: str) -> PriorityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_priorities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class AlertRoutingOptimizer:
     ) -> None:
         self._max_records = max_records
         self._max_response_seconds = max_response_seconds
-        self._records: list[RoutingRecord] = []
+        self._records: RecordStore[RoutingRecord] = RecordStore(self._max_records)
         self._policies: list[RoutingPolicy] = []
         logger.info(
             "alert_routing_optimizer.initialized",
@@ -116,8 +118,6 @@ class AlertRoutingOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_routing_optimizer.routing_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class AlertRoutingOptimizer:
         return record
 
     def get_routing(self, record_id: str) -> RoutingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_routings(
         self,
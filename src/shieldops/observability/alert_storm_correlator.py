@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class AlertStormCorrelator:
     ) -> None:
         self._max_records = max_records
         self._storm_window_seconds = storm_window_seconds
-        self._records: list[AlertStorm] = []
+        self._records: RecordStore[AlertStorm] = RecordStore(self._max_records)
         logger.info(
             "alert_storm_correlator.initialized",
             max_records=max_records,
@@ -112,8 +114,6 @@ class AlertStormCorrelator:
             method=method,
         )
         self._records.append(storm)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_storm_correlator.recorded",
             storm_id=storm.id,
@@ -123,10 +123,7 @@ class AlertStormCorrelator:
         return storm
 
     def get_storm(self, storm_id: str) -> AlertStorm | None:
-        for s in self._records:
-            if s.id == storm_id:
-                return s
-        return None
+        return self._records.get(storm_id)
 
     def list_storms(
         self,
@@ -188,8 +185,6 @@ class AlertStormCorrelator:
         storm_alerts[0].is_root_cause = True
         storm.root_cause_alert_id = storm_alerts[0].id
         self._records.append(storm)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_storm_correlator.storm_detected",
             storm_id=storm.id,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class AnomalySelfLearningEngine:
     ) -> None:
         self._max_records = max_records
         self._accuracy_threshold = accuracy_threshold
-        self._records: list[AnomalyLearningRecord] = []
+        self._records: RecordStore[AnomalyLearningRecord] = RecordStore(self._max_records)
         self._analyses: list[AnomalyLearningAnalysis] = []
         logger.info(
             "anomaly_self_learning_engine.initialized",
@@ -128,8 +130,6 @@ class AnomalySelfLearningEngine:
             sensitivity_level=sensitivity_level,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "anomaly_self_learning_engine.record_added",
             record_id=record.id,
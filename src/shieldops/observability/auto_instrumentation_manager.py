@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,9 @@ class AutoInstrumentationManager:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AutoInstrumentationManagerRecord] = []
+        self._records: RecordStore[AutoInstrumentationManagerRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: list[AutoInstrumentationManagerAnalysis] = []
         logger.info(
             "auto.instrumentation.manager.initialized",
@@ -119,8 +123,6 @@ class AutoInstrumentationManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "auto.instrumentation.manager.record_added",
             record_id=record.id,
@@ -130,22 +132,22 @@ class AutoInstrumentationManager:
 
     def process(self, key: str) -> dict[str, Any]:
         """Find record by id, create analysis."""
-        for r in self._records:
-            if r.id == key:
-                analysis = AutoInstrumentationManagerAnalysis(
-                    name=r.name,
-                    instrumentation_target=(r.instrumentation_target),
-                    analysis_score=r.score,
-                    threshold=self._threshold,
-                    breached=(r.score < self._threshold),
-                    description=(f"Processed {r.name}"),
-                )
-                self._analyses.append(analysis)
-                return {
-                    "status": "processed",
-                    "analysis_id": analysis.id,
-                    "breached": analysis.breached,
-                }
+        r = self._records.get(key)
+        if r is not None:
+            analysis = AutoInstrumentationManagerAnalysis(
+                name=r.name,
+                instrumentation_target=(r.instrumentation_target),
+                analysis_score=r.score,
+                threshold=self._threshold,
+                breached=(r.score < self._threshold),
+                description=(f"Processed {r.name}"),
+            )
+            self._analyses.append(analysis)
+            return {
+                "status": "processed",
+                "analysis_id": analysis.id,
+                "breached": analysis.breached,
+            }
         return {"status": "not_found", "key": key}
 
     # -- domain methods ---
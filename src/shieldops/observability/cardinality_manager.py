@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class MetricCardinalityManager:
     ) -> None:
         self._max_records = max_records
         self._max_cardinality_threshold = max_cardinality_threshold
-        self._records: list[CardinalityRecord] = []
+        self._records: RecordStore[CardinalityRecord] = RecordStore(self._max_records)
         self._rules: list[CardinalityRule] = []
         logger.info(
             "cardinality_manager.initialized",
@@ -133,8 +135,6 @@ class MetricCardinalityManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cardinality_manager.metric_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class MetricCardinalityManager:
         return record
 
     def get_metric(self, record_id: str) -> CardinalityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
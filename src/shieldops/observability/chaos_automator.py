@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ChaosExperimentAutomator:
     ) -> None:
         self._max_records = max_records
         self._min_pass_rate_pct = min_pass_rate_pct
-        self._records: list[ChaosRecord] = []
+        self._records: RecordStore[ChaosRecord] = RecordStore(self._max_records)
         self._schedules: list[ChaosSchedule] = []
         logger.info(
             "chaos_automator.initialized",
@@ -116,8 +118,6 @@ class ChaosExperimentAutomator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "chaos_automator.experiment_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ChaosExperimentAutomator:
         return record
 
     def get_experiment(self, record_id: str) -> ChaosRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_experiments(
         self,
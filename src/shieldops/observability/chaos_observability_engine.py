@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ChaosObservabilityEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ChaosObservabilityRecord] = []
+        self._records: RecordStore[ChaosObservabilityRecord] = RecordStore(self._max_records)
         self._analyses: list[ChaosObservabilityAnalysis] = []
         logger.info(
             "chaos.observability.engine.initialized",
@@ -122,8 +124,6 @@ class ChaosObservabilityEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "chaos.observability.engine.record_added",
             record_id=record.id,
@@ -133,10 +133,7 @@ class ChaosObservabilityEngine:
         return record
 
     def get_record(self, record_id: str) -> ChaosObservabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
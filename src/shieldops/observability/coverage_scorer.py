@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ObservabilityCoverageScorer:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[ServiceCoverageRecord] = []
+        self._records: RecordStore[ServiceCoverageRecord] = RecordStore(self._max_records)
         self._gaps: list[CoverageGap] = []
         logger.info(
             "coverage_scorer.initialized",
@@ -137,8 +139,6 @@ class ObservabilityCoverageScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "coverage_scorer.coverage_recorded",
             record_id=record.id,
@@ -149,10 +149,7 @@ class ObservabilityCoverageScorer:
         return record
 
     def get_coverage(self, record_id: str) -> ServiceCoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coverage(
         self,
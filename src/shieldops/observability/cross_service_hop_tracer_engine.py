@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class CrossServiceHopTracerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CrossServiceHopRecord] = []
+        self._records: RecordStore[CrossServiceHopRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CrossServiceHopAnalysis] = {}
         logger.info("cross_service_hop_tracer_engine.init", max_records=max_records)
 
@@ -118,8 +120,6 @@ class CrossServiceHopTracerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_service_hop_tracer.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class CrossServiceHopTracerEngine:
         return record
 
     def process(self, key: str) -> CrossServiceHopAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_blocked = rec.tracing_completeness == TracingCompleteness.BLOCKED_TRACE
@@ -202,7 +198,7 @@ class CrossServiceHopTracerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cross_service_hop_tracer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DashboardEffectivenessScorer:
     ) -> None:
         self._max_records = max_records
         self._min_effectiveness_score = min_effectiveness_score
-        self._records: list[DashboardRecord] = []
+        self._records: RecordStore[DashboardRecord] = RecordStore(self._max_records)
         self._metrics: list[UsageMetric] = []
         logger.info(
             "dashboard_effectiveness.initialized",
@@ -120,8 +122,6 @@ class DashboardEffectivenessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dashboard_effectiveness.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class DashboardEffectivenessScorer:
         return record
 
     def get_dashboard(self, record_id: str) -> DashboardRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dashboards(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class DashboardIntelligenceEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[DashboardRecord] = []
+        self._records: RecordStore[DashboardRecord] = RecordStore(self._max_records)
         self._analyses: list[DashboardAnalysis] = []
         logger.info(
             "dashboard_intelligence_engine.initialized",
@@ -127,8 +129,6 @@ class DashboardIntelligenceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dashboard_intelligence_engine.entry_recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class DashboardIntelligenceEngine:
         return record
 
     def get_record(self, record_id: str) -> DashboardRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DashboardQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._min_quality_score = min_quality_score
-        self._records: list[DashboardScoreRecord] = []
+        self._records: RecordStore[DashboardScoreRecord] = RecordStore(self._max_records)
         self._issues: list[DashboardIssue] = []
         logger.info(
             "dashboard_quality.initialized",
@@ -169,8 +171,6 @@ class DashboardQualityScorer:
         record.score = score
         record.grade = self._score_to_grade(score)
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dashboard_quality.dashboard_recorded",
             record_id=record.id,
@@ -181,10 +181,7 @@ class DashboardQualityScorer:
         return record
 
     def get_dashboard(self, record_id: str) -> DashboardScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dashboards(
         self,
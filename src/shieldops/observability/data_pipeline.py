@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class DataPipelineReliabilityMonitor:
     ) -> None:
         self._max_records = max_records
         self._freshness_threshold_seconds = freshness_threshold_seconds
-        self._records: list[PipelineRunRecord] = []
+        self._records: RecordStore[PipelineRunRecord] = RecordStore(self._max_records)
         self._quality_issues: list[DataQualityRecord] = []
         logger.info(
             "data_pipeline.initialized",
@@ -119,8 +121,6 @@ class DataPipelineReliabilityMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_pipeline.run_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class DataPipelineReliabilityMonitor:
         return record
 
     def get_run(self, record_id: str) -> PipelineRunRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_runs(
         self,
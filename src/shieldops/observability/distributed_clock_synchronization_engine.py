@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class DistributedClockSynchronizationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ClockSyncRecord] = []
+        self._records: RecordStore[ClockSyncRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ClockSyncAnalysis] = {}
         logger.info("distributed_clock_synchronization_engine.init", max_records=max_records)
 
@@ -121,8 +123,6 @@ class DistributedClockSynchronizationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "clock_sync.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class DistributedClockSynchronizationEngine:
         return record
 
     def process(self, key: str) -> ClockSyncAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sev_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -205,7 +201,7 @@ class DistributedClockSynchronizationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("distributed_clock_synchronization_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class DistributedContextEnrichmentEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DistributedContextRecord] = []
+        self._records: RecordStore[DistributedContextRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DistributedContextAnalysis] = {}
         logger.info("distributed_context_enrichment_engine.init", max_records=max_records)
 
@@ -121,8 +123,6 @@ class DistributedContextEnrichmentEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "distributed_context.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class DistributedContextEnrichmentEngine:
         return record
 
     def process(self, key: str) -> DistributedContextAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         penalty = (rec.missing_keys * 5.0) + (rec.stale_fields * 2.0)
@@ -202,7 +198,7 @@ class DistributedContextEnrichmentEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("distributed_context_enrichment_engine.cleared")
         return {"status": "cleared"}
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -116,7 +118,7 @@ class DistributedContextTracker:
         self._max_records = max_records
         self._max_baggage_size = max_baggage_size_bytes
         self._max_hop_count = max_hop_count
-        self._records: list[ContextRecord] = []
+        self._records: RecordStore[ContextRecord] = RecordStore(self._max_records)
         self._analyses: list[ContextAnalysis] = []
         logger.info(
             "distributed_context_tracker.initialized",
@@ -170,8 +172,6 @@ class DistributedContextTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "distributed_context_tracker.record_added",
             record_id=record.id,
@@ -183,10 +183,7 @@ class DistributedContextTracker:
         return record
 
     def get_record(self, record_id: str) -> ContextRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DNSHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_resolution_ms = max_resolution_ms
-        self._records: list[DNSRecord] = []
+        self._records: RecordStore[DNSRecord] = RecordStore(self._max_records)
         self._policies: list[DNSPolicy] = []
         logger.info(
             "dns_health_monitor.initialized",
@@ -116,8 +118,6 @@ class DNSHealthMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dns_health_monitor.check_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DNSHealthMonitor:
         return record
 
     def get_check(self, record_id: str) -> DNSRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_checks(
         self,
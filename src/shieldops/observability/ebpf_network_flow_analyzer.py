@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -123,7 +125,7 @@ class EbpfNetworkFlowAnalyzer:
         self._max_records = max_records
         self._latency_threshold_us = latency_threshold_us
         self._retransmit_threshold = retransmit_threshold
-        self._records: list[NetworkFlowRecord] = []
+        self._records: RecordStore[NetworkFlowRecord] = RecordStore(self._max_records)
         self._analyses: list[FlowAnalysis] = []
         logger.info(
             "ebpf_network_flow_analyzer.initialized",
@@ -169,8 +171,6 @@ class EbpfNetworkFlowAnalyzer:
             node=node,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ebpf_network_flow_analyzer.record_added",
             record_id=record.id,
@@ -181,10 +181,7 @@ class EbpfNetworkFlowAnalyzer:
         return record
 
     def get_record(self, record_id: str) -> NetworkFlowRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
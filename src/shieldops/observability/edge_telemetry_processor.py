@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class EdgeTelemetryProcessor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[EdgeTelemetryRecord] = []
+        self._records: RecordStore[EdgeTelemetryRecord] = RecordStore(self._max_records)
         self._analyses: list[EdgeTelemetryAnalysis] = []
         logger.info(
             "edge_telemetry_processor.initialized",
@@ -125,8 +127,6 @@ class EdgeTelemetryProcessor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "edge_telemetry_processor.record_added",
             record_id=record.id,
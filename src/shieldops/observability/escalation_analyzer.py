@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class AlertEscalationAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_escalation_rate_pct = max_escalation_rate_pct
-        self._records: list[EscalationRecord] = []
+        self._records: RecordStore[EscalationRecord] = RecordStore(self._max_records)
         self._patterns: list[EscalationPattern] = []
         logger.info(
             "escalation_analyzer.initialized",
@@ -124,8 +126,6 @@ class AlertEscalationAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "escalation_analyzer.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AlertEscalationAnalyzer:
         return record
 
     def get_escalation(self, record_id: str) -> EscalationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_escalations(
         self,
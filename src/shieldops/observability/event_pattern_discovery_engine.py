@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class EventPatternDiscoveryEngine:
     ) -> None:
         self._max_records = max_records
         self._min_occurrences = min_occurrences
-        self._records: list[EventPatternRecord] = []
+        self._records: RecordStore[EventPatternRecord] = RecordStore(self._max_records)
         self._analyses: list[EventPatternAnalysis] = []
         logger.info(
             "event_pattern_discovery_engine.initialized",
@@ -128,8 +130,6 @@ class EventPatternDiscoveryEngine:
             lead_time_minutes=lead_time_minutes,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "event_pattern_discovery_engine.record_added",
             record_id=record.id,
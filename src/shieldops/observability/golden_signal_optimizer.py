@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -107,7 +109,7 @@ class GoldenSignalOptimizer:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
         self._sli_gap_threshold = sli_gap_threshold
-        self._records: list[GoldenSignalRecord] = []
+        self._records: RecordStore[GoldenSignalRecord] = RecordStore(self._max_records)
         self._recommendations: list[ThresholdRecommendation] = []
         logger.info(
             "golden_signal_optimizer.initialized",
@@ -152,8 +154,6 @@ class GoldenSignalOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "golden_signal_optimizer.record_added",
             record_id=record.id,
@@ -164,10 +164,7 @@ class GoldenSignalOptimizer:
         return record
 
     def get_record(self, record_id: str) -> GoldenSignalRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
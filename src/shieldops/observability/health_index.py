@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PlatformHealthIndex:
     ) -> None:
         self._max_records = max_records
         self._min_score_pct = min_score_pct
-        self._records: list[HealthIndexRecord] = []
+        self._records: RecordStore[HealthIndexRecord] = RecordStore(self._max_records)
         self._dimensions: list[DimensionScore] = []
         logger.info(
             "health_index.initialized",
@@ -116,8 +118,6 @@ class PlatformHealthIndex:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "health_index.index_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PlatformHealthIndex:
         return record
 
     def get_index(self, record_id: str) -> HealthIndexRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_indices(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class HopComplexityDistributionEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[HopComplexityDistributionRecord] = []
+        self._records: RecordStore[HopComplexityDistributionRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, HopComplexityDistributionAnalysis] = {}
         logger.info("hop_complexity_distribution_engine.init", max_records=max_records)
 
@@ -112,8 +114,6 @@ class HopComplexityDistributionEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "hop_complexity_distribution.record_added",
             record_id=record.id,
@@ -122,11 +122,7 @@ class HopComplexityDistributionEngine:
         return record
 
     def process(self, key: str) -> HopComplexityDistributionAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         shift = rec.distribution_trend in (
@@ -207,7 +203,7 @@ class HopComplexityDistributionEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("hop_complexity_distribution_engine.cleared")
         return {"status": "cleared"}
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -114,7 +116,7 @@ class IntelligentAlertGrouping:
         self._max_records = max_records
         self._similarity_threshold = similarity_threshold
         self._temporal_window_sec = temporal_window_sec
-        self._records: list[AlertGroupRecord] = []
+        self._records: RecordStore[AlertGroupRecord] = RecordStore(self._max_records)
         self._analyses: list[GroupAnalysis] = []
         logger.info(
             "intelligent_alert_grouping.initialized",
@@ -158,8 +160,6 @@ class IntelligentAlertGrouping:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "intelligent_alert_grouping.record_added",
             record_id=record.id,
@@ -186,10 +186,7 @@ class IntelligentAlertGrouping:
         return str(uuid.uuid4())
 
     def get_record(self, record_id: str) -> AlertGroupRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -83,7 +85,7 @@ class IntelligentLogRouting:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[LogRoutingRecord] = []
+        self._records: RecordStore[LogRoutingRecord] = RecordStore(self._max_records)
         self._rules: list[RoutingRule] = []
         logger.info("intelligent_log_routing.initialized", max_records=max_records)
 
@@ -128,8 +130,6 @@ class IntelligentLogRouting:
             cost_per_gb=cost,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         return record
 
     def _determine_tier(self, category: LogCategory, volume: int) -> LogTier:
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,9 @@ class InvestigationReasoningDepthEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[InvestigationReasoningDepthRecord] = []
+        self._records: RecordStore[InvestigationReasoningDepthRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: dict[str, InvestigationReasoningDepthAnalysis] = {}
         logger.info("investigation_reasoning_depth_engine.init", max_records=max_records)
 
@@ -114,8 +118,6 @@ class InvestigationReasoningDepthEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "investigation_reasoning_depth.record_added",
             record_id=record.id,
@@ -124,11 +126,7 @@ class InvestigationReasoningDepthEngine:
         return record
 
     def process(self, key: str) -> InvestigationReasoningDepthAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         breakdown = rec.reasoning_depth == ReasoningDepth.SHALLOW and not rec.resolved
@@ -196,7 +194,7 @@ class InvestigationReasoningDepthEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("investigation_reasoning_depth_engine.cleared")
         return {"status": "cleared"}
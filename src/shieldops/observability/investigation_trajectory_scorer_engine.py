@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,9 @@ class InvestigationTrajectoryScorerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[InvestigationTrajectoryScorerRecord] = []
+        self._records: RecordStore[InvestigationTrajectoryScorerRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: dict[str, InvestigationTrajectoryScorerAnalysis] = {}
         logger.info("investigation_trajectory_scorer_engine.init", max_records=max_records)
 
@@ -115,8 +119,6 @@ class InvestigationTrajectoryScorerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "investigation_trajectory_scorer.record_added",
             record_id=record.id,
@@ -125,11 +127,7 @@ class InvestigationTrajectoryScorerEngine:
         return record
 
     def process(self, key: str) -> InvestigationTrajectoryScorerAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         eff_ratio = (
@@ -212,7 +210,7 @@ class InvestigationTrajectoryScorerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("investigation_trajectory_scorer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class KafkaTelemetryPipeline:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[KafkaTelemetryPipelineRecord] = []
+        self._records: RecordStore[KafkaTelemetryPipelineRecord] = RecordStore(self._max_records)
         self._analyses: list[KafkaTelemetryPipelineAnalysis] = []
         logger.info(
             "kafka.telemetry.pipeline.initialized",
@@ -118,8 +120,6 @@ class KafkaTelemetryPipeline:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "kafka.telemetry.pipeline.record_added",
             record_id=record.id,
@@ -130,22 +130,22 @@ class KafkaTelemetryPipeline:
 
     def process(self, key: str) -> dict[str, Any]:
         """Find record by id, create analysis."""
-        for r in self._records:
-            if r.id == key:
-                analysis = KafkaTelemetryPipelineAnalysis(
-                    name=r.name,
-                    pipeline_stage=r.pipeline_stage,
-                    analysis_score=r.score,
-                    threshold=self._threshold,
-                    breached=r.score < self._threshold,
-                    description=f"Processed {r.name}",
-                )
-                self._analyses.append(analysis)
-                return {
-                    "status": "processed",
-                    "analysis_id": analysis.id,
-                    "breached": analysis.breached,
-                }
+        r = self._records.get(key)
+        if r is not None:
+            analysis = KafkaTelemetryPipelineAnalysis(
+                name=r.name,
+                pipeline_stage=r.pipeline_stage,
+                analysis_score=r.score,
+                threshold=self._threshold,
+                breached=r.score < self._threshold,
+                description=f"Processed {r.name}",
+            )
+            self._analyses.append(analysis)
+            return {
+                "status": "processed",
+                "analysis_id": analysis.id,
+                "breached": analysis.breached,
+            }
         return {"status": "not_found", "key": key}
 
     # -- domain methods ---
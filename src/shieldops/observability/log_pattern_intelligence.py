@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -111,7 +113,7 @@ class LogPatternIntelligence:
         self._max_records = max_records
         self._anomaly_entropy_threshold = anomaly_entropy_threshold
         self._rare_threshold = rare_threshold_count
-        self._records: list[LogPatternRecord] = []
+        self._records: RecordStore[LogPatternRecord] = RecordStore(self._max_records)
         self._analyses: list[PatternAnalysis] = []
         logger.info(
             "log_pattern_intelligence.initialized",
@@ -161,8 +163,6 @@ class LogPatternIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "log_pattern_intelligence.record_added",
             record_id=record.id,
@@ -191,10 +191,7 @@ class LogPatternIntelligence:
         return best_match or str(uuid.uuid4())[:8]
 
     def get_record(self, record_id: str) -> LogPatternRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
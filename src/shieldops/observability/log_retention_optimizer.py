@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class LogRetentionOptimizer:
     ) -> None:
         self._max_records = max_records
         self._default_retention_days = default_retention_days
-        self._records: list[LogRetentionRecord] = []
+        self._records: RecordStore[LogRetentionRecord] = RecordStore(self._max_records)
         self._policies: list[RetentionPolicy] = []
         logger.info(
             "log_retention_optimizer.initialized",
@@ -142,8 +144,6 @@ class LogRetentionOptimizer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "log_retention_optimizer.source_recorded",
             record_id=record.id,
@@ -153,10 +153,7 @@ class LogRetentionOptimizer:
         return record
 
     def get_log_source(self, record_id: str) -> LogRetentionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_log_sources(
         self,
@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class MeshControlPlaneObserver:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ControlPlaneRecord] = []
+        self._records: RecordStore[ControlPlaneRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ControlPlaneAnalysis] = {}
         logger.info(
             "mesh_control_plane_observer.init",
@@ -118,8 +120,6 @@ class MeshControlPlaneObserver:
             node_count=node_count,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "control_plane.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class MeshControlPlaneObserver:
         return record
 
     def process(self, key: str) -> ControlPlaneAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         healthy = rec.control_plane_health == ControlPlaneHealth.HEALTHY
@@ -204,7 +200,7 @@ class MeshControlPlaneObserver:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("mesh_control_plane_observer.cleared")
         return {"status": "cleared"}
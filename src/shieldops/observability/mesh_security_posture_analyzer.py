@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class MeshSecurityPostureAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SecurityPostureRecord] = []
+        self._records: RecordStore[SecurityPostureRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SecurityPostureAnalysis] = {}
         logger.info(
             "mesh_security_posture_analyzer.init",
@@ -118,8 +120,6 @@ class MeshSecurityPostureAnalyzer:
             open_ports=open_ports,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_posture.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class MeshSecurityPostureAnalyzer:
         return record
 
     def process(self, key: str) -> SecurityPostureAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_secure = rec.mtls_status == MtlsStatus.ENFORCED and rec.cert_health == CertHealth.VALID
@@ -225,7 +221,7 @@ class MeshSecurityPostureAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("mesh_security_posture_analyzer.cleared")
         return {"status": "cleared"}
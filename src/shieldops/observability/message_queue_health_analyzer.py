@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class MessageQueueHealthAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[QueueHealthRecord] = []
+        self._records: RecordStore[QueueHealthRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, QueueHealthAnalysis] = {}
         logger.info(
             "message_queue_health_analyzer.init",
@@ -117,8 +119,6 @@ class MessageQueueHealthAnalyzer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "queue_health.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class MessageQueueHealthAnalyzer:
         return record
 
     def process(self, key: str) -> QueueHealthAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         health_score = round(100.0 - rec.error_rate * 100, 2)
@@ -201,7 +197,7 @@ class MessageQueueHealthAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("message_queue_health_analyzer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MetricAnomalyClassifier:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[AnomalyRecord] = []
+        self._records: RecordStore[AnomalyRecord] = RecordStore(self._max_records)
         self._classifications: list[ClassificationResult] = []
         logger.info(
             "metric_anomaly_classifier.initialized",
@@ -124,8 +126,6 @@ class MetricAnomalyClassifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_anomaly_classifier.anomaly_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MetricAnomalyClassifier:
         return record
 
     def get_anomaly(self, record_id: str) -> AnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_anomalies(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -113,7 +115,7 @@ class MetricCardinalityGovernor:
         self._series_warn = series_warn_threshold
         self._series_critical = series_critical_threshold
         self._cost_per_series = cost_per_series_usd
-        self._records: list[CardinalityRecord] = []
+        self._records: RecordStore[CardinalityRecord] = RecordStore(self._max_records)
         self._analyses: list[CardinalityAnalysis] = []
         logger.info(
             "metric_cardinality_governor.initialized",
@@ -165,8 +167,6 @@ class MetricCardinalityGovernor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_cardinality_governor.record_added",
             record_id=record.id,
@@ -177,10 +177,7 @@ class MetricCardinalityGovernor:
         return record
 
     def get_record(self, record_id: str) -> CardinalityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MetricCardinalityPlanner:
     ) -> None:
         self._max_records = max_records
         self._max_high_cardinality_pct = max_high_cardinality_pct
-        self._records: list[CardinalityRecord] = []
+        self._records: RecordStore[CardinalityRecord] = RecordStore(self._max_records)
         self._plans: list[CardinalityPlan] = []
         logger.info(
             "metric_cardinality.initialized",
@@ -124,8 +126,6 @@ class MetricCardinalityPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_cardinality.cardinality_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MetricCardinalityPlanner:
         return record
 
     def get_cardinality(self, record_id: str) -> CardinalityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_cardinalities(
         self,
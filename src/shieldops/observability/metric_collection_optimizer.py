@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MetricCollectionOptimizer:
     ) -> None:
         self._max_records = max_records
         self._collection_efficiency_threshold = collection_efficiency_threshold
-        self._records: list[CollectionRecord] = []
+        self._records: RecordStore[CollectionRecord] = RecordStore(self._max_records)
         self._analyses: list[CollectionAnalysis] = []
         logger.info(
             "metric_collection_optimizer.initialized",
@@ -124,8 +126,6 @@ class MetricCollectionOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_collection_optimizer.collection_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MetricCollectionOptimizer:
         return record
 
     def get_collection(self, record_id: str) -> CollectionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_collections(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class MetricQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._min_metric_quality_pct = min_metric_quality_pct
-        self._records: list[MetricQualityRecord] = []
+        self._records: RecordStore[MetricQualityRecord] = RecordStore(self._max_records)
         self._assessments: list[QualityAssessment] = []
         logger.info(
             "metric_quality.initialized",
@@ -120,8 +122,6 @@ class MetricQualityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_quality.quality_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class MetricQualityScorer:
         return record
 
     def get_quality(self, record_id: str) -> MetricQualityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_qualities(
         self,
@@ -15,6 +15,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -118,7 +120,7 @@ class MlAnomalyDetectionEngine:
         self._max_records = max_records
         self._anomaly_score_threshold = anomaly_score_threshold
         self._z_score_threshold = z_score_threshold
-        self._records: list[AnomalyRecord] = []
+        self._records: RecordStore[AnomalyRecord] = RecordStore(self._max_records)
         self._decompositions: list[SeasonalDecomposition] = []
         logger.info(
             "ml_anomaly_detection_engine.initialized",
@@ -165,8 +167,6 @@ class MlAnomalyDetectionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ml_anomaly_detection_engine.record_added",
             record_id=record.id,
@@ -177,10 +177,7 @@ class MlAnomalyDetectionEngine:
         return record
 
     def get_record(self, record_id: str) -> AnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class MultiHopRootCauseEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MultiHopRootCauseRecord] = []
+        self._records: RecordStore[MultiHopRootCauseRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MultiHopRootCauseAnalysis] = {}
         logger.info("multi_hop_root_cause_engine.init", max_records=max_records)
 
@@ -114,8 +116,6 @@ class MultiHopRootCauseEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "multi_hop_root_cause.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class MultiHopRootCauseEngine:
         return record
 
     def process(self, key: str) -> MultiHopRootCauseAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         dep_valid = rec.chain_status in (ChainStatus.COMPLETE, ChainStatus.PARTIAL)
@@ -196,7 +192,7 @@ class MultiHopRootCauseEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("multi_hop_root_cause_engine.cleared")
         return {"status": "cleared"}
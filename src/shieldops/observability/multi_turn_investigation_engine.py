@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class MultiTurnInvestigationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MultiTurnInvestigationRecord] = []
+        self._records: RecordStore[MultiTurnInvestigationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MultiTurnInvestigationAnalysis] = {}
         logger.info("multi_turn_investigation_engine.init", max_records=max_records)
 
@@ -115,8 +117,6 @@ class MultiTurnInvestigationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "multi_turn_investigation.record_added",
             record_id=record.id,
@@ -125,11 +125,7 @@ class MultiTurnInvestigationEngine:
         return record
 
     def process(self, key: str) -> MultiTurnInvestigationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         should_cont = (
@@ -204,7 +200,7 @@ class MultiTurnInvestigationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("multi_turn_investigation_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class AlertNoiseClassifier:
     ) -> None:
         self._max_records = max_records
         self._max_noise_ratio_pct = max_noise_ratio_pct
-        self._records: list[NoiseRecord] = []
+        self._records: RecordStore[NoiseRecord] = RecordStore(self._max_records)
         self._rules: list[NoiseRule] = []
         logger.info(
             "noise_classifier.initialized",
@@ -129,8 +131,6 @@ class AlertNoiseClassifier:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "noise_classifier.recorded",
             record_id=record.id,
@@ -140,10 +140,7 @@ class AlertNoiseClassifier:
         return record
 
     def get_noise(self, record_id: str) -> NoiseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_noises(
         self,
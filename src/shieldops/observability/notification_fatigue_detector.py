@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class NotificationFatigueDetector:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[NotificationFatigueRecord] = []
+        self._records: RecordStore[NotificationFatigueRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, NotificationFatigueAnalysis] = {}
         logger.info(
             "notification_fatigue_detector.init",
@@ -118,8 +120,6 @@ class NotificationFatigueDetector:
             source=source,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "notification_fatigue.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class NotificationFatigueDetector:
         return record
 
     def process(self, key: str) -> NotificationFatigueAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.recipient_id == rec.recipient_id]
@@ -204,7 +200,7 @@ class NotificationFatigueDetector:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("notification_fatigue_detector.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ObservabilityAutomationEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AutomationRecord] = []
+        self._records: RecordStore[AutomationRecord] = RecordStore(self._max_records)
         self._analyses: list[AutomationAnalysis] = []
         logger.info(
             "obs_automation_engine.init",
@@ -126,8 +128,6 @@ class ObservabilityAutomationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "obs_automation_engine.added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ObservabilityCostAllocator:
     ) -> None:
         self._max_records = max_records
         self._high_cost_threshold = high_cost_threshold
-        self._records: list[ObservabilityCostRecord] = []
+        self._records: RecordStore[ObservabilityCostRecord] = RecordStore(self._max_records)
         self._allocations: list[CostAllocation] = []
         logger.info(
             "observability_cost.initialized",
@@ -113,8 +115,6 @@ class ObservabilityCostAllocator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "observability_cost.cost_recorded",
             record_id=record.id,
@@ -124,10 +124,7 @@ class ObservabilityCostAllocator:
         return record
 
     def get_cost(self, record_id: str) -> ObservabilityCostRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_costs(
         self,
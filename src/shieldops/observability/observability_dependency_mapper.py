@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ObservabilityDependencyMapper:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[DependencyRecord] = []
+        self._records: RecordStore[DependencyRecord] = RecordStore(self._max_records)
         self._analyses: list[DependencyAnalysis] = []
         logger.info(
             "observability_dependency_mapper.init",
@@ -122,8 +124,6 @@ class ObservabilityDependencyMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "observability_dep_mapper.added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ObservabilityGapDetector:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[GapRecord] = []
+        self._records: RecordStore[GapRecord] = RecordStore(self._max_records)
         self._assessments: list[CoverageAssessment] = []
         logger.info(
             "observability_gap.initialized",
@@ -116,8 +118,6 @@ class ObservabilityGapDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "observability_gap.gap_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ObservabilityGapDetector:
         return record
 
     def get_gap(self, record_id: str) -> GapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gaps(
         self,
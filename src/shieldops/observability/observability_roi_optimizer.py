@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ObservabilityRoiOptimizer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[RoiRecord] = []
+        self._records: RecordStore[RoiRecord] = RecordStore(self._max_records)
         self._analyses: list[RoiAnalysis] = []
         logger.info(
             "observability_roi_optimizer.initialized",
@@ -127,8 +129,6 @@ class ObservabilityRoiOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "observability_roi_optimizer.record_added",
             record_id=record.id,
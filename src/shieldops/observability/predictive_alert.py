@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class PredictiveAlertEngine:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[PredictiveAlertRecord] = []
+        self._records: RecordStore[PredictiveAlertRecord] = RecordStore(self._max_records)
         self._trends: list[SignalTrend] = []
         logger.info(
             "predictive_alert.initialized",
@@ -115,8 +117,6 @@ class PredictiveAlertEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "predictive_alert.recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class PredictiveAlertEngine:
         return record
 
     def get_alert(self, record_id: str) -> PredictiveAlertRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_alerts(
         self,
@@ -2,10 +2,40 @@
 
 Queries Prometheus via its HTTP API for metric data, anomaly detection,
 and instant queries used by investigation agents.
+
+Two things keep the number of HTTP round-trips down:
+
+* Batching.  Queries issued in the same event-loop tick (the investigation
+  toolkit fans out one instant query and one anomaly check per metric at
+  once) are combined into a single request: each query is tagged with a
+  ``label_replace`` and the tagged queries are joined with ``or``, and the
+  series are split back out by the tag.  Range queries are batched with
+  other range queries over the same window and step.
+* A range-query cache keyed by (query, window, step), with the window
+  aligned to the step so that calls made a few seconds apart hit the same
+  key.  A window that ended more than ``settle_seconds`` ago will not
+  change any more and is kept until evicted (LRU); a window reaching into
+  the live edge is kept for ``live_ttl_seconds``.  The 24h-ago baseline of
+  ``detect_anomalies`` is the common hit: it is the same for every
+  investigation of the same service within a step.
+
+Series are held as ``array('d')`` timestamp and value columns, and
+``detect_anomalies`` works on those columns directly instead of building
+a dict per data point first.
 """
 
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
 from datetime import UTC, datetime
-from typing import Any
+from itertools import compress
+from typing import Any, NamedTuple
 
 import httpx
 import structlog
@@ -15,15 +45,155 @@ from shieldops.observability.base import MetricSource
 
 logger = structlog.get_logger()
 
+# Label used to tell the queries of a batch apart in the combined result.
+BATCH_LABEL = "shieldops_batch_query"
+
+_DURATION_RE = re.compile(r"^(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)?$")
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+    "y": 31536000,
+}
+
+
+class Series(NamedTuple):
+    """One range-query series as parallel timestamp/value columns."""
+
+    labels: dict[str, str]
+    timestamps: array[float]
+    values: array[float]
+
+
+def parse_step(step: str | float) -> float:
+    """Seconds in a Prometheus duration (``"30s"``, ``"1m"``) or number."""
+    if isinstance(step, int | float):
+        seconds = float(step)
+    else:
+        m = _DURATION_RE.match(step.strip())
+        if m is None:
+            raise ValueError(f"Invalid Prometheus step: {step!r}")
+        seconds = float(m.group(1)) * _DURATION_UNITS[m.group(2) or "s"]
+    if seconds <= 0:
+        raise ValueError(f"Prometheus step must be positive, got {step!r}")
+    return seconds
+
+
+def align_window(time_range: TimeRange, step: float) -> tuple[float, float]:
+    """Snap *time_range* outwards to multiples of *step* seconds.
+
+    Prometheus evaluates a range query at ``start + k * step``, so two
+    windows aligned to the same step boundaries return the same points.
+    The end is rounded up so the newest, still-filling step is kept; a
+    window reaching the live edge is only cached for ``live_ttl_seconds``.
+    """
+    start = math.floor(time_range.start.timestamp() / step) * step
+    end = math.ceil(time_range.end.timestamp() / step) * step
+    return start, max(start, end)
+
+
+def build_selector(metric_name: str, labels: dict[str, str]) -> str:
+    label_selector = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    return f"{metric_name}{{{label_selector}}}" if labels else metric_name
+
+
+def _batched_query(queries: list[str]) -> str:
+    return " or ".join(
+        f'label_replace({query}, "{BATCH_LABEL}", "{i}", "", "")' for i, query in enumerate(queries)
+    )
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat()
+
+
+class _QueryBatcher:
+    """Collects queries submitted in one event-loop tick and runs them together.
+
+    ``run(key, queries)`` is called once per distinct key with the distinct
+    queries submitted under it, and returns one result per query.
+    """
+
+    def __init__(self, run: Callable[[Hashable, list[str]], Awaitable[list[Any]]]) -> None:
+        self._run = run
+        self._pending: dict[Hashable, dict[str, list[asyncio.Future[Any]]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def submit(self, key: Hashable, query: str) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.setdefault(key, {}).setdefault(query, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+        return future
+
+    async def _flush(self) -> None:
+        # One more pass through the loop lets callers that were scheduled
+        # alongside the first one join the batch.
+        await asyncio.sleep(0)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+        await asyncio.gather(*(self._run_key(key, waiting) for key, waiting in pending.items()))
+
+    async def _run_key(self, key: Hashable, waiting: dict[str, list[asyncio.Future[Any]]]) -> None:
+        queries = list(waiting)
+        try:
+            results = await self._run(key, queries)
+        except Exception as e:
+            for futures in waiting.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for query, result in zip(queries, results, strict=True):
+            for future in waiting[query]:
+                if not future.done():  # the caller may have timed out
+                    future.set_result(result)
+
 
 class PrometheusSource(MetricSource):
-    """Prometheus metric querying via HTTP API."""
+    """Prometheus metric querying via HTTP API.
+
+    Args:
+        url: Prometheus server URL.
+        batch_queries: Combine concurrent queries into one request.
+        max_batch_size: Most queries combined into one request.
+        cache_max_entries: Range-query results kept; 0 disables the cache.
+        settle_seconds: Age after which a window's data is treated as final.
+        live_ttl_seconds: How long a window reaching into the last
+            ``settle_seconds`` is cached.
+    """
 
     source_name = "prometheus"
 
-    def __init__(self, url: str = "http://localhost:9090") -> None:
+    def __init__(
+        self,
+        url: str = "http://localhost:9090",
+        *,
+        batch_queries: bool = True,
+        max_batch_size: int = 20,
+        cache_max_entries: int = 1024,
+        settle_seconds: float = 300.0,
+        live_ttl_seconds: float = 30.0,
+    ) -> None:
         self._url = url.rstrip("/")
         self._client = httpx.AsyncClient(timeout=30.0)
+        self._batch_queries = batch_queries
+        self._max_batch_size = max(1, max_batch_size)
+        self._cache_max_entries = cache_max_entries
+        self._settle_seconds = settle_seconds
+        self._live_ttl_seconds = live_ttl_seconds
+        # (query, start, end, step) -> (monotonic expiry or None, series)
+        self._range_cache: OrderedDict[
+            tuple[str, float, float, float], tuple[float | None, list[Series]]
+        ] = OrderedDict()
+        self._range_batcher = _QueryBatcher(self._run_range_batch)
+        self._instant_batcher = _QueryBatcher(self._run_instant_batch)
+
+    # -- Public API --
 
     async def query_metric(
         self,
@@ -33,65 +203,61 @@ class PrometheusSource(MetricSource):
         step: str = "1m",
     ) -> list[dict[str, Any]]:
         """Query a range of metric data points."""
-        label_selector = ",".join(f'{k}="{v}"' for k, v in labels.items())
-        query = f"{metric_name}{{{label_selector}}}" if labels else metric_name
+        series_list = await self.query_range(build_selector(metric_name, labels), time_range, step)
+        results = []
+        for series in series_list:
+            for timestamp, value in zip(series.timestamps, series.values, strict=True):
+                results.append(
+                    {
+                        "timestamp": _isoformat(timestamp),
+                        "value": value,
+                        "labels": series.labels,
+                    }
+                )
+        return results
 
-        try:
-            response = await self._client.get(
-                f"{self._url}/api/v1/query_range",
-                params={
-                    "query": query,
-                    "start": time_range.start.timestamp(),
-                    "end": time_range.end.timestamp(),
-                    "step": step,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = []
-            for series in data.get("data", {}).get("result", []):
-                for timestamp, value in series.get("values", []):
-                    results.append(
-                        {
-                            "timestamp": datetime.fromtimestamp(timestamp, tz=UTC).isoformat(),
-                            "value": float(value),
-                            "labels": series.get("metric", {}),
-                        }
-                    )
-            return results
+    async def query_range(
+        self, query: str, time_range: TimeRange, step: str = "1m"
+    ) -> list[Series]:
+        """Run a range query over the step-aligned *time_range*.
 
-        except httpx.HTTPError as e:
-            logger.error("prometheus_query_failed", query=query, error=str(e))
+        Results come from the cache when the aligned window is cached.
+        A failed query returns ``[]`` and is not cached.
+        """
+        step_seconds = parse_step(step)
+        start, end = align_window(time_range, step_seconds)
+        key = (query, start, end, step_seconds)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        window = (start, end, step_seconds)
+        if self._batch_queries:
+            series = await self._range_batcher.submit(window, query)
+        else:
+            series = (await self._run_range_batch(window, [query]))[0]
+        if series is None:
             return []
+        self._cache_put(key, series, end)
+        return series
+
+    async def query_range_many(
+        self, queries: list[str], time_range: TimeRange, step: str = "1m"
+    ) -> list[list[Series]]:
+        """Run several range queries over the same window, batched and cached."""
+        return list(await asyncio.gather(*(self.query_range(q, time_range, step) for q in queries)))
 
     async def query_instant(self, query: str) -> list[dict[str, Any]]:
         """Execute an instant PromQL query."""
-        try:
-            response = await self._client.get(
-                f"{self._url}/api/v1/query",
-                params={"query": query},
-            )
-            response.raise_for_status()
-            data = response.json()
+        if self._batch_queries:
+            result = await self._instant_batcher.submit(None, query)
+        else:
+            result = (await self._run_instant_batch(None, [query]))[0]
+        return result or []
 
-            results = []
-            for series in data.get("data", {}).get("result", []):
-                value = series.get("value", [None, None])
-                results.append(
-                    {
-                        "metric": series.get("metric", {}),
-                        "value": float(value[1]) if value[1] is not None else None,
-                        "timestamp": datetime.fromtimestamp(float(value[0]), tz=UTC).isoformat()
-                        if value[0]
-                        else None,
-                    }
-                )
-            return results
-
-        except httpx.HTTPError as e:
-            logger.error("prometheus_instant_query_failed", query=query, error=str(e))
-            return []
+    async def query_instant_many(self, queries: list[str]) -> list[list[dict[str, Any]]]:
+        """Execute several instant queries, batched into as few requests as possible."""
+        return list(await asyncio.gather(*(self.query_instant(q) for q in queries)))
 
     async def detect_anomalies(
         self,
@@ -102,46 +268,218 @@ class PrometheusSource(MetricSource):
         threshold_percent: float = 50.0,
     ) -> list[dict[str, Any]]:
         """Compare current values against baseline to detect anomalies."""
-        current_data = await self.query_metric(metric_name, labels, time_range)
-        baseline_data = await self.query_metric(metric_name, labels, baseline_range)
-
-        if not current_data or not baseline_data:
-            return []
-
-        # Calculate baseline average
-        baseline_values = [d["value"] for d in baseline_data if d["value"] is not None]
-        if not baseline_values:
-            return []
-        baseline_avg = sum(baseline_values) / len(baseline_values)
-
-        if baseline_avg == 0:
-            return []
-
-        # Find data points that deviate beyond threshold
-        anomalies = []
-        for point in current_data:
-            if point["value"] is None:
-                continue
-            deviation = ((point["value"] - baseline_avg) / baseline_avg) * 100
-            if abs(deviation) >= threshold_percent:
-                anomalies.append(
-                    {
-                        "timestamp": point["timestamp"],
-                        "current_value": point["value"],
-                        "baseline_value": baseline_avg,
-                        "deviation_percent": round(deviation, 2),
-                        "labels": point.get("labels", {}),
-                        "metric_name": metric_name,
-                    }
-                )
-
+        query = build_selector(metric_name, labels)
+        current, baseline = await asyncio.gather(
+            self.query_range(query, time_range),
+            self.query_range(query, baseline_range),
+        )
+        anomalies = find_anomalies(current, baseline, threshold_percent, metric_name)
         logger.info(
             "prometheus_anomaly_detection",
             metric=metric_name,
             anomalies_found=len(anomalies),
-            baseline_avg=round(baseline_avg, 2),
+            baseline_avg=round(anomalies[0]["baseline_value"], 2) if anomalies else None,
         )
         return anomalies
 
     async def close(self) -> None:
         await self._client.aclose()
+
+    # -- Range-query cache --
+
+    def _cache_get(self, key: tuple[str, float, float, float]) -> list[Series] | None:
+        entry = self._range_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, series = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._range_cache[key]
+            return None
+        self._range_cache.move_to_end(key)
+        return series
+
+    def _cache_put(
+        self, key: tuple[str, float, float, float], series: list[Series], end: float
+    ) -> None:
+        if self._cache_max_entries <= 0:
+            return
+        if end <= time.time() - self._settle_seconds:
+            expires_at = None  # past window: its data will not change
+        elif self._live_ttl_seconds > 0:
+            expires_at = time.monotonic() + self._live_ttl_seconds
+        else:
+            return
+        self._range_cache[key] = (expires_at, series)
+        self._range_cache.move_to_end(key)
+        while len(self._range_cache) > self._cache_max_entries:
+            self._range_cache.popitem(last=False)
+
+    # -- HTTP --
+
+    async def _run_range_batch(
+        self, window: Hashable, queries: list[str]
+    ) -> list[list[Series] | None]:
+        start, end, step = window  # type: ignore[misc]
+        params = {"start": start, "end": end, "step": step}
+        return await self._run_batches("/api/v1/query_range", params, queries, _parse_matrix)
+
+    async def _run_instant_batch(
+        self, _key: Hashable, queries: list[str]
+    ) -> list[list[dict[str, Any]] | None]:
+        return await self._run_batches("/api/v1/query", {}, queries, _parse_vector)
+
+    async def _run_batches(
+        self,
+        path: str,
+        params: dict[str, Any],
+        queries: list[str],
+        parse: Callable[[list[dict[str, Any]], int], list[Any]],
+    ) -> list[Any]:
+        size = self._max_batch_size
+        chunks = [queries[i : i + size] for i in range(0, len(queries), size)]
+        parts = await asyncio.gather(*(self._fetch(path, params, c, parse) for c in chunks))
+        return [result for part in parts for result in part]
+
+    async def _fetch(
+        self,
+        path: str,
+        params: dict[str, Any],
+        queries: list[str],
+        parse: Callable[[list[dict[str, Any]], int], list[Any]],
+    ) -> list[Any]:
+        """One request for *queries*; ``None`` in place of each failed query."""
+        if len(queries) == 1:
+            try:
+                response = await self._client.get(
+                    f"{self._url}{path}", params={"query": queries[0], **params}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error("prometheus_query_failed", query=queries[0], path=path, error=str(e))
+                return [None]
+            return parse(_result(response), 1)
+
+        try:
+            # POST keeps a long combined query out of the URL.
+            response = await self._client.post(
+                f"{self._url}{path}", data={"query": _batched_query(queries), **params}
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 400:
+                logger.error(
+                    "prometheus_query_failed", queries=len(queries), path=path, error=str(e)
+                )
+                return [None] * len(queries)
+            # One bad expression rejects the whole batch: retry the queries
+            # one by one so the others still get answers.
+            logger.warning("prometheus_batch_rejected", queries=len(queries), path=path)
+            singles = await asyncio.gather(
+                *(self._fetch(path, params, [q], parse) for q in queries)
+            )
+            return [single[0] for single in singles]
+        except httpx.HTTPError as e:
+            logger.error("prometheus_query_failed", queries=len(queries), path=path, error=str(e))
+            return [None] * len(queries)
+        return parse(_result(response), len(queries))
+
+
+def _result(response: httpx.Response) -> list[dict[str, Any]]:
+    result: list[dict[str, Any]] = response.json().get("data", {}).get("result", [])
+    return result
+
+
+def _split(raw: list[dict[str, Any]], count: int) -> list[list[tuple[dict[str, str], Any]]]:
+    """Group series by the batch tag (all under query 0 for a single query)."""
+    groups: list[list[tuple[dict[str, str], Any]]] = [[] for _ in range(count)]
+    for series in raw:
+        labels = dict(series.get("metric", {}))
+        index = int(labels.pop(BATCH_LABEL, 0)) if count > 1 else 0
+        if 0 <= index < count:
+            groups[index].append((labels, series))
+    return groups
+
+
+def _parse_matrix(raw: list[dict[str, Any]], count: int) -> list[list[Series]]:
+    parsed = []
+    for group in _split(raw, count):
+        series_list = []
+        for labels, series in group:
+            points = series.get("values", [])
+            series_list.append(
+                Series(
+                    labels,
+                    array("d", [float(t) for t, _ in points]),
+                    array("d", [float(v) for _, v in points]),
+                )
+            )
+        parsed.append(series_list)
+    return parsed
+
+
+def _parse_vector(raw: list[dict[str, Any]], count: int) -> list[list[dict[str, Any]]]:
+    parsed = []
+    for group in _split(raw, count):
+        results = []
+        for labels, series in group:
+            value = series.get("value", [None, None])
+            results.append(
+                {
+                    "metric": labels,
+                    "value": float(value[1]) if value[1] is not None else None,
+                    "timestamp": _isoformat(float(value[0])) if value[0] else None,
+                }
+            )
+        parsed.append(results)
+    return parsed
+
+
+def find_anomalies(
+    current: list[Series],
+    baseline: list[Series],
+    threshold_percent: float,
+    metric_name: str,
+) -> list[dict[str, Any]]:
+    """Points of *current* deviating from the *baseline* mean by ``threshold_percent``.
+
+    The baseline mean is taken over every baseline series (NaN samples
+    skipped), and each current series is screened column-wise against
+    precomputed bounds; dicts are only built for the points reported.
+    """
+    count = sum(len(s.values) for s in baseline)
+    if not current or not count:
+        return []
+    total = math.fsum(math.fsum(s.values) for s in baseline)
+    if math.isnan(total):
+        finite = [v for s in baseline for v in s.values if not math.isnan(v)]
+        if not finite:
+            return []
+        total, count = math.fsum(finite), len(finite)
+    baseline_avg = total / count
+    if baseline_avg == 0:
+        return []
+
+    # |v - avg| / |avg| * 100 >= threshold  <=>  v <= low or v >= high
+    margin = abs(baseline_avg) * threshold_percent / 100
+    low, high = baseline_avg - margin, baseline_avg + margin
+    scale = 100 / baseline_avg
+
+    anomalies = []
+    for series in current:
+        values = series.values
+        # NaN compares false both ways, so missing samples drop out here.
+        flags = [v <= low or v >= high for v in values]
+        for timestamp, value in zip(
+            compress(series.timestamps, flags), compress(values, flags), strict=True
+        ):
+            anomalies.append(
+                {
+                    "timestamp": _isoformat(timestamp),
+                    "current_value": value,
+                    "baseline_value": baseline_avg,
+                    "deviation_percent": round((value - baseline_avg) * scale, 2),
+                    "labels": series.labels,
+                    "metric_name": metric_name,
+                }
+            )
+    return anomalies
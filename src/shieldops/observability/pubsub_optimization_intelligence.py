@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PubsubOptimizationIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[PubsubOptRecord] = []
+        self._records: RecordStore[PubsubOptRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, PubsubOptAnalysis] = {}
         logger.info(
             "pubsub_optimization_intelligence.init",
@@ -117,8 +119,6 @@ class PubsubOptimizationIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "pubsub_opt.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class PubsubOptimizationIntelligence:
         return record
 
     def process(self, key: str) -> PubsubOptAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         dist_score = round(100.0 - rec.skew_ratio * 100, 2)
@@ -204,7 +200,7 @@ class PubsubOptimizationIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("pubsub_optimization_intelligence.cleared")
         return {"status": "cleared"}
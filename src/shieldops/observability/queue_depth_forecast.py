@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class QueueDepthForecaster:
     ) -> None:
         self._max_records = max_records
         self._overflow_threshold = overflow_threshold
-        self._records: list[QueueDepthRecord] = []
+        self._records: RecordStore[QueueDepthRecord] = RecordStore(self._max_records)
         self._forecasts: list[QueueForecast] = []
         logger.info(
             "queue_depth_forecast.initialized",
@@ -123,8 +125,6 @@ class QueueDepthForecaster:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "queue_depth_forecast.depth_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class QueueDepthForecaster:
         return record
 
     def get_depth(self, record_id: str) -> QueueDepthRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_depths(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class RealtimeSliCalculator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[SliRecord] = []
+        self._records: RecordStore[SliRecord] = RecordStore(self._max_records)
         self._analyses: list[SliAnalysis] = []
         logger.info(
             "realtime_sli_calculator.init",
@@ -124,8 +126,6 @@ class RealtimeSliCalculator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "realtime_sli_calculator.added",
             record_id=record.id,
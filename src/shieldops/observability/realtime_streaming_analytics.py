@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -112,7 +114,7 @@ class RealtimeStreamingAnalytics:
         self._max_records = max_records
         self._backpressure_threshold = backpressure_threshold_pct
         self._late_event_threshold = late_event_threshold
-        self._records: list[StreamRecord] = []
+        self._records: RecordStore[StreamRecord] = RecordStore(self._max_records)
         self._analyses: list[StreamAnalysis] = []
         logger.info(
             "realtime_streaming_analytics.initialized",
@@ -150,8 +152,6 @@ class RealtimeStreamingAnalytics:
             partition=partition,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "realtime_streaming_analytics.record_added",
             record_id=record.id,
@@ -161,10 +161,7 @@ class RealtimeStreamingAnalytics:
         return record
 
     def get_record(self, record_id: str) -> StreamRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ReasoningChainIntegrityEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ReasoningChainIntegrityRecord] = []
+        self._records: RecordStore[ReasoningChainIntegrityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ReasoningChainIntegrityAnalysis] = {}
         logger.info("reasoning_chain_integrity_engine.init", max_records=max_records)
 
@@ -117,8 +119,6 @@ class ReasoningChainIntegrityEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reasoning_chain_integrity.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class ReasoningChainIntegrityEngine:
         return record
 
     def process(self, key: str) -> ReasoningChainIntegrityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         has_viol = rec.integrity_status not in (IntegrityStatus.VALID,)
@@ -209,7 +205,7 @@ class ReasoningChainIntegrityEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("reasoning_chain_integrity_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DataRetentionPolicyManager:
     ) -> None:
         self._max_records = max_records
         self._max_retention_days = max_retention_days
-        self._records: list[RetentionRecord] = []
+        self._records: RecordStore[RetentionRecord] = RecordStore(self._max_records)
         self._rules: list[RetentionRule] = []
         logger.info(
             "retention_policy.initialized",
@@ -116,8 +118,6 @@ class DataRetentionPolicyManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "retention_policy.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DataRetentionPolicyManager:
         return record
 
     def get_retention(self, record_id: str) -> RetentionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_retentions(
         self,
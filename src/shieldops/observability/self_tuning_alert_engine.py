@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class SelfTuningAlertEngine:
     ) -> None:
         self._max_records = max_records
         self._noise_threshold = noise_threshold
-        self._records: list[AlertTuningRecord] = []
+        self._records: RecordStore[AlertTuningRecord] = RecordStore(self._max_records)
         self._analyses: list[AlertTuningAnalysis] = []
         logger.info(
             "self_tuning_alert_engine.initialized",
@@ -130,8 +132,6 @@ class SelfTuningAlertEngine:
             false_positive_rate=false_positive_rate,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "self_tuning_alert_engine.record_added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class ServiceLevelIntelligence:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[SloRecord] = []
+        self._records: RecordStore[SloRecord] = RecordStore(self._max_records)
         self._analyses: list[SloAnalysis] = []
         logger.info(
             "service_level_intelligence.init",
@@ -125,8 +127,6 @@ class ServiceLevelIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_level_intelligence.added",
             record_id=record.id,
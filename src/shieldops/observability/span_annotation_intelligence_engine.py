@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class SpanAnnotationIntelligenceEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SpanAnnotationRecord] = []
+        self._records: RecordStore[SpanAnnotationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SpanAnnotationAnalysis] = {}
         logger.info("span_annotation_intelligence_engine.init", max_records=max_records)
 
@@ -124,8 +126,6 @@ class SpanAnnotationIntelligenceEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "span_annotation.record_added",
             record_id=record.id,
@@ -134,11 +134,7 @@ class SpanAnnotationIntelligenceEngine:
         return record
 
     def process(self, key: str) -> SpanAnnotationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         qual_weights = {
@@ -204,7 +200,7 @@ class SpanAnnotationIntelligenceEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("span_annotation_intelligence_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SpanCriticalityScoringEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SpanCriticalityRecord] = []
+        self._records: RecordStore[SpanCriticalityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SpanCriticalityAnalysis] = {}
         logger.info("span_criticality_scoring_engine.init", max_records=max_records)
 
@@ -128,8 +130,6 @@ class SpanCriticalityScoringEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "span_criticality.record_added",
             record_id=record.id,
@@ -138,11 +138,7 @@ class SpanCriticalityScoringEngine:
         return record
 
     def process(self, key: str) -> SpanCriticalityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         conf_weights = {"high": 1.0, "medium": 0.75, "low": 0.5, "uncertain": 0.25}
@@ -204,7 +200,7 @@ class SpanCriticalityScoringEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("span_criticality_scoring_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class StreamingTelemetryProcessor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ProcessorRecord] = []
+        self._records: RecordStore[ProcessorRecord] = RecordStore(self._max_records)
         self._analyses: list[ProcessorAnalysis] = []
         logger.info(
             "streaming_telemetry_processor.initialized",
@@ -127,8 +129,6 @@ class StreamingTelemetryProcessor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "streaming_telemetry_processor.entry_recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class StreamingTelemetryProcessor:
         return record
 
     def get_record(self, record_id: str) -> ProcessorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
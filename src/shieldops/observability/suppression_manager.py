@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AlertSuppressionManager:
     ) -> None:
         self._max_records = max_records
         self._max_suppression_rate_pct = max_suppression_rate_pct
-        self._records: list[SuppressionRecord] = []
+        self._records: RecordStore[SuppressionRecord] = RecordStore(self._max_records)
         self._rules: list[SuppressionRule] = []
         logger.info(
             "suppression_manager.initialized",
@@ -123,8 +125,6 @@ class AlertSuppressionManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "suppression_manager.suppression_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class AlertSuppressionManager:
         return record
 
     def get_suppression(self, record_id: str) -> SuppressionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_suppressions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TelemetryComplianceEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ComplianceRecord] = []
+        self._records: RecordStore[ComplianceRecord] = RecordStore(self._max_records)
         self._analyses: list[ComplianceAnalysis] = []
         logger.info(
             "telemetry_compliance_engine.init",
@@ -126,8 +128,6 @@ class TelemetryComplianceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "telemetry_compliance_engine.added",
             record_id=record.id,
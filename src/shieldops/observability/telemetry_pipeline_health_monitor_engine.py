@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class TelemetryPipelineHealthMonitorEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TelemetryPipelineRecord] = []
+        self._records: RecordStore[TelemetryPipelineRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TelemetryPipelineAnalysis] = {}
         logger.info("telemetry_pipeline_health_monitor_engine.init", max_records=max_records)
 
@@ -124,8 +126,6 @@ class TelemetryPipelineHealthMonitorEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "telemetry_pipeline.record_added",
             record_id=record.id,
@@ -134,11 +134,7 @@ class TelemetryPipelineHealthMonitorEngine:
         return record
 
     def process(self, key: str) -> TelemetryPipelineAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         health_weights = {"healthy": 100, "degraded": 60, "unhealthy": 20, "unknown": 50}
@@ -209,7 +205,7 @@ class TelemetryPipelineHealthMonitorEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("telemetry_pipeline_health_monitor_engine.cleared")
         return {"status": "cleared"}
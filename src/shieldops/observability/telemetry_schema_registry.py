@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -117,7 +119,7 @@ class TelemetrySchemaRegistry:
     ) -> None:
         self._max_records = max_records
         self._max_deprecated_ratio = max_deprecated_ratio
-        self._records: list[SchemaRecord] = []
+        self._records: RecordStore[SchemaRecord] = RecordStore(self._max_records)
         self._deprecations: list[FieldDeprecation] = []
         logger.info(
             "telemetry_schema_registry.initialized",
@@ -157,8 +159,6 @@ class TelemetrySchemaRegistry:
             team=team or owner_team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "telemetry_schema_registry.record_added",
             record_id=record.id,
@@ -201,10 +201,7 @@ class TelemetrySchemaRegistry:
         return dep
 
     def get_record(self, record_id: str) -> SchemaRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
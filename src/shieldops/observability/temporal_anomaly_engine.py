@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class TemporalAnomalyEngine:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[TemporalAnomalyRecord] = []
+        self._records: RecordStore[TemporalAnomalyRecord] = RecordStore(self._max_records)
         self._analyses: list[TemporalAnomalyAnalysis] = []
         logger.info(
             "temporal_anomaly_engine.initialized",
@@ -132,8 +134,6 @@ class TemporalAnomalyEngine:
             operator=operator,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "temporal_anomaly_engine.record_added",
             record_id=record.id,
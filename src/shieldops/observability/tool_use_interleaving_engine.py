@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ToolUseInterleavingEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ToolUseInterleavingRecord] = []
+        self._records: RecordStore[ToolUseInterleavingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ToolUseInterleavingAnalysis] = {}
         logger.info("tool_use_interleaving_engine.init", max_records=max_records)
 
@@ -114,8 +116,6 @@ class ToolUseInterleavingEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "tool_use_interleaving.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class ToolUseInterleavingEngine:
         return record
 
     def process(self, key: str) -> ToolUseInterleavingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         outcome_weights = {
@@ -207,7 +203,7 @@ class ToolUseInterleavingEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("tool_use_interleaving_engine.cleared")
         return {"status": "cleared"}
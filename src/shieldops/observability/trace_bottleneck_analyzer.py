@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -116,7 +118,7 @@ class TraceBottleneckAnalyzer:
         self._max_records = max_records
         self._bottleneck_pct = bottleneck_self_time_pct
         self._slow_threshold_ms = slow_span_threshold_ms
-        self._records: list[TraceSpanRecord] = []
+        self._records: RecordStore[TraceSpanRecord] = RecordStore(self._max_records)
         self._analyses: list[BottleneckAnalysis] = []
         logger.info(
             "trace_bottleneck_analyzer.initialized",
@@ -166,8 +168,6 @@ class TraceBottleneckAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_bottleneck_analyzer.record_added",
             record_id=record.id,
@@ -178,10 +178,7 @@ class TraceBottleneckAnalyzer:
         return record
 
     def get_record(self, record_id: str) -> TraceSpanRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
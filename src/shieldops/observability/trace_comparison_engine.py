@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class TraceComparisonEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TraceComparisonRecord] = []
+        self._records: RecordStore[TraceComparisonRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TraceComparisonAnalysis] = {}
         logger.info("trace_comparison_engine.init", max_records=max_records)
 
@@ -127,8 +129,6 @@ class TraceComparisonEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_comparison.record_added",
             record_id=record.id,
@@ -137,11 +137,7 @@ class TraceComparisonEngine:
         return record
 
     def process(self, key: str) -> TraceComparisonAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         lat_delta = round(rec.candidate_latency_ms - rec.baseline_latency_ms, 2)
@@ -211,7 +207,7 @@ class TraceComparisonEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("trace_comparison_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class TraceCompletenessVerificationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TraceCompletenessRecord] = []
+        self._records: RecordStore[TraceCompletenessRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TraceCompletenessAnalysis] = {}
         logger.info("trace_completeness_verification_engine.init", max_records=max_records)
 
@@ -124,8 +126,6 @@ class TraceCompletenessVerificationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_completeness.record_added",
             record_id=record.id,
@@ -134,11 +134,7 @@ class TraceCompletenessVerificationEngine:
         return record
 
     def process(self, key: str) -> TraceCompletenessAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         integ_penalty = {"valid": 0, "incomplete": 10, "suspicious": 20, "corrupted": 50}
@@ -213,7 +209,7 @@ class TraceCompletenessVerificationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("trace_completeness_verification_engine.cleared")
         return {"status": "cleared"}
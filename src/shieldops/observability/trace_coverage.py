@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TraceCoverageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[TraceCoverageRecord] = []
+        self._records: RecordStore[TraceCoverageRecord] = RecordStore(self._max_records)
         self._metrics: list[CoverageMetric] = []
         logger.info(
             "trace_coverage.initialized",
@@ -124,8 +126,6 @@ class TraceCoverageAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_coverage.coverage_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TraceCoverageAnalyzer:
         return record
 
     def get_coverage(self, record_id: str) -> TraceCoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coverages(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class TraceRootCauseAnalyzerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TraceRootCauseRecord] = []
+        self._records: RecordStore[TraceRootCauseRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TraceRootCauseAnalysis] = {}
         logger.info("trace_root_cause_analyzer_engine.init", max_records=max_records)
 
@@ -118,8 +120,6 @@ class TraceRootCauseAnalyzerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_root_cause.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class TraceRootCauseAnalyzerEngine:
         return record
 
     def process(self, key: str) -> TraceRootCauseAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         conf_weights = {
@@ -204,7 +200,7 @@ class TraceRootCauseAnalyzerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("trace_root_cause_analyzer_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class TraceSamplingIntelligenceEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TraceSamplingRecord] = []
+        self._records: RecordStore[TraceSamplingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TraceSamplingAnalysis] = {}
         logger.info("trace_sampling_intelligence_engine.init", max_records=max_records)
 
@@ -121,8 +123,6 @@ class TraceSamplingIntelligenceEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trace_sampling.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class TraceSamplingIntelligenceEngine:
         return record
 
     def process(self, key: str) -> TraceSamplingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         effective = 0.0
@@ -197,7 +193,7 @@ class TraceSamplingIntelligenceEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("trace_sampling_intelligence_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AnalystWorkloadBalancer:
     ) -> None:
         self._max_records = max_records
         self._utilization_threshold = utilization_threshold
-        self._records: list[WorkloadRecord] = []
+        self._records: RecordStore[WorkloadRecord] = RecordStore(self._max_records)
         self._analyses: list[WorkloadAnalysis] = []
         logger.info(
             "analyst_workload_balancer.initialized",
@@ -124,8 +126,6 @@ class AnalystWorkloadBalancer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "analyst_workload_balancer.workload_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AnalystWorkloadBalancer:
         return record
 
     def get_workload(self, record_id: str) -> WorkloadRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_workloads(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class AutoScalingDecisionEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AutoScalingRecord] = []
+        self._records: RecordStore[AutoScalingRecord] = RecordStore(self._max_records)
         self._analyses: list[AutoScalingAnalysis] = []
         logger.info(
             "auto_scaling_decision_engine.initialized",
@@ -126,8 +128,6 @@ class AutoScalingDecisionEngine:
             team=team,
         )
         self._records.append(rec)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "auto_scaling_decision_engine.recorded",
             record_id=rec.id,
@@ -136,10 +136,7 @@ class AutoScalingDecisionEngine:
         return rec
 
     def get_record(self, record_id: str) -> AutoScalingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
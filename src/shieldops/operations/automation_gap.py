@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class AutomationGapIdentifier:
     ) -> None:
         self._max_records = max_records
         self._min_roi_score = min_roi_score
-        self._records: list[AutomationGapRecord] = []
+        self._records: RecordStore[AutomationGapRecord] = RecordStore(self._max_records)
         self._candidates: list[AutomationCandidate] = []
         logger.info(
             "automation_gap.initialized",
@@ -119,8 +121,6 @@ class AutomationGapIdentifier:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automation_gap.gap_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class AutomationGapIdentifier:
         return record
 
     def get_gap(self, record_id: str) -> AutomationGapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gaps(
         self,
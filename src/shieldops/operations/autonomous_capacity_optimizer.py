@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AutonomousCapacityOptimizer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CapacityRecord] = []
+        self._records: RecordStore[CapacityRecord] = RecordStore(self._max_records)
         self._analyses: list[CapacityAnalysis] = []
         logger.info(
             "autonomous_capacity_optimizer.initialized",
@@ -121,8 +123,6 @@ class AutonomousCapacityOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "autonomous_capacity_optimizer.item_recorded",
             record_id=record.id,
@@ -131,10 +131,7 @@ class AutonomousCapacityOptimizer:
         return record
 
     def get_record(self, record_id: str) -> CapacityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class AutonomousIncidentCommander:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CommandRecord] = []
+        self._records: RecordStore[CommandRecord] = RecordStore(self._max_records)
         self._analyses: list[CommandAnalysis] = []
         logger.info(
             "autonomous_incident_commander.initialized",
@@ -123,8 +125,6 @@ class AutonomousIncidentCommander:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "autonomous_incident_commander.item_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class AutonomousIncidentCommander:
         return record
 
     def get_record(self, record_id: str) -> CommandRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BlamelessPostmortemEnforcer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[PostmortemRecord] = []
+        self._records: RecordStore[PostmortemRecord] = RecordStore(self._max_records)
         self._analyses: list[PostmortemAnalysis] = []
         logger.info(
             "blameless_postmortem_enforcer.initialized",
@@ -124,8 +126,6 @@ class BlamelessPostmortemEnforcer:
             action_items_count=action_items_count,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "blameless_postmortem_enforcer.postmortem_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BlamelessPostmortemEnforcer:
         return record
 
     def get_postmortem(self, record_id: str) -> PostmortemRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_postmortems(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class BlastRadiusPredictor:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[BlastRadiusPrediction] = []
+        self._records: RecordStore[BlastRadiusPrediction] = RecordStore(self._max_records)
         self._analyses: list[RadiusAnalysis] = []
         logger.info(
             "blast_radius_predictor.initialized",
@@ -120,8 +122,6 @@ class BlastRadiusPredictor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "blast_radius_predictor.prediction_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class BlastRadiusPredictor:
         return record
 
     def get_prediction(self, record_id: str) -> BlastRadiusPrediction | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CapacityBurstManager:
     ) -> None:
         self._max_records = max_records
         self._max_burst_budget = max_burst_budget
-        self._records: list[BurstRecord] = []
+        self._records: RecordStore[BurstRecord] = RecordStore(self._max_records)
         self._policies: list[BurstPolicy] = []
         logger.info(
             "burst_manager.initialized",
@@ -116,8 +118,6 @@ class CapacityBurstManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "burst_manager.burst_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class CapacityBurstManager:
         return record
 
     def get_burst(self, record_id: str) -> BurstRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_bursts(
         self,
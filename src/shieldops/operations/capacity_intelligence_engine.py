@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -106,7 +108,7 @@ class CapacityIntelligenceEngine:
     ) -> None:
         self._max_records = max_records
         self._utilization_threshold = utilization_threshold
-        self._records: list[CapacityIntelligenceRecord] = []
+        self._records: RecordStore[CapacityIntelligenceRecord] = RecordStore(self._max_records)
         self._analyses: list[CapacityIntelligenceAnalysis] = []
         logger.info(
             "capacity.intelligence.engine.initialized",
@@ -148,8 +150,6 @@ class CapacityIntelligenceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "capacity.intelligence.engine.item_recorded",
             record_id=record.id,
@@ -160,10 +160,7 @@ class CapacityIntelligenceEngine:
         return record
 
     def get_record(self, record_id: str) -> CapacityIntelligenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class TeamCognitiveLoadTracker:
     ) -> None:
         self._max_records = max_records
         self._critical_threshold = critical_threshold
-        self._records: list[CognitiveLoadRecord] = []
+        self._records: RecordStore[CognitiveLoadRecord] = RecordStore(self._max_records)
         self._contributors: list[LoadContributor] = []
         logger.info(
             "cognitive_load.initialized",
@@ -113,8 +115,6 @@ class TeamCognitiveLoadTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cognitive_load.recorded",
             record_id=record.id,
@@ -125,10 +125,7 @@ class TeamCognitiveLoadTracker:
         return record
 
     def get_load(self, record_id: str) -> CognitiveLoadRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_loads(
         self,
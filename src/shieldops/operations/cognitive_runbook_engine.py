@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class CognitiveRunbookEngine:
     ) -> None:
         self._max_records = max_records
         self._effectiveness_threshold = effectiveness_threshold
-        self._records: list[RunbookRecord] = []
+        self._records: RecordStore[RunbookRecord] = RecordStore(self._max_records)
         self._analyses: list[RunbookAnalysis] = []
         logger.info(
             "cognitive_runbook_engine.initialized",
@@ -124,8 +126,6 @@ class CognitiveRunbookEngine:
             operator=operator,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cognitive_runbook_engine.record_added",
             record_id=record.id,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ConfigDriftMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_drift_count = max_drift_count
-        self._records: list[DriftRecord] = []
+        self._records: RecordStore[DriftRecord] = RecordStore(self._max_records)
         self._resolutions: list[DriftResolution] = []
         logger.info(
             "config_drift_monitor.initialized",
@@ -124,8 +126,6 @@ class ConfigDriftMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "config_drift_monitor.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ConfigDriftMonitor:
         return record
 
     def get_drift(self, record_id: str) -> DriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class CrossTeamAutomationOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[OrchestrationRecord] = []
+        self._records: RecordStore[OrchestrationRecord] = RecordStore(self._max_records)
         self._analyses: list[OrchestrationAnalysis] = []
         logger.info(
             "cross_team_automation_orchestrator.initialized",
@@ -130,8 +132,6 @@ class CrossTeamAutomationOrchestrator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_team_automation_orchestrator.entry_recorded",
             record_id=record.id,
@@ -142,10 +142,7 @@ class CrossTeamAutomationOrchestrator:
         return record
 
     def get_record(self, record_id: str) -> OrchestrationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
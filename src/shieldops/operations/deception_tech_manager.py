@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeceptionTechManager:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[DeceptionRecord] = []
+        self._records: RecordStore[DeceptionRecord] = RecordStore(self._max_records)
         self._analyses: list[DeceptionAnalysis] = []
         logger.info(
             "deception_tech_manager.initialized",
@@ -122,8 +124,6 @@ class DeceptionTechManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deception_tech_manager.asset_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class DeceptionTechManager:
         return record
 
     def get_asset(self, record_id: str) -> DeceptionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assets(
         self,
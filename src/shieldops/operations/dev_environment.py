@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class DevEnvironmentHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_drift_days = max_drift_days
-        self._records: list[EnvironmentIssueRecord] = []
+        self._records: RecordStore[EnvironmentIssueRecord] = RecordStore(self._max_records)
         self._baselines: list[EnvironmentBaseline] = []
         logger.info(
             "dev_environment.initialized",
@@ -122,8 +124,6 @@ class DevEnvironmentHealthMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dev_environment.issue_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class DevEnvironmentHealthMonitor:
         return record
 
     def get_issue(self, record_id: str) -> EnvironmentIssueRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_issues(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -104,7 +106,7 @@ class DisasterRecoveryIntelligence:
     ) -> None:
         self._max_records = max_records
         self._readiness_threshold = readiness_threshold
-        self._records: list[DisasterRecoveryRecord] = []
+        self._records: RecordStore[DisasterRecoveryRecord] = RecordStore(self._max_records)
         self._analyses: list[DisasterRecoveryAnalysis] = []
         logger.info(
             "disaster.recovery.intelligence.initialized",
@@ -148,8 +150,6 @@ class DisasterRecoveryIntelligence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "disaster.recovery.intelligence.item_recorded",
             record_id=record.id,
@@ -160,10 +160,7 @@ class DisasterRecoveryIntelligence:
         return record
 
     def get_record(self, record_id: str) -> DisasterRecoveryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DisasterRecoveryTester:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[DRTest] = []
+        self._records: RecordStore[DRTest] = RecordStore(self._max_records)
         self._analyses: list[DRAnalysis] = []
         logger.info(
             "disaster_recovery_tester.initialized",
@@ -120,8 +122,6 @@ class DisasterRecoveryTester:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "disaster_recovery_tester.test_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class DisasterRecoveryTester:
         return record
 
     def get_test(self, record_id: str) -> DRTest | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_tests(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DRDrillTracker:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate_pct = min_success_rate_pct
-        self._records: list[DrillRecord] = []
+        self._records: RecordStore[DrillRecord] = RecordStore(self._max_records)
         self._findings: list[DrillFinding] = []
         logger.info(
             "dr_drill_tracker.initialized",
@@ -116,8 +118,6 @@ class DRDrillTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dr_drill_tracker.drill_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class DRDrillTracker:
         return record
 
     def get_drill(self, record_id: str) -> DrillRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drills(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -102,7 +104,7 @@ class EnvironmentParityEngine:
     ) -> None:
         self._max_records = max_records
         self._parity_threshold = parity_threshold
-        self._records: list[EnvironmentParityRecord] = []
+        self._records: RecordStore[EnvironmentParityRecord] = RecordStore(self._max_records)
         self._analyses: list[EnvironmentParityAnalysis] = []
         logger.info(
             "environment.parity.engine.initialized",
@@ -140,8 +142,6 @@ class EnvironmentParityEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "environment.parity.engine.item_recorded",
             record_id=record.id,
@@ -152,10 +152,7 @@ class EnvironmentParityEngine:
         return record
 
     def get_record(self, record_id: str) -> EnvironmentParityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
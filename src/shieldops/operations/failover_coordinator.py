@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class MultiRegionFailoverCoordinator:
     ) -> None:
         self._max_records = max_records
         self._max_rto_seconds = max_rto_seconds
-        self._records: list[FailoverRecord] = []
+        self._records: RecordStore[FailoverRecord] = RecordStore(self._max_records)
         self._plans: list[FailoverPlan] = []
         logger.info(
             "failover_coordinator.initialized",
@@ -116,8 +118,6 @@ class MultiRegionFailoverCoordinator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "failover_coordinator.failover_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class MultiRegionFailoverCoordinator:
         return record
 
     def get_failover(self, record_id: str) -> FailoverRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_failovers(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -105,7 +107,7 @@ class FleetConfigurationEngine:
     ) -> None:
         self._max_records = max_records
         self._consistency_threshold = consistency_threshold
-        self._records: list[FleetConfigurationRecord] = []
+        self._records: RecordStore[FleetConfigurationRecord] = RecordStore(self._max_records)
         self._analyses: list[FleetConfigurationAnalysis] = []
         logger.info(
             "fleet.configuration.engine.initialized",
@@ -145,8 +147,6 @@ class FleetConfigurationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "fleet.configuration.engine.item_recorded",
             record_id=record.id,
@@ -157,10 +157,7 @@ class FleetConfigurationEngine:
         return record
 
     def get_record(self, record_id: str) -> FleetConfigurationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
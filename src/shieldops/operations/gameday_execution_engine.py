@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class GamedayExecutionEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[GamedaySession] = []
+        self._records: RecordStore[GamedaySession] = RecordStore(self._max_records)
         self._analyses: list[GamedayAnalysis] = []
         logger.info(
             "gameday_execution_engine.initialized",
@@ -120,8 +122,6 @@ class GamedayExecutionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "gameday_execution_engine.session_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class GamedayExecutionEngine:
         return record
 
     def get_session(self, record_id: str) -> GamedaySession | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_sessions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class HandoverQualityTracker:
     ) -> None:
         self._max_records = max_records
         self._min_handover_quality_pct = min_handover_quality_pct
-        self._records: list[HandoverRecord] = []
+        self._records: RecordStore[HandoverRecord] = RecordStore(self._max_records)
         self._checklists: list[HandoverChecklist] = []
         logger.info(
             "handover_quality.initialized",
@@ -124,8 +126,6 @@ class HandoverQualityTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "handover_quality.handover_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class HandoverQualityTracker:
         return record
 
     def get_handover(self, record_id: str) -> HandoverRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_handovers(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class IterationSchedulerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[IterationRecord] = []
+        self._records: RecordStore[IterationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, IterationAnalysis] = {}
         logger.info(
             "iteration_scheduler_engine.initialized",
@@ -118,8 +120,6 @@ class IterationSchedulerEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "iteration_scheduler_engine.item_recorded",
             record_id=record.id,
@@ -128,10 +128,9 @@ class IterationSchedulerEngine:
         return record
 
     def process(self, key: str) -> dict[str, Any]:
-        matching = [r for r in self._records if r.id == key]
-        if not matching:
+        rec = self._records.get(key)
+        if rec is None:
             return {"key": key, "status": "no_data"}
-        rec = matching[0]
         analysis = IterationAnalysis(
             name=rec.name,
             strategy=rec.strategy,
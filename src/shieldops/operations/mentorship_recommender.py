@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class MentorshipRecommender:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[MentorshipRecord] = []
+        self._records: RecordStore[MentorshipRecord] = RecordStore(self._max_records)
         self._analyses: list[MentorshipAnalysis] = []
         logger.info(
             "mentorship_recommender.initialized",
@@ -127,8 +129,6 @@ class MentorshipRecommender:
             sessions_completed=sessions_completed,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mentorship_recommender.mentorship_recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class MentorshipRecommender:
         return record
 
     def get_mentorship(self, record_id: str) -> MentorshipRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mentorships(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class OperationalMetricAggregator:
     ) -> None:
         self._max_records = max_records
         self._min_metric_health_pct = min_metric_health_pct
-        self._records: list[MetricRecord] = []
+        self._records: RecordStore[MetricRecord] = RecordStore(self._max_records)
         self._thresholds: list[MetricThreshold] = []
         logger.info(
             "metric_aggregator.initialized",
@@ -121,8 +123,6 @@ class OperationalMetricAggregator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "metric_aggregator.metric_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class OperationalMetricAggregator:
         return record
 
     def get_metric(self, record_id: str) -> MetricRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class NotificationDeliveryOptimizer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[NotificationDeliveryRecord] = []
+        self._records: RecordStore[NotificationDeliveryRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, NotificationDeliveryAnalysis] = {}
         logger.info(
             "notification_delivery_optimizer.init",
@@ -118,8 +120,6 @@ class NotificationDeliveryOptimizer:
             channel=channel,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "notification_delivery.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class NotificationDeliveryOptimizer:
         return record
 
     def process(self, key: str) -> NotificationDeliveryAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.channel == rec.channel]
@@ -201,7 +197,7 @@ class NotificationDeliveryOptimizer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("notification_delivery_optimizer.cleared")
         return {"status": "cleared"}
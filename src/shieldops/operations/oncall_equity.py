@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class TeamOnCallEquityAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_inequity_pct = max_inequity_pct
-        self._records: list[OnCallEquityRecord] = []
+        self._records: RecordStore[OnCallEquityRecord] = RecordStore(self._max_records)
         self._adjustments: list[EquityAdjustment] = []
         logger.info(
             "oncall_equity.initialized",
@@ -124,8 +126,6 @@ class TeamOnCallEquityAnalyzer:
             period=period,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "oncall_equity.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TeamOnCallEquityAnalyzer:
         return record
 
     def get_equity(self, record_id: str) -> OnCallEquityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_equities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class OncallEquityScorer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[EquityRecord] = []
+        self._records: RecordStore[EquityRecord] = RecordStore(self._max_records)
         self._analyses: list[EquityAnalysis] = []
         logger.info(
             "oncall_equity_scorer.initialized",
@@ -124,8 +126,6 @@ class OncallEquityScorer:
             page_count=page_count,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "oncall_equity_scorer.equity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class OncallEquityScorer:
         return record
 
     def get_equity(self, record_id: str) -> EquityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_equities(
         self,
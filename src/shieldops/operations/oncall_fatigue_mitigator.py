@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class OncallFatigueMitigator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[FatigueRecord] = []
+        self._records: RecordStore[FatigueRecord] = RecordStore(self._max_records)
         self._analyses: list[FatigueAnalysis] = []
         logger.info(
             "oncall_fatigue_mitigator.initialized",
@@ -124,8 +126,6 @@ class OncallFatigueMitigator:
             page_count=page_count,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "oncall_fatigue_mitigator.fatigue_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class OncallFatigueMitigator:
         return record
 
     def get_fatigue(self, record_id: str) -> FatigueRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_fatigues(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class OperationalHygieneScorer:
     ) -> None:
         self._max_records = max_records
         self._min_hygiene_score = min_hygiene_score
-        self._records: list[HygieneRecord] = []
+        self._records: RecordStore[HygieneRecord] = RecordStore(self._max_records)
         self._assessments: list[HygieneAssessment] = []
         logger.info(
             "operational_hygiene_scorer.initialized",
@@ -124,8 +126,6 @@ class OperationalHygieneScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "operational_hygiene_scorer.hygiene_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class OperationalHygieneScorer:
         return record
 
     def get_hygiene(self, record_id: str) -> HygieneRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_hygiene_records(
         self,
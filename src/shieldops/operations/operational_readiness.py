@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class OperationalReadinessScorer:
     ) -> None:
         self._max_records = max_records
         self._min_readiness_score = min_readiness_score
-        self._records: list[ReadinessRecord] = []
+        self._records: RecordStore[ReadinessRecord] = RecordStore(self._max_records)
         self._checkpoints: list[ReadinessCheckpoint] = []
         logger.info(
             "operational_readiness.initialized",
@@ -124,8 +126,6 @@ class OperationalReadinessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "operational_readiness.readiness_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class OperationalReadinessScorer:
         return record
 
     def get_readiness(self, record_id: str) -> ReadinessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_readiness(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ProvisioningPipelineOptimizer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[PipelineOptimizationRecord] = []
+        self._records: RecordStore[PipelineOptimizationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, PipelineOptimizationAnalysis] = {}
         logger.info(
             "provisioning_pipeline_optimizer.init",
@@ -117,8 +119,6 @@ class ProvisioningPipelineOptimizer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "pipeline_optimization.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class ProvisioningPipelineOptimizer:
         return record
 
     def process(self, key: str) -> PipelineOptimizationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         stages = [r for r in self._records if r.pipeline_id == rec.pipeline_id]
@@ -207,7 +203,7 @@ class ProvisioningPipelineOptimizer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("provisioning_pipeline_optimizer.cleared")
         return {"status": "cleared"}
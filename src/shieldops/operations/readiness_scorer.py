@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class OperationalReadinessScorer:
     ) -> None:
         self._max_records = max_records
         self._min_readiness_score = min_readiness_score
-        self._records: list[ReadinessAssessment] = []
+        self._records: RecordStore[ReadinessAssessment] = RecordStore(self._max_records)
         self._gaps: list[ReadinessGap] = []
         logger.info(
             "readiness_scorer.initialized",
@@ -121,8 +123,6 @@ class OperationalReadinessScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "readiness_scorer.assessment_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class OperationalReadinessScorer:
         return record
 
     def get_assessment(self, record_id: str) -> ReadinessAssessment | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
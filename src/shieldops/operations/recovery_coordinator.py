@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RecoveryCoordinator:
     ) -> None:
         self._max_records = max_records
         self._max_recovery_hours = max_recovery_hours
-        self._records: list[RecoveryRecord] = []
+        self._records: RecordStore[RecoveryRecord] = RecordStore(self._max_records)
         self._milestones: list[RecoveryMilestone] = []
         logger.info(
             "recovery_coordinator.initialized",
@@ -115,8 +117,6 @@ class RecoveryCoordinator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "recovery_coordinator.recovery_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class RecoveryCoordinator:
         return record
 
     def get_recovery(self, record_id: str) -> RecoveryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_recoveries(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class RecoveryDependencyMapper:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RecoveryDependencyRecord] = []
+        self._records: RecordStore[RecoveryDependencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RecoveryDependencyAnalysis] = {}
         logger.info(
             "recovery_dependency_mapper.init",
@@ -121,8 +123,6 @@ class RecoveryDependencyMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "recovery_dependency.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class RecoveryDependencyMapper:
         return record
 
     def process(self, key: str) -> RecoveryDependencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         deps = [r for r in self._records if r.source_service == rec.source_service]
@@ -196,7 +192,7 @@ class RecoveryDependencyMapper:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("recovery_dependency_mapper.cleared")
         return {"status": "cleared"}
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RecoveryRunbookEffectivenessEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RunbookEffectivenessRecord] = []
+        self._records: RecordStore[RunbookEffectivenessRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RunbookEffectivenessAnalysis] = {}
         logger.info(
             "recovery_runbook_effectiveness_engine.init",
@@ -118,8 +120,6 @@ class RecoveryRunbookEffectivenessEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "recovery_runbook_effectiveness.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class RecoveryRunbookEffectivenessEngine:
         return record
 
     def process(self, key: str) -> RunbookEffectivenessAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.runbook_id == rec.runbook_id]
@@ -192,7 +188,7 @@ class RecoveryRunbookEffectivenessEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("recovery_runbook_effectiveness_engine.cleared")
         return {"status": "cleared"}
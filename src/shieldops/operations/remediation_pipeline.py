@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RemediationPipelineOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._max_step_count = max_step_count
-        self._records: list[PipelineRecord] = []
+        self._records: RecordStore[PipelineRecord] = RecordStore(self._max_records)
         self._steps: list[PipelineStep] = []
         logger.info(
             "remediation_pipeline.initialized",
@@ -115,8 +117,6 @@ class RemediationPipelineOrchestrator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "remediation_pipeline.pipeline_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class RemediationPipelineOrchestrator:
         return record
 
     def get_pipeline(self, record_id: str) -> PipelineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_pipelines(
         self,
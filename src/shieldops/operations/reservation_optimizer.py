@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ReservationOptimizer:
     ) -> None:
         self._max_records = max_records
         self._min_utilization_pct = min_utilization_pct
-        self._records: list[ReservationRecord] = []
+        self._records: RecordStore[ReservationRecord] = RecordStore(self._max_records)
         self._metrics: list[UtilizationMetric] = []
         logger.info(
             "reservation_optimizer.initialized",
@@ -124,8 +126,6 @@ class ReservationOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reservation_optimizer.reservation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ReservationOptimizer:
         return record
 
     def get_reservation(self, record_id: str) -> ReservationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reservations(
         self,
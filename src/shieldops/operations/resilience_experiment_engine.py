@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ResilienceExperimentEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ResilienceExperimentRecord] = []
+        self._records: RecordStore[ResilienceExperimentRecord] = RecordStore(self._max_records)
         self._analyses: list[ResilienceExperimentAnalysis] = []
         logger.info(
             "resilience.experiment.engine.initialized",
@@ -122,8 +124,6 @@ class ResilienceExperimentEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "resilience.experiment.engine.item_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class ResilienceExperimentEngine:
         return record
 
     def get_record(self, record_id: str) -> ResilienceExperimentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
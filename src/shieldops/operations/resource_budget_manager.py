@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ResourceBudgetManager:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[BudgetRecord] = []
+        self._records: RecordStore[BudgetRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, BudgetAnalysis] = {}
         logger.info(
             "resource_budget_manager.initialized",
@@ -121,8 +123,6 @@ class ResourceBudgetManager:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "resource_budget_manager.item_recorded",
             record_id=record.id,
@@ -131,10 +131,9 @@ class ResourceBudgetManager:
         return record
 
     def process(self, key: str) -> dict[str, Any]:
-        matching = [r for r in self._records if r.id == key]
-        if not matching:
+        rec = self._records.get(key)
+        if rec is None:
             return {"key": key, "status": "no_data"}
-        rec = matching[0]
         util = round(rec.consumed / rec.allocated, 4) if rec.allocated > 0 else 0.0
         analysis = BudgetAnalysis(
             name=rec.name,
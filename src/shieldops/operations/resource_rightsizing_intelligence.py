@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ResourceRightsizingIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RightsizingRecord] = []
+        self._records: RecordStore[RightsizingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RightsizingAnalysis] = {}
         logger.info(
             "resource_rightsizing.init",
@@ -119,8 +121,6 @@ class ResourceRightsizingIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "resource_rightsizing.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class ResourceRightsizingIntelligence:
         return record
 
     def process(self, key: str) -> RightsizingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         savings = 0.0
@@ -194,7 +190,7 @@ class ResourceRightsizingIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("resource_rightsizing.cleared")
         return {"status": "cleared"}
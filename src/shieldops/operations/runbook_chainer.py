@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RunbookChainExecutor:
     ) -> None:
         self._max_records = max_records
         self._max_chain_length = max_chain_length
-        self._records: list[ChainRecord] = []
+        self._records: RecordStore[ChainRecord] = RecordStore(self._max_records)
         self._links: list[ChainLink] = []
         logger.info(
             "runbook_chain_executor.initialized",
@@ -115,8 +117,6 @@ class RunbookChainExecutor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_chain_executor.chain_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class RunbookChainExecutor:
         return record
 
     def get_chain(self, record_id: str) -> ChainRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_chains(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class RunbookComplianceChecker:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_pct = min_compliance_pct
-        self._records: list[ComplianceCheckRecord] = []
+        self._records: RecordStore[ComplianceCheckRecord] = RecordStore(self._max_records)
         self._standards: list[ComplianceStandard] = []
         logger.info(
             "runbook_compliance.initialized",
@@ -120,8 +122,6 @@ class RunbookComplianceChecker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_compliance.check_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class RunbookComplianceChecker:
         return record
 
     def get_check(self, record_id: str) -> ComplianceCheckRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_checks(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class RunbookCoverageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_coverage_pct = min_coverage_pct
-        self._records: list[CoverageRecord] = []
+        self._records: RecordStore[CoverageRecord] = RecordStore(self._max_records)
         self._gaps: list[CoverageGapDetail] = []
         logger.info(
             "runbook_coverage.initialized",
@@ -128,8 +130,6 @@ class RunbookCoverageAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_coverage.recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class RunbookCoverageAnalyzer:
         return record
 
     def get_coverage(self, record_id: str) -> CoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_coverages(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RunbookDependencyMapper:
     ) -> None:
         self._max_records = max_records
         self._max_broken_dependency_pct = max_broken_dependency_pct
-        self._records: list[RunbookDepRecord] = []
+        self._records: RecordStore[RunbookDepRecord] = RecordStore(self._max_records)
         self._metrics: list[DependencyCheck] = []
         logger.info(
             "runbook_dependency.initialized",
@@ -124,8 +126,6 @@ class RunbookDependencyMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_dependency.dependency_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RunbookDependencyMapper:
         return record
 
     def get_dependency(self, record_id: str) -> RunbookDepRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dependencies(
         self,
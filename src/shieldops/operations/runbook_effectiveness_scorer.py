@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RunbookEffectivenessScorer:
     ) -> None:
         self._max_records = max_records
         self._min_effectiveness_score = min_effectiveness_score
-        self._records: list[EffectivenessRecord] = []
+        self._records: RecordStore[EffectivenessRecord] = RecordStore(self._max_records)
         self._metrics: list[EffectivenessMetric] = []
         logger.info(
             "runbook_effectiveness_scorer.initialized",
@@ -124,8 +126,6 @@ class RunbookEffectivenessScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_effectiveness_scorer.effectiveness_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RunbookEffectivenessScorer:
         return record
 
     def get_effectiveness(self, record_id: str) -> EffectivenessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_effectiveness(
         self,
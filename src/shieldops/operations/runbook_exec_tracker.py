@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class RunbookExecutionTracker:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate_pct = min_success_rate_pct
-        self._records: list[ExecutionRecord] = []
+        self._records: RecordStore[ExecutionRecord] = RecordStore(self._max_records)
         self._steps: list[ExecutionStep] = []
         logger.info(
             "runbook_exec_tracker.initialized",
@@ -122,8 +124,6 @@ class RunbookExecutionTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_exec_tracker.execution_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class RunbookExecutionTracker:
         return record
 
     def get_execution(self, record_id: str) -> ExecutionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_executions(
         self,
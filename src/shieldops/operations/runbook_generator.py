@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class OperationalRunbookGenerator:
     ) -> None:
         self._max_records = max_records
         self._min_accuracy_pct = min_accuracy_pct
-        self._records: list[GeneratedRunbook] = []
+        self._records: RecordStore[GeneratedRunbook] = RecordStore(self._max_records)
         self._rules: list[GenerationRule] = []
         logger.info(
             "runbook_generator.initialized",
@@ -116,8 +118,6 @@ class OperationalRunbookGenerator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_generator.runbook_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class OperationalRunbookGenerator:
         return record
 
     def get_runbook(self, record_id: str) -> GeneratedRunbook | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_runbooks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RunbookQualityScorer:
     ) -> None:
         self._max_records = max_records
         self._min_quality_score = min_quality_score
-        self._records: list[QualityRecord] = []
+        self._records: RecordStore[QualityRecord] = RecordStore(self._max_records)
         self._assessments: list[QualityAssessment] = []
         logger.info(
             "runbook_quality_scorer.initialized",
@@ -124,8 +126,6 @@ class RunbookQualityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_quality_scorer.quality_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RunbookQualityScorer:
         return record
 
     def get_quality(self, record_id: str) -> QualityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_qualities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class RunbookRecommendationEngine:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[RecommendationRecord] = []
+        self._records: RecordStore[RecommendationRecord] = RecordStore(self._max_records)
         self._matches: list[RunbookMatch] = []
         logger.info(
             "runbook_recommender.initialized",
@@ -116,8 +118,6 @@ class RunbookRecommendationEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runbook_recommender.recommendation_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class RunbookRecommendationEngine:
         return record
 
     def get_recommendation(self, record_id: str) -> RecommendationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_recommendations(
         self,
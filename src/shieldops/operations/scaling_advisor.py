@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PredictiveScalingAdvisor:
     ) -> None:
         self._max_records = max_records
         self._min_confidence_pct = min_confidence_pct
-        self._records: list[ScalingRecord] = []
+        self._records: RecordStore[ScalingRecord] = RecordStore(self._max_records)
         self._recommendations: list[ScalingRecommendation] = []
         logger.info(
             "scaling_advisor.initialized",
@@ -116,8 +118,6 @@ class PredictiveScalingAdvisor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "scaling_advisor.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class PredictiveScalingAdvisor:
         return record
 
     def get_scaling(self, record_id: str) -> ScalingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scalings(
         self,
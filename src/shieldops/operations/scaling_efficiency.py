@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ScalingEfficiencyTracker:
     ) -> None:
         self._max_records = max_records
         self._max_duration_seconds = max_duration_seconds
-        self._records: list[ScalingEventRecord] = []
+        self._records: RecordStore[ScalingEventRecord] = RecordStore(self._max_records)
         self._inefficiencies: list[ScalingInefficiency] = []
         logger.info(
             "scaling_efficiency.initialized",
@@ -122,8 +124,6 @@ class ScalingEfficiencyTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "scaling_efficiency.event_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class ScalingEfficiencyTracker:
         return record
 
     def get_event(self, record_id: str) -> ScalingEventRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_events(
         self,
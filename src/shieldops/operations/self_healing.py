@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class SelfHealingOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate_pct = min_success_rate_pct
-        self._records: list[HealingRecord] = []
+        self._records: RecordStore[HealingRecord] = RecordStore(self._max_records)
         self._policies: list[HealingPolicy] = []
         logger.info(
             "self_healing.initialized",
@@ -116,8 +118,6 @@ class SelfHealingOrchestrator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "self_healing.healing_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class SelfHealingOrchestrator:
         return record
 
     def get_healing(self, record_id: str) -> HealingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_healings(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class SelfServiceProvisioningEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[SelfServiceProvisioningRecord] = []
+        self._records: RecordStore[SelfServiceProvisioningRecord] = RecordStore(self._max_records)
         self._analyses: list[SelfServiceProvisioningAnalysis] = []
         logger.info(
             "self.service.provisioning.engine.initialized",
@@ -126,8 +128,6 @@ class SelfServiceProvisioningEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "self.service.provisioning.engine.item_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SelfServiceProvisioningEngine:
         return record
 
     def get_record(self, record_id: str) -> SelfServiceProvisioningRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
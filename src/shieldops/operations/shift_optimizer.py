@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ShiftScheduleOptimizer:
     ) -> None:
         self._max_records = max_records
         self._max_coverage_gap_pct = max_coverage_gap_pct
-        self._records: list[ShiftRecord] = []
+        self._records: RecordStore[ShiftRecord] = RecordStore(self._max_records)
         self._gaps: list[CoverageGap] = []
         logger.info(
             "shift_optimizer.initialized",
@@ -124,8 +126,6 @@ class ShiftScheduleOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "shift_optimizer.shift_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ShiftScheduleOptimizer:
         return record
 
     def get_shift(self, record_id: str) -> ShiftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_shifts(
         self,
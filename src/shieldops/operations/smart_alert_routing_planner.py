@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SmartAlertRoutingPlanner:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SmartAlertRoutingRecord] = []
+        self._records: RecordStore[SmartAlertRoutingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SmartAlertRoutingAnalysis] = {}
         logger.info(
             "smart_alert_routing_planner.init",
@@ -118,8 +120,6 @@ class SmartAlertRoutingPlanner:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "smart_alert_routing.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class SmartAlertRoutingPlanner:
         return record
 
     def process(self, key: str) -> SmartAlertRoutingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         related = [r for r in self._records if r.route_id == rec.route_id]
@@ -209,7 +205,7 @@ class SmartAlertRoutingPlanner:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("smart_alert_routing_planner.cleared")
         return {"status": "cleared"}
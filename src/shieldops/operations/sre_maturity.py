@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SREMaturityAssessor:
     ) -> None:
         self._max_records = max_records
         self._target_maturity_score = target_maturity_score
-        self._records: list[MaturityAssessment] = []
+        self._records: RecordStore[MaturityAssessment] = RecordStore(self._max_records)
         self._roadmap: list[MaturityRoadmapItem] = []
         logger.info(
             "sre_maturity.initialized",
@@ -141,8 +143,6 @@ class SREMaturityAssessor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sre_maturity.assessment_recorded",
             record_id=record.id,
@@ -153,10 +153,7 @@ class SREMaturityAssessor:
         return record
 
     def get_assessment(self, record_id: str) -> MaturityAssessment | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_assessments(
         self,
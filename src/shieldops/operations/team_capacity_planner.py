@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TeamCapacityPlanner:
     ) -> None:
         self._max_records = max_records
         self._capacity_utilization_threshold = capacity_utilization_threshold
-        self._records: list[CapacityRecord] = []
+        self._records: RecordStore[CapacityRecord] = RecordStore(self._max_records)
         self._assessments: list[CapacityAssessment] = []
         logger.info(
             "team_capacity_planner.initialized",
@@ -124,8 +126,6 @@ class TeamCapacityPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "team_capacity_planner.capacity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TeamCapacityPlanner:
         return record
 
     def get_capacity(self, record_id: str) -> CapacityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_capacity_records(
         self,
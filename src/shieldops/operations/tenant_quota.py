@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class TenantResourceQuotaManager:
     ) -> None:
         self._max_records = max_records
         self._max_utilization_pct = max_utilization_pct
-        self._records: list[QuotaRecord] = []
+        self._records: RecordStore[QuotaRecord] = RecordStore(self._max_records)
         self._policies: list[QuotaPolicy] = []
         logger.info(
             "tenant_quota.initialized",
@@ -113,8 +115,6 @@ class TenantResourceQuotaManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "tenant_quota.recorded",
             record_id=record.id,
@@ -125,10 +125,7 @@ class TenantResourceQuotaManager:
         return record
 
     def get_quota(self, record_id: str) -> QuotaRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_quotas(
         self,
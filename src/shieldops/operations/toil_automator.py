@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ToilAutomationTracker:
     ) -> None:
         self._max_records = max_records
         self._min_automation_pct = min_automation_pct
-        self._records: list[ToilRecord] = []
+        self._records: RecordStore[ToilRecord] = RecordStore(self._max_records)
         self._progress: list[AutomationProgress] = []
         logger.info(
             "toil_automator.initialized",
@@ -124,8 +126,6 @@ class ToilAutomationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "toil_automator.toil_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ToilAutomationTracker:
         return record
 
     def get_toil(self, record_id: str) -> ToilRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_toils(
         self,
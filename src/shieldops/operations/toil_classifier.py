@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class OperationalToilClassifier:
     ) -> None:
         self._max_records = max_records
         self._max_toil_hours_weekly = max_toil_hours_weekly
-        self._records: list[ToilRecord] = []
+        self._records: RecordStore[ToilRecord] = RecordStore(self._max_records)
         self._classifications: list[ToilClassification] = []
         logger.info(
             "toil_classifier.initialized",
@@ -117,8 +119,6 @@ class OperationalToilClassifier:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "toil_classifier.toil_recorded",
             record_id=record.id,
@@ -129,10 +129,7 @@ class OperationalToilClassifier:
         return record
 
     def get_toil(self, record_id: str) -> ToilRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_toils(
         self,
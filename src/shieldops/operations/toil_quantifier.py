@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class TeamToilQuantifier:
     ) -> None:
         self._max_records = max_records
         self._max_toil_hours_weekly = max_toil_hours_weekly
-        self._records: list[ToilRecord] = []
+        self._records: RecordStore[ToilRecord] = RecordStore(self._max_records)
         self._policies: list[ToilPolicy] = []
         logger.info(
             "toil_quantifier.initialized",
@@ -116,8 +118,6 @@ class TeamToilQuantifier:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "toil_quantifier.toil_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class TeamToilQuantifier:
         return record
 
     def get_toil(self, record_id: str) -> ToilRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_toils(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TrainingNeedIdentifier:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[TrainingRecord] = []
+        self._records: RecordStore[TrainingRecord] = RecordStore(self._max_records)
         self._analyses: list[TrainingAnalysis] = []
         logger.info(
             "training_need_identifier.initialized",
@@ -124,8 +126,6 @@ class TrainingNeedIdentifier:
             estimated_hours=estimated_hours,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "training_need_identifier.training_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TrainingNeedIdentifier:
         return record
 
     def get_training(self, record_id: str) -> TrainingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trainings(
         self,
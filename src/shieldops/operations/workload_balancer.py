@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class TeamWorkloadBalancer:
     ) -> None:
         self._max_records = max_records
         self._max_imbalance_pct = max_imbalance_pct
-        self._records: list[WorkloadRecord] = []
+        self._records: RecordStore[WorkloadRecord] = RecordStore(self._max_records)
         self._assignments: list[WorkloadAssignment] = []
         logger.info(
             "workload_balancer.initialized",
@@ -113,8 +115,6 @@ class TeamWorkloadBalancer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "workload_balancer.recorded",
             record_id=record.id,
@@ -125,10 +125,7 @@ class TeamWorkloadBalancer:
         return record
 
     def get_workload(self, record_id: str) -> WorkloadRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_workloads(
         self,
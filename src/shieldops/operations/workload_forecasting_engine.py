@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class WorkloadForecastingEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[WorkloadForecastingEngineRecord] = []
+        self._records: RecordStore[WorkloadForecastingEngineRecord] = RecordStore(self._max_records)
         self._analyses: list[WorkloadForecastingEngineAnalysis] = []
         logger.info(
             "workload.forecasting.engine.initialized",
@@ -124,8 +126,6 @@ class WorkloadForecastingEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "workload.forecasting.engine.item_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class WorkloadForecastingEngine:
         return record
 
     def get_record(self, record_id: str) -> WorkloadForecastingEngineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
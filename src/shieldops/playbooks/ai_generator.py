@@ -85,6 +85,7 @@ class AIPlaybookGenerator:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 schema=GeneratedPlaybook,
+                agent_type="playbook_generator",
             )
 
             if isinstance(result, GeneratedPlaybook):
@@ -151,6 +152,7 @@ class AIPlaybookGenerator:
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 schema=GeneratedPlaybook,
+                agent_type="playbook_generator",
             )
 
             if isinstance(result, GeneratedPlaybook):
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class CrossAgentPolicyEnforcer:
     ) -> None:
         self._max_records = max_records
         self._max_violations_per_agent = max_violations_per_agent
-        self._records: list[EnforcementRecord] = []
+        self._records: RecordStore[EnforcementRecord] = RecordStore(self._max_records)
         self._rules: list[PolicyRule] = []
         logger.info(
             "cross_agent_enforcer.initialized",
@@ -115,8 +117,6 @@ class CrossAgentPolicyEnforcer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_agent_enforcer.recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class CrossAgentPolicyEnforcer:
         return record
 
     def get_enforcement(self, record_id: str) -> EnforcementRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_enforcements(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PlatformGovernanceScorer:
     ) -> None:
         self._max_records = max_records
         self._min_governance_score = min_governance_score
-        self._records: list[GovernanceRecord] = []
+        self._records: RecordStore[GovernanceRecord] = RecordStore(self._max_records)
         self._metrics: list[GovernanceMetric] = []
         logger.info(
             "governance_scorer.initialized",
@@ -116,8 +118,6 @@ class PlatformGovernanceScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "governance_scorer.governance_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PlatformGovernanceScorer:
         return record
 
     def get_governance(self, record_id: str) -> GovernanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_governance_records(
         self,
@@ -1,5 +1,9 @@
 """OPA policy evaluation client."""
 
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
@@ -7,6 +11,7 @@ import structlog
 
 from shieldops.config import settings
 from shieldops.models.base import Environment, RemediationAction, RiskLevel
+from shieldops.policy.opa.local import LocalPolicyEvaluator
 from shieldops.utils.resilience import CircuitBreaker, CircuitOpenError
 
 logger = structlog.get_logger()
@@ -24,10 +29,30 @@ class PolicyDecision:
         return not self.allowed
 
 
+# Rate-limit counters in the OPA input context.  They change with every
+# allowed action, so they are left out of decision cache keys.
+VOLATILE_CONTEXT_KEYS = frozenset(
+    {"actions_this_hour", "actions_this_minute", "team_actions_this_hour"}
+)
+
+
 class PolicyEngine:
     """Evaluates agent actions against OPA policies before execution.
 
     Every agent action must pass through this engine. No exceptions.
+
+    Args:
+        opa_url: OPA base URL; defaults to ``settings.opa_endpoint``.
+        rate_limiter: Supplies the rate-limit counters for the OPA input
+            and records allowed actions.
+        circuit_breaker: Breaker around OPA calls.
+        decision_cache_ttl: Seconds an OPA decision is reused for an
+            identical input (ignoring rate-limit counters).  0 disables
+            the cache.  Keep it short if ``allow`` rules read the counters
+            or the clock.
+        decision_cache_size: Maximum cached decisions.
+        local_evaluator: Evaluate ``allow`` in-process from the compiled
+            Rego bundle instead of querying the OPA server.
     """
 
     def __init__(
@@ -35,6 +60,9 @@ class PolicyEngine:
         opa_url: str | None = None,
         rate_limiter: Any = None,
         circuit_breaker: CircuitBreaker | None = None,
+        decision_cache_ttl: float = 0.0,
+        decision_cache_size: int = 10_000,
+        local_evaluator: LocalPolicyEvaluator | None = None,
     ) -> None:
         self._opa_url = opa_url or settings.opa_endpoint
         self._client = httpx.AsyncClient(timeout=5.0)
@@ -44,6 +72,10 @@ class PolicyEngine:
             failure_threshold=5,
             recovery_timeout=30.0,
         )
+        self._decision_cache_ttl = decision_cache_ttl
+        self._decision_cache_size = decision_cache_size
+        self._local_evaluator = local_evaluator
+        self._decision_cache: OrderedDict[str, tuple[float, bool, list[str]]] = OrderedDict()
 
     async def evaluate(
         self,
@@ -61,38 +93,89 @@ class PolicyEngine:
         Returns:
             PolicyDecision indicating whether the action is allowed.
         """
-        ctx = dict(context or {})
+        return (await self.evaluate_many([action], agent_id, context))[0]
 
-        # Enrich context with rate limiter data
-        if self._rate_limiter:
+    async def evaluate_many(
+        self,
+        actions: Sequence[RemediationAction],
+        agent_id: str,
+        context: dict[str, Any] | None = None,
+    ) -> list[PolicyDecision]:
+        """Evaluate several actions with one OPA query and one Redis round-trip each way.
+
+        Decisions are made as if the actions were evaluated one after
+        another: each action's rate-limit counters include the earlier
+        actions of the batch.  Actions answered from the decision cache
+        are not sent to OPA.
+
+        Returns:
+            One PolicyDecision per action, in order.
+        """
+        inputs = [self._build_input(action, agent_id, context) for action in actions]
+        keys = [self._cache_key(input_data) for input_data in inputs]
+        results: list[tuple[bool, list[str]] | None] = [self._cached(key) for key in keys]
+
+        misses = [i for i, result in enumerate(results) if result is None]
+        if misses:
+            await self._add_rate_counts(inputs)
             try:
-                actions_this_hour = await self._rate_limiter.count_recent_actions(
-                    action.environment.value
+                fresh = await self._query([inputs[i] for i in misses])
+            except CircuitOpenError as e:
+                logger.error(
+                    "policy_evaluation_circuit_open",
+                    breaker=e.name,
+                    recovery_in=e.recovery_in,
+                )
+                return self._deny_all(
+                    results,
+                    f"OPA circuit breaker open — recovery in "
+                    f"{e.recovery_in:.1f}s. Defaulting to deny.",
+                )
+            except httpx.HTTPError as e:
+                logger.error("policy_evaluation_failed", error=str(e))
+                # Fail closed: if we can't evaluate policy, deny the action
+                return self._deny_all(
+                    results, f"Policy evaluation failed: {e}. Defaulting to deny."
                 )
-                ctx.setdefault("actions_this_hour", actions_this_hour)
             except Exception as e:
-                logger.warning("rate_limiter_enrichment_failed", error=str(e))
+                logger.error("policy_evaluation_error", error=str(e))
+                return self._deny_all(results, f"Policy evaluation error: {e}. Defaulting to deny.")
+            for i, result in zip(misses, fresh, strict=True):
+                results[i] = result
+                self._store(keys[i], *result)
+
+        decisions: list[PolicyDecision] = []
+        allowed_actions: list[tuple[str, str | None]] = []
+        for input_data, result in zip(inputs, results, strict=True):
+            assert result is not None
+            allowed, reasons = result
+            logger.info(
+                "policy_evaluation",
+                action=input_data["action"],
+                target=input_data["target_resource"],
+                environment=input_data["environment"],
+                allowed=allowed,
+                reasons=reasons,
+            )
+            if allowed:
+                allowed_actions.append((input_data["environment"], input_data["team"]))
+            decisions.append(PolicyDecision(allowed=allowed, reasons=list(reasons)))
 
-        if self._rate_limiter:
+        # Increment rate limiter on allowed actions
+        if allowed_actions and self._rate_limiter:
             try:
-                actions_this_minute = await self._rate_limiter.count_recent_actions_minute(
-                    action.environment.value
-                )
-                ctx.setdefault("actions_this_minute", actions_this_minute)
+                await self._rate_limiter.increment_many(allowed_actions)
             except Exception as e:
-                logger.warning("rate_limiter_minute_enrichment_failed", error=str(e))
-
-            team = action.parameters.get("team") or ctx.get("team")
-            if team and self._rate_limiter:
-                try:
-                    team_actions = await self._rate_limiter.count_team_actions(
-                        team, action.environment.value
-                    )
-                    ctx.setdefault("team_actions_this_hour", team_actions)
-                except Exception as e:
-                    logger.warning("rate_limiter_team_enrichment_failed", error=str(e))
-
-        input_data = {
+                logger.warning("rate_limiter_increment_failed", error=str(e))
+
+        return decisions
+
+    @staticmethod
+    def _build_input(
+        action: RemediationAction, agent_id: str, context: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        ctx = dict(context or {})
+        return {
             "action": action.action_type,
             "target_resource": action.target_resource,
             "environment": action.environment.value,
@@ -106,75 +189,102 @@ class PolicyEngine:
             "context": ctx,
         }
 
+    async def _add_rate_counts(self, inputs: list[dict[str, Any]]) -> None:
+        """Enrich each input's context with rate limiter data in one read.
+
+        Counts for later inputs include the earlier inputs of the batch, as
+        they would if the actions were evaluated (and allowed) one by one.
+        """
+        if not self._rate_limiter:
+            return
+        pairs = [(input_data["environment"], input_data["team"]) for input_data in inputs]
         try:
+            counts = await self._rate_limiter.get_counts_many(pairs)
+        except Exception as e:
+            logger.warning("rate_limiter_enrichment_failed", error=str(e))
+            return
+        seen: dict[tuple[str, str], int] = {}
+        for input_data, (env, team), action_counts in zip(inputs, pairs, counts, strict=True):
+            prior_env = seen.get((env, ""), 0)
+            prior_team = seen.get((env, team), 0) if team else 0
+            ctx = input_data["context"]
+            for field, count in action_counts.items():
+                prior = prior_team if field == "team_actions_this_hour" else prior_env
+                ctx.setdefault(field, count + prior)
+            seen[(env, "")] = prior_env + 1
+            if team:
+                seen[(env, team)] = prior_team + 1
+
+    async def _query(self, inputs: list[dict[str, Any]]) -> list[tuple[bool, list[str]]]:
+        """Ask OPA for decisions: ``allow`` for one input, ``batch_allow`` for several."""
+        if self._local_evaluator is not None:
+            return [(allowed, []) for allowed in self._local_evaluator.allow_many(inputs)]
+
+        if len(inputs) == 1:
             response = await self._circuit_breaker.call(
                 self._client.post,
                 f"{self._opa_url}/v1/data/shieldops/allow",
-                json={"input": input_data},
+                json={"input": inputs[0]},
             )
             response.raise_for_status()
             result = response.json()
+            return [(result.get("result", False), result.get("reasons", []))]
 
-            allowed = result.get("result", False)
-            reasons = result.get("reasons", [])
-
-            logger.info(
-                "policy_evaluation",
-                action=action.action_type,
-                target=action.target_resource,
-                environment=action.environment.value,
-                allowed=allowed,
-                reasons=reasons,
-            )
-
-            # Increment rate limiter on allowed actions
-            if allowed and self._rate_limiter:
-                try:
-                    await self._rate_limiter.increment(action.environment.value)
-                except Exception as e:
-                    logger.warning("rate_limiter_increment_failed", error=str(e))
-
-                try:
-                    await self._rate_limiter.increment_minute(action.environment.value)
-                    team = action.parameters.get("team") or ctx.get("team")
-                    if team:
-                        await self._rate_limiter.increment_team(team, action.environment.value)
-                except Exception as e:
-                    logger.warning(
-                        "rate_limiter_extended_increment_failed",
-                        error=str(e),
-                    )
-
-            return PolicyDecision(allowed=allowed, reasons=reasons)
-
-        except CircuitOpenError as e:
-            logger.error(
-                "policy_evaluation_circuit_open",
-                breaker=e.name,
-                recovery_in=e.recovery_in,
-            )
-            return PolicyDecision(
-                allowed=False,
-                reasons=[
-                    f"OPA circuit breaker open — recovery in "
-                    f"{e.recovery_in:.1f}s. Defaulting to deny."
-                ],
-            )
-
-        except httpx.HTTPError as e:
-            logger.error("policy_evaluation_failed", error=str(e))
-            # Fail closed: if we can't evaluate policy, deny the action
-            return PolicyDecision(
-                allowed=False,
-                reasons=[f"Policy evaluation failed: {e}. Defaulting to deny."],
-            )
-
-        except Exception as e:
-            logger.error("policy_evaluation_error", error=str(e))
-            return PolicyDecision(
-                allowed=False,
-                reasons=[f"Policy evaluation error: {e}. Defaulting to deny."],
-            )
+        response = await self._circuit_breaker.call(
+            self._client.post,
+            f"{self._opa_url}/v1/data/shieldops/batch_allow",
+            json={"input": {"batch": inputs}},
+        )
+        response.raise_for_status()
+        decisions = response.json().get("result")
+        if not isinstance(decisions, list) or len(decisions) != len(inputs):
+            raise ValueError("OPA batch_allow returned no decision list for the batch")
+        return [(decision is True, []) for decision in decisions]
+
+    @staticmethod
+    def _deny_all(
+        results: list[tuple[bool, list[str]] | None], reason: str
+    ) -> list[PolicyDecision]:
+        # Cached decisions stand; everything OPA should have answered is denied.
+        return [
+            PolicyDecision(allowed=False, reasons=[reason])
+            if result is None
+            else PolicyDecision(allowed=result[0], reasons=list(result[1]))
+            for result in results
+        ]
+
+    # ── Decision cache ───────────────────────────────────────────
+
+    def _cache_key(self, input_data: dict[str, Any]) -> str:
+        if self._decision_cache_ttl <= 0:
+            return ""
+        ctx = {k: v for k, v in input_data["context"].items() if k not in VOLATILE_CONTEXT_KEYS}
+        return json.dumps({**input_data, "context": ctx}, sort_keys=True, default=str)
+
+    def _cached(self, key: str) -> tuple[bool, list[str]] | None:
+        if not key:
+            return None
+        entry = self._decision_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, allowed, reasons = entry
+        if time.monotonic() >= expires_at:
+            del self._decision_cache[key]
+            return None
+        self._decision_cache.move_to_end(key)
+        return allowed, reasons
+
+    def _store(self, key: str, allowed: bool, reasons: list[str]) -> None:
+        if not key:
+            return
+        self._decision_cache[key] = (
+            time.monotonic() + self._decision_cache_ttl,
+            allowed,
+            list(reasons),
+        )
+        self._decision_cache.move_to_end(key)
+        while len(self._decision_cache) > self._decision_cache_size:
+            self._decision_cache.popitem(last=False)
 
     def classify_risk(
         self,
@@ -0,0 +1,346 @@
+"""In-process evaluation of the ShieldOps ``allow`` policy.
+
+The Rego bundle under ``playbooks/policies`` is compiled ahead of time
+into a Python decision table: one row per ``allow if { ... }`` rule, each
+row a list of conditions on the OPA input.  Evaluating an action is then
+a handful of dict lookups instead of an HTTP round-trip to the OPA
+sidecar, and does not depend on the sidecar being up.
+
+Only the subset of Rego the ``allow`` rules use is supported:
+
+* ``default allow := true|false``
+* ``allow if { ... }`` bodies whose expressions are
+  ``input.<path> == <literal>``, ``input.<path> != <literal>``,
+  ``input.<path> in <set>``, ``input.<path>`` or ``not input.<path>``
+* ``<set> := {"a", "b", ...}`` string-set constants (or the same set
+  written inline after ``in``)
+
+Anything else in an ``allow`` body raises ``UnsupportedRegoError`` when
+the bundle is compiled, so a policy the table cannot express is rejected
+up front instead of being evaluated differently from OPA.  Other rules
+(``deny``, compliance mappings) are ignored: ``allow`` does not read
+them, and neither does the HTTP mode, which queries ``allow`` alone.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+POLICIES_DIR = Path(__file__).resolve().parent.parent.parent.parent.parent / "playbooks/policies"
+
+Condition = Callable[[dict[str, Any]], bool]
+
+_MISSING = object()
+
+_INPUT_PATH = r"input(?:\.[A-Za-z_]\w*)+"
+_LITERAL = r'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?|true|false|null'
+_COMPARE_RE = re.compile(rf"^({_INPUT_PATH})\s*(==|!=)\s*({_LITERAL})$")
+_MEMBER_RE = re.compile(rf"^({_INPUT_PATH})\s+in\s+([A-Za-z_]\w*|\{{.*\}})$")
+_TRUTHY_RE = re.compile(rf"^(not\s+)?({_INPUT_PATH})$")
+_PACKAGE_RE = re.compile(r"^package\s+([\w.]+)", re.MULTILINE)
+_DEFAULT_RE = re.compile(r"^default\s+allow\s*:?=\s*(true|false)\s*$", re.MULTILINE)
+_RULE_HEAD_RE = re.compile(r"^(allow|[A-Za-z_]\w*\s*:=)\s*(if\s*)?\{", re.MULTILINE)
+_STRING_ITEM_RE = re.compile(r'^"(?:[^"\\]|\\.)*"$')
+
+
+class UnsupportedRegoError(ValueError):
+    """The bundle uses Rego the local decision table cannot express."""
+
+
+class CompiledPolicy:
+    """The ``allow`` decision compiled from a Rego bundle.
+
+    The decision depends only on the few input paths the rules read, so
+    results are memoised per combination of those values: a remediation
+    plan of similar actions evaluates its rules once per distinct
+    (action, environment, risk level, ...) tuple.
+    """
+
+    MAX_TABLE_SIZE = 4096
+
+    def __init__(
+        self,
+        default: bool,
+        rules: list[list[Condition]],
+        paths: tuple[tuple[str, ...], ...] = (),
+        source: str = "",
+    ) -> None:
+        self.default = default
+        self.rules = rules
+        self.paths = paths
+        self.source = source
+        self._table: dict[tuple[Any, ...], bool] = {}
+
+    def allow(self, input_data: dict[str, Any]) -> bool:
+        """Evaluate ``data.shieldops.allow`` for *input_data*."""
+        values = []
+        for path in self.paths:
+            value = _lookup(input_data, path)
+            # Keyed with the type so True and 1 (equal in Python) stay apart.
+            values.append((type(value), value))
+        key = tuple(values)
+        try:
+            return self._table[key]
+        except KeyError:
+            pass
+        except TypeError:  # an object or array value: not memoisable
+            return self._evaluate(input_data)
+        decision = self._evaluate(input_data)
+        if len(self._table) >= self.MAX_TABLE_SIZE:
+            self._table.clear()
+        self._table[key] = decision
+        return decision
+
+    def _evaluate(self, input_data: dict[str, Any]) -> bool:
+        for conditions in self.rules:
+            if all(condition(input_data) for condition in conditions):
+                return True
+        return self.default
+
+
+def _strip_comments(text: str) -> str:
+    out: list[str] = []
+    for line in text.splitlines():
+        in_string = False
+        escaped = False
+        for i, ch in enumerate(line):
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = in_string
+            elif ch == '"':
+                in_string = not in_string
+            elif ch == "#" and not in_string:
+                line = line[:i]
+                break
+        out.append(line)
+    return "\n".join(out)
+
+
+def _block_body(text: str, open_brace: int) -> tuple[str, int]:
+    """Return the text between the brace at *open_brace* and its match."""
+    depth = 0
+    in_string = False
+    i = open_brace
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                i += 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[(":
+            depth += 1
+        elif ch in "}])":
+            depth -= 1
+            if depth == 0:
+                return text[open_brace + 1 : i], i + 1
+        i += 1
+    raise UnsupportedRegoError("Unbalanced braces in policy")
+
+
+def _lookup(input_data: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = input_data
+    for part in path:
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _rego_equal(left: Any, right: Any) -> bool:
+    # Rego never equates a boolean with a number, unlike Python.
+    if isinstance(left, bool) or isinstance(right, bool):
+        return type(left) is type(right) and left == right
+    return bool(left == right)
+
+
+def _string_set(body: str) -> frozenset[str] | None:
+    items = [item.strip() for item in body.split(",") if item.strip()]
+    if items and all(_STRING_ITEM_RE.match(item) for item in items):
+        return frozenset(json.loads(item) for item in items)
+    return None
+
+
+def _compile_expression(
+    expr: str, sets: dict[str, frozenset[str]]
+) -> tuple[tuple[str, ...], Condition]:
+    if m := _COMPARE_RE.match(expr):
+        path = tuple(m.group(1).split(".")[1:])
+        literal = json.loads(m.group(3))
+        negate = m.group(2) == "!="
+
+        def compare(input_data: dict[str, Any]) -> bool:
+            value = _lookup(input_data, path)
+            if value is _MISSING:
+                return False  # undefined: the expression fails either way
+            return _rego_equal(value, literal) != negate
+
+        return path, compare
+
+    if m := _MEMBER_RE.match(expr):
+        path = tuple(m.group(1).split(".")[1:])
+        name = m.group(2)
+        found = _string_set(name[1:-1]) if name.startswith("{") else sets.get(name)
+        if found is None:
+            raise UnsupportedRegoError(f"'{name}' is not a set of strings")
+        members = found
+
+        def member(input_data: dict[str, Any]) -> bool:
+            value = _lookup(input_data, path)
+            return isinstance(value, str) and value in members
+
+        return path, member
+
+    if m := _TRUTHY_RE.match(expr):
+        path = tuple(m.group(2).split(".")[1:])
+        negate = m.group(1) is not None
+
+        def truthy(input_data: dict[str, Any]) -> bool:
+            value = _lookup(input_data, path)
+            holds = value is not _MISSING and value is not False
+            return holds != negate
+
+        return path, truthy
+
+    raise UnsupportedRegoError(f"Unsupported expression in allow rule: {expr!r}")
+
+
+def _body_expressions(body: str) -> list[str]:
+    expressions = []
+    for line in body.replace(";", "\n").splitlines():
+        line = line.strip()
+        if line:
+            expressions.append(line)
+    return expressions
+
+
+def compile_policy(sources: dict[str, str], package: str = "shieldops") -> CompiledPolicy:
+    """Compile ``data.<package>.allow`` from Rego module sources.
+
+    Args:
+        sources: Module name (for error messages) to Rego text.
+        package: Package whose ``allow`` rule is compiled.
+
+    Raises:
+        UnsupportedRegoError: An ``allow`` rule uses unsupported Rego.
+    """
+    default = False
+    sets: dict[str, frozenset[str]] = {}
+    bodies: list[tuple[str, str]] = []
+
+    for name, raw in sorted(sources.items()):
+        text = _strip_comments(raw)
+        pkg = _PACKAGE_RE.search(text)
+        if pkg is None or pkg.group(1) != package:
+            continue
+        if m := _DEFAULT_RE.search(text):
+            default = m.group(1) == "true"
+        pos = 0
+        while m := _RULE_HEAD_RE.search(text, pos):
+            body, pos = _block_body(text, m.end() - 1)
+            head = m.group(1)
+            if head == "allow":
+                if not m.group(2):
+                    raise UnsupportedRegoError(f"{name}: allow rules must use 'if'")
+                bodies.append((name, body))
+            elif not m.group(2) and (members := _string_set(body)) is not None:
+                sets[head.rstrip(":= \t")] = members
+
+    rules: list[list[Condition]] = []
+    paths: dict[tuple[str, ...], None] = {}
+    for name, body in bodies:
+        conditions = []
+        for expr in _body_expressions(body):
+            try:
+                path, condition = _compile_expression(expr, sets)
+            except UnsupportedRegoError as e:
+                raise UnsupportedRegoError(f"{name}: {e}") from None
+            paths[path] = None
+            conditions.append(condition)
+        rules.append(conditions)
+    if not rules and not default:
+        raise UnsupportedRegoError(f"No allow rules found for package '{package}'")
+    return CompiledPolicy(default, rules, tuple(paths), source=", ".join(sorted(sources)))
+
+
+class LocalPolicyEvaluator:
+    """Evaluates ``allow`` in-process from a Rego bundle directory.
+
+    The bundle is recompiled when any ``.rego`` file in it is added,
+    removed or modified; the check runs at most once per
+    ``reload_interval`` seconds, on the next evaluation.  A bundle that
+    fails to compile is logged and the previous policy stays in force.
+
+    Args:
+        bundle_dir: Directory of ``.rego`` files; the repo's
+            ``playbooks/policies`` if omitted.
+        reload_interval: Seconds between bundle change checks; 0 checks
+            on every evaluation.
+    """
+
+    def __init__(self, bundle_dir: str | Path | None = None, reload_interval: float = 2.0) -> None:
+        self._dir = Path(bundle_dir) if bundle_dir else POLICIES_DIR
+        self._reload_interval = reload_interval
+        self._signature = self._bundle_signature()
+        self._policy = self._load()
+        self._checked_at = time.monotonic()
+
+    @property
+    def policy(self) -> CompiledPolicy:
+        return self._policy
+
+    def allow(self, input_data: dict[str, Any]) -> bool:
+        self._maybe_reload()
+        return self._policy.allow(input_data)
+
+    def allow_many(self, inputs: list[dict[str, Any]]) -> list[bool]:
+        self._maybe_reload()
+        return [self._policy.allow(input_data) for input_data in inputs]
+
+    def _bundle_signature(self) -> tuple[tuple[str, int, int], ...]:
+        try:
+            entries = list(os.scandir(self._dir))
+        except OSError:
+            return ()
+        return tuple(
+            sorted(
+                (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                for entry in entries
+                if entry.name.endswith(".rego") and entry.is_file()
+            )
+        )
+
+    def _load(self) -> CompiledPolicy:
+        sources = {
+            path.name: path.read_text(encoding="utf-8") for path in sorted(self._dir.glob("*.rego"))
+        }
+        policy = compile_policy(sources)
+        logger.info("local_policy_compiled", bundle=str(self._dir), rules=len(policy.rules))
+        return policy
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self._reload_interval:
+            return
+        self._checked_at = now
+        signature = self._bundle_signature()
+        if signature == self._signature:
+            return
+        self._signature = signature
+        try:
+            self._policy = self._load()
+        except (OSError, UnsupportedRegoError) as e:
+            logger.error("local_policy_reload_failed", bundle=str(self._dir), error=str(e))
@@ -1,5 +1,6 @@
 """Action rate limiter using Redis for OPA rate-limit context enrichment."""
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
 import structlog
@@ -105,6 +106,69 @@ class ActionRateLimiter:
             logger.warning("rate_limiter_minute_incr_failed", error=str(e))
             return 0
 
+    def _context_keys(self, environment: str, team: str | None, now: datetime) -> dict[str, str]:
+        hour = now.strftime("%Y%m%d%H")
+        keys = {
+            "actions_this_hour": f"shieldops:rate:{environment}:{hour}",
+            "actions_this_minute": f"shieldops:rate:min:{environment}:{now.strftime('%Y%m%d%H%M')}",
+        }
+        if team:
+            keys["team_actions_this_hour"] = f"shieldops:rate:{team}:{environment}:{hour}"
+        return keys
+
+    async def get_counts(self, environment: str, team: str | None = None) -> dict[str, int]:
+        """Get the hourly, per-minute and team counts in one round-trip."""
+        return (await self.get_counts_many([(environment, team)]))[0]
+
+    async def get_counts_many(
+        self, actions: Sequence[tuple[str, str | None]]
+    ) -> list[dict[str, int]]:
+        """Get the counts for each ``(environment, team)`` pair with a single MGET.
+
+        Each result is keyed by the OPA context field it feeds
+        (``actions_this_hour``, ``actions_this_minute`` and, when a team is
+        given, ``team_actions_this_hour``).  Counts read as 0 if Redis is
+        unavailable.
+        """
+        now = datetime.now(UTC)
+        per_action = [self._context_keys(env, team, now) for env, team in actions]
+        redis_keys = list(dict.fromkeys(k for keys in per_action for k in keys.values()))
+        if not redis_keys:
+            return []
+        try:
+            client = await self._ensure_client()
+            values = await client.mget(redis_keys)
+        except Exception as e:
+            logger.warning("rate_limiter_read_failed", error=str(e))
+            values = [None] * len(redis_keys)
+        counts = {k: int(v) if v else 0 for k, v in zip(redis_keys, values, strict=True)}
+        return [{field: counts[key] for field, key in keys.items()} for keys in per_action]
+
+    async def increment_many(self, actions: Sequence[tuple[str, str | None]]) -> None:
+        """Count one action per ``(environment, team)`` pair in a single pipeline.
+
+        Equivalent to calling ``increment``, ``increment_minute`` and (when
+        a team is given) ``increment_team`` for each pair.
+        """
+        now = datetime.now(UTC)
+        increments: dict[str, int] = {}
+        ttls: dict[str, int] = {}
+        for env, team in actions:
+            for field, key in self._context_keys(env, team, now).items():
+                increments[key] = increments.get(key, 0) + 1
+                ttls[key] = 120 if field == "actions_this_minute" else 3600
+        if not increments:
+            return
+        try:
+            client = await self._ensure_client()
+            pipe = client.pipeline(transaction=False)
+            for key, amount in increments.items():
+                pipe.incrby(key, amount)
+                pipe.expire(key, ttls[key])
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("rate_limiter_incr_failed", error=str(e))
+
     async def close(self) -> None:
         """Close the Redis connection."""
         if self._client is not None:
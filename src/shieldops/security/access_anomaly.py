@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AccessAnomalyDetector:
     ) -> None:
         self._max_records = max_records
         self._threat_threshold = threat_threshold
-        self._records: list[AccessAnomalyRecord] = []
+        self._records: RecordStore[AccessAnomalyRecord] = RecordStore(self._max_records)
         self._baselines: dict[str, AccessBaseline] = {}
         logger.info(
             "access_anomaly.initialized",
@@ -139,8 +141,6 @@ class AccessAnomalyDetector:
             threat_score=threat_score,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "access_anomaly.anomaly_recorded",
             record_id=record.id,
@@ -151,10 +151,7 @@ class AccessAnomalyDetector:
         return record
 
     def get_anomaly(self, record_id: str) -> AccessAnomalyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_anomalies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AccessContextAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._context_gap_threshold = context_gap_threshold
-        self._records: list[ContextRecord] = []
+        self._records: RecordStore[ContextRecord] = RecordStore(self._max_records)
         self._analyses: list[ContextAnalysis] = []
         logger.info(
             "access_context_analyzer.initialized",
@@ -124,8 +126,6 @@ class AccessContextAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "access_context_analyzer.context_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AccessContextAnalyzer:
         return record
 
     def get_context(self, record_id: str) -> ContextRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_contexts(
         self,
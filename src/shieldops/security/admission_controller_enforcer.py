@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AdmissionControllerEnforcer:
     ) -> None:
         self._max_records = max_records
         self._enforcement_gap_threshold = enforcement_gap_threshold
-        self._records: list[AdmissionRecord] = []
+        self._records: RecordStore[AdmissionRecord] = RecordStore(self._max_records)
         self._analyses: list[AdmissionAnalysis] = []
         logger.info(
             "admission_controller_enforcer.initialized",
@@ -124,8 +126,6 @@ class AdmissionControllerEnforcer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "admission_controller_enforcer.admission_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AdmissionControllerEnforcer:
         return record
 
     def get_admission(self, record_id: str) -> AdmissionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_admissions(
         self,
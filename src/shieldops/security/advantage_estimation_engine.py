@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class AdvantageEstimationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AdvantageRecord] = []
+        self._records: RecordStore[AdvantageRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AdvantageAnalysis] = {}
         logger.info(
             "advantage_estimation_engine.init",
@@ -121,8 +123,6 @@ class AdvantageEstimationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "advantage_estimation.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class AdvantageEstimationEngine:
         return record
 
     def process(self, key: str) -> AdvantageAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         group_recs = [r for r in self._records if r.group_id == rec.group_id]
@@ -212,7 +208,7 @@ class AdvantageEstimationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("advantage_estimation_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AdversarialRobustnessTester:
     ) -> None:
         self._max_records = max_records
         self._robustness_threshold = robustness_threshold
-        self._records: list[RobustnessRecord] = []
+        self._records: RecordStore[RobustnessRecord] = RecordStore(self._max_records)
         self._analyses: list[RobustnessAnalysis] = []
         logger.info(
             "adversarial_robustness_tester.initialized",
@@ -124,8 +126,6 @@ class AdversarialRobustnessTester:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adversarial_robustness_tester.test_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class AdversarialRobustnessTester:
         return record
 
     def get_test(self, record_id: str) -> RobustnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_tests(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class AdversaryEmulationEngine:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[EmulationRecord] = []
+        self._records: RecordStore[EmulationRecord] = RecordStore(self._max_records)
         self._analyses: list[EmulationAnalysis] = []
         logger.info(
             "adversary_emulation_engine.initialized",
@@ -128,8 +130,6 @@ class AdversaryEmulationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adversary_emulation_engine.record_added",
             record_id=record.id,
@@ -138,11 +138,7 @@ class AdversaryEmulationEngine:
         return record
 
     def process(self, key: str) -> EmulationAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = rec.detection_rate * 100.0
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AdversarySimulationEngine:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[SimulationRecord] = []
+        self._records: RecordStore[SimulationRecord] = RecordStore(self._max_records)
         self._analyses: list[SimulationAnalysis] = []
         logger.info(
             "adversary_simulation_engine.initialized",
@@ -122,8 +124,6 @@ class AdversarySimulationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "adversary_simulation_engine.simulation_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class AdversarySimulationEngine:
         return record
 
     def get_simulation(self, record_id: str) -> SimulationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_simulations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AlertEnrichmentEngine:
     ) -> None:
         self._max_records = max_records
         self._enrichment_quality_threshold = enrichment_quality_threshold
-        self._records: list[EnrichmentRecord] = []
+        self._records: RecordStore[EnrichmentRecord] = RecordStore(self._max_records)
         self._analyses: list[EnrichmentAnalysis] = []
         logger.info(
             "alert_enrichment_engine.initialized",
@@ -124,8 +126,6 @@ class AlertEnrichmentEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "alert_enrichment_engine.enrichment_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AlertEnrichmentEngine:
         return record
 
     def get_enrichment(self, record_id: str) -> EnrichmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_enrichments(
         self,
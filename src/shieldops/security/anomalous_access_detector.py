@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AnomalousAccessDetector:
     ) -> None:
         self._max_records = max_records
         self._anomaly_score_threshold = anomaly_score_threshold
-        self._records: list[AccessRecord] = []
+        self._records: RecordStore[AccessRecord] = RecordStore(self._max_records)
         self._analyses: list[AccessAnalysis] = []
         logger.info(
             "anomalous_access_detector.initialized",
@@ -124,8 +126,6 @@ class AnomalousAccessDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "anomalous_access_detector.access_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AnomalousAccessDetector:
         return record
 
     def get_access(self, record_id: str) -> AccessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_accesses(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class APIExposureAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[APIExposureRecord] = []
+        self._records: RecordStore[APIExposureRecord] = RecordStore(self._max_records)
         self._analyses: list[APIExposureAnalysis] = []
         logger.info(
             "api_exposure_analyzer.initialized",
@@ -124,8 +126,6 @@ class APIExposureAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_exposure_analyzer.exposure_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class APIExposureAnalyzer:
         return record
 
     def get_exposure(self, record_id: str) -> APIExposureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_exposures(
         self,
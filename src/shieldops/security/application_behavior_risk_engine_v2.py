@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ApplicationBehaviorRiskEngineV2:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[AppBehaviorRecord] = []
+        self._records: RecordStore[AppBehaviorRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, AppBehaviorAnalysis] = {}
         logger.info(
             "application_behavior_risk_engine_v2.init",
@@ -120,8 +122,6 @@ class ApplicationBehaviorRiskEngineV2:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "app_behavior_risk.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class ApplicationBehaviorRiskEngineV2:
         return record
 
     def process(self, key: str) -> AppBehaviorAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         rs_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -210,7 +206,7 @@ class ApplicationBehaviorRiskEngineV2:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("application_behavior_risk_engine_v2.cleared")
         return {"status": "cleared"}
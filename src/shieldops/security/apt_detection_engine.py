@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class APTDetectionEngine:
     ) -> None:
         self._max_records = max_records
         self._apt_threat_threshold = apt_threat_threshold
-        self._records: list[APTRecord] = []
+        self._records: RecordStore[APTRecord] = RecordStore(self._max_records)
         self._analyses: list[APTAnalysis] = []
         logger.info(
             "apt_detection_engine.initialized",
@@ -124,8 +126,6 @@ class APTDetectionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "apt_detection_engine.detection_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class APTDetectionEngine:
         return record
 
     def get_detection(self, record_id: str) -> APTRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_detections(
         self,
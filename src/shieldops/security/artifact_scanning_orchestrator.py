@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ArtifactScanningOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._scan_gap_threshold = scan_gap_threshold
-        self._records: list[ScanRecord] = []
+        self._records: RecordStore[ScanRecord] = RecordStore(self._max_records)
         self._analyses: list[ScanAnalysis] = []
         logger.info(
             "artifact_scanning_orchestrator.initialized",
@@ -124,8 +126,6 @@ class ArtifactScanningOrchestrator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "artifact_scanning_orchestrator.scan_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ArtifactScanningOrchestrator:
         return record
 
     def get_scan(self, record_id: str) -> ScanRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scans(
         self,
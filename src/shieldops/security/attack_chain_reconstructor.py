@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AttackChainReconstructor:
     ) -> None:
         self._max_records = max_records
         self._completeness_threshold = completeness_threshold
-        self._records: list[ChainRecord] = []
+        self._records: RecordStore[ChainRecord] = RecordStore(self._max_records)
         self._analyses: list[ChainAnalysis] = []
         logger.info(
             "attack_chain_reconstructor.initialized",
@@ -124,8 +126,6 @@ class AttackChainReconstructor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "attack_chain_reconstructor.chain_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AttackChainReconstructor:
         return record
 
     def get_chain(self, record_id: str) -> ChainRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_chains(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class AttackNarrativeEngine:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[NarrativeRecord] = []
+        self._records: RecordStore[NarrativeRecord] = RecordStore(self._max_records)
         self._analyses: list[NarrativeAnalysis] = []
         logger.info(
             "attack_narrative_engine.initialized",
@@ -125,8 +127,6 @@ class AttackNarrativeEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "attack_narrative_engine.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class AttackNarrativeEngine:
         return record
 
     def process(self, key: str) -> NarrativeAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         ev_weight = {
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AttackPathAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[AttackPathRecord] = []
+        self._records: RecordStore[AttackPathRecord] = RecordStore(self._max_records)
         self._analyses: list[AttackPathAnalysis] = []
         logger.info(
             "attack_path_analyzer.initialized",
@@ -124,8 +126,6 @@ class AttackPathAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "attack_path_analyzer.path_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AttackPathAnalyzer:
         return record
 
     def get_path(self, record_id: str) -> AttackPathRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_paths(
         self,
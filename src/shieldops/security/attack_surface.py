@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class AttackSurfaceMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_critical_exposures = max_critical_exposures
-        self._records: list[SurfaceRecord] = []
+        self._records: RecordStore[SurfaceRecord] = RecordStore(self._max_records)
         self._exposures: list[ExposureDetail] = []
         logger.info(
             "attack_surface.initialized",
@@ -116,8 +118,6 @@ class AttackSurfaceMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "attack_surface.surface_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class AttackSurfaceMonitor:
         return record
 
     def get_surface(self, record_id: str) -> SurfaceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_surfaces(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AttackerProfileBuilder:
     ) -> None:
         self._max_records = max_records
         self._profile_confidence_threshold = profile_confidence_threshold
-        self._records: list[ProfileRecord] = []
+        self._records: RecordStore[ProfileRecord] = RecordStore(self._max_records)
         self._analyses: list[ProfileAnalysis] = []
         logger.info(
             "attacker_profile_builder.initialized",
@@ -124,8 +126,6 @@ class AttackerProfileBuilder:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "attacker_profile_builder.profile_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AttackerProfileBuilder:
         return record
 
     def get_profile(self, record_id: str) -> ProfileRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_profiles(
         self,
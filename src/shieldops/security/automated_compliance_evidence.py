@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class AutomatedComplianceEvidence:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[EvidenceRecord] = []
+        self._records: RecordStore[EvidenceRecord] = RecordStore(self._max_records)
         self._analyses: list[EvidenceAnalysis] = []
         logger.info(
             "automated_compliance_evidence.initialized",
@@ -132,8 +134,6 @@ class AutomatedComplianceEvidence:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_compliance_evidence.record_added",
             record_id=record.id,
@@ -143,10 +143,7 @@ class AutomatedComplianceEvidence:
         return record
 
     def get_record(self, record_id: str) -> EvidenceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
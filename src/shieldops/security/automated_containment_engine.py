@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AutomatedContainmentEngine:
     ) -> None:
         self._max_records = max_records
         self._score_threshold = score_threshold
-        self._records: list[ContainmentRecord] = []
+        self._records: RecordStore[ContainmentRecord] = RecordStore(self._max_records)
         self._analyses: list[ContainmentAnalysis] = []
         logger.info(
             "automated_containment_engine.initialized",
@@ -124,8 +126,6 @@ class AutomatedContainmentEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_containment_engine.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AutomatedContainmentEngine:
         return record
 
     def get_record(self, record_id: str) -> ContainmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
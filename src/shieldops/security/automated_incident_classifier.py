@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AutomatedIncidentClassifier:
     ) -> None:
         self._max_records = max_records
         self._confidence_threshold = confidence_threshold
-        self._records: list[IncidentClassifierRecord] = []
+        self._records: RecordStore[IncidentClassifierRecord] = RecordStore(self._max_records)
         self._analyses: list[IncidentClassifierAnalysis] = []
         logger.info(
             "automated_incident_classifier.init",
@@ -124,8 +126,6 @@ class AutomatedIncidentClassifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_incident_classifier.added",
             record_id=record.id,
@@ -134,11 +134,7 @@ class AutomatedIncidentClassifier:
         return record
 
     def process(self, key: str) -> IncidentClassifierAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = rec.confidence_score * 100.0
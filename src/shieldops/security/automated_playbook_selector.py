@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AutomatedPlaybookSelector:
     ) -> None:
         self._max_records = max_records
         self._selection_threshold = selection_threshold
-        self._records: list[PlaybookSelectionRecord] = []
+        self._records: RecordStore[PlaybookSelectionRecord] = RecordStore(self._max_records)
         self._analyses: list[PlaybookSelectionAnalysis] = []
         logger.info(
             "automated_playbook_selector.initialized",
@@ -124,8 +126,6 @@ class AutomatedPlaybookSelector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "automated_playbook_selector.selection_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class AutomatedPlaybookSelector:
         return record
 
     def get_selection(self, record_id: str) -> PlaybookSelectionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_selections(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,9 @@ class AutonomousForensicsCollector:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[AutonomousForensicsCollectorRecord] = []
+        self._records: RecordStore[AutonomousForensicsCollectorRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: list[AutonomousForensicsCollectorAnalysis] = []
         logger.info(
             "autonomous.forensics.collector.initialized",
@@ -124,8 +128,6 @@ class AutonomousForensicsCollector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "autonomous.forensics.collector.item_recorded",
             record_id=record.id,
@@ -136,10 +138,7 @@ class AutonomousForensicsCollector:
         return record
 
     def get_record(self, record_id: str) -> AutonomousForensicsCollectorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
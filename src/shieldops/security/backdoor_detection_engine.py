@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BackdoorDetectionEngine:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[BackdoorRecord] = []
+        self._records: RecordStore[BackdoorRecord] = RecordStore(self._max_records)
         self._analyses: list[BackdoorAnalysis] = []
         logger.info(
             "backdoor_detection_engine.initialized",
@@ -124,8 +126,6 @@ class BackdoorDetectionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "backdoor_detection_engine.backdoor_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BackdoorDetectionEngine:
         return record
 
     def get_backdoor(self, record_id: str) -> BackdoorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_backdoors(
         self,
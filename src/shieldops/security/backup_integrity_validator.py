@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BackupIntegrityValidator:
     ) -> None:
         self._max_records = max_records
         self._integrity_threshold = integrity_threshold
-        self._records: list[BackupIntegrityRecord] = []
+        self._records: RecordStore[BackupIntegrityRecord] = RecordStore(self._max_records)
         self._analyses: list[BackupIntegrityAnalysis] = []
         logger.info(
             "backup_integrity_validator.initialized",
@@ -124,8 +126,6 @@ class BackupIntegrityValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "backup_integrity_validator.backup_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BackupIntegrityValidator:
         return record
 
     def get_backup(self, record_id: str) -> BackupIntegrityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_backups(
         self,
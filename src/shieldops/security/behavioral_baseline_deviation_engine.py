@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class BehavioralBaselineDeviationEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[BaselineDeviationRecord] = []
+        self._records: RecordStore[BaselineDeviationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, BaselineDeviationAnalysis] = {}
         logger.info(
             "behavioral_baseline_deviation_engine.init",
@@ -117,8 +119,6 @@ class BehavioralBaselineDeviationEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "behavioral_baseline_deviation.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class BehavioralBaselineDeviationEngine:
         return record
 
     def process(self, key: str) -> BaselineDeviationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sev_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -204,7 +200,7 @@ class BehavioralBaselineDeviationEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("behavioral_baseline_deviation_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class BulkExportDetector:
     ) -> None:
         self._max_records = max_records
         self._export_threshold = export_threshold
-        self._records: list[BulkExportRecord] = []
+        self._records: RecordStore[BulkExportRecord] = RecordStore(self._max_records)
         self._analyses: list[BulkExportAnalysis] = []
         logger.info(
             "bulk_export_detector.initialized",
@@ -124,8 +126,6 @@ class BulkExportDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "bulk_export_detector.export_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class BulkExportDetector:
         return record
 
     def get_export(self, record_id: str) -> BulkExportRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_exports(
         self,
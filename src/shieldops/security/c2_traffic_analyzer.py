@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class C2TrafficAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[C2TrafficRecord] = []
+        self._records: RecordStore[C2TrafficRecord] = RecordStore(self._max_records)
         self._analyses: list[C2TrafficAnalysis] = []
         logger.info(
             "c2_traffic_analyzer.initialized",
@@ -124,8 +126,6 @@ class C2TrafficAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "c2_traffic_analyzer.traffic_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class C2TrafficAnalyzer:
         return record
 
     def get_traffic(self, record_id: str) -> C2TrafficRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_traffics(
         self,
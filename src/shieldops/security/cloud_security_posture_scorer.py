@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CloudSecurityPostureScorer:
     ) -> None:
         self._max_records = max_records
         self._posture_threshold = posture_threshold
-        self._records: list[PostureRecord] = []
+        self._records: RecordStore[PostureRecord] = RecordStore(self._max_records)
         self._analyses: list[PostureAnalysis] = []
         logger.info(
             "cloud_security_posture_scorer.initialized",
@@ -124,8 +126,6 @@ class CloudSecurityPostureScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cloud_security_posture_scorer.finding_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CloudSecurityPostureScorer:
         return record
 
     def get_finding(self, record_id: str) -> PostureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_findings(
         self,
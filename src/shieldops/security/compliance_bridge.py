@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class SecurityComplianceBridge:
     ) -> None:
         self._max_records = max_records
         self._min_alignment_pct = min_alignment_pct
-        self._records: list[BridgeRecord] = []
+        self._records: RecordStore[BridgeRecord] = RecordStore(self._max_records)
         self._mappings: list[FrameworkMapping] = []
         logger.info(
             "compliance_bridge.initialized",
@@ -119,8 +121,6 @@ class SecurityComplianceBridge:
             gap_description=gap_description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_bridge.bridge_recorded",
             record_id=record.id,
@@ -131,10 +131,7 @@ class SecurityComplianceBridge:
         return record
 
     def get_bridge(self, record_id: str) -> BridgeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_bridges(
         self,
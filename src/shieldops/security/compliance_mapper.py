@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class SecurityComplianceMapper:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_score = min_compliance_score
-        self._records: list[ComplianceMapRecord] = []
+        self._records: RecordStore[ComplianceMapRecord] = RecordStore(self._max_records)
         self._evidence: list[ControlEvidence] = []
         logger.info(
             "compliance_mapper.initialized",
@@ -124,8 +126,6 @@ class SecurityComplianceMapper:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_mapper.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityComplianceMapper:
         return record
 
     def get_mapping(self, record_id: str) -> ComplianceMapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ComplianceViolationPredictor:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[ViolationPredictorRecord] = []
+        self._records: RecordStore[ViolationPredictorRecord] = RecordStore(self._max_records)
         self._analyses: list[ViolationPredictorAnalysis] = []
         logger.info(
             "compliance_violation_predictor.init",
@@ -125,8 +127,6 @@ class ComplianceViolationPredictor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "compliance_violation_predictor.added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class ComplianceViolationPredictor:
         return record
 
     def process(self, key: str) -> ViolationPredictorAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         likelihood_w = {
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ConditionalAccessEngine:
     ) -> None:
         self._max_records = max_records
         self._policy_gap_threshold = policy_gap_threshold
-        self._records: list[AccessPolicyRecord] = []
+        self._records: RecordStore[AccessPolicyRecord] = RecordStore(self._max_records)
         self._analyses: list[AccessPolicyAnalysis] = []
         logger.info(
             "conditional_access_engine.initialized",
@@ -124,8 +126,6 @@ class ConditionalAccessEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "conditional_access_engine.policy_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ConditionalAccessEngine:
         return record
 
     def get_policy(self, record_id: str) -> AccessPolicyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_policies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ConfigurationBaselineEnforcer:
     ) -> None:
         self._max_records = max_records
         self._compliance_gap_threshold = compliance_gap_threshold
-        self._records: list[BaselineRecord] = []
+        self._records: RecordStore[BaselineRecord] = RecordStore(self._max_records)
         self._analyses: list[BaselineAnalysis] = []
         logger.info(
             "configuration_baseline_enforcer.initialized",
@@ -124,8 +126,6 @@ class ConfigurationBaselineEnforcer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "configuration_baseline_enforcer.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ConfigurationBaselineEnforcer:
         return record
 
     def get_baseline(self, record_id: str) -> BaselineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_baselines(
         self,
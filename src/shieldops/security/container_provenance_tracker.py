@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ContainerProvenanceTracker:
     ) -> None:
         self._max_records = max_records
         self._provenance_gap_threshold = provenance_gap_threshold
-        self._records: list[ProvenanceRecord] = []
+        self._records: RecordStore[ProvenanceRecord] = RecordStore(self._max_records)
         self._analyses: list[ProvenanceAnalysis] = []
         logger.info(
             "container_provenance_tracker.initialized",
@@ -124,8 +126,6 @@ class ContainerProvenanceTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "container_provenance_tracker.provenance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ContainerProvenanceTracker:
         return record
 
     def get_provenance(self, record_id: str) -> ProvenanceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_provenance_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ContainerRuntimeSecurity:
     ) -> None:
         self._max_records = max_records
         self._runtime_security_threshold = runtime_security_threshold
-        self._records: list[RuntimeRecord] = []
+        self._records: RecordStore[RuntimeRecord] = RecordStore(self._max_records)
         self._analyses: list[RuntimeAnalysis] = []
         logger.info(
             "container_runtime_security.initialized",
@@ -124,8 +126,6 @@ class ContainerRuntimeSecurity:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "container_runtime_security.event_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ContainerRuntimeSecurity:
         return record
 
     def get_event(self, record_id: str) -> RuntimeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_events(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ContinuousIdentityVerifier:
     ) -> None:
         self._max_records = max_records
         self._verification_gap_threshold = verification_gap_threshold
-        self._records: list[VerificationRecord] = []
+        self._records: RecordStore[VerificationRecord] = RecordStore(self._max_records)
         self._analyses: list[VerificationAnalysis] = []
         logger.info(
             "continuous_identity_verifier.initialized",
@@ -124,8 +126,6 @@ class ContinuousIdentityVerifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "continuous_identity_verifier.verification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ContinuousIdentityVerifier:
         return record
 
     def get_verification(self, record_id: str) -> VerificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_verifications(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CredentialAbuseRiskScorerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CredentialAbuseRecord] = []
+        self._records: RecordStore[CredentialAbuseRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CredentialAbuseAnalysis] = {}
         logger.info(
             "credential_abuse_risk_scorer_engine.init",
@@ -120,8 +122,6 @@ class CredentialAbuseRiskScorerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "credential_abuse_risk.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class CredentialAbuseRiskScorerEngine:
         return record
 
     def process(self, key: str) -> CredentialAbuseAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         conf_weights = {"confirmed": 4, "probable": 3, "possible": 2, "unlikely": 1}
@@ -204,7 +200,7 @@ class CredentialAbuseRiskScorerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("credential_abuse_risk_scorer_engine.cleared")
         return {"status": "cleared"}
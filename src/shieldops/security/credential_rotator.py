@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CredentialRotationOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._min_completion_rate_pct = min_completion_rate_pct
-        self._records: list[RotationRecord] = []
+        self._records: RecordStore[RotationRecord] = RecordStore(self._max_records)
         self._policies: list[RotationPolicy] = []
         logger.info(
             "credential_rotator.initialized",
@@ -116,8 +118,6 @@ class CredentialRotationOrchestrator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "credential_rotator.rotation_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class CredentialRotationOrchestrator:
         return record
 
     def get_rotation(self, record_id: str) -> RotationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rotations(
         self,
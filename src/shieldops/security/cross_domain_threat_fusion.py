@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class CrossDomainThreatFusion:
     ) -> None:
         self._max_records = max_records
         self._reliability_threshold = reliability_threshold
-        self._records: list[ThreatFusionRecord] = []
+        self._records: RecordStore[ThreatFusionRecord] = RecordStore(self._max_records)
         self._analyses: list[ThreatFusionAnalysis] = []
         logger.info(
             "cross_domain_threat_fusion.init",
@@ -125,8 +127,6 @@ class CrossDomainThreatFusion:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_domain_threat_fusion.added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class CrossDomainThreatFusion:
         return record
 
     def process(self, key: str) -> ThreatFusionAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = rec.reliability_score * 100.0
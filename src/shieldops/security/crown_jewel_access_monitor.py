@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class CrownJewelAccessMonitor:
     ) -> None:
         self._max_records = max_records
         self._access_threshold = access_threshold
-        self._records: list[JewelAccessRecord] = []
+        self._records: RecordStore[JewelAccessRecord] = RecordStore(self._max_records)
         self._analyses: list[JewelAccessAnalysis] = []
         logger.info(
             "crown_jewel_access_monitor.initialized",
@@ -124,8 +126,6 @@ class CrownJewelAccessMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "crown_jewel_access_monitor.access_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class CrownJewelAccessMonitor:
         return record
 
     def get_access(self, record_id: str) -> JewelAccessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_accesses(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class CurriculumDifficultyCalibratorEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CalibrationRecord] = []
+        self._records: RecordStore[CalibrationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CalibrationAnalysis] = {}
         logger.info(
             "curriculum_difficulty_calibrator_engine.init",
@@ -122,8 +124,6 @@ class CurriculumDifficultyCalibratorEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "curriculum_difficulty_calibrator.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class CurriculumDifficultyCalibratorEngine:
         return record
 
     def process(self, key: str) -> CalibrationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         if rec.success_rate > 0.8:
@@ -210,7 +206,7 @@ class CurriculumDifficultyCalibratorEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("curriculum_difficulty_calibrator_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataBreachSimulator:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[BreachRecord] = []
+        self._records: RecordStore[BreachRecord] = RecordStore(self._max_records)
         self._analyses: list[BreachAnalysis] = []
         logger.info(
             "data_breach_simulator.initialized",
@@ -124,8 +126,6 @@ class DataBreachSimulator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_breach_simulator.simulation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataBreachSimulator:
         return record
 
     def get_simulation(self, record_id: str) -> BreachRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_simulations(
         self,
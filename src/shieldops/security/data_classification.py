@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataClassificationEngine:
     ) -> None:
         self._max_records = max_records
         self._min_classification_coverage_pct = min_classification_coverage_pct
-        self._records: list[ClassificationRecord] = []
+        self._records: RecordStore[ClassificationRecord] = RecordStore(self._max_records)
         self._rules: list[ClassificationRule] = []
         logger.info(
             "data_classification.initialized",
@@ -124,8 +126,6 @@ class DataClassificationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_classification.classification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataClassificationEngine:
         return record
 
     def get_classification(self, record_id: str) -> ClassificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_classifications(
         self,
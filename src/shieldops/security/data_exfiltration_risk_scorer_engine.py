@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DataExfiltrationRiskScorerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ExfiltrationRecord] = []
+        self._records: RecordStore[ExfiltrationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ExfiltrationAnalysis] = {}
         logger.info(
             "data_exfiltration_risk_scorer_engine.init",
@@ -117,8 +119,6 @@ class DataExfiltrationRiskScorerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_exfiltration_risk.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class DataExfiltrationRiskScorerEngine:
         return record
 
     def process(self, key: str) -> ExfiltrationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sens_weights = {"restricted": 4, "confidential": 3, "internal": 2, "public": 1}
@@ -208,7 +204,7 @@ class DataExfiltrationRiskScorerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("data_exfiltration_risk_scorer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DataFlowMapper:
     ) -> None:
         self._max_records = max_records
         self._flow_threshold = flow_threshold
-        self._records: list[DataFlowRecord] = []
+        self._records: RecordStore[DataFlowRecord] = RecordStore(self._max_records)
         self._analyses: list[DataFlowAnalysis] = []
         logger.info(
             "data_flow_mapper.initialized",
@@ -124,8 +126,6 @@ class DataFlowMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "data_flow_mapper.flow_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DataFlowMapper:
         return record
 
     def get_flow(self, record_id: str) -> DataFlowRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_flows(
         self,
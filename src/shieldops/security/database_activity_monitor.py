@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DatabaseActivityMonitor:
     ) -> None:
         self._max_records = max_records
         self._activity_threshold = activity_threshold
-        self._records: list[DatabaseActivityRecord] = []
+        self._records: RecordStore[DatabaseActivityRecord] = RecordStore(self._max_records)
         self._analyses: list[DatabaseActivityAnalysis] = []
         logger.info(
             "database_activity_monitor.initialized",
@@ -124,8 +126,6 @@ class DatabaseActivityMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "database_activity_monitor.activity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DatabaseActivityMonitor:
         return record
 
     def get_activity(self, record_id: str) -> DatabaseActivityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_activities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DependencyFreshnessEnforcer:
     ) -> None:
         self._max_records = max_records
         self._freshness_gap_threshold = freshness_gap_threshold
-        self._records: list[FreshnessRecord] = []
+        self._records: RecordStore[FreshnessRecord] = RecordStore(self._max_records)
         self._analyses: list[FreshnessAnalysis] = []
         logger.info(
             "dependency_freshness_enforcer.initialized",
@@ -124,8 +126,6 @@ class DependencyFreshnessEnforcer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_freshness_enforcer.freshness_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DependencyFreshnessEnforcer:
         return record
 
     def get_freshness(self, record_id: str) -> FreshnessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_freshness_records(
         self,
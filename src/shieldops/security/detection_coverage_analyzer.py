@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DetectionCoverageAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CoverageRecord] = []
+        self._records: RecordStore[CoverageRecord] = RecordStore(self._max_records)
         self._analyses: list[CoverageAnalysis] = []
         logger.info(
             "detection_coverage_analyzer.initialized",
@@ -124,8 +126,6 @@ class DetectionCoverageAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_coverage_analyzer.coverage_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DetectionCoverageAnalyzer:
         return record
 
     def get_record(self, record_id: str) -> CoverageRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DetectionEngineeringPipeline:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[PipelineRecord] = []
+        self._records: RecordStore[PipelineRecord] = RecordStore(self._max_records)
         self._analyses: list[PipelineAnalysis] = []
         logger.info(
             "detection_engineering_pipeline.initialized",
@@ -124,8 +126,6 @@ class DetectionEngineeringPipeline:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_engineering_pipeline.recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class DetectionEngineeringPipeline:
         return record
 
     def get_pipeline(self, record_id: str) -> PipelineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_pipelines(
         self,
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -99,7 +101,7 @@ class DetectionEngineeringPipelineV2:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[RuleRecord] = []
+        self._records: RecordStore[RuleRecord] = RecordStore(self._max_records)
         self._analyses: list[RuleAnalysis] = []
         logger.info(
             "detection_engineering_pipeline_v2.initialized",
@@ -133,8 +135,6 @@ class DetectionEngineeringPipelineV2:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_engineering_pipeline_v2.record_added",
             record_id=record.id,
@@ -144,10 +144,7 @@ class DetectionEngineeringPipelineV2:
         return record
 
     def get_record(self, record_id: str) -> RuleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
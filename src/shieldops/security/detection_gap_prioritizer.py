@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DetectionGapPrioritizer:
     ) -> None:
         self._max_records = max_records
         self._gap_threshold = gap_threshold
-        self._records: list[DetectionGapRecord] = []
+        self._records: RecordStore[DetectionGapRecord] = RecordStore(self._max_records)
         self._analyses: list[DetectionGapAnalysis] = []
         logger.info(
             "detection_gap_prioritizer.initialized",
@@ -124,8 +126,6 @@ class DetectionGapPrioritizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_gap_prioritizer.gap_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DetectionGapPrioritizer:
         return record
 
     def get_gap(self, record_id: str) -> DetectionGapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gaps(
         self,
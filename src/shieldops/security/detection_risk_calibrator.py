@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class DetectionRiskCalibrator:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DetectionCalibrationRecord] = []
+        self._records: RecordStore[DetectionCalibrationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DetectionCalibrationAnalysis] = {}
         logger.info(
             "detection_risk_calibrator.init",
@@ -123,8 +125,6 @@ class DetectionRiskCalibrator:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_risk_calibrator.record_added",
             record_id=record.id,
@@ -133,11 +133,7 @@ class DetectionRiskCalibrator:
         return record
 
     def process(self, key: str) -> DetectionCalibrationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         delta = round(
@@ -217,7 +213,7 @@ class DetectionRiskCalibrator:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("detection_risk_calibrator.cleared")
         return {"status": "cleared"}
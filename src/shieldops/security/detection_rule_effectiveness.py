@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DetectionRuleEffectiveness:
     ) -> None:
         self._max_records = max_records
         self._rule_effectiveness_threshold = rule_effectiveness_threshold
-        self._records: list[RuleRecord] = []
+        self._records: RecordStore[RuleRecord] = RecordStore(self._max_records)
         self._analyses: list[RuleAnalysis] = []
         logger.info(
             "detection_rule_effectiveness.initialized",
@@ -124,8 +126,6 @@ class DetectionRuleEffectiveness:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "detection_rule_effectiveness.rule_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DetectionRuleEffectiveness:
         return record
 
     def get_rule(self, record_id: str) -> RuleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rules(
         self,
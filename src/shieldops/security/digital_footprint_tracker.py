@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DigitalFootprintTracker:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[FootprintRecord] = []
+        self._records: RecordStore[FootprintRecord] = RecordStore(self._max_records)
         self._analyses: list[FootprintAnalysis] = []
         logger.info(
             "digital_footprint_tracker.initialized",
@@ -124,8 +126,6 @@ class DigitalFootprintTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "digital_footprint_tracker.footprint_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DigitalFootprintTracker:
         return record
 
     def get_footprint(self, record_id: str) -> FootprintRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_footprints(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DLPScorer:
     ) -> None:
         self._max_records = max_records
         self._protection_threshold = protection_threshold
-        self._records: list[DLPRecord] = []
+        self._records: RecordStore[DLPRecord] = RecordStore(self._max_records)
         self._analyses: list[DLPAnalysis] = []
         logger.info(
             "dlp_scorer.initialized",
@@ -124,8 +126,6 @@ class DLPScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dlp_scorer.policy_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DLPScorer:
         return record
 
     def get_policy(self, record_id: str) -> DLPRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_policies(
         self,
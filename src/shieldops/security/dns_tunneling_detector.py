@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DNSTunnelingDetector:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[TunnelingRecord] = []
+        self._records: RecordStore[TunnelingRecord] = RecordStore(self._max_records)
         self._analyses: list[TunnelingAnalysis] = []
         logger.info(
             "dns_tunneling_detector.initialized",
@@ -124,8 +126,6 @@ class DNSTunnelingDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dns_tunneling_detector.tunneling_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DNSTunnelingDetector:
         return record
 
     def get_tunneling(self, record_id: str) -> TunnelingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_tunnelings(
         self,
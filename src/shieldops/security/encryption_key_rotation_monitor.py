@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class EncryptionKeyRotationMonitor:
     ) -> None:
         self._max_records = max_records
         self._rotation_threshold = rotation_threshold
-        self._records: list[KeyRotationRecord] = []
+        self._records: RecordStore[KeyRotationRecord] = RecordStore(self._max_records)
         self._analyses: list[KeyRotationAnalysis] = []
         logger.info(
             "encryption_key_rotation_monitor.initialized",
@@ -124,8 +126,6 @@ class EncryptionKeyRotationMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "encryption_key_rotation_monitor.rotation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class EncryptionKeyRotationMonitor:
         return record
 
     def get_rotation(self, record_id: str) -> KeyRotationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rotations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class SecurityEventCorrelator:
     ) -> None:
         self._max_records = max_records
         self._min_threat_confidence_pct = min_threat_confidence_pct
-        self._records: list[EventRecord] = []
+        self._records: RecordStore[EventRecord] = RecordStore(self._max_records)
         self._chains: list[EventChain] = []
         logger.info(
             "event_correlator.initialized",
@@ -123,8 +125,6 @@ class SecurityEventCorrelator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "event_correlator.event_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class SecurityEventCorrelator:
         return record
 
     def get_event(self, record_id: str) -> EventRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_events(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ExploitPredictionEngine:
     ) -> None:
         self._max_records = max_records
         self._prediction_threshold = prediction_threshold
-        self._records: list[ExploitPrediction] = []
+        self._records: RecordStore[ExploitPrediction] = RecordStore(self._max_records)
         self._analyses: list[ExploitAnalysis] = []
         logger.info(
             "exploit_prediction_engine.initialized",
@@ -124,8 +126,6 @@ class ExploitPredictionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "exploit_prediction_engine.prediction_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ExploitPredictionEngine:
         return record
 
     def get_prediction(self, record_id: str) -> ExploitPrediction | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_predictions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ExposureSeverityScorer:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold = risk_threshold
-        self._records: list[ExposureSeverityRecord] = []
+        self._records: RecordStore[ExposureSeverityRecord] = RecordStore(self._max_records)
         self._analyses: list[ExposureSeverityAnalysis] = []
         logger.info(
             "exposure_severity_scorer.initialized",
@@ -124,8 +126,6 @@ class ExposureSeverityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "exposure_severity_scorer.exposure_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ExposureSeverityScorer:
         return record
 
     def get_exposure(self, record_id: str) -> ExposureSeverityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_exposures(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class FilelessMalwareDetector:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[FilelessRecord] = []
+        self._records: RecordStore[FilelessRecord] = RecordStore(self._max_records)
         self._analyses: list[FilelessAnalysis] = []
         logger.info(
             "fileless_malware_detector.initialized",
@@ -124,8 +126,6 @@ class FilelessMalwareDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "fileless_malware_detector.fileless_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class FilelessMalwareDetector:
         return record
 
     def get_fileless(self, record_id: str) -> FilelessRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_fileless_records(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class FormatComplianceRewardEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[FormatComplianceRecord] = []
+        self._records: RecordStore[FormatComplianceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, FormatComplianceAnalysis] = {}
         logger.info(
             "format_compliance_reward_engine.init",
@@ -118,8 +120,6 @@ class FormatComplianceRewardEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "format_compliance_reward.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class FormatComplianceRewardEngine:
         return record
 
     def process(self, key: str) -> FormatComplianceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         penalty_map = {
@@ -206,7 +202,7 @@ class FormatComplianceRewardEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("format_compliance_reward_engine.cleared")
         return {"status": "cleared"}
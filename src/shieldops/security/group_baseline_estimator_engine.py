@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class GroupBaselineEstimatorEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[BaselineRecord] = []
+        self._records: RecordStore[BaselineRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, BaselineAnalysis] = {}
         logger.info(
             "group_baseline_estimator_engine.init",
@@ -122,8 +124,6 @@ class GroupBaselineEstimatorEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "group_baseline_estimator.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class GroupBaselineEstimatorEngine:
         return record
 
     def process(self, key: str) -> BaselineAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         group_recs = [r for r in self._records if r.group_id == rec.group_id]
@@ -214,7 +210,7 @@ class GroupBaselineEstimatorEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("group_baseline_estimator_engine.cleared")
         return {"status": "cleared"}
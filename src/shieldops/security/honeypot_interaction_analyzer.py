@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class HoneypotInteractionAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._threat_score_threshold = threat_score_threshold
-        self._records: list[InteractionRecord] = []
+        self._records: RecordStore[InteractionRecord] = RecordStore(self._max_records)
         self._analyses: list[InteractionAnalysis] = []
         logger.info(
             "honeypot_interaction_analyzer.initialized",
@@ -124,8 +126,6 @@ class HoneypotInteractionAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "honeypot_interaction_analyzer.interaction_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class HoneypotInteractionAnalyzer:
         return record
 
     def get_interaction(self, record_id: str) -> InteractionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_interactions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class HuntEffectivenessTracker:
     ) -> None:
         self._max_records = max_records
         self._hunt_effectiveness_threshold = hunt_effectiveness_threshold
-        self._records: list[HuntRecord] = []
+        self._records: RecordStore[HuntRecord] = RecordStore(self._max_records)
         self._analyses: list[HuntAnalysis] = []
         logger.info(
             "hunt_effectiveness_tracker.initialized",
@@ -124,8 +126,6 @@ class HuntEffectivenessTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "hunt_effectiveness_tracker.hunt_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class HuntEffectivenessTracker:
         return record
 
     def get_hunt(self, record_id: str) -> HuntRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_hunts(
         self,
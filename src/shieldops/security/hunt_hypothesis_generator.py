@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class HuntHypothesisGenerator:
     ) -> None:
         self._max_records = max_records
         self._hypothesis_quality_threshold = hypothesis_quality_threshold
-        self._records: list[HypothesisRecord] = []
+        self._records: RecordStore[HypothesisRecord] = RecordStore(self._max_records)
         self._analyses: list[HypothesisAnalysis] = []
         logger.info(
             "hunt_hypothesis_generator.initialized",
@@ -124,8 +126,6 @@ class HuntHypothesisGenerator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "hunt_hypothesis_generator.hypothesis_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class HuntHypothesisGenerator:
         return record
 
     def get_hypothesis(self, record_id: str) -> HypothesisRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_hypotheses(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class IacSecurityScanningIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SecurityScanRecord] = []
+        self._records: RecordStore[SecurityScanRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SecurityScanAnalysis] = {}
         logger.info(
             "iac_security_scanning_intelligence.init",
@@ -117,8 +119,6 @@ class IacSecurityScanningIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_scan.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class IacSecurityScanningIntelligence:
         return record
 
     def process(self, key: str) -> SecurityScanAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         findings = [r for r in self._records if r.module_id == rec.module_id]
@@ -202,7 +198,7 @@ class IacSecurityScanningIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("iac_security_scanning.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IdentityFederationMonitor:
     ) -> None:
         self._max_records = max_records
         self._federation_gap_threshold = federation_gap_threshold
-        self._records: list[FederationRecord] = []
+        self._records: RecordStore[FederationRecord] = RecordStore(self._max_records)
         self._analyses: list[FederationAnalysis] = []
         logger.info(
             "identity_federation_monitor.initialized",
@@ -124,8 +126,6 @@ class IdentityFederationMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "identity_federation_monitor.federation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IdentityFederationMonitor:
         return record
 
     def get_federation(self, record_id: str) -> FederationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_federations(
         self,
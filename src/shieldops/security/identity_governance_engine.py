@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class IdentityGovernanceEngine:
     ) -> None:
         self._max_records = max_records
         self._dormant_threshold = dormant_threshold_days
-        self._records: list[AccessRecord] = []
+        self._records: RecordStore[AccessRecord] = RecordStore(self._max_records)
         self._metrics: list[GovernanceMetric] = []
         logger.info(
             "identity_governance_engine.initialized",
@@ -131,8 +133,6 @@ class IdentityGovernanceEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "identity_governance_engine.access_reviewed",
             record_id=record.id,
@@ -184,19 +184,19 @@ class IdentityGovernanceEngine:
 
     def certify_access(self, record_id: str, approve: bool = True) -> dict[str, Any]:
         """Certify or revoke a specific access record."""
-        for r in self._records:
-            if r.id == record_id:
-                if approve:
-                    r.decision = ReviewDecision.APPROVED
-                    r.privilege_status = PrivilegeStatus.COMPLIANT
-                else:
-                    r.decision = ReviewDecision.REVOKED
-                    r.privilege_status = PrivilegeStatus.REVOKED
-                return {
-                    "record_id": record_id,
-                    "decision": r.decision.value,
-                    "status": r.privilege_status.value,
-                }
+        r = self._records.get(record_id)
+        if r is not None:
+            if approve:
+                r.decision = ReviewDecision.APPROVED
+                r.privilege_status = PrivilegeStatus.COMPLIANT
+            else:
+                r.decision = ReviewDecision.REVOKED
+                r.privilege_status = PrivilegeStatus.REVOKED
+            return {
+                "record_id": record_id,
+                "decision": r.decision.value,
+                "status": r.privilege_status.value,
+            }
         return {"record_id": record_id, "error": "not_found"}
 
     def get_governance_metrics(self) -> dict[str, Any]:
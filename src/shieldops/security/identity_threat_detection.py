@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IdentityThreatDetection:
     ) -> None:
         self._max_records = max_records
         self._identity_threat_threshold = identity_threat_threshold
-        self._records: list[IdentityRecord] = []
+        self._records: RecordStore[IdentityRecord] = RecordStore(self._max_records)
         self._analyses: list[IdentityAnalysis] = []
         logger.info(
             "identity_threat_detection.initialized",
@@ -124,8 +126,6 @@ class IdentityThreatDetection:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "identity_threat_detection.threat_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IdentityThreatDetection:
         return record
 
     def get_threat(self, record_id: str) -> IdentityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_threats(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ImmutableBackupValidator:
     ) -> None:
         self._max_records = max_records
         self._validation_threshold = validation_threshold
-        self._records: list[ImmutabilityRecord] = []
+        self._records: RecordStore[ImmutabilityRecord] = RecordStore(self._max_records)
         self._analyses: list[ImmutabilityAnalysis] = []
         logger.info(
             "immutable_backup_validator.initialized",
@@ -124,8 +126,6 @@ class ImmutableBackupValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "immutable_backup_validator.immutability_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ImmutableBackupValidator:
         return record
 
     def get_immutability(self, record_id: str) -> ImmutabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_immutabilities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IncidentCorrelationEngine:
     ) -> None:
         self._max_records = max_records
         self._correlation_threshold = correlation_threshold
-        self._records: list[CorrelationRecord] = []
+        self._records: RecordStore[CorrelationRecord] = RecordStore(self._max_records)
         self._analyses: list[CorrelationAnalysis] = []
         logger.info(
             "incident_correlation_engine.initialized",
@@ -124,8 +126,6 @@ class IncidentCorrelationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "incident_correlation_engine.correlation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IncidentCorrelationEngine:
         return record
 
     def get_correlation(self, record_id: str) -> CorrelationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_correlations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class InsiderThreatDetector:
     ) -> None:
         self._max_records = max_records
         self._min_threat_confidence_pct = min_threat_confidence_pct
-        self._records: list[ThreatRecord] = []
+        self._records: RecordStore[ThreatRecord] = RecordStore(self._max_records)
         self._signals: list[ThreatSignal] = []
         logger.info(
             "insider_threat.initialized",
@@ -124,8 +126,6 @@ class InsiderThreatDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "insider_threat.threat_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class InsiderThreatDetector:
         return record
 
     def get_threat(self, record_id: str) -> ThreatRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_threats(
         self,
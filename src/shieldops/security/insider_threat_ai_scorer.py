@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class InsiderThreatAIScorer:
     ) -> None:
         self._max_records = max_records
         self._insider_threat_threshold = insider_threat_threshold
-        self._records: list[InsiderThreatRecord] = []
+        self._records: RecordStore[InsiderThreatRecord] = RecordStore(self._max_records)
         self._analyses: list[InsiderThreatAnalysis] = []
         logger.info(
             "insider_threat_ai_scorer.initialized",
@@ -124,8 +126,6 @@ class InsiderThreatAIScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "insider_threat_ai_scorer.threat_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class InsiderThreatAIScorer:
         return record
 
     def get_threat(self, record_id: str) -> InsiderThreatRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_threats(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class InsiderThreatRiskQuantifierEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[InsiderThreatRecord] = []
+        self._records: RecordStore[InsiderThreatRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, InsiderThreatAnalysis] = {}
         logger.info(
             "insider_threat_risk_quantifier_engine.init",
@@ -117,8 +119,6 @@ class InsiderThreatRiskQuantifierEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "insider_threat_risk.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class InsiderThreatRiskQuantifierEngine:
         return record
 
     def process(self, key: str) -> InsiderThreatAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         composite = round(rec.risk_score * rec.indicator_weight, 2)
@@ -196,7 +192,7 @@ class InsiderThreatRiskQuantifierEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("insider_threat_risk_quantifier_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class IOCSweepEngine:
     ) -> None:
         self._max_records = max_records
         self._match_score_threshold = match_score_threshold
-        self._records: list[SweepRecord] = []
+        self._records: RecordStore[SweepRecord] = RecordStore(self._max_records)
         self._analyses: list[SweepAnalysis] = []
         logger.info(
             "ioc_sweep_engine.initialized",
@@ -124,8 +126,6 @@ class IOCSweepEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ioc_sweep_engine.sweep_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class IOCSweepEngine:
         return record
 
     def get_sweep(self, record_id: str) -> SweepRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_sweeps(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class JITAccessProvisioner:
     ) -> None:
         self._max_records = max_records
         self._provisioning_gap_threshold = provisioning_gap_threshold
-        self._records: list[ProvisioningRecord] = []
+        self._records: RecordStore[ProvisioningRecord] = RecordStore(self._max_records)
         self._analyses: list[ProvisioningAnalysis] = []
         logger.info(
             "jit_access_provisioner.initialized",
@@ -124,8 +126,6 @@ class JITAccessProvisioner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "jit_access_provisioner.provisioning_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class JITAccessProvisioner:
         return record
 
     def get_provisioning(self, record_id: str) -> ProvisioningRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_provisionings(
         self,
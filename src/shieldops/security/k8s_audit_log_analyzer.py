@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class K8sAuditLogAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._risk_gap_threshold = risk_gap_threshold
-        self._records: list[AuditLogRecord] = []
+        self._records: RecordStore[AuditLogRecord] = RecordStore(self._max_records)
         self._analyses: list[AuditLogAnalysis] = []
         logger.info(
             "k8s_audit_log_analyzer.initialized",
@@ -124,8 +126,6 @@ class K8sAuditLogAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "k8s_audit_log_analyzer.audit_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class K8sAuditLogAnalyzer:
         return record
 
     def get_audit(self, record_id: str) -> AuditLogRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_audits(
         self,
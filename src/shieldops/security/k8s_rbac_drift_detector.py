@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class K8sRBACDriftDetector:
     ) -> None:
         self._max_records = max_records
         self._drift_gap_threshold = drift_gap_threshold
-        self._records: list[RBACDriftRecord] = []
+        self._records: RecordStore[RBACDriftRecord] = RecordStore(self._max_records)
         self._analyses: list[RBACDriftAnalysis] = []
         logger.info(
             "k8s_rbac_drift_detector.initialized",
@@ -124,8 +126,6 @@ class K8sRBACDriftDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "k8s_rbac_drift_detector.drift_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class K8sRBACDriftDetector:
         return record
 
     def get_drift(self, record_id: str) -> RBACDriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class LateralMovementDetector:
     ) -> None:
         self._max_records = max_records
         self._min_detection_confidence_pct = min_detection_confidence_pct
-        self._records: list[MovementRecord] = []
+        self._records: RecordStore[MovementRecord] = RecordStore(self._max_records)
         self._hops: list[MovementHop] = []
         logger.info(
             "lateral_movement.initialized",
@@ -124,8 +126,6 @@ class LateralMovementDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "lateral_movement.movement_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class LateralMovementDetector:
         return record
 
     def get_movement(self, record_id: str) -> MovementRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_movements(
         self,
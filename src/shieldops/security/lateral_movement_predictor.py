@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class LateralMovementPredictor:
     ) -> None:
         self._max_records = max_records
         self._prediction_threshold = prediction_threshold
-        self._records: list[MovementPrediction] = []
+        self._records: RecordStore[MovementPrediction] = RecordStore(self._max_records)
         self._analyses: list[MovementAnalysis] = []
         logger.info(
             "lateral_movement_predictor.initialized",
@@ -124,8 +126,6 @@ class LateralMovementPredictor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "lateral_movement_predictor.movement_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class LateralMovementPredictor:
         return record
 
     def get_movement(self, record_id: str) -> MovementPrediction | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_movements(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class LateralMovementRiskScorerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[LateralMovementRecord] = []
+        self._records: RecordStore[LateralMovementRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, LateralMovementAnalysis] = {}
         logger.info(
             "lateral_movement_risk_scorer_engine.init",
@@ -117,8 +119,6 @@ class LateralMovementRiskScorerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "lateral_movement_risk.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class LateralMovementRiskScorerEngine:
         return record
 
     def process(self, key: str) -> LateralMovementAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         level_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -199,7 +195,7 @@ class LateralMovementRiskScorerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("lateral_movement_risk_scorer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MalwareSignatureIntegrator:
     ) -> None:
         self._max_records = max_records
         self._coverage_gap_threshold = coverage_gap_threshold
-        self._records: list[SignatureRecord] = []
+        self._records: RecordStore[SignatureRecord] = RecordStore(self._max_records)
         self._analyses: list[SignatureAnalysis] = []
         logger.info(
             "malware_signature_integrator.initialized",
@@ -124,8 +126,6 @@ class MalwareSignatureIntegrator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "malware_signature_integrator.signature_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MalwareSignatureIntegrator:
         return record
 
     def get_signature(self, record_id: str) -> SignatureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_signatures(
         self,
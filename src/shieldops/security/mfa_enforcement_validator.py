@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MFAEnforcementValidator:
     ) -> None:
         self._max_records = max_records
         self._enforcement_gap_threshold = enforcement_gap_threshold
-        self._records: list[MFARecord] = []
+        self._records: RecordStore[MFARecord] = RecordStore(self._max_records)
         self._analyses: list[MFAAnalysis] = []
         logger.info(
             "mfa_enforcement_validator.initialized",
@@ -124,8 +126,6 @@ class MFAEnforcementValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mfa_enforcement_validator.mfa_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MFAEnforcementValidator:
         return record
 
     def get_mfa(self, record_id: str) -> MFARecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mfas(
         self,
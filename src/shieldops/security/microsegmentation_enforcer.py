@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MicrosegmentationEnforcer:
     ) -> None:
         self._max_records = max_records
         self._enforcement_gap_threshold = enforcement_gap_threshold
-        self._records: list[SegmentRule] = []
+        self._records: RecordStore[SegmentRule] = RecordStore(self._max_records)
         self._analyses: list[SegmentAnalysis] = []
         logger.info(
             "microsegmentation_enforcer.initialized",
@@ -124,8 +126,6 @@ class MicrosegmentationEnforcer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "microsegmentation_enforcer.rule_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MicrosegmentationEnforcer:
         return record
 
     def get_rule(self, record_id: str) -> SegmentRule | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rules(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MitreAttackMapper:
     ) -> None:
         self._max_records = max_records
         self._coverage_gap_threshold = coverage_gap_threshold
-        self._records: list[AttackMapping] = []
+        self._records: RecordStore[AttackMapping] = RecordStore(self._max_records)
         self._analyses: list[CoverageAnalysis] = []
         logger.info(
             "mitre_attack_mapper.initialized",
@@ -124,8 +126,6 @@ class MitreAttackMapper:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mitre_attack_mapper.mapping_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MitreAttackMapper:
         return record
 
     def get_mapping(self, record_id: str) -> AttackMapping | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
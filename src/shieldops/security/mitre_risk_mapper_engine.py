@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class MitreRiskMapperEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[MitreRiskRecord] = []
+        self._records: RecordStore[MitreRiskRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, MitreRiskAnalysis] = {}
         logger.info(
             "mitre_risk_mapper_engine.init",
@@ -114,8 +116,6 @@ class MitreRiskMapperEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "mitre_risk_mapper.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class MitreRiskMapperEngine:
         return record
 
     def process(self, key: str) -> MitreRiskAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         cov_map = {
@@ -197,7 +193,7 @@ class MitreRiskMapperEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("mitre_risk_mapper_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class NamespaceIsolationValidator:
     ) -> None:
         self._max_records = max_records
         self._isolation_gap_threshold = isolation_gap_threshold
-        self._records: list[IsolationRecord] = []
+        self._records: RecordStore[IsolationRecord] = RecordStore(self._max_records)
         self._analyses: list[IsolationAnalysis] = []
         logger.info(
             "namespace_isolation_validator.initialized",
@@ -124,8 +126,6 @@ class NamespaceIsolationValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "namespace_isolation_validator.isolation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class NamespaceIsolationValidator:
         return record
 
     def get_isolation(self, record_id: str) -> IsolationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_isolations(
         self,
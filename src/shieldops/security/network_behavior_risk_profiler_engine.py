@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class NetworkBehaviorRiskProfilerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[NetworkBehaviorRecord] = []
+        self._records: RecordStore[NetworkBehaviorRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, NetworkBehaviorAnalysis] = {}
         logger.info(
             "network_behavior_risk_profiler_engine.init",
@@ -119,8 +121,6 @@ class NetworkBehaviorRiskProfilerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "network_behavior_risk.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class NetworkBehaviorRiskProfilerEngine:
         return record
 
     def process(self, key: str) -> NetworkBehaviorAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         tl_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -211,7 +207,7 @@ class NetworkBehaviorRiskProfilerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("network_behavior_risk_profiler_engine.cleared")
         return {"status": "cleared"}
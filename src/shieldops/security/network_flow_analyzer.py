@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class NetworkFlowAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._suspicion_score_threshold = suspicion_score_threshold
-        self._records: list[FlowRecord] = []
+        self._records: RecordStore[FlowRecord] = RecordStore(self._max_records)
         self._analyses: list[FlowAnalysis] = []
         logger.info(
             "network_flow_analyzer.initialized",
@@ -124,8 +126,6 @@ class NetworkFlowAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "network_flow_analyzer.flow_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class NetworkFlowAnalyzer:
         return record
 
     def get_flow(self, record_id: str) -> FlowRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_flows(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class NetworkSegmentationAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._segmentation_gap_threshold = segmentation_gap_threshold
-        self._records: list[SegmentationRecord] = []
+        self._records: RecordStore[SegmentationRecord] = RecordStore(self._max_records)
         self._analyses: list[SegmentationAnalysis] = []
         logger.info(
             "network_segmentation_analyzer.initialized",
@@ -124,8 +126,6 @@ class NetworkSegmentationAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "network_segmentation_analyzer.segmentation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class NetworkSegmentationAnalyzer:
         return record
 
     def get_segmentation(self, record_id: str) -> SegmentationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_segmentations(
         self,
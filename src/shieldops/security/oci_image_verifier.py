@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class OCIImageVerifier:
     ) -> None:
         self._max_records = max_records
         self._verification_gap_threshold = verification_gap_threshold
-        self._records: list[ImageVerificationRecord] = []
+        self._records: RecordStore[ImageVerificationRecord] = RecordStore(self._max_records)
         self._analyses: list[ImageVerificationAnalysis] = []
         logger.info(
             "oci_image_verifier.initialized",
@@ -124,8 +126,6 @@ class OCIImageVerifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "oci_image_verifier.verification_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class OCIImageVerifier:
         return record
 
     def get_verification(self, record_id: str) -> ImageVerificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_verifications(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PackageRegistryMonitor:
     ) -> None:
         self._max_records = max_records
         self._monitor_gap_threshold = monitor_gap_threshold
-        self._records: list[RegistryMonitorRecord] = []
+        self._records: RecordStore[RegistryMonitorRecord] = RecordStore(self._max_records)
         self._analyses: list[RegistryMonitorAnalysis] = []
         logger.info(
             "package_registry_monitor.initialized",
@@ -124,8 +126,6 @@ class PackageRegistryMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "package_registry_monitor.event_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PackageRegistryMonitor:
         return record
 
     def get_event(self, record_id: str) -> RegistryMonitorRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_events(
         self,
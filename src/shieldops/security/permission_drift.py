@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -86,7 +88,7 @@ class PermissionDriftDetector:
     ) -> None:
         self._max_records = max_records
         self._unused_days_threshold = unused_days_threshold
-        self._records: list[PermissionDriftRecord] = []
+        self._records: RecordStore[PermissionDriftRecord] = RecordStore(self._max_records)
         self._baselines: list[PermissionBaseline] = []
         logger.info(
             "permission_drift.initialized",
@@ -116,8 +118,6 @@ class PermissionDriftDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "permission_drift.drift_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PermissionDriftDetector:
         return record
 
     def get_drift(self, record_id: str) -> PermissionDriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
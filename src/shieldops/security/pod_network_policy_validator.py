@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PodNetworkPolicyValidator:
     ) -> None:
         self._max_records = max_records
         self._validation_gap_threshold = validation_gap_threshold
-        self._records: list[NetworkPolicyRecord] = []
+        self._records: RecordStore[NetworkPolicyRecord] = RecordStore(self._max_records)
         self._analyses: list[NetworkPolicyAnalysis] = []
         logger.info(
             "pod_network_policy_validator.initialized",
@@ -124,8 +126,6 @@ class PodNetworkPolicyValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "pod_network_policy_validator.validation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PodNetworkPolicyValidator:
         return record
 
     def get_validation(self, record_id: str) -> NetworkPolicyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
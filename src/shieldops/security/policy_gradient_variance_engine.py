@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class PolicyGradientVarianceEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[GradientVarianceRecord] = []
+        self._records: RecordStore[GradientVarianceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, GradientVarianceAnalysis] = {}
         logger.info(
             "policy_gradient_variance_engine.init",
@@ -122,8 +124,6 @@ class PolicyGradientVarianceEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_gradient_variance.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class PolicyGradientVarianceEngine:
         return record
 
     def process(self, key: str) -> GradientVarianceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         reduction_pct = (
@@ -210,7 +206,7 @@ class PolicyGradientVarianceEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("policy_gradient_variance_engine.cleared")
         return {"status": "cleared"}
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class PolicyStabilityAnalyzerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[StabilityRecord] = []
+        self._records: RecordStore[StabilityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, StabilityAnalysis] = {}
         logger.info(
             "policy_stability_analyzer_engine.init",
@@ -121,8 +123,6 @@ class PolicyStabilityAnalyzerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "policy_stability_analyzer.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class PolicyStabilityAnalyzerEngine:
         return record
 
     def process(self, key: str) -> StabilityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         entropy_collapsed = rec.entropy < 0.1
@@ -218,7 +214,7 @@ class PolicyStabilityAnalyzerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("policy_stability_analyzer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class SecurityPostureBenchmarker:
     ) -> None:
         self._max_records = max_records
         self._min_benchmark_score = min_benchmark_score
-        self._records: list[BenchmarkRecord] = []
+        self._records: RecordStore[BenchmarkRecord] = RecordStore(self._max_records)
         self._comparisons: list[BenchmarkComparison] = []
         logger.info(
             "posture_benchmark.initialized",
@@ -130,8 +132,6 @@ class SecurityPostureBenchmarker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "posture_benchmark.recorded",
             record_id=record.id,
@@ -141,10 +141,7 @@ class SecurityPostureBenchmarker:
         return record
 
     def get_benchmark(self, record_id: str) -> BenchmarkRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_benchmarks(
         self,
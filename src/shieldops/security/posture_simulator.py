@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class SecurityPostureSimulator:
     ) -> None:
         self._max_records = max_records
         self._min_blocked_rate_pct = min_blocked_rate_pct
-        self._records: list[SimulationRecord] = []
+        self._records: RecordStore[SimulationRecord] = RecordStore(self._max_records)
         self._scenarios: list[SimulationScenario] = []
         logger.info(
             "posture_simulator.initialized",
@@ -116,8 +118,6 @@ class SecurityPostureSimulator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "posture_simulator.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class SecurityPostureSimulator:
         return record
 
     def get_simulation(self, record_id: str) -> SimulationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_simulations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class SecurityPostureTrendAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._regression_threshold = regression_threshold
-        self._records: list[PostureSnapshot] = []
+        self._records: RecordStore[PostureSnapshot] = RecordStore(self._max_records)
         self._regressions: list[PostureRegression] = []
         logger.info(
             "posture_trend.initialized",
@@ -141,8 +143,6 @@ class SecurityPostureTrendAnalyzer:
             scan_source=scan_source,
         )
         self._records.append(snapshot)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "posture_trend.snapshot_recorded",
             snapshot_id=snapshot.id,
@@ -152,10 +152,7 @@ class SecurityPostureTrendAnalyzer:
         return snapshot
 
     def get_snapshot(self, snapshot_id: str) -> PostureSnapshot | None:
-        for s in self._records:
-            if s.id == snapshot_id:
-                return s
-        return None
+        return self._records.get(snapshot_id)
 
     def list_snapshots(
         self,
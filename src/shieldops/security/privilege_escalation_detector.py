@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PrivilegeEscalationDetector:
     ) -> None:
         self._max_records = max_records
         self._detection_gap_threshold = detection_gap_threshold
-        self._records: list[EscalationRecord] = []
+        self._records: RecordStore[EscalationRecord] = RecordStore(self._max_records)
         self._analyses: list[EscalationAnalysis] = []
         logger.info(
             "privilege_escalation_detector.initialized",
@@ -124,8 +126,6 @@ class PrivilegeEscalationDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "privilege_escalation_detector.escalation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PrivilegeEscalationDetector:
         return record
 
     def get_escalation(self, record_id: str) -> EscalationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_escalations(
         self,
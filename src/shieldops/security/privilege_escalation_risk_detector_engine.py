@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class PrivilegeEscalationRiskDetectorEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[EscalationRecord] = []
+        self._records: RecordStore[EscalationRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, EscalationAnalysis] = {}
         logger.info(
             "privilege_escalation_risk_detector_engine.init",
@@ -121,8 +123,6 @@ class PrivilegeEscalationRiskDetectorEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "privilege_escalation_risk.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class PrivilegeEscalationRiskDetectorEngine:
         return record
 
     def process(self, key: str) -> EscalationAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         sev_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -203,7 +199,7 @@ class PrivilegeEscalationRiskDetectorEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("privilege_escalation_risk_detector_engine.cleared")
         return {"status": "cleared"}
@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class PurpleTeamCampaignEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[CampaignRecord] = []
+        self._records: RecordStore[CampaignRecord] = RecordStore(self._max_records)
         self._analyses: list[CampaignAnalysis] = []
         logger.info(
             "purple_team_campaign_engine.initialized",
@@ -129,8 +131,6 @@ class PurpleTeamCampaignEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "purple_team_campaign_engine.record_added",
             record_id=record.id,
@@ -140,10 +140,7 @@ class PurpleTeamCampaignEngine:
         return record
 
     def get_record(self, record_id: str) -> CampaignRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
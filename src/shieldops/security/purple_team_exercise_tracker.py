@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class PurpleTeamExerciseTracker:
     ) -> None:
         self._max_records = max_records
         self._exercise_effectiveness_threshold = exercise_effectiveness_threshold
-        self._records: list[ExerciseRecord] = []
+        self._records: RecordStore[ExerciseRecord] = RecordStore(self._max_records)
         self._analyses: list[ExerciseAnalysis] = []
         logger.info(
             "purple_team_exercise_tracker.initialized",
@@ -124,8 +126,6 @@ class PurpleTeamExerciseTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "purple_team_exercise_tracker.exercise_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class PurpleTeamExerciseTracker:
         return record
 
     def get_exercise(self, record_id: str) -> ExerciseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_exercises(
         self,
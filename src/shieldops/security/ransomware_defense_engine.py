@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RansomwareDefenseEngine:
     ) -> None:
         self._max_records = max_records
         self._readiness_threshold = readiness_threshold
-        self._records: list[RansomwareRecord] = []
+        self._records: RecordStore[RansomwareRecord] = RecordStore(self._max_records)
         self._analyses: list[RansomwareAnalysis] = []
         logger.info(
             "ransomware_defense_engine.initialized",
@@ -124,8 +126,6 @@ class RansomwareDefenseEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ransomware_defense_engine.defense_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RansomwareDefenseEngine:
         return record
 
     def get_defense(self, record_id: str) -> RansomwareRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_defenses(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class SecurityResponseAutomator:
     ) -> None:
         self._max_records = max_records
         self._min_success_rate_pct = min_success_rate_pct
-        self._records: list[ResponseRecord] = []
+        self._records: RecordStore[ResponseRecord] = RecordStore(self._max_records)
         self._playbooks: list[ResponsePlaybook] = []
         logger.info(
             "response_automator.initialized",
@@ -115,8 +117,6 @@ class SecurityResponseAutomator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "response_automator.response_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class SecurityResponseAutomator:
         return record
 
     def get_response(self, record_id: str) -> ResponseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_responses(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class RewardShapingIntelligenceEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RewardShapingRecord] = []
+        self._records: RecordStore[RewardShapingRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RewardShapingAnalysis] = {}
         logger.info(
             "reward_shaping_intelligence_engine.init",
@@ -122,8 +124,6 @@ class RewardShapingIntelligenceEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reward_shaping_intelligence.record_added",
             record_id=record.id,
@@ -132,11 +132,7 @@ class RewardShapingIntelligenceEngine:
         return record
 
     def process(self, key: str) -> RewardShapingAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         difficulty_multipliers = {
@@ -209,7 +205,7 @@ class RewardShapingIntelligenceEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("reward_shaping_intelligence_engine.cleared")
         return {"status": "cleared"}
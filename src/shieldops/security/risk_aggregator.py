@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RiskSignalAggregator:
     ) -> None:
         self._max_records = max_records
         self._critical_threshold = critical_threshold
-        self._records: list[RiskSignalRecord] = []
+        self._records: RecordStore[RiskSignalRecord] = RecordStore(self._max_records)
         self._scores: list[AggregatedRiskScore] = []
         logger.info(
             "risk_aggregator.initialized",
@@ -115,8 +117,6 @@ class RiskSignalAggregator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_aggregator.signal_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class RiskSignalAggregator:
         return record
 
     def get_signal(self, record_id: str) -> RiskSignalRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_signals(
         self,
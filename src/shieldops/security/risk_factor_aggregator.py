@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class RiskFactorAggregator:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RiskFactorRecord] = []
+        self._records: RecordStore[RiskFactorRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RiskFactorAnalysis] = {}
         logger.info(
             "risk_factor_aggregator.init",
@@ -114,8 +116,6 @@ class RiskFactorAggregator:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_factor_aggregator.record_added",
             record_id=record.id,
@@ -124,11 +124,7 @@ class RiskFactorAggregator:
         return record
 
     def process(self, key: str) -> RiskFactorAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         corr = sum(1 for r in self._records if r.entity_id == rec.entity_id and r.id != rec.id)
@@ -194,7 +190,7 @@ class RiskFactorAggregator:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("risk_factor_aggregator.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RiskQuantificationEngine:
     ) -> None:
         self._max_records = max_records
         self._risk_tolerance_threshold = risk_tolerance_threshold
-        self._records: list[RiskRecord] = []
+        self._records: RecordStore[RiskRecord] = RecordStore(self._max_records)
         self._analyses: list[RiskAnalysis] = []
         logger.info(
             "risk_quantification_engine.initialized",
@@ -122,8 +124,6 @@ class RiskQuantificationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "risk_quantification_engine.risk_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class RiskQuantificationEngine:
         return record
 
     def get_risk(self, record_id: str) -> RiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_risks(
         self,
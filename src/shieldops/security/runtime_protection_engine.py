@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class RuntimeProtectionEngine:
     ) -> None:
         self._max_records = max_records
         self._protection_gap_threshold = protection_gap_threshold
-        self._records: list[ProtectionRecord] = []
+        self._records: RecordStore[ProtectionRecord] = RecordStore(self._max_records)
         self._analyses: list[ProtectionAnalysis] = []
         logger.info(
             "runtime_protection_engine.initialized",
@@ -124,8 +126,6 @@ class RuntimeProtectionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runtime_protection_engine.protection_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class RuntimeProtectionEngine:
         return record
 
     def get_protection(self, record_id: str) -> ProtectionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_protections(
         self,
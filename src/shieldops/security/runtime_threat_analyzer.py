@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class RuntimeThreatAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._severity_threshold = severity_threshold
-        self._records: list[RuntimeThreatRecord] = []
+        self._records: RecordStore[RuntimeThreatRecord] = RecordStore(self._max_records)
         self._analyses: list[RuntimeThreatAnalysis] = []
         logger.info(
             "runtime_threat_analyzer.initialized",
@@ -125,8 +127,6 @@ class RuntimeThreatAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "runtime_threat_analyzer.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class RuntimeThreatAnalyzer:
         return record
 
     def process(self, key: str) -> RuntimeThreatAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         evasion = rec.evasion_attempts > 0
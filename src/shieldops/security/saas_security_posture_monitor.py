@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SaaSSecurityPostureMonitor:
     ) -> None:
         self._max_records = max_records
         self._posture_gap_threshold = posture_gap_threshold
-        self._records: list[SaaSPostureRecord] = []
+        self._records: RecordStore[SaaSPostureRecord] = RecordStore(self._max_records)
         self._analyses: list[SaaSPostureAnalysis] = []
         logger.info(
             "saas_security_posture_monitor.initialized",
@@ -124,8 +126,6 @@ class SaaSSecurityPostureMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "saas_security_posture_monitor.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SaaSSecurityPostureMonitor:
         return record
 
     def get_posture(self, record_id: str) -> SaaSPostureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_postures(
         self,
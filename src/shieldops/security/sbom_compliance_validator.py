@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SBOMComplianceValidator:
     ) -> None:
         self._max_records = max_records
         self._compliance_gap_threshold = compliance_gap_threshold
-        self._records: list[SBOMValidation] = []
+        self._records: RecordStore[SBOMValidation] = RecordStore(self._max_records)
         self._analyses: list[ComplianceAnalysis] = []
         logger.info(
             "sbom_compliance_validator.initialized",
@@ -124,8 +126,6 @@ class SBOMComplianceValidator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sbom_compliance_validator.validation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SBOMComplianceValidator:
         return record
 
     def get_validation(self, record_id: str) -> SBOMValidation | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
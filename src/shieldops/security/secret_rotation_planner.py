@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecretRotationPlanner:
     ) -> None:
         self._max_records = max_records
         self._max_overdue_pct = max_overdue_pct
-        self._records: list[RotationRecord] = []
+        self._records: RecordStore[RotationRecord] = RecordStore(self._max_records)
         self._schedules: list[RotationSchedule] = []
         logger.info(
             "secret_rotation.initialized",
@@ -124,8 +126,6 @@ class SecretRotationPlanner:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "secret_rotation.rotation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecretRotationPlanner:
         return record
 
     def get_rotation(self, record_id: str) -> RotationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_rotations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityAlertDedupEngine:
     ) -> None:
         self._max_records = max_records
         self._dedup_effectiveness_threshold = dedup_effectiveness_threshold
-        self._records: list[DedupRecord] = []
+        self._records: RecordStore[DedupRecord] = RecordStore(self._max_records)
         self._analyses: list[DedupAnalysis] = []
         logger.info(
             "security_alert_dedup_engine.initialized",
@@ -124,8 +126,6 @@ class SecurityAlertDedupEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_alert_dedup_engine.dedup_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityAlertDedupEngine:
         return record
 
     def get_dedup(self, record_id: str) -> DedupRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_dedups(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityAutomationCoverage:
     ) -> None:
         self._max_records = max_records
         self._automation_coverage_threshold = automation_coverage_threshold
-        self._records: list[AutomationRecord] = []
+        self._records: RecordStore[AutomationRecord] = RecordStore(self._max_records)
         self._analyses: list[AutomationAnalysis] = []
         logger.info(
             "security_automation_coverage.initialized",
@@ -124,8 +126,6 @@ class SecurityAutomationCoverage:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_automation_coverage.automation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityAutomationCoverage:
         return record
 
     def get_automation(self, record_id: str) -> AutomationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_automations(
         self,
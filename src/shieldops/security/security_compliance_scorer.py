@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityComplianceScorer:
     ) -> None:
         self._max_records = max_records
         self._compliance_gap_threshold = compliance_gap_threshold
-        self._records: list[ComplianceScoreRecord] = []
+        self._records: RecordStore[ComplianceScoreRecord] = RecordStore(self._max_records)
         self._assessments: list[ComplianceGapAssessment] = []
         logger.info(
             "security_compliance_scorer.initialized",
@@ -124,8 +126,6 @@ class SecurityComplianceScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_compliance_scorer.compliance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityComplianceScorer:
         return record
 
     def get_compliance(self, record_id: str) -> ComplianceScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_compliance_records(
         self,
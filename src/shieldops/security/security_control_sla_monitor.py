@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityControlSLAMonitor:
     ) -> None:
         self._max_records = max_records
         self._sla_threshold = sla_threshold
-        self._records: list[ControlSLARecord] = []
+        self._records: RecordStore[ControlSLARecord] = RecordStore(self._max_records)
         self._analyses: list[ControlSLAAnalysis] = []
         logger.info(
             "security_control_sla_monitor.initialized",
@@ -124,8 +126,6 @@ class SecurityControlSLAMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_control_sla_monitor.sla_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityControlSLAMonitor:
         return record
 
     def get_sla(self, record_id: str) -> ControlSLARecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_slas(
         self,
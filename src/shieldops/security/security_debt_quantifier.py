@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class SecurityDebtQuantifier:
     ) -> None:
         self._max_records = max_records
         self._debt_threshold = debt_threshold
-        self._records: list[SecurityDebtRecord] = []
+        self._records: RecordStore[SecurityDebtRecord] = RecordStore(self._max_records)
         self._analyses: list[SecurityDebtAnalysis] = []
         logger.info(
             "security_debt_quantifier.initialized",
@@ -125,8 +127,6 @@ class SecurityDebtQuantifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_debt_quantifier.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class SecurityDebtQuantifier:
         return record
 
     def process(self, key: str) -> SecurityDebtAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         rate = round(0.01 * max(1, rec.age_days / 30), 4)
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class SecurityKnowledgeGraphEngine:
     ) -> None:
         self._max_records = max_records
         self._centrality_threshold = centrality_threshold
-        self._records: list[KnowledgeGraphRecord] = []
+        self._records: RecordStore[KnowledgeGraphRecord] = RecordStore(self._max_records)
         self._analyses: list[KnowledgeGraphAnalysis] = []
         logger.info(
             "security_knowledge_graph_engine.init",
@@ -125,8 +127,6 @@ class SecurityKnowledgeGraphEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_knowledge_graph.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class SecurityKnowledgeGraphEngine:
         return record
 
     def process(self, key: str) -> KnowledgeGraphAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = rec.centrality_score * 100.0
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class SecurityOrchestrationHub:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[OrchestrationRecord] = []
+        self._records: RecordStore[OrchestrationRecord] = RecordStore(self._max_records)
         self._analyses: list[OrchestrationAnalysis] = []
         logger.info(
             "security_orchestration_hub.initialized",
@@ -131,8 +133,6 @@ class SecurityOrchestrationHub:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_orchestration_hub.record_added",
             record_id=record.id,
@@ -142,10 +142,7 @@ class SecurityOrchestrationHub:
         return record
 
     def get_record(self, record_id: str) -> OrchestrationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
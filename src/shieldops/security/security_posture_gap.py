@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityPostureGapAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_critical_gap_pct = max_critical_gap_pct
-        self._records: list[PostureGapRecord] = []
+        self._records: RecordStore[PostureGapRecord] = RecordStore(self._max_records)
         self._metrics: list[GapAssessment] = []
         logger.info(
             "security_posture_gap.initialized",
@@ -124,8 +126,6 @@ class SecurityPostureGapAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_posture_gap.gap_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityPostureGapAnalyzer:
         return record
 
     def get_gap(self, record_id: str) -> PostureGapRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_gaps(
         self,
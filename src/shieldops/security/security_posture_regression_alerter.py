@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecurityPostureRegressionAlerter:
     ) -> None:
         self._max_records = max_records
         self._regression_gap_threshold = regression_gap_threshold
-        self._records: list[RegressionRecord] = []
+        self._records: RecordStore[RegressionRecord] = RecordStore(self._max_records)
         self._analyses: list[RegressionAnalysis] = []
         logger.info(
             "security_posture_regression_alerter.initialized",
@@ -124,8 +126,6 @@ class SecurityPostureRegressionAlerter:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_posture_regression_alerter.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecurityPostureRegressionAlerter:
         return record
 
     def get_regression(self, record_id: str) -> RegressionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_regressions(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class SecurityPostureTrendEngine:
     ) -> None:
         self._max_records = max_records
         self._regression_threshold = regression_threshold
-        self._records: list[PostureTrendRecord] = []
+        self._records: RecordStore[PostureTrendRecord] = RecordStore(self._max_records)
         self._analyses: list[PostureTrendAnalysis] = []
         logger.info(
             "security_posture_trend_engine.init",
@@ -125,8 +127,6 @@ class SecurityPostureTrendEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_posture_trend.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class SecurityPostureTrendEngine:
         return record
 
     def process(self, key: str) -> PostureTrendAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         gap = rec.benchmark_score - rec.posture_score
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SecuritySignalCorrelator:
     ) -> None:
         self._max_records = max_records
         self._correlation_confidence_threshold = correlation_confidence_threshold
-        self._records: list[SignalRecord] = []
+        self._records: RecordStore[SignalRecord] = RecordStore(self._max_records)
         self._correlations: list[SignalCorrelation] = []
         logger.info(
             "security_signal_correlator.initialized",
@@ -124,8 +126,6 @@ class SecuritySignalCorrelator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_signal_correlator.signal_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SecuritySignalCorrelator:
         return record
 
     def get_signal(self, record_id: str) -> SignalRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_signals(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SecurityTaskComplexityClusteringEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ClusteringRecord] = []
+        self._records: RecordStore[ClusteringRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ClusteringAnalysis] = {}
         logger.info(
             "security_task_complexity_clustering.init",
@@ -118,8 +120,6 @@ class SecurityTaskComplexityClusteringEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "security_task_complexity_clustering.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class SecurityTaskComplexityClusteringEngine:
         return record
 
     def process(self, key: str) -> ClusteringAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         cluster_recs = [r for r in self._records if r.cluster_id == rec.cluster_id]
@@ -207,7 +203,7 @@ class SecurityTaskComplexityClusteringEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("security_task_complexity_clustering.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SensitiveDataDiscoveryEngine:
     ) -> None:
         self._max_records = max_records
         self._discovery_threshold = discovery_threshold
-        self._records: list[DiscoveryRecord] = []
+        self._records: RecordStore[DiscoveryRecord] = RecordStore(self._max_records)
         self._analyses: list[DiscoveryAnalysis] = []
         logger.info(
             "sensitive_data_discovery_engine.initialized",
@@ -124,8 +126,6 @@ class SensitiveDataDiscoveryEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sensitive_data_discovery_engine.discovery_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SensitiveDataDiscoveryEngine:
         return record
 
     def get_discovery(self, record_id: str) -> DiscoveryRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_discoveries(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ServiceMeshSecurityScorer:
     ) -> None:
         self._max_records = max_records
         self._security_gap_threshold = security_gap_threshold
-        self._records: list[MeshSecurityRecord] = []
+        self._records: RecordStore[MeshSecurityRecord] = RecordStore(self._max_records)
         self._analyses: list[MeshSecurityAnalysis] = []
         logger.info(
             "service_mesh_security_scorer.initialized",
@@ -124,8 +126,6 @@ class ServiceMeshSecurityScorer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_mesh_security_scorer.mesh_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ServiceMeshSecurityScorer:
         return record
 
     def get_mesh(self, record_id: str) -> MeshSecurityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_meshes(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class SessionAnomalyRiskScorerEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SessionAnomalyRecord] = []
+        self._records: RecordStore[SessionAnomalyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SessionAnomalyAnalysis] = {}
         logger.info(
             "session_anomaly_risk_scorer_engine.init",
@@ -120,8 +122,6 @@ class SessionAnomalyRiskScorerEngine:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "session_anomaly_risk.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class SessionAnomalyRiskScorerEngine:
         return record
 
     def process(self, key: str) -> SessionAnomalyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         level_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
@@ -210,7 +206,7 @@ class SessionAnomalyRiskScorerEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("session_anomaly_risk_scorer_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ShadowDataDiscoveryEngine:
     ) -> None:
         self._max_records = max_records
         self._discovery_threshold = discovery_threshold
-        self._records: list[ShadowDataRecord] = []
+        self._records: RecordStore[ShadowDataRecord] = RecordStore(self._max_records)
         self._analyses: list[ShadowDataAnalysis] = []
         logger.info(
             "shadow_data_discovery_engine.initialized",
@@ -124,8 +126,6 @@ class ShadowDataDiscoveryEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "shadow_data_discovery_engine.shadow_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ShadowDataDiscoveryEngine:
         return record
 
     def get_shadow(self, record_id: str) -> ShadowDataRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_shadows(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SOARPlaybookEngine:
     ) -> None:
         self._max_records = max_records
         self._effectiveness_threshold = effectiveness_threshold
-        self._records: list[PlaybookRecord] = []
+        self._records: RecordStore[PlaybookRecord] = RecordStore(self._max_records)
         self._executions: list[PlaybookExecution] = []
         logger.info(
             "soar_playbook_engine.initialized",
@@ -124,8 +126,6 @@ class SOARPlaybookEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "soar_playbook_engine.playbook_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SOARPlaybookEngine:
         return record
 
     def get_playbook(self, record_id: str) -> PlaybookRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_playbooks(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SOCMetricsDashboard:
     ) -> None:
         self._max_records = max_records
         self._metric_target_threshold = metric_target_threshold
-        self._records: list[SOCMetricRecord] = []
+        self._records: RecordStore[SOCMetricRecord] = RecordStore(self._max_records)
         self._analyses: list[MetricAnalysis] = []
         logger.info(
             "soc_metrics_dashboard.initialized",
@@ -122,8 +124,6 @@ class SOCMetricsDashboard:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "soc_metrics_dashboard.metric_recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class SOCMetricsDashboard:
         return record
 
     def get_metric(self, record_id: str) -> SOCMetricRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_metrics(
         self,
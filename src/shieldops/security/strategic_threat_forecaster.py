@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class StrategicThreatForecaster:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[StrategicThreatForecasterRecord] = []
+        self._records: RecordStore[StrategicThreatForecasterRecord] = RecordStore(self._max_records)
         self._analyses: list[StrategicThreatForecasterAnalysis] = []
         logger.info(
             "strategic.threat.forecaster.initialized",
@@ -124,8 +126,6 @@ class StrategicThreatForecaster:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "strategic.threat.forecaster.item_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class StrategicThreatForecaster:
         return record
 
     def get_record(self, record_id: str) -> StrategicThreatForecasterRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SupplyChainAttackDetector:
     ) -> None:
         self._max_records = max_records
         self._supply_chain_risk_threshold = supply_chain_risk_threshold
-        self._records: list[SupplyChainRecord] = []
+        self._records: RecordStore[SupplyChainRecord] = RecordStore(self._max_records)
         self._analyses: list[SupplyChainAnalysis] = []
         logger.info(
             "supply_chain_attack_detector.initialized",
@@ -124,8 +126,6 @@ class SupplyChainAttackDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "supply_chain_attack_detector.detection_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SupplyChainAttackDetector:
         return record
 
     def get_detection(self, record_id: str) -> SupplyChainRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_detections(
         self,
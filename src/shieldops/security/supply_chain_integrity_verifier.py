@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SupplyChainIntegrityVerifier:
     ) -> None:
         self._max_records = max_records
         self._integrity_gap_threshold = integrity_gap_threshold
-        self._records: list[IntegrityRecord] = []
+        self._records: RecordStore[IntegrityRecord] = RecordStore(self._max_records)
         self._analyses: list[IntegrityAnalysis] = []
         logger.info(
             "supply_chain_integrity_verifier.initialized",
@@ -124,8 +126,6 @@ class SupplyChainIntegrityVerifier:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "supply_chain_integrity_verifier.integrity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SupplyChainIntegrityVerifier:
         return record
 
     def get_integrity(self, record_id: str) -> IntegrityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_integrity_records(
         self,
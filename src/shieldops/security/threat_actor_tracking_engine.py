@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ThreatActorTrackingEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ThreatActorTrackingEngineRecord] = []
+        self._records: RecordStore[ThreatActorTrackingEngineRecord] = RecordStore(self._max_records)
         self._analyses: list[ThreatActorTrackingEngineAnalysis] = []
         logger.info(
             "threat.actor.tracking.engine.initialized",
@@ -124,8 +126,6 @@ class ThreatActorTrackingEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat.actor.tracking.engine.item_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ThreatActorTrackingEngine:
         return record
 
     def get_record(self, record_id: str) -> ThreatActorTrackingEngineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
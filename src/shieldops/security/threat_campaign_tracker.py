@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ThreatCampaignTracker:
     ) -> None:
         self._max_records = max_records
         self._threat_score_threshold = threat_score_threshold
-        self._records: list[CampaignRecord] = []
+        self._records: RecordStore[CampaignRecord] = RecordStore(self._max_records)
         self._analyses: list[CampaignAnalysis] = []
         logger.info(
             "threat_campaign_tracker.initialized",
@@ -124,8 +126,6 @@ class ThreatCampaignTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_campaign_tracker.campaign_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ThreatCampaignTracker:
         return record
 
     def get_campaign(self, record_id: str) -> CampaignRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_campaigns(
         self,
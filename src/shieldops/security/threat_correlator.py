@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ThreatIntelligenceCorrelator:
     ) -> None:
         self._max_records = max_records
         self._min_relevance_score = min_relevance_score
-        self._records: list[ThreatRecord] = []
+        self._records: RecordStore[ThreatRecord] = RecordStore(self._max_records)
         self._correlations: list[ThreatCorrelation] = []
         logger.info(
             "threat_correlator.initialized",
@@ -122,8 +124,6 @@ class ThreatIntelligenceCorrelator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_correlator.threat_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ThreatIntelligenceCorrelator:
         return record
 
     def get_threat(self, record_id: str) -> ThreatRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_threats(
         self,
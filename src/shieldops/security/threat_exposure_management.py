@@ -11,6 +11,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class ThreatExposureManagement:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ExposureRecord] = []
+        self._records: RecordStore[ExposureRecord] = RecordStore(self._max_records)
         self._analyses: list[ExposureAnalysis] = []
         logger.info(
             "threat_exposure_management.initialized",
@@ -132,8 +134,6 @@ class ThreatExposureManagement:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_exposure_management.record_added",
             record_id=record.id,
@@ -143,10 +143,7 @@ class ThreatExposureManagement:
         return record
 
     def get_record(self, record_id: str) -> ExposureRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ThreatHuntOrchestrator:
     ) -> None:
         self._max_records = max_records
         self._min_detection_rate_pct = min_detection_rate_pct
-        self._records: list[HuntRecord] = []
+        self._records: RecordStore[HuntRecord] = RecordStore(self._max_records)
         self._findings: list[HuntFinding] = []
         logger.info(
             "threat_hunt.initialized",
@@ -115,8 +117,6 @@ class ThreatHuntOrchestrator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_hunt.hunt_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class ThreatHuntOrchestrator:
         return record
 
     def get_hunt(self, record_id: str) -> HuntRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_hunts(
         self,
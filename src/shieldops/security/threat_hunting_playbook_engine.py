@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ThreatHuntingPlaybookEngine:
     ) -> None:
         self._max_records = max_records
         self._coverage_threshold = coverage_threshold
-        self._records: list[HuntPlaybookRecord] = []
+        self._records: RecordStore[HuntPlaybookRecord] = RecordStore(self._max_records)
         self._analyses: list[HuntPlaybookAnalysis] = []
         logger.info(
             "threat_hunting_playbook_engine.init",
@@ -125,8 +127,6 @@ class ThreatHuntingPlaybookEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_hunting_playbook.record_added",
             record_id=record.id,
@@ -135,11 +135,7 @@ class ThreatHuntingPlaybookEngine:
         return record
 
     def process(self, key: str) -> HuntPlaybookAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = (
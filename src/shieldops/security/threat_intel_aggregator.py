@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ThreatIntelAggregator:
     ) -> None:
         self._max_records = max_records
         self._ioc_confidence_threshold = ioc_confidence_threshold
-        self._records: list[IOCRecord] = []
+        self._records: RecordStore[IOCRecord] = RecordStore(self._max_records)
         self._correlations: list[IOCCorrelation] = []
         logger.info(
             "threat_intel_aggregator.initialized",
@@ -124,8 +126,6 @@ class ThreatIntelAggregator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_intel_aggregator.ioc_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ThreatIntelAggregator:
         return record
 
     def get_ioc(self, record_id: str) -> IOCRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_iocs(
         self,
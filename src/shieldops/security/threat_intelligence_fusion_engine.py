@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,9 @@ class ThreatIntelligenceFusionEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ThreatIntelligenceFusionEngineRecord] = []
+        self._records: RecordStore[ThreatIntelligenceFusionEngineRecord] = RecordStore(
+            self._max_records
+        )
         self._analyses: list[ThreatIntelligenceFusionEngineAnalysis] = []
         logger.info(
             "threat.intelligence.fusion.engine.initialized",
@@ -124,8 +128,6 @@ class ThreatIntelligenceFusionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat.intelligence.fusion.engine.item_recorded",
             record_id=record.id,
@@ -136,10 +138,7 @@ class ThreatIntelligenceFusionEngine:
         return record
 
     def get_record(self, record_id: str) -> ThreatIntelligenceFusionEngineRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
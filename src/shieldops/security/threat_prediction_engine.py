@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -95,7 +97,7 @@ class ThreatPredictionEngine:
     ) -> None:
         self._max_records = max_records
         self._probability_threshold = probability_threshold
-        self._records: list[ThreatPredictionRecord] = []
+        self._records: RecordStore[ThreatPredictionRecord] = RecordStore(self._max_records)
         self._analyses: list[ThreatPredictionAnalysis] = []
         logger.info(
             "threat_prediction_engine.initialized",
@@ -125,8 +127,6 @@ class ThreatPredictionEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_prediction_engine.record_added",
             record_id=record.id,
@@ -137,11 +137,7 @@ class ThreatPredictionEngine:
 
     def process(self, key: str) -> ThreatPredictionAnalysis | None:
         """Process a record by ID, producing an analysis."""
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         score = rec.probability * 100.0
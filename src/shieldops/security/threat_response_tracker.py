@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ThreatResponseTracker:
     ) -> None:
         self._max_records = max_records
         self._max_response_time_hours = max_response_time_hours
-        self._records: list[ThreatResponseRecord] = []
+        self._records: RecordStore[ThreatResponseRecord] = RecordStore(self._max_records)
         self._assessments: list[ResponseAssessment] = []
         logger.info(
             "threat_response_tracker.initialized",
@@ -124,8 +126,6 @@ class ThreatResponseTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_response_tracker.response_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ThreatResponseTracker:
         return record
 
     def get_response(self, record_id: str) -> ThreatResponseRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_responses(
         self,
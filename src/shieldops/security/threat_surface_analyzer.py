@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ThreatSurfaceAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_exposure_score = max_exposure_score
-        self._records: list[SurfaceRecord] = []
+        self._records: RecordStore[SurfaceRecord] = RecordStore(self._max_records)
         self._metrics: list[SurfaceMetric] = []
         logger.info(
             "threat_surface_analyzer.initialized",
@@ -124,8 +126,6 @@ class ThreatSurfaceAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "threat_surface_analyzer.surface_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ThreatSurfaceAnalyzer:
         return record
 
     def get_surface(self, record_id: str) -> SurfaceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_surfaces(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TrustScoreCalculator:
     ) -> None:
         self._max_records = max_records
         self._trust_gap_threshold = trust_gap_threshold
-        self._records: list[TrustRecord] = []
+        self._records: RecordStore[TrustRecord] = RecordStore(self._max_records)
         self._analyses: list[TrustAnalysis] = []
         logger.info(
             "trust_score_calculator.initialized",
@@ -124,8 +126,6 @@ class TrustScoreCalculator:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "trust_score_calculator.trust_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TrustScoreCalculator:
         return record
 
     def get_trust(self, record_id: str) -> TrustRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trusts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class VendorSBOMTracker:
     ) -> None:
         self._max_records = max_records
         self._completeness_gap_threshold = completeness_gap_threshold
-        self._records: list[VendorSBOMRecord] = []
+        self._records: RecordStore[VendorSBOMRecord] = RecordStore(self._max_records)
         self._analyses: list[VendorSBOMAnalysis] = []
         logger.info(
             "vendor_sbom_tracker.initialized",
@@ -124,8 +126,6 @@ class VendorSBOMTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vendor_sbom_tracker.vendor_sbom_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class VendorSBOMTracker:
         return record
 
     def get_vendor_sbom(self, record_id: str) -> VendorSBOMRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_vendor_sboms(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class VendorSecurityIncidentTracker:
     ) -> None:
         self._max_records = max_records
         self._incident_gap_threshold = incident_gap_threshold
-        self._records: list[VendorIncidentRecord] = []
+        self._records: RecordStore[VendorIncidentRecord] = RecordStore(self._max_records)
         self._analyses: list[VendorIncidentAnalysis] = []
         logger.info(
             "vendor_security_incident_tracker.initialized",
@@ -124,8 +126,6 @@ class VendorSecurityIncidentTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vendor_security_incident_tracker.recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class VendorSecurityIncidentTracker:
         return record
 
     def get_incident(self, record_id: str) -> VendorIncidentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_incidents(
         self,
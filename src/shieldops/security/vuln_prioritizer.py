@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class VulnerabilityPrioritizer:
     ) -> None:
         self._max_records = max_records
         self._critical_cvss_threshold = critical_cvss_threshold
-        self._records: list[VulnRecord] = []
+        self._records: RecordStore[VulnRecord] = RecordStore(self._max_records)
         self._rules: list[VulnPriorityRule] = []
         logger.info(
             "vuln_prioritizer.initialized",
@@ -120,8 +122,6 @@ class VulnerabilityPrioritizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vuln_prioritizer.vuln_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class VulnerabilityPrioritizer:
         return record
 
     def get_vuln(self, record_id: str) -> VulnRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_vulns(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class VulnerabilityExploitPredictor:
     ) -> None:
         self._max_records = max_records
         self._exposure_threshold = exposure_threshold
-        self._records: list[ExploitPredictorRecord] = []
+        self._records: RecordStore[ExploitPredictorRecord] = RecordStore(self._max_records)
         self._analyses: list[ExploitPredictorAnalysis] = []
         logger.info(
             "vulnerability_exploit_predictor.init",
@@ -128,8 +130,6 @@ class VulnerabilityExploitPredictor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vulnerability_exploit_predictor.added",
             record_id=record.id,
@@ -138,11 +138,7 @@ class VulnerabilityExploitPredictor:
         return record
 
     def process(self, key: str) -> ExploitPredictorAnalysis | None:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return None
         sev_w = {
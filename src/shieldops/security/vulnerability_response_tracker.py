@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class VulnerabilityResponseTracker:
     ) -> None:
         self._max_records = max_records
         self._max_remediation_days = max_remediation_days
-        self._records: list[VulnerabilityRecord] = []
+        self._records: RecordStore[VulnerabilityRecord] = RecordStore(self._max_records)
         self._metrics: list[RemediationMetric] = []
         logger.info(
             "vulnerability_response_tracker.initialized",
@@ -124,8 +126,6 @@ class VulnerabilityResponseTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "vulnerability_response_tracker.vulnerability_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class VulnerabilityResponseTracker:
         return record
 
     def get_vulnerability(self, record_id: str) -> VulnerabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_vulnerabilities(
         self,
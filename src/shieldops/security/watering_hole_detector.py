@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class WateringHoleDetector:
     ) -> None:
         self._max_records = max_records
         self._detection_threshold = detection_threshold
-        self._records: list[WateringHoleRecord] = []
+        self._records: RecordStore[WateringHoleRecord] = RecordStore(self._max_records)
         self._analyses: list[WateringHoleAnalysis] = []
         logger.info(
             "watering_hole_detector.initialized",
@@ -124,8 +126,6 @@ class WateringHoleDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "watering_hole_detector.waterhole_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class WateringHoleDetector:
         return record
 
     def get_waterhole(self, record_id: str) -> WateringHoleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_waterholes(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class WorkloadIdentityAuditor:
     ) -> None:
         self._max_records = max_records
         self._audit_gap_threshold = audit_gap_threshold
-        self._records: list[WorkloadIdentityRecord] = []
+        self._records: RecordStore[WorkloadIdentityRecord] = RecordStore(self._max_records)
         self._analyses: list[WorkloadIdentityAnalysis] = []
         logger.info(
             "workload_identity_auditor.initialized",
@@ -124,8 +126,6 @@ class WorkloadIdentityAuditor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "workload_identity_auditor.identity_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class WorkloadIdentityAuditor:
         return record
 
     def get_identity(self, record_id: str) -> WorkloadIdentityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_identities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ZeroTrustVerifier:
     ) -> None:
         self._max_records = max_records
         self._min_trust_score = min_trust_score
-        self._records: list[VerificationRecord] = []
+        self._records: RecordStore[VerificationRecord] = RecordStore(self._max_records)
         self._policies: list[TrustPolicy] = []
         logger.info(
             "zero_trust.initialized",
@@ -115,8 +117,6 @@ class ZeroTrustVerifier:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "zero_trust.verification_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class ZeroTrustVerifier:
         return record
 
     def get_verification(self, record_id: str) -> VerificationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_verifications(
         self,
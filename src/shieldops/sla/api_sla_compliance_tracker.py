@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ApiSlaComplianceTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[SlaComplianceRecord] = []
+        self._records: RecordStore[SlaComplianceRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, SlaComplianceAnalysis] = {}
         logger.info(
             "api_sla_compliance_tracker.init",
@@ -118,8 +120,6 @@ class ApiSlaComplianceTracker:
             breach_margin=breach_margin,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sla_compliance.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class ApiSlaComplianceTracker:
         return record
 
     def process(self, key: str) -> SlaComplianceAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_comp = rec.compliance_status == ComplianceStatus.COMPLIANT
@@ -197,7 +193,7 @@ class ApiSlaComplianceTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("api_sla_compliance_tracker.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class PlatformAvailabilityTracker:
     ) -> None:
         self._max_records = max_records
         self._min_availability_pct = min_availability_pct
-        self._records: list[AvailabilityRecord] = []
+        self._records: RecordStore[AvailabilityRecord] = RecordStore(self._max_records)
         self._outages: list[OutageEvent] = []
         logger.info(
             "availability_tracker.initialized",
@@ -123,8 +125,6 @@ class PlatformAvailabilityTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "availability_tracker.recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class PlatformAvailabilityTracker:
         return record
 
     def get_availability(self, record_id: str) -> AvailabilityRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_availabilities(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SLABreachImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_breach_impact_score = max_breach_impact_score
-        self._records: list[BreachImpactRecord] = []
+        self._records: RecordStore[BreachImpactRecord] = RecordStore(self._max_records)
         self._assessments: list[ImpactAssessment] = []
         logger.info(
             "breach_impact.initialized",
@@ -124,8 +126,6 @@ class SLABreachImpactAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "breach_impact.breach_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SLABreachImpactAnalyzer:
         return record
 
     def get_breach(self, record_id: str) -> BreachImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_breaches(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ServiceDegradationTracker:
     ) -> None:
         self._max_records = max_records
         self._max_degradation_minutes = max_degradation_minutes
-        self._records: list[DegradationRecord] = []
+        self._records: RecordStore[DegradationRecord] = RecordStore(self._max_records)
         self._events: list[DegradationEvent] = []
         logger.info(
             "degradation_tracker.initialized",
@@ -124,8 +126,6 @@ class ServiceDegradationTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "degradation_tracker.degradation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ServiceDegradationTracker:
         return record
 
     def get_degradation(self, record_id: str) -> DegradationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_degradations(
         self,
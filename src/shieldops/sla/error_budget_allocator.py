@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ErrorBudgetAllocator:
     ) -> None:
         self._max_records = max_records
         self._min_healthy_rate_pct = min_healthy_rate_pct
-        self._records: list[AllocationRecord] = []
+        self._records: RecordStore[AllocationRecord] = RecordStore(self._max_records)
         self._policies: list[AllocationPolicy] = []
         logger.info(
             "error_budget_allocator.initialized",
@@ -116,8 +118,6 @@ class ErrorBudgetAllocator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "error_budget_allocator.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ErrorBudgetAllocator:
         return record
 
     def get_allocation(self, record_id: str) -> AllocationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_allocations(
         self,
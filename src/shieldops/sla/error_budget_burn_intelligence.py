@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ErrorBudgetBurnIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ErrorBudgetBurnRecord] = []
+        self._records: RecordStore[ErrorBudgetBurnRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ErrorBudgetBurnAnalysis] = {}
         logger.info(
             "error_budget_burn_intelligence.init",
@@ -120,8 +122,6 @@ class ErrorBudgetBurnIntelligence:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "error_budget_burn_intelligence.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class ErrorBudgetBurnIntelligence:
         return record
 
     def process(self, key: str) -> ErrorBudgetBurnAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         points = sum(1 for r in self._records if r.service_id == rec.service_id)
@@ -206,7 +202,7 @@ class ErrorBudgetBurnIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("error_budget_burn_intelligence.cleared")
         return {"status": "cleared"}
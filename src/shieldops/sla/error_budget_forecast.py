@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ErrorBudgetForecaster:
     ) -> None:
         self._max_records = max_records
         self._risk_threshold_pct = risk_threshold_pct
-        self._records: list[BudgetSnapshot] = []
+        self._records: RecordStore[BudgetSnapshot] = RecordStore(self._max_records)
         self._forecasts: list[BudgetForecast] = []
         logger.info(
             "error_budget_forecast.initialized",
@@ -134,8 +136,6 @@ class ErrorBudgetForecaster:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "error_budget_forecast.snapshot_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class ErrorBudgetForecaster:
         return record
 
     def get_snapshot(self, record_id: str) -> BudgetSnapshot | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_snapshots(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -96,7 +98,7 @@ class SLAImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_breach_count = max_breach_count
-        self._records: list[ImpactRecord] = []
+        self._records: RecordStore[ImpactRecord] = RecordStore(self._max_records)
         self._contributors: list[ImpactContributor] = []
         logger.info(
             "sla_impact.initialized",
@@ -128,8 +130,6 @@ class SLAImpactAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sla_impact.recorded",
             record_id=record.id,
@@ -139,10 +139,7 @@ class SLAImpactAnalyzer:
         return record
 
     def get_impact(self, record_id: str) -> ImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_impacts(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class MaintenanceImpactAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_impact_minutes = max_impact_minutes
-        self._records: list[MaintenanceImpactRecord] = []
+        self._records: RecordStore[MaintenanceImpactRecord] = RecordStore(self._max_records)
         self._attributions: list[DowntimeAttribution] = []
         logger.info(
             "maintenance_impact.initialized",
@@ -124,8 +126,6 @@ class MaintenanceImpactAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "maintenance_impact.maintenance_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class MaintenanceImpactAnalyzer:
         return record
 
     def get_maintenance(self, record_id: str) -> MaintenanceImpactRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_maintenances(
         self,
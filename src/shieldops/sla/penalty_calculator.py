@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -100,7 +102,7 @@ class SLAPenaltyCalculator:
     ) -> None:
         self._max_records = max_records
         self._default_credit_multiplier = default_credit_multiplier
-        self._records: list[PenaltyRecord] = []
+        self._records: RecordStore[PenaltyRecord] = RecordStore(self._max_records)
         self._thresholds: dict[str, PenaltyThreshold] = {}
         logger.info(
             "penalty_calculator.initialized",
@@ -175,8 +177,6 @@ class SLAPenaltyCalculator:
             credit_amount=credit_amount,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "penalty_calculator.penalty_recorded",
             record_id=record.id,
@@ -186,10 +186,7 @@ class SLAPenaltyCalculator:
         return record
 
     def get_penalty(self, record_id: str) -> PenaltyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_penalties(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class ReliabilityAutomationEngine:
     ) -> None:
         self._max_records = max_records
         self._min_impact_score = min_impact_score
-        self._records: list[AdjustmentRecord] = []
+        self._records: RecordStore[AdjustmentRecord] = RecordStore(self._max_records)
         self._rules: list[AdjustmentRule] = []
         logger.info(
             "reliability_automation_engine.initialized",
@@ -115,8 +117,6 @@ class ReliabilityAutomationEngine:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_automation_engine.adjustment_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class ReliabilityAutomationEngine:
         return record
 
     def get_adjustment(self, record_id: str) -> AdjustmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_adjustments(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ReliabilityImprovementTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ReliabilityImprovementRecord] = []
+        self._records: RecordStore[ReliabilityImprovementRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ReliabilityImprovementAnalysis] = {}
         logger.info(
             "reliability_improvement_tracker.init",
@@ -120,8 +122,6 @@ class ReliabilityImprovementTracker:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_improvement_tracker.record_added",
             record_id=record.id,
@@ -130,11 +130,7 @@ class ReliabilityImprovementTracker:
         return record
 
     def process(self, key: str) -> ReliabilityImprovementAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         points = sum(1 for r in self._records if r.initiative_id == rec.initiative_id)
@@ -201,7 +197,7 @@ class ReliabilityImprovementTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("reliability_improvement_tracker.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ReliabilityRegressionDetector:
     ) -> None:
         self._max_records = max_records
         self._deviation_threshold_pct = deviation_threshold_pct
-        self._records: list[RegressionEvent] = []
+        self._records: RecordStore[RegressionEvent] = RecordStore(self._max_records)
         self._analyses: list[RegressionAnalysis] = []
         logger.info(
             "reliability_regression.initialized",
@@ -139,8 +141,6 @@ class ReliabilityRegressionDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_regression.recorded",
             record_id=record.id,
@@ -151,10 +151,7 @@ class ReliabilityRegressionDetector:
         return record
 
     def get_regression(self, record_id: str) -> RegressionEvent | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_regressions(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class PlatformReliabilityScorecard:
     ) -> None:
         self._max_records = max_records
         self._min_grade_score = min_grade_score
-        self._records: list[ScorecardRecord] = []
+        self._records: RecordStore[ScorecardRecord] = RecordStore(self._max_records)
         self._categories: list[CategoryScore] = []
         logger.info(
             "reliability_scorecard.initialized",
@@ -116,8 +118,6 @@ class PlatformReliabilityScorecard:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_scorecard.scorecard_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class PlatformReliabilityScorecard:
         return record
 
     def get_scorecard(self, record_id: str) -> ScorecardRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scorecards(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ServiceReliabilityScorer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ServiceReliabilityRecord] = []
+        self._records: RecordStore[ServiceReliabilityRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ServiceReliabilityAnalysis] = {}
         logger.info(
             "service_reliability_scorer.init",
@@ -117,8 +119,6 @@ class ServiceReliabilityScorer:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_reliability_scorer.record_added",
             record_id=record.id,
@@ -127,11 +127,7 @@ class ServiceReliabilityScorer:
         return record
 
     def process(self, key: str) -> ServiceReliabilityAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         metrics = sum(1 for r in self._records if r.service_id == rec.service_id)
@@ -196,7 +192,7 @@ class ServiceReliabilityScorer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("service_reliability_scorer.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ServiceSLACascader:
     ) -> None:
         self._max_records = max_records
         self._min_acceptable_sla_pct = min_acceptable_sla_pct
-        self._records: list[CascadeRecord] = []
+        self._records: RecordStore[CascadeRecord] = RecordStore(self._max_records)
         self._paths: list[CascadePath] = []
         logger.info(
             "sla_cascader.initialized",
@@ -131,8 +133,6 @@ class ServiceSLACascader:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "sla_cascader.dependency_recorded",
             record_id=record.id,
@@ -144,10 +144,7 @@ class ServiceSLACascader:
 
     def get_record(self, record_id: str) -> CascadeRecord | None:
         """Get a single cascade record by ID."""
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class SLOAggregationDashboard:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_pct = min_compliance_pct
-        self._records: list[AggregationRecord] = []
+        self._records: RecordStore[AggregationRecord] = RecordStore(self._max_records)
         self._rules: list[AggregationRule] = []
         logger.info(
             "slo_aggregator.initialized",
@@ -116,8 +118,6 @@ class SLOAggregationDashboard:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_aggregator.aggregation_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class SLOAggregationDashboard:
         return record
 
     def get_aggregation(self, record_id: str) -> AggregationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_aggregations(
         self,
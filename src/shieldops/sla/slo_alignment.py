@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class SLOAlignmentValidator:
     ) -> None:
         self._max_records = max_records
         self._min_alignment_score = min_alignment_score
-        self._records: list[AlignmentRecord] = []
+        self._records: RecordStore[AlignmentRecord] = RecordStore(self._max_records)
         self._gaps: list[AlignmentGap] = []
         logger.info(
             "slo_alignment.initialized",
@@ -123,8 +125,6 @@ class SLOAlignmentValidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_alignment.recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class SLOAlignmentValidator:
         return record
 
     def get_alignment(self, record_id: str) -> AlignmentRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_alignments(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -87,7 +89,7 @@ class SLOAutoScaler:
     ) -> None:
         self._max_records = max_records
         self._max_replica_delta = max_replica_delta
-        self._records: list[ScaleRecord] = []
+        self._records: RecordStore[ScaleRecord] = RecordStore(self._max_records)
         self._policies: list[ScalePolicy] = []
         logger.info(
             "slo_auto_scaler.initialized",
@@ -115,8 +117,6 @@ class SLOAutoScaler:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_auto_scaler.scale_recorded",
             record_id=record.id,
@@ -126,10 +126,7 @@ class SLOAutoScaler:
         return record
 
     def get_scale(self, record_id: str) -> ScaleRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_scales(
         self,
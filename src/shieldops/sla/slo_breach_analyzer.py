@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SLOBreachAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_breach_duration_minutes = max_breach_duration_minutes
-        self._records: list[BreachRecord] = []
+        self._records: RecordStore[BreachRecord] = RecordStore(self._max_records)
         self._assessments: list[BreachImpactAssessment] = []
         logger.info(
             "slo_breach_analyzer.initialized",
@@ -124,8 +126,6 @@ class SLOBreachAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_breach_analyzer.breach_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SLOBreachAnalyzer:
         return record
 
     def get_breach(self, record_id: str) -> BreachRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_breaches(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class SLOComplianceChecker:
     ) -> None:
         self._max_records = max_records
         self._min_compliance_pct = min_compliance_pct
-        self._records: list[ComplianceRecord] = []
+        self._records: RecordStore[ComplianceRecord] = RecordStore(self._max_records)
         self._violations: list[ComplianceViolation] = []
         logger.info(
             "slo_compliance.initialized",
@@ -125,8 +127,6 @@ class SLOComplianceChecker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_compliance.compliance_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class SLOComplianceChecker:
         return record
 
     def get_compliance(self, record_id: str) -> ComplianceRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_compliances(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SLODependencyMapper:
     ) -> None:
         self._max_records = max_records
         self._min_slo_target_pct = min_slo_target_pct
-        self._records: list[MappingRecord] = []
+        self._records: RecordStore[MappingRecord] = RecordStore(self._max_records)
         self._rules: list[MappingRule] = []
         logger.info(
             "slo_dep_mapper.initialized",
@@ -126,8 +128,6 @@ class SLODependencyMapper:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_dep_mapper.mapping_recorded",
             record_id=record.id,
@@ -138,10 +138,7 @@ class SLODependencyMapper:
         return record
 
     def get_mapping(self, record_id: str) -> MappingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
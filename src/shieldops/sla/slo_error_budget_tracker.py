@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SLOErrorBudgetTracker:
     ) -> None:
         self._max_records = max_records
         self._min_remaining_budget_pct = min_remaining_budget_pct
-        self._records: list[BudgetRecord] = []
+        self._records: RecordStore[BudgetRecord] = RecordStore(self._max_records)
         self._allocations: list[BudgetAllocation] = []
         logger.info(
             "slo_error_budget.initialized",
@@ -124,8 +126,6 @@ class SLOErrorBudgetTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_error_budget.budget_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SLOErrorBudgetTracker:
         return record
 
     def get_budget(self, record_id: str) -> BudgetRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_budgets(
         self,
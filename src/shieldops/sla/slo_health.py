@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class SLOHealthDashboard:
     ) -> None:
         self._max_records = max_records
         self._min_health_score = min_health_score
-        self._records: list[SLOHealthRecord] = []
+        self._records: RecordStore[SLOHealthRecord] = RecordStore(self._max_records)
         self._rules: list[SLOHealthRule] = []
         logger.info(
             "slo_health.initialized",
@@ -120,8 +122,6 @@ class SLOHealthDashboard:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_health.health_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class SLOHealthDashboard:
         return record
 
     def get_health(self, record_id: str) -> SLOHealthRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_health_records(
         self,
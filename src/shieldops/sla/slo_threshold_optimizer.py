@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class SloThresholdOptimizer:
     ) -> None:
         self._max_records = max_records
         self._adjustment_sensitivity = adjustment_sensitivity
-        self._records: list[ThresholdRecord] = []
+        self._records: RecordStore[ThresholdRecord] = RecordStore(self._max_records)
         self._analyses: list[ThresholdAnalysis] = []
         logger.info(
             "slo_threshold_optimizer.initialized",
@@ -124,8 +126,6 @@ class SloThresholdOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "slo_threshold_optimizer.threshold_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class SloThresholdOptimizer:
         return record
 
     def get_threshold(self, record_id: str) -> ThresholdRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_thresholds(
         self,
@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ApiConsumerImpactAnalyzer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ConsumerImpactRecord] = []
+        self._records: RecordStore[ConsumerImpactRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ConsumerImpactAnalysis] = {}
         logger.info(
             "api_consumer_impact_analyzer.init",
@@ -118,8 +120,6 @@ class ApiConsumerImpactAnalyzer:
             notified=notified,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "consumer_impact.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class ApiConsumerImpactAnalyzer:
         return record
 
     def process(self, key: str) -> ConsumerImpactAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_breaking = rec.impact_level == ImpactLevel.BREAKING
@@ -203,7 +199,7 @@ class ApiConsumerImpactAnalyzer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("api_consumer_impact_analyzer.cleared")
         return {"status": "cleared"}
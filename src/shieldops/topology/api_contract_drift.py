@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class APIContractDriftDetector:
     ) -> None:
         self._max_records = max_records
         self._max_breaking_drift_pct = max_breaking_drift_pct
-        self._records: list[ContractDriftRecord] = []
+        self._records: RecordStore[ContractDriftRecord] = RecordStore(self._max_records)
         self._details: list[DriftDetail] = []
         logger.info(
             "api_contract_drift.initialized",
@@ -124,8 +126,6 @@ class APIContractDriftDetector:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_contract_drift.drift_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class APIContractDriftDetector:
         return record
 
     def get_drift(self, record_id: str) -> ContractDriftRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_drifts(
         self,
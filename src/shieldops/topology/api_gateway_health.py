@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class APIGatewayHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_error_rate_pct = max_error_rate_pct
-        self._records: list[GatewayHealthRecord] = []
+        self._records: RecordStore[GatewayHealthRecord] = RecordStore(self._max_records)
         self._alerts: list[GatewayAlert] = []
         logger.info(
             "api_gateway_health.initialized",
@@ -120,8 +122,6 @@ class APIGatewayHealthMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_gateway_health.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class APIGatewayHealthMonitor:
         return record
 
     def get_health(self, record_id: str) -> GatewayHealthRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_health_records(
         self,
@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ApiHealthCompositeScorer:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ApiHealthRecord] = []
+        self._records: RecordStore[ApiHealthRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ApiHealthAnalysis] = {}
         logger.info(
             "api_health_composite_scorer.init",
@@ -121,8 +123,6 @@ class ApiHealthCompositeScorer:
             throughput_rps=throughput_rps,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_health.record_added",
             record_id=record.id,
@@ -131,11 +131,7 @@ class ApiHealthCompositeScorer:
         return record
 
     def process(self, key: str) -> ApiHealthAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         signals = sum(1 for r in self._records if r.endpoint == rec.endpoint)
@@ -203,7 +199,7 @@ class ApiHealthCompositeScorer:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("api_health_composite_scorer.cleared")
         return {"status": "cleared"}
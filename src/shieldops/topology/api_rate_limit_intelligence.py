@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ApiRateLimitIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[RateLimitRecord] = []
+        self._records: RecordStore[RateLimitRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, RateLimitAnalysis] = {}
         logger.info(
             "api_rate_limit_intelligence.init",
@@ -118,8 +120,6 @@ class ApiRateLimitIntelligence:
             utilization_pct=utilization_pct,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "rate_limit.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class ApiRateLimitIntelligence:
         return record
 
     def process(self, key: str) -> RateLimitAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         at_risk = rec.throttle_risk in (
@@ -204,7 +200,7 @@ class ApiRateLimitIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("api_rate_limit_intelligence.cleared")
         return {"status": "cleared"}
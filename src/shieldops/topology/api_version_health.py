@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class APIVersionHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._sunset_warning_days = sunset_warning_days
-        self._records: list[APIVersionRecord] = []
+        self._records: RecordStore[APIVersionRecord] = RecordStore(self._max_records)
         self._migrations: list[VersionMigration] = []
         logger.info(
             "api_version_health.initialized",
@@ -119,8 +121,6 @@ class APIVersionHealthMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_version_health.version_recorded",
             record_id=record.id,
@@ -131,10 +131,7 @@ class APIVersionHealthMonitor:
         return record
 
     def get_version(self, record_id: str) -> APIVersionRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_versions(
         self,
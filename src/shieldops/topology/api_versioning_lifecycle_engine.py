@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ApiVersioningLifecycleEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[ApiVersionRecord] = []
+        self._records: RecordStore[ApiVersionRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, ApiVersionAnalysis] = {}
         logger.info(
             "api_versioning_lifecycle.init",
@@ -118,8 +120,6 @@ class ApiVersioningLifecycleEngine:
             days_since_release=days_since_release,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "api_versioning.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class ApiVersioningLifecycleEngine:
         return record
 
     def process(self, key: str) -> ApiVersionAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         is_stale = rec.version_status in (
@@ -205,7 +201,7 @@ class ApiVersioningLifecycleEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("api_versioning_lifecycle.cleared")
         return {"status": "cleared"}
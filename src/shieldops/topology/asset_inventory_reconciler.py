@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class AssetInventoryReconciler:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[ReconciliationRecord] = []
+        self._records: RecordStore[ReconciliationRecord] = RecordStore(self._max_records)
         self._analyses: list[ReconciliationAnalysis] = []
         logger.info(
             "asset_inventory_reconciler.initialized",
@@ -124,8 +126,6 @@ class AssetInventoryReconciler:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "asset_inventory_reconciler.recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class AssetInventoryReconciler:
         return record
 
     def get_reconciliation(self, record_id: str) -> ReconciliationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_reconciliations(
         self,
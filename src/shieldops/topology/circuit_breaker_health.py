@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CircuitBreakerHealthMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_trip_count_24h = max_trip_count_24h
-        self._records: list[BreakerStateRecord] = []
+        self._records: RecordStore[BreakerStateRecord] = RecordStore(self._max_records)
         self._transitions: list[BreakerTransition] = []
         logger.info(
             "circuit_breaker_health.initialized",
@@ -117,8 +119,6 @@ class CircuitBreakerHealthMonitor:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "circuit_breaker_health.state_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class CircuitBreakerHealthMonitor:
         return record
 
     def get_state(self, record_id: str) -> BreakerStateRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_states(
         self,
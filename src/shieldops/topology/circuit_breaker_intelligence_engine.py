@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class CircuitBreakerIntelligenceEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[CircuitBreakerRecord] = []
+        self._records: RecordStore[CircuitBreakerRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, CircuitBreakerAnalysis] = {}
         logger.info(
             "circuit_breaker_intelligence.init",
@@ -118,8 +120,6 @@ class CircuitBreakerIntelligenceEngine:
             current_error_rate=current_error_rate,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "circuit_breaker.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class CircuitBreakerIntelligenceEngine:
         return record
 
     def process(self, key: str) -> CircuitBreakerAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         changes = sum(1 for r in self._records if r.breaker_name == rec.breaker_name)
@@ -204,7 +200,7 @@ class CircuitBreakerIntelligenceEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("circuit_breaker_intelligence.cleared")
         return {"status": "cleared"}
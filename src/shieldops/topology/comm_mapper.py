@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ServiceCommunicationMapper:
     ) -> None:
         self._max_records = max_records
         self._max_unhealthy_links = max_unhealthy_links
-        self._records: list[CommRecord] = []
+        self._records: RecordStore[CommRecord] = RecordStore(self._max_records)
         self._links: list[CommLink] = []
         logger.info(
             "comm_mapper.initialized",
@@ -117,8 +119,6 @@ class ServiceCommunicationMapper:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "comm_mapper.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ServiceCommunicationMapper:
         return record
 
     def get_comm(self, record_id: str) -> CommRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_comms(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class CrossTeamDependencyTracker:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TeamDependencyRecord] = []
+        self._records: RecordStore[TeamDependencyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TeamDependencyAnalysis] = {}
         logger.info(
             "cross_team_dependency_tracker.init",
@@ -117,8 +119,6 @@ class CrossTeamDependencyTracker:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "cross_team_dependency.item_recorded",
             record_id=record.id,
@@ -127,11 +127,7 @@ class CrossTeamDependencyTracker:
         return record
 
     def process(self, key: str) -> TeamDependencyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         team_recs = [r for r in self._records if r.source_team == rec.source_team]
@@ -206,7 +202,7 @@ class CrossTeamDependencyTracker:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("cross_team_dependency_tracker.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class DependencyChangeTracker:
     ) -> None:
         self._max_records = max_records
         self._max_breaking_change_pct = max_breaking_change_pct
-        self._records: list[DepChangeRecord] = []
+        self._records: RecordStore[DepChangeRecord] = RecordStore(self._max_records)
         self._rules: list[DepChangeRule] = []
         logger.info(
             "dep_change_tracker.initialized",
@@ -120,8 +122,6 @@ class DependencyChangeTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dep_change_tracker.change_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class DependencyChangeTracker:
         return record
 
     def get_change(self, record_id: str) -> DepChangeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_changes(
         self,
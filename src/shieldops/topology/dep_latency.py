@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class DependencyLatencyTracker:
     ) -> None:
         self._max_records = max_records
         self._max_latency_ms = max_latency_ms
-        self._records: list[LatencyRecord] = []
+        self._records: RecordStore[LatencyRecord] = RecordStore(self._max_records)
         self._breakdowns: list[LatencyBreakdown] = []
         logger.info(
             "dep_latency.initialized",
@@ -118,8 +120,6 @@ class DependencyLatencyTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dep_latency.latency_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class DependencyLatencyTracker:
         return record
 
     def get_latency(self, record_id: str) -> LatencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_latencies(
         self,
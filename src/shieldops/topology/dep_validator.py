@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -93,7 +95,7 @@ class ServiceDependencyValidator:
     ) -> None:
         self._max_records = max_records
         self._max_invalid_pct = max_invalid_pct
-        self._records: list[ValidationRecord] = []
+        self._records: RecordStore[ValidationRecord] = RecordStore(self._max_records)
         self._rules: list[ValidationRule] = []
         logger.info(
             "dep_validator.initialized",
@@ -123,8 +125,6 @@ class ServiceDependencyValidator:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dep_validator.validation_recorded",
             record_id=record.id,
@@ -135,10 +135,7 @@ class ServiceDependencyValidator:
         return record
 
     def get_validation(self, record_id: str) -> ValidationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_validations(
         self,
@@ -10,6 +10,8 @@ from uuid import uuid4
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class DependencyVulnerabilityMapper:
     ) -> None:
         self._max_records = max_records
         self._max_critical_vulns = max_critical_vulns
-        self._records: list[VulnMappingRecord] = []
+        self._records: RecordStore[VulnMappingRecord] = RecordStore(self._max_records)
         self._details: list[VulnDependencyDetail] = []
         logger.info(
             "dep_vuln_mapper.initialized",
@@ -119,8 +121,6 @@ class DependencyVulnerabilityMapper:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dep_vuln_mapper.mapping_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class DependencyVulnerabilityMapper:
         return record
 
     def get_mapping(self, record_id: str) -> VulnMappingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_mappings(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DependencyCircuitBreakerMonitor:
     ) -> None:
         self._max_records = max_records
         self._max_open_circuit_pct = max_open_circuit_pct
-        self._records: list[CircuitBreakerRecord] = []
+        self._records: RecordStore[CircuitBreakerRecord] = RecordStore(self._max_records)
         self._events: list[CircuitEvent] = []
         logger.info(
             "dependency_circuit_breaker.initialized",
@@ -124,8 +126,6 @@ class DependencyCircuitBreakerMonitor:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_circuit_breaker.circuit_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DependencyCircuitBreakerMonitor:
         return record
 
     def get_circuit(self, record_id: str) -> CircuitBreakerRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_circuits(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -91,7 +93,7 @@ class DependencyLagMonitor:
     ) -> None:
         self._max_records = max_records
         self._degradation_threshold_pct = degradation_threshold_pct
-        self._records: list[DependencyLagRecord] = []
+        self._records: RecordStore[DependencyLagRecord] = RecordStore(self._max_records)
         self._baselines: dict[str, LagBaseline] = {}
         logger.info(
             "dependency_lag.initialized",
@@ -145,8 +147,6 @@ class DependencyLagMonitor:
             cause=cause,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_lag.lag_recorded",
             record_id=record.id,
@@ -158,10 +158,7 @@ class DependencyLagMonitor:
         return record
 
     def get_lag_record(self, record_id: str) -> DependencyLagRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_lag_records(
         self,
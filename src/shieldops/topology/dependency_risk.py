@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class DependencyRiskScorer:
     ) -> None:
         self._max_records = max_records
         self._critical_threshold = critical_threshold
-        self._records: list[DependencyRiskRecord] = []
+        self._records: RecordStore[DependencyRiskRecord] = RecordStore(self._max_records)
         self._mitigations: list[RiskMitigation] = []
         logger.info(
             "dependency_risk.initialized",
@@ -134,8 +136,6 @@ class DependencyRiskScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_risk.risk_recorded",
             record_id=record.id,
@@ -145,10 +145,7 @@ class DependencyRiskScorer:
         return record
 
     def get_risk(self, record_id: str) -> DependencyRiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_risks(
         self,
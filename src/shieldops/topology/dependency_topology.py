@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class DependencyTopologyAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_coupling_depth = max_coupling_depth
-        self._records: list[TopologyRecord] = []
+        self._records: RecordStore[TopologyRecord] = RecordStore(self._max_records)
         self._rules: list[TopologyRule] = []
         logger.info(
             "dependency_topology.initialized",
@@ -116,8 +118,6 @@ class DependencyTopologyAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_topology.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class DependencyTopologyAnalyzer:
         return record
 
     def get_observation(self, record_id: str) -> TopologyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_observations(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -98,7 +100,7 @@ class DependencyUpgradeEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[DependencyUpgradeRecord] = []
+        self._records: RecordStore[DependencyUpgradeRecord] = RecordStore(self._max_records)
         self._analyses: list[DependencyUpgradeAnalysis] = []
         logger.info(
             "dependency.upgrade.engine.initialized",
@@ -126,8 +128,6 @@ class DependencyUpgradeEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency.upgrade.engine.item_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DependencyUpgradeEngine:
         return record
 
     def get_record(self, record_id: str) -> DependencyUpgradeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class DeprecationCascadeAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._impact_gap_threshold = impact_gap_threshold
-        self._records: list[DeprecationRecord] = []
+        self._records: RecordStore[DeprecationRecord] = RecordStore(self._max_records)
         self._analyses: list[DeprecationAnalysis] = []
         logger.info(
             "deprecation_cascade_analyzer.initialized",
@@ -124,8 +126,6 @@ class DeprecationCascadeAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deprecation_cascade_analyzer.deprecation_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class DeprecationCascadeAnalyzer:
         return record
 
     def get_deprecation(self, record_id: str) -> DeprecationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_deprecations(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ServiceDeprecationTracker:
     ) -> None:
         self._max_records = max_records
         self._max_overdue_days = max_overdue_days
-        self._records: list[DeprecationRecord] = []
+        self._records: RecordStore[DeprecationRecord] = RecordStore(self._max_records)
         self._migration_plans: list[MigrationPlan] = []
         logger.info(
             "deprecation_tracker.initialized",
@@ -120,8 +122,6 @@ class ServiceDeprecationTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "deprecation_tracker.deprecation_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ServiceDeprecationTracker:
         return record
 
     def get_deprecation(self, record_id: str) -> DeprecationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_deprecations(
         self,
@@ -12,6 +12,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class EventDrivenTopologyMapper:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TopologyRecord] = []
+        self._records: RecordStore[TopologyRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TopologyAnalysis] = {}
         logger.info(
             "event_driven_topology_mapper.init",
@@ -117,8 +119,6 @@ class EventDrivenTopologyMapper:
             description=description,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "topology_mapper.item_recorded",
             record_id=record.id,
@@ -127,11 +127,7 @@ class EventDrivenTopologyMapper:
         return record
 
     def process(self, key: str) -> TopologyAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         centrality = round(
@@ -208,7 +204,7 @@ class EventDrivenTopologyMapper:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("event_driven_topology_mapper.cleared")
         return {"status": "cleared"}
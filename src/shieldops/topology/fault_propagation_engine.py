@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class FaultPropagationEngine:
     ) -> None:
         self._max_records = max_records
         self._threshold = threshold
-        self._records: list[FaultPropagationRecord] = []
+        self._records: RecordStore[FaultPropagationRecord] = RecordStore(self._max_records)
         self._analyses: list[FaultPropagationAnalysis] = []
         logger.info(
             "fault.propagation.engine.initialized",
@@ -122,8 +124,6 @@ class FaultPropagationEngine:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "fault.propagation.engine.item_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class FaultPropagationEngine:
         return record
 
     def get_record(self, record_id: str) -> FaultPropagationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ServiceHealthTrendAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._min_health_trend_score = min_health_trend_score
-        self._records: list[HealthTrendRecord] = []
+        self._records: RecordStore[HealthTrendRecord] = RecordStore(self._max_records)
         self._data_points: list[TrendDataPoint] = []
         logger.info(
             "health_trend.initialized",
@@ -120,8 +122,6 @@ class ServiceHealthTrendAnalyzer:
             service=service,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "health_trend.trend_recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ServiceHealthTrendAnalyzer:
         return record
 
     def get_trend(self, record_id: str) -> HealthTrendRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_trends(
         self,
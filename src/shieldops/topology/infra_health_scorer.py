@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class InfrastructureHealthScorer:
     ) -> None:
         self._max_records = max_records
         self._min_health_score = min_health_score
-        self._records: list[HealthScoreRecord] = []
+        self._records: RecordStore[HealthScoreRecord] = RecordStore(self._max_records)
         self._dimension_details: list[HealthDimensionDetail] = []
         logger.info(
             "infra_health_scorer.initialized",
@@ -116,8 +118,6 @@ class InfrastructureHealthScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "infra_health_scorer.recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class InfrastructureHealthScorer:
         return record
 
     def get_health(self, record_id: str) -> HealthScoreRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_health_records(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class NetworkLatencyMapper:
     ) -> None:
         self._max_records = max_records
         self._max_acceptable_ms = max_acceptable_ms
-        self._records: list[LatencyRecord] = []
+        self._records: RecordStore[LatencyRecord] = RecordStore(self._max_records)
         self._paths: list[LatencyPath] = []
         logger.info(
             "network_latency.initialized",
@@ -116,8 +118,6 @@ class NetworkLatencyMapper:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "network_latency.latency_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class NetworkLatencyMapper:
         return record
 
     def get_latency(self, record_id: str) -> LatencyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_latencies(
         self,
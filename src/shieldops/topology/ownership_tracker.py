@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class ServiceOwnershipTracker:
     ) -> None:
         self._max_records = max_records
         self._max_orphan_days = max_orphan_days
-        self._records: list[OwnershipRecord] = []
+        self._records: RecordStore[OwnershipRecord] = RecordStore(self._max_records)
         self._transfers: list[OwnershipTransfer] = []
         logger.info(
             "ownership_tracker.initialized",
@@ -116,8 +118,6 @@ class ServiceOwnershipTracker:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "ownership_tracker.ownership_recorded",
             record_id=record.id,
@@ -128,10 +128,7 @@ class ServiceOwnershipTracker:
         return record
 
     def get_ownership(self, record_id: str) -> OwnershipRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_ownerships(
         self,
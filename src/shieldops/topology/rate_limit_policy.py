@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -88,7 +90,7 @@ class RateLimitPolicyManager:
     ) -> None:
         self._max_records = max_records
         self._violation_threshold = violation_threshold
-        self._records: list[RateLimitPolicyRecord] = []
+        self._records: RecordStore[RateLimitPolicyRecord] = RecordStore(self._max_records)
         self._violations: list[RateLimitViolation] = []
         logger.info(
             "rate_limit_policy.initialized",
@@ -116,8 +118,6 @@ class RateLimitPolicyManager:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "rate_limit_policy.policy_recorded",
             record_id=record.id,
@@ -127,10 +127,7 @@ class RateLimitPolicyManager:
         return record
 
     def get_policy(self, record_id: str) -> RateLimitPolicyRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_policies(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class ReliabilityAntiPatternDetector:
     ) -> None:
         self._max_records = max_records
         self._max_accepted_risks = max_accepted_risks
-        self._records: list[AntiPatternRecord] = []
+        self._records: RecordStore[AntiPatternRecord] = RecordStore(self._max_records)
         self._plans: list[RemediationPlan] = []
         logger.info(
             "reliability_antipattern.initialized",
@@ -119,8 +121,6 @@ class ReliabilityAntiPatternDetector:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "reliability_antipattern.pattern_recorded",
             record_id=record.id,
@@ -130,10 +130,7 @@ class ReliabilityAntiPatternDetector:
         return record
 
     def get_pattern(self, record_id: str) -> AntiPatternRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_patterns(
         self,
@@ -14,6 +14,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -97,7 +99,7 @@ class ServiceCatalogIntelligenceEngine:
     ) -> None:
         self._max_records = max_records
         self._health_threshold = health_threshold
-        self._records: list[ServiceCatalogRecord] = []
+        self._records: RecordStore[ServiceCatalogRecord] = RecordStore(self._max_records)
         self._analyses: list[ServiceCatalogAnalysis] = []
         logger.info(
             "service_catalog_intelligence_engine.init",
@@ -108,8 +110,6 @@ class ServiceCatalogIntelligenceEngine:
     def record_item(self, **kwargs: Any) -> ServiceCatalogRecord:
         """Record a service catalog entry."""
         record = ServiceCatalogRecord(**kwargs)
-        if len(self._records) >= self._max_records:
-            self._records = self._records[len(self._records) // 10 :]
         self._records.append(record)
         logger.info(
             "service_catalog_intelligence_engine.record_item",
@@ -120,10 +120,7 @@ class ServiceCatalogIntelligenceEngine:
 
     def process(self, key: str) -> ServiceCatalogAnalysis:
         """Process a record by ID."""
-        record = next(
-            (r for r in self._records if r.id == key),
-            None,
-        )
+        record = self._records.get(key)
         if not record:
             return ServiceCatalogAnalysis()
         score = self._compute_health(record)
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ServiceCommunicationAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._max_anomaly_rate_pct = max_anomaly_rate_pct
-        self._records: list[CommunicationRecord] = []
+        self._records: RecordStore[CommunicationRecord] = RecordStore(self._max_records)
         self._links: list[CommunicationLink] = []
         logger.info(
             "service_communication.initialized",
@@ -120,8 +122,6 @@ class ServiceCommunicationAnalyzer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_communication.recorded",
             record_id=record.id,
@@ -132,10 +132,7 @@ class ServiceCommunicationAnalyzer:
         return record
 
     def get_communication(self, record_id: str) -> CommunicationRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_communications(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -92,7 +94,7 @@ class ServiceDependencyRiskScorer:
     ) -> None:
         self._max_records = max_records
         self._max_risk_score = max_risk_score
-        self._records: list[DependencyRiskRecord] = []
+        self._records: RecordStore[DependencyRiskRecord] = RecordStore(self._max_records)
         self._factors: list[RiskFactor] = []
         logger.info(
             "service_dep_risk.initialized",
@@ -122,8 +124,6 @@ class ServiceDependencyRiskScorer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_dep_risk.recorded",
             record_id=record.id,
@@ -134,10 +134,7 @@ class ServiceDependencyRiskScorer:
         return record
 
     def get_risk(self, record_id: str) -> DependencyRiskRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_risks(
         self,
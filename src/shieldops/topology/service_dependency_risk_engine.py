@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class ServiceDependencyRiskEngine:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[DependencyRiskRecord] = []
+        self._records: RecordStore[DependencyRiskRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, DependencyRiskAnalysis] = {}
         logger.info(
             "service_dependency_risk_engine.init",
@@ -119,8 +121,6 @@ class ServiceDependencyRiskEngine:
             fallback_available=fallback_available,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "dependency_risk.record_added",
             record_id=record.id,
@@ -129,11 +129,7 @@ class ServiceDependencyRiskEngine:
         return record
 
     def process(self, key: str) -> DependencyRiskAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         deps = sum(1 for r in self._records if r.source_service == rec.source_service)
@@ -198,7 +194,7 @@ class ServiceDependencyRiskEngine:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("service_dependency_risk_engine.cleared")
         return {"status": "cleared"}
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class ServiceRoutingOptimizer:
     ) -> None:
         self._max_records = max_records
         self._latency_threshold_ms = latency_threshold_ms
-        self._records: list[RoutingRecord] = []
+        self._records: RecordStore[RoutingRecord] = RecordStore(self._max_records)
         self._optimizations: list[RoutingOptimization] = []
         logger.info(
             "service_routing_optimizer.initialized",
@@ -124,8 +126,6 @@ class ServiceRoutingOptimizer:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "service_routing_optimizer.routing_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class ServiceRoutingOptimizer:
         return record
 
     def get_routing(self, record_id: str) -> RoutingRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_routings(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -94,7 +96,7 @@ class TopologyChangeTracker:
     ) -> None:
         self._max_records = max_records
         self._max_high_impact_pct = max_high_impact_pct
-        self._records: list[TopologyChangeRecord] = []
+        self._records: RecordStore[TopologyChangeRecord] = RecordStore(self._max_records)
         self._assessments: list[ChangeImpactAssessment] = []
         logger.info(
             "topology_change_tracker.initialized",
@@ -124,8 +126,6 @@ class TopologyChangeTracker:
             team=team,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "topology_change_tracker.change_recorded",
             record_id=record.id,
@@ -136,10 +136,7 @@ class TopologyChangeTracker:
         return record
 
     def get_change(self, record_id: str) -> TopologyChangeRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_changes(
         self,
@@ -10,6 +10,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -90,7 +92,7 @@ class TrafficPatternAnalyzer:
     ) -> None:
         self._max_records = max_records
         self._error_threshold_pct = error_threshold_pct
-        self._records: list[TrafficRecord] = []
+        self._records: RecordStore[TrafficRecord] = RecordStore(self._max_records)
         self._anomalies: list[TrafficAnomalyRecord] = []
         logger.info(
             "traffic_pattern.initialized",
@@ -122,8 +124,6 @@ class TrafficPatternAnalyzer:
             details=details,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "traffic_pattern.traffic_recorded",
             record_id=record.id,
@@ -133,10 +133,7 @@ class TrafficPatternAnalyzer:
         return record
 
     def get_traffic(self, record_id: str) -> TrafficRecord | None:
-        for r in self._records:
-            if r.id == record_id:
-                return r
-        return None
+        return self._records.get(record_id)
 
     def list_traffic(
         self,
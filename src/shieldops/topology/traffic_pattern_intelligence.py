@@ -13,6 +13,8 @@ from typing import Any
 import structlog
 from pydantic import BaseModel, Field
 
+from shieldops.utils.record_store import RecordStore
+
 logger = structlog.get_logger()
 
 
@@ -89,7 +91,7 @@ class TrafficPatternIntelligence:
 
     def __init__(self, max_records: int = 200000) -> None:
         self._max_records = max_records
-        self._records: list[TrafficPatternRecord] = []
+        self._records: RecordStore[TrafficPatternRecord] = RecordStore(self._max_records)
         self._analyses: dict[str, TrafficPatternAnalysis] = {}
         logger.info(
             "traffic_pattern_intelligence.init",
@@ -118,8 +120,6 @@ class TrafficPatternIntelligence:
             deviation_pct=deviation_pct,
         )
         self._records.append(record)
-        if len(self._records) > self._max_records:
-            self._records = self._records[-self._max_records :]
         logger.info(
             "traffic_pattern.record_added",
             record_id=record.id,
@@ -128,11 +128,7 @@ class TrafficPatternIntelligence:
         return record
 
     def process(self, key: str) -> TrafficPatternAnalysis | dict[str, Any]:
-        rec = None
-        for r in self._records:
-            if r.id == key:
-                rec = r
-                break
+        rec = self._records.get(key)
         if rec is None:
             return {"status": "not_found", "key": key}
         samples = sum(1 for r in self._records if r.service == rec.service)
@@ -193,7 +189,7 @@ class TrafficPatternIntelligence:
         }
 
     def clear_data(self) -> dict[str, str]:
-        self._records = []
+        self._records.clear()
         self._analyses = {}
         logger.info("traffic_pattern_intelligence.cleared")
         return {"status": "cleared"}
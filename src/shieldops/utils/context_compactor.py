@@ -0,0 +1,304 @@
+"""Prompt-size budgeting and context compaction before LLM calls.
+
+Agent nodes build prompts from raw evidence (log lines, anomalies,
+findings) capped only by item count, so prompt size follows whatever the
+evidence happens to look like.  ``ContextBuilder`` instead assembles a
+prompt under a token budget:
+
+* Log lines are grouped into templates: numbers (but not HTTP status
+  codes), IDs, IPs, timestamps, paths and quoted values are masked, and
+  lines with the same template become one line with a count and the
+  most severe line as the example.
+* Every candidate line carries a score.  Lines are packed highest score
+  first until the budget is spent, then rendered in section order, and
+  each section notes how many of its lines were left out.
+* ``build()`` returns the prompt together with a ``CompactionReport``
+  giving the tokens sent, the tokens the uncompacted evidence would have
+  cost, and the difference.
+
+Token counts use the same ~4 characters/token estimate as
+``shieldops.utils.llm_metrics``.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import structlog
+from pydantic import BaseModel
+
+from shieldops.utils.llm_metrics import estimate_tokens
+
+logger = structlog.get_logger()
+
+# Base scores; callers add small bonuses (counts, deviations) on top.
+LEVEL_SCORES: dict[str, float] = {
+    "fatal": 40.0,
+    "critical": 40.0,
+    "error": 30.0,
+    "warning": 20.0,
+    "warn": 20.0,
+    "info": 10.0,
+    "debug": 5.0,
+}
+
+_MASKS: list[tuple[re.Pattern[str], str]] = [
+    (
+        re.compile(
+            r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+        ),
+        "<ts>",
+    ),
+    (re.compile(r"\b[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\b"), "<uuid>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<ip>"),
+    (re.compile(r"(?:/[\w.\-]+){2,}"), "<path>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{12,}\b"), "<hex>"),
+    (re.compile(r"\"[^\"]*\"|'[^']*'"), "<str>"),
+    # Pod-style suffixes: api-7d9f8b6c5-x2k4p
+    (re.compile(r"\b([a-z][\w]*(?:-[a-z][\w]*)*)-[a-z0-9]{8,10}-[a-z0-9]{5}\b"), r"\1-<pod>"),
+    # Bare 1xx-5xx are left alone: they are HTTP status codes, and a 500
+    # and a 404 must not share a template.
+    (
+        re.compile(
+            r"\b(?![1-5]\d\d\b(?!\.\d))\d+(?:\.\d+)?(?:ms|s|m|h|b|kb|mb|gb|ki|mi|gi|%)?\b",
+            re.IGNORECASE,
+        ),
+        "<n>",
+    ),
+]
+
+
+def log_template(message: str) -> str:
+    """Mask the variable parts of a log line so repeats compare equal."""
+    for pattern, replacement in _MASKS:
+        message = pattern.sub(replacement, message)
+    return " ".join(message.split())
+
+
+class LogTemplate(BaseModel):
+    """Log lines that share a template."""
+
+    template: str
+    example: str
+    level: str = "info"
+    count: int = 0
+
+    @property
+    def score(self) -> float:
+        return LEVEL_SCORES.get(self.level.lower(), 10.0) + min(math.log2(self.count + 1), 9) / 10
+
+    def render(self, max_chars: int = 300) -> str:
+        repeat = f" (x{self.count})" if self.count > 1 else ""
+        return f"[{self.level}]{repeat} {self.example[:max_chars]}"
+
+
+def dedup_log_entries(
+    entries: Iterable[dict[str, Any]], *, message_key: str = "message"
+) -> list[LogTemplate]:
+    """Group log entries by template, highest-signal group first.
+
+    Groups are ordered by level, then by count; a group's level and
+    example come from its most severe entry (the first one on a tie).
+    """
+    groups: dict[str, LogTemplate] = {}
+    for entry in entries:
+        message = str(entry.get(message_key, ""))
+        level = str(entry.get("level", "info") or "info").lower()
+        key = log_template(message)
+        group = groups.get(key)
+        if group is None:
+            groups[key] = LogTemplate(template=key, example=message, level=level, count=1)
+            continue
+        group.count += 1
+        if LEVEL_SCORES.get(level, 0) > LEVEL_SCORES.get(group.level, 0):
+            group.level = level
+            group.example = message
+    return sorted(groups.values(), key=lambda g: g.score, reverse=True)
+
+
+class CompactionReport(BaseModel):
+    """Token accounting for one compacted prompt."""
+
+    node: str = ""
+    budget_tokens: int = 0
+    prompt_tokens: int = 0
+    raw_tokens: int = 0
+    tokens_saved: int = 0
+    items_total: int = 0
+    items_dropped: int = 0
+    lines_deduplicated: int = 0
+
+
+class CompactedPrompt(NamedTuple):
+    text: str
+    report: CompactionReport
+
+
+@dataclass
+class _Item:
+    text: str
+    score: float
+    tokens: int
+    order: int
+
+
+@dataclass
+class _Section:
+    title: str
+    # Required lines (str) and candidate items, in insertion order
+    lines: list[str | _Item] = field(default_factory=list)
+
+    @property
+    def items(self) -> list[_Item]:
+        return [line for line in self.lines if isinstance(line, _Item)]
+
+
+_OMITTED = "... {} more omitted to fit the context budget"
+
+
+def _line_tokens(line: str) -> int:
+    return estimate_tokens(line) + 1  # + the newline
+
+
+class ContextBuilder:
+    """Assemble a prompt from scored lines under a token budget.
+
+    Args:
+        node: Name of the calling node, for the report and logs.
+        budget_tokens: Most tokens the prompt may use; required lines
+            are always kept, even past the budget.
+
+    Usage::
+
+        builder = ContextBuilder("analyze_logs", budget_tokens=3000)
+        builder.require(f"Alert: {name}")
+        builder.section("## Error Log Entries")
+        builder.add_logs(entries)
+        prompt, report = builder.build()
+    """
+
+    def __init__(self, node: str, budget_tokens: int) -> None:
+        self._node = node
+        self._budget = budget_tokens
+        self._sections: list[_Section] = [_Section(title="")]
+        self._order = 0
+        self._raw_tokens = 0
+        self._deduplicated = 0
+
+    def section(self, title: str) -> ContextBuilder:
+        """Start a section; it is rendered only if one of its lines is."""
+        self._sections.append(_Section(title=title))
+        return self
+
+    def require(self, *lines: str) -> ContextBuilder:
+        """Add lines to the current section that are always included."""
+        self._sections[-1].lines.extend(lines)
+        self._raw_tokens += sum(_line_tokens(line) for line in lines)
+        return self
+
+    def add(self, text: str, score: float, *, raw_tokens: int | None = None) -> ContextBuilder:
+        """Add a candidate line to the current section.
+
+        *raw_tokens* is what the evidence behind the line would cost
+        uncompacted (e.g. every log line a template stands for).
+        """
+        tokens = _line_tokens(text)
+        self._sections[-1].lines.append(_Item(text, score, tokens, self._order))
+        self._order += 1
+        self._raw_tokens += tokens if raw_tokens is None else raw_tokens
+        return self
+
+    def add_duplicate(self, text: str) -> ContextBuilder:
+        """Account for a line left out because an equivalent one was added."""
+        self._raw_tokens += _line_tokens(text)
+        self._deduplicated += 1
+        return self
+
+    def add_logs(
+        self,
+        entries: Iterable[dict[str, Any]],
+        *,
+        score_offset: float = 0.0,
+        max_chars: int = 300,
+        indent: str = "",
+    ) -> ContextBuilder:
+        """Add log entries to the current section, deduplicated into templates."""
+        entries = list(entries)
+        templates = dedup_log_entries(entries)
+        self._deduplicated += len(entries) - len(templates)
+        for group in templates:
+            raw = group.count * _line_tokens(f"[{group.level}] {group.example[:max_chars]}")
+            self.add(indent + group.render(max_chars), group.score + score_offset, raw_tokens=raw)
+        return self
+
+    def build(self) -> CompactedPrompt:
+        """Pack the highest-scoring lines into the budget and render the prompt."""
+        required_tokens = sum(
+            _line_tokens(line) for s in self._sections for line in s.lines if isinstance(line, str)
+        )
+        # Section titles with their blank line, and room for an omission note
+        required_tokens += sum(_line_tokens(s.title) + 1 for s in self._sections if s.title)
+        required_tokens += sum(
+            _line_tokens(_OMITTED.format(len(s.items))) for s in self._sections if s.items
+        )
+        remaining = self._budget - required_tokens
+
+        candidates = sorted(
+            (item for s in self._sections for item in s.items),
+            key=lambda item: (-item.score, item.order),
+        )
+        chosen: set[int] = set()
+        for item in candidates:
+            if item.tokens <= remaining:
+                chosen.add(item.order)
+                remaining -= item.tokens
+
+        lines: list[str] = []
+        items_total = dropped_total = 0
+        for section in self._sections:
+            body: list[str] = []
+            dropped = 0
+            for line in section.lines:
+                if isinstance(line, str):
+                    body.append(line)
+                elif line.order in chosen:
+                    body.append(line.text)
+                else:
+                    dropped += 1
+            items_total += len(section.items)
+            dropped_total += dropped
+            if not body:
+                continue
+            if lines and section.title:
+                lines.append("")
+            if section.title:
+                lines.append(section.title)
+            lines.extend(body)
+            if dropped:
+                lines.append(_OMITTED.format(dropped))
+
+        text = "\n".join(lines)
+        prompt_tokens = estimate_tokens(text)
+        report = CompactionReport(
+            node=self._node,
+            budget_tokens=self._budget,
+            prompt_tokens=prompt_tokens,
+            raw_tokens=self._raw_tokens,
+            tokens_saved=max(0, self._raw_tokens - prompt_tokens),
+            items_total=items_total,
+            items_dropped=dropped_total,
+            lines_deduplicated=self._deduplicated,
+        )
+        logger.info(
+            "llm_context_compacted",
+            node=self._node,
+            prompt_tokens=prompt_tokens,
+            raw_tokens=self._raw_tokens,
+            tokens_saved=report.tokens_saved,
+            items_dropped=dropped_total,
+        )
+        return CompactedPrompt(text, report)
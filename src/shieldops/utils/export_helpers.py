@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import csv
 import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
 
@@ -26,6 +28,38 @@ def dicts_to_csv(data: list[dict[str, Any]], fieldnames: list[str] | None = None
     return output.getvalue()
 
 
+async def iter_csv(
+    rows: AsyncIterable[dict[str, Any]], fieldnames: list[str] | None = None
+) -> AsyncIterator[str]:
+    """Stream *rows* as CSV text, one chunk per row.
+
+    Produces the same output as :func:`dicts_to_csv` without holding the
+    rows in memory: nothing (not even a header) is emitted for an empty
+    stream.
+    """
+    output = io.StringIO()
+    writer: csv.DictWriter[str] | None = None
+    async for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(
+                output, fieldnames=fieldnames or list(row.keys()), extrasaction="ignore"
+            )
+            writer.writeheader()
+        writer.writerow({k: sanitize_for_csv(v) for k, v in row.items()})
+        yield output.getvalue()
+        output.seek(0)
+        output.truncate()
+
+
+async def iter_json_array(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """Stream *rows* as a JSON array, one element per chunk."""
+    separator = "["
+    async for row in rows:
+        yield separator + json.dumps(row, default=str)
+        separator = ","
+    yield "[]" if separator == "[" else "]"
+
+
 def sanitize_for_csv(value: Any) -> str:
     """Sanitize a value for CSV output (prevent formula injection).
 
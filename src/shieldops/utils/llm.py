@@ -2,8 +2,21 @@
 
 Wraps langchain-anthropic with structured output support.
 All agent nodes use this client for analysis and reasoning.
+
+Responses are served from ``LLMResponseCache`` when the same prompt was
+answered recently (see ``shieldops.utils.llm_cache``).  Callers pass
+``agent_type`` so caching can be turned off per agent and usage is
+attributed; ``cache=False`` skips the cache for a single call.
+
+Calls that reach the provider are admitted by the shared ``LLMGateway``
+(see ``shieldops.utils.llm_gateway``), which enforces rate budgets,
+priorities and adaptive concurrency and may route overflow to a cheaper
+model.  Only responses from the configured model are cached.
 """
 
+import time
+import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
@@ -13,30 +26,153 @@ from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel
 
 from shieldops.config import settings
+from shieldops.utils.llm_cache import LLMResponseCache
+from shieldops.utils.llm_gateway import LLMGateway, resolve_priority
+from shieldops.utils.llm_metrics import estimate_tokens
 
 logger = structlog.get_logger()
 
-# Module-level singleton (lazy-initialized)
-_llm_instance: ChatAnthropic | None = None
-
-
-def get_llm() -> ChatAnthropic:
-    """Get or create the shared LLM client."""
-    global _llm_instance
-    if _llm_instance is None:
-        _llm_instance = ChatAnthropic(  # type: ignore[call-arg]
-            model=settings.anthropic_model,
+# Module-level singletons (lazy-initialized)
+_llm_instances: dict[str, ChatAnthropic] = {}
+_response_cache: LLMResponseCache | None = None
+_gateway: LLMGateway | None = None
+
+
+def get_llm(model: str | None = None) -> ChatAnthropic:
+    """Get or create the shared LLM client for *model* (default: configured model)."""
+    model = model or settings.anthropic_model
+    llm = _llm_instances.get(model)
+    if llm is None:
+        extra: dict[str, Any] = {}
+        if settings.llm_gateway_enabled:
+            extra["max_retries"] = 0  # the gateway coordinates retries
+        llm = _llm_instances[model] = ChatAnthropic(  # type: ignore[call-arg]
+            model=model,
             api_key=settings.anthropic_api_key,  # type: ignore[arg-type]
             max_tokens=4096,
             temperature=0.1,  # Low temp for deterministic infrastructure reasoning
+            **extra,
+        )
+    return llm
+
+
+def get_llm_gateway() -> LLMGateway | None:
+    """Get or create the shared LLM gateway (``None`` when disabled)."""
+    global _gateway
+    if _gateway is None and settings.llm_gateway_enabled:
+        _gateway = LLMGateway(
+            requests_per_minute=settings.llm_gateway_requests_per_minute,
+            tokens_per_minute=settings.llm_gateway_tokens_per_minute,
+            max_concurrency=settings.llm_gateway_max_concurrency,
+            min_concurrency=settings.llm_gateway_min_concurrency,
+            target_latency_ms=settings.llm_gateway_target_latency_ms,
+            max_retries=settings.llm_gateway_max_retries,
+            output_token_reserve=settings.llm_gateway_output_token_reserve,
+            overflow_queue_depth=settings.llm_gateway_overflow_queue_depth,
+        )
+    return _gateway
+
+
+def get_response_cache() -> LLMResponseCache | None:
+    """Get or create the shared LLM response cache (``None`` when disabled)."""
+    global _response_cache
+    if _response_cache is None and settings.llm_cache_enabled:
+        _response_cache = LLMResponseCache(
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            max_bytes=settings.llm_cache_max_bytes,
+            use_redis=settings.llm_cache_backend == "redis",
+            disabled_agents=settings.llm_cache_disabled_agents,
+            mask_volatile=settings.llm_cache_mask_volatile,
+        )
+    return _response_cache
+
+
+async def _admitted_call(
+    system_prompt: str,
+    user_prompt: str,
+    agent_type: str,
+    call: Callable[[str], Awaitable[Any]],
+) -> tuple[Any, str]:
+    """Run ``call(model)`` through the gateway; returns the value and model used."""
+    model = settings.anthropic_model
+    gateway = get_llm_gateway()
+    if gateway is None:
+        return await call(model), model
+
+    used = model
+
+    async def admitted(chosen: str) -> Any:
+        nonlocal used
+        used = chosen
+        return await call(chosen)
+
+    value = await gateway.run(
+        admitted,
+        model=model,
+        priority=resolve_priority(agent_type),
+        prompt_tokens=estimate_tokens(system_prompt) + estimate_tokens(user_prompt),
+    )
+    return value, used
+
+
+async def _cached_call(
+    system_prompt: str,
+    user_prompt: str,
+    schema: type[BaseModel] | None,
+    agent_type: str,
+    cache: bool,
+    call: Callable[[str], Awaitable[Any]],
+) -> Any:
+    """Run ``call(model)`` through the response cache and record the outcome.
+
+    *call* must return a JSON-serializable value.
+    """
+    response_cache = get_response_cache()
+    if not cache or response_cache is None or not response_cache.enabled_for(agent_type):
+        value, _ = await _admitted_call(system_prompt, user_prompt, agent_type, call)
+        return value
+
+    model = settings.anthropic_model
+    used_model = model
+
+    async def compute() -> Any:
+        nonlocal used_model
+        value, used_model = await _admitted_call(system_prompt, user_prompt, agent_type, call)
+        return value
+
+    key = response_cache.make_key(model, system_prompt, user_prompt, schema, agent_type=agent_type)
+    start = time.perf_counter()
+    value, hit = await response_cache.get_or_compute(
+        key, compute, cacheable=lambda: used_model == model
+    )
+    latency_ms = int((time.perf_counter() - start) * 1000)
+
+    router = response_cache.router
+    if router is not None:
+        router.record_usage(
+            request_id=str(uuid.uuid4()),
+            complexity=router.classify_complexity(
+                user_prompt, requires_structured_output=schema is not None
+            ),
+            model=used_model,
+            provider="anthropic",
+            input_tokens=estimate_tokens(system_prompt) + estimate_tokens(user_prompt),
+            output_tokens=estimate_tokens(str(value)),
+            latency_ms=latency_ms,
+            agent_type=agent_type,
+            cache_hit=hit,
         )
-    return _llm_instance
+    logger.debug("llm_cache_lookup", agent_type=agent_type, hit=hit, latency_ms=latency_ms)
+    return value
 
 
 async def llm_analyze(
     system_prompt: str,
     user_prompt: str,
     response_schema: type[BaseModel] | None = None,
+    *,
+    agent_type: str = "",
+    cache: bool = True,
 ) -> dict[str, Any]:
     """Run an LLM analysis with optional structured output.
 
@@ -44,11 +180,29 @@ async def llm_analyze(
         system_prompt: System instructions for the analysis task.
         user_prompt: The data/context to analyze.
         response_schema: If provided, parse response as this Pydantic model.
+        agent_type: Calling agent, for per-agent cache opt-out and usage.
+        cache: Set to ``False`` to always call the provider.
 
     Returns:
         Parsed dict from LLM response.
     """
-    llm = get_llm()
+
+    async def call(model: str) -> dict[str, Any]:
+        return await _llm_analyze(model, system_prompt, user_prompt, response_schema)
+
+    result: dict[str, Any] = await _cached_call(
+        system_prompt, user_prompt, response_schema, agent_type, cache, call
+    )
+    return result
+
+
+async def _llm_analyze(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: type[BaseModel] | None,
+) -> dict[str, Any]:
+    llm = get_llm(model)
     messages = [
         SystemMessage(content=system_prompt),
         HumanMessage(content=user_prompt),
@@ -73,15 +227,27 @@ async def llm_structured(
     system_prompt: str,
     user_prompt: str,
     schema: type[BaseModel],
+    *,
+    agent_type: str = "",
+    cache: bool = True,
 ) -> dict[str, Any] | BaseModel:
     """Run LLM analysis and return a validated Pydantic model.
 
-    Uses Claude's native tool_use for reliable structured output.
+    Uses Claude's native tool_use for reliable structured output.  A
+    cached response is re-validated against *schema*.
     """
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(schema)
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=user_prompt),
-    ]
-    return await structured_llm.ainvoke(messages)
+
+    async def call(model: str) -> dict[str, Any]:
+        llm = get_llm(model)
+        structured_llm = llm.with_structured_output(schema)
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt),
+        ]
+        result = await structured_llm.ainvoke(messages)
+        if isinstance(result, BaseModel):
+            return result.model_dump(mode="json")
+        return dict(result)
+
+    data = await _cached_call(system_prompt, user_prompt, schema, agent_type, cache, call)
+    return schema.model_validate(data)
@@ -0,0 +1,300 @@
+"""Deterministic response cache for ``llm_structured`` / ``llm_analyze``.
+
+Agents run at temperature 0.1, so the same prompt gets effectively the
+same answer.  During an alert storm the same flapping alert is
+investigated over and over with the same prompt.  This cache stores
+each response under a key derived from (scope, agent type, model, system
+prompt, normalized user prompt, response schema) and serves repeats
+without calling the provider.
+
+The scope is the organization the call is made for (see
+``llm_cache_scope``), so tenants never share entries.  Normalization
+collapses whitespace; masking ISO-8601 timestamps and UUIDs as well is
+opt-in, since in most prompts those are the resource, incident and org
+identifiers the answer is about.  The schema part of the key includes a
+digest of its JSON schema, so changing a response model invalidates the
+entries written for the old one.
+
+Entries live in a per-process LRU bounded by a byte budget and, with the
+Redis backend, also in Redis so every worker shares them.  Concurrent
+callers for the same key wait for one provider call.  Cache errors never
+fail an LLM call; they are logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from pydantic import BaseModel
+
+from shieldops.cache.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from shieldops.utils.llm_router import LLMRouter
+
+logger = structlog.get_logger()
+
+DEFAULT_TTL = 900
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+_ISO_TIMESTAMP_RE = re.compile(
+    r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?\b"
+)
+_UUID_RE = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+_SPACES_RE = re.compile(r"[ \t]+")
+
+_scope: ContextVar[str] = ContextVar("llm_cache_scope", default="")
+
+
+@contextlib.contextmanager
+def llm_cache_scope(scope: str | None) -> Iterator[None]:
+    """Key the cached LLM calls made inside the block by *scope* (an org id).
+
+    The value is a context variable, so it carries into tasks created
+    inside the block.  Calls made outside any scope share the ``""`` scope.
+    """
+    token = _scope.set(scope or "")
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def current_cache_scope() -> str:
+    return _scope.get()
+
+
+def normalize_prompt(text: str, *, mask_volatile: bool = False) -> str:
+    """Canonical form of a prompt for cache keying.
+
+    Runs of spaces/tabs collapse to one space, lines are stripped and
+    blank lines dropped.  With *mask_volatile*, timestamps and UUIDs are
+    replaced by ``<ts>`` and ``<uuid>``.
+    """
+    if mask_volatile:
+        text = _ISO_TIMESTAMP_RE.sub("<ts>", text)
+        text = _UUID_RE.sub("<uuid>", text)
+    lines = (_SPACES_RE.sub(" ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+@lru_cache(maxsize=512)
+def _schema_fingerprint(schema: type[BaseModel]) -> str:
+    digest = hashlib.sha256(
+        json.dumps(schema.model_json_schema(), sort_keys=True).encode()
+    ).hexdigest()[:16]
+    return f"{schema.__module__}.{schema.__qualname__}:{digest}"
+
+
+class LLMResponseCache:
+    """TTL + byte-budgeted cache of LLM responses, optionally shared via Redis.
+
+    Args:
+        ttl_seconds: How long a response is served from the cache.
+        max_bytes: Budget for the per-process store; least recently used
+            entries are evicted past it.
+        redis: Client for the shared backend; created from
+            ``settings.redis_url`` on first use when *use_redis* is set.
+        use_redis: Also read and write entries in Redis.
+        prefix: Redis key prefix.
+        disabled_agents: Agent types whose calls bypass the cache.
+        mask_volatile: Mask timestamps and UUIDs when normalizing prompts.
+            Only safe when no prompt identifies its subject by UUID or time.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        redis: Redis | None = None,
+        use_redis: bool = False,
+        prefix: str = "shieldops:llm:",
+        disabled_agents: Iterable[str] = (),
+        mask_volatile: bool = False,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._client: Redis | None = redis
+        self._use_redis = use_redis or redis is not None
+        self._prefix = prefix
+        self._disabled_agents = frozenset(disabled_agents)
+        self._mask_volatile = mask_volatile
+        # key -> (monotonic expiry, serialized response)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._flight = SingleFlight()
+        self._router: LLMRouter | None = None
+        self._hits = 0
+        self._misses = 0
+
+    # ── Configuration ────────────────────────────────────────────
+
+    @property
+    def router(self) -> LLMRouter | None:
+        """Router that cache hits and misses are recorded on, if any."""
+        return self._router
+
+    def attach_router(self, router: LLMRouter) -> None:
+        self._router = router
+
+    def enabled_for(self, agent_type: str) -> bool:
+        return self._ttl > 0 and agent_type not in self._disabled_agents
+
+    def make_key(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema: type[BaseModel] | None = None,
+        *,
+        agent_type: str = "",
+        scope: str | None = None,
+    ) -> str:
+        """Digest of (scope, agent type, model, system prompt, user prompt, schema).
+
+        The user prompt is normalized first; *scope* defaults to the one
+        set by ``llm_cache_scope``.
+        """
+        parts = (
+            current_cache_scope() if scope is None else scope,
+            agent_type,
+            model,
+            system_prompt,
+            normalize_prompt(user_prompt, mask_volatile=self._mask_volatile),
+            _schema_fingerprint(schema) if schema is not None else "",
+        )
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(part.encode())
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    # ── Lookup ───────────────────────────────────────────────────
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        cacheable: Callable[[], bool] | None = None,
+    ) -> tuple[Any, bool]:
+        """Return ``(value, hit)``; on a miss *compute* runs once per key.
+
+        Callers that wait on another caller's in-flight *compute* get
+        ``hit=True``: they did not call the provider themselves.
+        *compute* must return a JSON-serializable value.  If *cacheable*
+        is given and returns ``False`` after *compute*, the value is not
+        stored.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            self._hits += 1
+            return cached, True
+
+        computed = False
+
+        async def fill() -> Any:
+            nonlocal computed
+            computed = True
+            value = await compute()
+            if cacheable is None or cacheable():
+                await self.set(key, value)
+            return value
+
+        value = await self._flight.do(key, fill)
+        if computed:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value, not computed
+
+    async def get(self, key: str) -> Any | None:
+        raw = self._local_get(key)
+        if raw is None and self._use_redis:
+            try:
+                raw = await self._ensure_client().get(self._prefix + key)
+            except Exception as e:
+                logger.warning("llm_cache_redis_get_failed", error=str(e))
+                raw = None
+            if raw is not None:
+                self._local_put(key, raw)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any) -> None:
+        try:
+            raw = json.dumps(value, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as e:
+            logger.warning("llm_cache_unserializable", error=str(e))
+            return
+        self._local_put(key, raw)
+        if self._use_redis:
+            try:
+                await self._ensure_client().set(self._prefix + key, raw, ex=self._ttl)
+            except Exception as e:
+                logger.warning("llm_cache_redis_set_failed", error=str(e))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+        }
+
+    # ── Local store ──────────────────────────────────────────────
+
+    def _local_get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return raw
+
+    def _local_put(self, key: str, raw: bytes) -> None:
+        if len(raw) > self._max_bytes:
+            return
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (time.monotonic() + self._ttl, raw)
+        self._bytes += len(raw)
+        while self._bytes > self._max_bytes:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        _, raw = self._entries.pop(key)
+        self._bytes -= len(raw)
+
+    def _ensure_client(self) -> Redis:
+        if self._client is None:
+            import redis.asyncio as aioredis
+
+            from shieldops.config import settings
+
+            self._client = aioredis.from_url(settings.redis_url)  # type: ignore[no-untyped-call]
+        return self._client
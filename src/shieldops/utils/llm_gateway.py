@@ -0,0 +1,378 @@
+"""LLM Gateway — shared concurrency, rate budgets and priorities for LLM calls.
+
+Every agent node calls the provider through ``llm_structured`` /
+``llm_analyze``.  Without coordination an alert storm starts dozens of
+investigations that hit the provider's rate limits together and then all
+retry together.  The gateway sits in front of those calls and:
+
+* Keeps each model within a requests-per-minute and tokens-per-minute
+  budget (token buckets; tokens are estimated from the prompt plus a
+  fixed reserve for the response).
+* Queues calls by priority.  Critical-severity investigations go first,
+  background agents (learning, cost, ...) last; ties are served FIFO.
+* Adapts the number of calls in flight (AIMD): it grows by about one per
+  round of fast successful calls, shrinks by 10% when latency exceeds the
+  target and halves on a 429 (or an overload/5xx/connection error).  Such
+  an error also pauses the model for the provider's ``retry-after`` (or
+  an exponential backoff) and requeues the call at its priority, so
+  retries are spread out instead of stampeding.  The provider client's
+  own retries are turned off while the gateway is enabled.
+* When the primary model's queue is deeper than ``overflow_queue_depth``,
+  non-critical calls are routed to the cheapest tier from
+  ``LLMRouter.get_model`` if that model has room.
+
+Budgets are per process; size them as the provider limit divided by the
+number of workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import structlog
+
+if TYPE_CHECKING:
+    from shieldops.utils.llm_router import LLMRouter
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+
+class LLMPriority(IntEnum):
+    """Queue priority of an LLM call; lower values are served first."""
+
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    BACKGROUND = 3
+
+
+# Agents whose work can wait behind incident response.
+AGENT_PRIORITIES: dict[str, LLMPriority] = {
+    "learning": LLMPriority.BACKGROUND,
+    "cost": LLMPriority.BACKGROUND,
+    "playbook_generator": LLMPriority.BACKGROUND,
+    "enterprise_integration": LLMPriority.BACKGROUND,
+    "chatops": LLMPriority.HIGH,
+    "security_chat": LLMPriority.HIGH,
+}
+
+SEVERITY_PRIORITIES: dict[str, LLMPriority] = {
+    "critical": LLMPriority.CRITICAL,
+    "high": LLMPriority.HIGH,
+    "warning": LLMPriority.HIGH,
+}
+
+_priority: ContextVar[LLMPriority | None] = ContextVar("llm_priority", default=None)
+
+
+@contextlib.contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Run the LLM calls made inside the block at *priority*.
+
+    The value is a context variable, so it carries into the tasks a
+    LangGraph run creates for its nodes.
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def priority_for_severity(severity: str) -> LLMPriority:
+    return SEVERITY_PRIORITIES.get(severity.lower(), LLMPriority.NORMAL)
+
+
+def resolve_priority(agent_type: str) -> LLMPriority:
+    """Priority from ``llm_priority`` if set, else from the agent type."""
+    priority = _priority.get()
+    if priority is not None:
+        return priority
+    return AGENT_PRIORITIES.get(agent_type, LLMPriority.NORMAL)
+
+
+# Provider responses that mean "slow down": rate limited, overloaded or
+# briefly unavailable.  Connection errors and timeouts are treated alike.
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504, 529}
+_RETRYABLE_ERRORS = {"RateLimitError", "APIConnectionError", "APITimeoutError"}
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Seconds the provider asked us to wait if *exc* is retryable, else ``None``.
+
+    ``0.0`` means retryable without a hint; the gateway then backs off
+    exponentially.
+    """
+    status = getattr(exc, "status_code", None)
+    response = getattr(exc, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if status not in _RETRYABLE_STATUS and type(exc).__name__ not in _RETRYABLE_ERRORS:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("retry-after", 0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = max(1.0, float(per_minute))
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class _Lane:
+    """Budget, adaptive concurrency limit and priority queue for one model."""
+
+    def __init__(self, model: str, gateway: LLMGateway) -> None:
+        self.model = model
+        self._gw = gateway
+        self.requests = _TokenBucket(gateway.requests_per_minute)
+        self.tokens = _TokenBucket(gateway.tokens_per_minute)
+        self.limit = float(gateway.max_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.consecutive_throttles = 0
+        self._waiters: list[tuple[int, int, float, asyncio.Future[None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def has_room(self) -> bool:
+        return (
+            not self._waiters
+            and self.in_flight < int(self.limit)
+            and self.paused_until <= time.monotonic()
+        )
+
+    async def acquire(self, priority: LLMPriority, seq: int, tokens: float) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), seq, tokens, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # granted just as we were cancelled
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= max(1, int(self.limit)):
+                return
+            wait = max(
+                self.paused_until - now,
+                self.requests.wait_time(1, now),
+                self.tokens.wait_time(tokens, now),
+            )
+            if wait > 0:
+                self._wake_in(wait)
+                return
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self.in_flight += 1
+            future.set_result(None)
+
+    def _wake_in(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    # -- Feedback --
+
+    def on_success(self, latency_s: float) -> None:
+        self.consecutive_throttles = 0
+        gw = self._gw
+        if latency_s * 1000 > gw.target_latency_ms:
+            self.limit = max(gw.min_concurrency, self.limit * 0.9)
+        else:
+            self.limit = min(gw.max_concurrency, self.limit + 1 / max(self.limit, 1.0))
+
+    def on_throttled(self, retry_after: float | None) -> float:
+        gw = self._gw
+        self.consecutive_throttles += 1
+        self.limit = max(gw.min_concurrency, self.limit / 2)
+        backoff = retry_after or min(
+            gw.max_backoff_seconds, gw.base_backoff_seconds * 2 ** (self.consecutive_throttles - 1)
+        )
+        self.paused_until = max(self.paused_until, time.monotonic() + backoff)
+        return backoff
+
+
+class LLMGateway:
+    """Shared admission control for LLM calls.
+
+    Args:
+        requests_per_minute: Request budget per model.
+        tokens_per_minute: Input + reserved output token budget per model.
+        max_concurrency: Upper bound (and starting value) of calls in flight
+            per model.
+        min_concurrency: Lower bound the adaptive limit shrinks to.
+        target_latency_ms: Calls slower than this shrink the limit.
+        max_retries: Times a throttled call is requeued before the error
+            is raised to the caller.
+        output_token_reserve: Tokens charged per call for the response.
+        overflow_queue_depth: Queue depth on the primary model past which
+            non-critical calls may go to the cheaper tier; 0 disables.
+        router: Source of the overflow tier; overflow also requires
+            ``router.enabled``.
+    """
+
+    base_backoff_seconds = 1.0
+    max_backoff_seconds = 60.0
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: int = 50,
+        tokens_per_minute: int = 80000,
+        max_concurrency: int = 16,
+        min_concurrency: int = 2,
+        target_latency_ms: int = 20000,
+        max_retries: int = 3,
+        output_token_reserve: int = 1024,
+        overflow_queue_depth: int = 20,
+        router: LLMRouter | None = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.target_latency_ms = target_latency_ms
+        self.max_retries = max_retries
+        self.output_token_reserve = output_token_reserve
+        self.overflow_queue_depth = overflow_queue_depth
+        self._router = router
+        self._lanes: dict[str, _Lane] = {}
+        self._seq = itertools.count()
+        self._throttled = 0
+        self._overflowed = 0
+
+    def attach_router(self, router: LLMRouter) -> None:
+        self._router = router
+
+    def _lane(self, model: str) -> _Lane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = self._lanes[model] = _Lane(model, self)
+        return lane
+
+    def _choose_model(self, model: str, priority: LLMPriority) -> str:
+        primary = self._lane(model)
+        router = self._router
+        if (
+            priority == LLMPriority.CRITICAL
+            or self.overflow_queue_depth <= 0
+            or primary.queued < self.overflow_queue_depth
+            or router is None
+            or not router.enabled
+        ):
+            return model
+        from shieldops.utils.llm_router import TaskComplexity
+
+        cheaper = router.get_model(complexity=TaskComplexity.SIMPLE).model
+        if cheaper != model and self._lane(cheaper).has_room():
+            self._overflowed += 1
+            logger.info("llm_gateway_overflow", model=model, routed_to=cheaper)
+            return cheaper
+        return model
+
+    async def run(
+        self,
+        call: Callable[[str], Awaitable[T]],
+        *,
+        model: str,
+        priority: LLMPriority = LLMPriority.NORMAL,
+        prompt_tokens: int = 0,
+    ) -> T:
+        """Run ``call(model)`` once admitted; the model may be the overflow tier."""
+        seq = next(self._seq)
+        chosen = self._choose_model(model, priority)
+        lane = self._lane(chosen)
+        tokens = prompt_tokens + self.output_token_reserve
+        attempt = 0
+        while True:
+            await lane.acquire(priority, seq, tokens)
+            start = time.monotonic()
+            try:
+                result = await call(chosen)
+            except Exception as e:
+                retry_after = _retry_after(e)
+                if retry_after is None:
+                    raise
+                self._throttled += 1
+                backoff = lane.on_throttled(retry_after)
+                attempt += 1
+                logger.warning(
+                    "llm_gateway_throttled",
+                    model=chosen,
+                    attempt=attempt,
+                    backoff_s=round(backoff, 2),
+                    limit=int(lane.limit),
+                )
+                if attempt > self.max_retries:
+                    raise
+                continue
+            else:
+                lane.on_success(time.monotonic() - start)
+                return result
+            finally:
+                # After on_throttled/on_success, so the slot is handed out
+                # under the adjusted limit; also runs on cancellation.
+                lane.release()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "throttled": self._throttled,
+            "overflowed": self._overflowed,
+            "models": {
+                model: {
+                    "concurrency_limit": round(lane.limit, 2),
+                    "in_flight": lane.in_flight,
+                    "queued": lane.queued,
+                    "paused_for_s": round(max(0.0, lane.paused_until - time.monotonic()), 2),
+                }
+                for model, lane in self._lanes.items()
+            },
+        }
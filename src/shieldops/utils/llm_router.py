@@ -46,6 +46,8 @@ class UsageRecord(BaseModel):
     estimated_cost: float = 0.0
     latency_ms: int = 0
     agent_type: str = ""
+    cache_hit: bool | None = None  # None when the call did not go through the cache
+    cost_saved: float = 0.0
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
@@ -56,6 +58,10 @@ class UsageStats(BaseModel):
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     total_estimated_cost: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_hit_rate: float = 0.0
+    total_cost_saved: float = 0.0
     by_model: dict[str, dict[str, Any]] = Field(default_factory=dict)
     by_complexity: dict[str, dict[str, Any]] = Field(default_factory=dict)
     by_agent: dict[str, dict[str, Any]] = Field(default_factory=dict)
@@ -212,8 +218,13 @@ class LLMRouter:
         output_tokens: int = 0,
         latency_ms: int = 0,
         agent_type: str = "",
+        cache_hit: bool | None = None,
     ) -> UsageRecord:
-        """Record LLM usage for cost tracking."""
+        """Record LLM usage for cost tracking.
+
+        A cache hit made no provider call: it is recorded at zero cost,
+        with what the call would have cost in ``cost_saved``.
+        """
         tier = None
         for t in self._tiers.values():
             if t.model == model:
@@ -227,6 +238,10 @@ class LLMRouter:
                 + output_tokens / 1000 * tier.cost_per_1k_output
             )
 
+        cost_saved = 0.0
+        if cache_hit:
+            cost_saved, estimated_cost = estimated_cost, 0.0
+
         record = UsageRecord(
             request_id=request_id,
             complexity=complexity,
@@ -237,6 +252,8 @@ class LLMRouter:
             estimated_cost=round(estimated_cost, 6),
             latency_ms=latency_ms,
             agent_type=agent_type,
+            cache_hit=cache_hit,
+            cost_saved=round(cost_saved, 6),
         )
         self._usage_records.append(record)
 
@@ -245,14 +262,25 @@ class LLMRouter:
             model=model,
             complexity=complexity,
             cost=estimated_cost,
+            cache_hit=cache_hit,
         )
         return record
 
     def get_usage_stats(self) -> UsageStats:
-        """Get aggregated usage statistics."""
+        """Get aggregated usage statistics.
+
+        Cache hits are counted in ``cache_hits`` and ``total_cost_saved``
+        only; the other totals cover calls that reached a provider.
+        """
         stats = UsageStats()
 
         for record in self._usage_records:
+            if record.cache_hit:
+                stats.cache_hits += 1
+                stats.total_cost_saved += record.cost_saved
+                continue
+            if record.cache_hit is False:
+                stats.cache_misses += 1
             stats.total_requests += 1
             stats.total_input_tokens += record.input_tokens
             stats.total_output_tokens += record.output_tokens
@@ -286,6 +314,9 @@ class LLMRouter:
                 stats.by_agent[record.agent_type]["cost"] += record.estimated_cost
 
         stats.total_estimated_cost = round(stats.total_estimated_cost, 6)
+        stats.total_cost_saved = round(stats.total_cost_saved, 6)
+        lookups = stats.cache_hits + stats.cache_misses
+        stats.cache_hit_rate = round(stats.cache_hits / lookups, 4) if lookups else 0.0
         return stats
 
     def get_cost_breakdown(
@@ -296,10 +327,13 @@ class LLMRouter:
         records = self._usage_records
         if agent_type:
             records = [r for r in records if r.agent_type == agent_type]
+        cache_hits = sum(1 for r in records if r.cache_hit)
+        records = [r for r in records if not r.cache_hit]
 
         breakdown: dict[str, Any] = {
             "total_cost": 0.0,
             "total_requests": len(records),
+            "cache_hits": cache_hits,
             "by_model": {},
         }
 
@@ -0,0 +1,191 @@
+"""Bounded, indexed in-memory record store for the analysis engines.
+
+Most engines keep an append-only history of Pydantic records capped at
+``max_records``.  ``RecordStore`` is a drop-in replacement for the plain
+list they used: it reads like a list (``len``, iteration, indexing and
+slicing, oldest record first) but
+
+* evicts the oldest record in O(1) once full, instead of copying the
+  surviving ``max_records`` items on every append past capacity, and
+* keeps an id → record index, so lookups by id are O(1) instead of a
+  scan of the whole history.
+
+Optional secondary indexes map the value of a field (typically an enum
+such as ``severity`` or ``status``) to the records holding it, so
+filtered listings only touch matching records.  Indexed fields must not
+be reassigned after a record is appended; fields that engines update in
+place (``status`` on a tracked action, say) should not be indexed.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from operator import attrgetter
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class RecordStore(Sequence[T]):
+    """Ring buffer of records with O(1) lookup by id.
+
+    Args:
+        capacity: Maximum records kept; the oldest is evicted on overflow.
+            0 means unbounded, as ``max_records=0`` did for the plain lists.
+        key: Attribute holding the record id.
+        indexes: Attributes to keep secondary indexes on, for ``where()``.
+    """
+
+    __slots__ = ("_by_key", "_capacity", "_duplicates", "_get_key", "_indexes", "_items")
+
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        key: str = "id",
+        indexes: Iterable[str] = (),
+    ) -> None:
+        if capacity < 0:
+            raise ValueError(f"capacity must not be negative, got {capacity}")
+        self._capacity = capacity
+        self._get_key = attrgetter(key)
+        self._items: deque[T] = deque(maxlen=capacity or None)
+        self._by_key: dict[Any, T] = {}
+        # Ids appended more than once -> extra copies held.  Normally empty;
+        # lets get() keep the first-match semantics of the list scans it replaces.
+        self._duplicates: dict[Any, int] = {}
+        # field -> value -> records with that value, keyed by identity
+        # (dicts keep insertion order, so matches come back oldest first).
+        self._indexes: dict[str, dict[Any, dict[int, T]]] = {field: {} for field in indexes}
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    # -- Mutation --
+
+    def append(self, record: T) -> None:
+        """Add *record*, evicting the oldest record if the store is full."""
+        items = self._items
+        if len(items) == items.maxlen:
+            self._unindex(items[0])
+        items.append(record)
+        record_key = self._get_key(record)
+        if record_key in self._by_key:
+            self._duplicates[record_key] = self._duplicates.get(record_key, 0) + 1
+        else:
+            self._by_key[record_key] = record
+        for field, index in self._indexes.items():
+            index.setdefault(getattr(record, field), {})[id(record)] = record
+
+    def extend(self, records: Iterable[T]) -> None:
+        for record in records:
+            self.append(record)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._by_key.clear()
+        self._duplicates.clear()
+        for index in self._indexes.values():
+            index.clear()
+
+    def _unindex(self, record: T) -> None:
+        record_key = self._get_key(record)
+        extra = self._duplicates.get(record_key)
+        if extra:
+            # The evicted record is the oldest, so it is the one get() was
+            # returning; the next copy in insertion order takes its place.
+            if extra == 1:
+                del self._duplicates[record_key]
+            else:
+                self._duplicates[record_key] = extra - 1
+            self._by_key[record_key] = next(
+                r for r in self._items if r is not record and self._get_key(r) == record_key
+            )
+        else:
+            self._by_key.pop(record_key, None)
+        for field, index in self._indexes.items():
+            value = getattr(record, field)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(id(record), None)
+                if not bucket:
+                    del index[value]
+
+    # -- Lookup --
+
+    def get(self, record_key: Any, default: T | None = None) -> T | None:
+        """Return the record with id *record_key*, or *default*."""
+        return self._by_key.get(record_key, default)
+
+    def where(self, **filters: Any) -> list[T]:
+        """Records matching every ``field=value`` filter, oldest first.
+
+        The smallest matching bucket among the indexed filters is scanned;
+        without an indexed filter every record is.
+        """
+        candidates: Iterable[T] = self._items
+        smallest = len(self._items) + 1
+        for field, value in filters.items():
+            index = self._indexes.get(field)
+            if index is None:
+                continue
+            bucket = index.get(value)
+            if not bucket:
+                return []
+            if len(bucket) < smallest:
+                candidates, smallest = bucket.values(), len(bucket)
+        return [r for r in candidates if all(getattr(r, f) == v for f, v in filters.items())]
+
+    # -- Sequence protocol --
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._items)
+
+    def __contains__(self, record: object) -> bool:
+        try:
+            found = self._by_key.get(self._get_key(record))
+        except AttributeError:
+            return False
+        return found is record or (found is not None and record in self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if not isinstance(index, slice):
+            return self._items[index]
+        items = self._items
+        start, stop, step = index.indices(len(items))
+        if step != 1:
+            return list(items)[index]
+        if stop <= start:
+            return []
+        # Walk in from the nearer end: engines mostly read the newest records.
+        if start >= len(items) - stop:
+            tail = islice(reversed(items), len(items) - stop, len(items) - start)
+            return list(tail)[::-1]
+        return list(islice(items, start, stop))
+
+    def __eq__(self, other: object) -> bool:
+        # Compares like the list it replaces: equal to a list (or store)
+        # holding equal records in the same order.
+        if isinstance(other, RecordStore | list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RecordStore(len={len(self)}, capacity={self._capacity})"
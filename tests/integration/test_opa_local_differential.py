@@ -0,0 +1,165 @@
+"""Differential tests: local policy evaluation must agree with a real OPA server.
+
+Every input in a generated grid (action x environment x risk level x
+approval context, plus malformed inputs) is evaluated by the in-process
+decision table and by ``PolicyEngine`` in HTTP mode against OPA, both one
+action at a time (``allow``) and as one batch (``batch_allow``).
+
+OPA comes from ``SHIELDOPS_OPA_TEST_URL`` if set, otherwise an ``opa``
+binary on ``PATH`` is started on the repo's ``playbooks/policies``.  The
+tests are skipped when neither is available.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import shutil
+import socket
+import subprocess
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from shieldops.models.base import Environment, RemediationAction, RiskLevel
+from shieldops.policy.opa.client import PolicyEngine
+from shieldops.policy.opa.local import POLICIES_DIR, LocalPolicyEvaluator
+
+pytestmark = pytest.mark.integration
+
+ACTIONS = [
+    # read-only, production-safe, high-impact, forbidden and unknown actions
+    "query_logs",
+    "list_resources",
+    "restart_pod",
+    "scale_horizontal",
+    "trigger_renewal",
+    "rollback_deployment",
+    "rotate_credentials",
+    "drain_node",
+    "delete_namespace",
+    "custom_action",
+]
+CONTEXTS: list[dict[str, Any]] = [
+    {},
+    {"approval_status": "approved"},
+    {"approval_status": "pending"},
+    {"approval_status": True},
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+@pytest.fixture(scope="module")
+def opa_url() -> Iterator[str]:
+    url = os.environ.get("SHIELDOPS_OPA_TEST_URL")
+    if url:
+        yield url.rstrip("/")
+        return
+
+    binary = shutil.which("opa")
+    if binary is None:
+        pytest.skip("No OPA server: set SHIELDOPS_OPA_TEST_URL or install the opa binary")
+    port = _free_port()
+    proc = subprocess.Popen(  # noqa: S603
+        [binary, "run", "--server", f"--addr=127.0.0.1:{port}", str(POLICIES_DIR)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                if httpx.get(f"{url}/health", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                pytest.fail("OPA server did not become healthy")
+            time.sleep(0.1)
+        yield url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def _grid() -> list[RemediationAction]:
+    actions = []
+    for i, (action_type, env, risk, ctx) in enumerate(
+        itertools.product(ACTIONS, Environment, RiskLevel, range(len(CONTEXTS)))
+    ):
+        actions.append(
+            RemediationAction(
+                id=f"diff-{i}",
+                action_type=action_type,
+                target_resource="default/app",
+                environment=env,
+                risk_level=risk,
+                parameters={"context_variant": ctx},
+                description="differential test",
+            )
+        )
+    return actions
+
+
+def _context(action: RemediationAction) -> dict[str, Any]:
+    return CONTEXTS[action.parameters["context_variant"]]
+
+
+class TestLocalMatchesOpa:
+    @pytest.mark.asyncio
+    async def test_single_decisions_agree(self, opa_url):
+        http_engine = PolicyEngine(opa_url=opa_url)
+        local_engine = PolicyEngine(local_evaluator=LocalPolicyEvaluator(POLICIES_DIR))
+        mismatches = []
+        try:
+            for action in _grid():
+                ctx = _context(action)
+                remote = await http_engine.evaluate(action, "diff-agent", ctx)
+                local = await local_engine.evaluate(action, "diff-agent", ctx)
+                if remote.reasons:
+                    pytest.fail(f"OPA evaluation failed: {remote.reasons}")
+                if remote.allowed != local.allowed:
+                    mismatches.append((action.action_type, action.environment, action.risk_level))
+        finally:
+            await http_engine.close()
+            await local_engine.close()
+        assert mismatches == []
+
+    @pytest.mark.asyncio
+    async def test_batch_decisions_agree(self, opa_url):
+        grid = _grid()
+        http_engine = PolicyEngine(opa_url=opa_url)
+        local = LocalPolicyEvaluator(POLICIES_DIR)
+        try:
+            for ctx in CONTEXTS:
+                remote = await http_engine.evaluate_many(grid, "diff-agent", ctx)
+                inputs = [PolicyEngine._build_input(a, "diff-agent", ctx) for a in grid]
+                assert [d.allowed for d in remote] == local.allow_many(inputs)
+        finally:
+            await http_engine.close()
+
+    @pytest.mark.parametrize(
+        "input_data",
+        [
+            {},
+            {"action": "query_logs"},
+            {"environment": "development", "risk_level": "low"},
+            {"environment": "production", "risk_level": "high", "context": "approved"},
+            {"environment": "production", "risk_level": "high", "context": {"approval_status": 1}},
+            {"action": 7, "environment": "staging", "risk_level": "low"},
+        ],
+    )
+    def test_malformed_inputs_agree(self, opa_url, input_data):
+        response = httpx.post(f"{opa_url}/v1/data/shieldops/allow", json={"input": input_data})
+        response.raise_for_status()
+        remote = response.json().get("result", False)
+        assert LocalPolicyEvaluator(POLICIES_DIR).allow(input_data) is remote
@@ -0,0 +1,133 @@
+"""Event serialization benchmark: JSON (Pydantic) vs schema-versioned msgpack.
+
+Encodes and decodes a representative alert event both ways, plus the lazy
+header-only decode used when consumers filter by ``event_type``.
+
+Run the comparison report:
+    PYTHONPATH=src python -m tests.performance.test_event_serialization_benchmark
+
+Run the micro-benchmarks:
+    pytest tests/performance/test_event_serialization_benchmark.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from shieldops.messaging.topics import (
+    EventEncoding,
+    EventEnvelope,
+    decode_event_lazy,
+    deserialize_event,
+    encode_event,
+    serialize_event,
+)
+
+ITERATIONS = 20_000
+
+
+def sample_event() -> EventEnvelope:
+    """An ``alert.triggered`` event shaped like the Prometheus webhook payload."""
+    return EventEnvelope(
+        event_type="alert.triggered",
+        source="prometheus",
+        correlation_id="inv-7f3a9c",
+        payload={
+            "alert_id": "alert-20250301-0042",
+            "alert_name": "HighCPUUsage",
+            "severity": "critical",
+            "resource_id": "deployment/payments-api",
+            "description": "CPU usage above 95% for 5 minutes on payments-api pods",
+            "labels": {
+                "namespace": "payments",
+                "cluster": "prod-us-east-1",
+                "team": "platform",
+                "pod": "payments-api-6d9f8b7c4-x2k9p",
+            },
+            "values": [91.2, 93.8, 95.1, 96.4, 97.0],
+            "threshold": 95.0,
+        },
+    )
+
+
+def _ops_per_sec(fn: Callable[[], Any], iterations: int = ITERATIONS) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def measure(iterations: int = ITERATIONS) -> dict[str, dict[str, float]]:
+    """Encode/decode throughput (ops/s) and frame size for each format."""
+    event = sample_event()
+    json_frame = serialize_event(event)
+    binary_frame = encode_event(event, EventEncoding.MSGPACK)
+    return {
+        "json": {
+            "bytes": len(json_frame),
+            "encode": _ops_per_sec(lambda: serialize_event(event), iterations),
+            "decode": _ops_per_sec(lambda: deserialize_event(json_frame), iterations),
+        },
+        "msgpack": {
+            "bytes": len(binary_frame),
+            "encode": _ops_per_sec(lambda: encode_event(event, "msgpack"), iterations),
+            "decode": _ops_per_sec(lambda: deserialize_event(binary_frame), iterations),
+            "header_only": _ops_per_sec(
+                lambda: decode_event_lazy(binary_frame).event_type, iterations
+            ),
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Size and relative speed (plain assertions, no benchmark fixture needed)
+# ---------------------------------------------------------------------------
+
+
+class TestEventFrameSize:
+    def test_binary_frame_is_smaller(self):
+        event = sample_event()
+        assert len(encode_event(event, "msgpack")) < 0.85 * len(serialize_event(event))
+
+    def test_binary_decode_faster_than_json(self):
+        results = measure(iterations=2_000)
+        assert results["msgpack"]["decode"] > results["json"]["decode"]
+        assert results["msgpack"]["header_only"] > results["msgpack"]["decode"]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestEventSerializationBenchmarks:
+    def test_json_encode_speed(self, benchmark):
+        event = sample_event()
+        benchmark(serialize_event, event)
+
+    def test_msgpack_encode_speed(self, benchmark):
+        event = sample_event()
+        benchmark(encode_event, event, EventEncoding.MSGPACK)
+
+    def test_json_decode_speed(self, benchmark):
+        frame = serialize_event(sample_event())
+        benchmark(deserialize_event, frame)
+
+    def test_msgpack_decode_speed(self, benchmark):
+        frame = encode_event(sample_event(), EventEncoding.MSGPACK)
+        benchmark(deserialize_event, frame)
+
+    def test_msgpack_header_only_decode_speed(self, benchmark):
+        frame = encode_event(sample_event(), EventEncoding.MSGPACK)
+        benchmark(lambda: decode_event_lazy(frame).event_type)
+
+
+if __name__ == "__main__":
+    results = measure()
+    print(f"alert.triggered event, {ITERATIONS:,} iterations per measurement")
+    print(f"{'format':<10}{'bytes':>8}{'encode/s':>12}{'decode/s':>12}{'header/s':>12}")
+    for name, r in results.items():
+        header = f"{r['header_only']:>12,.0f}" if "header_only" in r else f"{'n/a':>12}"
+        print(f"{name:<10}{r['bytes']:>8.0f}{r['encode']:>12,.0f}{r['decode']:>12,.0f}{header}")
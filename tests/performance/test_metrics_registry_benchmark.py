@@ -0,0 +1,150 @@
+"""MetricsRegistry hot-path benchmark: locked tuple lists vs sharded arrays.
+
+Times one request's worth of recording -- a counter increment plus a
+duration histogram observation -- three ways:
+
+* ``legacy`` -- the previous registry: labels re-encoded on every call and
+  the histogram rebuilt as a fresh list of ``(le, count)`` tuples under
+  one global lock.
+* ``dict api`` -- ``inc_counter`` / ``observe_histogram`` on the current
+  registry (handle lookup, then a per-thread shard write).
+* ``handles`` -- pre-resolved ``counter()`` / ``histogram()`` handles, the
+  path ``record_http_request`` takes.
+
+Run the comparison report:
+    PYTHONPATH=src python -m tests.performance.test_metrics_registry_benchmark
+
+Run the micro-benchmarks:
+    pytest tests/performance/test_metrics_registry_benchmark.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from shieldops.api.middleware.metrics import DEFAULT_BUCKETS, MetricsRegistry
+
+ITERATIONS = 50_000
+
+COUNTER_LABELS = {"method": "GET", "path_template": "/api/v1/agents", "status_code": "200"}
+HISTOGRAM_LABELS = {"method": "GET", "path_template": "/api/v1/agents"}
+
+
+class _LegacyRegistry:
+    """The recording path ``MetricsRegistry`` used before sharding."""
+
+    def __init__(self) -> None:
+        self._mu = threading.Lock()
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, list[tuple[float, int]]] = {}
+        self.sums: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+
+    @staticmethod
+    def _label_key(name: str, labels: dict[str, str]) -> str:
+        sorted_labels = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+        return f"{name}|{sorted_labels}"
+
+    def inc_counter(self, name: str, labels: dict[str, str]) -> None:
+        key = self._label_key(name, labels)
+        with self._mu:
+            self.counters[key] = self.counters.get(key, 0) + 1
+
+    def observe_histogram(self, name: str, labels: dict[str, str], value: float) -> None:
+        key = self._label_key(name, labels)
+        with self._mu:
+            if key not in self.histograms:
+                self.histograms[key] = [(b, 0) for b in DEFAULT_BUCKETS] + [(float("inf"), 0)]
+                self.sums[key] = 0.0
+                self.counts[key] = 0
+            self.histograms[key] = [
+                (le, count + 1 if value <= le else count) for le, count in self.histograms[key]
+            ]
+            self.sums[key] += value
+            self.counts[key] += 1
+
+
+def _legacy_record() -> Callable[[], None]:
+    r = _LegacyRegistry()
+
+    def record() -> None:
+        r.inc_counter("http_requests_total", COUNTER_LABELS)
+        r.observe_histogram("http_request_duration_seconds", HISTOGRAM_LABELS, 0.042)
+
+    return record
+
+
+def _dict_api_record() -> Callable[[], None]:
+    r = MetricsRegistry()
+
+    def record() -> None:
+        r.inc_counter("http_requests_total", COUNTER_LABELS)
+        r.observe_histogram("http_request_duration_seconds", HISTOGRAM_LABELS, 0.042)
+
+    return record
+
+
+def _handle_record() -> Callable[[], None]:
+    r = MetricsRegistry()
+
+    def record() -> None:
+        r.counter("http_requests_total", COUNTER_LABELS).inc()
+        r.histogram("http_request_duration_seconds", HISTOGRAM_LABELS).observe(0.042)
+
+    return record
+
+
+def _ns_per_op(fn: Callable[[], None], iterations: int) -> float:
+    for _ in range(min(iterations, 1_000)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def measure(iterations: int = ITERATIONS) -> dict[str, float]:
+    """Nanoseconds to record one request's counter + histogram sample."""
+    return {
+        "legacy": _ns_per_op(_legacy_record(), iterations),
+        "dict api": _ns_per_op(_dict_api_record(), iterations),
+        "handles": _ns_per_op(_handle_record(), iterations),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Relative speed (plain assertions, no benchmark fixture needed)
+# ---------------------------------------------------------------------------
+
+
+class TestRegistryRecordingSpeed:
+    def test_sharded_registry_faster_than_legacy(self):
+        results = measure(iterations=5_000)
+        assert results["dict api"] < results["legacy"]
+        assert results["handles"] < results["legacy"]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestRegistryBenchmarks:
+    def test_legacy_record_speed(self, benchmark: Any):
+        benchmark(_legacy_record())
+
+    def test_dict_api_record_speed(self, benchmark: Any):
+        benchmark(_dict_api_record())
+
+    def test_handle_record_speed(self, benchmark: Any):
+        benchmark(_handle_record())
+
+
+if __name__ == "__main__":
+    results = measure()
+    print(f"counter + histogram per request, {ITERATIONS:,} iterations")
+    for name, ns in results.items():
+        print(f"{name:<10}{ns:>10,.0f} ns/request")
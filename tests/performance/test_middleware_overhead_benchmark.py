@@ -0,0 +1,240 @@
+"""Middleware stack overhead benchmark: BaseHTTPMiddleware vs pure ASGI.
+
+Drives a trivial ``GET /ping`` route through the ASGI interface directly
+(no HTTP client or socket in the loop) and reports the per-request cost
+each middleware stack adds on top of the bare app:
+
+* ``basehttp x12`` -- twelve ``BaseHTTPMiddleware`` layers that each set a
+  response header, the shape of the stack ``create_app()`` used to build.
+* ``asgi x12`` -- the same twelve layers written as pure ASGI callables.
+* ``production`` -- the stack ``create_app()`` installs now: the fused
+  ``RequestContextMiddleware`` plus the remaining pure-ASGI layers, with
+  an in-memory stand-in for Redis behind the rate limiter.
+
+Run the comparison report:
+    PYTHONPATH=src python -m tests.performance.test_middleware_overhead_benchmark
+
+Run the micro-benchmarks:
+    pytest tests/performance/test_middleware_overhead_benchmark.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import structlog
+from starlette.applications import Starlette
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shieldops.api.auth.service import create_access_token
+from shieldops.api.middleware import (
+    APIVersionMiddleware,
+    BillingEnforcementMiddleware,
+    ErrorHandlerMiddleware,
+    GracefulShutdownMiddleware,
+    RateLimitMiddleware,
+    RequestContextMiddleware,
+    SecurityHeadersMiddleware,
+    UsageTrackerMiddleware,
+)
+from shieldops.api.middleware.idempotency import IdempotencyMiddleware
+
+REQUESTS = 5_000
+LAYERS = 12
+
+
+async def _ping(request: Request) -> Response:
+    return PlainTextResponse("pong")
+
+
+def _bare_app() -> Starlette:
+    return Starlette(routes=[Route("/ping", _ping)])
+
+
+class _HeaderLayer(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        response.headers["X-Layer"] = "1"
+        return response
+
+
+class _AsgiHeaderLayer:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Layer"] = "1"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class _InMemoryRedis:
+    """Counter that never trips the limit, so every request reaches the route."""
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[int]:
+        return [1, 0]
+
+
+def basehttp_app(layers: int = LAYERS) -> Starlette:
+    app = _bare_app()
+    for _ in range(layers):
+        app.add_middleware(_HeaderLayer)
+    return app
+
+
+def asgi_app(layers: int = LAYERS) -> Starlette:
+    app = _bare_app()
+    for _ in range(layers):
+        app.add_middleware(_AsgiHeaderLayer)
+    return app
+
+
+def production_app() -> Starlette:
+    """The middleware ``create_app()`` installs, in the same order."""
+    app = _bare_app()
+    app.add_middleware(ErrorHandlerMiddleware)
+    app.add_middleware(IdempotencyMiddleware)
+    app.add_middleware(RateLimitMiddleware, redis=_InMemoryRedis())
+    app.add_middleware(BillingEnforcementMiddleware)
+    app.add_middleware(UsageTrackerMiddleware)
+    app.add_middleware(APIVersionMiddleware)
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestContextMiddleware)
+    app.add_middleware(GracefulShutdownMiddleware)
+    return app
+
+
+def _scope() -> Scope:
+    token = create_access_token(subject="bench-user", role="operator")
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {token}".encode()),
+            (b"x-organization-id", b"org-bench"),
+        ],
+        "client": ("10.0.0.1", 40000),
+        "server": ("bench", 80),
+    }
+
+
+async def _drive(app: ASGIApp, requests: int) -> float:
+    """Send *requests* requests through *app*; return seconds elapsed."""
+    template = _scope()
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        return None
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(template), receive, send)
+    return time.perf_counter() - start
+
+
+@contextmanager
+def _quiet_logging() -> Iterator[None]:
+    # Access logs would dominate the measurement; production ships them
+    # asynchronously, so drop them here.
+    previous = structlog.get_config()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    try:
+        yield
+    finally:
+        structlog.configure(**previous)
+
+
+def measure(requests: int = REQUESTS) -> dict[str, float]:
+    """Per-request overhead (microseconds) of each stack over the bare app."""
+    apps: dict[str, Any] = {
+        "bare": _bare_app(),
+        f"basehttp x{LAYERS}": basehttp_app(),
+        f"asgi x{LAYERS}": asgi_app(),
+        "production": production_app(),
+    }
+
+    async def run() -> dict[str, float]:
+        timings: dict[str, float] = {}
+        for name, app in apps.items():
+            await _drive(app, min(requests, 500))  # warm-up
+            timings[name] = await _drive(app, requests) / requests * 1e6
+        return timings
+
+    with _quiet_logging():
+        timings = asyncio.run(run())
+    bare = timings.pop("bare")
+    return {"bare": bare, **{name: t - bare for name, t in timings.items()}}
+
+
+# ---------------------------------------------------------------------------
+# Relative overhead (plain assertions, no benchmark fixture needed)
+# ---------------------------------------------------------------------------
+
+
+class TestMiddlewareOverhead:
+    def test_pure_asgi_layers_cheaper_than_basehttp(self):
+        results = measure(requests=500)
+        assert results[f"asgi x{LAYERS}"] < results[f"basehttp x{LAYERS}"] / 2
+
+    def test_production_stack_cheaper_than_basehttp_chain(self):
+        results = measure(requests=500)
+        assert results["production"] < results[f"basehttp x{LAYERS}"]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+
+def _bench_request(benchmark: Any, app: ASGIApp) -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        with _quiet_logging():
+            benchmark(lambda: loop.run_until_complete(_drive(app, 1)))
+    finally:
+        loop.close()
+
+
+class TestMiddlewareBenchmarks:
+    def test_bare_request_speed(self, benchmark):
+        _bench_request(benchmark, _bare_app())
+
+    def test_basehttp_stack_request_speed(self, benchmark):
+        _bench_request(benchmark, basehttp_app())
+
+    def test_asgi_stack_request_speed(self, benchmark):
+        _bench_request(benchmark, asgi_app())
+
+    def test_production_stack_request_speed(self, benchmark):
+        _bench_request(benchmark, production_app())
+
+
+if __name__ == "__main__":
+    results = measure()
+    print(f"GET /ping, {REQUESTS:,} requests per stack (ASGI direct, no client)")
+    print(f"{'bare app':<16}{results.pop('bare'):>10.1f} us/request")
+    for name, overhead in results.items():
+        print(f"{name:<16}{overhead:>+10.1f} us/request overhead")
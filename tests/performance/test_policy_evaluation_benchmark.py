@@ -0,0 +1,173 @@
+"""PolicyEngine latency: HTTP to OPA vs the in-process decision table.
+
+Times ``PolicyEngine.evaluate`` for one action and ``evaluate_many`` for a
+100-action remediation plan in both evaluation modes.  The decision cache
+and rate limiter are off so every call reaches the evaluator.
+
+HTTP mode talks to ``SHIELDOPS_OPA_TEST_URL`` if set.  Otherwise it talks
+to a stub server on localhost that answers every query without evaluating
+any Rego, so the HTTP numbers are a lower bound on what a real OPA
+sidecar costs.
+
+Run the comparison report:
+    PYTHONPATH=src python -m tests.performance.test_policy_evaluation_benchmark
+
+Run the micro-benchmarks:
+    pytest tests/performance/test_policy_evaluation_benchmark.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import structlog
+
+from shieldops.models.base import Environment, RemediationAction, RiskLevel
+from shieldops.policy.opa.client import PolicyEngine
+from shieldops.policy.opa.local import POLICIES_DIR, LocalPolicyEvaluator
+
+ITERATIONS = 500
+PLAN_SIZE = 100
+
+ACTION = RemediationAction(
+    id="bench-act",
+    action_type="restart_pod",
+    target_resource="default/api",
+    environment=Environment.PRODUCTION,
+    risk_level=RiskLevel.MEDIUM,
+    description="Benchmark action",
+)
+PLAN = [ACTION.model_copy(update={"id": f"bench-act-{i}"}) for i in range(PLAN_SIZE)]
+
+
+async def _stub_opa(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 server answering like OPA's data API."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            body = json.loads(await reader.readexactly(length))
+            batch = body["input"].get("batch") if isinstance(body["input"], dict) else None
+            payload = json.dumps({"result": [True] * len(batch) if batch else True}).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                + f"content-length: {len(payload)}\r\n\r\n".encode()
+                + payload
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _us_per_call(fn: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    for _ in range(min(iterations, 50)):
+        await fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def _measure(iterations: int) -> tuple[dict[str, float], str]:
+    server = None
+    opa_url = os.environ.get("SHIELDOPS_OPA_TEST_URL", "")
+    if opa_url:
+        target = opa_url
+    else:
+        server = await asyncio.start_server(_stub_opa, "127.0.0.1", 0)
+        opa_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        target = "stub server"
+
+    http_engine = PolicyEngine(opa_url=opa_url)
+    local_engine = PolicyEngine(local_evaluator=LocalPolicyEvaluator(POLICIES_DIR))
+    try:
+        results = {
+            "http evaluate": await _us_per_call(
+                lambda: http_engine.evaluate(ACTION, "bench"), iterations
+            ),
+            "local evaluate": await _us_per_call(
+                lambda: local_engine.evaluate(ACTION, "bench"), iterations
+            ),
+            f"http plan x{PLAN_SIZE}": await _us_per_call(
+                lambda: http_engine.evaluate_many(PLAN, "bench"), iterations // 10
+            ),
+            f"local plan x{PLAN_SIZE}": await _us_per_call(
+                lambda: local_engine.evaluate_many(PLAN, "bench"), iterations // 10
+            ),
+        }
+    finally:
+        await http_engine.close()
+        await local_engine.close()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    return results, target
+
+
+@contextmanager
+def _quiet_logging() -> Iterator[None]:
+    # The per-decision info log would dominate the local-mode numbers.
+    previous = structlog.get_config()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    try:
+        yield
+    finally:
+        structlog.configure(**previous)
+
+
+def measure(iterations: int = ITERATIONS) -> tuple[dict[str, float], str]:
+    """Microseconds per call for each mode, and what HTTP mode talked to."""
+    with _quiet_logging():
+        return asyncio.run(_measure(iterations))
+
+
+# ---------------------------------------------------------------------------
+# Relative speed (plain assertions, no benchmark fixture needed)
+# ---------------------------------------------------------------------------
+
+
+class TestPolicyEvaluationSpeed:
+    def test_local_mode_faster_than_http(self):
+        results, _ = measure(iterations=100)
+        assert results["local evaluate"] < results["http evaluate"]
+        assert results[f"local plan x{PLAN_SIZE}"] < results[f"http plan x{PLAN_SIZE}"]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestPolicyEvaluationBenchmarks:
+    def test_local_evaluate_speed(self, benchmark: Any):
+        engine = PolicyEngine(local_evaluator=LocalPolicyEvaluator(POLICIES_DIR))
+        loop = asyncio.new_event_loop()
+        benchmark(lambda: loop.run_until_complete(engine.evaluate(ACTION, "bench")))
+        loop.run_until_complete(engine.close())
+        loop.close()
+
+    def test_local_plan_speed(self, benchmark: Any):
+        engine = PolicyEngine(local_evaluator=LocalPolicyEvaluator(POLICIES_DIR))
+        loop = asyncio.new_event_loop()
+        benchmark(lambda: loop.run_until_complete(engine.evaluate_many(PLAN, "bench")))
+        loop.run_until_complete(engine.close())
+        loop.close()
+
+
+if __name__ == "__main__":
+    results, target = measure()
+    print(f"PolicyEngine latency, HTTP mode against {target}")
+    for name, us in results.items():
+        print(f"{name:<18}{us:>10,.1f} µs/call")
@@ -0,0 +1,131 @@
+"""Engine record history: trimmed list vs RecordStore.
+
+Times the two hot operations of the analysis engines on a full history
+of ``CAPACITY`` records (the engines' default ``max_records``):
+
+* ``append`` -- add one record past capacity.  The list version is the
+  pattern the engines used before, ``append`` then
+  ``self._records = self._records[-max_records:]``.
+* ``get`` -- look a record up by id.  The list version scans for it;
+  the record sits in the middle of the history.
+
+Run the comparison report:
+    PYTHONPATH=src python -m tests.performance.test_record_store_benchmark
+
+Run the micro-benchmarks:
+    pytest tests/performance/test_record_store_benchmark.py -v --benchmark-only
+"""
+
+from __future__ import annotations
+
+import itertools
+import time
+from collections.abc import Callable
+from typing import Any
+
+from shieldops.utils.record_store import RecordStore
+
+CAPACITY = 200_000
+ITERATIONS = 500
+
+
+class _Record:
+    __slots__ = ("id",)
+
+    def __init__(self, record_id: str) -> None:
+        self.id = record_id
+
+
+def _history(capacity: int) -> list[_Record]:
+    return [_Record(f"rec-{i}") for i in range(capacity)]
+
+
+def _list_append(capacity: int) -> Callable[[], None]:
+    records = _history(capacity)
+    ids = itertools.count()
+
+    def append() -> None:
+        nonlocal records
+        records.append(_Record(f"new-{next(ids)}"))
+        if len(records) > capacity:
+            records = records[-capacity:]
+
+    return append
+
+
+def _store_append(capacity: int) -> Callable[[], None]:
+    store: RecordStore[_Record] = RecordStore(capacity)
+    store.extend(_history(capacity))
+    ids = itertools.count()
+    return lambda: store.append(_Record(f"new-{next(ids)}"))
+
+
+def _list_get(capacity: int) -> Callable[[], Any]:
+    records = _history(capacity)
+    target = f"rec-{capacity // 2}"
+
+    def get() -> _Record | None:
+        for r in records:
+            if r.id == target:
+                return r
+        return None
+
+    return get
+
+
+def _store_get(capacity: int) -> Callable[[], Any]:
+    store: RecordStore[_Record] = RecordStore(capacity)
+    store.extend(_history(capacity))
+    target = f"rec-{capacity // 2}"
+    return lambda: store.get(target)
+
+
+def _us_per_op(fn: Callable[[], Any], iterations: int) -> float:
+    for _ in range(min(iterations, 20)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def measure(capacity: int = CAPACITY, iterations: int = ITERATIONS) -> dict[str, float]:
+    """Microseconds per operation on a full history of *capacity* records."""
+    return {
+        "list append": _us_per_op(_list_append(capacity), iterations),
+        "store append": _us_per_op(_store_append(capacity), iterations),
+        "list get": _us_per_op(_list_get(capacity), iterations),
+        "store get": _us_per_op(_store_get(capacity), iterations),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Relative speed (plain assertions, no benchmark fixture needed)
+# ---------------------------------------------------------------------------
+
+
+class TestRecordStoreSpeed:
+    def test_store_faster_than_list(self):
+        results = measure(capacity=20_000, iterations=50)
+        assert results["store append"] < results["list append"]
+        assert results["store get"] < results["list get"]
+
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestRecordStoreBenchmarks:
+    def test_store_append_speed(self, benchmark: Any):
+        benchmark(_store_append(CAPACITY))
+
+    def test_store_get_speed(self, benchmark: Any):
+        benchmark(_store_get(CAPACITY))
+
+
+if __name__ == "__main__":
+    results = measure()
+    print(f"full history of {CAPACITY:,} records, {ITERATIONS} iterations")
+    for name, us in results.items():
+        print(f"{name:<14}{us:>12,.2f} µs/op")
@@ -136,7 +136,9 @@ class TestListAuditLogsFilterByEnvironment:
         assert resp.status_code == 200
 
         # Verify environment was passed to the repository
-        mock_repo.list_audit_logs.assert_called_once_with(environment="staging", limit=50, offset=0)
+        mock_repo.list_audit_logs.assert_called_once_with(
+            environment="staging", limit=50, offset=0, after=None
+        )
 
 
 # ==========================================================================
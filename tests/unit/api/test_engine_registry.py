@@ -0,0 +1,235 @@
+"""Tests for the lazy engine/route registry and the startup profile endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import re
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shieldops.api import app as app_module
+from shieldops.api.auth.dependencies import get_current_user
+from shieldops.api.auth.models import UserResponse, UserRole
+from shieldops.api.engine_registry import (
+    EngineSpec,
+    EngineState,
+    LazyEngineRegistry,
+    current_rss_bytes,
+)
+from shieldops.api.engine_specs import ENGINE_SPECS
+from shieldops.api.routes import anomaly_correlation, startup_profile
+
+_SPEC = EngineSpec(
+    name="anomaly_correlation",
+    route_module="anomaly_correlation",
+    engine="shieldops.analytics.anomaly_correlation:AnomalyCorrelationEngine",
+    tags=("Anomaly Correlation",),
+    settings_kwargs={"max_events": "max_events"},
+    const_kwargs={"correlation_window_seconds": 120.0},
+)
+
+
+def _settings(**overrides: Any) -> SimpleNamespace:
+    return SimpleNamespace(api_prefix="/api/v1", max_events=50, **overrides)
+
+
+def _user(role: UserRole) -> UserResponse:
+    return UserResponse(
+        id="user-1",
+        email="user@test.com",
+        name="User",
+        role=role,
+        is_active=True,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_route_engine():
+    anomaly_correlation.set_engine(None)
+    yield
+    anomaly_correlation.set_engine(None)
+
+
+def _client(
+    registry: LazyEngineRegistry,
+    settings: Any,
+    role: UserRole = UserRole.VIEWER,
+) -> TestClient:
+    app = FastAPI()
+    registry.mount(app, settings)
+    app.state.engine_registry = registry
+    app.include_router(startup_profile.router, prefix="/api/v1")
+    app.dependency_overrides[get_current_user] = lambda: _user(role)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestLazyMaterialization:
+    def test_mount_does_not_build_engine(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        _client(registry, _settings())
+        assert anomaly_correlation._engine is None
+        assert registry.profile()["by_state"] == {"pending": 1}
+
+    def test_first_request_builds_engine_once(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        client = _client(registry, _settings())
+
+        resp = client.get("/api/v1/anomaly-correlation/anomalies")
+        assert resp.status_code == 200
+        engine = anomaly_correlation._engine
+        assert engine is not None
+        assert engine.max_events == 50
+
+        client.get("/api/v1/anomaly-correlation/anomalies")
+        assert anomaly_correlation._engine is engine
+        profile = registry.profile()
+        assert profile["by_state"] == {"ready": 1}
+        assert profile["engines"][0]["import_ms"] >= 0
+
+    def test_failed_build_returns_route_503(self) -> None:
+        spec = EngineSpec(
+            name="broken",
+            route_module="anomaly_correlation",
+            engine="shieldops.analytics.anomaly_correlation:DoesNotExist",
+        )
+        registry = LazyEngineRegistry([spec])
+        client = _client(registry, _settings())
+
+        resp = client.get("/api/v1/anomaly-correlation/anomalies")
+        assert resp.status_code == 503
+        engine_profile = registry.profile()["engines"][0]
+        assert engine_profile["state"] == EngineState.FAILED
+        assert "DoesNotExist" in engine_profile["error"]
+
+    def test_disabled_flag_skips_router(self) -> None:
+        spec = EngineSpec(**{**_SPEC.__dict__, "enabled_flag": "anomaly_enabled"})
+        registry = LazyEngineRegistry([spec])
+        client = _client(registry, _settings(anomaly_enabled=False))
+
+        assert client.get("/api/v1/anomaly-correlation/anomalies").status_code == 404
+        assert registry.profile()["by_state"] == {"disabled": 1}
+
+    def test_shared_route_module_last_setter_wins(self) -> None:
+        first = EngineSpec(
+            name="first",
+            route_module="anomaly_correlation",
+            engine="shieldops.analytics.anomaly_correlation:AnomalyCorrelationEngine",
+            const_kwargs={"max_events": 10},
+        )
+        second = EngineSpec(**{**first.__dict__, "name": "second", "const_kwargs": {}})
+        registry = LazyEngineRegistry([first, second])
+        client = _client(registry, _settings())
+
+        client.get("/api/v1/anomaly-correlation/anomalies")
+        assert anomaly_correlation._engine.max_events != 10
+        assert registry.profile()["by_state"] == {"ready": 2}
+
+    def test_duplicate_name_rejected(self) -> None:
+        with pytest.raises(ValueError, match="already registered"):
+            LazyEngineRegistry([_SPEC, _SPEC])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_requests_share_one_off_loop_build(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        registry._settings = _settings()
+        threads: list[int] = []
+        ensure_route = registry.ensure_route
+
+        def record(route_module: str) -> None:
+            threads.append(threading.get_ident())
+            ensure_route(route_module)
+
+        registry.ensure_route = record  # type: ignore[method-assign]
+        await asyncio.gather(*(registry.aensure_route("anomaly_correlation") for _ in range(5)))
+
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+        assert registry.profile()["by_state"] == {"ready": 1}
+
+    def test_materialize_all(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        assert registry.materialize_all(settings=_settings()) == 1
+        assert anomaly_correlation._engine is not None
+
+
+def _route_keys(app: FastAPI) -> list[tuple[str, tuple[str, ...]]]:
+    # The OpenAPI paths follow route registration order, and unlike
+    # ``app.routes`` they are flattened on every FastAPI version.
+    return [(path, tuple(sorted(ops))) for path, ops in app.openapi()["paths"].items()]
+
+
+class TestMountOrder:
+    def test_staged_mount_matches_eager_include_order(self) -> None:
+        first, second = ENGINE_SPECS[1], ENGINE_SPECS[2]
+
+        def router(route_module: str) -> Any:
+            return importlib.import_module(f"shieldops.api.routes.{route_module}").router
+
+        eager = FastAPI()
+        for module in (first.route_module, "startup_profile", second.route_module):
+            eager.include_router(router(module), prefix="/api/v1")
+
+        lazy = FastAPI()
+        registry = LazyEngineRegistry([first, second])
+        registry.mount(lazy, _settings(), through=first.name)
+        lazy.include_router(router("startup_profile"), prefix="/api/v1")
+        registry.mount(lazy, _settings())
+
+        assert _route_keys(lazy) == _route_keys(eager)
+
+    def test_mount_through_already_mounted_is_a_no_op(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        app = FastAPI()
+        assert registry.mount(app, _settings()) == 1
+        assert registry.mount(app, _settings(), through=_SPEC.name) == 0
+
+    def test_mount_through_unknown_engine(self) -> None:
+        with pytest.raises(ValueError, match="not registered"):
+            LazyEngineRegistry([_SPEC]).mount(FastAPI(), _settings(), through="nope")
+
+    def test_app_mount_stages_follow_declaration_order(self) -> None:
+        source = Path(app_module.__file__).read_text()
+        stages = re.findall(r'engine_registry\.mount\(app, settings, through="(\w+)"\)', source)
+        names = [spec.name for spec in ENGINE_SPECS]
+        positions = [names.index(stage) for stage in stages]
+        assert positions == sorted(positions)
+        assert "engine_registry.mount(app, settings)\n" in source
+
+    def test_each_app_gets_its_own_registry(self) -> None:
+        a, b = app_module.create_app(), app_module.create_app()
+        assert a.state.engine_registry is not b.state.engine_registry
+
+
+class TestStartupProfileEndpoint:
+    def test_reports_engines(self) -> None:
+        registry = LazyEngineRegistry([_SPEC])
+        client = _client(registry, _settings(), role=UserRole.ADMIN)
+        registry.ensure_route("anomaly_correlation")
+
+        resp = client.get("/api/v1/startup-profile", params={"state": "ready"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_engines"] == 1
+        assert data["process_rss_bytes"] > 0
+        assert [e["name"] for e in data["engines"]] == ["anomaly_correlation"]
+
+
+class TestEngineSpecs:
+    def test_names_are_unique(self) -> None:
+        names = [s.name for s in ENGINE_SPECS]
+        assert len(names) == len(set(names))
+
+    def test_engine_paths_are_well_formed(self) -> None:
+        for spec in ENGINE_SPECS:
+            module, _, cls = spec.engine.partition(":")
+            assert module.startswith("shieldops.") and cls, spec.name
+
+    def test_rss_is_positive(self) -> None:
+        assert current_rss_bytes() > 0
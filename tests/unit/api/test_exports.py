@@ -17,8 +17,9 @@ from __future__ import annotations
 
 import csv
 import io
+from collections.abc import AsyncIterator
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
@@ -30,6 +31,16 @@ from shieldops.utils.export_helpers import dicts_to_csv, sanitize_for_csv
 # ── Fixtures & helpers ───────────────────────────────────────────────
 
 
+def _streamed(rows: list[dict[str, Any]]) -> MagicMock:
+    """Mock a Repository.export_* async generator yielding *rows*."""
+
+    async def _iterate(**_: Any) -> AsyncIterator[dict[str, Any]]:
+        for row in rows:
+            yield row
+
+    return MagicMock(side_effect=_iterate)
+
+
 def _create_test_app() -> FastAPI:
     app = FastAPI()
     app.include_router(exports.router, prefix="/api/v1")
@@ -129,20 +140,20 @@ def _reset_module_repo():
 @pytest.fixture
 def mock_repo() -> AsyncMock:
     repo = AsyncMock()
-    repo.export_investigations = AsyncMock(
-        return_value=[
+    repo.export_investigations = _streamed(
+        [
             _make_investigation(),
             _make_investigation(investigation_id="inv-002"),
         ]
     )
-    repo.export_remediations = AsyncMock(
-        return_value=[
+    repo.export_remediations = _streamed(
+        [
             _make_remediation(),
             _make_remediation(remediation_id="rem-002"),
         ]
     )
-    repo.export_compliance_data = AsyncMock(
-        return_value=[
+    repo.export_compliance_data = _streamed(
+        [
             _make_compliance(),
             _make_compliance(scan_id="scan-002", compliance_score=88.0),
         ]
@@ -334,7 +345,7 @@ class TestEmptyResults:
         """When there are no results the CSV body is empty."""
         app = _create_test_app()
         repo = AsyncMock()
-        repo.export_investigations = AsyncMock(return_value=[])
+        repo.export_investigations = _streamed([])
         client = _build_client_with_viewer(app, repo)
 
         resp = client.get("/api/v1/export/investigations?format=csv")
@@ -346,7 +357,7 @@ class TestEmptyResults:
     def test_empty_json_returns_empty_list(self) -> None:
         app = _create_test_app()
         repo = AsyncMock()
-        repo.export_investigations = AsyncMock(return_value=[])
+        repo.export_investigations = _streamed([])
         client = _build_client_with_viewer(app, repo)
 
         resp = client.get("/api/v1/export/investigations?format=json")
@@ -436,7 +447,7 @@ class TestAuthRequired:
         """Without auth override the endpoint returns 401/403."""
         app = _create_test_app()
         repo = AsyncMock()
-        repo.export_investigations = AsyncMock(return_value=[])
+        repo.export_investigations = _streamed([])
         exports.set_repository(repo)
 
         client = TestClient(app, raise_server_exceptions=False)
@@ -447,7 +458,7 @@ class TestAuthRequired:
     def test_remediations_requires_auth(self) -> None:
         app = _create_test_app()
         repo = AsyncMock()
-        repo.export_remediations = AsyncMock(return_value=[])
+        repo.export_remediations = _streamed([])
         exports.set_repository(repo)
 
         client = TestClient(app, raise_server_exceptions=False)
@@ -458,7 +469,7 @@ class TestAuthRequired:
     def test_compliance_requires_auth(self) -> None:
         app = _create_test_app()
         repo = AsyncMock()
-        repo.export_compliance_data = AsyncMock(return_value=[])
+        repo.export_compliance_data = _streamed([])
         exports.set_repository(repo)
 
         client = TestClient(app, raise_server_exceptions=False)
@@ -0,0 +1,182 @@
+"""Tests for the verified-token cache shared by middleware and auth dependencies."""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shieldops.api.auth import service as auth_service
+from shieldops.api.auth.api_keys import generate_api_key
+from shieldops.api.auth.dependencies import _authenticate_via_api_key
+from shieldops.api.auth.service import create_access_token, decode_request_token, decode_token
+from shieldops.api.auth.token_cache import (
+    VerifiedTokenCache,
+    get_token_cache,
+    token_cache_key,
+)
+from shieldops.api.auth.token_manager import TokenManager
+from shieldops.cache.invalidation import CacheInvalidationBus, InvalidationMessage, InvalidationOp
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Any:
+    VerifiedTokenCache.reset_instance()
+    yield
+    VerifiedTokenCache.reset_instance()
+
+
+def _key_repo(key_id: str = "key-1", user_id: str = "user-1") -> AsyncMock:
+    repo = AsyncMock()
+    repo.get_api_key_by_hash.return_value = {
+        "id": key_id,
+        "user_id": user_id,
+        "is_active": True,
+        "expires_at": None,
+    }
+    repo.get_user_by_id.return_value = {
+        "id": user_id,
+        "email": "ops@example.com",
+        "name": "Ops",
+        "role": "operator",
+        "is_active": True,
+    }
+    return repo
+
+
+class TestJwtCache:
+    def test_second_decode_skips_verification(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+
+        with patch.object(
+            auth_service, "_verify_token", wraps=auth_service._verify_token
+        ) as verify:
+            first = decode_token(token)
+            second = decode_token(token)
+
+        assert first == second
+        assert first is not None and first["sub"] == "user-1"
+        assert verify.call_count == 1
+
+    def test_callers_get_a_copy(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+        decode_token(token)["role"] = "viewer"  # type: ignore[index]
+        assert decode_token(token)["role"] == "admin"  # type: ignore[index]
+
+    def test_invalid_tokens_are_not_cached(self) -> None:
+        assert decode_token("not.a.token") is None
+        assert len(get_token_cache()) == 0
+
+    def test_expired_entry_not_served(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+        decode_token(token)
+        key = token_cache_key(token, auth_service.settings.jwt_secret_key)
+        assert get_token_cache().get(key) is not None
+
+        with patch("shieldops.api.auth.token_cache.time.time", return_value=time.time() + 7200):
+            assert get_token_cache().get(key) is None
+        assert len(get_token_cache()) == 0
+
+    def test_rotated_secret_misses_cache(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+        assert decode_token(token) is not None
+
+        with patch.object(auth_service.settings, "jwt_secret_key", "rotated-secret"):
+            assert decode_token(token) is None
+
+    def test_lru_bounded(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        for i in range(3):
+            cache.put(token_cache_key(f"t{i}"), {"sub": str(i)}, time.time() + 60)
+
+        assert len(cache) == 2
+        assert cache.get(token_cache_key("t0")) is None
+
+
+class TestRevocationHooks:
+    def test_revoked_jti_rejected_immediately(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+        payload = decode_token(token)
+        assert payload is not None
+
+        get_token_cache().revoke_jti(payload["jti"], payload["exp"])
+
+        assert decode_token(token) is None
+        assert len(get_token_cache()) == 0
+
+    @pytest.mark.asyncio
+    async def test_token_manager_revocation_reaches_cache(self) -> None:
+        manager = TokenManager()
+        token = create_access_token(subject="user-1", role="admin", expires_delta=timedelta(5))
+        decode_token(token)
+
+        assert await manager.revoke_token(token) is True
+        assert decode_token(token) is None
+
+    @pytest.mark.asyncio
+    async def test_api_key_served_from_cache_until_revoked(self) -> None:
+        full_key, _, _ = generate_api_key()
+        repo = _key_repo()
+
+        first = await _authenticate_via_api_key(full_key, repo)
+        second = await _authenticate_via_api_key(full_key, repo)
+
+        assert first == second
+        assert first is not None and first.id == "user-1"
+        assert repo.get_api_key_by_hash.await_count == 1
+
+        get_token_cache().invalidate(key_id="key-1")
+        repo.get_api_key_by_hash.return_value["is_active"] = False
+
+        assert await _authenticate_via_api_key(full_key, repo) is None
+
+    @pytest.mark.asyncio
+    async def test_deactivated_owner_drops_api_key_entries(self) -> None:
+        full_key, _, _ = generate_api_key()
+        repo = _key_repo()
+        await _authenticate_via_api_key(full_key, repo)
+
+        assert get_token_cache().invalidate(subject="user-1") == 1
+
+
+class TestCrossWorkerInvalidation:
+    @pytest.mark.asyncio
+    async def test_revocation_reaches_other_workers(self) -> None:
+        full_key, _, _ = generate_api_key()
+        client = AsyncMock()
+        here, there = VerifiedTokenCache(), VerifiedTokenCache()
+        here._bus = CacheInvalidationBus(client=client)
+        for cache in (here, there):
+            with patch.object(VerifiedTokenCache, "_instance", cache):
+                await _authenticate_via_api_key(full_key, _key_repo())
+
+        assert await here.invalidate_everywhere(key_id="key-1") == 1
+
+        _, raw = client.publish.await_args.args
+        assert there.apply_invalidation(InvalidationMessage.model_validate_json(raw)) == 1
+        assert len(there) == 0
+
+    def test_unrelated_broadcasts_are_ignored(self) -> None:
+        cache = get_token_cache()
+        cache.put(b"k", {}, time.time() + 60, subject="user-1")
+        message = InvalidationMessage(op=InvalidationOp.FLUSH)
+
+        assert cache.apply_invalidation(message) == 0
+        assert len(cache) == 1
+
+
+class TestRequestMemo:
+    def test_decoded_once_per_request(self) -> None:
+        token = create_access_token(subject="user-1", role="admin")
+        scope: dict[str, Any] = {"type": "http"}
+
+        with patch.object(auth_service, "decode_token", wraps=auth_service.decode_token) as decode:
+            first = decode_request_token(scope, token)
+            second = decode_request_token(scope, token)
+
+        assert first is second
+        assert decode.call_count == 1
+        assert scope["state"]["verified_token"] == (token, first)
@@ -0,0 +1,201 @@
+"""Tests for the atomic rate-limit script client and the local token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import NoScriptError
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from shieldops.api.middleware import RateLimitMiddleware
+from shieldops.api.middleware.atomic_rate_limit import (
+    RATE_LIMIT_SCRIPT,
+    AtomicRateLimiter,
+    LocalTokenBucket,
+    SlidingWindow,
+)
+from shieldops.api.middleware.metrics import MetricsRegistry, get_metrics_registry
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+
+class _ScriptRedis:
+    """In-memory stand-in that executes the rate-limit script's logic."""
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.logs: dict[str, list[float]] = {}
+        self.calls = 0
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[int]:
+        self.calls += 1
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        limit, cost = int(args[1]), int(args[2])
+        count = self.counters[keys[0]] = self.counters.get(keys[0], 0) + cost
+        if numkeys == 1 or count - cost >= limit:
+            return [count, 0]
+        sliding_limit, window, now = int(args[3]), int(args[4]), int(args[5])
+        log = [ts for ts in self.logs.get(keys[1], []) if ts > now - window]
+        if len(log) >= sliding_limit:
+            self.counters[keys[0]] -= cost
+            return [count - cost, -1]
+        self.logs[keys[1]] = [*log, now]
+        return [count, len(log) + 1]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry() -> Any:
+    MetricsRegistry.reset_instance()
+    yield
+    MetricsRegistry.reset_instance()
+
+
+def _build_app(redis: Any, **kwargs: Any) -> Starlette:
+    app = Starlette(routes=[Route("/api/v1/agents", lambda r: PlainTextResponse("ok"))])
+    app.add_middleware(RateLimitMiddleware, redis=redis, **kwargs)
+    return app
+
+
+# ── AtomicRateLimiter ────────────────────────────────────────────────
+
+
+class TestAtomicRateLimiter:
+    @pytest.mark.asyncio
+    async def test_one_script_call_per_check(self) -> None:
+        redis = AsyncMock()
+        redis.evalsha.return_value = [3, 0]
+        limiter = AtomicRateLimiter(redis)
+
+        decision = await limiter.check("k", limit=5, window=60)
+
+        assert decision.allowed and decision.remaining == 2
+        sha, numkeys, key, window, limit, cost = redis.evalsha.await_args.args
+        assert (numkeys, key, window, limit, cost) == (1, "k", 60, 5, 1)
+        redis.incr.assert_not_called()
+        redis.expire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_eval_when_script_not_loaded(self) -> None:
+        redis = AsyncMock()
+        redis.evalsha.side_effect = NoScriptError("NOSCRIPT")
+        redis.eval.return_value = [6, 0]
+
+        decision = await AtomicRateLimiter(redis).check("k", limit=5, window=60)
+
+        assert not decision.allowed and decision.denied_by == "fixed"
+        assert redis.eval.await_args.args[0] == RATE_LIMIT_SCRIPT
+
+    @pytest.mark.asyncio
+    async def test_sliding_window_checked_in_same_call(self) -> None:
+        redis = _ScriptRedis()
+        limiter = AtomicRateLimiter(redis)
+        sliding = SlidingWindow("ratelimit:read:u", limit=2, window=60)
+
+        results = [await limiter.check("k", 10, 60, sliding) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert results[2].denied_by == "sliding"
+        assert redis.calls == 3
+        assert redis.counters["k"] == 2  # the rejected request was rolled back
+
+
+# ── LocalTokenBucket ─────────────────────────────────────────────────
+
+
+class TestLocalTokenBucket:
+    @pytest.mark.asyncio
+    async def test_serves_leased_tokens_without_redis(self) -> None:
+        redis = _ScriptRedis()
+        bucket = LocalTokenBucket(AtomicRateLimiter(redis), lease_size=10, max_fraction=0.1)
+        expires = time.time() + 60
+
+        decisions = [await bucket.acquire("k", 100, 60, expires) for _ in range(25)]
+
+        assert all(d.allowed for d in decisions)
+        assert redis.calls == 3  # 10-token leases
+        assert [d.source for d in decisions[:2]] == ["redis", "local"]
+
+    @pytest.mark.asyncio
+    async def test_never_admits_more_than_limit(self) -> None:
+        redis = _ScriptRedis()
+        limiter = AtomicRateLimiter(redis)
+        replicas = [LocalTokenBucket(limiter, lease_size=4, max_fraction=1.0) for _ in range(3)]
+        expires = time.time() + 60
+
+        admitted = 0
+        for i in range(60):
+            decision = await replicas[i % 3].acquire("k", 10, 60, expires)
+            admitted += decision.allowed
+
+        assert admitted == 10
+
+    @pytest.mark.asyncio
+    async def test_exhausted_window_rejected_locally(self) -> None:
+        redis = _ScriptRedis()
+        bucket = LocalTokenBucket(AtomicRateLimiter(redis), lease_size=5, max_fraction=1.0)
+        expires = time.time() + 60
+
+        for _ in range(5):
+            assert (await bucket.acquire("k", 5, 60, expires)).allowed
+        calls = redis.calls
+        denied = [await bucket.acquire("k", 5, 60, expires) for _ in range(3)]
+
+        assert not any(d.allowed for d in denied)
+        assert redis.calls == calls  # the lease already saw the window was full
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_refill(self) -> None:
+        redis = _ScriptRedis()
+        bucket = LocalTokenBucket(AtomicRateLimiter(redis), lease_size=10, max_fraction=1.0)
+        expires = time.time() + 60
+
+        decisions = await asyncio.gather(*(bucket.acquire("k", 100, 60, expires) for _ in range(8)))
+
+        assert all(d.allowed for d in decisions)
+        assert redis.calls == 1
+
+    def test_lease_capped_by_fraction_of_limit(self) -> None:
+        bucket = LocalTokenBucket(AtomicRateLimiter(AsyncMock()), lease_size=50, max_fraction=0.1)
+        assert bucket._chunk(300) == 30
+        assert bucket._chunk(5) == 1
+
+
+# ── Middleware wiring ────────────────────────────────────────────────
+
+
+class TestMiddlewareWiring:
+    def test_lease_mode_reports_local_latency(self) -> None:
+        redis = _ScriptRedis()
+        client = TestClient(_build_app(redis, lease_size=10, lease_max_fraction=0.5))
+
+        responses = [client.get("/api/v1/agents") for _ in range(5)]
+
+        assert all(r.status_code == 200 for r in responses)
+        assert redis.calls == 1
+        expected = (
+            'rate_limit_check_duration_seconds_count{limiter="fixed_window",source="local"} 4'
+        )
+        assert expected in get_metrics_registry().collect()
+
+    def test_sliding_tier_rejection_uses_tier_limit(self) -> None:
+        redis = _ScriptRedis()
+        app = _build_app(redis, sliding_window=True)
+
+        async def _with_override(scope: Any, receive: Any, send: Any) -> None:
+            scope.setdefault("state", {})["rate_limit_override"] = 1
+            await app(scope, receive, send)
+
+        client = TestClient(_with_override)
+        assert client.get("/api/v1/agents").status_code == 200
+        resp = client.get("/api/v1/agents")
+
+        assert resp.status_code == 429
+        assert resp.headers["x-ratelimit-limit"] == "1"
+        assert redis.calls == 2
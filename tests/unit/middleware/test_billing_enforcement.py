@@ -6,7 +6,7 @@ tracking, and the upgrade-usage endpoint integration.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from starlette.applications import Starlette
@@ -488,6 +488,53 @@ class TestPlanEnforcementService:
         assert limit == 1000
         assert allowed is True
 
+    @pytest.mark.asyncio
+    async def test_check_api_quota_reads_persisted_rollups(self) -> None:
+        """With a rollup sink, persisted hours come from the DB plus unpersisted memory."""
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one=MagicMock(return_value=900))
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        svc = PlanEnforcementService(session_factory=session_factory)
+
+        tracker = UsageTracker.get_instance()
+        tracker.sink = AsyncMock()
+        for _ in range(5):
+            tracker.record("org-1", "GET", "/api/v1/agents")
+
+        _, used, _ = await svc.check_api_quota("org-1", plan="free")
+        _, used_again, _ = await svc.check_api_quota("org-1", plan="free")
+
+        assert used == used_again == 905
+        assert session.execute.await_count == 1  # cached like the plan lookup
+
+    @pytest.mark.asyncio
+    async def test_flush_does_not_undercount_quota(self) -> None:
+        """Flushed hours leave the local term, so the cached DB sum is re-read."""
+        db_total = 900
+        session = AsyncMock()
+        session.execute.side_effect = lambda _stmt: MagicMock(
+            scalar_one=MagicMock(return_value=db_total)
+        )
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        svc = PlanEnforcementService(session_factory=session_factory)
+
+        tracker = UsageTracker()
+        tracker.sink = AsyncMock()
+        tracker.add_flush_listener(svc.invalidate_usage)
+        for _ in range(5):
+            tracker.record("org-1", "GET", "/api/v1/agents")
+
+        assert await svc._count_api_calls(tracker, "org-1", 24) == 905
+
+        tracker.rollup(final=True)
+        await tracker.flush_to_sink()
+        db_total = 905  # the flushed calls are now in the DB sum
+
+        assert await svc._count_api_calls(tracker, "org-1", 24) == 905
+        assert session.execute.await_count == 2
+
     @pytest.mark.asyncio
     async def test_get_usage_summary_structure(self) -> None:
         """get_usage_summary returns all expected keys."""
@@ -0,0 +1,185 @@
+"""Tests for the fused RequestContextMiddleware and the pure-ASGI stack."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from shieldops.api.auth import service as auth_service
+from shieldops.api.auth.service import create_access_token
+from shieldops.api.middleware import (
+    ErrorHandlerMiddleware,
+    RateLimitMiddleware,
+    RequestContextMiddleware,
+    SecurityHeadersMiddleware,
+)
+from shieldops.api.middleware.correlation import CorrelationMiddleware
+from shieldops.api.middleware.metrics import MetricsRegistry, get_metrics_registry
+from shieldops.observability.request_correlation import RequestCorrelator, SpanStatus
+
+# ── Helpers ──────────────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry() -> Any:
+    MetricsRegistry.reset_instance()
+    yield
+    MetricsRegistry.reset_instance()
+
+
+async def _context_endpoint(request: Request) -> Response:
+    ctx = request.state.request_context
+    return JSONResponse(
+        {
+            "request_id": request.state.request_id,
+            "organization_id": request.state.organization_id,
+            "user_id": ctx.user_id,
+            "role": ctx.role,
+            "path_template": ctx.path_template,
+        }
+    )
+
+
+async def _boom(request: Request) -> Response:
+    raise RuntimeError("boom")
+
+
+async def _stream(request: Request) -> Response:
+    async def chunks() -> Any:
+        for part in (b"a", b"b", b"c"):
+            yield part
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+def _build_app(*extra: Any) -> Starlette:
+    app = Starlette(
+        routes=[
+            Route("/health", lambda r: PlainTextResponse("ok")),
+            Route("/api/v1/items/{item_id}", _context_endpoint),
+            Route("/api/v1/boom", _boom),
+            Route("/api/v1/stream", _stream),
+        ],
+    )
+    for middleware, kwargs in extra:
+        app.add_middleware(middleware, **kwargs)
+    app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+def _bearer(user_id: str = "user-1") -> dict[str, str]:
+    token = create_access_token(subject=user_id, role="operator")
+    return {"Authorization": f"Bearer {token}"}
+
+
+# ── Context resolution ───────────────────────────────────────────────
+
+
+class TestRequestContext:
+    def test_resolves_user_tenant_and_labels(self) -> None:
+        client = TestClient(_build_app())
+        resp = client.get(
+            "/api/v1/items/12345",
+            headers={**_bearer(), "X-Organization-ID": "org-7", "X-Request-ID": "rid-1"},
+        )
+
+        assert resp.json() == {
+            "request_id": "rid-1",
+            "organization_id": "org-7",
+            "user_id": "user-1",
+            "role": "operator",
+            "path_template": "/api/v1/items/{id}",
+        }
+        assert resp.headers["x-request-id"] == "rid-1"
+
+    def test_anonymous_request_gets_generated_id(self) -> None:
+        client = TestClient(_build_app())
+        resp = client.get("/api/v1/items/1")
+
+        body = resp.json()
+        assert body["user_id"] is None
+        assert body["organization_id"] is None
+        assert resp.headers["x-request-id"] == body["request_id"]
+
+    def test_org_claim_in_token_wins_over_header(self) -> None:
+        client = TestClient(_build_app())
+        with patch.object(
+            auth_service,
+            "decode_token",
+            return_value={"sub": "u", "role": "admin", "org_id": "org-jwt"},
+        ):
+            resp = client.get(
+                "/api/v1/items/1",
+                headers={"Authorization": "Bearer x", "X-Organization-ID": "org-hdr"},
+            )
+        assert resp.json()["organization_id"] == "org-jwt"
+
+    def test_jwt_decoded_once_across_stack(self) -> None:
+        redis = AsyncMock()
+        redis.evalsha.return_value = [1, 0]
+        app = _build_app((RateLimitMiddleware, {"redis": redis}))
+        client = TestClient(app)
+
+        with patch.object(auth_service, "decode_token", wraps=auth_service.decode_token) as decode:
+            resp = client.get("/api/v1/items/1", headers=_bearer())
+
+        assert resp.status_code == 200
+        assert "x-ratelimit-limit" in resp.headers
+        assert decode.call_count == 1
+        assert redis.evalsha.await_args.args[2].endswith("user:user-1")
+
+
+# ── Metrics and errors ───────────────────────────────────────────────
+
+
+class TestMetricsAndErrors:
+    def test_records_request_metrics(self) -> None:
+        client = TestClient(_build_app())
+        client.get("/api/v1/items/42")
+
+        output = get_metrics_registry().collect()
+        assert (
+            'http_requests_total{method="GET",path_template="/api/v1/items/{id}",'
+            'status_code="200"} 1' in output
+        )
+        assert 'http_requests_in_progress{method="GET"} 0' in output
+
+    def test_unhandled_error_becomes_json_500_with_request_id(self) -> None:
+        app = _build_app((ErrorHandlerMiddleware, {}))
+        client = TestClient(app, raise_server_exceptions=False)
+
+        resp = client.get("/api/v1/boom", headers={"X-Request-ID": "rid-err"})
+
+        assert resp.status_code == 500
+        assert resp.json() == {"detail": "Internal server error", "request_id": "rid-err"}
+        assert 'status_code="500"' in get_metrics_registry().collect()
+
+    def test_streaming_body_passes_through_header_layers(self) -> None:
+        app = _build_app((SecurityHeadersMiddleware, {}))
+        client = TestClient(app)
+
+        resp = client.get("/api/v1/stream")
+
+        assert resp.text == "abc"
+        assert resp.headers["x-frame-options"] == "DENY"
+        assert "x-request-id" in resp.headers
+
+    def test_correlation_trace_wraps_request(self) -> None:
+        correlator = RequestCorrelator()
+        app = _build_app((CorrelationMiddleware, {"correlator": correlator}))
+        client = TestClient(app)
+
+        resp = client.get("/api/v1/items/42", headers={"X-Request-ID": "rid-corr"})
+
+        assert resp.headers["x-correlation-id"] == "rid-corr"
+        trace = correlator.get_trace("rid-corr")
+        assert trace is not None
+        assert trace.status == SpanStatus.COMPLETED
+        assert trace.spans[0].metadata == {"status_code": 200}
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from unittest.mock import ANY
 
 import pytest
 from starlette.applications import Starlette
@@ -17,6 +23,8 @@ from starlette.testclient import TestClient
 
 from shieldops.api.middleware.usage_tracker import (
     _SKIP_PATHS,
+    OVERFLOW_ENDPOINT,
+    UsageRollup,
     UsageTracker,
     UsageTrackerMiddleware,
     get_usage_tracker,
@@ -465,11 +473,10 @@ class TestHourBoundary:
         """Data older than the window is excluded."""
         tracker = UsageTracker()
 
-        # Manually insert data for 48 hours ago
-        old_hour = (datetime.now(UTC) - timedelta(hours=48)).strftime("%Y-%m-%dT%H")
-
-        with tracker._mu:
-            tracker._counts["org-1"]["GET /old"][old_hour] = 99
+        # Record data for 48 hours ago
+        old_ts = (datetime.now(UTC) - timedelta(hours=48)).timestamp()
+        for _ in range(99):
+            tracker.record("org-1", "GET", "/old", timestamp=old_ts)
 
         # Current-hour data
         tracker.record("org-1", "GET", "/api/v1/agents")
@@ -512,3 +519,186 @@ class TestSingleton:
 
         usage = tracker.get_usage()
         assert usage["total_calls"] == 0
+
+
+# ── Test: Path templates and bounded memory ──────────────────────────
+
+
+class TestPathTemplates:
+    def test_middleware_records_route_template(self) -> None:
+        """Requests are grouped by route template, not raw path."""
+        app = Starlette(routes=[Route("/api/v1/agents/{agent_id}", _ok_endpoint)])
+        app.add_middleware(UsageTrackerMiddleware)
+        client = TestClient(app)
+
+        client.get("/api/v1/agents/a1")
+        client.get("/api/v1/agents/b2")
+
+        eps = get_usage_tracker().get_top_endpoints()
+        assert eps == [
+            {"endpoint": "GET /api/v1/agents/{agent_id}", "count": 2, "avg_latency_ms": ANY}
+        ]
+
+    def test_unmatched_paths_normalised(self) -> None:
+        """Paths that match no route have their IDs collapsed."""
+        app = _build_app()
+        client = TestClient(app)
+
+        client.get("/api/v1/unknown/12345")
+        client.get("/api/v1/unknown/67890")
+
+        eps = get_usage_tracker().get_top_endpoints()
+        assert eps[0]["endpoint"] == "GET /api/v1/unknown/{id}"
+        assert eps[0]["count"] == 2
+
+    def test_endpoints_per_org_capped(self) -> None:
+        """Endpoints past the per-org cap are counted under one overflow key."""
+        tracker = UsageTracker(max_endpoints_per_org=3)
+        for i in range(10):
+            tracker.record("org-1", "GET", f"/api/v1/r{i}")
+
+        eps = {e["endpoint"]: e["count"] for e in tracker.get_top_endpoints(limit=20)}
+        assert len(eps) == 4
+        assert eps[OVERFLOW_ENDPOINT] == 7
+        assert tracker.get_usage()["total_calls"] == 10
+
+
+class TestStripedRecording:
+    def test_concurrent_records_are_not_lost(self) -> None:
+        """Records from many threads across orgs all land."""
+        tracker = UsageTracker()
+
+        def worker(n: int) -> None:
+            for _ in range(1_000):
+                tracker.record(f"org-{n % 4}", "GET", "/api/v1/agents", duration_ms=1.0)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert tracker.get_usage()["total_calls"] == 8_000
+        assert tracker.get_org_total("org-1") == 2_000
+
+
+# ── Test: Rollup, eviction and the persistence sink ───────────────────
+
+
+class _RecordingSink:
+    def __init__(self, fail: bool = False) -> None:
+        self.rows: list[UsageRollup] = []
+        self.fail = fail
+
+    async def write_usage_rollups(self, rows: Sequence[UsageRollup]) -> None:
+        if self.fail:
+            raise RuntimeError("db down")
+        self.rows.extend(rows)
+
+
+class TestRollup:
+    def test_ended_hours_compacted_and_still_queryable(self) -> None:
+        """Rolling up moves ended hours out of the open map without losing counts."""
+        tracker = UsageTracker()
+        two_hours_ago = time.time() - 7200
+        for _ in range(3):
+            tracker.record("org-1", "GET", "/api/v1/agents", 5.0, timestamp=two_hours_ago)
+        tracker.record("org-1", "GET", "/api/v1/agents", 5.0)
+
+        tracker.rollup()
+
+        usage = tracker._orgs["org-1"]
+        assert len(usage.open) == 1
+        assert [r.total for r in usage.closed] == [3]
+        assert tracker.get_top_endpoints(org_id="org-1")[0] == {
+            "endpoint": "GET /api/v1/agents",
+            "count": 4,
+            "avg_latency_ms": 5.0,
+        }
+
+    def test_hours_past_retention_evicted(self) -> None:
+        """Hours older than the retention window are dropped, and empty orgs with them."""
+        tracker = UsageTracker(retention_hours=24)
+        tracker.record("org-old", "GET", "/api/v1/agents", timestamp=time.time() - 48 * 3600)
+        tracker.record("org-1", "GET", "/api/v1/agents")
+
+        tracker.rollup()
+
+        assert set(tracker._orgs) == {"org-1"}
+        assert tracker.get_usage(hours=720)["total_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_each_hour_once(self) -> None:
+        """Compacted hours are written to the sink in one batch, then not again."""
+        sink = _RecordingSink()
+        tracker = UsageTracker(sink=sink)
+        hour_ago = time.time() - 3600
+        tracker.record("org-1", "GET", "/a", 2.0, timestamp=hour_ago)
+        tracker.record("org-1", "GET", "/a", 4.0, timestamp=hour_ago)
+        tracker.record("org-2", "POST", "/b", timestamp=hour_ago)
+        tracker.record("org-1", "GET", "/a")  # current hour stays open
+
+        tracker.rollup()
+        assert await tracker.flush_to_sink() == 2
+        assert await tracker.flush_to_sink() == 0
+
+        by_org = {(r.org_id, r.endpoint): r for r in sink.rows}
+        assert by_org[("org-1", "GET /a")].call_count == 2
+        assert by_org[("org-1", "GET /a")].total_latency_ms == 6.0
+        assert by_org[("org-1", "GET /a")].hour.minute == 0
+        assert tracker.get_org_total("org-1", unpersisted_only=True) == 1
+        assert tracker.get_org_total("org-1") == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self) -> None:
+        """Rows stay pending when the sink raises."""
+        sink = _RecordingSink(fail=True)
+        tracker = UsageTracker(sink=sink)
+        tracker.record("org-1", "GET", "/a")
+        tracker.rollup(final=True)
+
+        with pytest.raises(RuntimeError):
+            await tracker.flush_to_sink()
+        sink.fail = False
+
+        assert await tracker.flush_to_sink() == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_finishes_its_write_once(self) -> None:
+        """Cancelling a flush mid-write still marks its hours; the next flush adds nothing."""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        class _SlowSink(_RecordingSink):
+            async def write_usage_rollups(self, rows: Sequence[UsageRollup]) -> None:
+                started.set()
+                await release.wait()
+                await super().write_usage_rollups(rows)
+
+        sink = _SlowSink()
+        tracker = UsageTracker(sink=sink)
+        tracker.record("org-1", "GET", "/a")
+        tracker.rollup(final=True)
+
+        flush = asyncio.create_task(tracker.flush_to_sink())
+        await started.wait()
+        flush.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flush
+        release.set()
+
+        assert await tracker.flush_to_sink() == 0
+        assert len(sink.rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_listeners_get_flushed_orgs(self) -> None:
+        """Listeners are told which orgs' hours were persisted."""
+        tracker = UsageTracker(sink=_RecordingSink())
+        seen: list[set[str]] = []
+        tracker.add_flush_listener(seen.append)
+        tracker.record("org-1", "GET", "/a")
+        tracker.record("org-2", "GET", "/a")
+        tracker.rollup(final=True)
+
+        await tracker.flush_to_sink()
+
+        assert seen == [{"org-1", "org-2"}]
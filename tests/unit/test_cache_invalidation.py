@@ -0,0 +1,268 @@
+"""Tests for cross-process L1 invalidation over Redis pub/sub.
+
+Covers:
+- CacheInvalidationBus publish/subscribe, self-origin filtering, resubscribe
+- MultiLevelCache broadcasting writes and applying remote invalidations
+- Invalidation lag statistics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shieldops.cache.invalidation import (
+    CacheInvalidationBus,
+    InvalidationMessage,
+    InvalidationOp,
+)
+from shieldops.cache.multilevel_cache import MultiLevelCache
+
+
+class _Broker:
+    """In-memory stand-in for Redis pub/sub shared by several clients."""
+
+    def __init__(self) -> None:
+        self.queues: list[asyncio.Queue[dict[str, Any]]] = []
+
+    def client(self) -> _BrokerClient:
+        return _BrokerClient(self)
+
+
+class _BrokerClient:
+    def __init__(self, broker: _Broker) -> None:
+        self._broker = broker
+
+    async def publish(self, channel: str, data: str) -> int:
+        for queue in self._broker.queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(self._broker.queues)
+
+    def pubsub(self) -> _BrokerPubSub:
+        return _BrokerPubSub(self._broker)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _BrokerPubSub:
+    def __init__(self, broker: _Broker) -> None:
+        self._broker = broker
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._broker.queues.append(self._queue)
+
+    async def get_message(
+        self, ignore_subscribe_messages: bool = True, timeout: float = 1.0
+    ) -> dict[str, Any] | None:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        if self._queue in self._broker.queues:
+            self._broker.queues.remove(self._queue)
+
+
+def _make_l2() -> AsyncMock:
+    l2 = AsyncMock()
+    l2.get = AsyncMock(return_value=None)
+    l2.set = AsyncMock()
+    l2.delete = AsyncMock(return_value=True)
+    l2.set_many = AsyncMock()
+    l2.delete_many = AsyncMock(return_value=0)
+    l2.invalidate_pattern = AsyncMock(return_value=0)
+    l2.flush_all = AsyncMock(return_value=0)
+    return l2
+
+
+async def _settle() -> None:
+    """Give listener tasks time to receive and apply broadcasts."""
+    await asyncio.sleep(0.02)
+
+
+@pytest.fixture
+async def pods() -> Any:
+    """Two caches ("pods") sharing one L2 mock and one pub/sub broker."""
+    broker = _Broker()
+    l2 = _make_l2()
+    a = MultiLevelCache(
+        l2, invalidation_bus=CacheInvalidationBus(node_id="a", client=broker.client())
+    )
+    b = MultiLevelCache(
+        l2, invalidation_bus=CacheInvalidationBus(node_id="b", client=broker.client())
+    )
+    await a.start_invalidation_listener()
+    await b.start_invalidation_listener()
+    await _settle()
+    yield a, b
+    await a.stop_invalidation_listener()
+    await b.stop_invalidation_listener()
+
+
+# ── Bus ──────────────────────────────────────────────────────────
+
+
+class TestCacheInvalidationBus:
+    @pytest.mark.asyncio
+    async def test_ignores_own_messages(self) -> None:
+        broker = _Broker()
+        bus = CacheInvalidationBus(node_id="a", client=broker.client())
+        received: list[InvalidationMessage] = []
+        await bus.start(received.append)
+        try:
+            await _settle()
+            await bus.publish(InvalidationOp.KEYS, "ns", ["k"])
+            other = CacheInvalidationBus(node_id="b", client=broker.client())
+            await other.publish(InvalidationOp.FLUSH)
+            await _settle()
+
+            assert [m.origin for m in received] == ["b"]
+            assert bus.connected
+        finally:
+            await bus.stop()
+        assert not bus.connected
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_callback_runs_on_connect(self) -> None:
+        bus = CacheInvalidationBus(client=_Broker().client())
+        resubscribed = asyncio.Event()
+        await bus.start(lambda m: None, on_resubscribe=resubscribed.set)
+        try:
+            await asyncio.wait_for(resubscribed.wait(), 1)
+        finally:
+            await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_swallowed(self) -> None:
+        client = AsyncMock()
+        client.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+        bus = CacheInvalidationBus(client=client)
+
+        assert await bus.publish(InvalidationOp.FLUSH) is False
+        assert bus.published == 0
+
+    @pytest.mark.asyncio
+    async def test_malformed_message_is_skipped(self) -> None:
+        broker = _Broker()
+        bus = CacheInvalidationBus(node_id="a", client=broker.client())
+        received: list[InvalidationMessage] = []
+        await bus.start(received.append)
+        try:
+            await _settle()
+            await broker.client().publish("ch", "not json")
+            await CacheInvalidationBus(node_id="b", client=broker.client()).publish(
+                InvalidationOp.FLUSH
+            )
+            await _settle()
+
+            assert len(received) == 1
+        finally:
+            await bus.stop()
+
+
+# ── MultiLevelCache ──────────────────────────────────────────────
+
+
+class TestCrossPodInvalidation:
+    @pytest.mark.asyncio
+    async def test_set_on_one_pod_evicts_peer_l1(self, pods: Any) -> None:
+        a, b = pods
+        await b.set("k", "old")
+        await _settle()
+        await a.set("k", "new")
+        await _settle()
+
+        assert b._l1_get("default:k") == (False, None)
+        assert a._l1_get("default:k") == (True, "new")
+
+    @pytest.mark.asyncio
+    async def test_delete_many_evicts_peer_l1(self, pods: Any) -> None:
+        a, b = pods
+        await b.set_many({"x": 1, "y": 2, "z": 3}, namespace="ns")
+        await a.delete_many(["x", "y"], namespace="ns")
+        await _settle()
+
+        assert b._l1_get("ns:x")[0] is False
+        assert b._l1_get("ns:z") == (True, 3)
+
+    @pytest.mark.asyncio
+    async def test_namespace_invalidation_propagates(self, pods: Any) -> None:
+        a, b = pods
+        await b.set("k1", 1, namespace="agents")
+        await b.set("k2", 2, namespace="other")
+        await a.invalidate_namespace("agents")
+        await _settle()
+
+        assert b._l1_get("agents:k1")[0] is False
+        assert b._l1_get("other:k2")[0] is True
+
+    @pytest.mark.asyncio
+    async def test_flush_propagates(self, pods: Any) -> None:
+        a, b = pods
+        await b.set("k", 1)
+        await a.flush_all()
+        await _settle()
+
+        assert b.get_stats().l1_size == 0
+
+    @pytest.mark.asyncio
+    async def test_stats_track_published_received_and_lag(self, pods: Any) -> None:
+        a, b = pods
+        await a.set("k", 1)
+        await a.delete("k")
+        await _settle()
+
+        assert a.get_stats().invalidations_published == 2
+        stats = b.get_stats()
+        assert stats.invalidations_received == 2
+        assert stats.invalidation_resyncs == 1
+        assert 0 <= stats.invalidation_lag_avg_ms <= stats.invalidation_lag_max_ms
+
+    @pytest.mark.asyncio
+    async def test_no_bus_means_no_publish(self) -> None:
+        cache = MultiLevelCache(_make_l2())
+        await cache.set("k", 1)
+        await cache.start_invalidation_listener()
+        stats = cache.get_stats()
+        assert stats.invalidations_published == 0
+        assert stats.invalidations_received == 0
+
+
+class TestApplyInvalidation:
+    def test_keys_only_touch_l1(self) -> None:
+        l2 = _make_l2()
+        cache = MultiLevelCache(l2)
+        cache._l1_put("ns:a", 1, None, "ns")
+        cache._l1_put("ns:b", 2, None, "ns")
+
+        removed = cache.apply_invalidation(
+            InvalidationMessage(op=InvalidationOp.KEYS, namespace="ns", keys=["a", "missing"])
+        )
+
+        assert removed == 1
+        assert cache._l1_get("ns:b") == (True, 2)
+        l2.delete.assert_not_awaited()
+
+    def test_lag_measured_from_sent_at(self) -> None:
+        cache = MultiLevelCache(_make_l2())
+        cache.apply_invalidation(
+            InvalidationMessage(op=InvalidationOp.FLUSH, sent_at=time.time() - 0.05)
+        )
+        stats = cache.get_stats()
+        assert stats.invalidation_lag_max_ms >= 50
+        assert stats.invalidation_lag_p99_ms >= 50
+
+    def test_reset_stats_clears_lag(self) -> None:
+        cache = MultiLevelCache(_make_l2())
+        cache.apply_invalidation(InvalidationMessage(op=InvalidationOp.FLUSH))
+        cache.reset_stats()
+        stats = cache.get_stats()
+        assert stats.invalidations_received == 0
+        assert stats.invalidation_lag_max_ms == 0.0
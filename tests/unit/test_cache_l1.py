@@ -0,0 +1,175 @@
+"""Tests for the L1 stores (LRU baseline and sharded W-TinyLFU).
+
+Covers:
+- FrequencySketch counting, saturation and aging
+- TinyLFUStore byte budgets, admission, scan resistance, namespace budgets
+- MultiLevelCache running on the tinylfu policy
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from shieldops.cache.l1 import FrequencySketch, LRUStore, TinyLFUStore, estimate_size
+from shieldops.cache.multilevel_cache import L1Policy, MultiLevelCache
+
+
+def _store(**kwargs: object) -> TinyLFUStore:
+    defaults: dict[str, object] = {"max_bytes": 1 << 30, "max_size": 100, "shards": 1}
+    return TinyLFUStore(**{**defaults, **kwargs})  # type: ignore[arg-type]
+
+
+# ── Sketch ───────────────────────────────────────────────────────
+
+
+class TestFrequencySketch:
+    def test_counts_accesses(self) -> None:
+        sketch = FrequencySketch(64)
+        for _ in range(5):
+            sketch.increment("hot")
+        sketch.increment("cold")
+        assert sketch.frequency("hot") >= 5
+        assert sketch.frequency("hot") > sketch.frequency("cold")
+        assert sketch.frequency("never") <= sketch.frequency("cold")
+
+    def test_counters_saturate_at_15(self) -> None:
+        sketch = FrequencySketch(64)
+        for _ in range(40):
+            sketch.increment("k")
+        assert sketch.frequency("k") == 15
+
+    def test_aging_halves_counters(self) -> None:
+        sketch = FrequencySketch(16)
+        for _ in range(8):
+            sketch.increment("k")
+        for i in range(160):  # sample size is 10 * width
+            sketch.increment(f"other-{i}")
+        assert sketch.frequency("k") < 8
+
+
+class TestEstimateSize:
+    def test_nested_payload_counts_children(self) -> None:
+        small = estimate_size({"a": 1})
+        large = estimate_size({"a": 1, "rows": [{"x": "y" * 1000} for _ in range(10)]})
+        assert large > small + 10_000
+
+
+# ── TinyLFUStore ─────────────────────────────────────────────────
+
+
+class TestTinyLFUStore:
+    def test_get_put_delete(self) -> None:
+        store = _store()
+        store.put("k", "v", 60, "ns")
+        assert store.get("k") == (True, "v")
+        assert store.delete("k") is True
+        assert store.get("k") == (False, None)
+        assert store.delete("k") is False
+
+    def test_expired_entry_is_miss(self) -> None:
+        store = _store()
+        store.put("k", "v", 1, "ns")
+        with patch("shieldops.cache.l1.time") as mock_time:
+            mock_time.monotonic.return_value = time.monotonic() + 100
+            assert store.get("k") == (False, None)
+        assert len(store) == 0
+
+    def test_entry_count_bounded(self) -> None:
+        store = _store(max_size=10)
+        for i in range(100):
+            store.put(f"k{i}", i, 60, "ns")
+        assert len(store) <= 10
+
+    def test_byte_budget_bounded(self) -> None:
+        store = _store(max_bytes=10_000, max_size=1000)
+        for i in range(50):
+            store.put(f"report{i}", "x" * 2000, 60, "reports")
+        assert store.stats()["bytes"] <= 10_000
+
+    def test_oversized_value_rejected(self) -> None:
+        store = _store(max_bytes=1000)
+        store.put("huge", "x" * 5000, 60, "ns")
+        assert store.get("huge") == (False, None)
+        assert store.stats()["rejections"] == 1
+
+    def test_hot_set_survives_scan(self) -> None:
+        store = _store(max_size=100)
+        hot = [f"hot{i}" for i in range(50)]
+        for _ in range(5):
+            for key in hot:
+                if not store.get(key)[0]:
+                    store.put(key, key, 60, "ns")
+        for i in range(1000):  # one-off scan, each key seen once
+            if not store.get(f"scan{i}")[0]:
+                store.put(f"scan{i}", i, 60, "ns")
+
+        survivors = sum(store.get(key)[0] for key in hot)
+        assert survivors >= 45
+
+    def test_lru_loses_hot_set_to_same_scan(self) -> None:
+        store = LRUStore(max_size=100)
+        hot = [f"hot{i}" for i in range(50)]
+        for key in hot:
+            store.put(key, key, 60, "ns")
+        for i in range(1000):
+            store.put(f"scan{i}", i, 60, "ns")
+        assert sum(store.get(key)[0] for key in hot) == 0
+
+    def test_namespace_budget_limits_one_namespace(self) -> None:
+        store = _store(max_bytes=1 << 20, max_size=1000, namespace_budgets={"reports": 5000})
+        store.put("config", "c", 60, "config")
+        for i in range(20):
+            store.put(f"r{i}", "x" * 1000, 60, "reports")
+
+        assert store.namespace_bytes()["reports"] <= 5000
+        assert store.get("r19")[0] is True
+        assert store.get("config") == (True, "c")
+
+    def test_remove_namespace_and_clear(self) -> None:
+        store = _store(shards=4)
+        for i in range(10):
+            store.put(f"a{i}", i, 60, "a")
+            store.put(f"b{i}", i, 60, "b")
+        assert store.remove_namespace("a") == 10
+        assert store.namespace_bytes().keys() == {"b"}
+        assert store.clear() == 10
+        assert len(store) == 0
+        assert store.stats()["bytes"] == 0
+
+    def test_update_in_place_tracks_bytes(self) -> None:
+        store = _store()
+        store.put("k", "x" * 100, 60, "ns")
+        before = store.stats()["bytes"]
+        store.put("k", "x" * 1000, 60, "ns")
+        assert store.stats()["bytes"] > before
+        assert store.get("k") == (True, "x" * 1000)
+        assert len(store) == 1
+
+    def test_sharding_spreads_keys(self) -> None:
+        store = _store(shards=8, max_size=800)
+        for i in range(400):
+            store.put(f"k{i}", i, 60, "ns")
+        assert sum(1 for shard in store._shards if shard.index) == 8
+
+
+# ── MultiLevelCache integration ──────────────────────────────────
+
+
+class TestMultiLevelTinyLFU:
+    @pytest.mark.asyncio
+    async def test_stats_report_policy_and_bytes(self) -> None:
+        cache = MultiLevelCache(AsyncMock(), l1_policy=L1Policy.TINYLFU, l1_max_bytes=1 << 20)
+        await cache.set("k", {"payload": "x" * 100})
+        assert await cache.get("k") == {"payload": "x" * 100}
+
+        stats = cache.get_stats()
+        assert stats.l1_policy == "tinylfu"
+        assert stats.l1_size == 1
+        assert 0 < stats.l1_bytes <= stats.l1_max_bytes == 1 << 20
+
+    def test_unknown_policy_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            MultiLevelCache(AsyncMock(), l1_policy="fifo")
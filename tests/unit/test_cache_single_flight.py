@@ -0,0 +1,358 @@
+"""Tests for cache stampede protection.
+
+Covers:
+- SingleFlight coalescing, error propagation and background refresh
+- SWREntry envelopes and XFetch early-refresh decisions
+- @cached single-flight, cross-process lock and stale-while-revalidate
+- MultiLevelCache coalesced L2 fetches and get_or_set
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shieldops.cache import decorators
+from shieldops.cache.decorators import cached, set_cache
+from shieldops.cache.multilevel_cache import MultiLevelCache
+from shieldops.cache.single_flight import SingleFlight, SWREntry, compute_with_lock
+
+
+class _DictCache:
+    """Minimal in-memory stand-in for RedisCache with lock support."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.locks: dict[str, str] = {}
+        self.get_calls = 0
+
+    async def get(self, key: str, namespace: str = "default") -> Any:
+        self.get_calls += 1
+        return self.store.get(f"{namespace}:{key}")
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, namespace: str = "default"
+    ) -> None:
+        self.store[f"{namespace}:{key}"] = value
+        self.ttls[f"{namespace}:{key}"] = ttl
+
+    async def acquire_lock(self, name: str, ttl_ms: int = 5000) -> str | None:
+        if name in self.locks:
+            return None
+        self.locks[name] = "tok"
+        return "tok"
+
+    async def release_lock(self, name: str, token: str) -> bool:
+        return self.locks.pop(name, None) == token
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Any:
+    set_cache(None)
+    decorators._flights = SingleFlight()
+    yield
+    set_cache(None)
+
+
+# ── SingleFlight ─────────────────────────────────────────────────
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        flights = SingleFlight()
+        calls = 0
+
+        async def work() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 42
+
+        results = await asyncio.gather(*(flights.do("k", work) for _ in range(10)))
+
+        assert results == [42] * 10
+        assert calls == 1
+        assert flights.stats()["coalesced"] == 9
+        assert not flights.in_flight("k")
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self) -> None:
+        flights = SingleFlight()
+
+        async def boom() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        results = await asyncio.gather(
+            *(flights.do("k", boom) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self) -> None:
+        flights = SingleFlight()
+        fn = AsyncMock(return_value=1)
+        await flights.do("k", fn)
+        await flights.do("k", fn)
+        assert fn.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_cancelled(self) -> None:
+        flights = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "leader"
+
+        leader = asyncio.create_task(flights.do("k", slow))
+        await started.wait()
+        waiter = asyncio.create_task(flights.do("k", AsyncMock(return_value="waiter")))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == "waiter"
+
+    @pytest.mark.asyncio
+    async def test_do_background_dedupes(self) -> None:
+        flights = SingleFlight()
+        gate = asyncio.Event()
+        fn = AsyncMock(side_effect=gate.wait)
+
+        assert flights.do_background("k", fn) is True
+        await asyncio.sleep(0)
+        assert flights.do_background("k", fn) is False
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert fn.await_count == 1
+
+
+# ── SWREntry ─────────────────────────────────────────────────────
+
+
+class TestSWREntry:
+    def test_wrap_unwrap_round_trip(self) -> None:
+        entry = SWREntry.unwrap(SWREntry.wrap({"a": 1}, ttl=60, delta=0.5))
+        assert entry is not None
+        assert entry.value == {"a": 1}
+        assert entry.delta == 0.5
+        assert not entry.is_stale()
+
+    def test_plain_value_is_not_envelope(self) -> None:
+        assert SWREntry.unwrap({"a": 1}) is None
+        assert SWREntry.unwrap([1, 2]) is None
+
+    def test_stale_always_refreshes(self) -> None:
+        entry = SWREntry("v", expires_at=time.time() - 1, delta=0.0)
+        assert entry.should_refresh(beta=0.0)
+
+    def test_far_from_expiry_never_refreshes(self) -> None:
+        entry = SWREntry("v", expires_at=time.time() + 3600, delta=0.001)
+        assert not any(entry.should_refresh(beta=1.0) for _ in range(200))
+
+    def test_near_expiry_with_costly_recompute_refreshes_early(self) -> None:
+        entry = SWREntry("v", expires_at=time.time() + 0.5, delta=5.0)
+        assert any(entry.should_refresh(beta=1.0) for _ in range(200))
+
+    def test_beta_zero_disables_early_refresh(self) -> None:
+        entry = SWREntry("v", expires_at=time.time() + 0.5, delta=5.0)
+        assert not entry.should_refresh(beta=0.0)
+
+
+# ── compute_with_lock ────────────────────────────────────────────
+
+
+class TestComputeWithLock:
+    @pytest.mark.asyncio
+    async def test_lock_holder_computes_and_releases(self) -> None:
+        cache = _DictCache()
+        compute = AsyncMock(return_value="v")
+
+        result = await compute_with_lock(cache, "k", compute, AsyncMock(), lock_ttl=1)
+
+        assert result == "v"
+        compute.assert_awaited_once()
+        assert cache.locks == {}
+
+    @pytest.mark.asyncio
+    async def test_loser_waits_for_published_value(self) -> None:
+        cache = _DictCache()
+        cache.locks["k"] = "other"
+        compute = AsyncMock(return_value="mine")
+        read = AsyncMock(side_effect=[None, "theirs"])
+
+        result = await compute_with_lock(cache, "k", compute, read, lock_ttl=1, poll_interval=0.001)
+
+        assert result == "theirs"
+        compute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_loser_computes_after_lock_ttl(self) -> None:
+        cache = _DictCache()
+        cache.locks["k"] = "other"
+        compute = AsyncMock(return_value="mine")
+
+        result = await compute_with_lock(
+            cache, "k", compute, AsyncMock(return_value=None), lock_ttl=0.02, poll_interval=0.005
+        )
+
+        assert result == "mine"
+
+
+# ── @cached ──────────────────────────────────────────────────────
+
+
+class TestCachedStampede:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self) -> None:
+        cache = _DictCache()
+        set_cache(cache)
+        calls = 0
+
+        @cached(ttl=60, namespace="inv")
+        async def list_investigations() -> list[str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["inv-1"]
+
+        results = await asyncio.gather(*(list_investigations() for _ in range(20)))
+
+        assert results == [["inv-1"]] * 20
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_single_flight_can_be_disabled(self) -> None:
+        set_cache(_DictCache())
+        calls = 0
+
+        @cached(ttl=60, single_flight=False)
+        async def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return 1
+
+        await asyncio.gather(fetch(), fetch())
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_lock_ttl_uses_cache_lock(self) -> None:
+        cache = _DictCache()
+        cache.acquire_lock = AsyncMock(return_value="tok")  # type: ignore[method-assign]
+        cache.release_lock = AsyncMock(return_value=True)  # type: ignore[method-assign]
+        set_cache(cache)
+
+        @cached(ttl=60, namespace="inv", lock_ttl=2)
+        async def fetch() -> int:
+            return 7
+
+        assert await fetch() == 7
+        cache.acquire_lock.assert_awaited_once()
+        assert cache.acquire_lock.await_args.kwargs["ttl_ms"] == 2000
+        cache.release_lock.assert_awaited_once()
+
+
+class TestCachedStaleWhileRevalidate:
+    @pytest.mark.asyncio
+    async def test_stores_envelope_with_extended_ttl(self) -> None:
+        cache = _DictCache()
+        set_cache(cache)
+
+        @cached(ttl=60, namespace="inv", stale_ttl=30)
+        async def fetch() -> str:
+            return "fresh"
+
+        assert await fetch() == "fresh"
+        (stored_key,) = cache.store
+        assert SWREntry.unwrap(cache.store[stored_key]) is not None
+        assert cache.ttls[stored_key] == 90
+
+    @pytest.mark.asyncio
+    async def test_serves_stale_and_refreshes_in_background(self) -> None:
+        cache = _DictCache()
+        set_cache(cache)
+        values = iter(["v1", "v2"])
+
+        @cached(ttl=60, namespace="inv", stale_ttl=30)
+        async def fetch() -> str:
+            return next(values)
+
+        assert await fetch() == "v1"
+        (stored_key,) = cache.store
+        cache.store[stored_key]["exp"] = time.time() - 1  # logically expired
+
+        assert await fetch() == "v1"  # stale value served immediately
+        await asyncio.sleep(0.01)  # let the background refresh run
+        assert SWREntry.unwrap(cache.store[stored_key]).value == "v2"
+        assert await fetch() == "v2"
+
+    @pytest.mark.asyncio
+    async def test_plain_cached_value_still_served(self) -> None:
+        cache = _DictCache()
+        set_cache(cache)
+
+        @cached(ttl=60, namespace="inv", stale_ttl=30)
+        async def fetch() -> str:
+            return "computed"
+
+        key = decorators._build_cache_key(fetch.__wrapped__, (), {})
+        cache.store[f"inv:{key}"] = "legacy"
+        assert await fetch() == "legacy"
+
+
+# ── MultiLevelCache ──────────────────────────────────────────────
+
+
+class TestMultiLevelCoalescing:
+    @pytest.mark.asyncio
+    async def test_concurrent_l1_misses_share_one_l2_get(self) -> None:
+        l2 = _DictCache()
+        l2.store["default:k"] = "v"
+        original_get = l2.get
+
+        async def slow_get(key: str, namespace: str = "default") -> Any:
+            await asyncio.sleep(0.01)
+            return await original_get(key, namespace)
+
+        l2.get = slow_get  # type: ignore[method-assign]
+        cache = MultiLevelCache(l2)
+
+        results = await asyncio.gather(*(cache.get("k") for _ in range(5)))
+
+        assert results == ["v"] * 5
+        assert l2.get_calls == 1
+        assert cache.get_stats().coalesced_requests == 4
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_computes_once(self) -> None:
+        l2 = _DictCache()
+        cache = MultiLevelCache(l2)
+        calls = 0
+
+        async def factory() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "computed"
+
+        results = await asyncio.gather(*(cache.get_or_set("k", factory) for _ in range(8)))
+
+        assert results == ["computed"] * 8
+        assert calls == 1
+        assert l2.store["default:k"] == "computed"
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_with_lock_delegates_to_l2(self) -> None:
+        l2 = _DictCache()
+        cache = MultiLevelCache(l2)
+
+        assert await cache.get_or_set("k", lambda: "sync", lock_ttl=1) == "sync"
+        assert l2.locks == {}
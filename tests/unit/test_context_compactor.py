@@ -0,0 +1,113 @@
+"""Tests for prompt token budgeting and log deduplication."""
+
+from __future__ import annotations
+
+from shieldops.utils.context_compactor import (
+    ContextBuilder,
+    dedup_log_entries,
+    log_template,
+)
+
+
+class TestLogTemplate:
+    def test_masks_variable_parts(self):
+        line = (
+            "2026-10-16T10:00:01Z req 3f2b6c1e-8a4d-4f5e-9b2a-1c3d5e7f9a0b "
+            "to 10.0.0.4:5432 took 3012ms"
+        )
+        assert log_template(line) == "<ts> req <uuid> to <ip> took <n>"
+
+    def test_same_shape_lines_share_a_template(self):
+        a = log_template("pod api-7d9f8b6c5-x2k4p restarted 3 times")
+        b = log_template("pod api-5c8d7f9b4-q7m2z restarted 14 times")
+        assert a == b
+
+    def test_keeps_http_status_codes(self):
+        assert log_template("upstream returned 503 after 1500ms") == (
+            "upstream returned 503 after <n>"
+        )
+
+
+class TestDedupLogEntries:
+    def test_groups_by_template_most_severe_first(self):
+        entries = [{"level": "info", "message": f"GET /health {i}"} for i in range(20)] + [
+            {"level": "error", "message": "timeout after 30s"},
+            {"level": "fatal", "message": "timeout after 45s"},
+        ]
+
+        groups = dedup_log_entries(entries)
+
+        assert len(groups) == 2
+        assert groups[0].level == "fatal"
+        assert groups[0].count == 2
+        assert groups[0].example == "timeout after 45s"
+        assert groups[1].count == 20
+
+    def test_http_status_codes_are_not_merged(self):
+        groups = dedup_log_entries(
+            [
+                {"level": "warning", "message": "GET /api returned 404 in 12ms"},
+                {"level": "error", "message": "GET /api returned 500 in 30ms"},
+            ]
+        )
+
+        assert [g.example for g in groups] == [
+            "GET /api returned 500 in 30ms",
+            "GET /api returned 404 in 12ms",
+        ]
+
+
+class TestContextBuilder:
+    def test_everything_fits(self):
+        builder = ContextBuilder("node", budget_tokens=1000)
+        builder.section("## Alert").require("Alert: x")
+        builder.section("## Items").add("- a", 1).add("- b", 2)
+
+        text, report = builder.build()
+
+        assert text == "## Alert\nAlert: x\n\n## Items\n- a\n- b"
+        assert report.items_dropped == 0
+
+    def test_budget_keeps_highest_scores_in_original_order(self):
+        builder = ContextBuilder("node", budget_tokens=32)
+        builder.section("## Items")
+        for i, score in enumerate([1, 9, 5, 8]):
+            builder.add(f"- item {i} " + "x" * 20, score)
+
+        text, report = builder.build()
+
+        assert [line[:8] for line in text.splitlines()[1:3]] == ["- item 1", "- item 3"]
+        assert "... 2 more omitted" in text
+        assert report.items_dropped == 2
+        assert report.prompt_tokens <= 32
+
+    def test_required_lines_survive_a_tiny_budget(self):
+        builder = ContextBuilder("node", budget_tokens=1)
+        builder.require("Alert: x").add("- optional", 100)
+
+        text, _ = builder.build()
+
+        assert text.startswith("Alert: x")
+        assert "- optional" not in text
+
+    def test_empty_sections_are_not_rendered(self):
+        builder = ContextBuilder("node", budget_tokens=1000)
+        builder.section("## Empty")
+        builder.section("## Full").add("- a", 1)
+
+        text, _ = builder.build()
+
+        assert "## Empty" not in text
+
+    def test_report_counts_tokens_saved_by_dedup(self):
+        builder = ContextBuilder("analyze_logs", budget_tokens=1000)
+        builder.add_logs(
+            {"level": "error", "message": f"connection refused to 10.0.0.{i}"} for i in range(100)
+        )
+
+        text, report = builder.build()
+
+        assert text == "[error] (x100) connection refused to 10.0.0.0"
+        assert report.lines_deduplicated == 99
+        assert report.raw_tokens > 10 * report.prompt_tokens
+        assert report.tokens_saved == report.raw_tokens - report.prompt_tokens
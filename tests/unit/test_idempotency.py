@@ -1,19 +1,22 @@
 """Tests for shieldops.api.middleware.idempotency module.
 
-Covers InMemoryIdempotencyStore, IdempotencyStore protocol, IdempotencyMiddleware,
-composite key building, TTL expiry, and cache replay behavior.
+Covers InMemoryIdempotencyStore, RedisIdempotencyStore, IdempotencyStore protocol,
+IdempotencyMiddleware, composite key building, TTL expiry, cache replay behavior,
+the body size cap, and coalescing of concurrent duplicates.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import time
 from typing import Any
 
+import httpx
 import pytest
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, PlainTextResponse
 from starlette.routing import Route
 from starlette.testclient import TestClient
 
@@ -24,6 +27,7 @@ from shieldops.api.middleware.idempotency import (
     IdempotencyMiddleware,
     IdempotencyStore,
     InMemoryIdempotencyStore,
+    RedisIdempotencyStore,
 )
 
 # ---------------------------------------------------------------------------
@@ -450,3 +454,163 @@ class TestIdempotencyMiddlewareTTL:
         app = Starlette(routes=[])
         middleware = IdempotencyMiddleware(app)
         assert middleware.ttl == DEFAULT_TTL
+
+
+# ---------------------------------------------------------------------------
+# IdempotencyMiddleware — raw replay, size cap, concurrent duplicates
+# ---------------------------------------------------------------------------
+
+
+class _FakeRedis:
+    """Minimal async Redis stand-in covering GET/SET(NX, EX)/DELETE."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None, nx: bool = False) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+def _counting_app(response: Any, **kwargs: Any) -> tuple[Starlette, dict[str, int]]:
+    calls = {"value": 0}
+
+    async def endpoint(request: Request) -> Any:
+        calls["value"] += 1
+        return response() if callable(response) else response
+
+    app = Starlette(routes=[Route("/api/test", endpoint, methods=["POST"])])
+    app.add_middleware(IdempotencyMiddleware, **kwargs)
+    return app, calls
+
+
+class TestIdempotencyMiddlewareRawReplay:
+    """Responses are stored and replayed as raw bytes and headers."""
+
+    def test_non_json_response_replayed_verbatim(self) -> None:
+        app, calls = _counting_app(
+            lambda: PlainTextResponse("line 1\nline 2", headers={"X-Custom": "a"})
+        )
+        client = TestClient(app)
+
+        resp1 = client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"})
+        resp2 = client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"})
+
+        assert calls["value"] == 1
+        assert resp2.content == resp1.content == b"line 1\nline 2"
+        assert resp2.headers["x-custom"] == "a"
+        assert resp2.headers["content-type"] == resp1.headers["content-type"]
+
+    def test_oversized_response_not_stored_and_not_rerun(self) -> None:
+        app, calls = _counting_app(lambda: PlainTextResponse("x" * 100), max_body_bytes=10)
+        client = TestClient(app)
+
+        assert client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"}).text == "x" * 100
+        resp = client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"})
+
+        assert resp.status_code == 409
+        assert calls["value"] == 1
+
+    def test_server_error_can_be_retried(self) -> None:
+        app, calls = _counting_app(lambda: JSONResponse({"error": "boom"}, status_code=503))
+        client = TestClient(app)
+
+        client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"})
+        client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"})
+
+        assert calls["value"] == 2
+
+
+class TestIdempotencyMiddlewareConcurrency:
+    """Duplicates that arrive mid-flight wait for the original's response."""
+
+    @staticmethod
+    def _slow_app(store: IdempotencyStore, release: asyncio.Event) -> tuple[Any, dict[str, int]]:
+        calls = {"value": 0}
+
+        async def endpoint(request: Request) -> JSONResponse:
+            calls["value"] += 1
+            await release.wait()
+            return JSONResponse({"call_count": calls["value"]}, status_code=201)
+
+        app = Starlette(routes=[Route("/api/test", endpoint, methods=["POST"])])
+        return IdempotencyMiddleware(app, store=store, wait_timeout=5), calls
+
+    @pytest.mark.asyncio
+    async def test_local_duplicates_coalesce(self) -> None:
+        release = asyncio.Event()
+        app, calls = self._slow_app(InMemoryIdempotencyStore(), release)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            pending = [
+                asyncio.create_task(client.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"}))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            responses = await asyncio.gather(*pending)
+
+        assert calls["value"] == 1
+        assert {r.status_code for r in responses} == {201}
+        assert sum(r.headers.get("x-idempotency-replayed") == "true" for r in responses) == 4
+
+    @pytest.mark.asyncio
+    async def test_duplicate_on_other_worker_waits_via_shared_store(self) -> None:
+        store = RedisIdempotencyStore(_FakeRedis())  # type: ignore[arg-type]
+        release = asyncio.Event()
+        worker_a, calls = self._slow_app(store, release)
+        worker_b, _ = self._slow_app(store, release)
+
+        async with (
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=worker_a), base_url="http://a"
+            ) as a,
+            httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=worker_b), base_url="http://b"
+            ) as b,
+        ):
+            first = asyncio.create_task(a.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"}))
+            await asyncio.sleep(0.05)
+            second = asyncio.create_task(b.post("/api/test", headers={IDEMPOTENCY_HEADER: "k"}))
+            await asyncio.sleep(0.05)
+            release.set()
+            resp_a, resp_b = await asyncio.gather(first, second)
+
+        assert calls["value"] == 1
+        assert resp_b.status_code == 201
+        assert resp_b.json() == resp_a.json()
+        assert resp_b.headers["x-idempotency-replayed"] == "true"
+
+
+class TestRedisIdempotencyStore:
+    """Tests for the shared Redis backend's encoding and claim semantics."""
+
+    @pytest.mark.asyncio
+    async def test_round_trips_raw_body(self) -> None:
+        store = RedisIdempotencyStore(_FakeRedis())  # type: ignore[arg-type]
+        entry = {"status_code": 200, "headers": [["x-a", "1"]], "body": b"\x00\n{raw}"}
+
+        await store.set("k", entry, ttl=60)
+
+        assert await store.get("k") == entry
+        assert isinstance(store, IdempotencyStore)
+
+    @pytest.mark.asyncio
+    async def test_add_only_when_absent(self) -> None:
+        redis = _FakeRedis()
+        store = RedisIdempotencyStore(redis)  # type: ignore[arg-type]
+
+        assert await store.add("k", {"status": "processing"}, ttl=60) is True
+        assert await store.add("k", {"status": "processing"}, ttl=60) is False
+        assert await store.get("k") == {"status": "processing"}
+        assert list(redis.data) == ["shieldops:idempotency:k"]
@@ -8,6 +8,8 @@ Tests cover:
 - API endpoints (routes/investigations.py)
 """
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -345,6 +347,108 @@ class TestInvestigationToolkit:
         assert 'pod="api-server"' in result
 
 
+def _delayed(result, delay: float = 0.05):
+    async def call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return result
+
+    return AsyncMock(side_effect=call)
+
+
+class TestToolkitFanOut:
+    @pytest.mark.asyncio
+    async def test_metric_queries_run_concurrently(self):
+        source = AsyncMock()
+        source.source_name = "prometheus"
+        source.query_instant = _delayed([{"value": 1.0}])
+        source.detect_anomalies = _delayed([])
+        toolkit = InvestigationToolkit(metric_sources=[source], max_concurrent_queries=8)
+
+        start = time.monotonic()
+        result = await toolkit.query_metrics("default/api-server")
+
+        # 4 metrics x 2 calls of 50ms each: sequential would take ~400ms
+        assert time.monotonic() - start < 0.2
+        assert len(result["current_values"]) == 4
+        assert result["source_status"] == {"prometheus": "ok"}
+        assert result["source_latency_ms"]["prometheus"] >= 50
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def track(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        source = AsyncMock()
+        source.source_name = "prometheus"
+        source.query_instant = AsyncMock(side_effect=track)
+        source.detect_anomalies = AsyncMock(side_effect=track)
+        toolkit = InvestigationToolkit(metric_sources=[source], max_concurrent_queries=3)
+
+        await toolkit.query_metrics("default/api-server")
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_without_losing_others(self, mock_log_source):
+        slow = AsyncMock()
+        slow.source_name = "splunk"
+        slow.query_logs = _delayed([{"message": "late", "level": "error"}], delay=5)
+        toolkit = InvestigationToolkit(log_sources=[mock_log_source, slow], source_timeout=0.05)
+
+        result = await toolkit.query_logs("default/api-server")
+
+        assert result["total_entries"] == 2
+        assert result["source_status"] == {"kubernetes": "ok", "splunk": "timeout"}
+        assert result["sources_queried"] == ["kubernetes", "splunk"]
+
+    @pytest.mark.asyncio
+    async def test_slow_source_does_not_starve_others_of_slots(self, mock_log_source):
+        slow = AsyncMock()
+        slow.source_name = "splunk"
+        slow.query_logs = _delayed([], delay=5)
+        toolkit = InvestigationToolkit(
+            log_sources=[slow, mock_log_source],
+            source_timeout=0.05,
+            max_concurrent_queries=1,
+        )
+
+        result = await toolkit.query_logs("default/api-server")
+
+        assert result["source_status"] == {"splunk": "timeout", "kubernetes": "ok"}
+        assert result["total_entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_results_before_deadline_are_kept(self):
+        source = AsyncMock()
+        source.source_name = "prometheus"
+        source.query_instant = _delayed([{"value": 2.0}], delay=0)
+        source.detect_anomalies = _delayed([], delay=5)
+        toolkit = InvestigationToolkit(metric_sources=[source], source_timeout=0.05)
+
+        result = await toolkit.query_metrics("default/api-server", metric_names=["up"])
+
+        assert result["current_values"] == {"up": 2.0}
+        assert result["source_status"] == {"prometheus": "timeout"}
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_keeps_successful_calls(self, mock_metric_source):
+        mock_metric_source.detect_anomalies = AsyncMock(side_effect=ConnectionError("refused"))
+        toolkit = InvestigationToolkit(metric_sources=[mock_metric_source])
+
+        result = await toolkit.query_metrics("default/api-server", metric_names=["a", "b"])
+
+        assert result["current_values"] == {"a": 1073741824, "b": 1073741824}
+        assert result["anomaly_count"] == 0
+        assert result["source_status"] == {"prometheus": "partial"}
+
+
 # ============================================================================
 # Node tests
 # ============================================================================
@@ -466,6 +570,43 @@ class TestAnalyzeLogsNode:
 
         set_toolkit(None)
 
+    @pytest.mark.asyncio
+    async def test_analyze_logs_compacts_repeated_lines(self, investigation_state):
+        """Repeated log lines reach the LLM once, with a count and the tokens saved."""
+        from shieldops.agents.investigation.nodes import analyze_logs, set_toolkit
+
+        source = AsyncMock()
+        source.source_name = "kubernetes"
+        source.query_logs = AsyncMock(
+            return_value=[
+                {"message": f"upstream timeout after {i}ms to 10.0.0.{i % 9}", "level": "error"}
+                for i in range(150)
+            ]
+        )
+        source.search_patterns = AsyncMock(return_value={})
+        set_toolkit(InvestigationToolkit(log_sources=[source]))
+
+        llm = AsyncMock(
+            return_value=LogAnalysisResult(
+                summary="timeouts",
+                error_patterns=[],
+                severity="error",
+                root_cause_hints=[],
+                affected_services=[],
+            )
+        )
+        with patch("shieldops.agents.investigation.nodes.llm_structured", llm):
+            result = await analyze_logs(investigation_state)
+
+        prompt = llm.call_args.kwargs["user_prompt"]
+        assert prompt.count("upstream timeout") == 1
+        assert "(x150)" in prompt
+        step = result["reasoning_chain"][-1]
+        assert step.prompt_tokens > 0
+        assert step.prompt_tokens_saved > step.prompt_tokens
+
+        set_toolkit(None)
+
 
 class TestAnalyzeMetricsNode:
     @pytest.mark.asyncio
@@ -705,6 +846,66 @@ class TestGraphConstruction:
         compiled = graph.compile()
         assert compiled is not None
 
+    @pytest.mark.asyncio
+    async def test_log_and_metric_analysis_run_in_parallel(self, investigation_state):
+        from shieldops.agents.investigation.graph import create_investigation_graph
+        from shieldops.agents.investigation.nodes import set_toolkit
+
+        log_source = AsyncMock()
+        log_source.source_name = "loki"
+        log_source.query_logs = _delayed([], delay=0.2)
+        log_source.search_patterns = AsyncMock(return_value={})
+        metric_source = AsyncMock()
+        metric_source.source_name = "prometheus"
+        metric_source.query_instant = _delayed([], delay=0.2)
+        metric_source.detect_anomalies = _delayed([], delay=0.2)
+        set_toolkit(
+            InvestigationToolkit(
+                log_sources=[log_source],
+                metric_sources=[metric_source],
+                max_concurrent_queries=16,
+            )
+        )
+        try:
+            app = create_investigation_graph().compile()
+            with patch(
+                "shieldops.agents.investigation.nodes.llm_structured",
+                new_callable=AsyncMock,
+                side_effect=Exception("LLM unavailable"),
+            ):
+                start = time.monotonic()
+                result = await app.ainvoke(investigation_state)
+                elapsed = time.monotonic() - start
+        finally:
+            set_toolkit(None)
+
+        assert elapsed < 0.35
+        steps = result["reasoning_chain"]
+        assert [s.step_number for s in steps] == list(range(1, len(steps) + 1))
+        actions = [s.action for s in steps]
+        assert set(actions[2:4]) == {"analyze_logs", "analyze_metrics"}
+        assert actions[4:] == ["correlate_findings", "generate_hypotheses"]
+        metrics_step = next(s for s in steps if s.action == "analyze_metrics")
+        assert set(metrics_step.source_latency_ms) == {"prometheus"}
+
+    def test_merge_reasoning_chain_appends_parallel_steps(self):
+        from shieldops.agents.investigation.models import merge_reasoning_chain
+
+        def step(n: int, action: str) -> ReasoningStep:
+            return ReasoningStep(
+                step_number=n, action=action, input_summary="", output_summary="", duration_ms=0
+            )
+
+        base = [step(1, "gather_context")]
+        merged = merge_reasoning_chain(base, [*base, step(2, "analyze_logs")])
+        merged = merge_reasoning_chain(merged, [*base, step(2, "analyze_metrics")])
+
+        assert [(s.step_number, s.action) for s in merged] == [
+            (1, "gather_context"),
+            (2, "analyze_logs"),
+            (3, "analyze_metrics"),
+        ]
+
 
 # ============================================================================
 # Runner tests
@@ -0,0 +1,234 @@
+"""Tests for concurrent, partition-parallel consumption in EventConsumer."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import TopicPartition
+
+from shieldops.messaging.consumer import (
+    EventConsumer,
+    PartitionOffsetTracker,
+    event_ordering_key,
+)
+from shieldops.messaging.dlq import DeadLetterQueue
+from shieldops.messaging.topics import EventEnvelope
+
+TOPIC = "shieldops.events"
+TP0 = TopicPartition(TOPIC, 0)
+
+
+class _FakeKafkaConsumer:
+    """Serves pre-built ``getmany`` batches, then idles."""
+
+    def __init__(self, batches: list[dict[Any, list[Any]]]) -> None:
+        self._batches = deque(batches)
+        self.commits: list[dict[Any, int]] = []
+        self.paused: list[Any] = []
+        self.resumed: list[Any] = []
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int | None = None) -> dict:
+        if self._batches:
+            return self._batches.popleft()
+        await asyncio.sleep(timeout_ms / 1000)
+        return {}
+
+    async def commit(self, offsets: dict[Any, int]) -> None:
+        self.commits.append(dict(offsets))
+
+    def pause(self, *partitions: Any) -> None:
+        self.paused.extend(partitions)
+
+    def resume(self, *partitions: Any) -> None:
+        self.resumed.extend(partitions)
+
+
+def _msg(offset: int, partition: int = 0, **payload: Any) -> SimpleNamespace:
+    event = EventEnvelope(event_type="alert.fired", source="test", payload=payload)
+    return SimpleNamespace(topic=TOPIC, partition=partition, offset=offset, value=event)
+
+
+def _consumer(batches: list[dict[Any, list[Any]]], **kwargs: Any) -> EventConsumer:
+    consumer = EventConsumer(
+        brokers="broker:9092", group_id="grp", topics=[TOPIC], enable_auto_commit=False, **kwargs
+    )
+    consumer._consumer = _FakeKafkaConsumer(batches)
+    return consumer
+
+
+async def _run_until(consumer: EventConsumer, handler: Any, done: Any, **kwargs: Any) -> None:
+    kwargs.setdefault("timeout_ms", 5)
+    task = asyncio.create_task(consumer.consume_concurrent(handler, **kwargs))
+    for _ in range(200):
+        if done():
+            break
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class TestEventOrderingKey:
+    def test_prefers_resource_then_correlation(self) -> None:
+        ev = EventEnvelope(event_type="t", source="s", payload={"resource_id": "pod-1"})
+        assert event_ordering_key(ev) == "resource:pod-1"
+        ev = EventEnvelope(event_type="t", source="s", correlation_id="c-1")
+        assert event_ordering_key(ev) == "correlation:c-1"
+        ev = EventEnvelope(event_type="t", source="s")
+        assert event_ordering_key(ev) == f"event:{ev.event_id}"
+
+
+class TestPartitionOffsetTracker:
+    def test_commit_stops_at_lowest_unfinished(self) -> None:
+        tracker = PartitionOffsetTracker()
+        for offset in (10, 11, 12):
+            tracker.track(TP0, offset)
+        tracker.complete(TP0, 11)
+        tracker.complete(TP0, 12)
+        assert tracker.committable() == {TP0: 10}
+
+        tracker.complete(TP0, 10)
+        assert tracker.committable() == {TP0: 13}
+
+    def test_only_advanced_partitions_reported(self) -> None:
+        tracker = PartitionOffsetTracker()
+        tracker.track(TP0, 0)
+        tracker.complete(TP0, 0)
+        tracker.mark_committed(tracker.committable())
+        assert tracker.committable() == {}
+
+
+class TestConsumeConcurrent:
+    @pytest.mark.asyncio
+    async def test_slow_handler_does_not_block_other_keys(self) -> None:
+        release = asyncio.Event()
+        handled: list[str] = []
+
+        async def handler(event: EventEnvelope) -> None:
+            if event.payload["resource_id"] == "slow":
+                await release.wait()
+            handled.append(event.payload["resource_id"])
+
+        batch = {TP0: [_msg(0, resource_id="slow"), _msg(1, resource_id="fast")]}
+        consumer = _consumer([batch])
+        task = asyncio.create_task(consumer.consume_concurrent(handler, timeout_ms=5))
+        for _ in range(100):
+            if handled:
+                break
+            await asyncio.sleep(0.005)
+
+        assert handled == ["fast"]
+        release.set()
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert handled == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_same_key_processed_in_order(self) -> None:
+        order: list[int] = []
+        delays = {0: 0.03, 1: 0.0, 2: 0.01}
+
+        async def handler(event: EventEnvelope) -> None:
+            seq = event.payload["seq"]
+            await asyncio.sleep(delays[seq])
+            order.append(seq)
+
+        # Same resource split across two partitions and two fetches.
+        batches = [
+            {TP0: [_msg(0, resource_id="db", seq=0)]},
+            {TopicPartition(TOPIC, 1): [_msg(0, partition=1, resource_id="db", seq=1)]},
+            {TP0: [_msg(1, resource_id="db", seq=2)]},
+        ]
+        consumer = _consumer(batches)
+        await _run_until(consumer, handler, lambda: len(order) == 3)
+
+        assert order == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_bounded_per_partition(self) -> None:
+        release = asyncio.Event()
+        active = 0
+        peak = 0
+        handled = 0
+
+        async def handler(event: EventEnvelope) -> None:
+            nonlocal active, peak, handled
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            active -= 1
+            handled += 1
+
+        batch = {TP0: [_msg(i, resource_id=f"r{i}") for i in range(5)]}
+        consumer = _consumer([batch])
+        task = asyncio.create_task(
+            consumer.consume_concurrent(handler, max_in_flight_per_partition=2, timeout_ms=5)
+        )
+        await asyncio.sleep(0.02)
+        fake = consumer._consumer
+
+        assert peak == 2
+        assert fake.paused == [TP0]
+        release.set()
+        for _ in range(100):
+            if handled == 5:
+                break
+            await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert handled == 5
+        assert peak == 2
+        assert fake.resumed == [TP0]
+
+    @pytest.mark.asyncio
+    async def test_commits_only_up_to_lowest_unfinished_offset(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(event: EventEnvelope) -> None:
+            if event.payload["resource_id"] == "r0":
+                await release.wait()
+
+        batch = {TP0: [_msg(i, resource_id=f"r{i}") for i in range(3)]}
+        consumer = _consumer([batch])
+        task = asyncio.create_task(
+            consumer.consume_concurrent(handler, commit_interval_s=0, timeout_ms=5)
+        )
+        await asyncio.sleep(0.03)
+        fake = consumer._consumer
+
+        # Offsets 1 and 2 finished, but 0 is still running.
+        assert fake.commits == [{TP0: 0}]
+        release.set()
+        await asyncio.sleep(0.03)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert fake.commits[-1] == {TP0: 3}
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_go_through_dlq_and_still_commit(self) -> None:
+        dlq = DeadLetterQueue(producer=AsyncMock(), max_retries=1)
+        dlq.send_to_dlq = AsyncMock()  # type: ignore[method-assign]
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+
+        consumer = _consumer([{TP0: [_msg(0, resource_id="r")]}], dlq=dlq)
+        await _run_until(consumer, handler, lambda: dlq.send_to_dlq.await_count == 1)
+
+        dlq.send_to_dlq.assert_awaited_once()
+        assert consumer._consumer.commits[-1] == {TP0: 1}
+
+    @pytest.mark.asyncio
+    async def test_not_started_returns_immediately(self) -> None:
+        consumer = EventConsumer(brokers="b", group_id="g", topics=[TOPIC])
+        handler = AsyncMock()
+        await consumer.consume_concurrent(handler)
+        handler.assert_not_awaited()
@@ -0,0 +1,152 @@
+"""Tests for binary, schema-versioned event encoding and lazy decoding."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import msgpack
+import pytest
+from aiokafka import TopicPartition
+
+from shieldops.messaging.consumer import EventConsumer
+from shieldops.messaging.producer import EventProducer
+from shieldops.messaging.topics import (
+    BINARY_MAGIC,
+    EVENT_SCHEMA_VERSION,
+    EVENTS_TOPIC,
+    EventEncoding,
+    EventEnvelope,
+    decode_event_lazy,
+    deserialize_event,
+    encode_event,
+    serialize_event,
+)
+
+
+def _event(**kwargs: object) -> EventEnvelope:
+    defaults: dict[str, object] = {
+        "event_type": "alert.triggered",
+        "source": "prometheus",
+        "payload": {"alert_id": "a-1", "value": 95.3, "labels": {"pod": "web-0"}},
+        "correlation_id": "corr-1",
+    }
+    return EventEnvelope(**{**defaults, **kwargs})  # type: ignore[arg-type]
+
+
+class TestBinaryEncoding:
+    def test_frame_starts_with_magic_and_version(self) -> None:
+        data = encode_event(_event(), EventEncoding.MSGPACK)
+        assert data[0] == BINARY_MAGIC
+        assert data[1] == EVENT_SCHEMA_VERSION
+
+    def test_round_trip_matches_json_path(self) -> None:
+        original = _event(timestamp=datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=UTC))
+        from_binary = deserialize_event(encode_event(original, EventEncoding.MSGPACK))
+        from_json = deserialize_event(serialize_event(original))
+        assert from_binary.model_dump() == from_json.model_dump() == original.model_dump()
+
+    def test_smaller_than_json(self) -> None:
+        event = _event()
+        assert len(encode_event(event, "msgpack")) < len(serialize_event(event))
+
+    def test_non_msgpack_payload_values_encode_like_json(self) -> None:
+        ts = datetime(2025, 1, 1, tzinfo=UTC)
+        event = _event(payload={"seen_at": ts, "tags": {"a"}})
+        decoded = deserialize_event(encode_event(event, EventEncoding.MSGPACK))
+        assert decoded.payload == {"seen_at": ts.isoformat().replace("+00:00", "Z"), "tags": ["a"]}
+
+    def test_json_encoding_is_default(self) -> None:
+        event = _event()
+        assert encode_event(event) == serialize_event(event)
+
+    def test_unknown_schema_version_rejected(self) -> None:
+        data = bytearray(encode_event(_event(), EventEncoding.MSGPACK))
+        data[1] = EVENT_SCHEMA_VERSION + 1
+        with pytest.raises(ValueError, match="schema version"):
+            deserialize_event(bytes(data))
+
+    def test_malformed_frame_rejected(self) -> None:
+        data = bytes((BINARY_MAGIC, EVENT_SCHEMA_VERSION)) + msgpack.packb([1, 2])
+        with pytest.raises(ValueError, match="malformed"):
+            deserialize_event(data)
+
+
+class TestLazyDecoding:
+    def test_header_available_without_payload_decode(self) -> None:
+        event = _event()
+        lazy = decode_event_lazy(encode_event(event, EventEncoding.MSGPACK))
+
+        assert lazy.event_type == "alert.triggered"
+        assert lazy.event_id == event.event_id
+        assert lazy.payload_decoded is False
+
+        assert lazy.payload == event.payload
+        assert lazy.payload_decoded is True
+        assert lazy.envelope().timestamp == event.timestamp
+
+    def test_json_frames_decode_eagerly(self) -> None:
+        lazy = decode_event_lazy(serialize_event(_event()))
+        assert lazy.payload_decoded is True
+        assert lazy.envelope().payload["alert_id"] == "a-1"
+
+
+class TestProducerEncodings:
+    @pytest.mark.asyncio
+    async def test_binary_topic_sends_encoded_bytes(self) -> None:
+        producer = EventProducer(brokers="b", encodings={EVENTS_TOPIC: "msgpack"})
+        producer._producer = AsyncMock()
+        event = _event()
+
+        await producer.publish(EVENTS_TOPIC, event)
+        await producer.publish("shieldops.audit", event)
+
+        binary, json_call = producer._producer.send_and_wait.await_args_list
+        assert deserialize_event(binary.kwargs["value"]).event_id == event.event_id
+        assert binary.kwargs["value"][0] == BINARY_MAGIC
+        assert json_call.kwargs["value"] is event
+        assert producer.encoding_for("shieldops.audit") == EventEncoding.JSON
+
+    def test_unknown_encoding_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            EventProducer(brokers="b", encodings={EVENTS_TOPIC: "avro"})
+
+
+class TestConsumerEventTypeFilter:
+    def test_filtered_events_skip_payload_decode(self) -> None:
+        consumer = EventConsumer(
+            brokers="b", group_id="g", topics=[EVENTS_TOPIC], event_types={"alert.triggered"}
+        )
+        wanted = encode_event(_event(), EventEncoding.MSGPACK)
+        other = encode_event(_event(event_type="audit.login"), EventEncoding.MSGPACK)
+
+        with patch("shieldops.messaging.topics.msgpack.unpackb", wraps=msgpack.unpackb) as unpack:
+            assert consumer._deserialize(other) is None
+            assert unpack.call_count == 1  # header only
+
+        assert consumer._deserialize(wanted).payload["alert_id"] == "a-1"
+
+    def test_no_filter_decodes_everything(self) -> None:
+        consumer = EventConsumer(brokers="b", group_id="g", topics=[EVENTS_TOPIC])
+        data = encode_event(_event(event_type="audit.login"), EventEncoding.MSGPACK)
+        assert consumer._deserialize(data).event_type == "audit.login"
+
+    @pytest.mark.asyncio
+    async def test_filtered_messages_are_skipped_but_committed(self) -> None:
+        consumer = EventConsumer(
+            brokers="b", group_id="g", topics=[EVENTS_TOPIC], enable_auto_commit=False
+        )
+        handler = AsyncMock()
+        message = SimpleNamespace(topic=EVENTS_TOPIC, partition=0, offset=4, value=None)
+
+        await consumer._process_message(handler, message)
+        handler.assert_not_awaited()
+
+        fake = AsyncMock()
+        fake.getmany.side_effect = [{TopicPartition(EVENTS_TOPIC, 0): [message]}, {}]
+        consumer._consumer = fake
+        task = consumer.consume_concurrent(handler, commit_interval_s=0, timeout_ms=0)
+        with pytest.raises(StopAsyncIteration):
+            await task
+        fake.commit.assert_awaited_with({TopicPartition(EVENTS_TOPIC, 0): 5})
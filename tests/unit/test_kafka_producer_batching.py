@@ -0,0 +1,170 @@
+"""Tests for batched, non-blocking publishing in EventProducer."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shieldops.messaging.bus import EventBus
+from shieldops.messaging.producer import EventProducer, ProducerBufferFullError
+from shieldops.messaging.topics import AUDIT_TOPIC, EVENTS_TOPIC, EventEnvelope
+
+
+class _FakeKafkaProducer:
+    """``send`` enqueues and returns a delivery future the test resolves."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, Any, Any]] = []
+        self.deliveries: list[asyncio.Future[Any]] = []
+        self.send_and_wait = AsyncMock()
+        self.flush = AsyncMock()
+
+    async def send(self, topic: str, value: Any = None, key: Any = None) -> asyncio.Future[Any]:
+        self.sent.append((topic, value, key))
+        fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self.deliveries.append(fut)
+        return fut
+
+    def ack_all(self) -> None:
+        for i, fut in enumerate(self.deliveries):
+            if not fut.done():
+                fut.set_result(MagicMock(offset=i))
+
+
+def _event(n: int = 0) -> EventEnvelope:
+    return EventEnvelope(event_type="audit.test", source="unit", payload={"n": n})
+
+
+def _producer(**kwargs: Any) -> tuple[EventProducer, _FakeKafkaProducer]:
+    producer = EventProducer(brokers="broker:9092", **kwargs)
+    fake = _FakeKafkaProducer()
+    producer._producer = fake
+    return producer, fake
+
+
+class TestProducerConfig:
+    @pytest.mark.asyncio
+    @patch("shieldops.messaging.producer.AIOKafkaProducer")
+    async def test_batching_options_passed_to_client(self, mock_kafka_cls):
+        mock_kafka_cls.return_value = AsyncMock()
+        producer = EventProducer(
+            brokers="b:9092", linger_ms=20, max_batch_size=65536, compression_type="gzip"
+        )
+        await producer.start()
+
+        kwargs = mock_kafka_cls.call_args.kwargs
+        assert kwargs["linger_ms"] == 20
+        assert kwargs["max_batch_size"] == 65536
+        assert kwargs["compression_type"] == "gzip"
+
+    def test_bus_forwards_producer_options(self):
+        bus = EventBus(brokers="b:9092", group_id="g", producer_options={"linger_ms": 50})
+        assert bus.producer._linger_ms == 50
+
+
+class TestPublishNowait:
+    @pytest.mark.asyncio
+    async def test_returns_before_delivery(self):
+        producer, fake = _producer()
+        delivery = await producer.publish_nowait(EVENTS_TOPIC, _event(), key="pod-1")
+
+        assert not delivery.done()
+        assert fake.sent[0][0] == EVENTS_TOPIC
+        assert fake.sent[0][2] == b"pod-1"
+        assert producer.buffered == 1
+        fake.send_and_wait.assert_not_awaited()
+
+        fake.ack_all()
+        await delivery
+        await asyncio.sleep(0)  # let done-callbacks run
+        assert producer.buffered == 0
+
+    @pytest.mark.asyncio
+    async def test_delivery_failure_is_counted_and_raised(self):
+        producer, fake = _producer()
+        delivery = await producer.publish_nowait(EVENTS_TOPIC, _event())
+        fake.deliveries[0].set_exception(ConnectionError("broker gone"))
+
+        with pytest.raises(ConnectionError):
+            await delivery
+        await asyncio.sleep(0)  # let done-callbacks run
+        assert producer.delivery_failures == 1
+        assert producer.buffered == 0
+
+    @pytest.mark.asyncio
+    async def test_not_started_returns_resolved_future(self):
+        producer = EventProducer(brokers="b:9092")
+        delivery = await producer.publish_nowait(EVENTS_TOPIC, _event())
+        assert delivery.done() and delivery.result() is None
+
+
+class TestBackpressure:
+    @pytest.mark.asyncio
+    async def test_full_buffer_blocks_until_delivery(self):
+        producer, fake = _producer(max_buffered_messages=2)
+        await producer.publish_nowait(EVENTS_TOPIC, _event(0))
+        await producer.publish_nowait(EVENTS_TOPIC, _event(1))
+
+        third = asyncio.create_task(producer.publish_nowait(EVENTS_TOPIC, _event(2)))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        fake.deliveries[0].set_result(MagicMock())
+        await asyncio.wait_for(third, 1)
+        assert len(fake.sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_buffer_timeout_raises(self):
+        producer, _ = _producer(max_buffered_messages=1, buffer_timeout_s=0.01)
+        await producer.publish_nowait(EVENTS_TOPIC, _event())
+
+        with pytest.raises(ProducerBufferFullError):
+            await producer.publish_nowait(EVENTS_TOPIC, _event())
+        assert producer.buffered == 1
+
+
+class TestPublishMany:
+    @pytest.mark.asyncio
+    async def test_enqueues_all_before_waiting(self):
+        producer, fake = _producer()
+        events = [_event(i) for i in range(5)]
+
+        task = asyncio.create_task(producer.publish_many(AUDIT_TOPIC, events))
+        await asyncio.sleep(0.01)
+        # Every event is handed to the accumulator before any ack arrives.
+        assert len(fake.sent) == 5
+        assert not task.done()
+
+        fake.ack_all()
+        futures = await task
+        assert [f.result().offset for f in futures] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_no_wait_returns_futures(self):
+        producer, fake = _producer()
+        futures = await producer.publish_many(AUDIT_TOPIC, [_event(), _event()], wait=False)
+        assert len(futures) == 2
+        assert not any(f.done() for f in futures)
+        fake.ack_all()
+
+
+class TestConveniencePublishers:
+    @pytest.mark.asyncio
+    async def test_audit_without_wait_skips_send_and_wait(self):
+        producer, fake = _producer()
+        envelope = await producer.publish_audit("pod.restarted", {"pod": "a"}, wait=False)
+
+        assert envelope.event_type == "audit.pod.restarted"
+        assert fake.sent[0][0] == AUDIT_TOPIC
+        fake.send_and_wait.assert_not_awaited()
+        fake.ack_all()
+
+    @pytest.mark.asyncio
+    async def test_result_defaults_to_waiting(self):
+        producer, fake = _producer()
+        await producer.publish_result("investigation", {"ok": True})
+        fake.send_and_wait.assert_awaited_once()
+        assert fake.sent == []
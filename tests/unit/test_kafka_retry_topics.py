@@ -0,0 +1,438 @@
+"""Tests for delay-retry topics and bulk DLQ replay."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiokafka import TopicPartition
+
+from shieldops.messaging import consumer as consumer_module
+from shieldops.messaging.consumer import EventConsumer
+from shieldops.messaging.dlq import DeadLetterQueue
+from shieldops.messaging.dlq_consumer import DLQConsumer
+from shieldops.messaging.producer import EventProducer
+from shieldops.messaging.retry import (
+    HEADER_ORIGINAL_TOPIC,
+    HEADER_RETRY_COUNT,
+    RetryMetadata,
+    RetryTopicConsumer,
+    retry_topic_name,
+    retry_topics,
+)
+from shieldops.messaging.topics import DLQ_TOPIC, DLQEnvelope, EventEnvelope
+
+EVENTS = "shieldops.events"
+RETRY_10S = TopicPartition("shieldops.retry.10s", 0)
+
+
+def _event(**payload: Any) -> EventEnvelope:
+    return EventEnvelope(event_type="alert.fired", source="test", payload=payload)
+
+
+def _msg(
+    value: Any,
+    *,
+    topic: str = EVENTS,
+    offset: int = 0,
+    headers: list[tuple[str, bytes]] | None = None,
+    key: bytes | None = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        topic=topic,
+        partition=0,
+        offset=offset,
+        value=value,
+        headers=headers or [],
+        key=key,
+    )
+
+
+class _FakeKafkaConsumer:
+    def __init__(self, batches: list[dict[Any, list[Any]]]) -> None:
+        self._batches = deque(batches)
+        self.commits: list[Any] = []
+        self.seeks: list[tuple[Any, int]] = []
+        self.paused: list[Any] = []
+        self.resumed: list[Any] = []
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int | None = None) -> dict:
+        return self._batches.popleft() if self._batches else {}
+
+    async def commit(self, offsets: Any = None) -> None:
+        self.commits.append(offsets)
+
+    def seek(self, tp: Any, offset: int) -> None:
+        self.seeks.append((tp, offset))
+
+    def pause(self, *partitions: Any) -> None:
+        self.paused.extend(partitions)
+
+    def resume(self, *partitions: Any) -> None:
+        self.resumed.extend(partitions)
+
+
+# ── Topics and headers ───────────────────────────────────────────────────────
+
+
+class TestRetryTopicNames:
+    def test_default_tiers(self) -> None:
+        assert retry_topics() == [
+            "shieldops.retry.10s",
+            "shieldops.retry.1m",
+            "shieldops.retry.10m",
+        ]
+
+    def test_uneven_delays_fall_back_to_seconds(self) -> None:
+        assert retry_topic_name(90) == "shieldops.retry.90s"
+        assert retry_topic_name(7200) == "shieldops.retry.2h"
+
+
+class TestRetryMetadata:
+    def test_headers_round_trip(self) -> None:
+        meta = RetryMetadata(
+            retry_count=2,
+            original_topic=EVENTS,
+            not_before_ms=123,
+            error_type="TimeoutError",
+            first_failed_at_ms=100,
+        )
+        assert RetryMetadata.from_headers(meta.to_headers()) == meta
+
+    def test_missing_or_malformed_headers_mean_first_attempt(self) -> None:
+        assert RetryMetadata.from_headers(None).retry_count == 0
+        assert RetryMetadata.from_headers([("trace-id", b"abc")]).retry_count == 0
+        assert RetryMetadata.from_headers([(HEADER_RETRY_COUNT, b"two")]).retry_count == 0
+
+
+# ── DeadLetterQueue.send_to_retry ────────────────────────────────────────────
+
+
+class TestSendToRetry:
+    @pytest.mark.asyncio
+    async def test_publishes_to_tier_with_headers(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        dlq = DeadLetterQueue(producer, retry_delays=(10, 60, 600))
+        event = _event()
+
+        before_ms = int(time.time() * 1000)
+        meta = await dlq.send_to_retry(event, RuntimeError("x"), EVENTS, 2, key="pod-1")
+
+        args, kwargs = producer.publish.call_args
+        assert args == ("shieldops.retry.1m", event)
+        assert kwargs["key"] == "pod-1"
+        assert RetryMetadata.from_headers(kwargs["headers"]) == meta
+        assert meta.original_topic == EVENTS
+        assert meta.not_before_ms >= before_ms + 60_000
+        assert meta.error_type == "RuntimeError"
+
+    def test_attempts_past_last_tier_reuse_it(self) -> None:
+        dlq = DeadLetterQueue(AsyncMock(), max_retries=5, retry_delays=(10, 60))
+        assert dlq.retry_topic_for(1) == "shieldops.retry.10s"
+        assert dlq.retry_topic_for(5) == "shieldops.retry.1m"
+
+    def test_no_tiers_configured(self) -> None:
+        dlq = DeadLetterQueue(AsyncMock())
+        assert dlq.retry_delays == ()
+        with pytest.raises(ValueError):
+            dlq.retry_topic_for(1)
+
+
+# ── EventConsumer routing ────────────────────────────────────────────────────
+
+
+class TestConsumerRetryRouting:
+    def _consumer(self, producer: Any, max_retries: int = 3) -> EventConsumer:
+        dlq = DeadLetterQueue(producer, max_retries=max_retries, retry_delays=(10, 60, 600))
+        return EventConsumer(brokers="b", group_id="g", topics=[EVENTS], dlq=dlq)
+
+    @pytest.mark.asyncio
+    async def test_first_failure_goes_to_first_tier(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        consumer = self._consumer(producer)
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+
+        await consumer._process_message(handler, _msg(_event(), key=b"pod-1"))
+
+        args, kwargs = producer.publish.call_args
+        assert args[0] == "shieldops.retry.10s"
+        assert kwargs["key"] == "pod-1"
+        meta = RetryMetadata.from_headers(kwargs["headers"])
+        assert meta.retry_count == 1
+        assert meta.original_topic == EVENTS
+        assert consumer._retry_counts == {}
+
+    @pytest.mark.asyncio
+    async def test_retry_count_comes_from_headers(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        consumer = self._consumer(producer)
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+        headers = RetryMetadata(
+            retry_count=1,
+            original_topic=EVENTS,
+            first_failed_at_ms=42,
+        ).to_headers()
+
+        await consumer._process_message(handler, _msg(_event(), headers=headers))
+
+        args, kwargs = producer.publish.call_args
+        assert args[0] == "shieldops.retry.1m"
+        meta = RetryMetadata.from_headers(kwargs["headers"])
+        assert meta.retry_count == 2
+        assert meta.first_failed_at_ms == 42
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_go_to_dlq_with_original_topic(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        consumer = self._consumer(producer, max_retries=3)
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+        headers = [(HEADER_RETRY_COUNT, b"3"), (HEADER_ORIGINAL_TOPIC, b"shieldops.audit")]
+
+        await consumer._process_message(handler, _msg(_event(), headers=headers))
+
+        args, _ = producer.publish.call_args
+        assert args[0] == DLQ_TOPIC
+        dlq_envelope = DLQEnvelope.model_validate(args[1].payload)
+        assert dlq_envelope.source_topic == "shieldops.audit"
+        assert dlq_envelope.retry_count == 4
+
+    @pytest.mark.asyncio
+    async def test_in_memory_tracker_is_bounded_without_tiers(self) -> None:
+        dlq = DeadLetterQueue(AsyncMock(spec=EventProducer), max_retries=100)
+        consumer = EventConsumer(brokers="b", group_id="g", topics=[EVENTS], dlq=dlq)
+        handler = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch.object(consumer_module, "_MAX_TRACKED_RETRIES", 5):
+            for _ in range(20):
+                await consumer._process_message(handler, _msg(_event()))
+
+        assert len(consumer._retry_counts) == 5
+
+
+# ── RetryTopicConsumer ───────────────────────────────────────────────────────
+
+
+class TestRetryTopicConsumer:
+    def _retry_consumer(
+        self, batches: list[dict[Any, list[Any]]], producer: Any
+    ) -> tuple[RetryTopicConsumer, _FakeKafkaConsumer]:
+        retry = RetryTopicConsumer(brokers="b", producer=producer, poll_timeout_ms=0)
+        fake = _FakeKafkaConsumer(batches)
+        retry._consumer = fake
+        return retry, fake
+
+    @staticmethod
+    def _headers(not_before_ms: int, retry_count: int = 1) -> list[tuple[str, bytes]]:
+        meta = RetryMetadata(
+            retry_count=retry_count, original_topic=EVENTS, not_before_ms=not_before_ms
+        )
+        return meta.to_headers()
+
+    @pytest.mark.asyncio
+    async def test_due_message_forwarded_and_committed(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        event = _event()
+        headers = self._headers(int(time.time() * 1000) - 1)
+        message = _msg(event, topic=RETRY_10S.topic, offset=7, headers=headers, key=b"k")
+        retry, fake = self._retry_consumer([{RETRY_10S: [message]}], producer)
+
+        assert await retry.poll_once() == 1
+
+        args, kwargs = producer.publish.call_args
+        assert args == (EVENTS, event)
+        assert kwargs["key"] == "k"
+        assert RetryMetadata.from_headers(kwargs["headers"]).retry_count == 1
+        assert fake.commits == [{RETRY_10S: 8}]
+        assert retry.forwarded == 1
+
+    @pytest.mark.asyncio
+    async def test_message_not_yet_due_pauses_partition(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        now_ms = int(time.time() * 1000)
+        due = _msg(_event(), topic=RETRY_10S.topic, offset=1, headers=self._headers(now_ms - 1))
+        later = _msg(
+            _event(), topic=RETRY_10S.topic, offset=2, headers=self._headers(now_ms + 60_000)
+        )
+        retry, fake = self._retry_consumer([{RETRY_10S: [due, later]}], producer)
+
+        assert await retry.poll_once() == 1
+
+        assert fake.commits == [{RETRY_10S: 2}]
+        assert fake.seeks == [(RETRY_10S, 2)]
+        assert fake.paused == [RETRY_10S]
+
+        with patch("shieldops.messaging.retry.time") as mock_time:
+            mock_time.time.return_value = time.time() + 120
+            await retry.poll_once()
+        assert fake.resumed == [RETRY_10S]
+
+    @pytest.mark.asyncio
+    async def test_forward_failure_holds_message(self) -> None:
+        producer = AsyncMock(spec=EventProducer)
+        producer.publish.side_effect = ConnectionError("broker down")
+        headers = self._headers(int(time.time() * 1000) - 1)
+        message = _msg(_event(), topic=RETRY_10S.topic, offset=3, headers=headers)
+        retry, fake = self._retry_consumer([{RETRY_10S: [message]}], producer)
+
+        assert await retry.poll_once() == 0
+        assert fake.commits == []
+        assert fake.seeks == [(RETRY_10S, 3)]
+
+    @pytest.mark.asyncio
+    async def test_start_subscribes_to_all_tiers_without_auto_commit(self) -> None:
+        with patch("shieldops.messaging.retry.AIOKafkaConsumer") as mock_kafka_cls:
+            mock_kafka_cls.return_value = MagicMock(start=AsyncMock())
+            retry = RetryTopicConsumer(brokers="b", producer=AsyncMock(), delays=(5, 30))
+            await retry.start()
+
+        subscribe = mock_kafka_cls.return_value.subscribe
+        assert subscribe.call_args.args == (["shieldops.retry.5s", "shieldops.retry.30s"],)
+        assert mock_kafka_cls.call_args.kwargs["enable_auto_commit"] is False
+
+    @pytest.mark.asyncio
+    async def test_revoked_partitions_are_not_resumed(self) -> None:
+        with patch("shieldops.messaging.retry.AIOKafkaConsumer") as mock_kafka_cls:
+            mock_kafka_cls.return_value = MagicMock(start=AsyncMock())
+            retry = RetryTopicConsumer(brokers="b", producer=AsyncMock())
+            await retry.start()
+        listener = mock_kafka_cls.return_value.subscribe.call_args.kwargs["listener"]
+        fake = _FakeKafkaConsumer([])
+        retry._consumer = fake
+        retry._hold(RETRY_10S, 4, time.time() - 1)
+
+        await listener.on_partitions_revoked([RETRY_10S])
+        await retry.poll_once()
+
+        assert fake.resumed == []
+
+    @pytest.mark.asyncio
+    async def test_run_survives_poll_errors(self) -> None:
+        retry, _ = self._retry_consumer([], AsyncMock(spec=EventProducer))
+        retry._error_backoff_s = 0
+        polls = 0
+
+        async def poll_once() -> int:
+            nonlocal polls
+            polls += 1
+            if polls == 1:
+                raise RuntimeError("rebalance in progress")
+            if polls == 3:
+                raise asyncio.CancelledError
+            return 0
+
+        retry.poll_once = poll_once  # type: ignore[method-assign]
+        with pytest.raises(asyncio.CancelledError):
+            await retry.run()
+
+        assert polls == 3
+
+
+# ── Bulk DLQ replay ──────────────────────────────────────────────────────────
+
+
+def _dlq_msg(offset: int, source_topic: str = EVENTS, **payload: Any) -> SimpleNamespace:
+    envelope = DLQEnvelope(
+        original_event=_event(**payload),
+        error_message="err",
+        error_type="RuntimeError",
+        source_topic=source_topic,
+    )
+    carrier = EventEnvelope(
+        event_type="dlq.failed",
+        source="shieldops.dlq",
+        payload=envelope.model_dump(mode="json"),
+    )
+    return _msg(carrier, topic=DLQ_TOPIC, offset=offset)
+
+
+class TestReplayBulk:
+    def _dlq_consumer(self, batches: list[dict[Any, list[Any]]]) -> DLQConsumer:
+        consumer = DLQConsumer(brokers="b", enable_auto_commit=False)
+        consumer._consumer = _FakeKafkaConsumer(batches)
+        return consumer
+
+    @pytest.mark.asyncio
+    async def test_replays_batches_grouped_by_topic_until_drained(self) -> None:
+        tp = TopicPartition(DLQ_TOPIC, 0)
+        batches = [
+            {tp: [_dlq_msg(0), _dlq_msg(1, source_topic="shieldops.audit"), _dlq_msg(2)]},
+            {tp: [_dlq_msg(3)]},
+        ]
+        consumer = self._dlq_consumer(batches)
+        producer = AsyncMock(spec=EventProducer)
+
+        report = await consumer.replay_bulk(producer, rate_per_s=0, idle_timeout_ms=0)
+
+        assert report.replayed == 4
+        assert report.completed is True
+        assert report.by_topic == {EVENTS: 3, "shieldops.audit": 1}
+        assert producer.publish_many.await_count == 3
+        assert len(consumer._consumer.commits) == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_paces_batches(self) -> None:
+        tp = TopicPartition(DLQ_TOPIC, 0)
+        batches = [{tp: [_dlq_msg(i)]} for i in range(3)]
+        consumer = self._dlq_consumer(batches)
+
+        with patch("shieldops.messaging.dlq_consumer.asyncio.sleep") as mock_sleep:
+            report = await consumer.replay_bulk(
+                AsyncMock(spec=EventProducer), rate_per_s=10, batch_size=1, idle_timeout_ms=0
+            )
+
+        assert report.replayed == 3
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(delays) == 3
+        assert all(0 < delay <= 0.3 for delay in delays)
+
+    @pytest.mark.asyncio
+    async def test_filter_max_messages_and_dry_run(self) -> None:
+        tp = TopicPartition(DLQ_TOPIC, 0)
+        batches = [{tp: [_dlq_msg(i, keep=i % 2 == 0) for i in range(4)]}]
+        consumer = self._dlq_consumer(batches)
+        producer = AsyncMock(spec=EventProducer)
+
+        report = await consumer.replay_bulk(
+            producer,
+            filter_fn=lambda env: env.original_event.payload["keep"],
+            rate_per_s=0,
+            max_messages=4,
+            dry_run=True,
+        )
+
+        assert (report.replayed, report.skipped) == (2, 2)
+        assert report.completed is False
+        producer.publish_many.assert_not_awaited()
+        assert consumer._consumer.commits == []
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_stops_without_commit(self) -> None:
+        tp = TopicPartition(DLQ_TOPIC, 0)
+        consumer = self._dlq_consumer([{tp: [_dlq_msg(0)]}, {tp: [_dlq_msg(1)]}])
+        producer = AsyncMock(spec=EventProducer)
+        producer.publish_many.side_effect = ConnectionError("broker down")
+
+        report = await consumer.replay_bulk(producer, rate_per_s=0)
+
+        assert report.failed == 1
+        assert report.replayed == 0
+        assert consumer._consumer.commits == []
+
+
+class TestProducerHeaders:
+    @pytest.mark.asyncio
+    async def test_publish_forwards_key_and_headers(self) -> None:
+        producer = EventProducer(brokers="b")
+        producer._producer = AsyncMock()
+        event = _event()
+
+        await producer.publish(EVENTS, event, key="k", headers=[("h", b"v")])
+
+        producer._producer.send_and_wait.assert_awaited_once_with(
+            EVENTS, value=event, key=b"k", headers=[("h", b"v")]
+        )
@@ -0,0 +1,227 @@
+"""Tests for the LLM response cache and its use by llm_structured / llm_analyze."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from shieldops.utils import llm as llm_module
+from shieldops.utils.llm_cache import LLMResponseCache, llm_cache_scope, normalize_prompt
+from shieldops.utils.llm_router import LLMRouter
+
+
+class _Verdict(BaseModel):
+    summary: str
+    confidence: float
+
+
+class _OtherVerdict(BaseModel):
+    summary: str
+
+
+class TestNormalizePrompt:
+    def test_collapses_whitespace_and_blank_lines(self):
+        assert normalize_prompt("  a \t b\n\n\nc  ") == "a b\nc"
+
+    def test_masks_timestamps_and_uuids(self):
+        text = "alert 3f2b6c1e-8a4d-4f5e-9b2a-1c3d5e7f9a0b at 2026-10-16T21:20:52.123Z"
+        assert normalize_prompt(text, mask_volatile=True) == "alert <uuid> at <ts>"
+
+    def test_masking_is_opt_in(self):
+        text = "at 2026-10-16T21:20:52Z"
+        assert normalize_prompt(text) == text
+
+
+class TestMakeKey:
+    def test_equivalent_prompts_share_a_key(self):
+        cache = LLMResponseCache(mask_volatile=True)
+        a = cache.make_key("m", "sys", "pod  crashed at 2026-10-16T10:00:00Z", _Verdict)
+        b = cache.make_key("m", "sys", "pod crashed at 2026-10-16T10:05:00Z\n", _Verdict)
+        assert a == b
+
+    def test_model_system_prompt_and_schema_are_part_of_the_key(self):
+        cache = LLMResponseCache()
+        base = cache.make_key("m", "sys", "u", _Verdict)
+        assert cache.make_key("other", "sys", "u", _Verdict) != base
+        assert cache.make_key("m", "other", "u", _Verdict) != base
+        assert cache.make_key("m", "sys", "u", _OtherVerdict) != base
+        assert cache.make_key("m", "sys", "u", None) != base
+
+    def test_entity_ids_and_times_are_part_of_the_key_by_default(self):
+        cache = LLMResponseCache()
+        a = cache.make_key("m", "sys", "pod 3f2b6c1e-8a4d-4f5e-9b2a-1c3d5e7f9a0b crashed")
+        b = cache.make_key("m", "sys", "pod 9c1d2e3f-8a4d-4f5e-9b2a-1c3d5e7f9a0b crashed")
+        assert a != b
+
+    def test_org_and_agent_type_scope_the_key(self):
+        cache = LLMResponseCache()
+        base = cache.make_key("m", "sys", "u", agent_type="investigation")
+        assert cache.make_key("m", "sys", "u", agent_type="remediation") != base
+        with llm_cache_scope("org-1"):
+            org_1 = cache.make_key("m", "sys", "u", agent_type="investigation")
+        with llm_cache_scope("org-2"):
+            org_2 = cache.make_key("m", "sys", "u", agent_type="investigation")
+        assert len({base, org_1, org_2}) == 3
+
+
+class TestLLMResponseCache:
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        cache = LLMResponseCache()
+        compute = AsyncMock(return_value={"content": "ok"})
+
+        first = await cache.get_or_compute("k", compute)
+        second = await cache.get_or_compute("k", compute)
+
+        assert first == ({"content": "ok"}, False)
+        assert second == ({"content": "ok"}, True)
+        compute.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_call_once(self):
+        cache = LLMResponseCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"content": "ok"}
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(5)))
+
+        assert calls == 1
+        assert all(value == {"content": "ok"} for value, _ in results)
+        assert sorted(hit for _, hit in results) == [False, True, True, True, True]
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_recomputed(self):
+        cache = LLMResponseCache(ttl_seconds=60)
+        compute = AsyncMock(return_value={"content": "ok"})
+        await cache.get_or_compute("k", compute)
+        cache._entries["k"] = (0.0, cache._entries["k"][1])
+
+        _, hit = await cache.get_or_compute("k", compute)
+
+        assert hit is False
+        assert compute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_evicts_least_recently_used(self):
+        cache = LLMResponseCache(max_bytes=30)
+        await cache.set("a", "x" * 10)
+        await cache.set("b", "y" * 10)
+        await cache.get("a")
+        await cache.set("c", "z" * 10)
+
+        assert await cache.get("a") == "x" * 10
+        assert await cache.get("b") is None
+        assert cache.stats()["bytes"] <= 30
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_shares_entries(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b'{"content":"shared"}')
+        redis.set = AsyncMock()
+        cache = LLMResponseCache(redis=redis, ttl_seconds=120)
+
+        assert await cache.get("k") == {"content": "shared"}
+        redis.get.assert_awaited_once_with("shieldops:llm:k")
+
+        await cache.set("k2", {"content": "new"})
+        redis.set.assert_awaited_once_with("shieldops:llm:k2", b'{"content":"new"}', ex=120)
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_treated_as_misses(self):
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        redis.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = LLMResponseCache(redis=redis)
+
+        value, hit = await cache.get_or_compute("k", AsyncMock(return_value={"v": 1}))
+
+        assert (value, hit) == ({"v": 1}, False)
+
+    def test_disabled_agents(self):
+        cache = LLMResponseCache(disabled_agents=["chatops"])
+        assert cache.enabled_for("investigation")
+        assert not cache.enabled_for("chatops")
+        assert not LLMResponseCache(ttl_seconds=0).enabled_for("investigation")
+
+
+class TestLLMStructuredCaching:
+    @pytest.fixture
+    def structured_llm(self):
+        structured = MagicMock()
+        structured.ainvoke = AsyncMock(return_value=_Verdict(summary="oom", confidence=0.9))
+        llm = MagicMock()
+        llm.with_structured_output.return_value = structured
+        with patch.object(llm_module, "get_llm", return_value=llm):
+            yield structured
+
+    @pytest.fixture
+    def response_cache(self):
+        cache = LLMResponseCache(disabled_agents=["chatops"])
+        with patch.object(llm_module, "_response_cache", cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_is_served_from_cache(self, structured_llm, response_cache):
+        first = await llm_module.llm_structured("sys", "pod crashed", _Verdict, agent_type="inv")
+        second = await llm_module.llm_structured("sys", "pod crashed", _Verdict, agent_type="inv")
+
+        assert first == second == _Verdict(summary="oom", confidence=0.9)
+        structured_llm.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_opt_out_per_agent_and_per_call(self, structured_llm, response_cache):
+        for _ in range(2):
+            await llm_module.llm_structured("sys", "u", _Verdict, agent_type="chatops")
+            await llm_module.llm_structured("sys", "u", _Verdict, cache=False)
+
+        assert structured_llm.ainvoke.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_hits_and_misses_are_recorded_on_router(self, structured_llm, response_cache):
+        router = LLMRouter()
+        response_cache.attach_router(router)
+
+        for _ in range(3):
+            await llm_module.llm_structured("sys", "u", _Verdict, agent_type="investigation")
+
+        stats = router.get_usage_stats()
+        assert stats.cache_hits == 2
+        assert stats.cache_misses == 1
+        assert stats.by_agent["investigation"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_are_recorded_as_hits(self, response_cache):
+        router = LLMRouter()
+        response_cache.attach_router(router)
+        structured = MagicMock()
+
+        async def slow(_messages):
+            await asyncio.sleep(0.01)
+            return _Verdict(summary="oom", confidence=0.9)
+
+        structured.ainvoke = AsyncMock(side_effect=slow)
+        llm = MagicMock()
+        llm.with_structured_output.return_value = structured
+        with patch.object(llm_module, "get_llm", return_value=llm):
+            await asyncio.gather(
+                *(
+                    llm_module.llm_structured("sys", "u", _Verdict, agent_type="investigation")
+                    for _ in range(3)
+                )
+            )
+
+        stats = router.get_usage_stats()
+        assert structured.ainvoke.await_count == 1
+        assert stats.cache_hits == 2
+        assert stats.cache_misses == 1
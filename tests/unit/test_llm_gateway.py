@@ -0,0 +1,286 @@
+"""Tests for the LLM gateway — budgets, priority queueing, adaptive concurrency, overflow."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from shieldops.utils.llm_gateway import (
+    LLMGateway,
+    LLMPriority,
+    llm_priority,
+    priority_for_severity,
+    resolve_priority,
+)
+from shieldops.utils.llm_router import LLMRouter, ModelTier, TaskComplexity
+
+
+class _RateLimitedError(Exception):
+    status_code = 429
+
+
+class _Response:
+    def __init__(self, retry_after: str) -> None:
+        self.status_code = 429
+        self.headers = {"retry-after": retry_after}
+
+
+class _RateLimitedWithHintError(Exception):
+    def __init__(self, retry_after: str) -> None:
+        super().__init__("rate limited")
+        self.response = _Response(retry_after)
+
+
+def _gateway(**kwargs) -> LLMGateway:
+    kwargs.setdefault("requests_per_minute", 10_000)
+    kwargs.setdefault("tokens_per_minute", 10_000_000)
+    return LLMGateway(**kwargs)
+
+
+class TestPriorities:
+    def test_agent_defaults(self):
+        assert resolve_priority("learning") == LLMPriority.BACKGROUND
+        assert resolve_priority("investigation") == LLMPriority.NORMAL
+
+    def test_context_overrides_agent(self):
+        with llm_priority(LLMPriority.CRITICAL):
+            assert resolve_priority("learning") == LLMPriority.CRITICAL
+        assert resolve_priority("learning") == LLMPriority.BACKGROUND
+
+    def test_severity_mapping(self):
+        assert priority_for_severity("critical") == LLMPriority.CRITICAL
+        assert priority_for_severity("Warning") == LLMPriority.HIGH
+        assert priority_for_severity("info") == LLMPriority.NORMAL
+
+    @pytest.mark.asyncio
+    async def test_critical_calls_are_served_first(self):
+        gateway = _gateway(max_concurrency=1)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def blocker(_model: str) -> None:
+            await release.wait()
+
+        def record(name: str):
+            async def call(_model: str) -> None:
+                order.append(name)
+
+            return call
+
+        first = asyncio.create_task(gateway.run(blocker, model="m"))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(
+                gateway.run(record("bg"), model="m", priority=LLMPriority.BACKGROUND)
+            ),
+            asyncio.create_task(gateway.run(record("normal"), model="m")),
+            asyncio.create_task(
+                gateway.run(record("crit"), model="m", priority=LLMPriority.CRITICAL)
+            ),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *queued)
+
+        assert order == ["crit", "normal", "bg"]
+
+
+class TestBudgets:
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        gateway = _gateway(max_concurrency=2)
+        in_flight = peak = 0
+
+        async def call(_model: str) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        await asyncio.gather(*(gateway.run(call, model="m") for _ in range(6)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_request_budget_delays_excess_calls(self):
+        gateway = _gateway(requests_per_minute=2)
+        lane = gateway._lane("m")
+
+        async def call(_model: str) -> str:
+            return "ok"
+
+        await gateway.run(call, model="m")
+        await gateway.run(call, model="m")
+        third = asyncio.create_task(gateway.run(call, model="m"))
+        await asyncio.sleep(0.01)
+
+        assert not third.done()
+        assert lane.queued == 1
+        third.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await third
+
+    @pytest.mark.asyncio
+    async def test_token_budget_counts_prompt_and_reserve(self):
+        gateway = _gateway(tokens_per_minute=1000, output_token_reserve=200)
+
+        async def call(_model: str) -> None:
+            return None
+
+        await gateway.run(call, model="m", prompt_tokens=300)
+
+        assert gateway._lane("m").tokens.level == pytest.approx(500, abs=1)
+
+
+class TestAdaptiveConcurrency:
+    @pytest.mark.asyncio
+    async def test_throttled_call_is_retried_and_limit_halved(self):
+        gateway = _gateway(max_concurrency=8, min_concurrency=1)
+        gateway.base_backoff_seconds = 0.01
+        attempts = 0
+
+        async def call(_model: str) -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise _RateLimitedError()
+            return "ok"
+
+        assert await gateway.run(call, model="m") == "ok"
+        assert attempts == 2
+        assert gateway.stats()["throttled"] == 1
+        assert gateway._lane("m").limit < 8
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header_pauses_the_model(self):
+        gateway = _gateway(max_retries=0)
+
+        async def call(_model: str) -> None:
+            raise _RateLimitedWithHintError("30")
+
+        with pytest.raises(_RateLimitedWithHintError):
+            await gateway.run(call, model="m")
+
+        assert gateway.stats()["models"]["m"]["paused_for_s"] > 25
+
+    @pytest.mark.asyncio
+    async def test_throttle_pauses_before_the_slot_is_handed_on(self):
+        gateway = _gateway(max_concurrency=1, min_concurrency=1, max_retries=0)
+        gateway.base_backoff_seconds = 30
+        started: list[str] = []
+
+        async def throttled(_model: str) -> None:
+            await asyncio.sleep(0.01)
+            raise _RateLimitedError()
+
+        async def waiting(_model: str) -> None:
+            started.append("waiting")
+
+        first = asyncio.create_task(gateway.run(throttled, model="m"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(gateway.run(waiting, model="m"))
+        with pytest.raises(_RateLimitedError):
+            await first
+        await asyncio.sleep(0.01)
+
+        assert started == []
+        assert gateway._lane("m").in_flight == 0
+        second.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await second
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_releases_its_slot(self):
+        gateway = _gateway(max_concurrency=1, min_concurrency=1)
+
+        async def hang(_model: str) -> None:
+            await asyncio.sleep(60)
+
+        task = asyncio.create_task(gateway.run(hang, model="m"))
+        await asyncio.sleep(0.01)
+        assert gateway._lane("m").in_flight == 1
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+        assert gateway._lane("m").in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self):
+        gateway = _gateway()
+        attempts = 0
+
+        async def call(_model: str) -> None:
+            nonlocal attempts
+            attempts += 1
+            raise ValueError("bad schema")
+
+        with pytest.raises(ValueError):
+            await gateway.run(call, model="m")
+
+        assert attempts == 1
+        assert gateway._lane("m").in_flight == 0
+
+    def test_slow_calls_shrink_and_fast_calls_grow_the_limit(self):
+        gateway = _gateway(max_concurrency=10, min_concurrency=2, target_latency_ms=1000)
+        lane = gateway._lane("m")
+        lane.limit = 5
+
+        lane.on_success(2.0)
+        assert lane.limit == pytest.approx(4.5)
+        lane.on_success(0.1)
+        assert lane.limit == pytest.approx(4.5 + 1 / 4.5)
+
+
+class TestOverflow:
+    @pytest.fixture
+    def router(self) -> LLMRouter:
+        tiers = {
+            TaskComplexity.SIMPLE: ModelTier(provider="anthropic", model="cheap"),
+            TaskComplexity.MODERATE: ModelTier(provider="anthropic", model="primary"),
+            TaskComplexity.COMPLEX: ModelTier(provider="anthropic", model="big"),
+        }
+        return LLMRouter(model_tiers=tiers, enabled=True)
+
+    @pytest.mark.asyncio
+    async def test_non_critical_calls_overflow_to_cheaper_tier(self, router: LLMRouter):
+        gateway = _gateway(max_concurrency=1, overflow_queue_depth=1, router=router)
+        release = asyncio.Event()
+        models: list[str] = []
+
+        async def blocker(_model: str) -> None:
+            await release.wait()
+
+        async def call(model: str) -> None:
+            models.append(model)
+
+        first = asyncio.create_task(gateway.run(blocker, model="primary"))
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(gateway.run(call, model="primary"))
+        await asyncio.sleep(0)
+
+        await gateway.run(call, model="primary")
+        release.set()
+        await asyncio.gather(first, waiting)
+
+        assert models[0] == "cheap"
+        assert models[1] == "primary"
+        assert gateway.stats()["overflowed"] == 1
+
+    def test_critical_calls_never_overflow(self, router: LLMRouter):
+        gateway = _gateway(overflow_queue_depth=1, router=router)
+        gateway._lane("primary")._waiters.append((0, 0, 0.0, MagicMock()))
+
+        assert gateway._choose_model("primary", LLMPriority.CRITICAL) == "primary"
+        assert gateway._choose_model("primary", LLMPriority.NORMAL) == "cheap"
+
+    def test_no_overflow_when_routing_disabled(self, router: LLMRouter):
+        router._enabled = False
+        gateway = _gateway(overflow_queue_depth=1, router=router)
+        gateway._lane("primary")._waiters.append((0, 0, 0.0, MagicMock()))
+
+        assert gateway._choose_model("primary", LLMPriority.NORMAL) == "primary"
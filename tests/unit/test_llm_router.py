@@ -768,3 +768,49 @@ class TestEdgeCases:
         breakdown = router_with_records.get_cost_breakdown()
         assert breakdown["total_cost"] == pytest.approx(stats.total_estimated_cost, abs=1e-6)
         assert breakdown["total_requests"] == stats.total_requests
+
+
+# ── Response cache accounting ───────────────────────────────────────
+
+
+class TestCacheAccounting:
+    """Cache hits are free and kept out of request totals."""
+
+    def _record(self, router: LLMRouter, cache_hit: bool | None) -> UsageRecord:
+        return router.record_usage(
+            request_id="r",
+            complexity=TaskComplexity.SIMPLE,
+            model="test-simple-model",
+            provider="test-provider",
+            input_tokens=1000,
+            output_tokens=1000,
+            agent_type="investigation",
+            cache_hit=cache_hit,
+        )
+
+    def test_hit_is_recorded_as_saved_cost(self, custom_router: LLMRouter):
+        record = self._record(custom_router, cache_hit=True)
+        assert record.estimated_cost == pytest.approx(0.0)
+        assert record.cost_saved == pytest.approx(0.003)
+
+    def test_stats_count_hits_and_misses(self, custom_router: LLMRouter):
+        self._record(custom_router, cache_hit=True)
+        self._record(custom_router, cache_hit=True)
+        self._record(custom_router, cache_hit=False)
+        self._record(custom_router, cache_hit=None)
+
+        stats = custom_router.get_usage_stats()
+        assert stats.total_requests == 2
+        assert stats.cache_hits == 2
+        assert stats.cache_misses == 1
+        assert stats.cache_hit_rate == pytest.approx(2 / 3, abs=1e-4)
+        assert stats.total_cost_saved == pytest.approx(0.006)
+        assert stats.total_estimated_cost == pytest.approx(0.006)
+
+    def test_cost_breakdown_excludes_hits(self, custom_router: LLMRouter):
+        self._record(custom_router, cache_hit=True)
+        self._record(custom_router, cache_hit=False)
+
+        breakdown = custom_router.get_cost_breakdown()
+        assert breakdown["total_requests"] == 1
+        assert breakdown["cache_hits"] == 1
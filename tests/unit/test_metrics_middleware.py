@@ -7,6 +7,7 @@ thread safety, and middleware integration via TestClient.
 
 from __future__ import annotations
 
+import os
 import threading
 
 import pytest
@@ -490,3 +491,92 @@ class TestMultipleConcurrentRequests:
             if "http_requests_total" in k and 'path_template="/"' in k
         )
         assert total == n_threads * n_per_thread
+
+
+# ── Handles, shards and multiprocess aggregation ────────────────────
+
+
+class TestHandlesAndShards:
+    def test_handle_matches_dict_api(self):
+        r = get_metrics_registry()
+        labels = {"method": "GET", "path_template": "/"}
+        r.histogram("dur", labels).observe(0.03)
+        r.observe_histogram("dur", labels, 0.2)
+        r.counter("c", labels).inc(2)
+
+        key = r._label_key("dur", labels)
+        assert r._histogram_counts[key] == 2
+        assert r.counters[r._label_key("c", labels)] == 2
+        assert r.counter("c", labels) is r.counter("c", labels)
+
+    def test_exited_thread_counts_are_kept(self):
+        r = get_metrics_registry()
+        t = threading.Thread(target=lambda: r.inc_counter("c", {"a": "b"}, 5))
+        t.start()
+        t.join()
+
+        assert r.counters[r._label_key("c", {"a": "b"})] == 5
+        r.inc_counter("c", {"a": "b"})
+        assert r.counters[r._label_key("c", {"a": "b"})] == 6
+        assert all(shard.thread.is_alive() for shard in r._shards)
+
+    def test_reset_clears_every_shard(self):
+        r = get_metrics_registry()
+        t = threading.Thread(target=lambda: r.observe_histogram("h", {}, 0.1))
+        t.start()
+        t.join()
+        r.reset()
+        assert r.histograms == {}
+
+
+class TestMultiprocessAggregation:
+    def test_collect_sums_worker_snapshots(self, tmp_path):
+        import json
+        import subprocess
+        import sys
+
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        live_pid = os.getppid()
+        key = MetricsRegistry._label_key("http_requests_total", {"method": "GET"})
+        gauge = MetricsRegistry._label_key("in_progress", {"method": "GET"})
+        hist = MetricsRegistry._label_key("dur", {"method": "GET"})
+        for pid, count in ((live_pid, 3), (dead.pid, 4)):
+            (tmp_path / f"metrics-{pid}.json").write_text(
+                json.dumps(
+                    {
+                        "counters": {key: count},
+                        "histograms": {
+                            hist: {"bounds": [0.1, 1.0], "counts": [count, 0, 0], "sum": 0.05}
+                        },
+                        "gauges": {gauge: 1},
+                    }
+                )
+            )
+
+        r = MetricsRegistry(str(tmp_path))
+        r.inc_counter("http_requests_total", {"method": "GET"})
+        r.observe_histogram("dur", {"method": "GET"}, 0.05, buckets=(0.1, 1.0))
+        output = r.collect()
+
+        assert 'http_requests_total{method="GET"} 8' in output
+        assert 'dur_count{method="GET"} 8' in output
+        assert 'in_progress{method="GET"} 1' in output  # dead worker's gauge dropped
+        assert (tmp_path / f"metrics-{os.getpid()}.json").exists()
+
+    def test_forked_worker_reports_only_its_own_metrics(self, tmp_path):
+        import multiprocessing
+
+        r = MetricsRegistry(str(tmp_path))
+        r.inc_counter("c", {"w": "x"}, 10)
+
+        def child() -> None:
+            r.inc_counter("c", {"w": "x"})
+            r.flush()
+
+        proc = multiprocessing.get_context("fork").Process(target=child)
+        proc.start()
+        proc.join()
+
+        assert proc.exitcode == 0
+        assert 'c{w="x"} 11' in r.collect()
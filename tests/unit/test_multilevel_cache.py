@@ -21,6 +21,9 @@ def _make_l2(**overrides: object) -> AsyncMock:
     l2.delete = AsyncMock()
     l2.invalidate_pattern = AsyncMock(return_value=0)
     l2.flush_all = AsyncMock(return_value=0)
+    l2.get_many = AsyncMock(return_value={})
+    l2.set_many = AsyncMock()
+    l2.delete_many = AsyncMock(return_value=0)
     for k, v in overrides.items():
         setattr(l2, k, v)
     return l2
@@ -273,7 +276,7 @@ class TestTTLExpiration:
         cache = _make_cache(l1_ttl_seconds=1)
         await cache.set("k", "v")
 
-        with patch("shieldops.cache.multilevel_cache.time") as mock_time:
+        with patch("shieldops.cache.l1.time") as mock_time:
             mock_time.monotonic.return_value = time.monotonic() + 100
             found, _ = cache._l1_get("default:k")
             assert found is False
@@ -328,6 +331,62 @@ class TestInvalidateNamespace:
         assert count == 1 + 5  # 1 from L1 + 5 from L2
 
 
+# =========================================================================
+# Bulk operations
+# =========================================================================
+
+
+class TestBulkOperations:
+    @pytest.mark.asyncio
+    async def test_get_many_single_l2_round_trip_for_misses(self):
+        l2 = _make_l2(get_many=AsyncMock(return_value={"b": 2}))
+        cache = _make_cache(l2)
+        await cache.set("a", 1)
+
+        result = await cache.get_many(["a", "b", "c"])
+
+        assert result == {"a": 1, "b": 2}
+        l2.get_many.assert_awaited_once_with(["b", "c"], namespace="default")
+        stats = cache.get_stats()
+        assert (stats.l1_hits, stats.l2_hits, stats.misses) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_many_promotes_l2_hits(self):
+        l2 = _make_l2(get_many=AsyncMock(return_value={"b": 2}))
+        cache = _make_cache(l2)
+
+        await cache.get_many(["b"], namespace="ns")
+        l2.get_many.reset_mock()
+
+        assert await cache.get_many(["b"], namespace="ns") == {"b": 2}
+        l2.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_many_writes_both_levels(self):
+        l2 = _make_l2()
+        cache = _make_cache(l2)
+
+        await cache.set_many({"a": 1, "b": 2}, ttl=30, namespace="ns", ttls={"b": 5})
+
+        l2.set_many.assert_awaited_once_with(
+            {"a": 1, "b": 2}, ttl=30, namespace="ns", ttls={"b": 5}
+        )
+        assert await cache.get_many(["a", "b"], namespace="ns") == {"a": 1, "b": 2}
+        l2.get_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_clears_both_levels(self):
+        l2 = _make_l2(delete_many=AsyncMock(return_value=2))
+        cache = _make_cache(l2)
+        await cache.set_many({"a": 1, "b": 2})
+
+        removed = await cache.delete_many(["a", "b"])
+
+        assert removed == 2
+        l2.delete_many.assert_awaited_once_with(["a", "b"], namespace="default")
+        assert cache.get_stats().l1_size == 0
+
+
 # =========================================================================
 # flush_all()
 # =========================================================================
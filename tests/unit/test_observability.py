@@ -4,8 +4,12 @@ Tests cover:
 - SplunkSource (LogSource) — SPL queries via Splunk REST API
 - DatadogSource (MetricSource) — Datadog Metrics API
 - JaegerSource (TraceSource) — Jaeger HTTP API
+- PrometheusSource (MetricSource) — Prometheus HTTP API, batching and range cache
 """
 
+import asyncio
+import math
+from array import array
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -15,6 +19,14 @@ import pytest
 from shieldops.models.base import TimeRange
 from shieldops.observability.datadog.client import DatadogSource
 from shieldops.observability.otel.client import JaegerSource
+from shieldops.observability.prometheus.client import (
+    BATCH_LABEL,
+    PrometheusSource,
+    Series,
+    align_window,
+    find_anomalies,
+    parse_step,
+)
 from shieldops.observability.splunk.client import SplunkSource
 
 # --- Helpers ---
@@ -596,6 +608,210 @@ class TestJaegerSource:
         assert url == "http://localhost:16686/api/traces/trace-xyz"
 
 
+# ============================================================================
+# PrometheusSource tests
+# ============================================================================
+
+
+def _matrix(*series: tuple[dict, list]) -> dict:
+    return {
+        "data": {
+            "result": [{"metric": labels, "values": values} for labels, values in series],
+        }
+    }
+
+
+class TestPrometheusSource:
+    @pytest.fixture
+    def prom(self):
+        yield PrometheusSource(url="http://prom:9090/")
+
+    @pytest.fixture
+    def past_range(self):
+        now = datetime.now(UTC)
+        return TimeRange(start=now - timedelta(days=1, hours=1), end=now - timedelta(days=1))
+
+    @pytest.mark.asyncio
+    async def test_query_metric_returns_points(self, prom, time_range):
+        prom._client.get = AsyncMock(
+            return_value=_mock_response(
+                _matrix(({"pod": "web-1"}, [[1704067200, "1.5"], [1704067260, "2.5"]]))
+            )
+        )
+
+        results = await prom.query_metric("cpu", {"pod": "web-1"}, time_range)
+
+        assert [r["value"] for r in results] == [1.5, 2.5]
+        assert results[0]["labels"] == {"pod": "web-1"}
+        params = prom._client.get.call_args.kwargs["params"]
+        assert params["query"] == 'cpu{pod="web-1"}'
+        assert params["start"] % 60 == 0
+        assert params["end"] % 60 == 0
+
+    @pytest.mark.asyncio
+    async def test_query_metric_connection_error(self, prom, time_range):
+        prom._client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+        assert await prom.query_metric("cpu", {}, time_range) == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_instant_queries_are_batched(self, prom):
+        prom._client.post = AsyncMock(
+            return_value=_mock_response(
+                {
+                    "data": {
+                        "result": [
+                            {"metric": {"pod": "a", BATCH_LABEL: "0"}, "value": [1704067200, "1"]},
+                            {"metric": {"pod": "b", BATCH_LABEL: "1"}, "value": [1704067200, "2"]},
+                        ]
+                    }
+                }
+            )
+        )
+
+        first, second = await prom.query_instant_many(["up", "cpu"])
+
+        prom._client.post.assert_awaited_once()
+        query = prom._client.post.call_args.kwargs["data"]["query"]
+        assert query == (
+            f'label_replace(up, "{BATCH_LABEL}", "0", "", "")'
+            f' or label_replace(cpu, "{BATCH_LABEL}", "1", "", "")'
+        )
+        assert first[0]["metric"] == {"pod": "a"}
+        assert first[0]["value"] == 1.0
+        assert second[0]["metric"] == {"pod": "b"}
+        assert second[0]["value"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_falls_back_to_single_queries(self, prom):
+        request = httpx.Request("POST", "http://prom:9090/api/v1/query")
+        bad = httpx.HTTPStatusError(
+            "bad", request=request, response=httpx.Response(400, request=request)
+        )
+        prom._client.post = AsyncMock(return_value=_mock_response_error(bad))
+        prom._client.get = AsyncMock(
+            side_effect=[
+                _mock_response({"data": {"result": [{"metric": {}, "value": [1, "3"]}]}}),
+                _mock_response_error(bad),
+            ]
+        )
+
+        good, broken = await prom.query_instant_many(["up", "up{"])
+
+        assert good[0]["value"] == 3.0
+        assert broken == []
+        assert prom._client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_issues_one_request_per_query(self, time_range):
+        prom = PrometheusSource(batch_queries=False)
+        prom._client.get = AsyncMock(return_value=_mock_response({"data": {"result": []}}))
+        prom._client.post = AsyncMock()
+
+        await asyncio.gather(prom.query_instant("up"), prom.query_instant("cpu"))
+
+        assert prom._client.get.await_count == 2
+        prom._client.post.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_past_window_is_cached(self, prom, past_range):
+        prom._client.get = AsyncMock(
+            return_value=_mock_response(_matrix(({}, [[1704067200, "1"]])))
+        )
+
+        first = await prom.query_range("cpu", past_range)
+        second = await prom.query_range("cpu", past_range)
+
+        assert first == second
+        prom._client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_live_window_expires(self, prom, time_range):
+        prom._live_ttl_seconds = 0
+        prom._client.get = AsyncMock(return_value=_mock_response(_matrix()))
+
+        await prom.query_range("cpu", time_range)
+        await prom.query_range("cpu", time_range)
+
+        assert prom._client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_range_query_is_not_cached(self, prom, past_range):
+        prom._client.get = AsyncMock(
+            side_effect=[
+                httpx.ConnectError("Connection refused"),
+                _mock_response(_matrix(({}, [[1704067200, "1"]]))),
+            ]
+        )
+
+        assert await prom.query_range("cpu", past_range) == []
+        assert len(await prom.query_range("cpu", past_range)) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, past_range):
+        prom = PrometheusSource(cache_max_entries=1)
+        prom._client.get = AsyncMock(return_value=_mock_response(_matrix()))
+
+        await prom.query_range("a", past_range)
+        await prom.query_range("b", past_range)
+        await prom.query_range("a", past_range)
+
+        assert prom._client.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_detect_anomalies_batches_current_and_baseline(
+        self, prom, time_range, baseline_range
+    ):
+        prom._client.get = AsyncMock(
+            side_effect=[
+                _mock_response(_matrix(({"pod": "a"}, [[1704067200, "100"], [1704067260, "300"]]))),
+                _mock_response(_matrix(({"pod": "a"}, [[1704067200, "100"], [1704067260, "100"]]))),
+            ]
+        )
+
+        anomalies = await prom.detect_anomalies("cpu", {}, time_range, baseline_range)
+
+        assert len(anomalies) == 1
+        assert anomalies[0]["current_value"] == 300.0
+        assert anomalies[0]["baseline_value"] == 100.0
+        assert anomalies[0]["deviation_percent"] == 200.0
+        assert anomalies[0]["labels"] == {"pod": "a"}
+
+    def test_parse_step(self):
+        assert parse_step("30s") == 30
+        assert parse_step("1m") == 60
+        assert parse_step("1.5h") == 5400
+        assert parse_step(15) == 15
+        with pytest.raises(ValueError):
+            parse_step("soon")
+        with pytest.raises(ValueError):
+            parse_step("0s")
+
+    def test_align_window_snaps_outwards_to_step(self):
+        start = datetime(2024, 1, 1, 12, 0, 42, tzinfo=UTC)
+        window = TimeRange(start=start, end=start + timedelta(minutes=10))
+
+        assert align_window(window, 60) == (
+            datetime(2024, 1, 1, 12, 0, tzinfo=UTC).timestamp(),
+            datetime(2024, 1, 1, 12, 11, tzinfo=UTC).timestamp(),
+        )
+
+    def test_align_window_keeps_aligned_end(self):
+        end = datetime(2024, 1, 1, 12, 10, tzinfo=UTC)
+        window = TimeRange(start=end - timedelta(minutes=10), end=end)
+
+        assert align_window(window, 60)[1] == end.timestamp()
+
+    def test_find_anomalies_skips_nan_and_zero_baseline(self):
+        current = [Series({}, array("d", [1, 2, 3]), array("d", [10.0, math.nan, 30.0]))]
+        baseline = [Series({}, array("d", [1, 2]), array("d", [10.0, math.nan]))]
+
+        anomalies = find_anomalies(current, baseline, 50.0, "cpu")
+
+        assert [a["current_value"] for a in anomalies] == [30.0]
+        zero = [Series({}, array("d", [1]), array("d", [0.0]))]
+        assert find_anomalies(current, zero, 50.0, "cpu") == []
+
+
 # ============================================================================
 # Import re-export tests
 # ============================================================================
@@ -616,3 +832,8 @@ class TestImports:
         from shieldops.observability.otel import JaegerSource as J
 
         assert J is JaegerSource
+
+    def test_prometheus_import(self):
+        from shieldops.observability.prometheus import PrometheusSource as P
+
+        assert P is PrometheusSource
@@ -0,0 +1,224 @@
+"""Tests for PolicyEngine batch evaluation and the OPA decision cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from shieldops.models.base import Environment, RemediationAction, RiskLevel
+from shieldops.policy.opa.client import PolicyEngine
+
+
+def _action(
+    action_id: str = "act-1",
+    *,
+    action_type: str = "restart_pod",
+    env: Environment = Environment.PRODUCTION,
+    team: str | None = None,
+) -> RemediationAction:
+    return RemediationAction(
+        id=action_id,
+        action_type=action_type,
+        target_resource=f"pod/{action_id}",
+        environment=env,
+        risk_level=RiskLevel.LOW,
+        parameters={"team": team} if team else {},
+        description="test",
+    )
+
+
+def _response(result: object) -> MagicMock:
+    resp = MagicMock()
+    resp.json.return_value = {"result": result}
+    resp.raise_for_status = MagicMock()
+    return resp
+
+
+def _rate_limiter(hour: int = 0) -> MagicMock:
+    async def _counts(pairs):
+        return [{"actions_this_hour": hour, "actions_this_minute": 0} for _ in pairs]
+
+    limiter = MagicMock()
+    limiter.get_counts_many = AsyncMock(side_effect=_counts)
+    limiter.increment_many = AsyncMock()
+    return limiter
+
+
+class TestEvaluateMany:
+    @pytest.mark.asyncio
+    async def test_batch_sent_as_one_query(self):
+        engine = PolicyEngine(opa_url="http://opa:8181")
+        engine._client.post = AsyncMock(return_value=_response([True, False, True]))
+
+        decisions = await engine.evaluate_many(
+            [_action("a"), _action("b"), _action("c")], agent_id="agent-1"
+        )
+
+        assert [d.allowed for d in decisions] == [True, False, True]
+        engine._client.post.assert_awaited_once()
+        url = engine._client.post.call_args.args[0]
+        payload = engine._client.post.call_args.kwargs["json"]
+        assert url == "http://opa:8181/v1/data/shieldops/batch_allow"
+        assert [i["target_resource"] for i in payload["input"]["batch"]] == [
+            "pod/a",
+            "pod/b",
+            "pod/c",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_action_uses_allow_document(self):
+        engine = PolicyEngine(opa_url="http://opa:8181")
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        decisions = await engine.evaluate_many([_action()], agent_id="agent-1")
+
+        assert decisions[0].allowed is True
+        assert engine._client.post.call_args.args[0].endswith("/v1/data/shieldops/allow")
+
+    @pytest.mark.asyncio
+    async def test_counts_include_earlier_actions_in_batch(self):
+        limiter = _rate_limiter(hour=3)
+        engine = PolicyEngine(opa_url="http://opa:8181", rate_limiter=limiter)
+        engine._client.post = AsyncMock(return_value=_response([True, True, True]))
+
+        await engine.evaluate_many(
+            [_action("a"), _action("b", env=Environment.STAGING), _action("c")],
+            agent_id="agent-1",
+        )
+
+        batch = engine._client.post.call_args.kwargs["json"]["input"]["batch"]
+        assert [i["context"]["actions_this_hour"] for i in batch] == [3, 3, 4]
+        limiter.get_counts_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_allowed_actions_counted_in_one_call(self):
+        limiter = _rate_limiter()
+        engine = PolicyEngine(opa_url="http://opa:8181", rate_limiter=limiter)
+        engine._client.post = AsyncMock(return_value=_response([True, False, True]))
+
+        await engine.evaluate_many(
+            [_action("a", team="platform"), _action("b"), _action("c")], agent_id="agent-1"
+        )
+
+        limiter.increment_many.assert_awaited_once_with(
+            [("production", "platform"), ("production", None)]
+        )
+
+    @pytest.mark.asyncio
+    async def test_opa_failure_denies_whole_batch(self):
+        limiter = _rate_limiter()
+        engine = PolicyEngine(opa_url="http://opa:8181", rate_limiter=limiter)
+        engine._client.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        decisions = await engine.evaluate_many([_action("a"), _action("b")], agent_id="agent-1")
+
+        assert all(d.denied for d in decisions)
+        assert "Defaulting to deny" in decisions[0].reasons[0]
+        limiter.increment_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_malformed_batch_result_denies(self):
+        engine = PolicyEngine(opa_url="http://opa:8181")
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        decisions = await engine.evaluate_many([_action("a"), _action("b")], agent_id="agent-1")
+
+        assert all(d.denied for d in decisions)
+
+
+class TestDecisionCache:
+    @pytest.mark.asyncio
+    async def test_repeat_input_served_from_cache(self):
+        engine = PolicyEngine(opa_url="http://opa:8181", decision_cache_ttl=60)
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        first = await engine.evaluate(_action(), agent_id="agent-1")
+        second = await engine.evaluate(_action(), agent_id="agent-1")
+
+        assert first.allowed and second.allowed
+        engine._client.post.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rate_counters_ignored_in_key_but_hits_still_counted(self):
+        limiter = _rate_limiter(hour=1)
+        engine = PolicyEngine(
+            opa_url="http://opa:8181", rate_limiter=limiter, decision_cache_ttl=60
+        )
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        await engine.evaluate(_action(), agent_id="agent-1")
+        await engine.evaluate(_action(), agent_id="agent-1", context={"actions_this_hour": 9})
+
+        engine._client.post.assert_awaited_once()
+        assert limiter.increment_many.await_count == 2
+        # A full cache hit needs no counter read
+        limiter.get_counts_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_different_input_misses(self):
+        engine = PolicyEngine(opa_url="http://opa:8181", decision_cache_ttl=60)
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        await engine.evaluate(_action(), agent_id="agent-1")
+        await engine.evaluate(
+            _action(), agent_id="agent-1", context={"approval_status": "approved"}
+        )
+
+        assert engine._client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_only_queries_misses(self):
+        engine = PolicyEngine(opa_url="http://opa:8181", decision_cache_ttl=60)
+        engine._client.post = AsyncMock(return_value=_response(False))
+        await engine.evaluate(_action("a"), agent_id="agent-1")
+
+        engine._client.post = AsyncMock(return_value=_response([True, True]))
+        decisions = await engine.evaluate_many(
+            [_action("a"), _action("b"), _action("c")], agent_id="agent-1"
+        )
+
+        assert [d.allowed for d in decisions] == [False, True, True]
+        batch = engine._client.post.call_args.kwargs["json"]["input"]["batch"]
+        assert [i["target_resource"] for i in batch] == ["pod/b", "pod/c"]
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        engine = PolicyEngine(opa_url="http://opa:8181", decision_cache_ttl=60)
+        engine._client.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        assert (await engine.evaluate(_action(), agent_id="agent-1")).denied
+
+        engine._client.post = AsyncMock(return_value=_response(True))
+        assert (await engine.evaluate(_action(), agent_id="agent-1")).allowed
+
+    @pytest.mark.asyncio
+    async def test_expired_and_evicted_entries(self, monkeypatch):
+        import shieldops.policy.opa.client as client_mod
+
+        now = [1000.0]
+        monkeypatch.setattr(client_mod.time, "monotonic", lambda: now[0])
+        engine = PolicyEngine(
+            opa_url="http://opa:8181", decision_cache_ttl=5, decision_cache_size=2
+        )
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        await engine.evaluate(_action("a"), agent_id="agent-1")
+        now[0] += 6
+        await engine.evaluate(_action("a"), agent_id="agent-1")
+        assert engine._client.post.await_count == 2
+
+        await engine.evaluate(_action("b"), agent_id="agent-1")
+        await engine.evaluate(_action("c"), agent_id="agent-1")
+        assert len(engine._decision_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        engine = PolicyEngine(opa_url="http://opa:8181")
+        engine._client.post = AsyncMock(return_value=_response(True))
+
+        await engine.evaluate(_action(), agent_id="agent-1")
+        await engine.evaluate(_action(), agent_id="agent-1")
+
+        assert engine._client.post.await_count == 2
+        assert not engine._decision_cache
@@ -0,0 +1,218 @@
+"""Tests for the in-process OPA policy evaluator (local evaluation mode)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from shieldops.models.base import Environment, RemediationAction, RiskLevel
+from shieldops.policy.opa.client import PolicyEngine
+from shieldops.policy.opa.local import (
+    POLICIES_DIR,
+    LocalPolicyEvaluator,
+    UnsupportedRegoError,
+    compile_policy,
+)
+
+
+def _input(action: str, env: str, risk: str, **context: object) -> dict:
+    return {"action": action, "environment": env, "risk_level": risk, "context": context}
+
+
+def _write(path: Path, text: str, mtime_offset: int = 0) -> None:
+    path.write_text(text)
+    if mtime_offset:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + mtime_offset))
+
+
+# ────────────────────────────────────────────────────────────────────
+# Shipped bundle
+# ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def evaluator() -> LocalPolicyEvaluator:
+    return LocalPolicyEvaluator(POLICIES_DIR)
+
+
+class TestShippedBundle:
+    @pytest.mark.parametrize(
+        ("input_data", "expected"),
+        [
+            (_input("query_logs", "production", "critical"), True),
+            (_input("restart_pod", "development", "low"), True),
+            (_input("rollback_deployment", "staging", "medium"), True),
+            (_input("restart_pod", "production", "medium"), True),
+            (_input("rollback_deployment", "production", "medium"), False),
+            (_input("rollback_deployment", "production", "high"), False),
+            (_input("rollback_deployment", "production", "high", approval_status="approved"), True),
+            (_input("drain_node", "production", "critical", approval_status="pending"), False),
+            (_input("drain_node", "staging", "critical"), False),
+            ({"action": "restart_pod"}, False),
+        ],
+    )
+    def test_allow_matches_rego(self, evaluator, input_data, expected):
+        assert evaluator.allow(input_data) is expected
+
+    def test_only_allow_rules_compiled(self, evaluator):
+        # shieldops.rego defines nine allow rules; deny/compliance rules are skipped.
+        assert len(evaluator.policy.rules) == 9
+        assert evaluator.policy.default is False
+
+
+# ────────────────────────────────────────────────────────────────────
+# Compiler semantics
+# ────────────────────────────────────────────────────────────────────
+
+
+class TestCompiler:
+    def test_undefined_paths_fail_expressions(self):
+        policy = compile_policy(
+            {"p.rego": 'package shieldops\nallow if {\n input.context.flag != "x"\n}\n'}
+        )
+        assert policy.allow({"context": {"flag": "y"}}) is True
+        assert policy.allow({"context": {}}) is False
+        assert policy.allow({"context": "not-an-object"}) is False
+
+    def test_booleans_never_equal_numbers(self):
+        policy = compile_policy({"p.rego": "package shieldops\nallow if {\n input.n == 1\n}\n"})
+        assert policy.allow({"n": 1}) is True
+        assert policy.allow({"n": 1.0}) is True
+        assert policy.allow({"n": True}) is False
+
+    def test_not_and_truthiness(self):
+        policy = compile_policy(
+            {
+                "p.rego": (
+                    "package shieldops\n"
+                    "allow if {\n input.context.override\n}\n"
+                    "allow if {\n not input.context.blocked\n input.ok == true\n}\n"
+                )
+            }
+        )
+        assert policy.allow({"context": {"override": "yes"}}) is True
+        assert policy.allow({"context": {"override": False}}) is False
+        assert policy.allow({"ok": True, "context": {"blocked": False}}) is True
+        assert policy.allow({"ok": True, "context": {"blocked": True}}) is False
+
+    def test_set_constants_inline_sets_and_comments(self):
+        policy = compile_policy(
+            {
+                "a.rego": (
+                    "package shieldops\n"
+                    '# allow if { input.action == "ignored" }\n'
+                    "allow if {\n"
+                    "    input.action in safe  # trailing comment\n"
+                    "}\n"
+                    'allow if { input.team == "sre#1"; input.action in {"scale", "restart"} }\n'
+                ),
+                "b.rego": 'package shieldops\nsafe := {\n    "query",\n    "list",\n}\n',
+            }
+        )
+        assert policy.allow({"action": "list"}) is True
+        assert policy.allow({"action": "ignored"}) is False
+        assert policy.allow({"team": "sre#1", "action": "scale"}) is True
+        assert policy.allow({"team": "sre#1", "action": "drain"}) is False
+
+    def test_other_packages_and_rules_ignored(self):
+        policy = compile_policy(
+            {
+                "p.rego": (
+                    "package shieldops\n"
+                    "default allow := true\n"
+                    "deny contains msg if {\n    some x in input.items\n    msg := x\n}\n"
+                ),
+                "q.rego": "package other\nallow if {\n    count(input.items) > 1\n}\n",
+            }
+        )
+        assert policy.rules == []
+        assert policy.allow({}) is True
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            "count(input.items) > 2",
+            "input.action in unknown_set",
+            "some x in input.items",
+            "input.environment == data.envs[0]",
+            "deny",
+        ],
+    )
+    def test_unsupported_allow_bodies_rejected(self, body):
+        with pytest.raises(UnsupportedRegoError):
+            compile_policy({"p.rego": f"package shieldops\nallow if {{\n    {body}\n}}\n"})
+
+    def test_bundle_without_allow_rejected(self):
+        with pytest.raises(UnsupportedRegoError):
+            compile_policy({"p.rego": "package shieldops\nx := 1\n"})
+
+
+# ────────────────────────────────────────────────────────────────────
+# Hot reload
+# ────────────────────────────────────────────────────────────────────
+
+
+class TestHotReload:
+    def test_recompiles_when_bundle_changes(self, tmp_path):
+        rego = tmp_path / "policy.rego"
+        _write(rego, 'package shieldops\nallow if {\n    input.action == "a"\n}\n')
+        evaluator = LocalPolicyEvaluator(tmp_path, reload_interval=0)
+        assert evaluator.allow({"action": "b"}) is False
+
+        _write(rego, 'package shieldops\nallow if {\n    input.action == "b"\n}\n', 1_000_000)
+        assert evaluator.allow({"action": "b"}) is True
+
+        (tmp_path / "extra.rego").write_text(
+            'package shieldops\nallow if {\n    input.action == "c"\n}\n'
+        )
+        assert evaluator.allow({"action": "c"}) is True
+
+    def test_broken_bundle_keeps_previous_policy(self, tmp_path):
+        rego = tmp_path / "policy.rego"
+        _write(rego, 'package shieldops\nallow if {\n    input.action == "a"\n}\n')
+        evaluator = LocalPolicyEvaluator(tmp_path, reload_interval=0)
+
+        _write(rego, "package shieldops\nallow if {\n    count(input.x) > 1\n}\n", 1_000_000)
+        assert evaluator.allow({"action": "a"}) is True
+
+    def test_reload_checks_are_rate_limited(self, tmp_path):
+        rego = tmp_path / "policy.rego"
+        _write(rego, 'package shieldops\nallow if {\n    input.action == "a"\n}\n')
+        evaluator = LocalPolicyEvaluator(tmp_path, reload_interval=3600)
+
+        _write(rego, 'package shieldops\nallow if {\n    input.action == "b"\n}\n', 1_000_000)
+        assert evaluator.allow({"action": "a"}) is True
+
+
+# ────────────────────────────────────────────────────────────────────
+# PolicyEngine integration
+# ────────────────────────────────────────────────────────────────────
+
+
+class TestPolicyEngineLocalMode:
+    @pytest.mark.asyncio
+    async def test_local_mode_skips_http(self):
+        engine = PolicyEngine(
+            opa_url="http://opa:8181", local_evaluator=LocalPolicyEvaluator(POLICIES_DIR)
+        )
+        engine._client.post = AsyncMock()
+        actions = [
+            RemediationAction(
+                id=f"act-{risk.value}",
+                action_type="rollback_deployment",
+                target_resource="deploy/api",
+                environment=Environment.STAGING,
+                risk_level=risk,
+                description="test",
+            )
+            for risk in (RiskLevel.LOW, RiskLevel.HIGH)
+        ]
+
+        decisions = await engine.evaluate_many(actions, agent_id="agent-1")
+
+        assert [d.allowed for d in decisions] == [True, False]
+        engine._client.post.assert_not_awaited()
@@ -29,7 +29,9 @@ class TestPolicyEngineWithRateLimiter:
     async def test_evaluate_enriches_context(self):
         """Verify that actions_this_hour is added to the OPA input context."""
         mock_limiter = AsyncMock()
-        mock_limiter.count_recent_actions.return_value = 5
+        mock_limiter.get_counts_many.return_value = [
+            {"actions_this_hour": 5, "actions_this_minute": 1}
+        ]
 
         engine = PolicyEngine(opa_url="http://opa:8181", rate_limiter=mock_limiter)
         engine._client = AsyncMock()
@@ -59,7 +61,7 @@ class TestPolicyEngineWithRateLimiter:
         assert input_data["input"]["context"]["actions_this_hour"] == 5
 
         # Verify rate limiter was incremented
-        mock_limiter.increment.assert_called_once_with("production")
+        mock_limiter.increment_many.assert_called_once_with([("production", None)])
 
     @pytest.mark.asyncio
     async def test_evaluate_without_rate_limiter(self):
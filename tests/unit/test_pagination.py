@@ -1,19 +1,24 @@
 """Tests for cursor-based pagination utilities.
 
 Covers encode_cursor, parse_cursor, paginate, PaginatedResponse model,
-and DEFAULT_LIMIT / MAX_LIMIT constants.
+the keyset cursor helpers, and DEFAULT_LIMIT / MAX_LIMIT constants.
 """
 
 import base64
 import json
+from datetime import UTC, datetime
 
 from shieldops.api.pagination import (
     DEFAULT_LIMIT,
     MAX_LIMIT,
     PaginatedResponse,
     encode_cursor,
+    encode_keyset_cursor,
+    keyset_paginate,
+    next_keyset_cursor,
     paginate,
     parse_cursor,
+    parse_keyset_cursor,
 )
 
 # ---------------------------------------------------------------------------
@@ -287,3 +292,53 @@ class TestPaginate:
         result = paginate(items, cursor=far_cursor, limit=10)
         assert result.items == []
         assert result.has_more is False
+
+
+# ---------------------------------------------------------------------------
+# Keyset cursors
+# ---------------------------------------------------------------------------
+
+
+class TestKeysetCursor:
+    def test_round_trip(self):
+        ts = datetime(2026, 3, 1, 12, 30, tzinfo=UTC)
+        assert parse_keyset_cursor(encode_keyset_cursor(ts, "inv-1")) == (ts, "inv-1")
+
+    def test_accepts_iso_string(self):
+        cursor = encode_keyset_cursor("2026-03-01T12:30:00+00:00", "inv-1")
+        assert parse_keyset_cursor(cursor) == (datetime(2026, 3, 1, 12, 30, tzinfo=UTC), "inv-1")
+
+    def test_offset_cursor_is_not_a_keyset_cursor(self):
+        assert parse_keyset_cursor(encode_cursor(20)) is None
+
+    def test_garbage_returns_none(self):
+        assert parse_keyset_cursor("!!!not-base64!!!") is None
+
+    def test_next_cursor_points_at_last_row(self):
+        rows = [
+            {"id": "b", "created_at": "2026-03-02T00:00:00+00:00"},
+            {"id": "a", "created_at": "2026-03-01T00:00:00+00:00"},
+        ]
+        ts, row_id = parse_keyset_cursor(next_keyset_cursor(rows, limit=2))
+        assert (ts.day, row_id) == (1, "a")
+
+    def test_rows_without_sort_value_are_skipped(self):
+        rows = [
+            {"id": "b", "created_at": "2026-03-01T00:00:00+00:00"},
+            {"id": "a", "created_at": None},
+        ]
+        cursor = next_keyset_cursor(rows, limit=2)
+        assert parse_keyset_cursor(cursor)[1] == "b"
+        assert next_keyset_cursor([{"id": "a", "created_at": None}], limit=1) is None
+
+    def test_short_page_has_no_next_cursor(self):
+        rows = [{"id": "a", "created_at": "2026-03-01T00:00:00+00:00"}]
+        assert next_keyset_cursor(rows, limit=2) is None
+        assert next_keyset_cursor([], limit=2) is None
+
+    def test_keyset_paginate_custom_keys(self):
+        rows = [{"investigation_id": "inv-1", "created_at": "2026-03-01T00:00:00+00:00"}]
+        page = keyset_paginate(rows, limit=1, id_key="investigation_id")
+        assert page.has_more is True
+        assert parse_keyset_cursor(page.next_cursor)[1] == "inv-1"
+        assert page.total_count == 1
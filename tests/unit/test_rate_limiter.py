@@ -25,7 +25,11 @@ def _auth_header(role: str = "admin", user_id: str = "user-1") -> dict[str, str]
 
 @pytest.fixture
 def mock_redis():
-    """Mock Redis client that tracks INCR counts per key."""
+    """Mock Redis client that tracks INCR counts per key.
+
+    The rate-limit script's fixed-window counter is routed through
+    ``incr`` so tests can override that to simulate counts.
+    """
     store: dict[str, int] = {}
     client = AsyncMock()
 
@@ -36,8 +40,12 @@ def mock_redis():
     async def _expire(key: str, ttl: int) -> None:
         pass
 
+    async def _evalsha(sha: str, numkeys: int, *keys_and_args: object) -> list[int]:
+        return [await client.incr(keys_and_args[0]), 0]
+
     client.incr = AsyncMock(side_effect=_incr)
     client.expire = AsyncMock(side_effect=_expire)
+    client.evalsha = AsyncMock(side_effect=_evalsha)
     client._store = store
     return client
 
@@ -226,7 +234,7 @@ class TestGracefulDegradation:
         app = _make_app()
 
         failing_client = AsyncMock()
-        failing_client.incr = AsyncMock(side_effect=ConnectionError("Redis down"))
+        failing_client.evalsha = AsyncMock(side_effect=ConnectionError("Redis down"))
 
         async def _failing_ensure(self):
             return failing_client
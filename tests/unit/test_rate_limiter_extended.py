@@ -44,6 +44,24 @@ def _mock_redis_client() -> AsyncMock:
     return client
 
 
+def _mock_rate_limiter(*, hour: int = 0, minute: int = 0, team: int = 0) -> MagicMock:
+    """Return a mock ActionRateLimiter reporting the given counts."""
+
+    async def _counts(pairs):
+        result = []
+        for _env, team_name in pairs:
+            counts = {"actions_this_hour": hour, "actions_this_minute": minute}
+            if team_name:
+                counts["team_actions_this_hour"] = team
+            result.append(counts)
+        return result
+
+    rate_limiter = MagicMock()
+    rate_limiter.get_counts_many = AsyncMock(side_effect=_counts)
+    rate_limiter.increment_many = AsyncMock()
+    return rate_limiter
+
+
 # ────────────────────────────────────────────────────────────────────
 # TestMinuteKeyGeneration
 # ────────────────────────────────────────────────────────────────────
@@ -252,13 +270,7 @@ class TestIncrementMinute:
 class TestContextEnrichment:
     @pytest.mark.asyncio
     async def test_minute_count_added_to_context(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=5)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=2)
-        rate_limiter.count_team_actions = AsyncMock(return_value=0)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=5, minute=2, team=0)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -280,13 +292,7 @@ class TestContextEnrichment:
 
     @pytest.mark.asyncio
     async def test_team_actions_added_to_context(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=5)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=1)
-        rate_limiter.count_team_actions = AsyncMock(return_value=8)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=5, minute=1, team=8)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -308,13 +314,7 @@ class TestContextEnrichment:
 
     @pytest.mark.asyncio
     async def test_no_team_skips_team_enrichment(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=0)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=0)
-        rate_limiter.count_team_actions = AsyncMock(return_value=0)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=0, minute=0, team=0)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -333,7 +333,7 @@ class TestContextEnrichment:
         await engine.evaluate(action, agent_id="agent-1")
 
         assert "team_actions_this_hour" not in captured_input["context"]
-        rate_limiter.count_team_actions.assert_not_awaited()
+        rate_limiter.get_counts_many.assert_awaited_once_with([("production", None)])
 
 
 # ────────────────────────────────────────────────────────────────────
@@ -381,13 +381,7 @@ class TestBackwardCompatibility:
 class TestExtendedIncrement:
     @pytest.mark.asyncio
     async def test_minute_and_team_incremented_on_allow(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=0)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=0)
-        rate_limiter.count_team_actions = AsyncMock(return_value=0)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=0, minute=0, team=0)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -402,19 +396,11 @@ class TestExtendedIncrement:
         action = _make_action(team="platform")
         await engine.evaluate(action, agent_id="agent-1")
 
-        rate_limiter.increment.assert_awaited_once()
-        rate_limiter.increment_minute.assert_awaited_once_with("production")
-        rate_limiter.increment_team.assert_awaited_once_with("platform", "production")
+        rate_limiter.increment_many.assert_awaited_once_with([("production", "platform")])
 
     @pytest.mark.asyncio
     async def test_no_team_skips_team_increment(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=0)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=0)
-        rate_limiter.count_team_actions = AsyncMock(return_value=0)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=0, minute=0, team=0)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -429,18 +415,11 @@ class TestExtendedIncrement:
         action = _make_action(team=None)
         await engine.evaluate(action, agent_id="agent-1")
 
-        rate_limiter.increment_minute.assert_awaited_once()
-        rate_limiter.increment_team.assert_not_awaited()
+        rate_limiter.increment_many.assert_awaited_once_with([("production", None)])
 
     @pytest.mark.asyncio
     async def test_no_increment_on_deny(self):
-        rate_limiter = MagicMock()
-        rate_limiter.count_recent_actions = AsyncMock(return_value=0)
-        rate_limiter.count_recent_actions_minute = AsyncMock(return_value=0)
-        rate_limiter.count_team_actions = AsyncMock(return_value=0)
-        rate_limiter.increment = AsyncMock()
-        rate_limiter.increment_minute = AsyncMock()
-        rate_limiter.increment_team = AsyncMock()
+        rate_limiter = _mock_rate_limiter(hour=0, minute=0, team=0)
 
         engine = PolicyEngine(opa_url="http://localhost:8181", rate_limiter=rate_limiter)
 
@@ -455,6 +434,77 @@ class TestExtendedIncrement:
         action = _make_action(team="platform")
         await engine.evaluate(action, agent_id="agent-1")
 
-        rate_limiter.increment.assert_not_awaited()
-        rate_limiter.increment_minute.assert_not_awaited()
-        rate_limiter.increment_team.assert_not_awaited()
+        rate_limiter.increment_many.assert_not_awaited()
+
+
+# ────────────────────────────────────────────────────────────────────
+# TestPipelinedCounters
+# ────────────────────────────────────────────────────────────────────
+
+
+class TestPipelinedCounters:
+    @pytest.mark.asyncio
+    async def test_get_counts_many_uses_one_mget(self):
+        limiter = ActionRateLimiter()
+        mock_client = _mock_redis_client()
+        hour = datetime.now(UTC).strftime("%Y%m%d%H")
+
+        async def _mget(keys):
+            return ["4" if key == f"shieldops:rate:production:{hour}" else None for key in keys]
+
+        mock_client.mget = AsyncMock(side_effect=_mget)
+        limiter._client = mock_client
+
+        counts = await limiter.get_counts_many(
+            [("production", "platform"), ("production", None), ("staging", None)]
+        )
+
+        mock_client.mget.assert_awaited_once()
+        mock_client.get.assert_not_awaited()
+        # Shared keys are fetched once: prod hour/minute, prod team, staging hour/minute
+        assert len(mock_client.mget.call_args[0][0]) == 5
+        assert counts[0] == {
+            "actions_this_hour": 4,
+            "actions_this_minute": 0,
+            "team_actions_this_hour": 0,
+        }
+        assert counts[1] == {"actions_this_hour": 4, "actions_this_minute": 0}
+        assert counts[2] == {"actions_this_hour": 0, "actions_this_minute": 0}
+
+    @pytest.mark.asyncio
+    async def test_get_counts_degrades_to_zero(self):
+        limiter = ActionRateLimiter()
+        mock_client = _mock_redis_client()
+        mock_client.mget = AsyncMock(side_effect=ConnectionError("down"))
+        limiter._client = mock_client
+
+        counts = await limiter.get_counts("production", "platform")
+
+        assert counts == {
+            "actions_this_hour": 0,
+            "actions_this_minute": 0,
+            "team_actions_this_hour": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_increment_many_uses_one_pipeline(self):
+        limiter = ActionRateLimiter()
+        mock_client = _mock_redis_client()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        mock_client.pipeline = MagicMock(return_value=pipe)
+        limiter._client = mock_client
+
+        await limiter.increment_many([("production", "platform"), ("production", None)])
+
+        mock_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute.assert_awaited_once()
+        mock_client.incr.assert_not_awaited()
+        increments = {c.args[0]: c.args[1] for c in pipe.incrby.call_args_list}
+        hour = datetime.now(UTC).strftime("%Y%m%d%H")
+        assert increments[f"shieldops:rate:production:{hour}"] == 2
+        assert increments[f"shieldops:rate:platform:production:{hour}"] == 1
+        ttls = {c.args[0]: c.args[1] for c in pipe.expire.call_args_list}
+        minute_keys = [k for k in ttls if k.startswith("shieldops:rate:min:")]
+        assert [ttls[k] for k in minute_keys] == [120]
+        assert ttls[f"shieldops:rate:production:{hour}"] == 3600
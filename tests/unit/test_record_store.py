@@ -0,0 +1,221 @@
+"""Tests for shieldops.utils.record_store module.
+
+Covers list compatibility, ring-buffer eviction, the id index (including
+duplicate ids) and secondary indexes.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel, Field
+
+from shieldops.observability.alert_dedup import (
+    AlertDeduplicationEngine,
+    AlertPriority,
+    DedupResult,
+    DedupStrategy,
+)
+from shieldops.utils.record_store import RecordStore
+
+
+class Severity(StrEnum):
+    LOW = "low"
+    HIGH = "high"
+
+
+class Rec(BaseModel):
+    id: str = Field(default_factory=lambda: uuid4().hex)
+    severity: Severity = Severity.LOW
+    team: str = ""
+
+
+def _store(n: int, capacity: int = 10, **kwargs: object) -> RecordStore[Rec]:
+    store: RecordStore[Rec] = RecordStore(capacity, **kwargs)  # type: ignore[arg-type]
+    for i in range(n):
+        store.append(Rec(id=f"r{i}", severity=Severity.HIGH if i % 3 == 0 else Severity.LOW))
+    return store
+
+
+# ---------------------------------------------------------------------------
+# List compatibility
+# ---------------------------------------------------------------------------
+
+
+class TestSequence:
+    def test_len_iter_bool(self) -> None:
+        store = _store(3)
+        assert len(store) == 3
+        assert [r.id for r in store] == ["r0", "r1", "r2"]
+        assert [r.id for r in reversed(store)] == ["r2", "r1", "r0"]
+        assert store
+        assert not RecordStore(5)
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            slice(None),
+            slice(-2, None),
+            slice(None, 3),
+            slice(2, 5),
+            slice(-0, None),
+            slice(-50, None),
+            slice(4, 2),
+            slice(None, None, 2),
+            slice(None, None, -1),
+        ],
+    )
+    def test_slicing_matches_list(self, index: slice) -> None:
+        store = _store(15, capacity=8)
+        expected = list(store)[index]
+        assert store[index] == expected
+
+    def test_int_indexing(self) -> None:
+        store = _store(4)
+        assert store[0].id == "r0"
+        assert store[-1].id == "r3"
+        with pytest.raises(IndexError):
+            store[4]
+
+    def test_contains(self) -> None:
+        store = _store(3, capacity=2)
+        assert store[0] in store
+        assert Rec(id="r0") not in store
+        assert "r1" not in store
+
+    def test_sorted_and_list(self) -> None:
+        store = _store(3)
+        assert [r.id for r in sorted(store, key=lambda r: r.id, reverse=True)] == [
+            "r2",
+            "r1",
+            "r0",
+        ]
+        assert list(store) == store[:]
+
+    def test_equality_like_list(self) -> None:
+        store = _store(3)
+        assert store == list(store)
+        assert store == _store(3)
+        assert store != store[:2]
+        assert RecordStore(5) == []
+        assert store != tuple(store)
+
+    def test_invalid_capacity(self) -> None:
+        with pytest.raises(ValueError, match="capacity"):
+            RecordStore(-1)
+
+
+# ---------------------------------------------------------------------------
+# Eviction and id index
+# ---------------------------------------------------------------------------
+
+
+class TestEviction:
+    def test_oldest_evicted_at_capacity(self) -> None:
+        store = _store(12, capacity=5)
+        assert len(store) == 5
+        assert [r.id for r in store] == ["r7", "r8", "r9", "r10", "r11"]
+        assert store.get("r6") is None
+        assert store.get("r7") is store[0]
+
+    def test_zero_capacity_is_unbounded(self) -> None:
+        store = _store(12, capacity=0)
+        assert len(store) == 12
+        assert store.get("r0") is store[0]
+
+    def test_get_missing_returns_default(self) -> None:
+        store = _store(1)
+        sentinel = Rec(id="x")
+        assert store.get("nope") is None
+        assert store.get("nope", sentinel) is sentinel
+
+    def test_clear(self) -> None:
+        store = _store(5, indexes=("severity",))
+        store.clear()
+        assert len(store) == 0
+        assert store.get("r1") is None
+        assert store.where(severity=Severity.HIGH) == []
+        store.append(Rec(id="r1"))
+        assert store.get("r1") is store[0]
+
+    def test_duplicate_ids_return_oldest_surviving(self) -> None:
+        store: RecordStore[Rec] = RecordStore(3)
+        first, second = Rec(id="dup", team="a"), Rec(id="dup", team="b")
+        store.extend([first, Rec(id="x"), second])
+        assert store.get("dup") is first
+
+        store.append(Rec(id="y"))  # evicts first
+        assert store.get("dup") is second
+
+        store.extend([Rec(id="z"), Rec(id="w")])  # evicts x, then second
+        assert store.get("dup") is None
+
+    def test_custom_key(self) -> None:
+        store: RecordStore[Rec] = RecordStore(2, key="team")
+        rec = Rec(team="sre")
+        store.append(rec)
+        assert store.get("sre") is rec
+
+
+# ---------------------------------------------------------------------------
+# Secondary indexes
+# ---------------------------------------------------------------------------
+
+
+class TestWhere:
+    def test_indexed_filter_oldest_first(self) -> None:
+        store = _store(10, indexes=("severity",))
+        assert [r.id for r in store.where(severity=Severity.HIGH)] == ["r0", "r3", "r6", "r9"]
+
+    def test_index_follows_eviction(self) -> None:
+        store = _store(11, capacity=5, indexes=("severity",))
+        assert [r.id for r in store.where(severity=Severity.HIGH)] == ["r6", "r9"]
+        assert [r.id for r in store.where(severity="low")] == ["r7", "r8", "r10"]
+
+    def test_mixed_and_unindexed_filters(self) -> None:
+        store: RecordStore[Rec] = RecordStore(10, indexes=("severity",))
+        store.extend(
+            [
+                Rec(id="a", severity=Severity.HIGH, team="sre"),
+                Rec(id="b", severity=Severity.HIGH, team="web"),
+                Rec(id="c", severity=Severity.LOW, team="sre"),
+            ]
+        )
+        assert [r.id for r in store.where(severity=Severity.HIGH, team="sre")] == ["a"]
+        assert [r.id for r in store.where(team="sre")] == ["a", "c"]
+        assert store.where(severity=Severity.HIGH, team="db") == []
+        assert len(store.where()) == 3
+
+    def test_missing_value(self) -> None:
+        store = _store(3, indexes=("severity",))
+        assert store.where(severity="critical") == []
+
+
+# ---------------------------------------------------------------------------
+# Engine integration
+# ---------------------------------------------------------------------------
+
+
+class TestEngineIntegration:
+    def test_alert_dedup_lookup_and_filters(self) -> None:
+        engine = AlertDeduplicationEngine(max_records=3)
+        recs = [
+            engine.record_dedup(f"alert-{i}", strategy=s, result=res, priority=p)
+            for i, (s, res, p) in enumerate(
+                [
+                    (DedupStrategy.FINGERPRINT, DedupResult.DUPLICATE, AlertPriority.HIGH),
+                    (DedupStrategy.FINGERPRINT, DedupResult.UNIQUE, AlertPriority.HIGH),
+                    (DedupStrategy.EXACT_MATCH, DedupResult.DUPLICATE, AlertPriority.LOW),
+                    (DedupStrategy.FINGERPRINT, DedupResult.DUPLICATE, AlertPriority.HIGH),
+                ]
+            )
+        ]
+        assert engine.get_dedup(recs[0].id) is None
+        assert engine.get_dedup(recs[3].id) is recs[3]
+        assert engine.list_dedups(strategy=DedupStrategy.FINGERPRINT) == [recs[1], recs[3]]
+        assert engine.list_dedups(
+            strategy=DedupStrategy.FINGERPRINT, result=DedupResult.DUPLICATE
+        ) == [recs[3]]
+        assert engine.list_dedups(limit=2) == recs[2:]
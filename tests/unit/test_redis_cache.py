@@ -12,7 +12,7 @@ Covers:
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
@@ -46,7 +46,7 @@ def _make_mock_client() -> AsyncMock:
     client = AsyncMock()
     client.get = AsyncMock(return_value=None)
     client.set = AsyncMock()
-    client.delete = AsyncMock()
+    client.delete = AsyncMock(side_effect=lambda *keys: len(keys))  # DEL returns the count
     client.ping = AsyncMock(return_value=True)
     client.aclose = AsyncMock()
     # scan_iter returns an async iterator
@@ -57,7 +57,7 @@ def _make_mock_client() -> AsyncMock:
 def _make_scan_iter(keys: list[bytes]) -> Any:
     """Create a callable that returns an async iterator over *keys*."""
 
-    def scan_iter(match: str | None = None) -> Any:
+    def scan_iter(match: str | None = None, count: int | None = None) -> Any:
         async def _aiter():
             for k in keys:
                 yield k
@@ -154,7 +154,8 @@ class TestRedisCacheInvalidatePattern:
         deleted = await cache.invalidate_pattern("inv:*")
 
         assert deleted == 2
-        assert cache._client.delete.await_count == 2
+        # Both keys are removed with a single multi-key DEL
+        cache._client.delete.assert_awaited_once_with(*keys)
 
     @pytest.mark.asyncio
     async def test_invalidate_pattern_returns_zero_when_no_match(self) -> None:
@@ -167,6 +168,124 @@ class TestRedisCacheInvalidatePattern:
 
         assert deleted == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_pattern_deletes_in_batches(self) -> None:
+        """Keys are deleted one SCAN page at a time, not one per round-trip."""
+        cache = RedisCache(redis_url="redis://localhost:6379/0", scan_batch_size=2)
+        cache._client = _make_mock_client()
+        keys = [f"shieldops:inv:k{i}".encode() for i in range(5)]
+        cache._client.scan_iter = _make_scan_iter(keys)
+        cache._client.delete = AsyncMock(side_effect=lambda *k: len(k))
+
+        deleted = await cache.invalidate_pattern("inv:*")
+
+        assert deleted == 5
+        assert cache._client.delete.await_count == 3
+        assert cache._client.delete.await_args_list[0].args == tuple(keys[:2])
+
+    @pytest.mark.asyncio
+    async def test_invalidate_namespace_scopes_pattern(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        seen: list[str | None] = []
+
+        def scan_iter(match: str | None = None, count: int | None = None) -> Any:
+            seen.append(match)
+            return _make_scan_iter([b"shieldops:inv:k1"])(match, count)
+
+        cache._client.scan_iter = scan_iter
+        cache._client.delete = AsyncMock(return_value=1)
+
+        assert await cache.invalidate_namespace("inv") == 1
+        assert seen == ["shieldops:inv:*"]
+
+
+class TestRedisCacheBulk:
+    @pytest.mark.asyncio
+    async def test_get_many_uses_single_mget(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.mget = AsyncMock(return_value=[b'{"a":1}', None, b"[2]"])
+
+        result = await cache.get_many(["k1", "k2", "k3"], namespace="ns")
+
+        assert result == {"k1": {"a": 1}, "k3": [2]}
+        cache._client.mget.assert_awaited_once_with(
+            ["shieldops:ns:k1", "shieldops:ns:k2", "shieldops:ns:k3"]
+        )
+        assert cache._hits == 2
+        assert cache._misses == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_empty_skips_round_trip(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.mget = AsyncMock()
+
+        assert await cache.get_many([]) == {}
+        cache._client.mget.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_set_many_pipelines_with_per_key_ttl(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0", default_ttl=60)
+        cache._client = _make_mock_client()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        cache._client.pipeline = MagicMock(return_value=pipe)
+
+        await cache.set_many({"a": 1, "b": 2}, namespace="ns", ttls={"b": 5})
+
+        cache._client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        assert pipe.set.call_args_list[0].kwargs["ex"] == 60
+        assert pipe.set.call_args_list[1].kwargs["ex"] == 5
+        assert pipe.set.call_args_list[1].args[0] == "shieldops:ns:b"
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_many_single_del(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.delete = AsyncMock(return_value=2)
+
+        removed = await cache.delete_many(["a", "b", "a"], namespace="ns")
+
+        assert removed == 2
+        cache._client.delete.assert_awaited_once_with("shieldops:ns:a", "shieldops:ns:b")
+
+
+class TestRedisCacheLocks:
+    @pytest.mark.asyncio
+    async def test_acquire_lock_uses_set_nx_px(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.set = AsyncMock(return_value=True)
+
+        token = await cache.acquire_lock("inv:abc", ttl_ms=1500)
+
+        assert token
+        args, kwargs = cache._client.set.await_args
+        assert args[0] == "shieldops:lock:inv:abc"
+        assert kwargs == {"nx": True, "px": 1500}
+
+    @pytest.mark.asyncio
+    async def test_acquire_lock_returns_none_when_held(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.set = AsyncMock(return_value=None)
+
+        assert await cache.acquire_lock("inv:abc") is None
+
+    @pytest.mark.asyncio
+    async def test_release_lock_compares_token(self) -> None:
+        cache = RedisCache(redis_url="redis://localhost:6379/0")
+        cache._client = _make_mock_client()
+        cache._client.eval = AsyncMock(return_value=1)
+
+        assert await cache.release_lock("inv:abc", "tok") is True
+        args = cache._client.eval.await_args.args
+        assert args[1:] == (1, "shieldops:lock:inv:abc", b"tok")
+
 
 class TestRedisCacheGetOrSet:
     @pytest.mark.asyncio
@@ -0,0 +1,105 @@
+"""Tests for keyset pagination and streaming exports in Repository."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shieldops.db.repository import EXPORT_BATCH_SIZE, Repository
+
+
+def _repo(session: AsyncMock) -> Repository:
+    sf = MagicMock()
+    sf.return_value.__aenter__ = AsyncMock(return_value=session)
+    sf.return_value.__aexit__ = AsyncMock(return_value=False)
+    return Repository(session_factory=sf)
+
+
+def _sql(stmt: Any) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _list_session() -> AsyncMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    session = AsyncMock()
+    session.execute.return_value = result
+    return session
+
+
+class _ScalarStream:
+    def __init__(self, records: list[Any]) -> None:
+        self._records = iter(records)
+
+    def __aiter__(self) -> _ScalarStream:
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._records)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+class TestKeysetListing:
+    @pytest.mark.asyncio
+    async def test_after_seeks_on_created_at_and_id(self) -> None:
+        session = _list_session()
+        after = (datetime(2026, 3, 1, tzinfo=UTC), "inv-100")
+
+        await _repo(session).list_investigations(limit=25, offset=50, after=after)
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert "(investigations.created_at, investigations.id) <" in sql
+        assert "ORDER BY investigations.created_at DESC, investigations.id DESC" in sql
+        assert "OFFSET" not in sql
+
+    @pytest.mark.asyncio
+    async def test_offset_still_supported_without_cursor(self) -> None:
+        session = _list_session()
+
+        await _repo(session).list_remediations(limit=25, offset=50)
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert "OFFSET" in sql
+        assert "remediations.id DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_audit_log_keys_on_timestamp(self) -> None:
+        session = _list_session()
+        after = (datetime(2026, 3, 1, tzinfo=UTC), "aud-1")
+
+        await _repo(session).list_audit_logs(environment="prod", after=after)
+
+        sql = _sql(session.execute.call_args.args[0])
+        assert "(audit_log.timestamp, audit_log.id) <" in sql
+
+
+class TestStreamingExports:
+    @pytest.mark.asyncio
+    async def test_export_streams_with_server_side_cursor(self) -> None:
+        record = MagicMock(
+            id="scan-1",
+            created_at=datetime(2026, 3, 1, tzinfo=UTC),
+            updated_at=None,
+        )
+        session = AsyncMock()
+        session.stream_scalars = AsyncMock(return_value=_ScalarStream([record]))
+
+        rows = [row async for row in _repo(session).export_compliance_data(limit=10)]
+
+        assert [row["scan_id"] for row in rows] == ["scan-1"]
+        stmt = session.stream_scalars.call_args.args[0]
+        assert stmt.get_execution_options()["yield_per"] == EXPORT_BATCH_SIZE
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_export_is_lazy(self) -> None:
+        session = AsyncMock()
+        stream = _repo(session).export_investigations()
+        session.stream_scalars.assert_not_called()
+        await stream.aclose()
@@ -0,0 +1,52 @@
+"""Tests for Repository.write_usage_rollups."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from shieldops.api.middleware.usage_tracker import UsageRollup
+from shieldops.db.repository import USAGE_ROLLUP_CHUNK_ROWS, Repository
+
+# asyncpg / Postgres limit on bind parameters per statement
+_MAX_BIND_PARAMS = 32767
+
+
+def _repo(session: AsyncMock) -> Repository:
+    sf = MagicMock()
+    sf.return_value.__aenter__ = AsyncMock(return_value=session)
+    sf.return_value.__aexit__ = AsyncMock(return_value=False)
+    return Repository(session_factory=sf)
+
+
+class TestWriteUsageRollups:
+    @pytest.mark.asyncio
+    async def test_large_flush_is_chunked_in_one_transaction(self) -> None:
+        hour = datetime(2026, 3, 1, 12, tzinfo=UTC)
+        total = 2 * USAGE_ROLLUP_CHUNK_ROWS + 10
+        rows = [UsageRollup(f"org-{i % 20}", f"/api/v1/e{i}", hour, 1, 5.0) for i in range(total)]
+        session = AsyncMock()
+
+        await _repo(session).write_usage_rollups(rows)
+
+        statements = [call.args[0] for call in session.execute.call_args_list]
+        assert len(statements) == 3
+        params = [len(stmt.compile(dialect=postgresql.dialect()).params) for stmt in statements]
+        assert max(params) < _MAX_BIND_PARAMS
+        assert sum(params) == 5 * total
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_are_merged_before_writing(self) -> None:
+        hour = datetime(2026, 3, 1, 12, tzinfo=UTC)
+        rows = [UsageRollup("org-1", "/api/v1/x", hour, 2, 10.0)] * 3
+        session = AsyncMock()
+
+        await _repo(session).write_usage_rollups(rows)
+
+        params = session.execute.call_args.args[0].compile(dialect=postgresql.dialect()).params
+        assert params["call_count_m0"] == 6
+        assert params["total_latency_ms_m0"] == 30.0
@@ -5,15 +5,20 @@ Covers:
 - InvestigationRunner._broadcast() with and without ws_manager
 - RemediationRunner._broadcast() with and without ws_manager
 - ConnectionManager.broadcast() delivery and dead-connection cleanup
+- Per-connection send queues and slow-consumer policies
+- Cross-worker fan-out through RedisBroadcastBackplane
 - Lifespan wiring: runners receive ws_manager from get_ws_manager()
 """
 
+import asyncio
+import json
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from shieldops.api.ws.manager import ConnectionManager
+from shieldops.api.ws.manager import ConnectionManager, RedisBroadcastBackplane
 
 # ---------------------------------------------------------------------------
 # Singleton: get_ws_manager()
@@ -61,33 +66,32 @@ class TestGetWsManagerSingleton:
 class TestConnectionManagerBroadcast:
     @pytest.mark.asyncio
     async def test_broadcast_sends_to_all_subscribers(self) -> None:
-        """broadcast() should call send_json on every websocket in the channel."""
+        """broadcast() should send the serialized event to every websocket in the channel."""
         mgr = ConnectionManager()
         ws1 = AsyncMock()
         ws2 = AsyncMock()
-
-        # Manually add sockets (bypass .connect() which calls accept())
-        mgr._channels["test_channel"].add(ws1)
-        mgr._channels["test_channel"].add(ws2)
+        await mgr.connect(ws1, "test_channel")
+        await mgr.connect(ws2, "test_channel")
 
         event = {"type": "test", "value": 42}
         await mgr.broadcast("test_channel", event)
+        await asyncio.sleep(0)
 
-        ws1.send_json.assert_awaited_once_with(event)
-        ws2.send_json.assert_awaited_once_with(event)
+        ws1.send_text.assert_awaited_once_with('{"type":"test","value":42}')
+        ws2.send_text.assert_awaited_once_with('{"type":"test","value":42}')
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_dead_connections(self) -> None:
-        """If send_json raises, that websocket should be removed from the channel."""
+        """If sending raises, that websocket should be removed from the channel."""
         mgr = ConnectionManager()
         alive_ws = AsyncMock()
         dead_ws = AsyncMock()
-        dead_ws.send_json.side_effect = RuntimeError("connection closed")
-
-        mgr._channels["ch"].add(alive_ws)
-        mgr._channels["ch"].add(dead_ws)
+        dead_ws.send_text.side_effect = RuntimeError("connection closed")
+        await mgr.connect(alive_ws, "ch")
+        await mgr.connect(dead_ws, "ch")
 
         await mgr.broadcast("ch", {"type": "ping"})
+        await asyncio.sleep(0)
 
         # Dead socket removed
         assert dead_ws not in mgr._channels["ch"]
@@ -107,14 +111,213 @@ class TestConnectionManagerBroadcast:
         mgr = ConnectionManager()
         target_ws = AsyncMock()
         other_ws = AsyncMock()
-
-        mgr._channels["target"].add(target_ws)
-        mgr._channels["other"].add(other_ws)
+        await mgr.connect(target_ws, "target")
+        await mgr.connect(other_ws, "other")
 
         await mgr.broadcast("target", {"type": "scoped"})
+        await asyncio.sleep(0)
+
+        target_ws.send_text.assert_awaited_once()
+        other_ws.send_text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_event_serialized_once_per_broadcast(self) -> None:
+        mgr = ConnectionManager()
+        sockets = [AsyncMock() for _ in range(5)]
+        for ws in sockets:
+            await mgr.connect(ws, "ch")
+
+        with patch("shieldops.api.ws.manager.json.dumps", wraps=json.dumps) as dumps:
+            await mgr.broadcast("ch", {"type": "fanout", "at": datetime(2026, 1, 1, tzinfo=UTC)})
+        await asyncio.sleep(0)
+
+        assert dumps.call_count == 1
+        for ws in sockets:
+            ws.send_text.assert_awaited_once_with(
+                '{"type":"fanout","at":"2026-01-01 00:00:00+00:00"}'
+            )
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self) -> None:
+        mgr = ConnectionManager()
+        ws = AsyncMock()
+        await mgr.connect(ws, "ch")
+        conn = mgr._channels["ch"][ws]
+
+        mgr.disconnect(ws, "ch")
+        await asyncio.sleep(0)
+
+        assert conn.writer.cancelled()
+        assert mgr.active_connections == 0
+        mgr.disconnect(ws, "ch")  # idempotent
+
+    def test_unknown_policy_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ConnectionManager(slow_consumer_policy="block")
+
+
+# ---------------------------------------------------------------------------
+# Slow consumers
+# ---------------------------------------------------------------------------
+
+
+def _stalled_socket() -> tuple[AsyncMock, asyncio.Event]:
+    """A websocket whose sends block until the returned event is set."""
+    release = asyncio.Event()
+    ws = AsyncMock()
+    sent: list[str] = []
+
+    async def send_text(text: str) -> None:
+        await release.wait()
+        sent.append(text)
+
+    ws.send_text.side_effect = send_text
+    ws.sent = sent
+    return ws, release
+
+
+class TestSlowConsumers:
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self) -> None:
+        mgr = ConnectionManager(queue_size=4)
+        slow, _release = _stalled_socket()
+        fast = AsyncMock()
+        await mgr.connect(slow, "ch")
+        await mgr.connect(fast, "ch")
+
+        for i in range(3):
+            await mgr.broadcast("ch", {"n": i})
+            await asyncio.sleep(0)
+
+        assert fast.send_text.await_count == 3
+        assert slow.sent == []
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_newest_events(self) -> None:
+        mgr = ConnectionManager(queue_size=2)
+        slow, release = _stalled_socket()
+        await mgr.connect(slow, "ch")
+        await mgr.broadcast("ch", {"n": 0})
+        await asyncio.sleep(0)  # writer takes n=0 and stalls on it
+
+        for i in range(1, 6):
+            await mgr.broadcast("ch", {"n": i})
+        conn = mgr._channels["ch"][slow]
+        assert conn.dropped == 3
+
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert slow.sent == ['{"n":0}', '{"n":4}', '{"n":5}']
+        assert slow in mgr._channels["ch"]
+
+    @pytest.mark.asyncio
+    async def test_close_policy_disconnects_full_queue(self) -> None:
+        mgr = ConnectionManager(queue_size=1, slow_consumer_policy="close")
+        slow, _release = _stalled_socket()
+        fast = AsyncMock()
+        await mgr.connect(slow, "ch")
+        await mgr.connect(fast, "ch")
+
+        for i in range(3):
+            await mgr.broadcast("ch", {"n": i})
+            await asyncio.sleep(0)
+
+        assert slow not in mgr._channels["ch"]
+        assert fast in mgr._channels["ch"]
+        slow.close.assert_awaited_once_with(code=1013, reason="queue_full")
+
+    @pytest.mark.asyncio
+    async def test_stalled_send_times_out(self) -> None:
+        mgr = ConnectionManager(send_timeout=0.01)
+        slow, _release = _stalled_socket()
+        await mgr.connect(slow, "ch")
+
+        await mgr.broadcast("ch", {"n": 0})
+        await asyncio.sleep(0.05)
+
+        assert mgr.active_connections == 0
+        slow.close.assert_awaited_once_with(code=1013, reason="send_timeout")
+
+
+# ---------------------------------------------------------------------------
+# Cross-worker fan-out
+# ---------------------------------------------------------------------------
+
+
+class _FakeBroker:
+    """Pattern pub/sub shared by several fake Redis clients."""
+
+    def __init__(self) -> None:
+        self.subscribers: list[tuple[str, asyncio.Queue[dict[str, Any]]]] = []
+
+    def client(self) -> MagicMock:
+        client = MagicMock()
+        client.publish = AsyncMock(side_effect=self._publish)
+        client.pubsub = self._pubsub
+        client.aclose = AsyncMock()
+        return client
+
+    async def _publish(self, channel: str, data: bytes) -> int:
+        for pattern, queue in self.subscribers:
+            if channel.startswith(pattern.rstrip("*")):
+                queue.put_nowait({"type": "pmessage", "channel": channel.encode(), "data": data})
+        return len(self.subscribers)
+
+    def _pubsub(self) -> MagicMock:
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        pubsub = MagicMock()
+
+        async def psubscribe(pattern: str) -> None:
+            self.subscribers.append((pattern, queue))
+
+        async def get_message(ignore_subscribe_messages: bool, timeout: float) -> Any:
+            try:
+                return await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                return None
+
+        pubsub.psubscribe = psubscribe
+        pubsub.get_message = get_message
+        pubsub.aclose = AsyncMock()
+        return pubsub
+
+
+class TestRedisFanout:
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_subscribers_on_other_workers(self) -> None:
+        broker = _FakeBroker()
+        worker_a, worker_b = ConnectionManager(), ConnectionManager()
+        await worker_a.start_backplane(RedisBroadcastBackplane(client=broker.client()))
+        await worker_b.start_backplane(RedisBroadcastBackplane(client=broker.client()))
+        ws_a, ws_b = AsyncMock(), AsyncMock()
+        await worker_a.connect(ws_a, "ch")
+        await worker_b.connect(ws_b, "ch")
+        await asyncio.sleep(0)
+
+        await worker_a.broadcast("ch", {"type": "x"})
+        await asyncio.sleep(0.01)
+
+        ws_a.send_text.assert_awaited_once_with('{"type":"x"}')
+        ws_b.send_text.assert_awaited_once_with('{"type":"x"}')
+
+        await worker_a.stop_backplane()
+        await worker_b.stop_backplane()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_still_delivers_locally(self) -> None:
+        client = MagicMock()
+        client.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+        backplane = RedisBroadcastBackplane(client=client)
+        mgr = ConnectionManager()
+        mgr._backplane = backplane
+        ws = AsyncMock()
+        await mgr.connect(ws, "ch")
+
+        await mgr.broadcast("ch", {"type": "x"})
+        await asyncio.sleep(0)
 
-        target_ws.send_json.assert_awaited_once()
-        other_ws.send_json.assert_not_awaited()
+        ws.send_text.assert_awaited_once_with('{"type":"x"}')
 
 
 # ---------------------------------------------------------------------------